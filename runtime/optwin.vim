@@ -261,6 +261,10 @@ call <SID>OptionG("sect", &sect)
 call <SID>AddOption("path", gettext("list of directory names used for file searching"))
 call append("$", "\t" .. s:global_or_local)
 call <SID>OptionG("pa", &pa)
+if has("timers")
+  call <SID>AddOption("pathidletime", gettext("time in msec to read 'path' directories while waiting for a character"))
+  call <SID>OptionG("pit", &pit)
+endif
 call <SID>AddOption("cdhome", gettext(":cd without argument goes to the home directory"))
 call <SID>BinOptionG("cdh", &cdh)
 call <SID>AddOption("cdpath", gettext("list of directory names used for :cd"))
@@ -437,6 +441,10 @@ if has("syntax")
   call <SID>AddOption("synmaxcol", gettext("maximum column to look for syntax items"))
   call append("$", "\t" .. s:local_to_buffer)
   call <SID>OptionL("smc")
+  if has("timers")
+    call <SID>AddOption("synidletime", gettext("time in msec to compute syntax state while waiting for a character"))
+    call <SID>OptionG("sit", &sit)
+  endif
 endif
 call <SID>AddOption("highlight", gettext("which highlighting to use for various occasions"))
 call <SID>OptionG("hl", &hl)
@@ -839,6 +847,8 @@ call <SID>AddOption("undodir", gettext("list of directories for undo files"))
 call <SID>OptionG("udir", &udir)
 call <SID>AddOption("undoreload", gettext("maximum number lines to save for undo on a buffer reload"))
 call append("$", " \tset ur=" . &ur)
+call <SID>AddOption("undomaxmem", gettext("maximum memory in Kbyte used for undo of a buffer"))
+call append("$", " \tset umm=" . &umm)
 call <SID>AddOption("modified", gettext("changes have been made and not written to a file"))
 call append("$", "\t" .. s:local_to_buffer)
 call <SID>BinOptionL("mod")
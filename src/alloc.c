@@ -426,6 +426,7 @@ free_all_mem(void)
 
     free_titles();
     free_findfile();
+    dir_cache_clear();
 
     // Obviously named calls.
     free_all_autocmds();
@@ -71,9 +71,30 @@ typedef struct AutoPat
     int		    patlen;		// strlen() of pat
     int		    buflocal_nr;	// !=0 for buffer-local AutoPat
     char	    allow_dirs;		// Pattern may match whole path
+    char	    kind;		// AUPAT_ value
     char	    last;		// last pattern for apply_autocmds()
 } AutoPat;
 
+// Values for AutoPat.kind.  Simple patterns are matched without using the
+// regexp engine.
+#define AUPAT_REGEXP	0   // use "reg_prog"
+#define AUPAT_ANY	1   // "*": matches any name
+#define AUPAT_LITERAL	2   // literal name, e.g. "python"
+#define AUPAT_TAIL	3   // "*" and literal text, e.g. "*.c"
+
+#if defined(FEAT_EVAL) || defined(PROTO)
+// Statistics returned by autocmd_stats(), per event.
+typedef struct
+{
+    long	count;		// nr of times patterns were checked
+    long	matched;	// nr of times a pattern matched
+    float_T	match_time;	// time spent matching patterns
+    float_T	exec_time;	// time spent executing the commands
+} au_stat_T;
+
+static au_stat_T au_stats[NUM_EVENTS];
+#endif
+
 //
 // special cases:
 // BufNewFile and BufRead are searched for ALOT (especially at startup)
@@ -1139,6 +1160,64 @@ au_get_grouparg(char_u **argp)
     return group;
 }
 
+/*
+ * Return the AUPAT_ value for file pattern "pat[patlen]".  Only patterns
+ * that file_pat_to_reg_pat() turns into literal text, possibly preceded by
+ * ".*", are handled without a regexp.
+ */
+    static int
+au_pat_kind(char_u *pat, int patlen)
+{
+    int	    i = 0;
+
+    while (i < patlen && pat[i] == '*')
+	++i;
+    if (i == patlen)
+	return i > 0 ? AUPAT_ANY : AUPAT_REGEXP;
+    for ( ; i < patlen; ++i)
+	if (!ASCII_ISALNUM(pat[i]) && vim_strchr((char_u *)"._-", pat[i]) == NULL)
+	    return AUPAT_REGEXP;
+    return pat[0] == '*' ? AUPAT_TAIL : AUPAT_LITERAL;
+}
+
+/*
+ * Return TRUE if autocmd pattern "ap" matches the file name, in the same way
+ * as match_file_pat().
+ */
+    static int
+au_pat_match(AutoPat *ap, char_u *fname, char_u *sfname, char_u *tail)
+{
+    char_u	*p;
+    char_u	*lit;
+    size_t	len;
+
+    if (ap->kind == AUPAT_ANY)
+	return TRUE;
+    if (ap->kind != AUPAT_REGEXP)
+    {
+	// Find the end of "tail".  When ignoring case leave non-ASCII
+	// characters to the regexp engine, it folds them differently.
+	for (p = tail; *p != NUL && (!p_fic || *p < 0x80); ++p)
+	    ;
+	if (*p == NUL)
+	{
+	    lit = ap->pat;
+	    while (*lit == '*')
+		++lit;
+	    len = ap->patlen - (lit - ap->pat);
+	    if (ap->kind == AUPAT_LITERAL)
+		p = tail;
+	    else if ((size_t)(p - tail) < len)
+		return FALSE;
+	    else
+		p -= len;
+	    return (p_fic ? STRICMP(p, lit) : STRCMP(p, lit)) == 0;
+	}
+    }
+    return match_file_pat(NULL, &ap->reg_prog, fname, sfname, tail,
+							      ap->allow_dirs);
+}
+
 /*
  * do_autocmd() for one event.
  * If *pat == NUL do for all patterns.
@@ -1366,12 +1445,14 @@ do_autocmd_event(
 		{
 		    ap->buflocal_nr = buflocal_nr;
 		    ap->reg_prog = NULL;
+		    ap->kind = AUPAT_REGEXP;
 		}
 		else
 		{
 		    char_u	*reg_pat;
 
 		    ap->buflocal_nr = 0;
+		    ap->kind = au_pat_kind(pat, patlen);
 		    reg_pat = file_pat_to_reg_pat(pat, endpat,
 							 &ap->allow_dirs, TRUE);
 		    if (reg_pat != NULL)
@@ -2387,6 +2468,9 @@ apply_autocmds_group(
     patcmd.tail = tail;
     patcmd.event = event;
     patcmd.arg_bufnr = autocmd_bufnr;
+#ifdef FEAT_EVAL
+    ++au_stats[(int)event].count;
+#endif
     auto_next_pat(&patcmd, FALSE);
 
     // found one, start executing the autocommands
@@ -2424,10 +2508,34 @@ apply_autocmds_group(
 
 	int save_did_emsg = did_emsg;
 	int save_ex_pressedreturn = get_pressedreturn();
+#ifdef FEAT_EVAL
+	au_stat_T *stat = &au_stats[(int)event];
+# ifdef FEAT_RELTIME
+	proftime_T exec_start;
+	float_T	save_match_time = stat->match_time;
+
+	profile_start(&exec_start);
+# endif
+	++stat->matched;
+	if (trace_fd != NULL)
+	    trace_begin("autocmd", event_nr2name(event), fname);
+#endif
 
 	do_cmdline(NULL, getnextac, (void *)&patcmd,
 				     DOCMD_NOWAIT|DOCMD_VERBOSE|DOCMD_REPEAT);
 
+#ifdef FEAT_EVAL
+	if (trace_fd != NULL)
+	    trace_end();
+#endif
+
+#if defined(FEAT_EVAL) && defined(FEAT_RELTIME)
+	// Finding the next matching pattern is counted as matching.
+	profile_end(&exec_start);
+	stat->exec_time += profile_float(&exec_start)
+				       - (stat->match_time - save_match_time);
+#endif
+
 	did_emsg += save_did_emsg;
 	set_pressedreturn(save_ex_pressedreturn);
 
@@ -2621,6 +2729,11 @@ auto_next_pat(
     char	*s;
     estack_T	*entry;
     char_u	*namep;
+#if defined(FEAT_EVAL) && defined(FEAT_RELTIME)
+    proftime_T	start;
+
+    profile_start(&start);
+#endif
 
     entry = ((estack_T *)exestack.ga_data) + exestack.ga_len - 1;
 
@@ -2640,8 +2753,7 @@ auto_next_pat(
 	{
 	    // execution-condition
 	    if (ap->buflocal_nr == 0
-		    ? (match_file_pat(NULL, &ap->reg_prog, apc->fname,
-				      apc->sfname, apc->tail, ap->allow_dirs))
+		    ? au_pat_match(ap, apc->fname, apc->sfname, apc->tail)
 		    : ap->buflocal_nr == apc->arg_bufnr)
 	    {
 		name = event_nr2name(apc->event);
@@ -2676,6 +2788,11 @@ auto_next_pat(
 	if (stop_at_last && ap->last)
 	    break;
     }
+
+#if defined(FEAT_EVAL) && defined(FEAT_RELTIME)
+    profile_end(&start);
+    au_stats[(int)apc->event].match_time += profile_float(&start);
+#endif
 }
 
 #if defined(FEAT_EVAL) || defined(PROTO)
@@ -2763,12 +2880,52 @@ getnextac(
  */
     int
 has_autocmd(event_T event, char_u *sfname, buf_T *buf)
+{
+    return has_autocmd_except(event, sfname, buf, NULL);
+}
+
+/*
+ * Return TRUE if all the commands of "ap" were defined in one of the scripts
+ * with the IDs in "sids", a zero terminated array.
+ */
+    static int
+au_defined_in(AutoPat *ap, int *sids)
+{
+    AutoCmd	*ac;
+    int		i;
+
+    for (ac = ap->cmds; ac != NULL; ac = ac->next)
+    {
+	if (ac->cmd == NULL)
+	    continue;
+	for (i = 0; sids[i] != 0; ++i)
+	    if (ac->script_ctx.sc_sid == sids[i])
+		break;
+	if (sids[i] == 0)
+	    return FALSE;
+    }
+    return TRUE;
+}
+
+/*
+ * Like has_autocmd(), but ignore autocommands defined in the scripts with the
+ * IDs in "sids", a zero terminated array, when it is not NULL.
+ */
+    int
+has_autocmd_except(
+    event_T	event,
+    char_u	*sfname,
+    buf_T	*buf,
+    int		*sids)
 {
     AutoPat	*ap;
     char_u	*fname;
     char_u	*tail = gettail(sfname);
     int		retval = FALSE;
 
+    if (first_autopat[(int)event] == NULL)
+	return FALSE;
+
     fname = FullName_save(sfname, FALSE);
     if (fname == NULL)
 	return FALSE;
@@ -2785,16 +2942,19 @@ has_autocmd(event_T event, char_u *sfname, buf_T *buf)
 #endif
 
     FOR_ALL_AUTOCMD_PATTERNS(event, ap)
+    {
+	if (sids != NULL && au_defined_in(ap, sids))
+	    continue;
 	if (ap->pat != NULL && ap->cmds != NULL
 	      && (ap->buflocal_nr == 0
-		? match_file_pat(NULL, &ap->reg_prog,
-					  fname, sfname, tail, ap->allow_dirs)
+		? au_pat_match(ap, fname, sfname, tail)
 		: buf != NULL && ap->buflocal_nr == buf->b_fnum
 	   ))
 	{
 	    retval = TRUE;
 	    break;
 	}
+    }
 
     vim_free(fname);
 #ifdef BACKSLASH_IN_FILENAME
@@ -3484,4 +3644,46 @@ f_autocmd_get(typval_T *argvars, typval_T *rettv)
     vim_free(pat);
 }
 
+/*
+ * autocmd_stats() function
+ * Returns a Dict with statistics for each event that autocommands were
+ * applied for.
+ */
+    void
+f_autocmd_stats(typval_T *argvars UNUSED, typval_T *rettv)
+{
+    event_T	event;
+    au_stat_T	*stat;
+    dict_T	*d;
+    typval_T	tv;
+
+    if (rettv_dict_alloc(rettv) == FAIL)
+	return;
+
+    for (event = (event_T)0; (int)event < NUM_EVENTS;
+					    event = (event_T)((int)event + 1))
+    {
+	stat = &au_stats[(int)event];
+	if (stat->count == 0)
+	    continue;
+	d = dict_alloc();
+	if (d == NULL)
+	    return;
+	if (dict_add_dict(rettv->vval.v_dict,
+				     (char *)event_nr2name(event), d) == FAIL)
+	{
+	    dict_unref(d);
+	    return;
+	}
+	dict_add_number(d, "count", stat->count);
+	dict_add_number(d, "matched", stat->matched);
+	tv.v_type = VAR_FLOAT;
+	tv.v_lock = 0;
+	tv.vval.v_float = stat->match_time;
+	dict_add_tv(d, "matchtime", &tv);
+	tv.vval.v_float = stat->exec_time;
+	dict_add_tv(d, "exectime", &tv);
+    }
+}
+
 #endif
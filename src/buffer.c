@@ -954,6 +954,8 @@ buf_freeall(buf_T *buf, int flags)
 #endif
     ml_close(buf, TRUE);	    // close and delete the memline/memfile
     buf->b_ml.ml_line_count = 0;    // no lines in buffer
+    search_index_free(buf);
+    ins_compl_index_free(buf);
     if ((flags & BFA_KEEP_UNDO) == 0)
 	// free the memory allocated for undo
 	// and reset all undo information
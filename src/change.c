@@ -477,6 +477,7 @@ changed_common(
 #ifdef FEAT_EVAL
     may_record_change(lnum, col, lnume, xtra);
 #endif
+    search_index_changed(lnum, lnume, xtra);
 #ifdef FEAT_DIFF
     if (curwin->w_p_diff && diff_internal())
     {
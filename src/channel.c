@@ -268,10 +268,12 @@ channel_still_useful(channel_T *channel)
     return (channel->ch_callback.cb_name != NULL && (has_sock_msg
 		|| has_out_msg || has_err_msg))
 	    || ((channel->ch_part[PART_OUT].ch_callback.cb_name != NULL
-		       || channel->ch_part[PART_OUT].ch_bufref.br_buf != NULL)
+		       || channel->ch_part[PART_OUT].ch_bufref.br_buf != NULL
+		       || channel->ch_part[PART_OUT].ch_qfid != 0)
 		    && has_out_msg)
 	    || ((channel->ch_part[PART_ERR].ch_callback.cb_name != NULL
-		       || channel->ch_part[PART_ERR].ch_bufref.br_buf != NULL)
+		       || channel->ch_part[PART_ERR].ch_bufref.br_buf != NULL
+		       || channel->ch_part[PART_ERR].ch_qfid != 0)
 		    && has_err_msg);
 }
 
@@ -351,7 +353,11 @@ channel_may_free(channel_T *channel)
     int
 channel_unref(channel_T *channel)
 {
-    if (channel != NULL && --channel->ch_refcount <= 0)
+    if (channel == NULL)
+	return FALSE;
+    // Also when not freed now, it may be freed by garbage collection.
+    may_have_garbage = TRUE;
+    if (--channel->ch_refcount <= 0)
 	return channel_may_free(channel);
     return FALSE;
 }
@@ -1241,6 +1247,38 @@ channel_set_options(channel_T *channel, jobopt_T *opt)
 	}
     }
 
+#ifdef FEAT_QUICKFIX
+    if ((opt->jo_set & JO_OUT_IO) && opt->jo_io[PART_OUT] == JIO_QUICKFIX)
+    {
+	// adding out to a quickfix list. Default mode is NL.
+	if (!(opt->jo_set & JO_OUT_MODE))
+	    channel->ch_part[PART_OUT].ch_mode = CH_MODE_NL;
+	channel->ch_part[PART_OUT].ch_qfid = (opt->jo_set2 & JO2_OUT_QFID)
+		       ? (int_u)opt->jo_io_qfid[PART_OUT]
+		       : qf_get_channel_list_id();
+	ch_log(channel, "adding out to quickfix list %d",
+					  channel->ch_part[PART_OUT].ch_qfid);
+    }
+
+    if ((opt->jo_set & JO_ERR_IO) && (opt->jo_io[PART_ERR] == JIO_QUICKFIX
+	 || (opt->jo_io[PART_ERR] == JIO_OUT && (opt->jo_set & JO_OUT_IO)
+				     && opt->jo_io[PART_OUT] == JIO_QUICKFIX)))
+    {
+	// adding err to a quickfix list. Default mode is NL.
+	if (!(opt->jo_set & JO_ERR_MODE))
+	    channel->ch_part[PART_ERR].ch_mode = CH_MODE_NL;
+	if (opt->jo_io[PART_ERR] == JIO_OUT)
+	    channel->ch_part[PART_ERR].ch_qfid =
+					   channel->ch_part[PART_OUT].ch_qfid;
+	else
+	    channel->ch_part[PART_ERR].ch_qfid = (opt->jo_set2 & JO2_ERR_QFID)
+		       ? (int_u)opt->jo_io_qfid[PART_ERR]
+		       : qf_get_channel_list_id();
+	ch_log(channel, "adding err to quickfix list %d",
+					  channel->ch_part[PART_ERR].ch_qfid);
+    }
+#endif
+
     channel->ch_part[PART_OUT].ch_io = opt->jo_io[PART_OUT];
     channel->ch_part[PART_ERR].ch_io = opt->jo_io[PART_ERR];
     channel->ch_part[PART_IN].ch_io = opt->jo_io[PART_IN];
@@ -1757,7 +1795,12 @@ invoke_callback(channel_T *channel, callback_T *callback, typval_T *argv)
     argv[0].v_type = VAR_CHANNEL;
     argv[0].vval.v_channel = channel;
 
+    if (trace_fd != NULL)
+	trace_begin("channel", callback->cb_partial != NULL
+		? partial_name(callback->cb_partial) : callback->cb_name, NULL);
     call_callback(callback, -1, &rettv, 2, argv);
+    if (trace_fd != NULL)
+	trace_end();
     clear_tv(&rettv);
     channel_need_redraw = TRUE;
 }
@@ -2967,8 +3010,8 @@ may_invoke_callback(channel_T *channel, ch_part_T part)
     }
     else
     {
-	// If there is no callback or buffer drop the message.
-	if (callback == NULL && buffer == NULL)
+	// If there is no callback, buffer or quickfix list drop the message.
+	if (callback == NULL && buffer == NULL && ch_part->ch_qfid == 0)
 	{
 	    // If there is a close callback it may use ch_read() to get the
 	    // messages.
@@ -3090,8 +3133,24 @@ may_invoke_callback(channel_T *channel, ch_part_T part)
 								       seq_nr);
 	}
     }
-    else if (callback != NULL || buffer != NULL)
+    else if (callback != NULL || buffer != NULL || ch_part->ch_qfid != 0)
     {
+#ifdef FEAT_QUICKFIX
+	if (ch_part->ch_qfid != 0)
+	{
+	    if (msg == NULL)
+		// JSON or JS mode: re-encode the message.
+		msg = json_encode(listtv, ch_mode);
+	    if (msg != NULL && qf_add_channel_lines(ch_part->ch_qfid, msg)
+								      == FAIL)
+	    {
+		// quickfix list was freed
+		ch_log(channel, "%s quickfix list has been freed",
+							  ch_part_names[part]);
+		ch_part->ch_qfid = 0;
+	    }
+	}
+#endif
 	if (buffer != NULL)
 	{
 	    if (msg == NULL)
@@ -3273,6 +3332,7 @@ channel_part_info(channel_T *channel, dict_T *dict, char *name, ch_part_T part)
 	case JIO_FILE: s = "file"; break;
 	case JIO_BUFFER: s = "buffer"; break;
 	case JIO_OUT: s = "out"; break;
+	case JIO_QUICKFIX: s = "quickfix"; break;
     }
     dict_add_string(dict, namebuf, (char_u *)s);
 
@@ -3315,6 +3375,8 @@ channel_info(channel_T *channel, dict_T *dict)
 channel_close(channel_T *channel, int invoke_close_cb)
 {
     ch_log(channel, "Closing channel");
+    // Callbacks of a closed channel are no longer marked as being used.
+    may_have_garbage = TRUE;
 
 #ifdef FEAT_GUI
     channel_gui_unregister(channel);
@@ -3340,7 +3402,8 @@ channel_close(channel_T *channel, int invoke_close_cb)
 	for (part = PART_SOCK; part < PART_IN; ++part)
 	{
 	    if (channel->ch_close_cb.cb_name != NULL
-			    || channel->ch_part[part].ch_bufref.br_buf != NULL)
+			    || channel->ch_part[part].ch_bufref.br_buf != NULL
+			    || channel->ch_part[part].ch_qfid != 0)
 	    {
 		// Increment the refcount to avoid the channel being freed
 		// halfway.
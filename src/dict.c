@@ -33,7 +33,9 @@ dict_alloc(void)
     if (d == NULL)
 	return NULL;
 
-    // Add the dict to the list of dicts for garbage collection.
+    // Add the dict to the list of dicts for garbage collection.  Until it is
+    // referenced only garbage collection can free it.
+    may_have_garbage = TRUE;
     if (first_dict != NULL)
 	first_dict->dv_used_prev = d;
     d->dv_used_next = first_dict;
@@ -175,8 +177,12 @@ dict_free(dict_T *d)
     void
 dict_unref(dict_T *d)
 {
-    if (d != NULL && --d->dv_refcount <= 0)
+    if (d == NULL)
+	return;
+    if (--d->dv_refcount <= 0)
 	dict_free(d);
+    else
+	may_have_garbage = TRUE;
 }
 
 /*
@@ -2243,9 +2243,9 @@ EXTERN char e_cannot_use_g_here[]
 EXTERN char e_not_allowed_for_terminal_in_popup_window[]
 	INIT(= N_("E863: Not allowed for a terminal in a popup window"));
 #endif
-EXTERN char e_percent_hash_can_only_be_followed_by_zero_one_two_automatic_engine_will_be_used[]
+EXTERN char e_percent_hash_can_only_be_followed_by_zero_one_two_three_automatic_engine_will_be_used[]
 	// xgettext:no-c-format
-	INIT(= N_("E864: \\%#= can only be followed by 0, 1, or 2. The automatic engine will be used"));
+	INIT(= N_("E864: \\%#= can only be followed by 0, 1, 2 or 3. The automatic engine will be used"));
 EXTERN char e_nfa_regexp_end_encountered_prematurely[]
 	INIT(= N_("E865: (NFA) Regexp end encountered prematurely"));
 EXTERN char e_nfa_regexp_misplaced_chr[]
@@ -1325,6 +1325,7 @@ static argcheck_T arg3_string_or_list_bool_number[] = {arg_string_or_list_any, a
 static argcheck_T arg3_string_string_bool[] = {arg_string, arg_string, arg_bool};
 static argcheck_T arg3_string_string_dict[] = {arg_string, arg_string, arg_dict_any};
 static argcheck_T arg3_string_string_number[] = {arg_string, arg_string, arg_number};
+static argcheck_T arg4_dict_number_number_list[] = {arg_dict_any, arg_number, arg_number, arg_list_any};
 static argcheck_T arg4_number_number_string_any[] = {arg_number, arg_number, arg_string, arg_any};
 static argcheck_T arg4_string_string_any_string[] = {arg_string, arg_string, arg_any, arg_string};
 static argcheck_T arg4_string_string_number_string[] = {arg_string, arg_string, arg_number, arg_string};
@@ -1968,6 +1969,8 @@ static funcentry_T global_functions[] =
 			ret_number_bool,    f_autocmd_delete},
     {"autocmd_get",	0, 1, FEARG_1,	    arg1_dict_any,
 			ret_list_dict_any,  f_autocmd_get},
+    {"autocmd_stats",	0, 0, 0,	    NULL,
+			ret_dict_any,	    f_autocmd_stats},
     {"balloon_gettext",	0, 0, 0,	    NULL,
 			ret_string,
 #ifdef FEAT_BEVAL
@@ -2236,6 +2239,8 @@ static funcentry_T global_functions[] =
 			ret_func_unknown,   f_function},
     {"garbagecollect",	0, 1, 0,	    arg1_bool,
 			ret_void,	    f_garbagecollect},
+    {"garbagecollect_info", 0, 0, 0,	    NULL,
+			ret_dict_any,	    f_garbagecollect_info},
     {"get",		2, 3, FEARG_1,	    arg23_get,
 			ret_any,	    f_get},
     {"getbufinfo",	0, 1, FEARG_1,	    arg1_buffer_or_dict_any,
@@ -2652,6 +2657,8 @@ static funcentry_T global_functions[] =
 			ret_list_dict_any,  PROP_FUNC(f_prop_list)},
     {"prop_remove",	1, 3, FEARG_1,	    arg3_dict_number_number,
 			ret_number,	    PROP_FUNC(f_prop_remove)},
+    {"prop_replace",	4, 4, FEARG_1,	    arg4_dict_number_number_list,
+			ret_void,	    PROP_FUNC(f_prop_replace)},
     {"prop_type_add",	2, 2, FEARG_1,	    arg2_string_dict,
 			ret_void,	    PROP_FUNC(f_prop_type_add)},
     {"prop_type_change", 2, 2, FEARG_1,	    arg2_string_dict,
@@ -2708,6 +2715,8 @@ static funcentry_T global_functions[] =
 			ret_string,	    f_reg_executing},
     {"reg_recording",	0, 0, 0,	    NULL,
 			ret_string,	    f_reg_recording},
+    {"regexpcacheinfo",	0, 0, 0,	    NULL,
+			ret_dict_number,    f_regexpcacheinfo},
     {"reltime",		0, 2, FEARG_1,	    arg2_list_number,
 			ret_list_any,	    f_reltime},
     {"reltimefloat",	1, 1, FEARG_1,	    arg1_list_number,
@@ -3098,6 +3107,10 @@ static funcentry_T global_functions[] =
 			ret_string,	    f_toupper},
     {"tr",		3, 3, FEARG_1,	    arg3_string,
 			ret_string,	    f_tr},
+    {"trace_start",	1, 1, FEARG_1,	    arg1_string,
+			ret_void,	    f_trace_start},
+    {"trace_stop",	0, 0, 0,	    NULL,
+			ret_string,	    f_trace_stop},
     {"trim",		1, 3, FEARG_1,	    arg3_string_string_number,
 			ret_string,	    f_trim},
     {"trunc",		1, 1, FEARG_1,	    arg1_float_or_nr,
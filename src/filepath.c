@@ -3944,6 +3944,739 @@ unix_expandpath(
 }
 #endif
 
+/*
+ * Cache of directory listings, used to expand file patterns in 'runtimepath'
+ * and to search in 'path' without reading the same directories again and
+ * again.  A listing is validated with the modification time of the
+ * directory, at most once per "dir_cache_tick".  Only used where file names
+ * are case sensitive.
+ */
+#if defined(UNIX) && !defined(VMS) && !defined(CASE_INSENSITIVE_FILENAME)
+# define USE_DIR_CACHE
+
+/*
+ * Entry in a directory listing.  Whether it is a directory is only found out
+ * when needed.
+ */
+typedef struct
+{
+    char	de_kind;	// DE_ values
+    char_u	de_name[1];	// name of the entry, actually longer
+} direntry_T;
+
+# define DE_UNKNOWN	0	// not checked yet
+# define DE_FILE	1	// exists and is not a directory
+# define DE_DIR		2	// a directory
+# define DE_NONE	3	// does not exist
+# define DE_LINK	4	// a symlink, the target is checked every time
+
+# define HI2DE(hi) ((direntry_T *)((hi)->hi_key - offsetof(direntry_T, de_name)))
+
+/*
+ * Cached listing of a directory.
+ */
+typedef struct dirlist_S dirlist_T;
+struct dirlist_S
+{
+    dirlist_T	*dl_lru_prev;	// used more recently, NULL for the first
+    dirlist_T	*dl_lru_next;	// used less recently, NULL for the last
+    time_t	dl_mtime;	// modification time of the directory
+# ifdef ST_MTIM_NSEC
+    long	dl_mtime_ns;
+# endif
+    int		dl_racy;	// modified in the second it was read
+    int		dl_missing;	// directory does not exist
+    int		dl_tick;	// "dir_cache_tick" when last validated
+    hashtab_T	dl_entries;	// direntry_T for each entry
+    char_u	dl_path[1];	// name of the directory, actually longer
+};
+
+# define HI2DL(hi) ((dirlist_T *)((hi)->hi_key - offsetof(dirlist_T, dl_path)))
+
+static hashtab_T dir_cache;	// dirlist_T for each cached directory
+static int dir_cache_tick = 1;
+static long dir_cache_names = 0;	// number of cached entries
+static dirlist_T *dir_cache_first = NULL;	// most recently used
+static dirlist_T *dir_cache_last = NULL;	// least recently used
+static int dir_cache_skipped = FALSE;	// did not add a listing, it's full
+static long dir_cache_max = 0;		// limit set for testing
+
+// When there are this many entries and directories no listing is added.
+// The next search then drops the least recently used listings until there
+// are no more than DIR_CACHE_LOW_NAMES.
+# define DIR_CACHE_MAX_NAMES 1000000L
+# define DIR_CACHE_LOW_NAMES(max) ((max) / 4 * 3)
+
+/*
+ * Free the entries in directory listing "dl".
+ */
+    static void
+dirlist_clear(dirlist_T *dl)
+{
+    hashitem_T	*hi;
+    int		todo;
+
+    dir_cache_names -= (long)dl->dl_entries.ht_used;
+    todo = (int)dl->dl_entries.ht_used;
+    FOR_ALL_HASHTAB_ITEMS(&dl->dl_entries, hi, todo)
+	if (!HASHITEM_EMPTY(hi))
+	{
+	    --todo;
+	    vim_free(HI2DE(hi));
+	}
+    hash_clear(&dl->dl_entries);
+    hash_init(&dl->dl_entries);
+}
+
+/*
+ * Remove "dl" from the list of listings in order of use.
+ */
+    static void
+dir_cache_lru_remove(dirlist_T *dl)
+{
+    if (dl->dl_lru_prev == NULL)
+	dir_cache_first = dl->dl_lru_next;
+    else
+	dl->dl_lru_prev->dl_lru_next = dl->dl_lru_next;
+    if (dl->dl_lru_next == NULL)
+	dir_cache_last = dl->dl_lru_prev;
+    else
+	dl->dl_lru_next->dl_lru_prev = dl->dl_lru_prev;
+}
+
+/*
+ * Add "dl" to the list of listings in order of use, as the most recently
+ * used one.
+ */
+    static void
+dir_cache_lru_add(dirlist_T *dl)
+{
+    dl->dl_lru_prev = NULL;
+    dl->dl_lru_next = dir_cache_first;
+    if (dir_cache_first == NULL)
+	dir_cache_last = dl;
+    else
+	dir_cache_first->dl_lru_prev = dl;
+    dir_cache_first = dl;
+}
+
+/*
+ * When the cache is full free the least recently used listings, one at a
+ * time, until there are no more than DIR_CACHE_LOW_NAMES entries and
+ * directories.  Must only be called when no listing is in use.
+ */
+    static void
+dir_cache_make_room(void)
+{
+    long	low;
+
+    if (!dir_cache_full())
+	return;
+    low = DIR_CACHE_LOW_NAMES(dir_cache_max > 0 ? dir_cache_max
+							: DIR_CACHE_MAX_NAMES);
+    while (dir_cache_last != NULL
+	    && dir_cache_names + (long)dir_cache.ht_used > low)
+    {
+	dirlist_T	*dl = dir_cache_last;
+
+	dir_cache_lru_remove(dl);
+	hash_remove(&dir_cache, hash_find(&dir_cache, dl->dl_path),
+								 "dir cache");
+	dirlist_clear(dl);
+	hash_clear(&dl->dl_entries);
+	vim_free(dl);
+    }
+}
+
+/*
+ * Read the entries of directory "dl" into its hashtable.
+ * Returns FAIL when the directory cannot be read.
+ */
+    static int
+dirlist_read(dirlist_T *dl)
+{
+    DIR		    *dirp;
+    struct dirent   *dp;
+    direntry_T	    *de;
+    size_t	    len;
+
+    dirp = opendir((char *)dl->dl_path);
+    if (dirp == NULL)
+	return FAIL;
+    while ((dp = readdir(dirp)) != NULL)
+    {
+	if (dp->d_name[0] == '.' && (dp->d_name[1] == NUL
+			     || (dp->d_name[1] == '.' && dp->d_name[2] == NUL)))
+	    continue;
+	len = STRLEN(dp->d_name);
+	de = alloc(offsetof(direntry_T, de_name) + len + 1);
+	if (de == NULL)
+	    break;
+	de->de_kind = DE_UNKNOWN;
+	mch_memmove(de->de_name, dp->d_name, len + 1);
+	if (hash_add(&dl->dl_entries, de->de_name, "dir cache") == FAIL)
+	    vim_free(de);
+	else
+	    ++dir_cache_names;
+    }
+    closedir(dirp);
+    return OK;
+}
+
+/*
+ * Return the kind of entry "de" in directory "dl", one of DE_FILE, DE_DIR or
+ * DE_NONE.  The kind of a symlink is not remembered: its target may appear
+ * or disappear without the directory being changed.
+ */
+    static int
+direntry_kind(dirlist_T *dl, direntry_T *de)
+{
+    char_u	buf[MAXPATHL];
+    stat_T	st;
+
+    if (de->de_kind == DE_UNKNOWN)
+    {
+	if (vim_snprintf((char *)buf, MAXPATHL, "%s/%s",
+				  dl->dl_path, de->de_name) >= MAXPATHL - 1
+		|| mch_lstat((char *)buf, &st) < 0)
+	    de->de_kind = DE_NONE;
+	else if (S_ISLNK(st.st_mode))
+	    de->de_kind = DE_LINK;
+	else
+	    de->de_kind = S_ISDIR(st.st_mode) ? DE_DIR : DE_FILE;
+    }
+    if (de->de_kind != DE_LINK)
+	return de->de_kind;
+
+    vim_snprintf((char *)buf, MAXPATHL, "%s/%s", dl->dl_path, de->de_name);
+    if (mch_stat((char *)buf, &st) < 0)
+	return DE_NONE;
+    return S_ISDIR(st.st_mode) ? DE_DIR : DE_FILE;
+}
+
+/*
+ * Return TRUE when directory "path" is known not to exist, because the
+ * listing of its parent was validated with the current "dir_cache_tick" and
+ * does not have it as a directory.
+ */
+    static int
+dir_cache_parent_lacks(char_u *path)
+{
+    char_u	*tail = gettail(path);
+    hashitem_T	*hi;
+    dirlist_T	*dl;
+    int		c;
+
+    if (tail <= path + 1 || *tail == NUL)
+	return FALSE;
+    c = tail[-1];
+    tail[-1] = NUL;
+    hi = hash_find(&dir_cache, path);
+    tail[-1] = c;
+    if (HASHITEM_EMPTY(hi))
+	return FALSE;
+    dl = HI2DL(hi);
+    if (dl->dl_tick != dir_cache_tick || dl->dl_missing)
+	return FALSE;
+    hi = hash_find(&dl->dl_entries, tail);
+    return HASHITEM_EMPTY(hi) || direntry_kind(dl, HI2DE(hi)) != DE_DIR;
+}
+
+/*
+ * Get the listing of directory "path", a full path without a trailing
+ * slash.  Reads the directory when it was not cached or was changed.
+ * Returns NULL when the directory does not exist.
+ */
+    static dirlist_T *
+dir_cache_lookup(char_u *path)
+{
+    hash_T	hash;
+    hashitem_T	*hi;
+    dirlist_T	*dl = NULL;
+    stat_T	st;
+    time_T	now;
+
+    if (dir_cache.ht_array == NULL)
+	hash_init(&dir_cache);
+
+    hash = hash_hash(path);
+    hi = hash_lookup(&dir_cache, path, hash);
+    if (!HASHITEM_EMPTY(hi))
+    {
+	dl = HI2DL(hi);
+	dir_cache_lru_remove(dl);
+	dir_cache_lru_add(dl);
+	if (dl->dl_tick == dir_cache_tick)
+	    return dl->dl_missing ? NULL : dl;
+    }
+    else
+    {
+	size_t len;
+
+	if (dir_cache_full())
+	{
+	    dir_cache_skipped = TRUE;
+	    return NULL;
+	}
+	len = STRLEN(path);
+	dl = alloc(offsetof(dirlist_T, dl_path) + len + 1);
+	if (dl == NULL)
+	    return NULL;
+	mch_memmove(dl->dl_path, path, len + 1);
+	hash_init(&dl->dl_entries);
+	dl->dl_missing = TRUE;
+	hash_add_item(&dir_cache, hi, dl->dl_path, hash);
+	dir_cache_lru_add(dl);
+    }
+    dl->dl_tick = dir_cache_tick;
+
+    if (dir_cache_parent_lacks(path)
+	    || mch_stat((char *)path, &st) < 0 || !S_ISDIR(st.st_mode))
+    {
+	if (!dl->dl_missing)
+	{
+	    dirlist_clear(dl);
+	    dl->dl_missing = TRUE;
+	}
+	return NULL;
+    }
+
+    if (!dl->dl_missing && !dl->dl_racy && dl->dl_mtime == st.st_mtime
+# ifdef ST_MTIM_NSEC
+	    && dl->dl_mtime_ns == (long)st.ST_MTIM_NSEC
+# endif
+	    )
+	return dl;
+
+    // Not read yet or changed: read it now.  When it was modified in the
+    // current second another change may follow with the same time stamp,
+    // thus check it again next time.
+    now = vim_time();
+    dirlist_clear(dl);
+    dl->dl_missing = dirlist_read(dl) == FAIL;
+    dl->dl_mtime = st.st_mtime;
+# ifdef ST_MTIM_NSEC
+    dl->dl_mtime_ns = (long)st.ST_MTIM_NSEC;
+# endif
+    dl->dl_racy = st.st_mtime >= now;
+    return dl->dl_missing ? NULL : dl;
+}
+
+/*
+ * Return TRUE if "s" up to "e" contains a wildcard.
+ */
+    static int
+dir_cache_has_wildcard(char_u *s, char_u *e)
+{
+    for ( ; s < e; ++s)
+	if (*s == '*' || *s == '?' || *s == '[')
+	    return TRUE;
+    return FALSE;
+}
+
+/*
+ * Add the entries of directory "buf[len]" matching the pattern "rest" to
+ * "gap", like unix_expandpath() does.  "buf" has room for MAXPATHL bytes.
+ */
+    static void
+dir_cache_expand_dir(
+	garray_T    *gap,
+	char_u	    *buf,
+	size_t	    len,
+	char_u	    *rest,
+	int	    flags)
+{
+    char_u	*e;
+    dirlist_T	*dl;
+    hashitem_T	*hi;
+    int		todo;
+    regmatch_T	regmatch;
+    char_u	*pat;
+    int		wild = FALSE;
+
+    // Components without a wildcard that are followed by more components
+    // are appended, their parent does not need to be read.
+    for (;;)
+    {
+	e = vim_strchr(rest, '/');
+	if (e == NULL || dir_cache_has_wildcard(rest, e))
+	    break;
+	if (e > rest)
+	{
+	    if (len + (e - rest) + 2 >= MAXPATHL)
+		return;
+	    buf[len++] = '/';
+	    mch_memmove(buf + len, rest, e - rest);
+	    len += e - rest;
+	}
+	rest = e + 1;
+    }
+    if (e == NULL)
+	e = rest + STRLEN(rest);
+    if (e == rest)
+	return;
+
+    buf[len] = NUL;
+    dl = dir_cache_lookup(len == 0 ? (char_u *)"/" : buf);
+    if (dl == NULL)
+	return;
+
+    regmatch.regprog = NULL;
+    if (dir_cache_has_wildcard(rest, e))
+    {
+	pat = file_pat_to_reg_pat(rest, e, NULL, FALSE);
+	if (pat == NULL)
+	    return;
+	regmatch.rm_ic = FALSE;
+	if (flags & EW_NOTWILD)
+	    ++emsg_silent;
+	regmatch.regprog = vim_regcomp(pat, RE_MAGIC);
+	if (flags & EW_NOTWILD)
+	    --emsg_silent;
+	vim_free(pat);
+	if (regmatch.regprog == NULL && (flags & EW_NOTWILD) == 0)
+	    return;
+	wild = TRUE;
+	todo = (int)dl->dl_entries.ht_used;
+	hi = dl->dl_entries.ht_array;
+    }
+    else
+    {
+	// No wildcard: a single lookup.
+	int c = *e;
+
+	*e = NUL;
+	hi = hash_find(&dl->dl_entries, rest);
+	*e = c;
+	todo = HASHITEM_EMPTY(hi) ? 0 : 1;
+    }
+
+    for ( ; todo > 0; ++hi)
+    {
+	direntry_T  *de;
+	int	    kind;
+	size_t	    namelen;
+
+	if (HASHITEM_EMPTY(hi))
+	    continue;
+	--todo;
+	de = HI2DE(hi);
+	namelen = STRLEN(de->de_name);
+	// With EW_NOTWILD the pattern may also match literally.
+	if (wild && ((de->de_name[0] == '.' && *rest != '.')
+		    || !((regmatch.regprog != NULL
+			    && vim_regexec(&regmatch, de->de_name, (colnr_T)0))
+			|| ((flags & EW_NOTWILD)
+			    && namelen == (size_t)(e - rest)
+			    && STRNCMP(de->de_name, rest, namelen) == 0))))
+	    continue;
+
+	kind = direntry_kind(dl, de);
+	if (kind == DE_NONE || len + namelen + 3 >= MAXPATHL)
+	    continue;
+	buf[len] = '/';
+	mch_memmove(buf + len + 1, de->de_name, namelen + 1);
+	if (*e == '/')
+	{
+	    if (kind == DE_DIR)
+		dir_cache_expand_dir(gap, buf, len + 1 + namelen, e + 1, flags);
+	}
+	else if (kind == DE_DIR ? (flags & EW_DIR) : (flags & EW_FILE))
+	{
+	    char_u *p;
+
+	    if (kind == DE_DIR && (flags & EW_ADDSLASH))
+		STRCAT(buf + len + 1, "/");
+	    p = vim_strsave(buf);
+
+	    if (p != NULL && ga_grow(gap, 1) == OK)
+		((char_u **)gap->ga_data)[gap->ga_len++] = p;
+	    else
+		vim_free(p);
+	}
+    }
+    vim_regfree(regmatch.regprog);
+}
+
+/*
+ * Return TRUE if "path" can be looked up in the cached directory listings:
+ * a full path without "**", "{}", "~", "$", "." and ".." or backslashes.
+ */
+    static int
+dir_cache_path_ok(char_u *path)
+{
+    char_u	*p;
+
+    if (p_fic || *path != '/'
+	    || vim_strpbrk(path, (char_u *)"\\{}~$`'") != NULL
+	    || strstr((char *)path, "**") != NULL
+	    || STRLEN(path) >= MAXPATHL)
+	return FALSE;
+    for (p = path; *p != NUL; ++p)
+	if (p[0] == '/' && p[1] == '.' && (p[2] == '/' || p[2] == NUL
+			  || (p[2] == '.' && (p[3] == '/' || p[3] == NUL))))
+	    return FALSE;
+    return TRUE;
+}
+#endif
+
+/*
+ * Like unix_expandpath(): add the matches for file pattern "pat" to "gap",
+ * using the cached directory listings.  "flags" can have EW_DIR, EW_FILE,
+ * EW_ADDSLASH, EW_NOTWILD, EW_SILENT and EW_CACHE.
+ * Returns the number of matches added, -1 when "pat" cannot be expanded this
+ * way.
+ */
+    int
+dir_cache_expandpath(garray_T *gap, char_u *pat, int flags)
+{
+#ifdef USE_DIR_CACHE
+    char_u	*buf;
+    int		start_len = gap->ga_len;
+    int		matches;
+
+    if ((flags & ~(EW_DIR | EW_FILE | EW_ADDSLASH | EW_NOTWILD | EW_SILENT
+							  | EW_CACHE)) != 0
+	    || !dir_cache_path_ok(pat) || pat[STRLEN(pat) - 1] == '/')
+	return -1;
+
+    buf = alloc(MAXPATHL);
+    if (buf == NULL)
+	return -1;
+    dir_cache_skipped = FALSE;
+    dir_cache_expand_dir(gap, buf, 0, pat + 1, flags);
+    vim_free(buf);
+    if (dir_cache_skipped)
+    {
+	// A directory was not cached, the matches may be incomplete.
+	while (gap->ga_len > start_len)
+	    vim_free(((char_u **)gap->ga_data)[--gap->ga_len]);
+	return -1;
+    }
+
+    matches = gap->ga_len - start_len;
+    if (matches > 1)
+	qsort(((char_u **)gap->ga_data) + start_len, matches,
+						   sizeof(char_u *), pstrcmp);
+    return matches;
+#else
+    return -1;
+#endif
+}
+
+/*
+ * Expand file pattern "pat" like gen_expand_wildcards() does, using cached
+ * directory listings.  Only handles a full path with "*", "?" and "[]"
+ * wildcards, see dir_cache_path_ok().
+ * "flags" can have EW_DIR and EW_FILE.
+ * Returns OK when something was found, FAIL when nothing was found and
+ * NOTDONE when "pat" cannot be expanded this way.
+ */
+    int
+dir_cache_expand(
+    char_u	*pat,
+    int		flags,
+    int		*num_file,
+    char_u	***file)
+{
+#ifdef USE_DIR_CACHE
+    garray_T	ga;
+
+    ga_init2(&ga, sizeof(char_u *), 10);
+    if (dir_cache_expandpath(&ga, pat, flags) < 0)
+	return NOTDONE;
+    if (ga.ga_len == 0)
+    {
+	ga_clear(&ga);
+	return FAIL;
+    }
+    *num_file = ga.ga_len;
+    *file = (char_u **)ga.ga_data;
+    return OK;
+#else
+    return NOTDONE;
+#endif
+}
+
+/*
+ * Start a new check of the cached directory listings: each one is validated
+ * again with the modification time of the directory before it is used.
+ */
+    void
+dir_cache_next_tick(void)
+{
+#ifdef USE_DIR_CACHE
+    ++dir_cache_tick;
+    dir_cache_make_room();
+#endif
+}
+
+/*
+ * Return TRUE when the cache holds as many entries as it may.  Then the
+ * cached listings are still used but no listing is added until
+ * dir_cache_next_tick() makes room.
+ */
+    int
+dir_cache_full(void)
+{
+#ifdef USE_DIR_CACHE
+    return dir_cache_names + (long)dir_cache.ht_used
+		  >= (dir_cache_max > 0 ? dir_cache_max : DIR_CACHE_MAX_NAMES);
+#else
+    return TRUE;
+#endif
+}
+
+/*
+ * Check if file "fname" exists, using the cached directory listings.
+ * When "isdir" is not NULL it is set to TRUE when "fname" is a directory.
+ * Returns OK when it exists, FAIL when it does not exist and NOTDONE when
+ * "fname" cannot be checked this way.
+ */
+    int
+dir_cache_exists(char_u *fname, int *isdir)
+{
+#ifdef USE_DIR_CACHE
+    char_u	buf[MAXPATHL];
+    char_u	*tail;
+    size_t	len;
+    dirlist_T	*dl;
+    hashitem_T	*hi;
+    int		kind;
+
+    if (!dir_cache_path_ok(fname))
+	return NOTDONE;
+    len = STRLEN(fname);
+    while (len > 1 && fname[len - 1] == '/')
+	--len;
+    if (len <= 1)
+	return NOTDONE;
+    vim_strncpy(buf, fname, len);
+    tail = gettail(buf);
+    dir_cache_skipped = FALSE;
+    if (tail == buf + 1)
+	dl = dir_cache_lookup((char_u *)"/");
+    else
+    {
+	tail[-1] = NUL;
+	dl = dir_cache_lookup(buf);
+    }
+    if (dl == NULL)
+	return dir_cache_skipped ? NOTDONE : FAIL;
+    hi = hash_find(&dl->dl_entries, tail);
+    if (HASHITEM_EMPTY(hi))
+	return FAIL;
+    kind = direntry_kind(dl, HI2DE(hi));
+    if (kind == DE_NONE)
+	return FAIL;
+    if (isdir != NULL)
+	*isdir = kind == DE_DIR;
+    return OK;
+#else
+    return NOTDONE;
+#endif
+}
+
+/*
+ * Read directory "dir" into the cache, when it wasn't cached yet or was
+ * changed.  Adds the full path of each of its subdirectories to "subdirs",
+ * except those starting with a dot, when "subdirs" is not NULL.
+ * Returns FAIL when the directory cannot be read or cached.
+ */
+    int
+dir_cache_read(char_u *dir, garray_T *subdirs)
+{
+#ifdef USE_DIR_CACHE
+    dirlist_T	*dl;
+    hashitem_T	*hi;
+    int		todo;
+
+    if (!dir_cache_path_ok(dir)
+		      || (STRLEN(dir) > 1 && dir[STRLEN(dir) - 1] == '/'))
+	return FAIL;
+    dl = dir_cache_lookup(dir);
+    if (dl == NULL)
+	return FAIL;
+    if (subdirs == NULL)
+	return OK;
+    todo = (int)dl->dl_entries.ht_used;
+    FOR_ALL_HASHTAB_ITEMS(&dl->dl_entries, hi, todo)
+	if (!HASHITEM_EMPTY(hi))
+	{
+	    direntry_T *de = HI2DE(hi);
+
+	    --todo;
+	    if (de->de_name[0] != '.' && direntry_kind(dl, de) == DE_DIR)
+	    {
+		char_u *p = concat_fnames(dir, de->de_name, TRUE);
+
+		if (p != NULL && ga_grow(subdirs, 1) == OK)
+		    ((char_u **)subdirs->ga_data)[subdirs->ga_len++] = p;
+		else
+		    vim_free(p);
+	    }
+	}
+    return OK;
+#else
+    return FAIL;
+#endif
+}
+
+/*
+ * Return the number of cached directory listings, for testing.
+ */
+    long
+dir_cache_count(void)
+{
+#ifdef USE_DIR_CACHE
+    return (long)dir_cache.ht_used;
+#else
+    return 0L;
+#endif
+}
+
+/*
+ * Free all cached directory listings.
+ */
+    void
+dir_cache_clear(void)
+{
+#ifdef USE_DIR_CACHE
+    hashitem_T	*hi;
+    int		todo;
+
+    if (dir_cache.ht_array == NULL)
+	return;
+    todo = (int)dir_cache.ht_used;
+    FOR_ALL_HASHTAB_ITEMS(&dir_cache, hi, todo)
+	if (!HASHITEM_EMPTY(hi))
+	{
+	    dirlist_T *dl = HI2DL(hi);
+
+	    --todo;
+	    dirlist_clear(dl);
+	    hash_clear(&dl->dl_entries);
+	    vim_free(dl);
+	}
+    hash_clear(&dir_cache);
+    hash_init(&dir_cache);
+    dir_cache_first = NULL;
+    dir_cache_last = NULL;
+#endif
+}
+
+/*
+ * Set the number of entries and directories the cache may hold, for testing.
+ * Zero restores the default.
+ */
+    void
+dir_cache_set_max(long max)
+{
+#ifdef USE_DIR_CACHE
+    dir_cache_max = max;
+#endif
+}
+
 /*
  * Return TRUE if "p" contains what looks like an environment variable.
  * Allowing for escaping.
@@ -4129,7 +4862,8 @@ gen_expand_wildcards(
 		    recursive = TRUE;
 		    did_expand_in_path = TRUE;
 		}
-		else
+		else if ((flags & EW_CACHE) == 0
+			|| (add_pat = dir_cache_expandpath(&ga, p, flags)) < 0)
 		    add_pat = mch_expandpath(&ga, p, flags);
 	    }
 	}
@@ -4184,12 +4918,17 @@ addfile(
     int		flags)
 {
     char_u	*p;
-    int		isdir;
+    int		isdir = -1;
+    int		exists = NOTDONE;
     stat_T	sb;
 
+    if ((flags & (EW_CACHE | EW_NOTFOUND | EW_ALLLINKS)) == EW_CACHE)
+	exists = dir_cache_exists(f, &isdir);
+
     // if the file/dir/link doesn't exist, may not add it
-    if (!(flags & EW_NOTFOUND) && ((flags & EW_ALLLINKS)
-			? mch_lstat((char *)f, &sb) < 0 : mch_getperm(f) < 0))
+    if (exists == FAIL || (exists == NOTDONE && !(flags & EW_NOTFOUND)
+		&& ((flags & EW_ALLLINKS)
+			? mch_lstat((char *)f, &sb) < 0 : mch_getperm(f) < 0)))
 	return;
 
 #ifdef FNAME_ILLEGAL
@@ -4198,7 +4937,8 @@ addfile(
 	return;
 #endif
 
-    isdir = mch_isdir(f);
+    if (isdir < 0)
+	isdir = mch_isdir(f);
     if ((isdir && !(flags & EW_DIR)) || (!isdir && !(flags & EW_FILE)))
 	return;
 
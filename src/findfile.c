@@ -190,9 +190,30 @@ static void ff_clear(ff_search_ctx_T *search_ctx);
 static void ff_free_stack_element(ff_stack_T *stack_ptr);
 static ff_stack_T *ff_create_stack_element(char_u *, size_t, char_u *, size_t, int, int);
 static int ff_path_in_stoplist(char_u *, int, string_T *);
+static int ff_isdir(char_u *fname);
+static int ff_exists(char_u *fname, int find_what);
 
 static string_T ff_expand_buffer = {NULL, 0};	    // used for expanding filenames
 
+#ifdef FEAT_TIMERS
+/*
+ * Reading the directories in 'path' into the cache of directory listings
+ * while waiting for a typed character, see 'pathidletime'.
+ */
+typedef struct
+{
+    char_u	*fi_dir;	// full path of the directory
+    int		fi_depth;	// how many levels below it may be read
+} ff_idle_dir_T;
+
+static char_u	*ff_idle_key = NULL;	// what the directories are for
+static garray_T	ff_idle_dirs = {0, 0, sizeof(ff_idle_dir_T), 20, NULL};
+static int	ff_idle_next = 0;	// index in ff_idle_dirs to read next
+static int	ff_idle_busy = FALSE;
+
+static void ff_idle_clear(void);
+#endif
+
 #if 0
 /*
  * if someone likes findfirst/findnext, here are the functions
@@ -310,6 +331,9 @@ vim_findfile_init(
     search_ctx->ffsc_find_what = find_what;
     search_ctx->ffsc_tagfile = tagfile;
 
+    // Cached directory listings are checked again for this search.
+    dir_cache_next_tick();
+
     // clear the search context, but NOT the visited lists
     ff_clear(search_ctx);
 
@@ -1023,7 +1047,7 @@ vim_findfile(void *search_ctx_arg)
 		    expand_wildcards((dirptrs[1] == NULL) ? 1 : 2, dirptrs,
 			    &stackp->ffs_filearray_size,
 			    &stackp->ffs_filearray,
-			    EW_DIR|EW_ADDSLASH|EW_SILENT|EW_NOTWILD);
+			    EW_DIR|EW_ADDSLASH|EW_SILENT|EW_NOTWILD|EW_CACHE);
 
 		stackp->ffs_filearray_cur = 0;
 		stackp->ffs_stage = 0;
@@ -1053,7 +1077,7 @@ vim_findfile(void *search_ctx_arg)
 					  i < stackp->ffs_filearray_size; ++i)
 		    {
 			if (!path_with_url(stackp->ffs_filearray[i])
-				      && !mch_isdir(stackp->ffs_filearray[i]))
+				      && !ff_isdir(stackp->ffs_filearray[i]))
 			    continue;   // not a directory
 
 			// prepare the filename to be checked for existence
@@ -1091,12 +1115,8 @@ vim_findfile(void *search_ctx_arg)
 			{
 			    // if file exists and we didn't already find it
 			    if ((path_with_url(file_path.string)
-				  || (mch_getperm(file_path.string) >= 0
-				      && (search_ctx->ffsc_find_what
-							      == FINDFILE_BOTH
-					  || ((search_ctx->ffsc_find_what
-							      == FINDFILE_DIR)
-						   == mch_isdir(file_path.string)))))
+				  || ff_exists(file_path.string,
+					       search_ctx->ffsc_find_what))
 #ifndef FF_VERBOSE
 				    && (ff_check_visited(
 					    &search_ctx->ffsc_visited_list
@@ -1180,7 +1200,7 @@ vim_findfile(void *search_ctx_arg)
 		    for (i = stackp->ffs_filearray_cur;
 					  i < stackp->ffs_filearray_size; ++i)
 		    {
-			if (!mch_isdir(stackp->ffs_filearray[i]))
+			if (!ff_isdir(stackp->ffs_filearray[i]))
 			    continue;	// not a directory
 
 			ff_push(search_ctx,
@@ -1210,7 +1230,7 @@ vim_findfile(void *search_ctx_arg)
 		    if (fnamecmp(stackp->ffs_filearray[i],
 						   stackp->ffs_fix_path.string) == 0)
 			continue; // don't repush same directory
-		    if (!mch_isdir(stackp->ffs_filearray[i]))
+		    if (!ff_isdir(stackp->ffs_filearray[i]))
 			continue;   // not a directory
 		    ff_push(search_ctx,
 			    ff_create_stack_element(
@@ -1407,6 +1427,45 @@ ff_get_visited_list(
     return retptr;
 }
 
+/*
+ * Return TRUE if "fname" is a directory.  Like mch_isdir(), but uses the
+ * cached directory listings when possible.
+ */
+    static int
+ff_isdir(char_u *fname)
+{
+    int	    isdir;
+    int	    res = dir_cache_exists(fname, &isdir);
+
+    if (res == NOTDONE)
+	return mch_isdir(fname);
+    return res == OK && isdir;
+}
+
+/*
+ * Return TRUE if "fname" exists and is what "find_what" asks for:
+ * FINDFILE_FILE, FINDFILE_DIR or FINDFILE_BOTH.  Uses the cached directory
+ * listings when possible.
+ */
+    static int
+ff_exists(char_u *fname, int find_what)
+{
+    int	    isdir;
+    int	    res = dir_cache_exists(fname, &isdir);
+
+    if (res == NOTDONE)
+    {
+	if (mch_getperm(fname) < 0)
+	    return FALSE;
+	if (find_what == FINDFILE_BOTH)
+	    return TRUE;
+	isdir = mch_isdir(fname);
+    }
+    else if (res == FAIL)
+	return FALSE;
+    return find_what == FINDFILE_BOTH || (find_what == FINDFILE_DIR) == isdir;
+}
+
 /*
  * check if two wildcard paths are equal. Returns TRUE or FALSE.
  * They are equal if:
@@ -1755,6 +1814,10 @@ find_file_in_path(
 free_findfile(void)
 {
     VIM_CLEAR_STRING(ff_expand_buffer);
+#ifdef FEAT_TIMERS
+    VIM_CLEAR(ff_idle_key);
+    ff_idle_clear();
+#endif
 }
 # endif
 
@@ -2017,6 +2080,211 @@ theend:
     return file_name;
 }
 
+#if defined(FEAT_TIMERS) || defined(PROTO)
+/*
+ * Return what the directories in 'path' depend on: the effective value of
+ * 'path', the current directory and the current file, in allocated memory.
+ */
+    static char_u *
+ff_idle_get_key(void)
+{
+    char_u	*path = *curbuf->b_p_path == NUL ? p_path : curbuf->b_p_path;
+    char_u	*fname = curbuf->b_ffname == NULL
+					   ? (char_u *)"" : curbuf->b_ffname;
+    char_u	cwd[MAXPATHL];
+    size_t	len;
+    char_u	*key;
+
+    if (mch_dirname(cwd, MAXPATHL) == FAIL)
+	*cwd = NUL;
+    len = STRLEN(path) + STRLEN(cwd) + STRLEN(fname) + 3;
+    key = alloc(len);
+    if (key != NULL)
+	vim_snprintf((char *)key, len, "%s\n%s\n%s", path, cwd, fname);
+    return key;
+}
+
+/*
+ * Free the list of directories to read.
+ */
+    static void
+ff_idle_clear(void)
+{
+    int	    i;
+
+    for (i = 0; i < ff_idle_dirs.ga_len; ++i)
+	vim_free(((ff_idle_dir_T *)ff_idle_dirs.ga_data)[i].fi_dir);
+    ga_clear(&ff_idle_dirs);
+    ff_idle_next = 0;
+}
+
+/*
+ * Add directory "dir" to the list of directories to read, with "depth"
+ * levels below it.  Takes over the allocated "dir".
+ */
+    static void
+ff_idle_add(char_u *dir, int depth)
+{
+    ff_idle_dir_T *fi;
+
+    if (dir == NULL)
+	return;
+    if (ga_grow(&ff_idle_dirs, 1) == FAIL)
+    {
+	vim_free(dir);
+	return;
+    }
+    fi = (ff_idle_dir_T *)ff_idle_dirs.ga_data + ff_idle_dirs.ga_len++;
+    fi->fi_dir = dir;
+    fi->fi_depth = depth;
+}
+
+/*
+ * Add the directories in 'path' where the search starts: for "dir" followed
+ * by "**" the directory "dir" with the depth of the "**", for "dir" just
+ * "dir" itself.
+ * The upward search after ";" and entries with other wildcards are skipped.
+ */
+    static void
+ff_idle_add_roots(void)
+{
+    char_u	*path = *curbuf->b_p_path == NUL ? p_path : curbuf->b_p_path;
+    char_u	*buf;
+    char_u	*p;
+    char_u	*dir;
+    int		depth;
+
+    buf = alloc(MAXPATHL);
+    if (buf == NULL)
+	return;
+    while (*path != NUL)
+    {
+	copy_option_part(&path, buf, MAXPATHL, ",");
+	p = vim_strchr(buf, ';');
+	if (p != NULL)
+	    *p = NUL;
+
+	depth = 0;
+	p = (char_u *)strstr((char *)buf, "**");
+	if (p != NULL)
+	{
+	    depth = strtol((char *)p + 2, NULL, 10);
+	    if (depth <= 0 || depth >= 255)
+		depth = FF_MAX_STAR_STAR_EXPAND;
+	    *p = NUL;
+	}
+	if (vim_strpbrk(buf, (char_u *)"*?[{$~`") != NULL)
+	    continue;
+
+	if (buf[0] == '.' && (buf[1] == NUL || vim_ispathsep(buf[1])))
+	{
+	    // relative to the directory of the current file
+	    if (curbuf->b_ffname == NULL)
+		continue;
+	    p = vim_strsave(curbuf->b_ffname);
+	    if (p == NULL)
+		continue;
+	    *gettail(p) = NUL;
+	    dir = concat_fnames(p, buf[1] == NUL ? buf + 1 : buf + 2, FALSE);
+	    vim_free(p);
+	}
+	else
+	    dir = vim_strsave(*buf == NUL ? (char_u *)"." : buf);
+	if (dir == NULL)
+	    continue;
+	p = FullName_save(dir, FALSE);
+	vim_free(dir);
+	if (p != NULL)
+	{
+	    // remove a trailing slash, except for the root directory
+	    dir = p + STRLEN(p);
+	    while (dir > p + 1 && vim_ispathsep(dir[-1]))
+		*--dir = NUL;
+	}
+	ff_idle_add(p, depth);
+    }
+    vim_free(buf);
+}
+
+/*
+ * Return TRUE if 'pathidletime' is set and findfile_idle() has work to do.
+ */
+    int
+findfile_idle_pending(void)
+{
+    char_u	*key;
+    int		changed;
+
+    if (p_pit <= 0 || ff_idle_busy || updating_screen || got_int)
+	return FALSE;
+    key = ff_idle_get_key();
+    changed = key == NULL || ff_idle_key == NULL
+					      || STRCMP(key, ff_idle_key) != 0;
+    vim_free(key);
+    return changed || (ff_idle_next < ff_idle_dirs.ga_len
+							 && !dir_cache_full());
+}
+
+/*
+ * Read the directories that searching in 'path' will look at into the cache
+ * of directory listings, breadth first, so that finding a file with
+ * ":find", "gf" or findfile() is fast also the first time.  Called while
+ * waiting for the user to type something.  Works for about 'pathidletime'
+ * msec, continuing where it stopped the next time.  Starts again when
+ * 'path', the current directory or the current file changes.
+ */
+    void
+findfile_idle(void)
+{
+    char_u	*key;
+    proftime_T	tm;
+    garray_T	subdirs;
+    int		i;
+
+    if (ff_idle_busy || p_pit <= 0)
+	return;
+    ff_idle_busy = TRUE;
+    profile_setlimit(p_pit, &tm);
+
+    key = ff_idle_get_key();
+    if (key == NULL || ff_idle_key == NULL || STRCMP(key, ff_idle_key) != 0)
+    {
+	vim_free(ff_idle_key);
+	ff_idle_key = key;
+	ff_idle_clear();
+	ff_idle_add_roots();
+    }
+    else
+	vim_free(key);
+
+    // Check the cached listings again, as a search would.
+    dir_cache_next_tick();
+    ga_init2(&subdirs, sizeof(char_u *), 20);
+    while (ff_idle_next < ff_idle_dirs.ga_len && !dir_cache_full()
+				    && !got_int && !profile_passed_limit(&tm))
+    {
+	ff_idle_dir_T	*fi = (ff_idle_dir_T *)ff_idle_dirs.ga_data
+							       + ff_idle_next;
+	char_u		*dir = fi->fi_dir;
+	int		depth = fi->fi_depth;
+
+	fi->fi_dir = NULL;
+	++ff_idle_next;
+	if (dir_cache_read(dir, depth > 0 ? &subdirs : NULL) == OK)
+	    for (i = 0; i < subdirs.ga_len; ++i)
+		ff_idle_add(((char_u **)subdirs.ga_data)[i], depth - 1);
+	subdirs.ga_len = 0;
+	vim_free(dir);
+    }
+    ga_clear(&subdirs);
+
+    // Free the directories when done, keep the key to not start again.
+    if (ff_idle_next >= ff_idle_dirs.ga_len || dir_cache_full())
+	ff_idle_clear();
+    ff_idle_busy = FALSE;
+}
+#endif
+
 /*
  * Get the file name at the cursor.
  * If Visual mode is active, use the selected text if it's in one line.
@@ -22,6 +22,14 @@
  */
 static int current_copyID = 0;
 
+// Statistics returned by garbagecollect_info().
+static long	gc_count = 0;	    // number of collections done
+static long	gc_skipped = 0;	    // number of collections skipped
+static long	gc_freed = 0;	    // number of collections that freed items
+static float_T	gc_last_time = 0.0; // duration of the last collection
+static float_T	gc_max_time = 0.0;  // duration of the longest collection
+static float_T	gc_total_time = 0.0; // duration of all collections
+
 static int free_unref_items(int copyID);
 
 /*
@@ -69,6 +77,11 @@ garbage_collect(int testing)
     win_T	*wp;
     int		did_free = FALSE;
     tabpage_T	*tp;
+#ifdef FEAT_RELTIME
+    proftime_T	start;
+
+    profile_start(&start);
+#endif
 
     if (!testing)
     {
@@ -236,15 +249,74 @@ garbage_collect(int testing)
 	 *    This may call us back recursively.
 	 */
 	free_unref_funccal(copyID, testing);
+
+	// Everything unreachable has been freed now.
+	may_have_garbage = FALSE;
     }
     else if (p_verbose > 0)
     {
 	verb_msg(_("Not enough memory to set references, garbage collection aborted!"));
     }
 
+    ++gc_count;
+    if (did_free)
+	++gc_freed;
+#ifdef FEAT_RELTIME
+    profile_end(&start);
+    gc_last_time = profile_float(&start);
+    if (gc_last_time > gc_max_time)
+	gc_max_time = gc_last_time;
+    gc_total_time += gc_last_time;
+#endif
+
     return did_free;
 }
 
+/*
+ * Do garbage collection when waiting for a character.  Skipped when no List,
+ * Dictionary, etc. was created or lost a reference since the last
+ * collection, nothing can have become unreachable then, unless
+ * garbagecollect() was called.  When not skipped this is a full collection,
+ * the time it takes is not bounded.
+ */
+    void
+garbage_collect_when_idle(void)
+{
+    if (!may_have_garbage && !want_garbage_collect)
+    {
+	++gc_skipped;
+	return;
+    }
+    (void)garbage_collect(FALSE);
+}
+
+/*
+ * "garbagecollect_info()" function
+ */
+    void
+f_garbagecollect_info(typval_T *argvars UNUSED, typval_T *rettv)
+{
+    dict_T	*d;
+    typval_T	tv;
+
+    if (rettv_dict_alloc(rettv) == FAIL)
+	return;
+    d = rettv->vval.v_dict;
+
+    dict_add_number(d, "count", gc_count);
+    dict_add_number(d, "skipped", gc_skipped);
+    dict_add_number(d, "freed", gc_freed);
+
+    tv.v_type = VAR_FLOAT;
+    tv.v_lock = 0;
+    tv.vval.v_float = gc_last_time;
+    dict_add_tv(d, "last", &tv);
+    tv.vval.v_float = gc_max_time;
+    dict_add_tv(d, "max", &tv);
+    tv.vval.v_float = gc_total_time;
+    dict_add_tv(d, "total", &tv);
+}
+
 /*
  * Free lists, dictionaries, channels and jobs that are no longer referenced.
  */
@@ -1722,7 +1722,7 @@ before_blocking(void)
     updatescript(0);
 #ifdef FEAT_EVAL
     if (may_garbage_collect)
-	garbage_collect(FALSE);
+	garbage_collect_when_idle();
 #endif
 }
 
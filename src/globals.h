@@ -395,6 +395,15 @@ EXTERN int	may_garbage_collect INIT(= FALSE);
 EXTERN int	want_garbage_collect INIT(= FALSE);
 EXTERN int	garbage_collect_at_exit INIT(= FALSE);
 
+/*
+ * "may_have_garbage" is set when a List, Dictionary, etc. is created, it may
+ * never get referenced, and when its reference count is decremented without
+ * it being freed, it may now only be referenced by itself.  When not set the
+ * garbage collection done while waiting for a character is skipped, it would
+ * not find anything to free.
+ */
+EXTERN int	may_have_garbage INIT(= TRUE);
+
 
 // Array with predefined commonly used types.
 //
@@ -1945,6 +1954,9 @@ EXTERN int xsmp_icefd INIT(= -1);   // The actual connection
 #ifdef STARTUPTIME
 EXTERN FILE *time_fd INIT(= NULL);  // where to write startup timing
 #endif
+#ifdef FEAT_EVAL
+EXTERN FILE *trace_fd INIT(= NULL); // where to write trace events
+#endif
 
 /*
  * Some compilers warn for not using a return value, but in some situations we
@@ -4729,6 +4729,528 @@ ins_compl_get_next_word_or_line(
     return ptr;
 }
 
+/*
+ * A word in the completion index of a buffer.
+ */
+typedef struct
+{
+    pos_T	cw_first;	// start of the first occurrence
+    pos_T	cw_last;	// start of the last occurrence
+    pos_T	cw_vi_first;	// same, not counting occurrences right after
+    pos_T	cw_vi_last;	// a match of "\<\k\k", lnum is zero if none
+    char_u	cw_word[1];	// the word, actually longer
+} complword_T;
+
+#define CW_KEY_OFF	offsetof(complword_T, cw_word)
+#define HI2CW(hi)	((complword_T *)((hi)->hi_key - CW_KEY_OFF))
+
+/*
+ * The completion index remembers the keywords in a buffer, so that keyword
+ * completion in other buffers does not have to search all their text each
+ * time.  It is made again when the text or 'iskeyword' was changed.
+ */
+struct complindex_S
+{
+    varnumber_T	ci_changedtick;	// b:changedtick the index is valid for
+    linenr_T	ci_line_count;	// line count the index is valid for
+    char_u	ci_chartab[32];	// b_chartab the index was made with
+    hashtab_T	ci_ht;		// complword_T items by word
+    garray_T	ci_words;	// complword_T pointers in order of the first
+				// occurrence
+    complword_T	**ci_sorted;	// ci_words sorted on the word, ASCII case
+				// folded
+    garray_T	ci_mbyte;	// complword_T pointers of words with a
+				// non-ASCII byte
+    char_u	*ci_pat;	// pattern ci_fwd and ci_bwd are for
+    int		ci_magic;	// 'magic' used for ci_pat
+    int		ci_ic;		// ignoring case for ci_pat
+    int		ci_vi;		// used cw_vi_first and cw_vi_last
+    garray_T	ci_fwd;		// first occurrences of the words matching
+				// ci_pat, pos_T items in order
+    garray_T	ci_bwd;		// last occurrences of the words matching
+				// ci_pat, pos_T items in reverse order
+};
+
+/*
+ * Free the completion index of buffer "buf".
+ */
+    void
+ins_compl_index_free(buf_T *buf)
+{
+    complindex_T    *ci = buf->b_compl_index;
+    int		    i;
+
+    if (ci == NULL)
+	return;
+    for (i = 0; i < ci->ci_words.ga_len; ++i)
+	vim_free(((complword_T **)ci->ci_words.ga_data)[i]);
+    ga_clear(&ci->ci_words);
+    hash_clear(&ci->ci_ht);
+    vim_free(ci->ci_sorted);
+    ga_clear(&ci->ci_mbyte);
+    vim_free(ci->ci_pat);
+    ga_clear(&ci->ci_fwd);
+    ga_clear(&ci->ci_bwd);
+    VIM_CLEAR(buf->b_compl_index);
+}
+
+/*
+ * Compare two strings, for length "len", ignoring case the ASCII way.
+ */
+    static int
+compl_index_strnicmp(char_u *s1, char_u *s2, size_t len)
+{
+    int		i;
+
+    while (len > 0)
+    {
+	i = (int)TOLOWER_ASC(*s1) - (int)TOLOWER_ASC(*s2);
+	if (i != 0)
+	    return i;
+	if (*s1 == NUL)
+	    break;
+	++s1;
+	++s2;
+	--len;
+    }
+    return 0;
+}
+
+/*
+ * Function passed to qsort() to sort words on the text, ignoring case.
+ */
+    static int
+compl_index_compare(const void *s1, const void *s2)
+{
+    complword_T	*cw1 = *(complword_T **)s1;
+    complword_T	*cw2 = *(complword_T **)s2;
+    int		res;
+
+    res = compl_index_strnicmp(cw1->cw_word, cw2->cw_word, (size_t)MAXCOL);
+    if (res == 0)
+	res = STRCMP(cw1->cw_word, cw2->cw_word);
+    return res;
+}
+
+/*
+ * Function passed to qsort() to sort positions.
+ */
+    static int
+compl_index_pos_compare(const void *s1, const void *s2)
+{
+    pos_T	*p1 = (pos_T *)s1;
+    pos_T	*p2 = (pos_T *)s2;
+
+    if (p1->lnum != p2->lnum)
+	return p1->lnum < p2->lnum ? -1 : 1;
+    if (p1->col != p2->col)
+	return p1->col < p2->col ? -1 : 1;
+    return 0;
+}
+
+/*
+ * Function passed to qsort() to sort positions, the last one first.
+ */
+    static int
+compl_index_pos_rcompare(const void *s1, const void *s2)
+{
+    return compl_index_pos_compare(s2, s1);
+}
+
+/*
+ * Add the word "word" found at "lnum" and "col" to completion index "ci".
+ * "after_match" is TRUE when it is right after a match of "\<\k\k".
+ * Returns FAIL when out of memory.
+ */
+    static int
+compl_index_add_word(
+	complindex_T	*ci,
+	char_u		*word,
+	linenr_T	lnum,
+	colnr_T		col,
+	int		after_match)
+{
+    hash_T	hash;
+    hashitem_T	*hi;
+    complword_T	*cw;
+    size_t	len;
+    char_u	*p;
+
+    hash = hash_hash(word);
+    hi = hash_lookup(&ci->ci_ht, word, hash);
+    if (!HASHITEM_EMPTY(hi))
+    {
+	cw = HI2CW(hi);
+	cw->cw_last.lnum = lnum;
+	cw->cw_last.col = col;
+	if (!after_match)
+	{
+	    if (cw->cw_vi_first.lnum == 0)
+		cw->cw_vi_first = cw->cw_last;
+	    cw->cw_vi_last = cw->cw_last;
+	}
+	return OK;
+    }
+
+    len = STRLEN(word);
+    cw = alloc(CW_KEY_OFF + len + 1);
+    if (cw == NULL || ga_grow(&ci->ci_words, 1) == FAIL)
+    {
+	vim_free(cw);
+	return FAIL;
+    }
+    cw->cw_first.lnum = lnum;
+    cw->cw_first.col = col;
+    cw->cw_first.coladd = 0;
+    cw->cw_last = cw->cw_first;
+    if (after_match)
+	CLEAR_POS(&cw->cw_vi_first);
+    else
+	cw->cw_vi_first = cw->cw_first;
+    cw->cw_vi_last = cw->cw_vi_first;
+    mch_memmove(cw->cw_word, word, len + 1);
+    if (hash_add_item(&ci->ci_ht, hi, cw->cw_word, hash) == FAIL)
+    {
+	vim_free(cw);
+	return FAIL;
+    }
+    ((complword_T **)ci->ci_words.ga_data)[ci->ci_words.ga_len++] = cw;
+
+    for (p = word; *p != NUL; ++p)
+	if (*p >= 0x80)
+	{
+	    if (ga_grow(&ci->ci_mbyte, 1) == FAIL)
+		return FAIL;
+	    ((complword_T **)ci->ci_mbyte.ga_data)[ci->ci_mbyte.ga_len++] = cw;
+	    break;
+	}
+    return OK;
+}
+
+/*
+ * Make the completion index for buffer "buf": find all the words in the
+ * buffer where a keyword completion pattern can match.  That is at the start
+ * of each keyword, except for a single character not followed by another
+ * keyword character.  When searching continues at the end of a match, a word
+ * right after such a single character is skipped by "\<\k\k", remember
+ * that too.
+ * Returns NULL when interrupted or out of memory.
+ */
+    static complindex_T *
+compl_index_build(buf_T *buf)
+{
+    complindex_T    *ci;
+    garray_T	    word_ga;
+    linenr_T	    lnum;
+    int		    i;
+
+    ci = ALLOC_CLEAR_ONE(complindex_T);
+    if (ci == NULL)
+	return NULL;
+    ci->ci_changedtick = CHANGEDTICK(buf);
+    ci->ci_line_count = buf->b_ml.ml_line_count;
+    mch_memmove(ci->ci_chartab, buf->b_chartab, sizeof(ci->ci_chartab));
+    hash_init(&ci->ci_ht);
+    ga_init2(&ci->ci_words, sizeof(complword_T *), 1000);
+    ga_init2(&ci->ci_mbyte, sizeof(complword_T *), 100);
+    ga_init2(&ci->ci_fwd, sizeof(pos_T), 100);
+    ga_init2(&ci->ci_bwd, sizeof(pos_T), 100);
+    buf->b_compl_index = ci;
+    ga_init2(&word_ga, 1, 100);
+
+    for (lnum = 1; lnum <= buf->b_ml.ml_line_count; ++lnum)
+    {
+	char_u	*line = ml_get_buf(buf, lnum, FALSE);
+	char_u	*p = line;
+	int	prev_class = 0;
+	char_u	*match_end = NULL;
+
+	while (*p != NUL)
+	{
+	    int	    class = mb_get_class_buf(p, buf);
+	    char_u  *end;
+	    int	    len;
+
+	    if (class <= 1 || class == prev_class)
+	    {
+		prev_class = class;
+		MB_PTR_ADV(p);
+		continue;
+	    }
+
+	    // Find the end of the word, like find_word_end() does.
+	    end = p;
+	    do
+		MB_PTR_ADV(end);
+	    while (*end != NUL && mb_get_class_buf(end, buf) == class);
+	    len = (int)(end - p);
+
+	    // "\<x\k" only matches a single character followed by a keyword
+	    // character.
+	    if (end != p + (*mb_ptr2len)(p) || vim_iswordp_buf(end, buf))
+	    {
+		int	after_match = p == match_end;
+
+		if (ga_grow(&word_ga, len + 1) == FAIL)
+		    goto fail;
+		mch_memmove(word_ga.ga_data, p, len);
+		((char_u *)word_ga.ga_data)[len] = NUL;
+		if (compl_index_add_word(ci, word_ga.ga_data, lnum,
+				    (colnr_T)(p - line), after_match) == FAIL)
+		    goto fail;
+		// "\<\k\k" matching a single character word ends inside the
+		// next word.
+		if (!after_match && end == p + (*mb_ptr2len)(p))
+		    match_end = end;
+	    }
+	    prev_class = class;
+	    p = end;
+	}
+
+	if ((lnum & 0xff) == 0)
+	{
+	    fast_breakcheck();
+	    if (got_int)
+		goto fail;
+	}
+    }
+    ga_clear(&word_ga);
+
+    if (ci->ci_words.ga_len > 0)
+    {
+	ci->ci_sorted = ALLOC_MULT(complword_T *, ci->ci_words.ga_len);
+	if (ci->ci_sorted == NULL)
+	{
+	    ins_compl_index_free(buf);
+	    return NULL;
+	}
+	for (i = 0; i < ci->ci_words.ga_len; ++i)
+	    ci->ci_sorted[i] = ((complword_T **)ci->ci_words.ga_data)[i];
+	qsort((void *)ci->ci_sorted, (size_t)ci->ci_words.ga_len,
+				  sizeof(complword_T *), compl_index_compare);
+    }
+    return ci;
+
+fail:
+    ga_clear(&word_ga);
+    ins_compl_index_free(buf);
+    return NULL;
+}
+
+/*
+ * Find the words in completion index "ci" that "compl_pattern" matches at
+ * their occurrences in "buf" and store their first and last occurrence in
+ * ci_fwd and ci_bwd.
+ * Returns FAIL when the pattern is invalid or out of memory.
+ */
+    static int
+compl_index_find_words(complindex_T *ci, buf_T *buf)
+{
+    regmatch_T	    regmatch;
+    complword_T	    **cand;
+    int		    count;
+    int		    headlen = 0;
+    int		    vi;
+    pos_T	    *fwd;
+    pos_T	    *bwd;
+    int		    i;
+
+    ga_clear(&ci->ci_fwd);
+    ga_clear(&ci->ci_bwd);
+    VIM_CLEAR(ci->ci_pat);
+
+    ++emsg_off;
+    regmatch.regprog = vim_regcomp(compl_pattern.string,
+					       magic_isset() ? RE_MAGIC : 0);
+    --emsg_off;
+    if (regmatch.regprog == NULL)
+	return FAIL;
+    regmatch.rm_ic = ignorecase(compl_pattern.string);
+
+    // When searching continues at the end of a match "\<\k\k" may skip a
+    // word, see compl_index_build().
+    vi = compl_length == 0 && vim_strchr(p_cpo, CPO_SEARCH) != NULL;
+
+    // All matching words start with the typed text.  The words are sorted
+    // with ASCII case folded, use the ASCII part of the text.
+    if (compl_orig_text.string != NULL)
+	while (headlen < compl_length
+		&& headlen < (int)compl_orig_text.length
+		&& compl_orig_text.string[headlen] < 0x80)
+	    ++headlen;
+    cand = ci->ci_sorted;
+    count = ci->ci_words.ga_len;
+    if (headlen > 0 && count > 0)
+    {
+	int	lo = 0;
+	int	hi = count;
+	int	first;
+
+	while (lo < hi)
+	{
+	    int mid = lo + (hi - lo) / 2;
+
+	    if (compl_index_strnicmp(ci->ci_sorted[mid]->cw_word,
+			       compl_orig_text.string, (size_t)headlen) < 0)
+		lo = mid + 1;
+	    else
+		hi = mid;
+	}
+	first = lo;
+	hi = count;
+	while (lo < hi)
+	{
+	    int mid = lo + (hi - lo) / 2;
+
+	    if (compl_index_strnicmp(ci->ci_sorted[mid]->cw_word,
+			      compl_orig_text.string, (size_t)headlen) <= 0)
+		lo = mid + 1;
+	    else
+		hi = mid;
+	}
+	cand = ci->ci_sorted + first;
+	count = lo - first;
+    }
+
+    for (i = 0; ; ++i)
+    {
+	complword_T *cw;
+	pos_T	    *pos;
+	char_u	    *line;
+
+	if (i == count)
+	{
+	    // When ignoring case a non-ASCII character in a word may match an
+	    // ASCII character in the text, also try those words.
+	    if (cand == (complword_T **)ci->ci_mbyte.ga_data || headlen == 0
+							   || !regmatch.rm_ic)
+		break;
+	    cand = (complword_T **)ci->ci_mbyte.ga_data;
+	    count = ci->ci_mbyte.ga_len;
+	    i = -1;
+	    continue;
+	}
+	cw = cand[i];
+	pos = vi ? &cw->cw_vi_first : &cw->cw_first;
+	if (pos->lnum == 0)
+	    continue;
+
+	// Check the pattern matches where the word is in the buffer.
+	line = ml_get_buf(buf, pos->lnum, FALSE);
+	if (!vim_regexec(&regmatch, line, pos->col)
+				  || regmatch.startp[0] != line + pos->col)
+	    continue;
+	if (ga_grow(&ci->ci_fwd, 1) == FAIL || ga_grow(&ci->ci_bwd, 1) == FAIL)
+	    break;
+	((pos_T *)ci->ci_fwd.ga_data)[ci->ci_fwd.ga_len++] = *pos;
+	((pos_T *)ci->ci_bwd.ga_data)[ci->ci_bwd.ga_len++] =
+					      vi ? cw->cw_vi_last : cw->cw_last;
+    }
+    vim_regfree(regmatch.regprog);
+
+    // Sort the positions, words with a non-ASCII byte may have been found
+    // twice.
+    fwd = (pos_T *)ci->ci_fwd.ga_data;
+    bwd = (pos_T *)ci->ci_bwd.ga_data;
+    qsort((void *)fwd, (size_t)ci->ci_fwd.ga_len, sizeof(pos_T),
+						     compl_index_pos_compare);
+    qsort((void *)bwd, (size_t)ci->ci_bwd.ga_len, sizeof(pos_T),
+						    compl_index_pos_rcompare);
+    for (i = 1, count = 1; i < ci->ci_fwd.ga_len; ++i)
+	if (!EQUAL_POS(fwd[i], fwd[count - 1]))
+	    fwd[count++] = fwd[i];
+    for (i = 1, count = 1; i < ci->ci_bwd.ga_len; ++i)
+	if (!EQUAL_POS(bwd[i], bwd[count - 1]))
+	    bwd[count++] = bwd[i];
+    if (ci->ci_fwd.ga_len > 0)
+	ci->ci_fwd.ga_len = ci->ci_bwd.ga_len = count;
+
+    ci->ci_pat = vim_strsave(compl_pattern.string);
+    if (ci->ci_pat == NULL)
+	return FAIL;
+    ci->ci_magic = magic_isset();
+    ci->ci_ic = regmatch.rm_ic;
+    ci->ci_vi = vi;
+    return OK;
+}
+
+/*
+ * Return TRUE if the completion index can be used to find the matches of
+ * "compl_pattern" in buffer "buf", which is not the current buffer.  Makes
+ * the index when needed.
+ */
+    static int
+compl_index_usable(buf_T *buf)
+{
+    complindex_T    *ci;
+
+    // Only for finding keywords, not when adding words or lines.
+    if (!ctrl_x_mode_normal() || compl_status_adding()
+					     || (compl_cont_status & CONT_SOL)
+					     || compl_pattern.string == NULL)
+	return FALSE;
+    // The words are found with 'iskeyword' of the current buffer.
+    if (memcmp(buf->b_chartab, curbuf->b_chartab, sizeof(buf->b_chartab))
+									 != 0)
+	return FALSE;
+
+    ci = buf->b_compl_index;
+    if (ci != NULL && (ci->ci_changedtick != CHANGEDTICK(buf)
+		|| ci->ci_line_count != buf->b_ml.ml_line_count
+		|| memcmp(ci->ci_chartab, buf->b_chartab,
+						  sizeof(ci->ci_chartab)) != 0))
+    {
+	ins_compl_index_free(buf);
+	ci = NULL;
+    }
+    if (ci == NULL)
+    {
+	ci = compl_index_build(buf);
+	if (ci == NULL)
+	    return FALSE;
+    }
+
+    if (ci->ci_pat == NULL || STRCMP(ci->ci_pat, compl_pattern.string) != 0
+	    || ci->ci_magic != magic_isset()
+	    || ci->ci_ic != ignorecase(compl_pattern.string)
+	    || ci->ci_vi != (compl_length == 0
+			       && vim_strchr(p_cpo, CPO_SEARCH) != NULL))
+	return compl_index_find_words(ci, buf) == OK;
+    return TRUE;
+}
+
+/*
+ * Find the next match of "compl_pattern" in buffer "buf" after "pos" in
+ * direction "dir", using the completion index.  Only the first occurrence of
+ * a word in that direction is found, the others would be duplicates.
+ * Returns OK and sets "pos" when found, FAIL otherwise.
+ */
+    static int
+compl_index_next(buf_T *buf, pos_T *pos, int dir)
+{
+    complindex_T    *ci = buf->b_compl_index;
+    garray_T	    *gap = dir == FORWARD ? &ci->ci_fwd : &ci->ci_bwd;
+    pos_T	    *positions = (pos_T *)gap->ga_data;
+    int		    lo = 0;
+    int		    hi = gap->ga_len;
+
+    // Find the first position that comes after "pos".
+    while (lo < hi)
+    {
+	int	mid = lo + (hi - lo) / 2;
+
+	if (dir == FORWARD ? !LT_POSP(pos, &positions[mid])
+					     : !LT_POSP(&positions[mid], pos))
+	    lo = mid + 1;
+	else
+	    hi = mid;
+    }
+    if (lo == gap->ga_len)
+	return FAIL;
+    *pos = positions[lo];
+    return OK;
+}
+
 /*
  * Get the next set of words matching "compl_pattern" for default completion(s)
  * (normal ^P/^N and ^X^L).
@@ -4751,12 +5273,17 @@ get_next_default_completion(ins_compl_next_state_T *st, pos_T *start_pos)
     char_u	*leader = ins_compl_leader();
     int		score = 0;
     int		in_curbuf = st->ins_buf == curbuf;
+    int		use_index;
 
     // If 'infercase' is set, don't use 'smartcase' here
     save_p_scs = p_scs;
     if (st->ins_buf->b_p_inf)
 	p_scs = FALSE;
 
+    // Other buffers don't change while completing, find the matches there
+    // with an index of their words instead of searching all their text.
+    use_index = !in_curbuf && !in_collect && compl_index_usable(st->ins_buf);
+
     //	Buffers other than curbuf are scanned from the beginning or the
     //	end but never from the middle, thus setting nowrapscan in this
     //	buffer is a good idea, on the other hand, we always set
@@ -4784,6 +5311,9 @@ get_next_default_completion(ins_compl_next_state_T *st, pos_T *start_pos)
 	else if (ctrl_x_mode_whole_line() || ctrl_x_mode_eval() || (compl_cont_status & CONT_SOL))
 	    found_new_match = search_for_exact_line(st->ins_buf,
 			    st->cur_match_pos, compl_direction, compl_pattern.string);
+	else if (use_index)
+	    found_new_match = compl_index_next(st->ins_buf, st->cur_match_pos,
+							     compl_direction);
 	else
 	    found_new_match = searchit(NULL, st->ins_buf, st->cur_match_pos,
 				NULL, compl_direction, compl_pattern.string, (int)compl_pattern.length,
@@ -57,6 +57,10 @@ handle_io(typval_T *item, ch_part_T part, jobopt_T *opt)
 	opt->jo_io[part] = JIO_BUFFER;
     else if (STRCMP(val, "out") == 0 && part == PART_ERR)
 	opt->jo_io[part] = JIO_OUT;
+#ifdef FEAT_QUICKFIX
+    else if (STRCMP(val, "quickfix") == 0 && part != PART_IN)
+	opt->jo_io[part] = JIO_QUICKFIX;
+#endif
     else
     {
 	semsg(_(e_invalid_argument_str), val);
@@ -252,6 +256,22 @@ get_job_options(typval_T *tv, jobopt_T *opt, int supported, int supported2)
 		opt->jo_set2 |= JO2_OUT_MSG << (part - PART_OUT);
 		opt->jo_message[part] = tv_get_bool(item);
 	    }
+	    else if (STRCMP(hi->hi_key, "out_qfid") == 0
+		    || STRCMP(hi->hi_key, "err_qfid") == 0)
+	    {
+		part = part_from_char(*hi->hi_key);
+
+		if (!(supported & JO_OUT_IO))
+		    break;
+		opt->jo_set2 |= JO2_OUT_QFID << (part - PART_OUT);
+		opt->jo_io_qfid[part] = tv_get_number(item);
+		if (opt->jo_io_qfid[part] <= 0)
+		{
+		    semsg(_(e_invalid_value_for_argument_str_str),
+					      hi->hi_key, tv_get_string(item));
+		    return FAIL;
+		}
+	    }
 	    else if (STRCMP(hi->hi_key, "in_top") == 0
 		    || STRCMP(hi->hi_key, "in_bot") == 0)
 	    {
@@ -1063,6 +1083,9 @@ job_cleanup(job_T *job)
     if (job->jv_channel != NULL && job->jv_channel->ch_anonymous_pipe)
 	job->jv_channel->ch_killing = TRUE;
 
+    // An ended job may no longer be useful, garbage collection may free it.
+    may_have_garbage = TRUE;
+
     // Do not free the job in case the close callback of the associated channel
     // isn't invoked yet and may get information by job_info().
     if (job->jv_refcount == 0 && !job_channel_still_useful(job))
@@ -1098,7 +1121,10 @@ set_ref_in_job(int copyID)
     void
 job_unref(job_T *job)
 {
-    if (job == NULL || --job->jv_refcount > 0)
+    if (job == NULL)
+	return;
+    may_have_garbage = TRUE;
+    if (--job->jv_refcount > 0)
 	return;
 
     // Do not free the job if there is a channel where the close callback
@@ -21,7 +21,14 @@ static list_T		*first_list = NULL;	// list of all lists
 #define FOR_ALL_WATCHERS(l, lw) \
     for ((lw) = (l)->lv_watch; (lw) != NULL; (lw) = (lw)->lw_next)
 
+// When list_find() would skip at least this many items, it creates an array
+// with pointers to the items.
+#define LIST_INDEX_MIN_STEPS	100
+// Minimal size of that array.
+#define LIST_INDEX_MIN_SIZE	256
+
 static void list_free_item(list_T *l, listitem_T *item);
+static void list_index_free(list_T *l);
 
 /*
  * Add a watcher to a list.
@@ -71,7 +78,9 @@ list_fix_watch(list_T *l, listitem_T *item)
     static void
 list_init(list_T *l)
 {
-    // Prepend the list to the list of lists for garbage collection.
+    // Prepend the list to the list of lists for garbage collection.  Until
+    // it is referenced only garbage collection can free it.
+    may_have_garbage = TRUE;
     if (first_list != NULL)
 	first_list->lv_used_prev = l;
     l->lv_used_prev = NULL;
@@ -213,8 +222,12 @@ rettv_list_set(typval_T *rettv, list_T *l)
     void
 list_unref(list_T *l)
 {
-    if (l != NULL && --l->lv_refcount <= 0)
+    if (l == NULL)
+	return;
+    if (--l->lv_refcount <= 0)
 	list_free(l);
+    else
+	may_have_garbage = TRUE;
 }
 
 /*
@@ -227,6 +240,8 @@ list_free_contents(list_T *l)
     listitem_T *item;
 
     if (l->lv_first != &range_list_item)
+    {
+	list_index_free(l);
 	for (item = l->lv_first; item != NULL; item = l->lv_first)
 	{
 	    // Remove the item before deleting it.
@@ -234,6 +249,7 @@ list_free_contents(list_T *l)
 	    clear_tv(&item->li_tv);
 	    list_free_item(l, item);
 	}
+    }
 }
 
 /*
@@ -390,6 +406,56 @@ list_equal(
     return item1 == NULL && item2 == NULL;
 }
 
+/*
+ * Free the array with item pointers of list "l", if there is one.  Must be
+ * done when items are inserted, removed or moved.  Not needed for appending
+ * items.
+ */
+    static void
+list_index_free(list_T *l)
+{
+    VIM_CLEAR(l->lv_u.mat.lv_items);
+    l->lv_u.mat.lv_items_len = 0;
+}
+
+/*
+ * Make the array with item pointers of list "l" include all the items.
+ * The array is allocated with a size that is a power of two, so that
+ * extending it after appending items takes linear time.
+ * Returns FAIL when out of memory.
+ */
+    static int
+list_index_update(list_T *l)
+{
+    int		len = l->lv_u.mat.lv_items_len;
+    long	size;
+    long	new_size;
+    listitem_T	*item;
+
+    for (size = LIST_INDEX_MIN_SIZE; size < len; size *= 2)
+	;
+    for (new_size = LIST_INDEX_MIN_SIZE; new_size < l->lv_len; new_size *= 2)
+	;
+    if (l->lv_u.mat.lv_items == NULL || new_size > size)
+    {
+	listitem_T **items = vim_realloc(l->lv_u.mat.lv_items,
+					   sizeof(listitem_T *) * new_size);
+
+	if (items == NULL)
+	    return FAIL;
+	l->lv_u.mat.lv_items = items;
+    }
+
+    if (len == 0)
+	item = l->lv_first;
+    else
+	item = l->lv_u.mat.lv_items[len - 1]->li_next;
+    for ( ; item != NULL; item = item->li_next)
+	l->lv_u.mat.lv_items[len++] = item;
+    l->lv_u.mat.lv_items_len = len;
+    return OK;
+}
+
 /*
  * Locate item with index "n" in list "l" and return it.
  * A negative index is counted from the end; -1 is the last item.
@@ -456,6 +522,16 @@ list_find(list_T *l, long n)
 	}
     }
 
+    // When many items would have to be skipped use an array with pointers
+    // to the items, created or extended when needed.
+    if ((n > idx ? n - idx : idx - n) >= LIST_INDEX_MIN_STEPS
+					    && (n < l->lv_u.mat.lv_items_len
+					       || list_index_update(l) == OK))
+    {
+	item = l->lv_u.mat.lv_items[n];
+	idx = n;
+    }
+
     while (n > idx)
     {
 	// search forward
@@ -747,6 +823,7 @@ list_insert(list_T *l, listitem_T *ni, listitem_T *item)
     else
     {
 	// Insert new item before existing item.
+	list_index_free(l);
 	ni->li_prev = item->li_prev;
 	ni->li_next = item;
 	if (item->li_prev == NULL)
@@ -1364,6 +1441,7 @@ vimlist_remove(list_T *l, listitem_T *item, listitem_T *item2)
     else
 	item->li_prev->li_next = item2->li_next;
     l->lv_u.mat.lv_idx_item = NULL;
+    list_index_free(l);
 }
 
 /*
@@ -2149,6 +2227,7 @@ do_sort(list_T *l, sortinfo_T *info)
 	    l->lv_first = l->lv_u.mat.lv_last
 		= l->lv_u.mat.lv_idx_item = NULL;
 	    l->lv_len = 0;
+	    list_index_free(l);
 	    for (i = 0; i < len; ++i)
 		list_append(l, ptrs[i].item);
 	}
@@ -2198,6 +2277,11 @@ do_uniq(list_T *l, sortinfo_T *info)
 
     if (!info->item_compare_func_err)
     {
+	if (i > 0)
+	{
+	    l->lv_u.mat.lv_idx_item = NULL;
+	    list_index_free(l);
+	}
 	while (--i >= 0)
 	{
 	    li = ptrs[i].item->li_next;
@@ -3099,6 +3183,7 @@ list_reverse(list_T *l, typval_T *rettv)
 	li = l->lv_u.mat.lv_last;
 	l->lv_first = l->lv_u.mat.lv_last = NULL;
 	l->lv_len = 0;
+	list_index_free(l);
 	while (li != NULL)
 	{
 	    ni = li->li_prev;
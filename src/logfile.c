@@ -207,4 +207,181 @@ f_ch_logfile(typval_T *argvars, typval_T *rettv UNUSED)
     ch_logfile(fname, opt);
 }
 
+/*
+ * Trace recorder.  Writes nested begin/end events in the Chrome "trace_event"
+ * JSON format, which can be loaded in chrome://tracing or Perfetto.  Callers
+ * check "trace_fd" before calling trace_begin() and trace_end(), so that the
+ * overhead is very small when not tracing.
+ */
+static char_u *trace_name = NULL;
+static int trace_count = 0;	// number of events written
+static int trace_depth = 0;	// number of spans begun and not ended yet
+static long trace_pid = 0;
+#ifdef FEAT_RELTIME
+static proftime_T trace_time_start;
+#endif
+
+/*
+ * Write "s" as a JSON string, including the quotes.
+ */
+    static void
+trace_put_string(char_u *s)
+{
+    char_u *p;
+
+    putc('"', trace_fd);
+    for (p = s; *p != NUL; ++p)
+    {
+	if (*p == '"' || *p == '\\')
+	{
+	    putc('\\', trace_fd);
+	    putc(*p, trace_fd);
+	}
+	else if (*p < 0x20)
+	    fprintf(trace_fd, "\\u%04x", *p);
+	else
+	    putc(*p, trace_fd);
+    }
+    putc('"', trace_fd);
+}
+
+/*
+ * Write the start of an event with phase "ph", up to and including the time
+ * stamp in microseconds since tracing started.
+ */
+    static void
+trace_put_lead(char *ph)
+{
+#ifdef FEAT_RELTIME
+    proftime_T now;
+
+    profile_start(&now);
+    profile_sub(&now, &trace_time_start);
+#endif
+    fputs(trace_count == 0 ? "\n" : ",\n", trace_fd);
+    ++trace_count;
+    fprintf(trace_fd, "{\"ph\":\"%s\",\"pid\":%ld,\"tid\":1,\"ts\":", ph,
+								   trace_pid);
+#ifdef FEAT_RELTIME
+    fprintf(trace_fd, "%.1f", profile_float(&now) * 1000000.0);
+#else
+    fputs("0", trace_fd);
+#endif
+}
+
+/*
+ * Start writing trace events to "fname".  When a trace is already being
+ * recorded it is finished first.
+ */
+    void
+trace_start(char_u *fname)
+{
+    FILE *file;
+
+    trace_stop();
+
+    file = mch_fopen((char *)fname, "w");
+    if (file == NULL)
+    {
+	semsg(_(e_cant_open_file_str), fname);
+	return;
+    }
+    trace_fd = file;
+    trace_name = vim_strsave(fname);
+    trace_count = 0;
+    trace_depth = 0;
+    trace_pid = mch_get_pid();
+#ifdef FEAT_RELTIME
+    profile_start(&trace_time_start);
+#endif
+
+    fputs("[", trace_fd);
+    trace_put_lead("M");
+    fputs(",\"name\":\"process_name\",\"args\":{\"name\":\"vim\"}}",
+								    trace_fd);
+}
+
+/*
+ * Stop writing trace events.  Spans that were begun and not ended yet are
+ * ended now, so that the file can be loaded.
+ */
+    void
+trace_stop(void)
+{
+    if (trace_fd == NULL)
+	return;
+
+    while (trace_depth > 0)
+	trace_end();
+    fputs("\n]\n", trace_fd);
+    fclose(trace_fd);
+    trace_fd = NULL;
+    VIM_CLEAR(trace_name);
+}
+
+/*
+ * Write the begin event of a span with category "cat" and name "name".
+ * When "detail" is not NULL it is added as an argument.
+ * Only to be called when "trace_fd" is not NULL.
+ */
+    void
+trace_begin(char *cat, char_u *name, char_u *detail)
+{
+    trace_put_lead("B");
+    fprintf(trace_fd, ",\"cat\":\"%s\",\"name\":", cat);
+    trace_put_string(name == NULL ? (char_u *)"" : name);
+    if (detail != NULL)
+    {
+	fputs(",\"args\":{\"detail\":", trace_fd);
+	trace_put_string(detail);
+	putc('}', trace_fd);
+    }
+    putc('}', trace_fd);
+    ++trace_depth;
+}
+
+/*
+ * Write the end event of the innermost span.  Does nothing when the span was
+ * begun before tracing started.
+ * Only to be called when "trace_fd" is not NULL.
+ */
+    void
+trace_end(void)
+{
+    if (trace_depth == 0)
+	return;
+    trace_put_lead("E");
+    putc('}', trace_fd);
+    --trace_depth;
+}
+
+/*
+ * "trace_start()" function
+ */
+    void
+f_trace_start(typval_T *argvars, typval_T *rettv UNUSED)
+{
+    // Don't open a file in restricted mode.
+    if (check_restricted() || check_secure())
+	return;
+
+    if (check_for_nonempty_string_arg(argvars, 0) == FAIL)
+	return;
+
+    trace_start(tv_get_string(&argvars[0]));
+}
+
+/*
+ * "trace_stop()" function
+ */
+    void
+f_trace_stop(typval_T *argvars UNUSED, typval_T *rettv)
+{
+    // Return the name of the trace file.
+    rettv->v_type = VAR_STRING;
+    rettv->vval.v_string = trace_name;
+    trace_name = NULL;
+    trace_stop();
+}
+
 #endif // FEAT_EVAL
@@ -167,6 +167,12 @@ main
 # endif
     }
 #endif
+#ifdef FEAT_EVAL
+    // Need to find "--trace" before sourcing any startup script.
+    for (i = 1; i < argc - 1; ++i)
+	if (STRICMP(argv[i], "--trace") == 0)
+	    trace_start((char_u *)(argv[i + 1]));
+#endif
 
 #ifdef CLEAN_RUNTIMEPATH
     // Need to find "--clean" before actually parsing arguments.
@@ -1843,6 +1849,7 @@ getout(int exitval)
 #ifdef FEAT_EVAL
     if (garbage_collect_at_exit)
 	garbage_collect(FALSE);
+    trace_stop();
 #endif
 #ifdef MSWIN
     free_cmd_argsW();
@@ -2201,6 +2208,11 @@ command_line_scan(mparm_T *parmp)
 		    want_argument = TRUE;
 		    argv_idx += 3;
 		}
+		else if (STRNICMP(argv[0] + argv_idx, "trace", 5) == 0)
+		{
+		    want_argument = TRUE;
+		    argv_idx += 5;
+		}
 #ifdef FEAT_CLIENTSERVER
 		else if (STRNICMP(argv[0] + argv_idx, "serverlist", 10) == 0)
 		    ; // already processed -- no arg
@@ -2596,6 +2608,7 @@ command_line_scan(mparm_T *parmp)
 
 		    // "--startuptime <file>" already handled
 		    // "--log <file>" already handled
+		    // "--trace <file>" already handled
 		    break;
 
 	    //	case 'd':   -d {device} is handled in mch_check_win() for the
@@ -3712,6 +3725,9 @@ usage(void)
 #ifdef FEAT_JOB_CHANNEL
     main_msg(_("--log <file>\t\tStart logging to <file> early"));
 #endif
+#ifdef FEAT_EVAL
+    main_msg(_("--trace <file>\tWrite trace events to <file>"));
+#endif
 #ifdef FEAT_VIMINFO
     main_msg(_("-i <viminfo>\t\tUse <viminfo> instead of .viminfo"));
 #endif
@@ -878,6 +878,9 @@ check_need_swap(
     void
 ml_close(buf_T *buf, int del_file)
 {
+#ifdef FEAT_PROP_POPUP
+    prop_lines_invalidate(buf);
+#endif
     if (buf->b_ml.ml_mfp == NULL)		// not open
 	return;
     mf_close(buf->b_ml.ml_mfp, del_file);	// close the .swp file
@@ -3460,6 +3463,9 @@ ml_append_int(
 #ifdef FEAT_JOB_CHANNEL
     if (buf->b_write_to_channel)
 	channel_write_new_lines(buf);
+#endif
+#ifdef FEAT_PROP_POPUP
+    prop_lines_append(buf, lnum, line, len);
 #endif
     ret = OK;
 
@@ -3671,6 +3677,10 @@ ml_replace_len(
     curbuf->b_ml.ml_line_textlen = !has_props ? len_arg + 1 : 0;
     curbuf->b_ml.ml_line_lnum = lnum;
     curbuf->b_ml.ml_flags = (curbuf->b_ml.ml_flags | ML_LINE_DIRTY) & ~ML_EMPTY;
+#ifdef FEAT_PROP_POPUP
+    if (has_props)
+	prop_lines_add(curbuf, lnum);
+#endif
 
     return OK;
 }
@@ -3954,6 +3964,9 @@ ml_delete_int(buf_T *buf, linenr_T lnum, int flags)
 					- textprop_len
 # endif
 						    , ML_CHNK_DELLINE);
+#endif
+#ifdef FEAT_PROP_POPUP
+    prop_lines_delete(buf, lnum);
 #endif
     ret = OK;
 
@@ -5010,7 +5010,7 @@ check_num_option_bounds(
 	errmsg = e_invalid_argument;
 	p_hi = 10000;
     }
-    if (p_re < 0 || p_re > 2)
+    if (p_re < 0 || p_re > 3)
     {
 	errmsg = e_invalid_argument;
 	p_re = 0;
@@ -5020,6 +5020,25 @@ check_num_option_bounds(
 	errmsg = e_argument_must_be_positive;
 	p_report = 1;
     }
+#ifdef FEAT_SYN_HL
+    if (p_sit < 0)
+    {
+	errmsg = e_argument_must_be_positive;
+	p_sit = 0;
+    }
+#endif
+#ifdef FEAT_TIMERS
+    if (p_pit < 0)
+    {
+	errmsg = e_argument_must_be_positive;
+	p_pit = 0;
+    }
+#endif
+    if (p_umm < 0)
+    {
+	errmsg = e_argument_must_be_positive;
+	p_umm = 0;
+    }
     if ((p_sj < -100 || p_sj >= Rows) && full_screen)
     {
 	if (Rows != old_Rows)	// Rows changed, just adjust p_sj
@@ -833,6 +833,9 @@ EXTERN char_u	*p_pex;		// 'patchexpr'
 #endif
 EXTERN char_u	*p_pm;		// 'patchmode'
 EXTERN char_u	*p_path;	// 'path'
+#ifdef FEAT_TIMERS
+EXTERN long	p_pit;		// 'pathidletime'
+#endif
 EXTERN char_u	*p_cdpath;	// 'cdpath'
 #if defined(DYNAMIC_PERL)
 EXTERN char_u	*p_perldll;	// 'perldll'
@@ -999,6 +1002,7 @@ EXTERN char_u	*p_tplo;	// 'tabpanelopt'
 #endif
 
 #ifdef FEAT_SYN_HL
+EXTERN long	p_sit;		// 'synidletime'
 EXTERN char_u	*p_syn;		// 'syntax'
 #endif
 EXTERN char_u	*p_tcl;		// 'tabclose'
@@ -1086,6 +1090,7 @@ EXTERN char_u	*p_udir;	// 'undodir'
 EXTERN int	p_udf;		// 'undofile'
 #endif
 EXTERN long	p_ul;		// 'undolevels'
+EXTERN long	p_umm;		// 'undomaxmem'
 EXTERN long	p_ur;		// 'undoreload'
 EXTERN long	p_uc;		// 'updatecount'
 EXTERN long	p_ut;		// 'updatetime'
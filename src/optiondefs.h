@@ -1952,6 +1952,13 @@ static struct vimoption options[] =
 			    (char_u *)".,/usr/include,,",
 #endif
 				(char_u *)0L} SCTX_INIT},
+    {"pathidletime", "pit", P_NUM|P_VI_DEF,
+#ifdef FEAT_TIMERS
+			    (char_u *)&p_pit, PV_NONE, NULL, NULL,
+#else
+			    (char_u *)NULL, PV_NONE, NULL, NULL,
+#endif
+			    {(char_u *)0L, (char_u *)0L} SCTX_INIT},
     {"perldll",     NULL,   P_STRING|P_EXPAND|P_VI_DEF|P_SECURE,
 #if defined(DYNAMIC_PERL)
 			    (char_u *)&p_perldll, PV_NONE, NULL, NULL,
@@ -2523,6 +2530,13 @@ static struct vimoption options[] =
     {"switchbuf",   "swb",  P_STRING|P_VI_DEF|P_ONECOMMA|P_NODUP,
 			    (char_u *)&p_swb, PV_NONE, did_set_switchbuf, expand_set_switchbuf,
 			    {(char_u *)"", (char_u *)0L} SCTX_INIT},
+    {"synidletime", "sit",  P_NUM|P_VI_DEF,
+#if defined(FEAT_SYN_HL) && defined(FEAT_TIMERS)
+			    (char_u *)&p_sit, PV_NONE, NULL, NULL,
+#else
+			    (char_u *)NULL, PV_NONE, NULL, NULL,
+#endif
+			    {(char_u *)0L, (char_u *)0L} SCTX_INIT},
     {"synmaxcol",   "smc",  P_NUM|P_VI_DEF|P_RBUF,
 #ifdef FEAT_SYN_HL
 			    (char_u *)&p_smc, PV_SMC, NULL, NULL,
@@ -2802,6 +2816,9 @@ static struct vimoption options[] =
 			    (char_u *)100L,
 #endif
 				(char_u *)0L} SCTX_INIT},
+    {"undomaxmem",  "umm",  P_NUM|P_VI_DEF,
+			    (char_u *)&p_umm, PV_NONE, NULL, NULL,
+			    {(char_u *)0L, (char_u *)0L} SCTX_INIT},
     {"undoreload",  "ur",   P_NUM|P_VI_DEF,
 			    (char_u *)&p_ur, PV_NONE, NULL, NULL,
 			    { (char_u *)10000L, (char_u *)0L} SCTX_INIT},
@@ -4893,6 +4893,9 @@ did_set_string_option(
 	update_package_paths_in_lua();
 #endif
     }
+    if (varp == &p_rtp || varp == &p_pp)
+	// Directories that are no longer used don't need to be kept.
+	dir_cache_clear();
 
 #if defined(FEAT_LINEBREAK)
     // Changing Formatlistpattern when briopt includes the list setting:
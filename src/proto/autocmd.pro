@@ -38,6 +38,7 @@ int is_autocmd_blocked(void);
 sctx_T *acp_script_ctx(AutoPatCmd_T *acp);
 char_u *getnextac(int c, void *cookie, int indent, getline_opt_T options);
 int has_autocmd(event_T event, char_u *sfname, buf_T *buf);
+int has_autocmd_except(event_T event, char_u *sfname, buf_T *buf, int *sids);
 char_u *get_augroup_name(expand_T *xp, int idx);
 char_u *set_context_in_autocmd(expand_T *xp, char_u *arg, int doautocmd);
 char_u *get_event_name(expand_T *xp, int idx);
@@ -48,4 +49,5 @@ int au_exists(char_u *arg);
 void f_autocmd_add(typval_T *argvars, typval_T *rettv);
 void f_autocmd_delete(typval_T *argvars, typval_T *rettv);
 void f_autocmd_get(typval_T *argvars, typval_T *rettv);
+void f_autocmd_stats(typval_T *argvars, typval_T *rettv);
 /* vim: set ft=c : */
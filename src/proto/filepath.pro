@@ -56,6 +56,15 @@ int expand_wildcards_eval(char_u **pat, int *num_file, char_u ***file, int flags
 int expand_wildcards(int num_pat, char_u **pat, int *num_files, char_u ***files, int flags);
 int match_suffix(char_u *fname);
 int unix_expandpath(garray_T *gap, char_u *path, size_t wildoff, int flags, int didstar);
+int dir_cache_expandpath(garray_T *gap, char_u *pat, int flags);
+int dir_cache_expand(char_u *pat, int flags, int *num_file, char_u ***file);
+void dir_cache_next_tick(void);
+int dir_cache_full(void);
+int dir_cache_exists(char_u *fname, int *isdir);
+int dir_cache_read(char_u *dir, garray_T *subdirs);
+long dir_cache_count(void);
+void dir_cache_clear(void);
+void dir_cache_set_max(long max);
 int gen_expand_wildcards(int num_pat, char_u **pat, int *num_file, char_u ***file, int flags);
 void addfile(garray_T *gap, char_u *f, int flags);
 void FreeWild(int count, char_u **files);
@@ -1,6 +1,8 @@
 /* gc.c */
 int get_copyID(void);
 int garbage_collect(int testing);
+void garbage_collect_when_idle(void);
+void f_garbagecollect_info(typval_T *argvars, typval_T *rettv);
 int set_ref_in_ht(hashtab_T *ht, int copyID, list_stack_T **list_stack, tuple_stack_T **tuple_stack);
 int set_ref_in_dict(dict_T *d, int copyID);
 int set_ref_in_list(list_T *ll, int copyID);
@@ -62,6 +62,7 @@ void f_complete(typval_T *argvars, typval_T *rettv);
 void f_complete_add(typval_T *argvars, typval_T *rettv);
 void f_complete_check(typval_T *argvars, typval_T *rettv);
 void f_complete_info(typval_T *argvars, typval_T *rettv);
+void ins_compl_index_free(buf_T *buf);
 void ins_compl_delete(void);
 void ins_compl_insert(int move_cursor);
 void ins_compl_check_keys(int frequency, int in_compl_func);
@@ -4,4 +4,10 @@ int ch_log_active(void);
 void ch_log_literal(char *lead, channel_T *ch, ch_part_T part, char_u *buf, int len);
 void f_ch_log(typval_T *argvars, typval_T *rettv);
 void f_ch_logfile(typval_T *argvars, typval_T *rettv);
+void trace_start(char_u *fname);
+void trace_stop(void);
+void trace_begin(char *cat, char_u *name, char_u *detail);
+void trace_end(void);
+void f_trace_start(typval_T *argvars, typval_T *rettv);
+void f_trace_stop(typval_T *argvars, typval_T *rettv);
 /* vim: set ft=c : */
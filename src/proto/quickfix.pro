@@ -31,6 +31,8 @@ void ex_cbelow(exarg_T *eap);
 void ex_cfile(exarg_T *eap);
 void ex_vimgrep(exarg_T *eap);
 int set_errorlist(win_T *wp, list_T *list, int action, char_u *title, dict_T *what);
+int_u qf_get_channel_list_id(void);
+int qf_add_channel_lines(int_u qfid, char_u *text);
 int set_ref_in_quickfix(int copyID);
 void ex_cbuffer(exarg_T *eap);
 char_u *cexpr_get_auname(cmdidx_T cmdidx);
@@ -16,6 +16,7 @@ void free_resub_eval_result(void);
 char_u *reg_submatch(int no);
 list_T *reg_submatch_list(int no);
 int vim_regcomp_had_eol(void);
+void f_regexpcacheinfo(typval_T *argvars, typval_T *rettv);
 regprog_T *vim_regcomp(char_u *expr_arg, int re_flags);
 void vim_regfree(regprog_T *prog);
 void free_regexp_stuff(void);
@@ -24,4 +25,6 @@ int vim_regexec_prog(regprog_T **prog, int ignore_case, char_u *line, colnr_T co
 int vim_regexec(regmatch_T *rmp, char_u *line, colnr_T col);
 int vim_regexec_nl(regmatch_T *rmp, char_u *line, colnr_T col);
 long vim_regexec_multi(regmmatch_T *rmp, win_T *win, buf_T *buf, linenr_T lnum, colnr_T col, int *timed_out);
+int vim_regfirstbytes(regprog_T *prog, int ic, char_u *bytes);
+int vim_regsingleline(regprog_T *prog, int *kword);
 /* vim: set ft=c : */
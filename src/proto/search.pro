@@ -33,6 +33,10 @@ int check_linecomment(char_u *line);
 void showmatch(int c);
 int current_search(long count, int forward);
 int linewhite(linenr_T lnum);
+void search_index_free(buf_T *buf);
+void search_index_changed(linenr_T lnum, linenr_T lnume, long xtra);
+int search_index_pending(void);
+void search_index_idle(void);
 void find_pattern_in_path(char_u *ptr, int dir, int len, int whole, int skip_comments, int type, long count, int action, linenr_T start_lnum, linenr_T end_lnum, int forceit);
 spat_T *get_spat(int idx);
 int get_spat_last_idx(void);
@@ -1,5 +1,7 @@
 /* syntax.c */
 void syntax_start(win_T *wp, linenr_T lnum);
+int syntax_idle_pending(void);
+void syntax_idle(void);
 void syn_stack_free_all(synblock_T *block);
 void syn_stack_apply_changes(buf_T *buf);
 void syntax_end_parsing(win_T *wp, linenr_T lnum);
@@ -8,6 +8,7 @@ void tag_freematch(void);
 void do_tags(exarg_T *eap);
 int find_tags(char_u *pat, int *num_matches, char_u ***matchesp, int flags, int mincount, char_u *buf_ffname);
 void free_tag_stuff(void);
+int tagindex_count(void);
 int get_tagfname(tagname_T *tnp, int first, char_u *buf);
 void tagname_free(tagname_T *tnp);
 void tagstack_clear_entry(taggy_T *item);
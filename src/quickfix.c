@@ -81,6 +81,9 @@ typedef struct qf_list_S
     qfline_T	*qf_last;	// pointer to the last error
     qfline_T	*qf_ptr;	// pointer to the current error
     int		qf_count;	// number of errors (0 means empty list)
+    garray_T	qf_entries;	// pointers to the errors, for finding one
+				// by its index; not used when it has fewer
+				// than qf_count items
     int		qf_index;	// current index in the error list
     int		qf_nonevalid;	// TRUE if not a single valid entry found
     int		qf_has_user_data; // TRUE if at least one item has user_data attached
@@ -123,6 +126,7 @@ static qf_info_T *ql_info;	// points to ql_info_actual if memory allocation is s
 static int_u last_qf_id = 0;	// Last used quickfix list id
 
 #define FMT_PATTERNS 14		// maximum number of % recognized
+#define EFM_LITERAL_LEN 16	// max length of efm_T literal
 
 /*
  * Structure used to hold the info of one part of 'errorformat'
@@ -151,6 +155,10 @@ struct efm_S
 				//   '-' do not include this line
 				//   '+' include whole line in message
     int		    conthere;	// %> used
+    char_u	    literal[EFM_LITERAL_LEN];
+				// text a matching line must start with,
+				// ASCII only
+    int		    literal_len; // number of bytes in "literal"
 };
 
 // List of location lists to be deleted.
@@ -462,6 +470,7 @@ efm_to_regpat(
     char_u	*efmp;
     int		round;
     int		idx = 0;
+    int		in_literal = TRUE;
 
     // Build a regexp pattern for a 'errorformat' option part
     ptr = regpat;
@@ -469,6 +478,18 @@ efm_to_regpat(
     round = 0;
     for (efmp = efm; efmp < efm + len; ++efmp)
     {
+	// Collect the literal text the pattern starts with.  Stop at anything
+	// else, also dropping the last character, it may be followed by a
+	// multi.
+	if (in_literal && (*efmp == '%' || *efmp == '\\' || *efmp >= 0x80
+		    || fmt_ptr->literal_len == EFM_LITERAL_LEN)
+		&& !(*efmp == '%' && efmp == efm
+		    && vim_strchr((char_u *)"+-DXAEWINCZGOPQ", efmp[1]) != NULL))
+	{
+	    in_literal = FALSE;
+	    if (fmt_ptr->literal_len > 0)
+		--fmt_ptr->literal_len;
+	}
 	if (*efmp == '%')
 	{
 	    ++efmp;
@@ -511,6 +532,8 @@ efm_to_regpat(
 	}
 	else			// copy normal character
 	{
+	    if (in_literal)
+		fmt_ptr->literal[fmt_ptr->literal_len++] = *efmp;
 	    if (*efmp == '\\' && efmp + 1 < efm + len)
 		++efmp;
 	    else if (vim_strchr((char_u *)".*^$~[", *efmp) != NULL)
@@ -1313,6 +1336,23 @@ qf_parse_match(
     return QF_OK;
 }
 
+/*
+ * Return FALSE if "linebuf" can't match "fmt_ptr", because it does not start
+ * with the literal text of the format.  Case is ignored, like for the
+ * pattern.  A non-ASCII character may fold to an ASCII one, the rest of the
+ * line is not checked then.
+ */
+    static int
+efm_may_match(efm_T *fmt_ptr, char_u *linebuf)
+{
+    int		i;
+
+    for (i = 0; i < fmt_ptr->literal_len && linebuf[i] < 0x80; ++i)
+	if (TOLOWER_ASC(linebuf[i]) != TOLOWER_ASC(fmt_ptr->literal[i]))
+	    return FALSE;
+    return TRUE;
+}
+
 /*
  * Parse an error line in 'linebuf' using a single error format string in
  * 'fmt_ptr->prog' and return the matching values in 'fields'.
@@ -1352,6 +1392,9 @@ qf_parse_get_fields(
     fields->type = 0;
     *tail = NULL;
 
+    if (!efm_may_match(fmt_ptr, linebuf))
+	return status;
+
     // Always ignore case when looking for a matching error.
     regmatch.rm_ic = TRUE;
     regmatch.regprog = fmt_ptr->prog;
@@ -2333,6 +2376,13 @@ qf_add_entry(
     qfp->qf_cleared = FALSE;
     *lastp = qfp;
     ++qfl->qf_count;
+    // Also store the entry in the array, when out of memory the list is
+    // walked instead.
+    if (qfl->qf_entries.ga_itemsize == 0)
+	ga_init2(&qfl->qf_entries, sizeof(qfline_T *), 100);
+    if (qfl->qf_entries.ga_len == qfl->qf_count - 1
+				  && ga_grow(&qfl->qf_entries, 1) == OK)
+	((qfline_T **)qfl->qf_entries.ga_data)[qfl->qf_entries.ga_len++] = qfp;
     if (qfl->qf_index == 0 && qfp->qf_valid)	// first valid entry
     {
 	qfl->qf_index = qfl->qf_count;
@@ -2983,6 +3033,20 @@ qflist_valid(win_T *wp, int_u qf_id)
     return FALSE;
 }
 
+/*
+ * Get the entry with index "idx" (one based) in the quickfix list "qfl",
+ * without walking the list.  Returns NULL when "idx" is out of range or the
+ * entries are not all in the array.
+ */
+    static qfline_T *
+qf_get_nth_ptr(qf_list_T *qfl, int idx)
+{
+    if (idx < 1 || idx > qfl->qf_count
+				 || qfl->qf_entries.ga_len != qfl->qf_count)
+	return NULL;
+    return ((qfline_T **)qfl->qf_entries.ga_data)[idx - 1];
+}
+
 /*
  * When loading a file from the quickfix, the autocommands may modify it.
  * This may invalidate the current quickfix entry.  This function checks
@@ -2995,6 +3059,10 @@ is_qf_entry_present(qf_list_T *qfl, qfline_T *qf_ptr)
     qfline_T	*qfp;
     int		i;
 
+    // Usually it is the current entry.
+    if (qf_ptr != NULL && qf_get_nth_ptr(qfl, qfl->qf_index) == qf_ptr)
+	return TRUE;
+
     // Search for the entry in the current list
     FOR_ALL_QFL_ITEMS(qfl, qfp, i)
 	if (qfp == qf_ptr)
@@ -3123,6 +3191,21 @@ get_nth_entry(qf_list_T *qfl, int errornr, int *new_qfidx)
     qfline_T	*qf_ptr = qfl->qf_ptr;
     int		qf_idx = qfl->qf_index;
 
+    // Use the array when possible.  Like when walking the list, stop at the
+    // first or last entry.
+    if (errornr != qf_idx)
+    {
+	int	idx = errornr < 1 ? 1
+			 : errornr > qfl->qf_count ? qfl->qf_count : errornr;
+
+	if ((qf_ptr = qf_get_nth_ptr(qfl, idx)) != NULL)
+	{
+	    *new_qfidx = idx;
+	    return qf_ptr;
+	}
+	qf_ptr = qfl->qf_ptr;
+    }
+
     // New error number is less than the current error number
     while (errornr < qf_idx && qf_idx > 1 && qf_ptr->qf_prev != NULL)
     {
@@ -4307,6 +4390,7 @@ qf_free_items(qf_list_T *qfl)
     qfl->qf_last = NULL;
     qfl->qf_ptr = NULL;
     qfl->qf_nonevalid = TRUE;
+    ga_clear(&qfl->qf_entries);
 
     qf_clean_dir_stack(&qfl->qf_dir_stack);
     qfl->qf_directory = NULL;
@@ -6533,6 +6617,281 @@ vgr_match_buflines(
     return found_match;
 }
 
+/*
+ * Events that may be triggered for a file when vimgrep loads it into a dummy
+ * buffer and wipes it out again.
+ */
+static event_T vgr_load_events[] = {
+    EVENT_BUFREADPRE,
+    EVENT_BUFREADPOST,
+    EVENT_BUFREADCMD,
+    EVENT_SWAPEXISTS,
+    EVENT_BUFUNLOAD,
+    EVENT_BUFDELETE,
+    EVENT_BUFWIPEOUT
+};
+
+/*
+ * Return TRUE if files can be searched for "regmatch" by reading their text
+ * directly, without loading them into a buffer.  This gives the same matches
+ * when the pattern only looks at the text of a line and the text would be
+ * read without conversion.  Whether autocommands would be triggered is
+ * checked for each file with vgr_has_load_autocmds(), the text itself in
+ * vgr_read_file().
+ */
+    static int
+vgr_can_read_text(regmmatch_T *regmatch, int flags)
+{
+    int		kword;
+
+    if ((flags & VGR_FUZZY) || (cmdmod.cmod_flags & CMOD_HIDE))
+	return FALSE;
+    // The dummy buffer gets the global option values.  The text must not be
+    // converted: with UTF-8 it is checked to be valid in vgr_read_file(),
+    // otherwise no conversion must be tried at all.
+    if (enc_utf8 ? (STRNCMP(p_fencs, "utf-8", 5) != 0
+			     && STRNCMP(p_fencs, "ucs-bom,utf-8", 13) != 0)
+		 : (has_mbyte || *p_fencs != NUL))
+	return FALSE;
+    if (p_bin || (vim_strchr(p_ffs, 'x') == NULL
+					    && vim_strchr(p_ffs, 'd') == NULL))
+	return FALSE;
+    if (!vim_regsingleline(regmatch->regprog, &kword))
+	return FALSE;
+    // vim_regexec() uses 'iskeyword' of the current buffer.
+    if (kword && STRCMP(curbuf->b_p_isk, p_isk) != 0)
+	return FALSE;
+    return TRUE;
+}
+
+/*
+ * Scripts in $VIMRUNTIME with autocommands that don't matter for a dummy
+ * buffer: filetype detection (the FileType event is not triggered) and
+ * restoring the cursor position in defaults.vim.  The filetype detection
+ * autocommands defined by the user in "ftdetect" scripts may do anything, a
+ * file they match is loaded into a buffer.
+ */
+static char *vgr_ignored_scripts[] = {
+    "filetype.vim",
+    "defaults.vim",
+    NULL
+};
+
+/*
+ * Store the IDs of the vgr_ignored_scripts[] that were sourced in "sids",
+ * followed by a zero.
+ */
+    static void
+vgr_get_ignored_sids(int *sids)
+{
+    int		count = 0;
+#ifdef FEAT_EVAL
+    int		i;
+    char_u	*p;
+    char_u	*fname;
+    int		sid;
+
+    for (i = 0; vgr_ignored_scripts[i] != NULL; ++i)
+    {
+	p = concat_fnames((char_u *)"$VIMRUNTIME",
+				      (char_u *)vgr_ignored_scripts[i], TRUE);
+	if (p == NULL)
+	    continue;
+	fname = expand_env_save(p);
+	vim_free(p);
+	if (fname == NULL)
+	    continue;
+	p = fix_fname(fname);
+	vim_free(fname);
+	if (p == NULL)
+	    continue;
+	sid = find_script_by_name(p);
+	vim_free(p);
+	if (sid > 0)
+	    sids[count++] = sid;
+    }
+#endif
+    sids[count] = 0;
+}
+
+/*
+ * Return TRUE if loading file "fname" into a dummy buffer would trigger any
+ * autocommands that matter.  "sids" is from vgr_get_ignored_sids().
+ */
+    static int
+vgr_has_load_autocmds(char_u *fname, int *sids)
+{
+    int		i;
+
+    for (i = 0; i < (int)ARRAY_LENGTH(vgr_load_events); ++i)
+	if (!event_ignored(vgr_load_events[i], p_ei)
+		&& has_autocmd_except(vgr_load_events[i], fname, NULL, sids))
+	    return TRUE;
+    return FALSE;
+}
+
+/*
+ * Read the text of file "fname" for vimgrep.  Returns the text with a NUL
+ * appended, the length is stored in "*lenp".  Returns NULL when the file is
+ * not a regular file, can't be read or when editing it would change the
+ * text: splitting lines at a CR, removing a BOM, converting from another
+ * encoding or decrypting.
+ */
+    static char_u *
+vgr_read_file(char_u *fname, size_t *lenp)
+{
+    stat_T	st;
+    int		fd;
+    char_u	*text;
+    size_t	len = 0;
+    long	n;
+
+    if (mch_stat((char *)fname, &st) < 0 || !S_ISREG(st.st_mode))
+	return NULL;
+    fd = mch_open((char *)fname, O_RDONLY | O_EXTRA, 0);
+    if (fd < 0)
+	return NULL;
+    text = alloc((size_t)st.st_size + 1);
+    if (text != NULL)
+	while (len < (size_t)st.st_size)
+	{
+	    n = read_eintr(fd, text + len, (size_t)st.st_size - len);
+	    if (n <= 0)
+		break;
+	    len += n;
+	}
+    close(fd);
+    if (text == NULL)
+	return NULL;
+    text[len] = NUL;
+
+    if (memchr(text, CAR, len) != NULL
+	    || (len >= 3 && text[0] == 0xef && text[1] == 0xbb
+							  && text[2] == 0xbf)
+	    || (len >= 9 && STRNCMP(text, "VimCrypt~", 9) == 0)
+	    || (enc_utf8 && !utf_valid_string(text, text + len)))
+    {
+	vim_free(text);
+	return NULL;
+    }
+    *lenp = len;
+    return text;
+}
+
+/*
+ * Search for a pattern in the lines of "text", read from file "fname" with
+ * vgr_read_file(), and add the matches to a quickfix list.  Like
+ * vgr_match_buflines(), but without a buffer.  "*fnump" is the number of the
+ * buffer for "fname", when zero a buffer is created for the first match.
+ * "text" is changed: line breaks are replaced with a NUL.
+ */
+    static int
+vgr_match_textlines(
+	qf_list_T   *qfl,
+	char_u	    *fname,
+	int	    *fnump,
+	char_u	    *text,
+	size_t	    len,
+	regmmatch_T *regmatch,
+	long	    *tomatch,
+	int	    flags)
+{
+    int		found_match = FALSE;
+    regmatch_T	rm;
+    char_u	firstbytes[32];
+    int		use_firstbytes;
+    char_u	*end = text + len;
+    char_u	*line;
+    char_u	*eol;
+    char_u	*p;
+    linenr_T	lnum = 0;
+    colnr_T	col;
+    buf_T	*buf;
+
+    rm.regprog = regmatch->regprog;
+    rm.rm_ic = regmatch->rmm_ic;
+    // Lines without a byte a match can start with can be skipped without
+    // running the regexp engine.
+    use_firstbytes = vim_regfirstbytes(rm.regprog, rm.rm_ic, firstbytes) == OK;
+
+    // An empty file has one empty line, a line break at the end of the file
+    // does not start another line.
+    for (line = text; (line < end || lnum == 0) && *tomatch > 0;
+							       line = eol + 1)
+    {
+	++lnum;
+	eol = memchr(line, NL, end - line);
+	if (eol == NULL)
+	    eol = end;
+	*eol = NUL;
+	// A NUL in the file is a NL in the buffer.
+	for (p = line; (p = memchr(p, NUL, eol - p)) != NULL; ++p)
+	    *p = NL;
+
+	line_breakcheck();
+	if (got_int)
+	    break;
+	if (use_firstbytes)
+	{
+	    for (p = line; p < eol; ++p)
+		if (firstbytes[*p >> 3] & (1 << (*p & 7)))
+		    break;
+	    if (p == eol)
+		continue;
+	}
+
+	col = 0;
+	while (vim_regexec(&rm, line, col))
+	{
+	    if (*fnump == 0)
+	    {
+		// Create the buffer like a dummy buffer that is kept, without
+		// triggering autocommands.
+		buf = buflist_new(fname, NULL, (linenr_T)0, BLN_DUMMY);
+		if (buf != NULL)
+		{
+		    buf->b_flags &= ~BF_DUMMY;
+		    *fnump = buf->b_fnum;
+		}
+	    }
+	    if (qf_add_entry(qfl,
+			NULL,	// dir
+			fname,
+			NULL,
+			*fnump,
+			line,
+			lnum,
+			lnum,
+			(int)(rm.startp[0] - line) + 1,
+			(int)(rm.endp[0] - line) + 1,
+			FALSE,	// vis_col
+			NULL,	// search pattern
+			0,	// nr
+			0,	// type
+			NULL,	// user_data
+			TRUE	// valid
+			) == QF_FAIL)
+	    {
+		got_int = TRUE;
+		break;
+	    }
+	    found_match = TRUE;
+	    if (--*tomatch == 0)
+		break;
+	    if ((flags & VGR_GLOBAL) == 0)
+		break;
+	    col = (colnr_T)(rm.endp[0] - line)
+				     + (col == (colnr_T)(rm.endp[0] - line));
+	    if (line + col > eol)
+		break;
+	}
+    }
+
+    // The regexp engine may have been changed.
+    regmatch->regprog = rm.regprog;
+    return found_match;
+}
+
 /*
  * Jump to the first match and update the directory.
  */
@@ -6673,6 +7032,11 @@ vgr_process_files(
     char_u	*dirname_now = NULL;
     int		found_match;
     aco_save_T	aco;
+    int		can_read_text;
+    int		ignored_sids[ARRAY_LENGTH(vgr_ignored_scripts)];
+    char_u	*text;
+    size_t	len;
+    int		fnum;
 
     dirname_start = alloc_id(MAXPATHL, aid_qf_dirname_start);
     dirname_now = alloc_id(MAXPATHL, aid_qf_dirname_now);
@@ -6683,6 +7047,10 @@ vgr_process_files(
     // ":lcd %:p:h" changes the meaning of short path names.
     mch_dirname(dirname_start, MAXPATHL);
 
+    can_read_text = vgr_can_read_text(&cmd_args->regmatch, cmd_args->flags);
+    if (can_read_text)
+	vgr_get_ignored_sids(ignored_sids);
+
     seconds = (time_t)0;
     for (fi = 0; fi < cmd_args->fcount && !got_int && cmd_args->tomatch > 0;
 									++fi)
@@ -6697,6 +7065,21 @@ vgr_process_files(
 	}
 
 	buf = buflist_findname_exp(cmd_args->fnames[fi]);
+	if ((buf == NULL || buf->b_ml.ml_mfp == NULL) && can_read_text
+		&& !vgr_has_load_autocmds(fname, ignored_sids)
+		&& (text = vgr_read_file(fname, &len)) != NULL)
+	{
+	    // Search the text of the file, there is no need to load it into
+	    // a buffer.
+	    fnum = buf == NULL ? 0 : buf->b_fnum;
+	    found_match = vgr_match_textlines(qf_get_curlist(qi), fname,
+		    &fnum, text, len, &cmd_args->regmatch, &cmd_args->tomatch,
+		    cmd_args->flags);
+	    vim_free(text);
+	    if (found_match && *first_match_buf == NULL)
+		*first_match_buf = buflist_findnr(fnum);
+	    continue;
+	}
 	if (buf == NULL || buf->b_ml.ml_mfp == NULL)
 	{
 	    // Remember that a buffer with this name already exists.
@@ -7213,6 +7596,9 @@ get_errorlist(
     if (qf_list_empty(qfl))
 	return FAIL;
 
+    if (eidx > 0 && (qfp = qf_get_nth_ptr(qfl, eidx)) != NULL)
+	return get_qfline_items(qfp, list);
+
     FOR_ALL_QFL_ITEMS(qfl, qfp, i)
     {
 	if (eidx > 0)
@@ -8305,6 +8691,53 @@ set_errorlist(
     return retval;
 }
 
+# if defined(FEAT_JOB_CHANNEL) || defined(PROTO)
+/*
+ * Return the ID of the current quickfix list, for adding the output of a job
+ * to it.  An empty list is created when there is none.
+ */
+    int_u
+qf_get_channel_list_id(void)
+{
+    qf_info_T	*qi = ql_info;
+
+    if (qi == NULL)
+	return 0;
+    if (qf_stack_empty(qi))
+	qf_new_list(qi, NULL);
+    return qf_get_curlist(qi)->qf_id;
+}
+
+/*
+ * Add the lines in "text", received from a channel, to the quickfix list
+ * with ID "qfid", using 'errorformat'.
+ * Returns FAIL when the list does not exist.
+ */
+    int
+qf_add_channel_lines(int_u qfid, char_u *text)
+{
+    qf_info_T	*qi = ql_info;
+    int		qf_idx;
+    typval_T	tv;
+    int		save_got_int = got_int;
+
+    if (qi == NULL || (qf_idx = qf_id2nr(qi, qfid)) == INVALID_QFIDX)
+	return FAIL;
+
+    incr_quickfix_busy();
+    tv.v_type = VAR_STRING;
+    tv.vval.v_string = text;
+    if (qf_init_ext(qi, qf_idx, NULL, NULL, &tv, p_efm, FALSE,
+			    (linenr_T)0, (linenr_T)0, NULL, NULL) >= 0)
+	qf_list_changed(qf_get_list(qi, qf_idx));
+    decr_quickfix_busy();
+
+    // qf_init_ext() resets got_int, don't lose an interrupt.
+    got_int |= save_got_int;
+    return OK;
+}
+# endif
+
 static int mark_quickfix_user_data(qf_info_T *qi, int copyID)
 {
     int abort = FALSE;
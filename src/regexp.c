@@ -2903,15 +2903,188 @@ static int regexp_engine = 0;
 static char_u regname[][30] = {
 		    "AUTOMATIC Regexp Engine",
 		    "BACKTRACKING Regexp Engine",
-		    "NFA Regexp Engine"
+		    "NFA Regexp Engine",
+		    "DFA Regexp Engine"
 			    };
 #endif
 
+/*
+ * Cache of compiled programs.  The same pattern is often compiled again and
+ * again, e.g. by substitute() in a loop or for each ":s" command.  A cached
+ * program is shared by all users, "re_refcount" counts them, including the
+ * cache itself.  Only a program that is not being executed is handed out.
+ */
+#define REGCACHE_SIZE	64
+
+typedef struct
+{
+    char_u	*rc_pat;	// pattern after "\%#=", NULL when unused
+    int		rc_flags;	// "re_flags" argument of vim_regcomp()
+    int		rc_engine;	// value of "regexp_engine"
+    int		rc_opts;	// option values used when compiling
+    int		rc_had_eol;	// value of "had_eol" after compiling
+    long	rc_lastused;	// "regcache_tick" when last used
+    regprog_T	*rc_prog;
+} regcache_T;
+
+static regcache_T   regcache[REGCACHE_SIZE];
+static long	    regcache_tick = 0;
+static long	    regcache_hits = 0;
+static long	    regcache_misses = 0;
+
+/*
+ * Return the option values that compiling a pattern depends on.
+ */
+    static int
+regcache_opts(void)
+{
+    get_cpo_flags();
+    return (reg_cpo_lit ? 1 : 0) + (reg_cpo_bsl ? 2 : 0)
+	    + (has_mbyte ? 4 : 0) + (enc_utf8 ? 8 : 0)
+#ifdef FEAT_SYN_HL
+	    + (reg_do_extmatch << 4)
+#endif
+	    ;
+}
+
+/*
+ * Return TRUE if the program for "expr" does not depend on more than what
+ * is used as the key for regcache[].
+ */
+    static int
+regcache_can_use(char_u *expr)
+{
+    // "~" inserts the previous substitute string and "[:keyword:]" etc.
+    // depend on options of the current buffer.
+    return vim_strchr(expr, '~') == NULL && strstr((char *)expr, "[:") == NULL;
+}
+
+/*
+ * Find a program for "expr" in the cache.
+ * Returns NULL when not found.
+ */
+    static regprog_T *
+regcache_find(char_u *expr, int re_flags, int engine)
+{
+    int		opts;
+    int		i;
+    regcache_T	*rc;
+
+    if (!regcache_can_use(expr))
+	return NULL;
+    opts = regcache_opts();
+    for (i = 0; i < REGCACHE_SIZE; ++i)
+    {
+	rc = &regcache[i];
+	if (rc->rc_pat != NULL
+		&& rc->rc_flags == re_flags
+		&& rc->rc_engine == engine
+		&& rc->rc_opts == opts
+		&& !rc->rc_prog->re_in_use
+		&& STRCMP(rc->rc_pat, expr) == 0)
+	{
+	    rc->rc_lastused = ++regcache_tick;
+	    had_eol = rc->rc_had_eol;
+	    ++rc->rc_prog->re_refcount;
+	    ++regcache_hits;
+	    return rc->rc_prog;
+	}
+    }
+    ++regcache_misses;
+    return NULL;
+}
+
+/*
+ * Remove cache entry "rc", freeing the program when nothing else uses it.
+ */
+    static void
+regcache_remove(regcache_T *rc)
+{
+    VIM_CLEAR(rc->rc_pat);
+    vim_regfree(rc->rc_prog);
+    rc->rc_prog = NULL;
+}
+
+/*
+ * Add "prog", compiled from "expr", to the cache.  Replaces the least
+ * recently used entry when the cache is full.
+ */
+    static void
+regcache_add(char_u *expr, int re_flags, int engine, regprog_T *prog)
+{
+    int		i;
+    regcache_T	*rc = &regcache[0];
+
+    if (!regcache_can_use(expr))
+	return;
+    for (i = 0; i < REGCACHE_SIZE; ++i)
+    {
+	if (regcache[i].rc_pat == NULL)
+	{
+	    rc = &regcache[i];
+	    break;
+	}
+	if (regcache[i].rc_lastused < rc->rc_lastused)
+	    rc = &regcache[i];
+    }
+    if (rc->rc_pat != NULL)
+	regcache_remove(rc);
+
+    rc->rc_pat = vim_strsave(expr);
+    if (rc->rc_pat == NULL)
+	return;
+    rc->rc_flags = re_flags;
+    rc->rc_engine = engine;
+    rc->rc_opts = regcache_opts();
+    rc->rc_had_eol = had_eol;
+    rc->rc_lastused = ++regcache_tick;
+    rc->rc_prog = prog;
+    ++prog->re_refcount;
+}
+
+#if defined(EXITFREE) || defined(PROTO)
+/*
+ * Free all programs in the cache that are not used elsewhere.
+ */
+    static void
+regcache_clear(void)
+{
+    int		i;
+
+    for (i = 0; i < REGCACHE_SIZE; ++i)
+	if (regcache[i].rc_pat != NULL)
+	    regcache_remove(&regcache[i]);
+}
+#endif
+
+#if defined(FEAT_EVAL) || defined(PROTO)
+/*
+ * "regexpcacheinfo()" function
+ */
+    void
+f_regexpcacheinfo(typval_T *argvars UNUSED, typval_T *rettv)
+{
+    int		i;
+    int		count = 0;
+
+    if (rettv_dict_alloc(rettv) == FAIL)
+	return;
+    for (i = 0; i < REGCACHE_SIZE; ++i)
+	if (regcache[i].rc_pat != NULL)
+	    ++count;
+    dict_add_number(rettv->vval.v_dict, "size", REGCACHE_SIZE);
+    dict_add_number(rettv->vval.v_dict, "count", count);
+    dict_add_number(rettv->vval.v_dict, "hits", regcache_hits);
+    dict_add_number(rettv->vval.v_dict, "misses", regcache_misses);
+}
+#endif
+
 /*
  * Compile a regular expression into internal code.
  * Returns the program in allocated memory.
  * Use vim_regfree() to free the memory.
  * Returns NULL for an error.
+ * The program may be shared with other users, it must not be changed.
  */
     regprog_T *
 vim_regcomp(char_u *expr_arg, int re_flags)
@@ -2919,6 +3092,7 @@ vim_regcomp(char_u *expr_arg, int re_flags)
     regprog_T   *prog = NULL;
     char_u	*expr = expr_arg;
     int		called_emsg_before;
+    int		engine;
 
     regexp_engine = p_re;
 
@@ -2929,7 +3103,8 @@ vim_regcomp(char_u *expr_arg, int re_flags)
 
 	if (newengine == AUTOMATIC_ENGINE
 	    || newengine == BACKTRACKING_ENGINE
-	    || newengine == NFA_ENGINE)
+	    || newengine == NFA_ENGINE
+	    || newengine == DFA_ENGINE)
 	{
 	    regexp_engine = expr[4] - '0';
 	    expr += 5;
@@ -2940,10 +3115,16 @@ vim_regcomp(char_u *expr_arg, int re_flags)
 	}
 	else
 	{
-	    emsg(_(e_percent_hash_can_only_be_followed_by_zero_one_two_automatic_engine_will_be_used));
+	    emsg(_(e_percent_hash_can_only_be_followed_by_zero_one_two_three_automatic_engine_will_be_used));
 	    regexp_engine = AUTOMATIC_ENGINE;
 	}
     }
+
+    engine = regexp_engine;
+    prog = regcache_find(expr, re_flags, engine);
+    if (prog != NULL)
+	return prog;
+
 #ifdef DEBUG
     bt_regengine.expr = expr;
     nfa_regengine.expr = expr;
@@ -3002,6 +3183,8 @@ vim_regcomp(char_u *expr_arg, int re_flags)
 	// out to be very slow when executing it.
 	prog->re_engine = regexp_engine;
 	prog->re_flags  = re_flags;
+	prog->re_refcount = 1;
+	regcache_add(expr, re_flags, engine, prog);
     }
 
     return prog;
@@ -3009,11 +3192,12 @@ vim_regcomp(char_u *expr_arg, int re_flags)
 
 /*
  * Free a compiled regexp program, returned by vim_regcomp().
+ * Only actually freed when it is not used elsewhere.
  */
     void
 vim_regfree(regprog_T *prog)
 {
-    if (prog != NULL)
+    if (prog != NULL && --prog->re_refcount <= 0)
 	prog->engine->regfree(prog);
 }
 
@@ -3021,6 +3205,7 @@ vim_regfree(regprog_T *prog)
     void
 free_regexp_stuff(void)
 {
+    regcache_clear();
     ga_clear(&regstack);
     ga_clear(&backpos);
     vim_free(reg_tofree);
@@ -3263,3 +3448,35 @@ vim_regexec_multi(
 
     return result <= 0 ? 0 : result;
 }
+
+#if defined(FEAT_SYN_HL) || defined(FEAT_QUICKFIX) || defined(PROTO)
+/*
+ * Set a bit in "bytes" (32 bytes) for every byte a match of "prog" can start
+ * with, when used with ignore-case flag "ic".
+ * Returns FAIL when this is unknown, then "bytes" is not valid.
+ */
+    int
+vim_regfirstbytes(regprog_T *prog, int ic, char_u *bytes)
+{
+    if (prog == NULL || prog->engine != &nfa_regengine)
+	return FAIL;
+    return nfa_regfirstbytes((nfa_regprog_T *)prog, ic, bytes);
+}
+#endif
+
+#if defined(FEAT_QUICKFIX) || defined(PROTO)
+/*
+ * Return TRUE if "prog" gives the same result when matched with
+ * vim_regexec() against the text of a line as with vim_regexec_multi() in a
+ * buffer.  "*kword" is set to TRUE when the pattern also depends on
+ * 'iskeyword'.  Returns FALSE when this is unknown.
+ */
+    int
+vim_regsingleline(regprog_T *prog, int *kword)
+{
+    *kword = FALSE;
+    if (prog == NULL || prog->engine != &nfa_regengine)
+	return FALSE;
+    return nfa_regsingleline((nfa_regprog_T *)prog, kword);
+}
+#endif
@@ -38,6 +38,7 @@
 #define	    AUTOMATIC_ENGINE	0
 #define	    BACKTRACKING_ENGINE	1
 #define	    NFA_ENGINE		2
+#define	    DFA_ENGINE		3
 
 typedef struct regengine regengine_T;
 
@@ -53,6 +54,7 @@ typedef struct regprog
     unsigned		re_engine;   // automatic, backtracking or nfa engine
     unsigned		re_flags;    // second argument for vim_regcomp()
     int			re_in_use;   // prog is being executed
+    int			re_refcount; // number of users, see regcache[]
 } regprog_T;
 
 /*
@@ -68,6 +70,7 @@ typedef struct
     unsigned		re_engine;
     unsigned		re_flags;
     int			re_in_use;
+    int			re_refcount;
 
     int			regstart;
     char_u		reganch;
@@ -94,6 +97,39 @@ struct nfa_state
     int			val;
 };
 
+/*
+ * State of the lazily built DFA used with the NFA matcher when
+ * 'regexpengine' is 3.  It stands for a set of NFA states, "ds_states" holds
+ * their index in nfa_regprog_T.state[], sorted.
+ */
+typedef struct dfa_state_S dfa_state_T;
+struct dfa_state_S
+{
+    dfa_state_T		*ds_hash_next;	// next state in the same hash bucket
+    dfa_state_T		*ds_next[256];	// state after a character, NULL when
+					// not computed yet
+    int			ds_match;	// NFA_MATCH is reached
+    int			ds_eol_match;	// NFA_MATCH is reached at end of line,
+					// -1 when not computed yet
+    int			ds_len;		// number of entries in ds_states[]
+    int			ds_states[1];	// actually longer..
+};
+
+#define DFA_HASH_SIZE	256
+
+typedef struct
+{
+    int			dfa_ic;		// value of rex.reg_ic used for states
+    int			dfa_count;	// number of states in dfa_hash[]
+    dfa_state_T		*dfa_start;	// start state when not at start of line
+    dfa_state_T		*dfa_hash[DFA_HASH_SIZE];
+    int			dfa_lastid;	// last ID used for dfa_seen[]
+    int			*dfa_seen;	// ID per NFA state, when seen
+    int			*dfa_list;	// room for "nstate" state numbers
+    int			*dfa_next_list;	// idem
+    nfa_state_T		**dfa_stack;	// room for the closure stack
+} nfa_dfa_T;
+
 /*
  * Structure used by the NFA matcher.
  */
@@ -105,15 +141,19 @@ typedef struct
     unsigned		re_engine;
     unsigned		re_flags;
     int			re_in_use;
+    int			re_refcount;
 
     nfa_state_T		*start;		// points into state[]
 
     int			reganch;	// pattern starts with ^
     int			regstart;	// char at start of pattern
     char_u		*match_text;	// plain text to match with
+    char_u		*regmust;	// text that every match contains
 
     int			has_zend;	// pattern contains \ze
     int			has_backref;	// pattern contains \1 .. \9
+    nfa_dfa_T		*dfa;		// lazy DFA, for DFA_ENGINE
+    int			dfa_checked;	// TRUE when "dfa" was set up
 #ifdef FEAT_SYN_HL
     int			reghasz;
 #endif
@@ -2565,10 +2565,15 @@ bt_regcomp(char_u *expr, int re_flags)
 
 	// When the r.e. starts with BOW, it is faster to look for a regmust
 	// first. Used a lot for "#" and "*" commands. (Added by mool).
-	if ((flags & SPSTART || OP(scan) == BOW || OP(scan) == EOW)
-							  && !(flags & HASNL))
+	// Also when a literal string appears after what the match starts with,
+	// e.g. "TODO.*urgent", finding it is cheap compared to trying a match
+	// at every "T".
+	if (!(flags & HASNL))
 	{
 	    size_t  scanlen;
+	    char_u  *first = OP(scan) == EXACTLY ? OPERAND(scan) : NULL;
+	    int	    expensive = flags & SPSTART
+				     || OP(scan) == BOW || OP(scan) == EOW;
 
 	    longest = NULL;
 	    len = 0;
@@ -2584,8 +2589,11 @@ bt_regcomp(char_u *expr, int re_flags)
 		    }
 		}
 	    }
-	    r->regmust = longest;
-	    r->regmlen = len;
+	    if (expensive || (longest != NULL && longest != first))
+	    {
+		r->regmust = longest;
+		r->regmlen = len;
+	    }
 	}
     }
 #ifdef BT_REGEXP_DUMP
@@ -4969,14 +4977,10 @@ bt_regexec_both(
 	s = line + col;
 
 	// This is used very often, esp. for ":global".  Use three versions of
-	// the loop to avoid overhead of conditions.
-	if (!rex.reg_ic && !has_mbyte)
-	    while ((s = vim_strbyte(s, c)) != NULL)
-	    {
-		if (cstrncmp(s, prog->regmust, &prog->regmlen) == 0)
-		    break;		// Found it.
-		++s;
-	    }
+	// the loop to avoid overhead of conditions.  When case matters
+	// strstr() is fastest.
+	if (!rex.reg_ic && !rex.reg_icombine)
+	    s = (char_u *)strstr((char *)s, (char *)prog->regmust);
 	else if (!rex.reg_ic || (!enc_utf8 && mb_char2len(c) > 1))
 	    while ((s = vim_strchr(s, c)) != NULL)
 	    {
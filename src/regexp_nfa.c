@@ -504,6 +504,186 @@ nfa_get_match_text(nfa_state_T *start)
     return ret;
 }
 
+/*
+ * Maximum number of states for which nfa_get_regmust() is done.
+ */
+#define NFA_REGMUST_MAX_STATES	2000
+
+/*
+ * Maximum number of literal strings nfa_get_regmust() checks.
+ */
+#define NFA_REGMUST_MAX_TRIES	10
+
+/*
+ * Return TRUE if "c" can be part of the regmust string: a character the
+ * matcher compares as-is and that is encoded with the same bytes in the
+ * text.
+ */
+    static int
+nfa_is_must_char(int c)
+{
+    if (c <= 0)
+	return FALSE;
+    if (c < 0x80)
+	return TRUE;
+    if (enc_utf8)
+	// Characters 0x80 - 0xff may also come from an illegal byte.
+	return c >= 0x100 && !utf_iscomposing(c);
+    return !has_mbyte;
+}
+
+/*
+ * Get the states that can follow state "p" for nfa_get_regmust().
+ * The characters inside a collection are alternatives, skip over them.
+ */
+    static void
+nfa_must_next(nfa_state_T *p, nfa_state_T **next1, nfa_state_T **next2)
+{
+    if (p->c == NFA_START_COLL || p->c == NFA_START_NEG_COLL)
+    {
+	*next1 = p->out1;
+	*next2 = NULL;
+    }
+    else
+    {
+	*next1 = p->out;
+	*next2 = p->out1;
+    }
+}
+
+/*
+ * Mark all states that can be reached from "start" in "reached[]", without
+ * going through state "skip" (can be NULL).  "stack" must have room for all
+ * states.  Return TRUE if NFA_MATCH was reached.
+ */
+    static int
+nfa_must_reach(
+    nfa_regprog_T	*prog,
+    nfa_state_T		*skip,
+    char_u		*reached,
+    nfa_state_T		**stack)
+{
+    int		depth = 0;
+    int		found_match = FALSE;
+    nfa_state_T	*p;
+    nfa_state_T	*next[2];
+    int		i;
+
+    vim_memset(reached, 0, prog->nstate);
+    if (prog->start == skip)
+	return FALSE;
+    reached[prog->start - prog->state] = TRUE;
+    stack[depth++] = prog->start;
+    while (depth > 0)
+    {
+	p = stack[--depth];
+	if (p->c == NFA_MATCH)
+	    found_match = TRUE;
+	nfa_must_next(p, &next[0], &next[1]);
+	for (i = 0; i < 2; ++i)
+	    if (next[i] != NULL && next[i] != skip
+					 && !reached[next[i] - prog->state])
+	    {
+		reached[next[i] - prog->state] = TRUE;
+		stack[depth++] = next[i];
+	    }
+    }
+    return found_match;
+}
+
+/*
+ * Figure out the longest string of literal characters that every match of
+ * the NFA in "prog" must contain.  Only done when the pattern can't match a
+ * line break, then the text must be in the line where the match starts.
+ * Return the string in allocated memory or NULL.
+ */
+    static char_u *
+nfa_get_regmust(nfa_regprog_T *prog)
+{
+    char_u	*reached = NULL;
+    char_u	*tried = NULL;
+    nfa_state_T	**stack = NULL;
+    nfa_state_T	*best;
+    nfa_state_T	*p;
+    int		best_len;
+    int		len;
+    int		tries;
+    int		i;
+    char_u	*ret = NULL;
+    char_u	*s;
+
+    if (prog->nstate > NFA_REGMUST_MAX_STATES || prog->match_text != NULL)
+	return NULL;
+    for (i = 0; i < prog->nstate; ++i)
+    {
+	int c = prog->state[i].c;
+
+	if (c == NFA_NEWL || (c >= NFA_FIRST_NL && c <= NFA_LAST_NL))
+	    return NULL;
+    }
+
+    reached = alloc(prog->nstate);
+    tried = alloc_clear(prog->nstate);
+    stack = ALLOC_MULT(nfa_state_T *, prog->nstate);
+    if (reached == NULL || tried == NULL || stack == NULL)
+	goto theend;
+
+    for (tries = 0; tries < NFA_REGMUST_MAX_TRIES; ++tries)
+    {
+	// Find the longest untried string of characters in the states that
+	// can be reached from the start.
+	nfa_must_reach(prog, NULL, reached, stack);
+	best = NULL;
+	best_len = 0;
+	for (i = 0; i < prog->nstate; ++i)
+	{
+	    if (!reached[i] || tried[i] || !nfa_is_must_char(prog->state[i].c))
+		continue;
+	    len = 0;
+	    for (p = &prog->state[i]; nfa_is_must_char(p->c); p = p->out)
+		len += MB_CHAR2LEN(p->c);
+	    if (len > best_len)
+	    {
+		best = &prog->state[i];
+		best_len = len;
+	    }
+	}
+	if (best == NULL)
+	    break;
+	tried[best - prog->state] = TRUE;
+
+	// A single character that the match starts with is already checked
+	// for with regstart.
+	if (best->c == prog->regstart && !nfa_is_must_char(best->out->c))
+	    continue;
+
+	// When NFA_MATCH can't be reached without going through "best", the
+	// characters must be in every match.
+	if (nfa_must_reach(prog, best, reached, stack))
+	    continue;
+
+	ret = alloc(best_len + 1);
+	if (ret == NULL)
+	    break;
+	s = ret;
+	for (p = best; nfa_is_must_char(p->c); p = p->out)
+	{
+	    if (has_mbyte)
+		s += (*mb_char2bytes)(p->c, s);
+	    else
+		*s++ = p->c;
+	}
+	*s = NUL;
+	break;
+    }
+
+theend:
+    vim_free(reached);
+    vim_free(tried);
+    vim_free(stack);
+    return ret;
+}
+
 /*
  * Allocate more space for post_start.  Called when
  * running above the estimated number of states.
@@ -2930,6 +3110,8 @@ nfa_dump(nfa_regprog_T *prog)
 		prog->regstart, prog->regstart);
     if (prog->match_text != NULL)
 	fprintf(debugf, "match_text: \"%s\"\n", prog->match_text);
+    if (prog->regmust != NULL)
+	fprintf(debugf, "regmust: \"%s\"\n", prog->regmust);
 
     fclose(debugf);
 }
@@ -5654,6 +5836,669 @@ skip_to_start(int c, colnr_T *colp)
     return OK;
 }
 
+/*
+ * Return the length of the character at "p", without composing characters.
+ */
+    static int
+regmust_ptr2len(char_u *p)
+{
+    if (enc_utf8)
+	return utf_ptr2len(p);
+    return has_mbyte ? (*mb_ptr2len)(p) : 1;
+}
+
+/*
+ * Return TRUE if "s" contains "must".  Compares characters the same way as
+ * the matcher does for a literal character.
+ */
+    static int
+find_regmust(char_u *s, char_u *must)
+{
+    char_u	*p;
+    char_u	*q;
+    char_u	*m;
+    int		first;
+    int		c1;
+    int		c2;
+
+    if (!rex.reg_ic)
+	return strstr((char *)s, (char *)must) != NULL;
+
+    first = MB_CASEFOLD(PTR2CHAR(must));
+    for (p = s; *p != NUL; p += regmust_ptr2len(p))
+    {
+	if (MB_CASEFOLD(PTR2CHAR(p)) != first)
+	    continue;
+	for (q = p, m = must; *m != NUL && *q != NUL;
+			q += regmust_ptr2len(q), m += regmust_ptr2len(m))
+	{
+	    c1 = PTR2CHAR(m);
+	    c2 = PTR2CHAR(q);
+	    if (c1 != c2 && MB_CASEFOLD(c1) != MB_CASEFOLD(c2))
+		break;
+	}
+	if (*m == NUL)
+	    return TRUE;
+    }
+    return FALSE;
+}
+
+/*
+ * Maximum number of DFA states kept for one pattern.  When more are needed
+ * all of them are thrown away and building starts again.
+ */
+#define DFA_MAX_STATES 500
+
+/*
+ * Return TRUE if the DFA can handle NFA state "c": it must only depend on
+ * the current character, "^" or "$", not on options, the buffer or what
+ * matched before.
+ */
+    static int
+dfa_state_supported(int c)
+{
+    if (c > 0)
+	return !(enc_utf8 && utf_iscomposing(c));
+    if (c >= NFA_MOPEN && c <= NFA_MCLOSE9)
+	return TRUE;
+#ifdef FEAT_SYN_HL
+    if (c >= NFA_ZOPEN && c <= NFA_ZCLOSE9)
+	return TRUE;
+#endif
+    if (c >= NFA_WHITE && c <= NFA_NUPPER_IC)
+	return TRUE;
+    if (c >= NFA_CLASS_ALNUM && c <= NFA_CLASS_ESCAPE)
+	return c != NFA_CLASS_PRINT;
+    switch (c)
+    {
+	case NFA_SPLIT:
+	case NFA_MATCH:
+	case NFA_EMPTY:
+	case NFA_START_COLL:
+	case NFA_END_COLL:
+	case NFA_START_NEG_COLL:
+	case NFA_RANGE_MIN:
+	case NFA_RANGE_MAX:
+	case NFA_BOL:
+	case NFA_EOL:
+	case NFA_ZSTART:
+	case NFA_ZEND:
+	case NFA_NOPEN:
+	case NFA_NCLOSE:
+	case NFA_ANY:
+	    return TRUE;
+    }
+    return FALSE;
+}
+
+/*
+ * Free the DFA "dfa" and its states.
+ */
+    static void
+dfa_clear_states(nfa_dfa_T *dfa)
+{
+    int		i;
+    dfa_state_T	*ds;
+
+    for (i = 0; i < DFA_HASH_SIZE; ++i)
+	while (dfa->dfa_hash[i] != NULL)
+	{
+	    ds = dfa->dfa_hash[i];
+	    dfa->dfa_hash[i] = ds->ds_hash_next;
+	    vim_free(ds);
+	}
+    dfa->dfa_count = 0;
+    dfa->dfa_start = NULL;
+}
+
+    static void
+dfa_free(nfa_dfa_T *dfa)
+{
+    if (dfa == NULL)
+	return;
+    dfa_clear_states(dfa);
+    vim_free(dfa->dfa_seen);
+    vim_free(dfa->dfa_list);
+    vim_free(dfa->dfa_next_list);
+    vim_free(dfa->dfa_stack);
+    vim_free(dfa);
+}
+
+/*
+ * Allocate the DFA for "prog", if all its states are supported.
+ * Returns NULL otherwise.
+ */
+    static nfa_dfa_T *
+dfa_alloc(nfa_regprog_T *prog)
+{
+    nfa_dfa_T	*dfa;
+    int		i;
+
+    if (prog->has_backref || prog->nstate == 0)
+	return NULL;
+#ifdef FEAT_SYN_HL
+    if (prog->reghasz == REX_USE)
+	return NULL;
+#endif
+    for (i = 0; i < prog->nstate; ++i)
+	if (!dfa_state_supported(prog->state[i].c))
+	    return NULL;
+
+    dfa = ALLOC_CLEAR_ONE(nfa_dfa_T);
+    if (dfa == NULL)
+	return NULL;
+    dfa->dfa_seen = ALLOC_CLEAR_MULT(int, prog->nstate);
+    dfa->dfa_list = ALLOC_MULT(int, prog->nstate);
+    dfa->dfa_next_list = ALLOC_MULT(int, prog->nstate);
+    dfa->dfa_stack = ALLOC_MULT(nfa_state_T *, prog->nstate * 3 + 1);
+    if (dfa->dfa_seen == NULL || dfa->dfa_list == NULL
+		   || dfa->dfa_next_list == NULL || dfa->dfa_stack == NULL)
+    {
+	dfa_free(dfa);
+	return NULL;
+    }
+    dfa->dfa_ic = rex.reg_ic;
+    return dfa;
+}
+
+    static int
+dfa_compare_ints(const void *s1, const void *s2)
+{
+    return *(int *)s1 - *(int *)s2;
+}
+
+/*
+ * Find the states that can be reached from the "len" states in "list" (and
+ * the start state when "add_start" is TRUE) without consuming a character.
+ * "bol" and "eol" tell whether "^" and "$" match at this position.
+ * Only states that consume a character and "$" are kept, they are stored
+ * sorted in dfa->dfa_next_list.  "*matchp" is set when NFA_MATCH is reached.
+ * Returns the number of states stored.
+ */
+    static int
+dfa_closure(
+    nfa_regprog_T   *prog,
+    int		    *list,
+    int		    len,
+    int		    add_start,
+    int		    bol,
+    int		    eol,
+    int		    *matchp)
+{
+    nfa_dfa_T	*dfa = prog->dfa;
+    nfa_state_T	**stack = dfa->dfa_stack;
+    int		*seen = dfa->dfa_seen;
+    int		sp = 0;
+    int		count = 0;
+    int		id;
+    int		i;
+    nfa_state_T	*state;
+
+    if (dfa->dfa_lastid == INT_MAX)
+    {
+	vim_memset(seen, 0, sizeof(int) * prog->nstate);
+	dfa->dfa_lastid = 0;
+    }
+    id = ++dfa->dfa_lastid;
+    *matchp = FALSE;
+
+    for (i = 0; i < len; ++i)
+	stack[sp++] = &prog->state[list[i]];
+    if (add_start)
+	stack[sp++] = prog->start;
+
+    while (sp > 0)
+    {
+	state = stack[--sp];
+	if (state == NULL || seen[state - prog->state] == id)
+	    continue;
+	seen[state - prog->state] = id;
+
+	switch (state->c)
+	{
+	    case NFA_SPLIT:
+		stack[sp++] = state->out1;
+		stack[sp++] = state->out;
+		break;
+
+	    case NFA_MATCH:
+		*matchp = TRUE;
+		break;
+
+	    case NFA_BOL:
+		if (bol)
+		    stack[sp++] = state->out;
+		break;
+
+	    case NFA_EOL:
+		if (eol)
+		    stack[sp++] = state->out;
+		else
+		    dfa->dfa_next_list[count++] = (int)(state - prog->state);
+		break;
+
+	    case NFA_ANY:
+	    case NFA_START_COLL:
+	    case NFA_START_NEG_COLL:
+		dfa->dfa_next_list[count++] = (int)(state - prog->state);
+		break;
+
+	    default:
+		if (state->c > 0 || (state->c >= NFA_WHITE
+						&& state->c <= NFA_NUPPER_IC))
+		    dfa->dfa_next_list[count++] = (int)(state - prog->state);
+		else
+		    // Zero-width: \zs, \ze, \( \), etc.
+		    stack[sp++] = state->out;
+		break;
+	}
+    }
+
+    qsort(dfa->dfa_next_list, (size_t)count, sizeof(int), dfa_compare_ints);
+    return count;
+}
+
+/*
+ * Return TRUE if NFA state "state", which consumes a character, matches
+ * character "c".  Must give the same result as nfa_regmatch().
+ */
+    static int
+dfa_char_match(nfa_state_T *state, int c)
+{
+    nfa_state_T	*s;
+    int		result_if_matched;
+    int		c1, c2;
+
+    switch (state->c)
+    {
+	case NFA_EOL:	    return FALSE;
+	case NFA_ANY:	    return TRUE;
+	case NFA_WHITE:	    return VIM_ISWHITE(c);
+	case NFA_NWHITE:    return !VIM_ISWHITE(c);
+	case NFA_DIGIT:	    return ri_digit(c);
+	case NFA_NDIGIT:    return !ri_digit(c);
+	case NFA_HEX:	    return ri_hex(c);
+	case NFA_NHEX:	    return !ri_hex(c);
+	case NFA_OCTAL:	    return ri_octal(c);
+	case NFA_NOCTAL:    return !ri_octal(c);
+	case NFA_WORD:	    return ri_word(c);
+	case NFA_NWORD:	    return !ri_word(c);
+	case NFA_HEAD:	    return ri_head(c);
+	case NFA_NHEAD:	    return !ri_head(c);
+	case NFA_ALPHA:	    return ri_alpha(c);
+	case NFA_NALPHA:    return !ri_alpha(c);
+	case NFA_LOWER:	    return ri_lower(c);
+	case NFA_NLOWER:    return !ri_lower(c);
+	case NFA_UPPER:	    return ri_upper(c);
+	case NFA_NUPPER:    return !ri_upper(c);
+	case NFA_LOWER_IC:  return ri_lower(c) || (rex.reg_ic && ri_upper(c));
+	case NFA_NLOWER_IC: return !(ri_lower(c) || (rex.reg_ic && ri_upper(c)));
+	case NFA_UPPER_IC:  return ri_upper(c) || (rex.reg_ic && ri_lower(c));
+	case NFA_NUPPER_IC: return !(ri_upper(c) || (rex.reg_ic && ri_lower(c)));
+
+	case NFA_START_COLL:
+	case NFA_START_NEG_COLL:
+	    result_if_matched = (state->c == NFA_START_COLL);
+	    for (s = state->out; s->c != NFA_END_COLL; s = s->out)
+	    {
+		if (s->c == NFA_RANGE_MIN)
+		{
+		    c1 = s->val;
+		    s = s->out; // advance to NFA_RANGE_MAX
+		    c2 = s->val;
+		    if (c >= c1 && c <= c2)
+			return result_if_matched;
+		    if (rex.reg_ic)
+		    {
+			int c_low = MB_CASEFOLD(c);
+
+			for ( ; c1 <= c2; ++c1)
+			    if (MB_CASEFOLD(c1) == c_low)
+				return result_if_matched;
+		    }
+		}
+		else if (s->c < 0 ? check_char_class(s->c, c)
+			: (c == s->c || (rex.reg_ic
+					 && MB_CASEFOLD(c) == MB_CASEFOLD(s->c))))
+		    return result_if_matched;
+	    }
+	    return !result_if_matched;
+
+	default:	// regular character
+	    return c == state->c
+		    || (rex.reg_ic && MB_CASEFOLD(c) == MB_CASEFOLD(state->c));
+    }
+}
+
+/*
+ * Find the DFA state for the "len" NFA states in dfa->dfa_next_list and
+ * "match", add one if it does not exist yet.
+ * "*clearedp" is set when all existing states were freed to make room.
+ * Returns NULL when out of memory.
+ */
+    static dfa_state_T *
+dfa_find_state(nfa_dfa_T *dfa, int len, int match, int *clearedp)
+{
+    int		*list = dfa->dfa_next_list;
+    unsigned	hash = match;
+    int		i;
+    dfa_state_T	*ds;
+
+    for (i = 0; i < len; ++i)
+	hash = hash * 31 + list[i];
+    hash %= DFA_HASH_SIZE;
+
+    for (ds = dfa->dfa_hash[hash]; ds != NULL; ds = ds->ds_hash_next)
+	if (ds->ds_len == len && ds->ds_match == match
+		&& memcmp(ds->ds_states, list, sizeof(int) * len) == 0)
+	    return ds;
+
+    if (dfa->dfa_count >= DFA_MAX_STATES)
+    {
+	dfa_clear_states(dfa);
+	*clearedp = TRUE;
+    }
+    ds = alloc_clear(offsetof(dfa_state_T, ds_states) + sizeof(int) * len + 1);
+    if (ds == NULL)
+	return NULL;
+    ds->ds_match = match;
+    ds->ds_eol_match = -1;
+    ds->ds_len = len;
+    mch_memmove(ds->ds_states, list, sizeof(int) * len);
+    ds->ds_hash_next = dfa->dfa_hash[hash];
+    dfa->dfa_hash[hash] = ds;
+    ++dfa->dfa_count;
+    return ds;
+}
+
+/*
+ * Return the DFA state at the start of matching.  "bol" is TRUE when at the
+ * start of the line.
+ */
+    static dfa_state_T *
+dfa_start_state(nfa_regprog_T *prog, int bol)
+{
+    nfa_dfa_T	*dfa = prog->dfa;
+    int		len;
+    int		match;
+    int		cleared = FALSE;
+    dfa_state_T	*ds;
+
+    if (!bol && dfa->dfa_start != NULL)
+	return dfa->dfa_start;
+    len = dfa_closure(prog, NULL, 0, TRUE, bol, FALSE, &match);
+    ds = dfa_find_state(dfa, len, match, &cleared);
+    if (!bol)
+	dfa->dfa_start = ds;
+    return ds;
+}
+
+/*
+ * Return the DFA state after state "ds" consumed character "c".
+ * Returns NULL when out of memory.
+ */
+    static dfa_state_T *
+dfa_next_state(nfa_regprog_T *prog, dfa_state_T *ds, int c)
+{
+    nfa_dfa_T	*dfa = prog->dfa;
+    int		len = 0;
+    int		match;
+    int		cleared = FALSE;
+    int		i;
+    nfa_state_T	*state;
+    dfa_state_T	*next;
+
+    for (i = 0; i < ds->ds_len; ++i)
+    {
+	state = &prog->state[ds->ds_states[i]];
+	if (dfa_char_match(state, c))
+	    // The state after a collection is the "out" of NFA_END_COLL.
+	    dfa->dfa_list[len++] = (int)((state->c == NFA_START_COLL
+				 || state->c == NFA_START_NEG_COLL
+				       ? state->out1->out : state->out)
+							      - prog->state);
+    }
+    // The pattern is not anchored, a match may start at every position.
+    len = dfa_closure(prog, dfa->dfa_list, len, TRUE, FALSE, FALSE, &match);
+    next = dfa_find_state(dfa, len, match, &cleared);
+    if (next != NULL && c < 256 && !cleared)
+	ds->ds_next[c] = next;
+    return next;
+}
+
+/*
+ * Return TRUE if DFA state "ds" matches at the end of the line.  "bol" is
+ * TRUE when that is also the start of the line.
+ */
+    static int
+dfa_eol_match(nfa_regprog_T *prog, dfa_state_T *ds, int bol)
+{
+    int		match;
+
+    if (!bol && ds->ds_eol_match >= 0)
+	return ds->ds_eol_match;
+    mch_memmove(prog->dfa->dfa_list, ds->ds_states, sizeof(int) * ds->ds_len);
+    (void)dfa_closure(prog, prog->dfa->dfa_list, ds->ds_len, FALSE, bol,
+								 TRUE, &match);
+    if (!bol)
+	ds->ds_eol_match = match;
+    return match;
+}
+
+/*
+ * Use the lazily built DFA to check whether "line" can match "prog" at or
+ * after column "col".  Each DFA state stands for the set of NFA states
+ * nfa_regmatch() would have in its list, transitions are computed when
+ * first needed and remembered.
+ * Returns FALSE when there is no match, TRUE when there is a match or the
+ * DFA cannot be used for this pattern or text.
+ */
+    static int
+dfa_may_match(nfa_regprog_T *prog, char_u *line, colnr_T col)
+{
+    char_u	*p = line + col;
+    dfa_state_T	*ds;
+    dfa_state_T	*next;
+    int		c;
+
+    if (!prog->dfa_checked)
+    {
+	prog->dfa_checked = TRUE;
+	prog->dfa = dfa_alloc(prog);
+    }
+    if (prog->dfa == NULL || rex.reg_line_lbr || rex.reg_icombine)
+	return TRUE;
+
+    // Transitions depend on 'ignorecase'.
+    if (prog->dfa->dfa_ic != rex.reg_ic)
+    {
+	dfa_clear_states(prog->dfa);
+	prog->dfa->dfa_ic = rex.reg_ic;
+    }
+
+    ds = dfa_start_state(prog, p == line);
+    for (;;)
+    {
+	if (ds == NULL || ds->ds_match)
+	    return TRUE;
+	if (*p == NUL)
+	    return dfa_eol_match(prog, ds, p == line);
+	// Without any states left nothing can match.
+	if (ds->ds_len == 0)
+	    return FALSE;
+
+	if (has_mbyte)
+	{
+	    // Composing characters are handled by the NFA.
+	    if (enc_utf8 && utfc_ptr2len(p) != utf_ptr2len(p))
+		return TRUE;
+	    c = (*mb_ptr2char)(p);
+	}
+	else
+	    c = *p;
+	next = c < 256 ? ds->ds_next[c] : NULL;
+	if (next == NULL)
+	    next = dfa_next_state(prog, ds, c);
+	ds = next;
+	p += has_mbyte ? (*mb_ptr2len)(p) : 1;
+    }
+}
+
+#if defined(FEAT_SYN_HL) || defined(FEAT_QUICKFIX) || defined(PROTO)
+/*
+ * Set a bit in "bytes" (32 bytes) for every byte a match of "prog" can start
+ * with.  "ic" is the ignore-case flag the pattern is going to be used with.
+ * Returns FAIL when this can't be decided, e.g. when the pattern can match
+ * an empty string, depends on options or on the text before the match.
+ */
+    static int
+nfa_regfirstbytes(nfa_regprog_T *prog, int ic, char_u *bytes)
+{
+    char_u	*seen;
+    nfa_state_T	**stack;
+    nfa_state_T	*state;
+    nfa_state_T	*s;
+    int		sp = 0;
+    int		c;
+    int		last;
+    int		save_ic = rex.reg_ic;
+    int		ret = OK;
+    char_u	buf[MB_MAXBYTES + 1];
+
+    if (prog->nstate == 0 || (has_mbyte && !enc_utf8)
+					  || (prog->regflags & RF_ICOMBINE))
+	return FAIL;
+    if (prog->regflags & RF_ICASE)
+	ic = TRUE;
+    else if (prog->regflags & RF_NOICASE)
+	ic = FALSE;
+
+    seen = alloc_clear(prog->nstate);
+    stack = ALLOC_MULT(nfa_state_T *, prog->nstate * 2 + 1);
+    if (seen == NULL || stack == NULL)
+    {
+	vim_free(seen);
+	vim_free(stack);
+	return FAIL;
+    }
+    vim_memset(bytes, 0, 32);
+    // dfa_char_match() uses rex.reg_ic
+    rex.reg_ic = ic;
+    // Only ASCII can be checked one byte at a time with UTF-8.
+    last = enc_utf8 ? 0x7f : 0xff;
+
+    stack[sp++] = prog->start;
+    while (sp > 0 && ret == OK)
+    {
+	state = stack[--sp];
+	if (seen[state - prog->state])
+	    continue;
+	seen[state - prog->state] = TRUE;
+
+	c = state->c;
+	if (c == NFA_SPLIT)
+	{
+	    stack[sp++] = state->out1;
+	    stack[sp++] = state->out;
+	    continue;
+	}
+	if ((c >= NFA_MOPEN && c <= NFA_MCLOSE9)
+		|| (c >= NFA_ZOPEN && c <= NFA_ZCLOSE9)
+		|| (c >= NFA_CURSOR && c <= NFA_VISUAL))
+	{
+	    stack[sp++] = state->out;
+	    continue;
+	}
+	switch (c)
+	{
+	    case NFA_EMPTY:
+	    case NFA_BOL:
+	    case NFA_BOW:
+	    case NFA_EOW:
+	    case NFA_BOF:
+	    case NFA_ZSTART:
+	    case NFA_ZEND:
+	    case NFA_NOPEN:
+	    case NFA_NCLOSE:
+		// zero-width, the match starts with what follows
+		stack[sp++] = state->out;
+		continue;
+
+	    case NFA_START_COLL:
+	    case NFA_START_NEG_COLL:
+		for (s = state->out; s->c != NFA_END_COLL; s = s->out)
+		    if (s->c < 0 && !dfa_state_supported(s->c))
+			ret = FAIL;
+		break;
+
+	    default:
+		// Anything else that does not consume one character that
+		// dfa_char_match() can check, e.g. NFA_MATCH, "$", "\n",
+		// look-behind and "\k".
+		if (!(c > 0 || (c >= NFA_WHITE && c <= NFA_NUPPER_IC))
+						   || !dfa_state_supported(c))
+		    ret = FAIL;
+		break;
+	}
+	if (ret == FAIL)
+	    break;
+
+	for (c = 1; c <= last; ++c)
+	    if (dfa_char_match(state, c))
+		bytes[c >> 3] |= 1 << (c & 7);
+	if (last == 0xff || (state->c > 0 && state->c < 0x80 && !ic))
+	    continue;
+	if (state->c >= 0x80 && !ic)
+	{
+	    // Only the first byte of this character.
+	    (void)utf_char2bytes(state->c, buf);
+	    bytes[buf[0] >> 3] |= 1 << (buf[0] & 7);
+	}
+	else
+	    // Any multibyte character may match.
+	    vim_memset(bytes + 0x10, 0xff, 16);
+    }
+
+    rex.reg_ic = save_ic;
+    vim_free(seen);
+    vim_free(stack);
+    return ret;
+}
+#endif
+
+#if defined(FEAT_QUICKFIX) || defined(PROTO)
+/*
+ * Return TRUE if "prog" only looks at the text of the line it is matched
+ * against: it cannot match a line break and does not depend on the line
+ * number, the cursor, marks, the Visual area or the window.
+ * "*kword" is set to TRUE when the pattern uses 'iskeyword'.
+ */
+    static int
+nfa_regsingleline(nfa_regprog_T *prog, int *kword)
+{
+    int		i;
+    int		c;
+
+    *kword = FALSE;
+    if (prog->regflags & RF_HASNL)
+	return FALSE;
+    for (i = 0; i < prog->nstate; ++i)
+    {
+	c = prog->state[i].c;
+	if (c == NFA_NEWL || c == NFA_BOF || c == NFA_EOF
+		|| (c >= NFA_FIRST_NL && c <= NFA_LAST_NL)
+		|| (c >= NFA_CURSOR && c <= NFA_VISUAL
+			   && !(c == NFA_COL || c == NFA_COL_GT
+							   || c == NFA_COL_LT)))
+	    return FALSE;
+	if (c == NFA_KWORD || c == NFA_SKWORD || c == NFA_BOW
+		|| c == NFA_EOW || c == NFA_CLASS_KEYWORD)
+	    *kword = TRUE;
+    }
+    return TRUE;
+}
+#endif
+
 /*
  * Check for a match with match_text.
  * Called after skip_to_start() has found regstart.
@@ -7503,6 +8348,12 @@ nfa_regexec_both(
     }
 #endif
 
+    // If there is text that every match must contain, check the line has
+    // it.  When it doesn't there is no need to start the matcher.
+    if (prog->regmust != NULL && !rex.reg_icombine
+				 && !find_regmust(line + col, prog->regmust))
+	return 0L;
+
     if (prog->regstart != NUL)
     {
 	// Skip ahead until a character we know the match must start with.
@@ -7527,6 +8378,11 @@ nfa_regexec_both(
     if (rex.reg_maxcol > 0 && col >= rex.reg_maxcol)
 	goto theend;
 
+    // With the DFA engine first check whether the line can match at all.
+    // Only when it does the NFA is used to find the position.
+    if (prog->re_engine == DFA_ENGINE && !dfa_may_match(prog, line, col))
+	return 0L;
+
     // Set the "nstate" used by nfa_regcomp() to zero to trigger an error when
     // it's accidentally used during execution.
     nstate = 0;
@@ -7652,6 +8508,9 @@ nfa_regcomp(char_u *expr, int re_flags)
     prog->reganch = nfa_get_reganch(prog->start, 0);
     prog->regstart = nfa_get_regstart(prog->start, 0);
     prog->match_text = nfa_get_match_text(prog->start);
+    prog->regmust = nfa_get_regmust(prog);
+    prog->dfa = NULL;
+    prog->dfa_checked = FALSE;
 
 #ifdef ENABLE_LOG
     nfa_postfix_dump(expr, OK);
@@ -7693,6 +8552,8 @@ nfa_regfree(regprog_T *prog)
 	return;
 
     vim_free(((nfa_regprog_T *)prog)->match_text);
+    vim_free(((nfa_regprog_T *)prog)->regmust);
+    dfa_free(((nfa_regprog_T *)prog)->dfa);
     vim_free(((nfa_regprog_T *)prog)->pattern);
     vim_free(prog);
 }
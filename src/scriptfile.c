@@ -571,6 +571,8 @@ do_in_path(
     char_u	*tail;
     int		num_files;
     char_u	**files;
+    int		ew_flags = (flags & DIP_DIR) ? EW_DIR : EW_FILE;
+    int		res;
     int		i;
     int		did_one = FALSE;
 #ifdef AMIGA
@@ -599,6 +601,9 @@ do_in_path(
 	    verbose_leave();
 	}
 
+	// Cached directory listings are checked again for this search.
+	dir_cache_next_tick();
+
 	// Loop over all entries in 'runtimepath'.
 	rtp = rtp_copy;
 	while (*rtp != NUL && ((flags & DIP_ALL) || !did_one))
@@ -648,12 +653,19 @@ do_in_path(
 		    }
 
 		    // Expand wildcards, invoke the callback for each match.
-		    if (gen_expand_wildcards(1, &buf, &num_files, &files,
-				  (flags & DIP_DIR) ? EW_DIR : EW_FILE) == OK)
+		    // Use the cached directory listings when possible, that
+		    // avoids reading the same directories for every search.
+		    res = dir_cache_expand(buf, ew_flags, &num_files, &files);
+		    if (res == NOTDONE)
+			res = gen_expand_wildcards(1, &buf, &num_files, &files,
+								    ew_flags);
+		    if (res == OK)
 		    {
 			for (i = 0; i < num_files; ++i)
 			{
 			    (*callback)(files[i], cookie);
+			    // The callback may have changed files.
+			    dir_cache_next_tick();
 			    did_one = TRUE;
 			    if (!(flags & DIP_ALL))
 				break;
@@ -1073,6 +1085,9 @@ ex_packadd(exarg_T *eap)
     int		round;
     int		res = OK;
 
+    if (trace_fd != NULL)
+	trace_begin("packadd", eap->arg, NULL);
+
     // Round 1: use "start", round 2: use "opt".
     for (round = 1; round <= 2; ++round)
     {
@@ -1083,7 +1098,7 @@ ex_packadd(exarg_T *eap)
 	len = (int)STRLEN(plugpat) + (int)STRLEN(eap->arg) + 5;
 	pat = alloc(len);
 	if (pat == NULL)
-	    return;
+	    break;
 	vim_snprintf(pat, len, plugpat, round == 1 ? "start" : "opt", eap->arg);
 	// The first round don't give a "not found" error, in the second round
 	// only when nothing was found in the first round.
@@ -1092,6 +1107,9 @@ ex_packadd(exarg_T *eap)
 		add_pack_plugin, eap->forceit ? &APP_ADD_DIR : &APP_BOTH);
 	vim_free(pat);
     }
+
+    if (trace_fd != NULL)
+	trace_end();
 }
 #endif
 
@@ -1769,6 +1787,8 @@ do_source_ext(
 #ifdef FEAT_EVAL
     current_sctx.sc_lnum = 0;
 
+    if (trace_fd != NULL)
+	trace_begin("source", fname_exp, NULL);
 # ifdef FEAT_PROFILE
     if (do_profiling == PROF_YES)
 	prof_child_enter(&wait_start);		// entering a child now
@@ -1997,6 +2017,8 @@ almosttheend:
     if (do_profiling == PROF_YES)
 	prof_child_exit(&wait_start);		// leaving a child now
 # endif
+    if (trace_fd != NULL)
+	trace_end();
 
     KeyTyped = save_KeyTyped;
 #endif
@@ -32,6 +32,53 @@ typedef struct searchstat
     int	    last_maxcount;  // the max count of the last search
 } searchstat_T;
 
+/*
+ * A match of the last search pattern, as stored in the search index.
+ */
+typedef struct
+{
+    pos_T	sm_start;	// start of the match
+    pos_T	sm_end;		// end of this or an earlier match, whichever
+				// is further
+} searchmatch_T;
+
+/*
+ * The search index remembers the positions of the matches of the last search
+ * pattern in a buffer, so that the search count does not have to search the
+ * whole buffer each time.  It is kept up to date when lines change by only
+ * searching the changed lines again.
+ */
+struct searchindex_S
+{
+    char_u	*si_pat;	// pattern the index is for
+    size_t	si_patlen;
+    int		si_magic;	// magic flag of "si_pat"
+    int		si_no_scs;	// no smartcase for "si_pat"
+    int		si_ic;		// 'ignorecase' used
+    int		si_scs;		// 'smartcase' used
+    int		si_cpo_search;	// 'cpoptions' contained 'c'
+    char_u	*si_isk;	// 'iskeyword' used
+    char_u	*si_isi;	// 'isident' used
+    char_u	*si_isf;	// 'isfname' used
+    char_u	*si_isp;	// 'isprint' used
+    long	si_re;		// 'regexpengine' used
+    int		si_multiline;	// pattern can match a line break
+    varnumber_T	si_changedtick;	// b:changedtick the index is valid for
+    linenr_T	si_line_count;	// line count the index is valid for
+    garray_T	si_matches;	// found matches, searchmatch_T items
+    pos_T	si_resume;	// continue searching after this position
+    int		si_complete;	// searched until the end of the buffer
+    int		si_limit;	// max number of matches to find, 0 for all
+    linenr_T	si_dirty_top;	// first line to search again, zero for none
+    linenr_T	si_dirty_bot;	// last line to search again
+};
+
+// Number of lines searched in one go when building the search index.
+#define SEARCH_INDEX_CHUNK 1000
+// Time in msec used for building the search index while waiting for a
+// character.
+#define SEARCH_INDEX_IDLE_TIME 20L
+
 #ifdef FEAT_SEARCH_EXTRA
 static void save_incsearch_state(void);
 static void restore_incsearch_state(void);
@@ -42,11 +89,12 @@ static void find_mps_values(int *initc, int *findc, int *backwards, int switchit
 static int is_zero_width(char_u *pattern, size_t patternlen, int move, pos_T *cur, int direction);
 static void cmdline_search_stat(int dirc, pos_T *pos, pos_T *cursor_pos, int show_top_bot_msg, char_u *msgbuf, size_t msgbuflen, int recompute, int maxcount, long timeout);
 static void update_search_stat(int dirc, pos_T *pos, pos_T *cursor_pos, searchstat_T *stat, int recompute, int maxcount, long timeout);
+static int search_index_count(pos_T *pos, int maxcount, long timeout, searchstat_T *stat);
 static int fuzzy_match_compute_score(char_u *fuzpat, char_u *str, int strSz, int_u *matches, int numMatches, int camelcase);
 static int fuzzy_match_recursive(char_u *fuzpat, char_u *str, int_u strIdx, int *outScore, char_u *strBegin, int strLen, int_u *srcMatches, int_u *matches, int maxMatches, int nextMatch, int *recursionCount, int camelcase);
 #if defined(FEAT_EVAL) || defined(FEAT_PROTO)
 static int fuzzy_match_item_compare(const void *s1, const void *s2);
-static void fuzzy_match_in_list(list_T *l, char_u *str, int matchseq, char_u *key, callback_T *item_cb, int retmatchpos, list_T *fmatchlist, long max_matches, int camelcase);
+static void fuzzy_match_in_list(list_T *l, char_u *str, int matchseq, char_u *key, callback_T *item_cb, int retmatchpos, list_T *fmatchlist, long max_matches, long max_best, int camelcase);
 static void do_fuzzymatch(typval_T *argvars, typval_T *rettv, int retmatchpos);
 #endif
 static int fuzzy_match_str_compare(const void *s1, const void *s2);
@@ -3324,30 +3372,41 @@ update_search_stat(
 	if (timeout > 0)
 	    profile_setlimit(timeout, &start);
 #endif
-	while (!got_int && searchit(curwin, curbuf, &lastpos, &endpos,
-			 FORWARD, NULL, 0, 1, SEARCH_KEEP, RE_LAST, NULL) != FAIL)
+	if (search_index_count(&p, maxcount, timeout, stat) == OK)
 	{
-	    done_search = TRUE;
-#ifdef FEAT_RELTIME
-	    // Stop after passing the time limit.
-	    if (timeout > 0 && profile_passed_limit(&start))
+	    cnt = stat->cnt;
+	    cur = stat->cur;
+	    exact_match = stat->exact_match;
+	    incomplete = stat->incomplete;
+	    done_search = cnt > 0;
+	}
+	else
+	{
+	    while (!got_int && searchit(curwin, curbuf, &lastpos, &endpos,
+			 FORWARD, NULL, 0, 1, SEARCH_KEEP, RE_LAST, NULL) != FAIL)
 	    {
-		incomplete = 1;
-		break;
-	    }
+		done_search = TRUE;
+#ifdef FEAT_RELTIME
+		// Stop after passing the time limit.
+		if (timeout > 0 && profile_passed_limit(&start))
+		{
+		    incomplete = 1;
+		    break;
+		}
 #endif
-	    cnt++;
-	    if (LTOREQ_POS(lastpos, p))
-	    {
-		cur = cnt;
-		if (LT_POS(p, endpos))
-		    exact_match = TRUE;
-	    }
-	    fast_breakcheck();
-	    if (maxcount > 0 && cnt > maxcount)
-	    {
-		incomplete = 2;    // max count exceeded
-		break;
+		cnt++;
+		if (LTOREQ_POS(lastpos, p))
+		{
+		    cur = cnt;
+		    if (LT_POS(p, endpos))
+			exact_match = TRUE;
+		}
+		fast_breakcheck();
+		if (maxcount > 0 && cnt > maxcount)
+		{
+		    incomplete = 2;    // max count exceeded
+		    break;
+		}
 	    }
 	}
 	if (got_int)
@@ -3373,6 +3432,510 @@ update_search_stat(
     p_ws = save_ws;
 }
 
+/*
+ * Return TRUE if the matches of the last search pattern only depend on the
+ * text, not on the cursor position, marks, the Visual area, line numbers,
+ * the last substitute string or the text around the match.
+ */
+    static int
+search_index_possible(void)
+{
+    char_u	*p = spats[last_idx].pat;
+
+    if (p == NULL || *p == NUL)
+	return FALSE;
+    for ( ; *p != NUL; ++p)
+    {
+	if (*p == '@' || *p == '~')
+	    return FALSE;
+	// "\%(", "\%[" and "\%d123" are fine, "\%#", "\%23l", etc. are not.
+	if (*p == '%' && p[1] != NUL
+			     && vim_strchr((char_u *)"([dxouUC", p[1]) == NULL)
+	    return FALSE;
+    }
+    return TRUE;
+}
+
+/*
+ * Return TRUE if search index "si" is for the last search pattern and the
+ * current text of the current buffer.
+ */
+    static int
+search_index_valid(searchindex_T *si)
+{
+    return si->si_changedtick == CHANGEDTICK(curbuf)
+	&& si->si_line_count == curbuf->b_ml.ml_line_count
+	&& si->si_patlen == spats[last_idx].patlen
+	&& STRCMP(si->si_pat, spats[last_idx].pat) == 0
+	&& si->si_magic == spats[last_idx].magic
+	&& si->si_no_scs == spats[last_idx].no_scs
+	&& si->si_ic == p_ic
+	&& si->si_scs == p_scs
+	&& si->si_cpo_search == (vim_strchr(p_cpo, CPO_SEARCH) != NULL)
+	&& STRCMP(si->si_isk, curbuf->b_p_isk) == 0
+	&& STRCMP(si->si_isi, p_isi) == 0
+	&& STRCMP(si->si_isf, p_isf) == 0
+	&& STRCMP(si->si_isp, p_isp) == 0
+	&& si->si_re == p_re;
+}
+
+/*
+ * Free the search index of buffer "buf".
+ */
+    void
+search_index_free(buf_T *buf)
+{
+    searchindex_T *si = buf->b_search_index;
+
+    if (si == NULL)
+	return;
+    vim_free(si->si_pat);
+    vim_free(si->si_isk);
+    vim_free(si->si_isi);
+    vim_free(si->si_isf);
+    vim_free(si->si_isp);
+    ga_clear(&si->si_matches);
+    VIM_CLEAR(buf->b_search_index);
+}
+
+/*
+ * Create a new, empty search index for the last search pattern in the
+ * current buffer.
+ * Returns NULL when out of memory or the pattern is invalid.
+ */
+    static searchindex_T *
+search_index_new(void)
+{
+    searchindex_T   *si;
+    regprog_T	    *prog;
+
+    // The pattern is compiled again when searching, errors are given then.
+    ++emsg_off;
+    prog = vim_regcomp(spats[last_idx].pat, spats[last_idx].magic
+							      ? RE_MAGIC : 0);
+    --emsg_off;
+    if (prog == NULL)
+	return NULL;
+    si = ALLOC_CLEAR_ONE(searchindex_T);
+    if (si != NULL)
+    {
+	si->si_multiline = re_multiline(prog);
+	si->si_pat = vim_strnsave(spats[last_idx].pat, spats[last_idx].patlen);
+	si->si_patlen = spats[last_idx].patlen;
+	si->si_magic = spats[last_idx].magic;
+	si->si_no_scs = spats[last_idx].no_scs;
+	si->si_ic = p_ic;
+	si->si_scs = p_scs;
+	si->si_cpo_search = vim_strchr(p_cpo, CPO_SEARCH) != NULL;
+	si->si_isk = vim_strsave(curbuf->b_p_isk);
+	si->si_isi = vim_strsave(p_isi);
+	si->si_isf = vim_strsave(p_isf);
+	si->si_isp = vim_strsave(p_isp);
+	si->si_re = p_re;
+	si->si_changedtick = CHANGEDTICK(curbuf);
+	si->si_line_count = curbuf->b_ml.ml_line_count;
+	ga_init2(&si->si_matches, sizeof(searchmatch_T), 100);
+	if (si->si_pat == NULL || si->si_isk == NULL || si->si_isi == NULL
+		|| si->si_isf == NULL || si->si_isp == NULL)
+	{
+	    vim_free(si->si_pat);
+	    vim_free(si->si_isk);
+	    vim_free(si->si_isi);
+	    vim_free(si->si_isf);
+	    vim_free(si->si_isp);
+	    VIM_CLEAR(si);
+	}
+    }
+    vim_regfree(prog);
+    return si;
+}
+
+/*
+ * Return the index of the first match in "si" that starts in line "lnum" or
+ * later.
+ */
+    static int
+search_index_find_line(searchindex_T *si, linenr_T lnum)
+{
+    searchmatch_T   *sm = (searchmatch_T *)si->si_matches.ga_data;
+    int		    lo = 0;
+    int		    hi = si->si_matches.ga_len;
+    int		    mid;
+
+    while (lo < hi)
+    {
+	mid = (lo + hi) / 2;
+	if (sm[mid].sm_start.lnum < lnum)
+	    lo = mid + 1;
+	else
+	    hi = mid;
+    }
+    return lo;
+}
+
+/*
+ * Find the matches of the last search pattern after "*from" that start in
+ * line "stop_lnum" or before and append them to "gap".  Stops after "limit"
+ * matches when it is not zero, or when "tm" is not NULL and passed.
+ * "*from" is set to where searching can continue.
+ * Returns OK when all matches up to "stop_lnum" were found.
+ */
+    static int
+search_index_find(
+    pos_T	*from,
+    linenr_T	stop_lnum,
+    garray_T	*gap,
+    int		limit,
+    proftime_T	*tm UNUSED)
+{
+    searchit_arg_T  sia;
+    searchmatch_T   *sm;
+    pos_T	    pos = *from;
+    pos_T	    endpos;
+
+    CLEAR_FIELD(sia);
+    sia.sa_stop_lnum = stop_lnum;
+    for (;;)
+    {
+	if (got_int || (limit > 0 && gap->ga_len >= limit))
+	    return FAIL;
+#ifdef FEAT_RELTIME
+	if (tm != NULL && profile_passed_limit(tm))
+	    return FAIL;
+#endif
+	if (searchit(curwin, curbuf, &pos, &endpos, FORWARD, NULL, 0, 1,
+					SEARCH_KEEP, RE_LAST, &sia) == FAIL)
+	    break;
+	if (ga_grow(gap, 1) == FAIL)
+	    return FAIL;
+	sm = (searchmatch_T *)gap->ga_data + gap->ga_len;
+	sm->sm_start = pos;
+	sm->sm_end = endpos;
+	if (gap->ga_len > 0 && LT_POS(sm->sm_end, sm[-1].sm_end))
+	    sm->sm_end = sm[-1].sm_end;
+	++gap->ga_len;
+	*from = pos;
+	fast_breakcheck();
+    }
+    if (got_int)
+	return FAIL;
+    // A match found with "\zs" may start after "stop_lnum".
+    if (from->lnum <= stop_lnum)
+    {
+	from->lnum = stop_lnum;
+	from->col = MAXCOL;
+	from->coladd = 0;
+    }
+    return OK;
+}
+
+/*
+ * Search lines "top" to "bot" in the search index "si" again.
+ * Returns FAIL when interrupted or out of memory.
+ */
+    static int
+search_index_rescan(searchindex_T *si, linenr_T top, linenr_T bot)
+{
+    garray_T	    ga;
+    pos_T	    from;
+    searchmatch_T   *sm;
+    int		    idx;
+    int		    end;
+    int		    ret = FAIL;
+
+    ga_init2(&ga, sizeof(searchmatch_T), 20);
+    if (top <= 1)
+	CLEAR_POS(&from);
+    else
+    {
+	from.lnum = top - 1;
+	from.col = MAXCOL;
+	from.coladd = 0;
+    }
+    if (search_index_find(&from, bot, &ga, 0, NULL) == OK)
+    {
+	// Replace the matches in these lines with the new ones.
+	idx = search_index_find_line(si, top);
+	end = search_index_find_line(si, bot + 1);
+	if (ga_grow(&si->si_matches, ga.ga_len - (end - idx)) == OK)
+	{
+	    sm = (searchmatch_T *)si->si_matches.ga_data;
+	    mch_memmove(sm + idx + ga.ga_len, sm + end,
+			(si->si_matches.ga_len - end) * sizeof(searchmatch_T));
+	    if (ga.ga_len > 0)
+		mch_memmove(sm + idx, ga.ga_data,
+					   ga.ga_len * sizeof(searchmatch_T));
+	    si->si_matches.ga_len += ga.ga_len - (end - idx);
+	    ret = OK;
+	}
+    }
+    ga_clear(&ga);
+    return ret;
+}
+
+/*
+ * Bring search index "si" up to date: search changed lines again and find
+ * more matches until the end of the buffer or "si_limit" is reached.
+ * Stops when "tm" is passed.
+ * Returns FAIL when not done.
+ */
+    static int
+search_index_update(searchindex_T *si, proftime_T *tm)
+{
+    int		save_ws = p_ws;
+    int		ret = OK;
+    linenr_T	stop_lnum;
+
+    p_ws = FALSE;
+    while (si->si_dirty_top > 0)
+    {
+	stop_lnum = si->si_dirty_top + SEARCH_INDEX_CHUNK - 1;
+	if (stop_lnum >= si->si_dirty_bot)
+	    stop_lnum = si->si_dirty_bot;
+	if (search_index_rescan(si, si->si_dirty_top, stop_lnum) == FAIL)
+	{
+	    ret = FAIL;
+	    break;
+	}
+	if (stop_lnum == si->si_dirty_bot)
+	    si->si_dirty_top = 0;
+	else
+	    si->si_dirty_top = stop_lnum + 1;
+#ifdef FEAT_RELTIME
+	if (tm != NULL && profile_passed_limit(tm))
+	{
+	    ret = FAIL;
+	    break;
+	}
+#endif
+    }
+
+    while (ret == OK && !si->si_complete
+	    && (si->si_limit == 0 || si->si_matches.ga_len < si->si_limit))
+    {
+	stop_lnum = si->si_resume.lnum + SEARCH_INDEX_CHUNK;
+	if (stop_lnum >= curbuf->b_ml.ml_line_count)
+	    stop_lnum = curbuf->b_ml.ml_line_count;
+	if (search_index_find(&si->si_resume, stop_lnum, &si->si_matches,
+						   si->si_limit, tm) == FAIL)
+	{
+	    // Reaching the limit is not a failure.
+	    if (si->si_limit == 0 || si->si_matches.ga_len < si->si_limit)
+		ret = FAIL;
+	    break;
+	}
+	if (si->si_resume.lnum >= curbuf->b_ml.ml_line_count)
+	    si->si_complete = TRUE;
+    }
+    p_ws = save_ws;
+    return ret;
+}
+
+/*
+ * Use the search index of the current buffer to compute the search count for
+ * the last search pattern at position "pos", like update_search_stat() does.
+ * The index is created or updated first, using at most "timeout" msec.
+ * Returns FAIL when the pattern cannot be used with the search index.
+ */
+    static int
+search_index_count(
+    pos_T	    *pos,
+    int		    maxcount,
+    long	    timeout UNUSED,
+    searchstat_T    *stat)
+{
+    searchindex_T   *si = curbuf->b_search_index;
+    searchmatch_T   *sm;
+    proftime_T	    tm;
+    proftime_T	    *tmp = NULL;
+    int		    count;
+    int		    lo, hi, mid;
+
+    if (!search_index_possible())
+	return FAIL;
+    if (si != NULL && !search_index_valid(si))
+    {
+	search_index_free(curbuf);
+	si = NULL;
+    }
+    if (si == NULL)
+    {
+	si = search_index_new();
+	if (si == NULL)
+	    return FAIL;
+	si->si_limit = maxcount > 0 ? maxcount + 1 : 0;
+	curbuf->b_search_index = si;
+    }
+    else if (si->si_limit > 0 && (maxcount <= 0 || maxcount >= si->si_limit))
+	si->si_limit = maxcount > 0 ? maxcount + 1 : 0;
+
+#ifdef FEAT_RELTIME
+    if (timeout > 0)
+    {
+	profile_setlimit(timeout, &tm);
+	tmp = &tm;
+    }
+#endif
+    stat->incomplete = search_index_update(si, tmp) == FAIL ? 1 : 0;
+
+    // Only the first "maxcount" + 1 matches are counted.
+    count = si->si_matches.ga_len;
+    if (maxcount > 0 && count > maxcount)
+    {
+	count = maxcount + 1;
+	stat->incomplete = 2;
+    }
+    stat->cnt = count;
+
+    // Find the number of matches starting at or before "pos".
+    sm = (searchmatch_T *)si->si_matches.ga_data;
+    lo = 0;
+    hi = count;
+    while (lo < hi)
+    {
+	mid = (lo + hi) / 2;
+	if (LTOREQ_POS(sm[mid].sm_start, *pos))
+	    lo = mid + 1;
+	else
+	    hi = mid;
+    }
+    stat->cur = lo;
+    stat->exact_match = lo > 0 && LT_POS(*pos, sm[lo - 1].sm_end);
+    return OK;
+}
+
+/*
+ * Called when lines "lnum" to "lnume" (exclusive) in the current buffer were
+ * changed and "xtra" lines were added or deleted after them.  Updates the
+ * search index, the changed lines are searched again later.
+ */
+    void
+search_index_changed(linenr_T lnum, linenr_T lnume, long xtra)
+{
+    searchindex_T   *si = curbuf->b_search_index;
+    searchmatch_T   *sm;
+    linenr_T	    top;
+    linenr_T	    bot;
+    int		    idx;
+    int		    end;
+    int		    i;
+
+    if (si == NULL)
+	return;
+    // The index must have been valid before this change, and a match with a
+    // line break may span the change.
+    if (si->si_changedtick != CHANGEDTICK(curbuf) - 1 || si->si_multiline)
+    {
+	search_index_free(curbuf);
+	return;
+    }
+    si->si_changedtick = CHANGEDTICK(curbuf);
+    si->si_line_count = curbuf->b_ml.ml_line_count;
+
+    if (!si->si_complete && si->si_resume.lnum < lnum)
+	// Changed text was not searched yet.
+	return;
+
+    // Remove the matches in the changed lines, adjust the line numbers of
+    // the matches below them.
+    idx = search_index_find_line(si, lnum);
+    end = search_index_find_line(si, lnume);
+    sm = (searchmatch_T *)si->si_matches.ga_data;
+    if (end > idx)
+    {
+	mch_memmove(sm + idx, sm + end,
+			(si->si_matches.ga_len - end) * sizeof(searchmatch_T));
+	si->si_matches.ga_len -= end - idx;
+    }
+    if (xtra != 0)
+	for (i = idx; i < si->si_matches.ga_len; ++i)
+	{
+	    sm[i].sm_start.lnum += xtra;
+	    sm[i].sm_end.lnum += xtra;
+	}
+
+    if (!si->si_complete)
+    {
+	if (si->si_resume.lnum >= lnume)
+	    si->si_resume.lnum += xtra;
+	else
+	{
+	    // Searching stopped in the changed lines, continue above them.
+	    si->si_matches.ga_len = idx;
+	    if (lnum <= 1)
+		CLEAR_POS(&si->si_resume);
+	    else
+	    {
+		si->si_resume.lnum = lnum - 1;
+		si->si_resume.col = MAXCOL;
+		si->si_resume.coladd = 0;
+	    }
+	}
+    }
+
+    // Lines still to be searched again move as well.
+    top = si->si_dirty_top;
+    bot = si->si_dirty_bot;
+    if (top > 0)
+    {
+	if (top >= lnume)
+	    top += xtra;
+	else if (top >= lnum)
+	    top = lnum;
+	if (bot >= lnume)
+	    bot += xtra;
+	else if (bot >= lnum)
+	    bot = lnume + xtra - 1;
+    }
+
+    // Add the changed lines.
+    if (lnume + xtra - 1 >= lnum)
+    {
+	if (top == 0 || top > lnum)
+	    top = lnum;
+	if (top == 0 || bot < lnume + xtra - 1)
+	    bot = lnume + xtra - 1;
+    }
+    if (!si->si_complete && bot >= si->si_resume.lnum)
+	bot = si->si_resume.lnum - 1;
+    if (top > bot || top <= 0)
+	top = 0;
+    si->si_dirty_top = top;
+    si->si_dirty_bot = bot;
+}
+
+#if defined(FEAT_TIMERS) || defined(PROTO)
+/*
+ * Return TRUE if the search index of the current buffer can be updated while
+ * waiting for a character.
+ */
+    int
+search_index_pending(void)
+{
+    searchindex_T   *si = curbuf->b_search_index;
+
+    return si != NULL && !got_int && search_index_possible()
+	&& search_index_valid(si)
+	&& (si->si_dirty_top > 0 || (!si->si_complete
+	    && (si->si_limit == 0 || si->si_matches.ga_len < si->si_limit)));
+}
+
+/*
+ * Update the search index of the current buffer for a short while.  Called
+ * when waiting for a character.
+ */
+    void
+search_index_idle(void)
+{
+    proftime_T	tm;
+
+    if (!search_index_pending())
+	return;
+    profile_setlimit(SEARCH_INDEX_IDLE_TIME, &tm);
+    (void)search_index_update(curbuf->b_search_index, &tm);
+}
+#endif
+
 #if defined(FEAT_FIND_ID) || defined(PROTO)
 
 /*
@@ -4554,8 +5117,10 @@ fuzzy_match_recursive(
     int		recursiveMatch = FALSE;
     int_u	bestRecursiveMatches[MAX_FUZZY_MATCHES];
     int		bestRecursiveScore = 0;
+    int		bestRecursiveCount = 0;
     int		first_match;
     int		matched;
+    int		c1;
 
     // Count recursions
     ++*recursionCount;
@@ -4568,24 +5133,21 @@ fuzzy_match_recursive(
 
     // Loop through fuzpat and str looking for a match
     first_match = TRUE;
+    c1 = vim_tolower(PTR2CHAR(fuzpat));
     while (*fuzpat != NUL && *str != NUL)
     {
-	int	c1;
-	int	c2;
-
-	c1 = PTR2CHAR(fuzpat);
-	c2 = PTR2CHAR(str);
+	int	c2 = PTR2CHAR(str);
 
 	// Found match
-	if (vim_tolower(c1) == vim_tolower(c2))
+	if (c1 == c2 || c1 == vim_tolower(c2))
 	{
 	    // Supplied matches buffer was too short
 	    if (nextMatch >= maxMatches)
 		return 0;
 
 	    int		recursiveScore = 0;
+	    int		recursiveCount;
 	    int_u	recursiveMatches[MAX_FUZZY_MATCHES];
-	    CLEAR_FIELD(recursiveMatches);
 
 	    // "Copy-on-Write" srcMatches into matches
 	    if (first_match && srcMatches)
@@ -4596,18 +5158,21 @@ fuzzy_match_recursive(
 
 	    // Recursive call that "skips" this match
 	    char_u *next_char = str + (has_mbyte ? (*mb_ptr2len)(str) : 1);
-	    if (fuzzy_match_recursive(fuzpat, next_char, strIdx + 1,
-			&recursiveScore, strBegin, strLen, matches,
+	    recursiveCount = fuzzy_match_recursive(fuzpat, next_char,
+			strIdx + 1, &recursiveScore, strBegin, strLen, matches,
 			recursiveMatches,
 			ARRAY_LENGTH(recursiveMatches),
-			nextMatch, recursionCount, camelcase))
+			nextMatch, recursionCount, camelcase);
+	    if (recursiveCount > 0)
 	    {
-		// Pick best recursive score
+		// Pick best recursive score.  Only the first "recursiveCount"
+		// entries are used.
 		if (!recursiveMatch || recursiveScore > bestRecursiveScore)
 		{
 		    memcpy(bestRecursiveMatches, recursiveMatches,
-			    MAX_FUZZY_MATCHES * sizeof(recursiveMatches[0]));
+				   recursiveCount * sizeof(recursiveMatches[0]));
 		    bestRecursiveScore = recursiveScore;
+		    bestRecursiveCount = recursiveCount;
 		}
 		recursiveMatch = TRUE;
 	    }
@@ -4618,6 +5183,8 @@ fuzzy_match_recursive(
 		MB_PTR_ADV(fuzpat);
 	    else
 		++fuzpat;
+	    if (*fuzpat != NUL)
+		c1 = vim_tolower(PTR2CHAR(fuzpat));
 	}
 	if (has_mbyte)
 	    MB_PTR_ADV(str);
@@ -4638,7 +5205,8 @@ fuzzy_match_recursive(
     if (recursiveMatch && (!matched || bestRecursiveScore > *outScore))
     {
 	// Recursive score is better than "this"
-	memcpy(matches, bestRecursiveMatches, maxMatches * sizeof(matches[0]));
+	memcpy(matches, bestRecursiveMatches,
+			       bestRecursiveCount * sizeof(matches[0]));
 	*outScore = bestRecursiveScore;
 	return nextMatch;
     }
@@ -4648,6 +5216,35 @@ fuzzy_match_recursive(
     return 0;		// no match
 }
 
+/*
+ * Return TRUE if all the characters of "fuzpat" appear in "str" in the same
+ * order, ignoring case.  This is a quick check done before the (much more
+ * expensive) recursive search, which can only find a match if this is TRUE.
+ */
+    static int
+fuzzy_match_possible(char_u *fuzpat, char_u *str)
+{
+    int		c1;
+
+    while (*fuzpat != NUL)
+    {
+	c1 = vim_tolower(PTR2CHAR(fuzpat));
+	for (;;)
+	{
+	    int	c2;
+
+	    if (*str == NUL)
+		return FALSE;
+	    c2 = PTR2CHAR(str);
+	    MB_PTR_ADV(str);
+	    if (c1 == c2 || c1 == vim_tolower(c2))
+		break;
+	}
+	MB_PTR_ADV(fuzpat);
+    }
+    return TRUE;
+}
+
 /*
  * fuzzy_match()
  *
@@ -4674,7 +5271,7 @@ fuzzy_match(
 	int		camelcase)
 {
     int		recursionCount = 0;
-    int		len = MB_CHARLEN(str);
+    int		len = -1;
     char_u	*save_pat;
     char_u	*pat;
     char_u	*p;
@@ -4717,9 +5314,17 @@ fuzzy_match(
 
 	score = 0;
 	recursionCount = 0;
-	matchCount = fuzzy_match_recursive(pat, str, 0, &score, str, len, NULL,
-				matches + numMatches, maxMatches - numMatches,
-				0, &recursionCount, camelcase);
+	if (!fuzzy_match_possible(pat, str))
+	    matchCount = 0;
+	else
+	{
+	    if (len < 0)
+		len = MB_CHARLEN(str);
+	    matchCount = fuzzy_match_recursive(pat, str, 0, &score, str, len,
+				NULL, matches + numMatches,
+				maxMatches - numMatches, 0, &recursionCount,
+				camelcase);
+	}
 	if (matchCount == 0)
 	{
 	    numMatches = 0;
@@ -4760,6 +5365,49 @@ fuzzy_match_item_compare(const void *s1, const void *s2)
 	return v1 > v2 ? -1 : 1;
 }
 
+/*
+ * Functions for a heap of fuzzy matches, used to keep the best "n" matches.
+ * The worst match, the one that sorts last, is at the root.
+ */
+    static void
+fuzzy_heap_sift_up(fuzzyItem_T *items, long i)
+{
+    while (i > 0)
+    {
+	long	    parent = (i - 1) / 2;
+	fuzzyItem_T tmp;
+
+	if (fuzzy_match_item_compare(&items[parent], &items[i]) >= 0)
+	    break;
+	tmp = items[parent];
+	items[parent] = items[i];
+	items[i] = tmp;
+	i = parent;
+    }
+}
+
+    static void
+fuzzy_heap_sift_down(fuzzyItem_T *items, long count, long i)
+{
+    for (;;)
+    {
+	long	    child = 2 * i + 1;
+	fuzzyItem_T tmp;
+
+	if (child >= count)
+	    break;
+	if (child + 1 < count && fuzzy_match_item_compare(&items[child + 1],
+						       &items[child]) > 0)
+	    ++child;
+	if (fuzzy_match_item_compare(&items[i], &items[child]) >= 0)
+	    break;
+	tmp = items[child];
+	items[child] = items[i];
+	items[i] = tmp;
+	i = child;
+    }
+}
+
 /*
  * Fuzzy search the string 'str' in a list of 'items' and return the matching
  * strings in 'fmatchlist'.
@@ -4770,6 +5418,8 @@ fuzzy_match_item_compare(const void *s1, const void *s2)
  * for each item or use 'item_cb' Funcref function to get the string.
  * If 'retmatchpos' is TRUE, then return a list of positions where 'str'
  * matches for each item.
+ * If 'max_best' is more than zero, then only the 'max_best' matches with the
+ * highest score are kept, using a heap.
  */
     static void
 fuzzy_match_in_list(
@@ -4781,13 +5431,16 @@ fuzzy_match_in_list(
 	int		retmatchpos,
 	list_T		*fmatchlist,
 	long		max_matches,
+	long		max_best,
 	int		camelcase)
 {
     long	len;
     fuzzyItem_T	*items;
+    fuzzyItem_T	*fi;
     listitem_T	*li;
     long	i = 0;
     long	match_count = 0;
+    long	item_count = 0;
     int_u	matches[MAX_FUZZY_MATCHES];
 
     len = list_len(l);
@@ -4795,6 +5448,8 @@ fuzzy_match_in_list(
 	return;
     if (max_matches > 0 && len > max_matches)
 	len = max_matches;
+    if (max_best > 0 && len > max_best)
+	len = max_best;
 
     items = ALLOC_CLEAR_MULT(fuzzyItem_T, len);
     if (items == NULL)
@@ -4844,35 +5499,61 @@ fuzzy_match_in_list(
 		&& fuzzy_match(itemstr, str, matchseq, &score, matches,
 						MAX_FUZZY_MATCHES, camelcase))
 	{
-	    items[match_count].idx = match_count;
-	    items[match_count].item = li;
-	    items[match_count].score = score;
-
-	    // Copy the list of matching positions in itemstr to a list, if
-	    // 'retmatchpos' is set.
-	    if (retmatchpos)
+	    if (item_count < len)
+		fi = &items[item_count++];
+	    else if (score > items[0].score)
 	    {
-		int	j = 0;
-		char_u	*p;
+		// The heap is full and this match is better than the worst
+		// one, replace it.  With the same score the earlier match
+		// is kept.
+		fi = &items[0];
+		if (fi->lmatchpos != NULL)
+		    list_free(fi->lmatchpos);
+		fi->lmatchpos = NULL;
+	    }
+	    else
+		fi = NULL;
 
-		items[match_count].lmatchpos = list_alloc();
-		if (items[match_count].lmatchpos == NULL)
-		    goto done;
+	    if (fi != NULL)
+	    {
+		fi->idx = match_count;
+		fi->item = li;
+		fi->score = score;
 
-		p = str;
-		while (*p != NUL)
+		// Copy the list of matching positions in itemstr to a list, if
+		// 'retmatchpos' is set.
+		if (retmatchpos)
 		{
-		    if (!VIM_ISWHITE(PTR2CHAR(p)) || matchseq)
+		    int		j = 0;
+		    char_u	*p;
+
+		    fi->lmatchpos = list_alloc();
+		    if (fi->lmatchpos == NULL)
+			goto done;
+
+		    p = str;
+		    while (*p != NUL)
 		    {
-			if (list_append_number(items[match_count].lmatchpos,
-				    matches[j]) == FAIL)
-			    goto done;
-			j++;
+			if (!VIM_ISWHITE(PTR2CHAR(p)) || matchseq)
+			{
+			    if (list_append_number(fi->lmatchpos,
+							 matches[j]) == FAIL)
+				goto done;
+			    j++;
+			}
+			if (has_mbyte)
+			    MB_PTR_ADV(p);
+			else
+			    ++p;
 		    }
-		    if (has_mbyte)
-			MB_PTR_ADV(p);
+		}
+
+		if (max_best > 0)
+		{
+		    if (fi == &items[0])
+			fuzzy_heap_sift_down(items, item_count, 0);
 		    else
-			++p;
+			fuzzy_heap_sift_up(items, item_count - 1);
 		}
 	    }
 	    ++match_count;
@@ -4880,12 +5561,12 @@ fuzzy_match_in_list(
 	clear_tv(&rettv);
     }
 
-    if (match_count > 0)
+    if (item_count > 0)
     {
 	list_T		*retlist;
 
 	// Sort the list by the descending order of the match score
-	qsort((void *)items, (size_t)match_count, sizeof(fuzzyItem_T),
+	qsort((void *)items, (size_t)item_count, sizeof(fuzzyItem_T),
 		fuzzy_match_item_compare);
 
 	// For matchfuzzy(), return a list of matched strings.
@@ -4906,7 +5587,7 @@ fuzzy_match_in_list(
 	    retlist = fmatchlist;
 
 	// Copy the matching strings with a valid score to the return list
-	for (i = 0; i < match_count; i++)
+	for (i = 0; i < item_count; i++)
 	{
 	    if (items[i].score == SCORE_NONE)
 		break;
@@ -4921,7 +5602,7 @@ fuzzy_match_in_list(
 		goto done;
 	    retlist = li->li_tv.vval.v_list;
 
-	    for (i = 0; i < match_count; i++)
+	    for (i = 0; i < item_count; i++)
 	    {
 		if (items[i].score == SCORE_NONE)
 		    break;
@@ -4935,7 +5616,7 @@ fuzzy_match_in_list(
 	    if (li == NULL || li->li_tv.vval.v_list == NULL)
 		goto done;
 	    retlist = li->li_tv.vval.v_list;
-	    for (i = 0; i < match_count; i++)
+	    for (i = 0; i < item_count; i++)
 	    {
 		if (items[i].score == SCORE_NONE)
 		    break;
@@ -4961,6 +5642,7 @@ do_fuzzymatch(typval_T *argvars, typval_T *rettv, int retmatchpos)
     int		ret;
     int		matchseq = FALSE;
     long	max_matches = 0;
+    long	max_best = 0;
     int		camelcase = TRUE;
 
     if (in_vim9script()
@@ -5028,6 +5710,16 @@ do_fuzzymatch(typval_T *argvars, typval_T *rettv, int retmatchpos)
 	    max_matches = (long)tv_get_number_chk(&di->di_tv, NULL);
 	}
 
+	if ((di = dict_find(d, (char_u *)"best", -1)) != NULL)
+	{
+	    if (di->di_tv.v_type != VAR_NUMBER)
+	    {
+		semsg(_(e_invalid_value_for_argument_str), "best");
+		return;
+	    }
+	    max_best = (long)tv_get_number_chk(&di->di_tv, NULL);
+	}
+
 	if ((di = dict_find(d, (char_u *)"camelcase", -1)) != NULL)
 	{
 	    if (di->di_tv.v_type != VAR_BOOL)
@@ -5082,7 +5774,7 @@ do_fuzzymatch(typval_T *argvars, typval_T *rettv, int retmatchpos)
 
     fuzzy_match_in_list(argvars[0].vval.v_list, tv_get_string(&argvars[1]),
 	    matchseq, key, &cb, retmatchpos, rettv->vval.v_list, max_matches,
-	    camelcase);
+	    max_best, camelcase);
 
 done:
     free_callback(&cb);
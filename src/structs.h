@@ -1743,6 +1743,9 @@ struct listvar_S
 	    listitem_T	*lv_last;	// last item, NULL if none
 	    listitem_T	*lv_idx_item;	// when not NULL item at index "lv_idx"
 	    int		lv_idx;		// cached index of an item
+	    listitem_T	**lv_items;	// when not NULL pointers to the first
+					// "lv_items_len" items, for indexing
+	    int		lv_items_len;
 	} mat;
     } lv_u;
     type_T	*lv_type;	// current type, allocated by alloc_type()
@@ -2559,7 +2562,8 @@ typedef enum {
     JIO_NULL,
     JIO_FILE,
     JIO_BUFFER,
-    JIO_OUT
+    JIO_OUT,
+    JIO_QUICKFIX
 } job_io_T;
 
 #define CH_PART_FD(part)	ch_part[part].ch_fd
@@ -2629,6 +2633,7 @@ typedef struct {
     int		ch_buf_append;	// write appended lines instead top-bot
     linenr_T	ch_buf_top;	// next line to send
     linenr_T	ch_buf_bot;	// last line to send
+    int_u	ch_qfid;	// ID of quickfix list to add lines to
 } chanpart_T;
 
 struct channel_S {
@@ -2733,6 +2738,8 @@ struct channel_S {
 #define JO2_BUFNR	    0x20000	// "bufnr"
 #define JO2_TERM_API	    0x40000	// "term_api"
 #define JO2_TERM_HIGHLIGHT  0x80000	// "highlight"
+#define JO2_OUT_QFID	    0x100000	// "out_qfid"
+#define JO2_ERR_QFID	    0x200000	// "err_qfid" (JO2_OUT_QFID << 1)
 
 #define JO_MODE_ALL	(JO_MODE + JO_IN_MODE + JO_OUT_MODE + JO_ERR_MODE)
 #define JO_CB_ALL \
@@ -2760,6 +2767,7 @@ typedef struct
     int		jo_pty;
     int		jo_modifiable[4];
     int		jo_message[4];
+    int		jo_io_qfid[4];
     channel_T	*jo_channel;
 
     linenr_T	jo_in_top;
@@ -2880,6 +2888,8 @@ typedef struct
 #endif
 
 typedef struct qf_info_S qf_info_T;
+typedef struct searchindex_S searchindex_T;
+typedef struct complindex_S complindex_T;
 
 #ifdef FEAT_PROFILE
 /*
@@ -2890,6 +2900,7 @@ typedef struct {
     proftime_T	slowest;	// time of slowest call
     long	count;		// nr of times used
     long	match;		// nr of times matched
+    long	skipped;	// nr of times skipped without trying
 } syn_time_T;
 #endif
 
@@ -2900,6 +2911,9 @@ struct timer_S
 #ifdef FEAT_TIMERS
     timer_T	*tr_next;
     timer_T	*tr_prev;
+    int		tr_heap_idx;	    // index in the timer heap, -1 if not in it
+    int_u	tr_pass;	    // check_due_timer() pass it was created or
+				    // last fired in
     proftime_T	tr_due;		    // when the callback is to be invoked
     char	tr_firing;	    // when TRUE callback is being called
     char	tr_paused;	    // when TRUE callback is not invoked
@@ -3022,6 +3036,9 @@ typedef struct {
      * b_sst_freecount	number of free entries in b_sst_array[]
      * b_sst_check_lnum	entries after this lnum need to be checked for
      *			validity (MAXLNUM means no check needed)
+     * b_sst_idle_lnum	line up to where syntax_idle() computed the state
+     * b_sst_idle_end	line up to where syntax_idle() got before a change
+     *			made it go back to b_sst_idle_lnum
      */
     synstate_T	*b_sst_array;
     int		b_sst_len;
@@ -3030,6 +3047,8 @@ typedef struct {
     int		b_sst_freecount;
     linenr_T	b_sst_check_lnum;
     short_u	b_sst_lasttick;	// last display tick
+    linenr_T	b_sst_idle_lnum;
+    linenr_T	b_sst_idle_end;
 #endif // FEAT_SYN_HL
 
 #ifdef FEAT_SPELL
@@ -3163,6 +3182,10 @@ struct file_buffer
     int		b_changelistlen;	// number of active entries
     int		b_new_change;		// set by u_savecommon()
 
+    searchindex_T *b_search_index;	// matches of the last search pattern,
+					// used for the search count
+    complindex_T *b_compl_index;	// keywords for insert mode completion
+
     /*
      * Character table, only used in charset.c for 'iskeyword'
      * 32 bytes of 8 bits: 1 bit per character 0-255.
@@ -3213,6 +3236,7 @@ struct file_buffer
     long	b_u_seq_cur;	// uh_seq of header below which we are now
     time_T	b_u_time_cur;	// uh_time of header below which we are now
     long	b_u_save_nr_cur; // file write nr after which we are now
+    long_u	b_u_mem;	// bytes used by the undo headers and entries
 
     /*
      * variables for "U" command in undo.c
@@ -3467,6 +3491,13 @@ struct file_buffer
     hashtab_T	*b_proptypes;	// text property types local to buffer
     proptype_T	**b_proparray;	// entries of b_proptypes sorted on tp_id
     garray_T	b_textprop_text; // stores text for props, index by (-id - 1)
+    garray_T	b_prop_lines;	// numbers of lines that may have text
+				// properties, when b_prop_lines_valid is set
+    int		b_prop_lines_valid;	// b_prop_lines can be used
+    int		b_prop_lines_sorted;	// b_prop_lines is sorted
+    linenr_T	b_prop_lines_steps;	// lines visited without b_prop_lines
+    long	b_prop_lines_moved;	// entries moved since b_prop_lines was
+					// built
 #endif
 
 #if defined(FEAT_BEVAL) && defined(FEAT_EVAL)
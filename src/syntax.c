@@ -61,6 +61,8 @@ typedef struct syn_pattern
     struct sp_syn sp_syn;		// struct passed to in_id_list()
     char_u	*sp_pattern;		// regexp to match, pattern
     regprog_T	*sp_prog;		// regexp to match, program
+    int		 sp_firstbytes_set;	// sp_firstbytes is valid
+    char_u	 sp_firstbytes[32];	// bytes a match can start with
 #ifdef FEAT_PROFILE
     syn_time_T	 sp_time;
 #endif
@@ -274,6 +276,9 @@ static garray_T current_state		// current stack of state_items
 static short	*current_next_list = NULL; // when non-zero, nextgroup list
 static int	current_next_flags = 0; // flags for current_next_list
 static int	current_line_id = 0;	// unique number for current line
+static int	current_line_bytes_id = -1; // current_line_id for
+					    // current_line_bytes[]
+static char_u	current_line_bytes[32];	// bytes used in current line
 
 #define CUR_STATE(idx)	((stateitem_T *)(current_state.ga_data))[idx]
 
@@ -292,6 +297,7 @@ static int syn_stack_equal(synstate_T *sp);
 static void validate_current_state(void);
 static int syn_finish_line(int syncing);
 static int syn_current_attr(int syncing, int displaying, int *can_spell, int keep_state);
+static int syn_may_match_line(synpat_T *spp);
 static int did_match_already(int idx, garray_T *gap);
 static stateitem_T *push_next_match(stateitem_T *cur_si);
 static void check_state_ends(void);
@@ -528,6 +534,134 @@ syntax_start(win_T *wp, linenr_T lnum)
     syn_start_line();
 }
 
+#if defined(FEAT_TIMERS) || defined(PROTO)
+/*
+ * Number of lines syntax_idle() parses at a time, about a screenful.
+ */
+# define SYN_IDLE_LINES 100
+
+static int syn_idle_busy = FALSE;
+
+/*
+ * Return TRUE if syntax_idle() has work to do for window "wp".
+ */
+    static int
+syn_idle_needed(win_T *wp)
+{
+    return syntax_present(wp)
+	    && !wp->w_s->b_syn_error
+# ifdef FEAT_RELTIME
+	    && !wp->w_s->b_syn_slow
+# endif
+	    // changes not applied to the state stack yet
+	    && !wp->w_buffer->b_mod_set
+	    && wp->w_s->b_sst_idle_lnum < wp->w_buffer->b_ml.ml_line_count;
+}
+
+/*
+ * Return TRUE if 'synidletime' is set and syntax_idle() has work to do.
+ */
+    int
+syntax_idle_pending(void)
+{
+    win_T	*wp;
+
+    if (p_sit <= 0 || syn_idle_busy || updating_screen || got_int)
+	return FALSE;
+    FOR_ALL_WINDOWS(wp)
+	if (syn_idle_needed(wp))
+	    return TRUE;
+    return FALSE;
+}
+
+/*
+ * After the state up to "b_sst_idle_lnum" was computed: When all the saved
+ * states up to "b_sst_idle_end" are valid, the previous computation of these
+ * is still good and the work can continue after them.
+ */
+    static void
+syn_idle_skip(synblock_T *block)
+{
+    synstate_T	*p;
+    int		found = FALSE;
+
+    if (block->b_sst_idle_end <= block->b_sst_idle_lnum)
+    {
+	block->b_sst_idle_end = block->b_sst_idle_lnum;
+	return;
+    }
+    FOR_ALL_SYNSTATES(block, p)
+    {
+	if (p->sst_lnum <= block->b_sst_idle_lnum)
+	    continue;
+	if (p->sst_lnum > block->b_sst_idle_end)
+	    break;
+	if (p->sst_change_lnum != 0)
+	    return;
+	found = TRUE;
+    }
+    if (found)
+	block->b_sst_idle_lnum = block->b_sst_idle_end;
+}
+
+/*
+ * Compute the syntax state for the windows in the current tab page, as if
+ * they were scrolled through from start to end, so that the state is
+ * available when jumping around later.  Called while waiting for the user
+ * to type something.  Works for about 'synidletime' msec, continuing where
+ * it stopped the next time.
+ */
+    void
+syntax_idle(void)
+{
+    win_T	*wp;
+    linenr_T	lnum;
+    int		save_did_emsg;
+    proftime_T	tm;
+
+    if (syn_idle_busy || p_sit <= 0)
+	return;
+    syn_idle_busy = TRUE;
+    profile_setlimit(p_sit, &tm);
+
+    FOR_ALL_WINDOWS(wp)
+    {
+	if (!syn_idle_needed(wp))
+	    continue;
+
+	save_did_emsg = did_emsg;
+	did_emsg = FALSE;
+	while (!profile_passed_limit(&tm))
+	{
+	    lnum = wp->w_s->b_sst_idle_lnum + SYN_IDLE_LINES;
+	    if (lnum > wp->w_buffer->b_ml.ml_line_count)
+		lnum = wp->w_buffer->b_ml.ml_line_count;
+	    syntax_start(wp, lnum);
+	    if (did_emsg)
+	    {
+		// Stop syntax highlighting, like when redrawing.
+		wp->w_s->b_syn_error = TRUE;
+		break;
+	    }
+	    if (got_int)
+		break;
+	    wp->w_s->b_sst_idle_lnum = lnum;
+	    syn_idle_skip(wp->w_s);
+	    if (wp->w_s->b_sst_idle_lnum >= wp->w_buffer->b_ml.ml_line_count)
+		break;
+	}
+	did_emsg |= save_did_emsg;
+	if (got_int || profile_passed_limit(&tm))
+	    break;
+    }
+
+    // The current state is not what the next caller expects.
+    invalidate_current_state();
+    current_lnum = 0;
+    syn_idle_busy = FALSE;
+}
+#endif
+
 /*
  * We cannot simply discard growarrays full of state_items or buf_states; we
  * have to manually release their extmatch pointers first.
@@ -1027,6 +1161,8 @@ syn_stack_free_block(synblock_T *block)
 {
     synstate_T	*p;
 
+    block->b_sst_idle_lnum = 0;
+    block->b_sst_idle_end = 0;
     if (block->b_sst_array == NULL)
 	return;
 
@@ -1164,6 +1300,18 @@ syn_stack_apply_changes_block(synblock_T *block, buf_T *buf)
     synstate_T	*p, *prev, *np;
     linenr_T	n;
 
+    // The states syntax_idle() computed from the change onwards need to be
+    // checked again.  "b_sst_idle_end" is kept to skip over the ones that
+    // turn out not to have changed.
+    if (block->b_sst_idle_end > buf->b_mod_top)
+    {
+	block->b_sst_idle_end += buf->b_mod_xlines;
+	if (block->b_sst_idle_end < buf->b_mod_top)
+	    block->b_sst_idle_end = buf->b_mod_top;
+    }
+    if (block->b_sst_idle_lnum > buf->b_mod_top)
+	block->b_sst_idle_lnum = buf->b_mod_top;
+
     prev = NULL;
     for (p = block->b_sst_first; p != NULL; )
     {
@@ -1955,6 +2103,18 @@ syn_current_attr(
 				continue;
 			    spp->sp_line_id = current_line_id;
 
+			    // Skip the pattern if the line doesn't contain a
+			    // byte a match can start with.
+			    if (!syn_may_match_line(spp))
+			    {
+				spp->sp_startcol = MAXCOL;
+#ifdef FEAT_PROFILE
+				if (syn_time_on)
+				    ++spp->sp_time.skipped;
+#endif
+				continue;
+			    }
+
 			    lc_col = current_col - spp->sp_offsets[SPO_LC_OFF];
 			    if (lc_col < 0)
 				lc_col = 0;
@@ -2316,6 +2476,31 @@ syn_current_attr(
 }
 
 
+/*
+ * Return TRUE if pattern "spp" may match in the current line: the line
+ * contains a byte a match can start with, or this is unknown.
+ */
+    static int
+syn_may_match_line(synpat_T *spp)
+{
+    char_u	*p;
+    int		i;
+
+    if (!spp->sp_firstbytes_set)
+	return TRUE;
+    if (current_line_bytes_id != current_line_id)
+    {
+	vim_memset(current_line_bytes, 0, sizeof(current_line_bytes));
+	for (p = syn_getcurline(); *p != NUL; ++p)
+	    current_line_bytes[*p >> 3] |= 1 << (*p & 7);
+	current_line_bytes_id = current_line_id;
+    }
+    for (i = 0; i < 32; ++i)
+	if (spp->sp_firstbytes[i] & current_line_bytes[i])
+	    return TRUE;
+    return FALSE;
+}
+
 /*
  * Check if we already matched pattern "idx" at the current column.
  */
@@ -5657,6 +5842,8 @@ get_syn_pattern(char_u *arg, synpat_T *ci)
     if (ci->sp_prog == NULL)
 	return NULL;
     ci->sp_ic = curwin->w_s->b_syn_ic;
+    ci->sp_firstbytes_set = vim_regfirstbytes(ci->sp_prog, ci->sp_ic,
+						   ci->sp_firstbytes) == OK;
 #ifdef FEAT_PROFILE
     syn_clear_time(&ci->sp_time);
 #endif
@@ -6645,6 +6832,7 @@ syn_clear_time(syn_time_T *st)
     profile_zero(&st->slowest);
     st->count = 0;
     st->match = 0;
+    st->skipped = 0;
 }
 
 /*
@@ -6690,6 +6878,7 @@ typedef struct
     proftime_T	total;
     int		count;
     int		match;
+    int		skipped;
     proftime_T	slowest;
     proftime_T	average;
     int		id;
@@ -6720,6 +6909,7 @@ syntime_report(void)
     int		patlen;
     proftime_T	total_total;
     int		total_count = 0;
+    int		total_skipped = 0;
     garray_T    ga;
     time_entry_T *p;
 
@@ -6734,7 +6924,7 @@ syntime_report(void)
     for (idx = 0; idx < curwin->w_s->b_syn_patterns.ga_len; ++idx)
     {
 	spp = &(SYN_ITEMS(curwin->w_s)[idx]);
-	if (spp->sp_time.count > 0)
+	if (spp->sp_time.count > 0 || spp->sp_time.skipped > 0)
 	{
 	    (void)ga_grow(&ga, 1);
 	    p = ((time_entry_T *)ga.ga_data) + ga.ga_len;
@@ -6742,7 +6932,9 @@ syntime_report(void)
 	    profile_add(&total_total, &spp->sp_time.total);
 	    p->count = spp->sp_time.count;
 	    p->match = spp->sp_time.match;
+	    p->skipped = spp->sp_time.skipped;
 	    total_count += spp->sp_time.count;
+	    total_skipped += spp->sp_time.skipped;
 	    p->slowest = spp->sp_time.slowest;
 # if defined(FEAT_RELTIME)
 	    profile_divide(&spp->sp_time.total, spp->sp_time.count, &tm);
@@ -6760,7 +6952,7 @@ syntime_report(void)
 	qsort(ga.ga_data, (size_t)ga.ga_len, sizeof(time_entry_T),
 							 syn_compare_syntime);
 
-    msg_puts_title(_("  TOTAL      COUNT  MATCH   SLOWEST     AVERAGE   NAME               PATTERN"));
+    msg_puts_title(_("  TOTAL      COUNT  MATCH SKIPPED   SLOWEST     AVERAGE   NAME               PATTERN"));
     msg_puts("\n");
     for (idx = 0; idx < ga.ga_len && !got_int; ++idx)
     {
@@ -6775,20 +6967,23 @@ syntime_report(void)
 	msg_outnum(p->match);
 	msg_puts(" ");
 	msg_advance(26);
+	msg_outnum(p->skipped);
+	msg_puts(" ");
+	msg_advance(34);
 	msg_puts(profile_msg(&p->slowest));
 	msg_puts(" ");
-	msg_advance(38);
+	msg_advance(46);
 	msg_puts(profile_msg(&p->average));
 	msg_puts(" ");
-	msg_advance(50);
+	msg_advance(58);
 	msg_outtrans(highlight_group_name(p->id - 1));
 	msg_puts(" ");
 
-	msg_advance(69);
-	if (Columns < 80)
+	msg_advance(77);
+	if (Columns < 88)
 	    len = 20; // will wrap anyway
 	else
-	    len = Columns - 70;
+	    len = Columns - 78;
 	patlen = (int)STRLEN(p->pattern);
 	if (len > patlen)
 	    len = patlen;
@@ -6800,8 +6995,12 @@ syntime_report(void)
     {
 	msg_puts("\n");
 	msg_puts(profile_msg(&total_total));
+	msg_puts(" ");
 	msg_advance(13);
 	msg_outnum(total_count);
+	msg_puts(" ");
+	msg_advance(26);
+	msg_outnum(total_skipped);
 	msg_puts("\n");
     }
 }
@@ -57,9 +57,47 @@ typedef enum
     TS_LINEAR,		// linear searching forward, till EOF
     TS_BINARY,		// binary searching
     TS_SKIP_BACK,	// skipping backwards
-    TS_STEP_FORWARD	// stepping forwards
+    TS_STEP_FORWARD,	// stepping forwards
+    TS_INDEX		// reading lines found with the index
 } tagsearch_state_T;	// Current search state
 
+/*
+ * Entry in the index of a tags file.
+ */
+typedef struct
+{
+    off_T	te_offset;	// offset of the line in the tags file
+    long	te_name;	// offset of the tag name in ti_names
+} tagentry_T;
+
+/*
+ * Index of a tags file, used instead of reading the whole file when a linear
+ * search is needed.  It holds the name and offset of every tag line in file
+ * order, and the same entries sorted on the name with case folded, like
+ * "sort -f" does.  Kept until the tags file changes or more than
+ * TAGINDEX_MAX other tags files were searched since it was used.
+ */
+typedef struct tagindex_S tagindex_T;
+struct tagindex_S
+{
+    tagindex_T	*ti_next;
+    char_u	*ti_fname;	// full name of the tags file
+    off_T	ti_size;	// size of the file
+    time_t	ti_mtime;	// modification time of the file
+#ifdef ST_MTIM_NSEC
+    long	ti_mtime_ns;
+#endif
+    garray_T	ti_names;	// tag names, each followed by a NUL
+    garray_T	ti_entries;	// tagentry_T for each tag line
+    int		*ti_sorted;	// indexes in ti_entries sorted on the name
+    garray_T	ti_mbyte;	// indexes of names with non-ASCII bytes
+};
+
+static tagindex_T *first_tagindex = NULL;  // most recently used first
+
+// Maximum number of tags file indexes kept.
+#define TAGINDEX_MAX 10
+
 /*
  * Binary search file offsets in a tags file
  */
@@ -1482,7 +1520,7 @@ find_tagfunc_tags(
     result = call_callback(&curbuf->b_tfu_cb, 0, &rettv, 3, args);
     curwin->w_cursor = save_pos;	// restore the cursor position
     check_cursor();			// make sure cursor position is valid
-    --d->dv_refcount;
+    dict_unref(d);
 
     if (result == FAIL)
 	return FAIL;
@@ -1690,8 +1728,17 @@ typedef struct
     int		match_count;		// number of matches found
     garray_T	ga_match[MT_COUNT];	// stores matches in sequence
     hashtab_T	ht_match[MT_COUNT];	// stores matches by key
+    tagindex_T	*tagindex;		// index used in TS_INDEX state
+    int		*index_cand;		// entries that may match, in file
+					// order; NULL for all entries
+    int		index_count;		// number of entries to try
+    int		index_next;		// next entry to try
+    int		index_cur;		// entry read into "lbuf"
 } findtags_state_T;
 
+static void findtags_matchargs_init(findtags_match_args_T *margs, int flags);
+static int findtags_match_tag(findtags_state_T *st, tagptrs_T *tagpp, findtags_match_args_T *margs);
+
 /*
  * Initialize the state used by find_tags().
  * Returns OK on success and FAIL on memory allocation failure.
@@ -1730,6 +1777,8 @@ findtags_state_init(
 #endif
     st->match_count = 0;
     st->stop_searching = FALSE;
+    st->tagindex = NULL;
+    st->index_cand = NULL;
 
     for (mtt = 0; mtt < MT_COUNT; ++mtt)
     {
@@ -2034,6 +2083,427 @@ etag_fail:
 }
 #endif
 
+/*
+ * Free the tags file index "ti".
+ */
+    static void
+tagindex_free(tagindex_T *ti)
+{
+    vim_free(ti->ti_fname);
+    ga_clear(&ti->ti_names);
+    ga_clear(&ti->ti_entries);
+    vim_free(ti->ti_sorted);
+    ga_clear(&ti->ti_mbyte);
+    vim_free(ti);
+}
+
+/*
+ * Remove "ti" from the list of tags file indexes and free it.
+ */
+    static void
+tagindex_drop(tagindex_T *ti)
+{
+    tagindex_T	**tip;
+
+    for (tip = &first_tagindex; *tip != NULL; tip = &(*tip)->ti_next)
+	if (*tip == ti)
+	{
+	    *tip = ti->ti_next;
+	    tagindex_free(ti);
+	    break;
+	}
+}
+
+// Index being sorted by tagindex_compare().
+static tagindex_T *sort_tagindex;
+
+/*
+ * Function passed to qsort() to sort tags file index entries on the tag
+ * name, ignoring case the way a case-folded tags file is sorted.
+ */
+    static int
+tagindex_compare(const void *s1, const void *s2)
+{
+    int		idx1 = *(int *)s1;
+    int		idx2 = *(int *)s2;
+    tagentry_T	*entries = (tagentry_T *)sort_tagindex->ti_entries.ga_data;
+    char_u	*names = (char_u *)sort_tagindex->ti_names.ga_data;
+    int		res;
+
+    res = tag_strnicmp(names + entries[idx1].te_name,
+				names + entries[idx2].te_name, (size_t)MAXCOL);
+    if (res == 0)
+	res = idx1 - idx2;
+    return res;
+}
+
+/*
+ * Function passed to qsort() to sort int values.
+ */
+    static int
+tagindex_int_compare(const void *s1, const void *s2)
+{
+    return *(int *)s1 - *(int *)s2;
+}
+
+/*
+ * Read all the lines of the tags file "fp" and build an index for it.
+ * Returns NULL when the file can't be indexed, e.g. because it is an Emacs
+ * tags file, or when out of memory.
+ */
+    static tagindex_T *
+tagindex_build(FILE *fp)
+{
+    tagindex_T	*ti;
+    char_u	*lbuf;
+    int		lbuf_size = LSIZE;
+    int		in_header = TRUE;
+    int		i;
+
+    ti = ALLOC_CLEAR_ONE(tagindex_T);
+    if (ti == NULL)
+	return NULL;
+    ga_init2(&ti->ti_names, 1, 10000);
+    ga_init2(&ti->ti_entries, sizeof(tagentry_T), 1000);
+    ga_init2(&ti->ti_mbyte, sizeof(int), 100);
+    lbuf = alloc(lbuf_size);
+    if (lbuf == NULL)
+	goto fail;
+
+    vim_ignored = vim_fseek(fp, 0L, SEEK_SET);
+    for (;;)
+    {
+	off_T	    offset = vim_ftell(fp);
+	char_u	    *p;
+	int	    len;
+	tagentry_T  *te;
+
+	if (vim_fgets(lbuf, lbuf_size, fp))
+	    break;
+	if (vim_isblankline(lbuf))
+	    continue;
+	if (*lbuf == Ctrl_L)
+	    goto fail;		// Emacs tags file
+	if (in_header)
+	{
+	    // Same check as in findtags_start_state_handler().
+	    if (STRNCMP(lbuf, "!_TAG_", 6) <= 0
+			     || (lbuf[0] == '!' && ASCII_ISLOWER(lbuf[1])))
+		continue;
+	    in_header = FALSE;
+	}
+
+	p = vim_strchr(lbuf, TAB);
+	if (p == NULL)
+	{
+	    if (lbuf[lbuf_size - 2] == NUL)
+		goto fail;	// format error, reported when searching
+	    // The name does not fit, read the line again with a bigger buffer.
+	    lbuf_size *= 2;
+	    vim_free(lbuf);
+	    lbuf = alloc(lbuf_size);
+	    if (lbuf == NULL)
+		goto fail;
+	    vim_ignored = vim_fseek(fp, offset, SEEK_SET);
+	    continue;
+	}
+
+	len = (int)(p - lbuf);
+	if (ga_grow(&ti->ti_names, len + 1) == FAIL
+		|| ga_grow(&ti->ti_entries, 1) == FAIL)
+	    goto fail;
+	for (i = 0; i < len; ++i)
+	    if (lbuf[i] >= 0x80)
+	    {
+		if (ga_grow(&ti->ti_mbyte, 1) == FAIL)
+		    goto fail;
+		((int *)ti->ti_mbyte.ga_data)[ti->ti_mbyte.ga_len++] =
+						      ti->ti_entries.ga_len;
+		break;
+	    }
+	te = (tagentry_T *)ti->ti_entries.ga_data + ti->ti_entries.ga_len++;
+	te->te_offset = offset;
+	te->te_name = ti->ti_names.ga_len;
+	mch_memmove((char_u *)ti->ti_names.ga_data + ti->ti_names.ga_len,
+								  lbuf, len);
+	ti->ti_names.ga_len += len;
+	((char_u *)ti->ti_names.ga_data)[ti->ti_names.ga_len++] = NUL;
+    }
+    VIM_CLEAR(lbuf);
+
+    if (ti->ti_entries.ga_len > 0)
+    {
+	ti->ti_sorted = ALLOC_MULT(int, ti->ti_entries.ga_len);
+	if (ti->ti_sorted == NULL)
+	    goto fail;
+	for (i = 0; i < ti->ti_entries.ga_len; ++i)
+	    ti->ti_sorted[i] = i;
+	sort_tagindex = ti;
+	qsort((void *)ti->ti_sorted, (size_t)ti->ti_entries.ga_len,
+					     sizeof(int), tagindex_compare);
+    }
+    return ti;
+
+fail:
+    vim_free(lbuf);
+    tagindex_free(ti);
+    return NULL;
+}
+
+/*
+ * Get the index for the tags file "fname", which is open as "fp".  Builds it
+ * when there is none yet or the file was changed.  The file position is
+ * kept.
+ * Returns NULL when there is no index.
+ */
+    static tagindex_T *
+tagindex_get(char_u *fname, FILE *fp)
+{
+    stat_T	st;
+    char_u	*full_fname;
+    tagindex_T	*ti;
+    tagindex_T	*prev = NULL;
+    off_T	pos;
+    int		count;
+
+    if (mch_stat((char *)fname, &st) < 0)
+	return NULL;
+    full_fname = FullName_save(fname, FALSE);
+    if (full_fname == NULL)
+	return NULL;
+
+    for (ti = first_tagindex; ti != NULL; prev = ti, ti = ti->ti_next)
+	if (fnamecmp(full_fname, ti->ti_fname) == 0)
+	{
+	    if (ti->ti_size == (off_T)st.st_size
+		    && ti->ti_mtime == st.st_mtime
+#ifdef ST_MTIM_NSEC
+		    && ti->ti_mtime_ns == (long)st.ST_MTIM_NSEC
+#endif
+		    )
+	    {
+		vim_free(full_fname);
+		if (prev != NULL)
+		{
+		    // Move it to the front, it is the most recently used.
+		    prev->ti_next = ti->ti_next;
+		    ti->ti_next = first_tagindex;
+		    first_tagindex = ti;
+		}
+		return ti;
+	    }
+	    // The file was changed, build a new index.
+	    tagindex_drop(ti);
+	    break;
+	}
+
+    pos = vim_ftell(fp);
+    ti = tagindex_build(fp);
+    vim_ignored = vim_fseek(fp, pos, SEEK_SET);
+    if (ti == NULL)
+    {
+	vim_free(full_fname);
+	return NULL;
+    }
+    ti->ti_fname = full_fname;
+    ti->ti_size = (off_T)st.st_size;
+    ti->ti_mtime = st.st_mtime;
+#ifdef ST_MTIM_NSEC
+    ti->ti_mtime_ns = (long)st.ST_MTIM_NSEC;
+#endif
+    ti->ti_next = first_tagindex;
+    first_tagindex = ti;
+
+    // When there are too many drop the index that was used least recently.
+    count = 1;
+    for (prev = ti; prev->ti_next != NULL; prev = prev->ti_next)
+	if (++count > TAGINDEX_MAX)
+	{
+	    tagindex_drop(prev->ti_next);
+	    break;
+	}
+    return ti;
+}
+
+#if defined(FEAT_EVAL) || defined(PROTO)
+/*
+ * Return the number of kept tags file indexes, for testing.
+ */
+    int
+tagindex_count(void)
+{
+    tagindex_T	*ti;
+    int		count = 0;
+
+    for (ti = first_tagindex; ti != NULL; ti = ti->ti_next)
+	++count;
+    return count;
+}
+#endif
+
+/*
+ * Start using the index of the tags file instead of reading all its lines,
+ * when a linear search is to be done.
+ * Returns FAIL when the index can't be used.
+ */
+    static int
+findtags_index_start(findtags_state_T *st)
+{
+    tagindex_T	*ti;
+    int		headlen;
+
+    if (st->fp == NULL || st->vimconv.vc_type != CONV_NONE
+#ifdef FEAT_CSCOPE
+	    || (st->flags & TAG_CSCOPE)
+#endif
+#ifdef FEAT_EMACS_TAGS
+	    || st->is_etag
+#endif
+	    )
+	return FAIL;
+
+    ti = tagindex_get(st->tag_fname, st->fp);
+    if (ti == NULL)
+	return FAIL;
+
+    VIM_CLEAR(st->index_cand);
+    st->index_count = ti->ti_entries.ga_len;
+
+    // Only tags starting with the pattern head can match.  The index is
+    // sorted with ASCII case folded, use the ASCII part of the head.
+    headlen = 0;
+    while (headlen < st->orgpat->headlen && st->orgpat->head[headlen] < 0x80)
+	++headlen;
+    if (headlen > 0 && st->index_count > 0)
+    {
+	tagentry_T  *entries = (tagentry_T *)ti->ti_entries.ga_data;
+	char_u	    *names = (char_u *)ti->ti_names.ga_data;
+	int	    lo, hi, first;
+	int	    extra = 0;
+
+	// Find the range of matching names with a binary search.
+	lo = 0;
+	hi = st->index_count;
+	while (lo < hi)
+	{
+	    int mid = lo + (hi - lo) / 2;
+
+	    if (tag_strnicmp(names + entries[ti->ti_sorted[mid]].te_name,
+				   st->orgpat->head, (size_t)headlen) < 0)
+		lo = mid + 1;
+	    else
+		hi = mid;
+	}
+	first = lo;
+	hi = st->index_count;
+	while (lo < hi)
+	{
+	    int mid = lo + (hi - lo) / 2;
+
+	    if (tag_strnicmp(names + entries[ti->ti_sorted[mid]].te_name,
+				  st->orgpat->head, (size_t)headlen) <= 0)
+		lo = mid + 1;
+	    else
+		hi = mid;
+	}
+
+	// When ignoring case a non-ASCII character in the name may match an
+	// ASCII character in the head, also try those names.
+	if (st->orgpat->regmatch.rm_ic)
+	    extra = ti->ti_mbyte.ga_len;
+
+	st->index_count = lo - first;
+	if (st->index_count + extra > 0)
+	{
+	    int	    i, j;
+
+	    st->index_cand = ALLOC_MULT(int, st->index_count + extra);
+	    if (st->index_cand == NULL)
+		return FAIL;
+	    mch_memmove(st->index_cand, ti->ti_sorted + first,
+					      st->index_count * sizeof(int));
+	    if (extra > 0)
+		mch_memmove(st->index_cand + st->index_count,
+				  ti->ti_mbyte.ga_data, extra * sizeof(int));
+
+	    // Matches are found in file order, like without the index.
+	    qsort((void *)st->index_cand, (size_t)(st->index_count + extra),
+					   sizeof(int), tagindex_int_compare);
+	    for (i = 1, j = 1; i < st->index_count + extra; ++i)
+		if (st->index_cand[i] != st->index_cand[j - 1])
+		    st->index_cand[j++] = st->index_cand[i];
+	    st->index_count = j;
+	}
+    }
+
+    st->tagindex = ti;
+    st->index_next = 0;
+    st->state = TS_INDEX;
+    return OK;
+}
+
+/*
+ * Read the next line from the tags file in the TS_INDEX state: the next line
+ * with a tag name that matches.  Names are checked without reading the file.
+ * Returns TAGS_READ_SUCCESS, TAGS_READ_EOF or TAGS_READ_IGNORE like
+ * findtags_get_next_line().
+ */
+    static tags_read_status_T
+findtags_index_next_line(findtags_state_T *st)
+{
+    tagindex_T	*ti = st->tagindex;
+    tagentry_T	*entries = (tagentry_T *)ti->ti_entries.ga_data;
+    char_u	*names = (char_u *)ti->ti_names.ga_data;
+
+    while (st->index_next < st->index_count)
+    {
+	int			idx;
+	tagentry_T		*te;
+	tagptrs_T		tagp;
+	findtags_match_args_T	margs;
+	int			len;
+
+	if ((st->index_next & 0x3ff) == 0)
+	{
+	    fast_breakcheck();
+	    if (got_int)
+		break;
+	}
+	idx = st->index_cand == NULL ? st->index_next
+					    : st->index_cand[st->index_next];
+	te = &entries[idx];
+	++st->index_next;
+
+	CLEAR_FIELD(tagp);
+	tagp.tagname = names + te->te_name;
+	len = (int)STRLEN(tagp.tagname);
+	tagp.tagname_end = tagp.tagname + len;
+	findtags_matchargs_init(&margs, st->flags);
+	if (!findtags_match_tag(st, &tagp, &margs))
+	    continue;
+
+	st->index_cur = st->index_next - 1;
+	if (vim_fseek(st->fp, te->te_offset, SEEK_SET) != 0
+		|| vim_fgets(st->lbuf, st->lbuf_size, st->fp)
+		|| (len < st->lbuf_size - 2
+		    && (STRNCMP(st->lbuf, tagp.tagname, len) != 0
+						|| st->lbuf[len] != TAB)))
+	{
+	    // The file was changed after the index was made.  Drop the index
+	    // and start reading the file again, found matches are not added
+	    // twice.
+	    tagindex_drop(ti);
+	    st->tagindex = NULL;
+	    VIM_CLEAR(st->index_cand);
+	    st->state = TS_START;
+	    vim_ignored = vim_fseek(st->fp, 0L, SEEK_SET);
+	    return TAGS_READ_IGNORE;
+	}
+	return TAGS_READ_SUCCESS;
+    }
+    return TAGS_READ_EOF;
+}
+
 /*
  * Read the next line from a tags file.
  * Returns TAGS_READ_SUCCESS if a tags line is successfully read and should be
@@ -2048,6 +2518,9 @@ findtags_get_next_line(findtags_state_T *st, tagsearch_info_T *sinfo_p)
     int		eof;
     off_T	offset;
 
+    if (st->state == TS_INDEX)
+	return findtags_index_next_line(st);
+
     // For binary search: compute the next offset to use.
     if (st->state == TS_BINARY)
     {
@@ -2227,6 +2700,10 @@ findtags_start_state_handler(
 	st->state = TS_LINEAR;
     }
 
+    // Instead of reading all lines use the index, if possible.
+    if (st->state == TS_LINEAR && findtags_index_start(st) == OK)
+	return FALSE;
+
     // When starting a binary search, get the size of the file and
     // compute the first offset.
     if (st->state == TS_BINARY)
@@ -2302,7 +2779,8 @@ findtags_parse_line(
 	    cmplen = p_tl;
 	if ((st->flags & TAG_REGEXP) && st->orgpat->headlen < cmplen)
 	    cmplen = st->orgpat->headlen;
-	else if (st->state == TS_LINEAR && st->orgpat->headlen != cmplen)
+	else if ((st->state == TS_LINEAR || st->state == TS_INDEX)
+					  && st->orgpat->headlen != cmplen)
 	    return TAG_MATCH_NEXT;
 
 	if (st->state == TS_BINARY)
@@ -2871,6 +3349,9 @@ line_read_in:
 		// Seek to the same position to read the same line again
 		vim_ignored = vim_fseek(st->fp, search_info.curr_offset,
 								     SEEK_SET);
+	    else if (st->state == TS_INDEX)
+		// Read the same entry again.
+		st->index_next = st->index_cur;
 	    // this will try the same thing again, make sure the offset is
 	    // different
 	    search_info.curr_offset = 0;
@@ -2964,6 +3445,8 @@ findtags_in_file(findtags_state_T *st, char_u *buf_ffname)
 	fclose(st->fp);
 	st->fp = NULL;
     }
+    st->tagindex = NULL;
+    VIM_CLEAR(st->index_cand);
 #ifdef FEAT_EMACS_TAGS
     emacs_tags_incstack_free();
 #endif
@@ -3287,6 +3770,8 @@ free_tag_stuff(void)
     if (curwin != NULL)
 	do_tag(NULL, DT_FREE, 0, 0, 0);
     tag_freematch();
+    while (first_tagindex != NULL)
+	tagindex_drop(first_tagindex);
 
 # if defined(FEAT_QUICKFIX)
     tagstack_clear_entry(&ptag_entry);
@@ -69,7 +69,11 @@ TEST_VIM9_RES = \
 	test_vim9_typealias.res
 
 # Benchmark scripts.
-SCRIPTS_BENCH = test_bench_regexp.res
+SCRIPTS_BENCH = \
+	test_bench_fuzzy.res \
+	test_bench_quickfix.res \
+	test_bench_regexp.res \
+	test_bench_vim9.res
 
 # Individual tests, including the ones part of test_alot.
 # Please keep sorted up to test_alot.
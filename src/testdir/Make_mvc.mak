@@ -155,7 +155,11 @@ opt_test.vim: util/gen_opt_test.vim ../optiondefs.h ../../runtime/doc/options.tx
 	$(VIMPROG) -e -s -u NONE $(COMMON_ARGS) --nofork -S $**
 	@if exist test.log ( type test.log & exit /b 1 )
 
+test_bench_fuzzy.res: test_bench_fuzzy.vim
+test_bench_quickfix.res: test_bench_quickfix.vim
 test_bench_regexp.res: test_bench_regexp.vim
+test_bench_vim9.res: test_bench_vim9.vim
+$(SCRIPTS_BENCH):
 	-if exist benchmark.out del benchmark.out
 	@echo $(VIMPROG) > vimcmd
 	$(VIMPROG) -u NONE $(COMMON_ARGS) -S runtest.vim $*.vim
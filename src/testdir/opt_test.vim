@@ -0,0 +1,18368 @@
+" DO NOT EDIT: Generated with util/gen_opt_test.vim
+" Used by test_options_all.vim.
+
+scriptencoding utf-8
+func Test_opt_set_aleph()
+if exists('+aleph') && execute('set!') =~# '\n..aleph\([=\n]\|$\)'
+let l:saved = [&g:aleph, &l:aleph]
+endif
+if exists('+aleph')
+set aleph=-1
+set aleph=0
+set aleph=100
+setlocal aleph=-1
+setlocal aleph=0
+setlocal aleph=100
+setglobal aleph=-1
+setglobal aleph=0
+setglobal aleph=100
+set al=-1
+set al=0
+set al=100
+setlocal al=-1
+setlocal al=0
+setlocal al=100
+setglobal al=-1
+setglobal al=0
+setglobal al=100
+silent! call assert_fails('set aleph=')
+silent! call assert_fails('setlocal aleph=')
+silent! call assert_fails('setglobal aleph=')
+silent! call assert_fails('set al=')
+silent! call assert_fails('setlocal al=')
+silent! call assert_fails('setglobal al=')
+set aleph&
+set al&
+if exists('l:saved')
+let [&g:aleph, &l:aleph] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_allowrevins()
+if exists('+allowrevins') && execute('set!') =~# '\n..allowrevins\([=\n]\|$\)'
+let l:saved = [&g:allowrevins, &l:allowrevins]
+endif
+if exists('+allowrevins')
+set allowrevins
+set noallowrevins
+set invallowrevins
+set allowrevins!
+setlocal allowrevins
+setlocal noallowrevins
+setlocal invallowrevins
+setlocal allowrevins!
+setglobal allowrevins
+setglobal noallowrevins
+setglobal invallowrevins
+setglobal allowrevins!
+set ari
+set noari
+set invari
+set ari!
+setlocal ari
+setlocal noari
+setlocal invari
+setlocal ari!
+setglobal ari
+setglobal noari
+setglobal invari
+setglobal ari!
+set allowrevins&
+set ari&
+if exists('l:saved')
+let [&g:allowrevins, &l:allowrevins] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_altkeymap()
+if exists('+altkeymap') && execute('set!') =~# '\n..altkeymap\([=\n]\|$\)'
+let l:saved = [&g:altkeymap, &l:altkeymap]
+endif
+if exists('+altkeymap')
+set altkeymap
+set noaltkeymap
+set invaltkeymap
+set altkeymap!
+setlocal altkeymap
+setlocal noaltkeymap
+setlocal invaltkeymap
+setlocal altkeymap!
+setglobal altkeymap
+setglobal noaltkeymap
+setglobal invaltkeymap
+setglobal altkeymap!
+set akm
+set noakm
+set invakm
+set akm!
+setlocal akm
+setlocal noakm
+setlocal invakm
+setlocal akm!
+setglobal akm
+setglobal noakm
+setglobal invakm
+setglobal akm!
+set altkeymap&
+set akm&
+if exists('l:saved')
+let [&g:altkeymap, &l:altkeymap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ambiwidth()
+if exists('+ambiwidth') && execute('set!') =~# '\n..ambiwidth\([=\n]\|$\)'
+let l:saved = [&g:ambiwidth, &l:ambiwidth]
+endif
+if exists('+ambiwidth')
+set ambiwidth=
+set ambiwidth=single
+set ambiwidth=double
+setlocal ambiwidth=
+setlocal ambiwidth=single
+setlocal ambiwidth=double
+setglobal ambiwidth=
+setglobal ambiwidth=single
+setglobal ambiwidth=double
+set ambw=
+set ambw=single
+set ambw=double
+setlocal ambw=
+setlocal ambw=single
+setlocal ambw=double
+setglobal ambw=
+setglobal ambw=single
+setglobal ambw=double
+silent! call assert_fails('set ambiwidth=xxx')
+silent! call assert_fails('setlocal ambiwidth=xxx')
+silent! call assert_fails('setglobal ambiwidth=xxx')
+silent! call assert_fails('set ambw=xxx')
+silent! call assert_fails('setlocal ambw=xxx')
+silent! call assert_fails('setglobal ambw=xxx')
+set ambiwidth&
+set ambw&
+if exists('l:saved')
+let [&g:ambiwidth, &l:ambiwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_antialias()
+if exists('+antialias') && execute('set!') =~# '\n..antialias\([=\n]\|$\)'
+let l:saved = [&g:antialias, &l:antialias]
+endif
+if exists('+antialias')
+set antialias
+set noantialias
+set invantialias
+set antialias!
+setlocal antialias
+setlocal noantialias
+setlocal invantialias
+setlocal antialias!
+setglobal antialias
+setglobal noantialias
+setglobal invantialias
+setglobal antialias!
+set anti
+set noanti
+set invanti
+set anti!
+setlocal anti
+setlocal noanti
+setlocal invanti
+setlocal anti!
+setglobal anti
+setglobal noanti
+setglobal invanti
+setglobal anti!
+set antialias&
+set anti&
+if exists('l:saved')
+let [&g:antialias, &l:antialias] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_arabic()
+if exists('+arabic') && execute('set!') =~# '\n..arabic\([=\n]\|$\)'
+let l:saved = [&g:arabic, &l:arabic]
+endif
+if exists('+arabic')
+set arabic
+set noarabic
+set invarabic
+set arabic!
+setlocal arabic
+setlocal noarabic
+setlocal invarabic
+setlocal arabic!
+setglobal arabic
+setglobal noarabic
+setglobal invarabic
+setglobal arabic!
+set arab
+set noarab
+set invarab
+set arab!
+setlocal arab
+setlocal noarab
+setlocal invarab
+setlocal arab!
+setglobal arab
+setglobal noarab
+setglobal invarab
+setglobal arab!
+set arabic&
+set arab&
+if exists('l:saved')
+let [&g:arabic, &l:arabic] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_arabicshape()
+if exists('+arabicshape') && execute('set!') =~# '\n..arabicshape\([=\n]\|$\)'
+let l:saved = [&g:arabicshape, &l:arabicshape]
+endif
+if exists('+arabicshape')
+set arabicshape
+set noarabicshape
+set invarabicshape
+set arabicshape!
+setlocal arabicshape
+setlocal noarabicshape
+setlocal invarabicshape
+setlocal arabicshape!
+setglobal arabicshape
+setglobal noarabicshape
+setglobal invarabicshape
+setglobal arabicshape!
+set arshape
+set noarshape
+set invarshape
+set arshape!
+setlocal arshape
+setlocal noarshape
+setlocal invarshape
+setlocal arshape!
+setglobal arshape
+setglobal noarshape
+setglobal invarshape
+setglobal arshape!
+set arabicshape&
+set arshape&
+if exists('l:saved')
+let [&g:arabicshape, &l:arabicshape] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_autochdir()
+if exists('+autochdir') && execute('set!') =~# '\n..autochdir\([=\n]\|$\)'
+let l:saved = [&g:autochdir, &l:autochdir]
+endif
+if exists('+autochdir')
+set autochdir
+set noautochdir
+set invautochdir
+set autochdir!
+setlocal autochdir
+setlocal noautochdir
+setlocal invautochdir
+setlocal autochdir!
+setglobal autochdir
+setglobal noautochdir
+setglobal invautochdir
+setglobal autochdir!
+set acd
+set noacd
+set invacd
+set acd!
+setlocal acd
+setlocal noacd
+setlocal invacd
+setlocal acd!
+setglobal acd
+setglobal noacd
+setglobal invacd
+setglobal acd!
+set autochdir&
+set acd&
+if exists('l:saved')
+let [&g:autochdir, &l:autochdir] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_autoindent()
+if exists('+autoindent') && execute('set!') =~# '\n..autoindent\([=\n]\|$\)'
+let l:saved = [&g:autoindent, &l:autoindent]
+endif
+if exists('+autoindent')
+set autoindent
+set noautoindent
+set invautoindent
+set autoindent!
+setlocal autoindent
+setlocal noautoindent
+setlocal invautoindent
+setlocal autoindent!
+setglobal autoindent
+setglobal noautoindent
+setglobal invautoindent
+setglobal autoindent!
+set ai
+set noai
+set invai
+set ai!
+setlocal ai
+setlocal noai
+setlocal invai
+setlocal ai!
+setglobal ai
+setglobal noai
+setglobal invai
+setglobal ai!
+set autoindent&
+set ai&
+if exists('l:saved')
+let [&g:autoindent, &l:autoindent] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_autoprint()
+if exists('+autoprint') && execute('set!') =~# '\n..autoprint\([=\n]\|$\)'
+let l:saved = [&g:autoprint, &l:autoprint]
+endif
+if exists('+autoprint')
+set autoprint
+set noautoprint
+set invautoprint
+set autoprint!
+setlocal autoprint
+setlocal noautoprint
+setlocal invautoprint
+setlocal autoprint!
+setglobal autoprint
+setglobal noautoprint
+setglobal invautoprint
+setglobal autoprint!
+set ap
+set noap
+set invap
+set ap!
+setlocal ap
+setlocal noap
+setlocal invap
+setlocal ap!
+setglobal ap
+setglobal noap
+setglobal invap
+setglobal ap!
+set autoprint&
+set ap&
+if exists('l:saved')
+let [&g:autoprint, &l:autoprint] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_autoread()
+if exists('+autoread') && execute('set!') =~# '\n..autoread\([=\n]\|$\)'
+let l:saved = [&g:autoread, &l:autoread]
+endif
+if exists('+autoread')
+set autoread
+set noautoread
+set invautoread
+set autoread!
+setlocal autoread
+setlocal noautoread
+setlocal invautoread
+setlocal autoread!
+setglobal autoread
+setglobal noautoread
+setglobal invautoread
+setglobal autoread!
+set ar
+set noar
+set invar
+set ar!
+setlocal ar
+setlocal noar
+setlocal invar
+setlocal ar!
+setglobal ar
+setglobal noar
+setglobal invar
+setglobal ar!
+set autoread&
+set ar&
+if exists('l:saved')
+let [&g:autoread, &l:autoread] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_autoshelldir()
+if exists('+autoshelldir') && execute('set!') =~# '\n..autoshelldir\([=\n]\|$\)'
+let l:saved = [&g:autoshelldir, &l:autoshelldir]
+endif
+if exists('+autoshelldir')
+set autoshelldir
+set noautoshelldir
+set invautoshelldir
+set autoshelldir!
+setlocal autoshelldir
+setlocal noautoshelldir
+setlocal invautoshelldir
+setlocal autoshelldir!
+setglobal autoshelldir
+setglobal noautoshelldir
+setglobal invautoshelldir
+setglobal autoshelldir!
+set asd
+set noasd
+set invasd
+set asd!
+setlocal asd
+setlocal noasd
+setlocal invasd
+setlocal asd!
+setglobal asd
+setglobal noasd
+setglobal invasd
+setglobal asd!
+set autoshelldir&
+set asd&
+if exists('l:saved')
+let [&g:autoshelldir, &l:autoshelldir] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_autowrite()
+if exists('+autowrite') && execute('set!') =~# '\n..autowrite\([=\n]\|$\)'
+let l:saved = [&g:autowrite, &l:autowrite]
+endif
+if exists('+autowrite')
+set autowrite
+set noautowrite
+set invautowrite
+set autowrite!
+setlocal autowrite
+setlocal noautowrite
+setlocal invautowrite
+setlocal autowrite!
+setglobal autowrite
+setglobal noautowrite
+setglobal invautowrite
+setglobal autowrite!
+set aw
+set noaw
+set invaw
+set aw!
+setlocal aw
+setlocal noaw
+setlocal invaw
+setlocal aw!
+setglobal aw
+setglobal noaw
+setglobal invaw
+setglobal aw!
+set autowrite&
+set aw&
+if exists('l:saved')
+let [&g:autowrite, &l:autowrite] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_autowriteall()
+if exists('+autowriteall') && execute('set!') =~# '\n..autowriteall\([=\n]\|$\)'
+let l:saved = [&g:autowriteall, &l:autowriteall]
+endif
+if exists('+autowriteall')
+set autowriteall
+set noautowriteall
+set invautowriteall
+set autowriteall!
+setlocal autowriteall
+setlocal noautowriteall
+setlocal invautowriteall
+setlocal autowriteall!
+setglobal autowriteall
+setglobal noautowriteall
+setglobal invautowriteall
+setglobal autowriteall!
+set awa
+set noawa
+set invawa
+set awa!
+setlocal awa
+setlocal noawa
+setlocal invawa
+setlocal awa!
+setglobal awa
+setglobal noawa
+setglobal invawa
+setglobal awa!
+set autowriteall&
+set awa&
+if exists('l:saved')
+let [&g:autowriteall, &l:autowriteall] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_background()
+if exists('+background') && execute('set!') =~# '\n..background\([=\n]\|$\)'
+let l:saved = [&g:background, &l:background]
+endif
+if exists('+background')
+set background=
+set background=light
+set background=dark
+setlocal background=
+setlocal background=light
+setlocal background=dark
+setglobal background=
+setglobal background=light
+setglobal background=dark
+set bg=
+set bg=light
+set bg=dark
+setlocal bg=
+setlocal bg=light
+setlocal bg=dark
+setglobal bg=
+setglobal bg=light
+setglobal bg=dark
+silent! call assert_fails('set background=xxx')
+silent! call assert_fails('setlocal background=xxx')
+silent! call assert_fails('setglobal background=xxx')
+silent! call assert_fails('set bg=xxx')
+silent! call assert_fails('setlocal bg=xxx')
+silent! call assert_fails('setglobal bg=xxx')
+set background&
+set bg&
+if exists('l:saved')
+let [&g:background, &l:background] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_backspace()
+if exists('+backspace') && execute('set!') =~# '\n..backspace\([=\n]\|$\)'
+let l:saved = [&g:backspace, &l:backspace]
+endif
+if exists('+backspace')
+set backspace=0
+set backspace=1
+set backspace=2
+set backspace=3
+set backspace=
+set backspace=indent
+set backspace=eol
+set backspace=start
+set backspace=nostop
+set backspace=eol,start
+set backspace=indent,eol,nostop
+setlocal backspace=0
+setlocal backspace=1
+setlocal backspace=2
+setlocal backspace=3
+setlocal backspace=
+setlocal backspace=indent
+setlocal backspace=eol
+setlocal backspace=start
+setlocal backspace=nostop
+setlocal backspace=eol,start
+setlocal backspace=indent,eol,nostop
+setglobal backspace=0
+setglobal backspace=1
+setglobal backspace=2
+setglobal backspace=3
+setglobal backspace=
+setglobal backspace=indent
+setglobal backspace=eol
+setglobal backspace=start
+setglobal backspace=nostop
+setglobal backspace=eol,start
+setglobal backspace=indent,eol,nostop
+set bs=0
+set bs=1
+set bs=2
+set bs=3
+set bs=
+set bs=indent
+set bs=eol
+set bs=start
+set bs=nostop
+set bs=eol,start
+set bs=indent,eol,nostop
+setlocal bs=0
+setlocal bs=1
+setlocal bs=2
+setlocal bs=3
+setlocal bs=
+setlocal bs=indent
+setlocal bs=eol
+setlocal bs=start
+setlocal bs=nostop
+setlocal bs=eol,start
+setlocal bs=indent,eol,nostop
+setglobal bs=0
+setglobal bs=1
+setglobal bs=2
+setglobal bs=3
+setglobal bs=
+setglobal bs=indent
+setglobal bs=eol
+setglobal bs=start
+setglobal bs=nostop
+setglobal bs=eol,start
+setglobal bs=indent,eol,nostop
+silent! call assert_fails('set backspace=-1')
+silent! call assert_fails('set backspace=4')
+silent! call assert_fails('set backspace=xxx')
+silent! call assert_fails('setlocal backspace=-1')
+silent! call assert_fails('setlocal backspace=4')
+silent! call assert_fails('setlocal backspace=xxx')
+silent! call assert_fails('setglobal backspace=-1')
+silent! call assert_fails('setglobal backspace=4')
+silent! call assert_fails('setglobal backspace=xxx')
+silent! call assert_fails('set bs=-1')
+silent! call assert_fails('set bs=4')
+silent! call assert_fails('set bs=xxx')
+silent! call assert_fails('setlocal bs=-1')
+silent! call assert_fails('setlocal bs=4')
+silent! call assert_fails('setlocal bs=xxx')
+silent! call assert_fails('setglobal bs=-1')
+silent! call assert_fails('setglobal bs=4')
+silent! call assert_fails('setglobal bs=xxx')
+set backspace&
+set bs&
+if exists('l:saved')
+let [&g:backspace, &l:backspace] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_backup()
+if exists('+backup') && execute('set!') =~# '\n..backup\([=\n]\|$\)'
+let l:saved = [&g:backup, &l:backup]
+endif
+if exists('+backup')
+set backup
+set nobackup
+set invbackup
+set backup!
+setlocal backup
+setlocal nobackup
+setlocal invbackup
+setlocal backup!
+setglobal backup
+setglobal nobackup
+setglobal invbackup
+setglobal backup!
+set bk
+set nobk
+set invbk
+set bk!
+setlocal bk
+setlocal nobk
+setlocal invbk
+setlocal bk!
+setglobal bk
+setglobal nobk
+setglobal invbk
+setglobal bk!
+set backup&
+set bk&
+if exists('l:saved')
+let [&g:backup, &l:backup] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_backupcopy()
+if exists('+backupcopy') && execute('set!') =~# '\n..backupcopy\([=\n]\|$\)'
+let l:saved = [&g:backupcopy, &l:backupcopy]
+endif
+if exists('+backupcopy')
+set backupcopy=yes
+set backupcopy=no
+set backupcopy=auto
+setlocal backupcopy=yes
+setlocal backupcopy=no
+setlocal backupcopy=auto
+setglobal backupcopy=yes
+setglobal backupcopy=no
+setglobal backupcopy=auto
+setlocal backupcopy=
+call assert_equal(&g:backupcopy, &backupcopy)
+set bkc=yes
+set bkc=no
+set bkc=auto
+setlocal bkc=yes
+setlocal bkc=no
+setlocal bkc=auto
+setglobal bkc=yes
+setglobal bkc=no
+setglobal bkc=auto
+setlocal bkc=
+call assert_equal(&g:backupcopy, &backupcopy)
+silent! call assert_fails('set backupcopy=')
+silent! call assert_fails('set backupcopy=xxx')
+silent! call assert_fails('set backupcopy=yes,no')
+" Skip global-local: silent! call assert_fails('setlocal backupcopy=')
+silent! call assert_fails('setlocal backupcopy=xxx')
+silent! call assert_fails('setlocal backupcopy=yes,no')
+silent! call assert_fails('setglobal backupcopy=')
+silent! call assert_fails('setglobal backupcopy=xxx')
+silent! call assert_fails('setglobal backupcopy=yes,no')
+silent! call assert_fails('set bkc=')
+silent! call assert_fails('set bkc=xxx')
+silent! call assert_fails('set bkc=yes,no')
+" Skip global-local: silent! call assert_fails('setlocal bkc=')
+silent! call assert_fails('setlocal bkc=xxx')
+silent! call assert_fails('setlocal bkc=yes,no')
+silent! call assert_fails('setglobal bkc=')
+silent! call assert_fails('setglobal bkc=xxx')
+silent! call assert_fails('setglobal bkc=yes,no')
+set backupcopy&
+set bkc&
+if exists('l:saved')
+let [&g:backupcopy, &l:backupcopy] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_backupdir()
+if exists('+backupdir') && execute('set!') =~# '\n..backupdir\([=\n]\|$\)'
+let l:saved = [&g:backupdir, &l:backupdir]
+endif
+if exists('+backupdir')
+set backupdir=
+set backupdir=xxx
+setlocal backupdir=
+setlocal backupdir=xxx
+setglobal backupdir=
+setglobal backupdir=xxx
+set bdir=
+set bdir=xxx
+setlocal bdir=
+setlocal bdir=xxx
+setglobal bdir=
+setglobal bdir=xxx
+set backupdir&
+set bdir&
+if exists('l:saved')
+let [&g:backupdir, &l:backupdir] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_backupext()
+if exists('+backupext') && execute('set!') =~# '\n..backupext\([=\n]\|$\)'
+let l:saved = [&g:backupext, &l:backupext]
+endif
+if exists('+backupext')
+set backupext=xxx
+setlocal backupext=xxx
+setglobal backupext=xxx
+set bex=xxx
+setlocal bex=xxx
+setglobal bex=xxx
+silent! call assert_fails('set backupext=')
+silent! call assert_fails('set backupext=*')
+silent! call assert_fails('setlocal backupext=')
+silent! call assert_fails('setlocal backupext=*')
+silent! call assert_fails('setglobal backupext=')
+silent! call assert_fails('setglobal backupext=*')
+silent! call assert_fails('set bex=')
+silent! call assert_fails('set bex=*')
+silent! call assert_fails('setlocal bex=')
+silent! call assert_fails('setlocal bex=*')
+silent! call assert_fails('setglobal bex=')
+silent! call assert_fails('setglobal bex=*')
+set backupext&
+set bex&
+if exists('l:saved')
+let [&g:backupext, &l:backupext] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_backupskip()
+if exists('+backupskip') && execute('set!') =~# '\n..backupskip\([=\n]\|$\)'
+let l:saved = [&g:backupskip, &l:backupskip]
+endif
+if exists('+backupskip')
+set backupskip=
+set backupskip=xxx
+setlocal backupskip=
+setlocal backupskip=xxx
+setglobal backupskip=
+setglobal backupskip=xxx
+set bsk=
+set bsk=xxx
+setlocal bsk=
+setlocal bsk=xxx
+setglobal bsk=
+setglobal bsk=xxx
+set backupskip&
+set bsk&
+if exists('l:saved')
+let [&g:backupskip, &l:backupskip] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_balloondelay()
+if exists('+balloondelay') && execute('set!') =~# '\n..balloondelay\([=\n]\|$\)'
+let l:saved = [&g:balloondelay, &l:balloondelay]
+endif
+if exists('+balloondelay')
+set balloondelay=-1
+set balloondelay=0
+set balloondelay=100
+setlocal balloondelay=-1
+setlocal balloondelay=0
+setlocal balloondelay=100
+setglobal balloondelay=-1
+setglobal balloondelay=0
+setglobal balloondelay=100
+set bdlay=-1
+set bdlay=0
+set bdlay=100
+setlocal bdlay=-1
+setlocal bdlay=0
+setlocal bdlay=100
+setglobal bdlay=-1
+setglobal bdlay=0
+setglobal bdlay=100
+silent! call assert_fails('set balloondelay=')
+silent! call assert_fails('setlocal balloondelay=')
+silent! call assert_fails('setglobal balloondelay=')
+silent! call assert_fails('set bdlay=')
+silent! call assert_fails('setlocal bdlay=')
+silent! call assert_fails('setglobal bdlay=')
+set balloondelay&
+set bdlay&
+if exists('l:saved')
+let [&g:balloondelay, &l:balloondelay] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ballooneval()
+if exists('+ballooneval') && execute('set!') =~# '\n..ballooneval\([=\n]\|$\)'
+let l:saved = [&g:ballooneval, &l:ballooneval]
+endif
+if exists('+ballooneval')
+set ballooneval
+set noballooneval
+set invballooneval
+set ballooneval!
+setlocal ballooneval
+setlocal noballooneval
+setlocal invballooneval
+setlocal ballooneval!
+setglobal ballooneval
+setglobal noballooneval
+setglobal invballooneval
+setglobal ballooneval!
+set beval
+set nobeval
+set invbeval
+set beval!
+setlocal beval
+setlocal nobeval
+setlocal invbeval
+setlocal beval!
+setglobal beval
+setglobal nobeval
+setglobal invbeval
+setglobal beval!
+set ballooneval&
+set beval&
+if exists('l:saved')
+let [&g:ballooneval, &l:ballooneval] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_balloonevalterm()
+if exists('+balloonevalterm') && execute('set!') =~# '\n..balloonevalterm\([=\n]\|$\)'
+let l:saved = [&g:balloonevalterm, &l:balloonevalterm]
+endif
+if exists('+balloonevalterm')
+set balloonevalterm
+set noballoonevalterm
+set invballoonevalterm
+set balloonevalterm!
+setlocal balloonevalterm
+setlocal noballoonevalterm
+setlocal invballoonevalterm
+setlocal balloonevalterm!
+setglobal balloonevalterm
+setglobal noballoonevalterm
+setglobal invballoonevalterm
+setglobal balloonevalterm!
+set bevalterm
+set nobevalterm
+set invbevalterm
+set bevalterm!
+setlocal bevalterm
+setlocal nobevalterm
+setlocal invbevalterm
+setlocal bevalterm!
+setglobal bevalterm
+setglobal nobevalterm
+setglobal invbevalterm
+setglobal bevalterm!
+set balloonevalterm&
+set bevalterm&
+if exists('l:saved')
+let [&g:balloonevalterm, &l:balloonevalterm] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_balloonexpr()
+if exists('+balloonexpr') && execute('set!') =~# '\n..balloonexpr\([=\n]\|$\)'
+let l:saved = [&g:balloonexpr, &l:balloonexpr]
+endif
+if exists('+balloonexpr')
+set balloonexpr=
+set balloonexpr=xxx
+setlocal balloonexpr=
+setlocal balloonexpr=xxx
+setglobal balloonexpr=
+setglobal balloonexpr=xxx
+setlocal balloonexpr=
+call assert_equal(&g:balloonexpr, &balloonexpr)
+set bexpr=
+set bexpr=xxx
+setlocal bexpr=
+setlocal bexpr=xxx
+setglobal bexpr=
+setglobal bexpr=xxx
+setlocal bexpr=
+call assert_equal(&g:balloonexpr, &balloonexpr)
+set balloonexpr&
+set bexpr&
+if exists('l:saved')
+let [&g:balloonexpr, &l:balloonexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_beautify()
+if exists('+beautify') && execute('set!') =~# '\n..beautify\([=\n]\|$\)'
+let l:saved = [&g:beautify, &l:beautify]
+endif
+if exists('+beautify')
+set beautify
+set nobeautify
+set invbeautify
+set beautify!
+setlocal beautify
+setlocal nobeautify
+setlocal invbeautify
+setlocal beautify!
+setglobal beautify
+setglobal nobeautify
+setglobal invbeautify
+setglobal beautify!
+set bf
+set nobf
+set invbf
+set bf!
+setlocal bf
+setlocal nobf
+setlocal invbf
+setlocal bf!
+setglobal bf
+setglobal nobf
+setglobal invbf
+setglobal bf!
+set beautify&
+set bf&
+if exists('l:saved')
+let [&g:beautify, &l:beautify] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_belloff()
+if exists('+belloff') && execute('set!') =~# '\n..belloff\([=\n]\|$\)'
+let l:saved = [&g:belloff, &l:belloff]
+endif
+if exists('+belloff')
+set belloff=
+set belloff=all
+set belloff=backspace
+set belloff=cursor
+set belloff=complete
+set belloff=copy
+set belloff=ctrlg
+set belloff=error
+set belloff=esc
+set belloff=ex
+set belloff=hangul
+set belloff=insertmode
+set belloff=lang
+set belloff=mess
+set belloff=showmatch
+set belloff=operator
+set belloff=register
+set belloff=shell
+set belloff=spell
+set belloff=term
+set belloff=wildmode
+set belloff=copy,error,shell
+setlocal belloff=
+setlocal belloff=all
+setlocal belloff=backspace
+setlocal belloff=cursor
+setlocal belloff=complete
+setlocal belloff=copy
+setlocal belloff=ctrlg
+setlocal belloff=error
+setlocal belloff=esc
+setlocal belloff=ex
+setlocal belloff=hangul
+setlocal belloff=insertmode
+setlocal belloff=lang
+setlocal belloff=mess
+setlocal belloff=showmatch
+setlocal belloff=operator
+setlocal belloff=register
+setlocal belloff=shell
+setlocal belloff=spell
+setlocal belloff=term
+setlocal belloff=wildmode
+setlocal belloff=copy,error,shell
+setglobal belloff=
+setglobal belloff=all
+setglobal belloff=backspace
+setglobal belloff=cursor
+setglobal belloff=complete
+setglobal belloff=copy
+setglobal belloff=ctrlg
+setglobal belloff=error
+setglobal belloff=esc
+setglobal belloff=ex
+setglobal belloff=hangul
+setglobal belloff=insertmode
+setglobal belloff=lang
+setglobal belloff=mess
+setglobal belloff=showmatch
+setglobal belloff=operator
+setglobal belloff=register
+setglobal belloff=shell
+setglobal belloff=spell
+setglobal belloff=term
+setglobal belloff=wildmode
+setglobal belloff=copy,error,shell
+set bo=
+set bo=all
+set bo=backspace
+set bo=cursor
+set bo=complete
+set bo=copy
+set bo=ctrlg
+set bo=error
+set bo=esc
+set bo=ex
+set bo=hangul
+set bo=insertmode
+set bo=lang
+set bo=mess
+set bo=showmatch
+set bo=operator
+set bo=register
+set bo=shell
+set bo=spell
+set bo=term
+set bo=wildmode
+set bo=copy,error,shell
+setlocal bo=
+setlocal bo=all
+setlocal bo=backspace
+setlocal bo=cursor
+setlocal bo=complete
+setlocal bo=copy
+setlocal bo=ctrlg
+setlocal bo=error
+setlocal bo=esc
+setlocal bo=ex
+setlocal bo=hangul
+setlocal bo=insertmode
+setlocal bo=lang
+setlocal bo=mess
+setlocal bo=showmatch
+setlocal bo=operator
+setlocal bo=register
+setlocal bo=shell
+setlocal bo=spell
+setlocal bo=term
+setlocal bo=wildmode
+setlocal bo=copy,error,shell
+setglobal bo=
+setglobal bo=all
+setglobal bo=backspace
+setglobal bo=cursor
+setglobal bo=complete
+setglobal bo=copy
+setglobal bo=ctrlg
+setglobal bo=error
+setglobal bo=esc
+setglobal bo=ex
+setglobal bo=hangul
+setglobal bo=insertmode
+setglobal bo=lang
+setglobal bo=mess
+setglobal bo=showmatch
+setglobal bo=operator
+setglobal bo=register
+setglobal bo=shell
+setglobal bo=spell
+setglobal bo=term
+setglobal bo=wildmode
+setglobal bo=copy,error,shell
+silent! call assert_fails('set belloff=xxx')
+silent! call assert_fails('setlocal belloff=xxx')
+silent! call assert_fails('setglobal belloff=xxx')
+silent! call assert_fails('set bo=xxx')
+silent! call assert_fails('setlocal bo=xxx')
+silent! call assert_fails('setglobal bo=xxx')
+set belloff&
+set bo&
+if exists('l:saved')
+let [&g:belloff, &l:belloff] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_binary()
+if exists('+binary') && execute('set!') =~# '\n..binary\([=\n]\|$\)'
+let l:saved = [&g:binary, &l:binary]
+endif
+if exists('+binary')
+set binary
+set nobinary
+set invbinary
+set binary!
+setlocal binary
+setlocal nobinary
+setlocal invbinary
+setlocal binary!
+setglobal binary
+setglobal nobinary
+setglobal invbinary
+setglobal binary!
+set bin
+set nobin
+set invbin
+set bin!
+setlocal bin
+setlocal nobin
+setlocal invbin
+setlocal bin!
+setglobal bin
+setglobal nobin
+setglobal invbin
+setglobal bin!
+set binary&
+set bin&
+if exists('l:saved')
+let [&g:binary, &l:binary] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_bioskey()
+if exists('+bioskey') && execute('set!') =~# '\n..bioskey\([=\n]\|$\)'
+let l:saved = [&g:bioskey, &l:bioskey]
+endif
+if exists('+bioskey')
+set bioskey
+set nobioskey
+set invbioskey
+set bioskey!
+setlocal bioskey
+setlocal nobioskey
+setlocal invbioskey
+setlocal bioskey!
+setglobal bioskey
+setglobal nobioskey
+setglobal invbioskey
+setglobal bioskey!
+set biosk
+set nobiosk
+set invbiosk
+set biosk!
+setlocal biosk
+setlocal nobiosk
+setlocal invbiosk
+setlocal biosk!
+setglobal biosk
+setglobal nobiosk
+setglobal invbiosk
+setglobal biosk!
+set bioskey&
+set biosk&
+if exists('l:saved')
+let [&g:bioskey, &l:bioskey] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_bomb()
+if exists('+bomb') && execute('set!') =~# '\n..bomb\([=\n]\|$\)'
+let l:saved = [&g:bomb, &l:bomb]
+endif
+if exists('+bomb')
+set bomb
+set nobomb
+set invbomb
+set bomb!
+setlocal bomb
+setlocal nobomb
+setlocal invbomb
+setlocal bomb!
+setglobal bomb
+setglobal nobomb
+setglobal invbomb
+setglobal bomb!
+set bomb
+set nobomb
+set invbomb
+set bomb!
+setlocal bomb
+setlocal nobomb
+setlocal invbomb
+setlocal bomb!
+setglobal bomb
+setglobal nobomb
+setglobal invbomb
+setglobal bomb!
+set bomb&
+set bomb&
+if exists('l:saved')
+let [&g:bomb, &l:bomb] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_breakat()
+if exists('+breakat') && execute('set!') =~# '\n..breakat\([=\n]\|$\)'
+let l:saved = [&g:breakat, &l:breakat]
+endif
+if exists('+breakat')
+set breakat=
+set breakat=xxx
+setlocal breakat=
+setlocal breakat=xxx
+setglobal breakat=
+setglobal breakat=xxx
+set brk=
+set brk=xxx
+setlocal brk=
+setlocal brk=xxx
+setglobal brk=
+setglobal brk=xxx
+set breakat&
+set brk&
+if exists('l:saved')
+let [&g:breakat, &l:breakat] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_breakindent()
+if exists('+breakindent') && execute('set!') =~# '\n..breakindent\([=\n]\|$\)'
+let l:saved = [&g:breakindent, &l:breakindent]
+endif
+if exists('+breakindent')
+set breakindent
+set nobreakindent
+set invbreakindent
+set breakindent!
+setlocal breakindent
+setlocal nobreakindent
+setlocal invbreakindent
+setlocal breakindent!
+setglobal breakindent
+setglobal nobreakindent
+setglobal invbreakindent
+setglobal breakindent!
+set bri
+set nobri
+set invbri
+set bri!
+setlocal bri
+setlocal nobri
+setlocal invbri
+setlocal bri!
+setglobal bri
+setglobal nobri
+setglobal invbri
+setglobal bri!
+set breakindent&
+set bri&
+if exists('l:saved')
+let [&g:breakindent, &l:breakindent] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_breakindentopt()
+if exists('+breakindentopt') && execute('set!') =~# '\n..breakindentopt\([=\n]\|$\)'
+let l:saved = [&g:breakindentopt, &l:breakindentopt]
+endif
+if exists('+breakindentopt')
+set breakindentopt=
+set breakindentopt=min:3
+set breakindentopt=shift:4
+set breakindentopt=shift:-2
+set breakindentopt=sbr
+set breakindentopt=list:5
+set breakindentopt=list:-1
+set breakindentopt=column:10
+set breakindentopt=column:-5
+set breakindentopt=min:1,sbr,shift:2
+setlocal breakindentopt=
+setlocal breakindentopt=min:3
+setlocal breakindentopt=shift:4
+setlocal breakindentopt=shift:-2
+setlocal breakindentopt=sbr
+setlocal breakindentopt=list:5
+setlocal breakindentopt=list:-1
+setlocal breakindentopt=column:10
+setlocal breakindentopt=column:-5
+setlocal breakindentopt=min:1,sbr,shift:2
+setglobal breakindentopt=
+setglobal breakindentopt=min:3
+setglobal breakindentopt=shift:4
+setglobal breakindentopt=shift:-2
+setglobal breakindentopt=sbr
+setglobal breakindentopt=list:5
+setglobal breakindentopt=list:-1
+setglobal breakindentopt=column:10
+setglobal breakindentopt=column:-5
+setglobal breakindentopt=min:1,sbr,shift:2
+set briopt=
+set briopt=min:3
+set briopt=shift:4
+set briopt=shift:-2
+set briopt=sbr
+set briopt=list:5
+set briopt=list:-1
+set briopt=column:10
+set briopt=column:-5
+set briopt=min:1,sbr,shift:2
+setlocal briopt=
+setlocal briopt=min:3
+setlocal briopt=shift:4
+setlocal briopt=shift:-2
+setlocal briopt=sbr
+setlocal briopt=list:5
+setlocal briopt=list:-1
+setlocal briopt=column:10
+setlocal briopt=column:-5
+setlocal briopt=min:1,sbr,shift:2
+setglobal briopt=
+setglobal briopt=min:3
+setglobal briopt=shift:4
+setglobal briopt=shift:-2
+setglobal briopt=sbr
+setglobal briopt=list:5
+setglobal briopt=list:-1
+setglobal briopt=column:10
+setglobal briopt=column:-5
+setglobal briopt=min:1,sbr,shift:2
+silent! call assert_fails('set breakindentopt=xxx')
+silent! call assert_fails('set breakindentopt=min')
+silent! call assert_fails('set breakindentopt=min:x')
+silent! call assert_fails('set breakindentopt=min:-1')
+silent! call assert_fails('set breakindentopt=shift:x')
+silent! call assert_fails('set breakindentopt=sbr:1')
+silent! call assert_fails('set breakindentopt=list:x')
+silent! call assert_fails('set breakindentopt=column:x')
+silent! call assert_fails('setlocal breakindentopt=xxx')
+silent! call assert_fails('setlocal breakindentopt=min')
+silent! call assert_fails('setlocal breakindentopt=min:x')
+silent! call assert_fails('setlocal breakindentopt=min:-1')
+silent! call assert_fails('setlocal breakindentopt=shift:x')
+silent! call assert_fails('setlocal breakindentopt=sbr:1')
+silent! call assert_fails('setlocal breakindentopt=list:x')
+silent! call assert_fails('setlocal breakindentopt=column:x')
+silent! call assert_fails('setglobal breakindentopt=xxx')
+silent! call assert_fails('setglobal breakindentopt=min')
+silent! call assert_fails('setglobal breakindentopt=min:x')
+silent! call assert_fails('setglobal breakindentopt=min:-1')
+silent! call assert_fails('setglobal breakindentopt=shift:x')
+silent! call assert_fails('setglobal breakindentopt=sbr:1')
+silent! call assert_fails('setglobal breakindentopt=list:x')
+silent! call assert_fails('setglobal breakindentopt=column:x')
+silent! call assert_fails('set briopt=xxx')
+silent! call assert_fails('set briopt=min')
+silent! call assert_fails('set briopt=min:x')
+silent! call assert_fails('set briopt=min:-1')
+silent! call assert_fails('set briopt=shift:x')
+silent! call assert_fails('set briopt=sbr:1')
+silent! call assert_fails('set briopt=list:x')
+silent! call assert_fails('set briopt=column:x')
+silent! call assert_fails('setlocal briopt=xxx')
+silent! call assert_fails('setlocal briopt=min')
+silent! call assert_fails('setlocal briopt=min:x')
+silent! call assert_fails('setlocal briopt=min:-1')
+silent! call assert_fails('setlocal briopt=shift:x')
+silent! call assert_fails('setlocal briopt=sbr:1')
+silent! call assert_fails('setlocal briopt=list:x')
+silent! call assert_fails('setlocal briopt=column:x')
+silent! call assert_fails('setglobal briopt=xxx')
+silent! call assert_fails('setglobal briopt=min')
+silent! call assert_fails('setglobal briopt=min:x')
+silent! call assert_fails('setglobal briopt=min:-1')
+silent! call assert_fails('setglobal briopt=shift:x')
+silent! call assert_fails('setglobal briopt=sbr:1')
+silent! call assert_fails('setglobal briopt=list:x')
+silent! call assert_fails('setglobal briopt=column:x')
+set breakindentopt&
+set briopt&
+if exists('l:saved')
+let [&g:breakindentopt, &l:breakindentopt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_browsedir()
+if exists('+browsedir') && execute('set!') =~# '\n..browsedir\([=\n]\|$\)'
+let l:saved = [&g:browsedir, &l:browsedir]
+endif
+call mkdir('Xdir with space', 'D')
+if exists('+browsedir')
+set browsedir=
+set browsedir=last
+set browsedir=buffer
+set browsedir=current
+set browsedir=./Xdir\ with\ space
+setlocal browsedir=
+setlocal browsedir=last
+setlocal browsedir=buffer
+setlocal browsedir=current
+setlocal browsedir=./Xdir\ with\ space
+setglobal browsedir=
+setglobal browsedir=last
+setglobal browsedir=buffer
+setglobal browsedir=current
+setglobal browsedir=./Xdir\ with\ space
+set bsdir=
+set bsdir=last
+set bsdir=buffer
+set bsdir=current
+set bsdir=./Xdir\ with\ space
+setlocal bsdir=
+setlocal bsdir=last
+setlocal bsdir=buffer
+setlocal bsdir=current
+setlocal bsdir=./Xdir\ with\ space
+setglobal bsdir=
+setglobal bsdir=last
+setglobal bsdir=buffer
+setglobal bsdir=current
+setglobal bsdir=./Xdir\ with\ space
+silent! call assert_fails('set browsedir=xxx')
+silent! call assert_fails('setlocal browsedir=xxx')
+silent! call assert_fails('setglobal browsedir=xxx')
+silent! call assert_fails('set bsdir=xxx')
+silent! call assert_fails('setlocal bsdir=xxx')
+silent! call assert_fails('setglobal bsdir=xxx')
+set browsedir&
+set bsdir&
+if exists('l:saved')
+let [&g:browsedir, &l:browsedir] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_bufhidden()
+if exists('+bufhidden') && execute('set!') =~# '\n..bufhidden\([=\n]\|$\)'
+let l:saved = [&g:bufhidden, &l:bufhidden]
+endif
+if exists('+bufhidden')
+set bufhidden=
+set bufhidden=hide
+set bufhidden=unload
+set bufhidden=delete
+set bufhidden=wipe
+setlocal bufhidden=
+setlocal bufhidden=hide
+setlocal bufhidden=unload
+setlocal bufhidden=delete
+setlocal bufhidden=wipe
+" Skip local-noglobal: setglobal bufhidden=
+" Skip local-noglobal: setglobal bufhidden=hide
+" Skip local-noglobal: setglobal bufhidden=unload
+" Skip local-noglobal: setglobal bufhidden=delete
+" Skip local-noglobal: setglobal bufhidden=wipe
+set bh=
+set bh=hide
+set bh=unload
+set bh=delete
+set bh=wipe
+setlocal bh=
+setlocal bh=hide
+setlocal bh=unload
+setlocal bh=delete
+setlocal bh=wipe
+" Skip local-noglobal: setglobal bh=
+" Skip local-noglobal: setglobal bh=hide
+" Skip local-noglobal: setglobal bh=unload
+" Skip local-noglobal: setglobal bh=delete
+" Skip local-noglobal: setglobal bh=wipe
+silent! call assert_fails('set bufhidden=xxx')
+silent! call assert_fails('set bufhidden=hide,wipe')
+silent! call assert_fails('setlocal bufhidden=xxx')
+silent! call assert_fails('setlocal bufhidden=hide,wipe')
+" Skip local-noglobal: silent! call assert_fails('setglobal bufhidden=xxx')
+" Skip local-noglobal: silent! call assert_fails('setglobal bufhidden=hide,wipe')
+silent! call assert_fails('set bh=xxx')
+silent! call assert_fails('set bh=hide,wipe')
+silent! call assert_fails('setlocal bh=xxx')
+silent! call assert_fails('setlocal bh=hide,wipe')
+" Skip local-noglobal: silent! call assert_fails('setglobal bh=xxx')
+" Skip local-noglobal: silent! call assert_fails('setglobal bh=hide,wipe')
+set bufhidden&
+set bh&
+if exists('l:saved')
+let [&g:bufhidden, &l:bufhidden] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_buflisted()
+if exists('+buflisted') && execute('set!') =~# '\n..buflisted\([=\n]\|$\)'
+let l:saved = [&g:buflisted, &l:buflisted]
+endif
+if exists('+buflisted')
+set buflisted
+set nobuflisted
+set invbuflisted
+set buflisted!
+setlocal buflisted
+setlocal nobuflisted
+setlocal invbuflisted
+setlocal buflisted!
+setglobal buflisted
+setglobal nobuflisted
+setglobal invbuflisted
+setglobal buflisted!
+set bl
+set nobl
+set invbl
+set bl!
+setlocal bl
+setlocal nobl
+setlocal invbl
+setlocal bl!
+setglobal bl
+setglobal nobl
+setglobal invbl
+setglobal bl!
+set buflisted&
+set bl&
+if exists('l:saved')
+let [&g:buflisted, &l:buflisted] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_buftype()
+if exists('+buftype') && execute('set!') =~# '\n..buftype\([=\n]\|$\)'
+let l:saved = [&g:buftype, &l:buftype]
+endif
+if exists('+buftype')
+set buftype=
+set buftype=nofile
+set buftype=nowrite
+set buftype=acwrite
+set buftype=quickfix
+set buftype=help
+set buftype=terminal
+set buftype=prompt
+set buftype=popup
+setlocal buftype=
+setlocal buftype=nofile
+setlocal buftype=nowrite
+setlocal buftype=acwrite
+setlocal buftype=quickfix
+setlocal buftype=help
+setlocal buftype=terminal
+setlocal buftype=prompt
+setlocal buftype=popup
+" Skip local-noglobal: setglobal buftype=
+" Skip local-noglobal: setglobal buftype=nofile
+" Skip local-noglobal: setglobal buftype=nowrite
+" Skip local-noglobal: setglobal buftype=acwrite
+" Skip local-noglobal: setglobal buftype=quickfix
+" Skip local-noglobal: setglobal buftype=help
+" Skip local-noglobal: setglobal buftype=terminal
+" Skip local-noglobal: setglobal buftype=prompt
+" Skip local-noglobal: setglobal buftype=popup
+set bt=
+set bt=nofile
+set bt=nowrite
+set bt=acwrite
+set bt=quickfix
+set bt=help
+set bt=terminal
+set bt=prompt
+set bt=popup
+setlocal bt=
+setlocal bt=nofile
+setlocal bt=nowrite
+setlocal bt=acwrite
+setlocal bt=quickfix
+setlocal bt=help
+setlocal bt=terminal
+setlocal bt=prompt
+setlocal bt=popup
+" Skip local-noglobal: setglobal bt=
+" Skip local-noglobal: setglobal bt=nofile
+" Skip local-noglobal: setglobal bt=nowrite
+" Skip local-noglobal: setglobal bt=acwrite
+" Skip local-noglobal: setglobal bt=quickfix
+" Skip local-noglobal: setglobal bt=help
+" Skip local-noglobal: setglobal bt=terminal
+" Skip local-noglobal: setglobal bt=prompt
+" Skip local-noglobal: setglobal bt=popup
+silent! call assert_fails('set buftype=xxx')
+silent! call assert_fails('set buftype=help,nofile')
+silent! call assert_fails('setlocal buftype=xxx')
+silent! call assert_fails('setlocal buftype=help,nofile')
+" Skip local-noglobal: silent! call assert_fails('setglobal buftype=xxx')
+" Skip local-noglobal: silent! call assert_fails('setglobal buftype=help,nofile')
+silent! call assert_fails('set bt=xxx')
+silent! call assert_fails('set bt=help,nofile')
+silent! call assert_fails('setlocal bt=xxx')
+silent! call assert_fails('setlocal bt=help,nofile')
+" Skip local-noglobal: silent! call assert_fails('setglobal bt=xxx')
+" Skip local-noglobal: silent! call assert_fails('setglobal bt=help,nofile')
+set buftype&
+set bt&
+if exists('l:saved')
+let [&g:buftype, &l:buftype] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_casemap()
+if exists('+casemap') && execute('set!') =~# '\n..casemap\([=\n]\|$\)'
+let l:saved = [&g:casemap, &l:casemap]
+endif
+if exists('+casemap')
+set casemap=
+set casemap=internal
+set casemap=keepascii
+set casemap=internal,keepascii
+setlocal casemap=
+setlocal casemap=internal
+setlocal casemap=keepascii
+setlocal casemap=internal,keepascii
+setglobal casemap=
+setglobal casemap=internal
+setglobal casemap=keepascii
+setglobal casemap=internal,keepascii
+set cmp=
+set cmp=internal
+set cmp=keepascii
+set cmp=internal,keepascii
+setlocal cmp=
+setlocal cmp=internal
+setlocal cmp=keepascii
+setlocal cmp=internal,keepascii
+setglobal cmp=
+setglobal cmp=internal
+setglobal cmp=keepascii
+setglobal cmp=internal,keepascii
+silent! call assert_fails('set casemap=xxx')
+silent! call assert_fails('setlocal casemap=xxx')
+silent! call assert_fails('setglobal casemap=xxx')
+silent! call assert_fails('set cmp=xxx')
+silent! call assert_fails('setlocal cmp=xxx')
+silent! call assert_fails('setglobal cmp=xxx')
+set casemap&
+set cmp&
+if exists('l:saved')
+let [&g:casemap, &l:casemap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cdhome()
+if exists('+cdhome') && execute('set!') =~# '\n..cdhome\([=\n]\|$\)'
+let l:saved = [&g:cdhome, &l:cdhome]
+endif
+if exists('+cdhome')
+set cdhome
+set nocdhome
+set invcdhome
+set cdhome!
+setlocal cdhome
+setlocal nocdhome
+setlocal invcdhome
+setlocal cdhome!
+setglobal cdhome
+setglobal nocdhome
+setglobal invcdhome
+setglobal cdhome!
+set cdh
+set nocdh
+set invcdh
+set cdh!
+setlocal cdh
+setlocal nocdh
+setlocal invcdh
+setlocal cdh!
+setglobal cdh
+setglobal nocdh
+setglobal invcdh
+setglobal cdh!
+set cdhome&
+set cdh&
+if exists('l:saved')
+let [&g:cdhome, &l:cdhome] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cdpath()
+if exists('+cdpath') && execute('set!') =~# '\n..cdpath\([=\n]\|$\)'
+let l:saved = [&g:cdpath, &l:cdpath]
+endif
+if exists('+cdpath')
+set cdpath=
+set cdpath=xxx
+setlocal cdpath=
+setlocal cdpath=xxx
+setglobal cdpath=
+setglobal cdpath=xxx
+set cd=
+set cd=xxx
+setlocal cd=
+setlocal cd=xxx
+setglobal cd=
+setglobal cd=xxx
+set cdpath&
+set cd&
+if exists('l:saved')
+let [&g:cdpath, &l:cdpath] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cedit()
+if exists('+cedit') && execute('set!') =~# '\n..cedit\([=\n]\|$\)'
+let l:saved = [&g:cedit, &l:cedit]
+endif
+if exists('+cedit')
+set cedit=
+set cedit=^Y
+set cedit=^@
+set cedit=<Esc>
+set cedit=<t_xx>
+setlocal cedit=
+setlocal cedit=^Y
+setlocal cedit=^@
+setlocal cedit=<Esc>
+setlocal cedit=<t_xx>
+setglobal cedit=
+setglobal cedit=^Y
+setglobal cedit=^@
+setglobal cedit=<Esc>
+setglobal cedit=<t_xx>
+set cedit=
+set cedit=^Y
+set cedit=^@
+set cedit=<Esc>
+set cedit=<t_xx>
+setlocal cedit=
+setlocal cedit=^Y
+setlocal cedit=^@
+setlocal cedit=<Esc>
+setlocal cedit=<t_xx>
+setglobal cedit=
+setglobal cedit=^Y
+setglobal cedit=^@
+setglobal cedit=<Esc>
+setglobal cedit=<t_xx>
+silent! call assert_fails('set cedit=xxx')
+silent! call assert_fails('set cedit=f')
+silent! call assert_fails('set cedit=<xxx>')
+silent! call assert_fails('set cedit=<t_xxx>')
+silent! call assert_fails('set cedit=<Esc')
+silent! call assert_fails('set cedit=<t_xx')
+silent! call assert_fails('setlocal cedit=xxx')
+silent! call assert_fails('setlocal cedit=f')
+silent! call assert_fails('setlocal cedit=<xxx>')
+silent! call assert_fails('setlocal cedit=<t_xxx>')
+silent! call assert_fails('setlocal cedit=<Esc')
+silent! call assert_fails('setlocal cedit=<t_xx')
+silent! call assert_fails('setglobal cedit=xxx')
+silent! call assert_fails('setglobal cedit=f')
+silent! call assert_fails('setglobal cedit=<xxx>')
+silent! call assert_fails('setglobal cedit=<t_xxx>')
+silent! call assert_fails('setglobal cedit=<Esc')
+silent! call assert_fails('setglobal cedit=<t_xx')
+silent! call assert_fails('set cedit=xxx')
+silent! call assert_fails('set cedit=f')
+silent! call assert_fails('set cedit=<xxx>')
+silent! call assert_fails('set cedit=<t_xxx>')
+silent! call assert_fails('set cedit=<Esc')
+silent! call assert_fails('set cedit=<t_xx')
+silent! call assert_fails('setlocal cedit=xxx')
+silent! call assert_fails('setlocal cedit=f')
+silent! call assert_fails('setlocal cedit=<xxx>')
+silent! call assert_fails('setlocal cedit=<t_xxx>')
+silent! call assert_fails('setlocal cedit=<Esc')
+silent! call assert_fails('setlocal cedit=<t_xx')
+silent! call assert_fails('setglobal cedit=xxx')
+silent! call assert_fails('setglobal cedit=f')
+silent! call assert_fails('setglobal cedit=<xxx>')
+silent! call assert_fails('setglobal cedit=<t_xxx>')
+silent! call assert_fails('setglobal cedit=<Esc')
+silent! call assert_fails('setglobal cedit=<t_xx')
+set cedit&
+set cedit&
+if exists('l:saved')
+let [&g:cedit, &l:cedit] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_charconvert()
+if exists('+charconvert') && execute('set!') =~# '\n..charconvert\([=\n]\|$\)'
+let l:saved = [&g:charconvert, &l:charconvert]
+endif
+if exists('+charconvert')
+set charconvert=
+set charconvert=xxx
+setlocal charconvert=
+setlocal charconvert=xxx
+setglobal charconvert=
+setglobal charconvert=xxx
+set ccv=
+set ccv=xxx
+setlocal ccv=
+setlocal ccv=xxx
+setglobal ccv=
+setglobal ccv=xxx
+set charconvert&
+set ccv&
+if exists('l:saved')
+let [&g:charconvert, &l:charconvert] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_chistory()
+if exists('+chistory') && execute('set!') =~# '\n..chistory\([=\n]\|$\)'
+let l:saved = [&g:chistory, &l:chistory]
+endif
+if exists('+chistory')
+set chistory=1
+set chistory=2
+set chistory=10
+set chistory=50
+setlocal chistory=1
+setlocal chistory=2
+setlocal chistory=10
+setlocal chistory=50
+setglobal chistory=1
+setglobal chistory=2
+setglobal chistory=10
+setglobal chistory=50
+set chi=1
+set chi=2
+set chi=10
+set chi=50
+setlocal chi=1
+setlocal chi=2
+setlocal chi=10
+setlocal chi=50
+setglobal chi=1
+setglobal chi=2
+setglobal chi=10
+setglobal chi=50
+silent! call assert_fails('set chistory=1000')
+silent! call assert_fails('set chistory=-1')
+silent! call assert_fails('setlocal chistory=1000')
+silent! call assert_fails('setlocal chistory=-1')
+silent! call assert_fails('setglobal chistory=1000')
+silent! call assert_fails('setglobal chistory=-1')
+silent! call assert_fails('set chi=1000')
+silent! call assert_fails('set chi=-1')
+silent! call assert_fails('setlocal chi=1000')
+silent! call assert_fails('setlocal chi=-1')
+silent! call assert_fails('setglobal chi=1000')
+silent! call assert_fails('setglobal chi=-1')
+set chistory&
+set chi&
+if exists('l:saved')
+let [&g:chistory, &l:chistory] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cindent()
+if exists('+cindent') && execute('set!') =~# '\n..cindent\([=\n]\|$\)'
+let l:saved = [&g:cindent, &l:cindent]
+endif
+if exists('+cindent')
+set cindent
+set nocindent
+set invcindent
+set cindent!
+setlocal cindent
+setlocal nocindent
+setlocal invcindent
+setlocal cindent!
+setglobal cindent
+setglobal nocindent
+setglobal invcindent
+setglobal cindent!
+set cin
+set nocin
+set invcin
+set cin!
+setlocal cin
+setlocal nocin
+setlocal invcin
+setlocal cin!
+setglobal cin
+setglobal nocin
+setglobal invcin
+setglobal cin!
+set cindent&
+set cin&
+if exists('l:saved')
+let [&g:cindent, &l:cindent] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cinkeys()
+if exists('+cinkeys') && execute('set!') =~# '\n..cinkeys\([=\n]\|$\)'
+let l:saved = [&g:cinkeys, &l:cinkeys]
+endif
+if exists('+cinkeys')
+set cinkeys=
+set cinkeys=xxx
+setlocal cinkeys=
+setlocal cinkeys=xxx
+setglobal cinkeys=
+setglobal cinkeys=xxx
+set cink=
+set cink=xxx
+setlocal cink=
+setlocal cink=xxx
+setglobal cink=
+setglobal cink=xxx
+set cinkeys&
+set cink&
+if exists('l:saved')
+let [&g:cinkeys, &l:cinkeys] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cinoptions()
+if exists('+cinoptions') && execute('set!') =~# '\n..cinoptions\([=\n]\|$\)'
+let l:saved = [&g:cinoptions, &l:cinoptions]
+endif
+if exists('+cinoptions')
+set cinoptions=
+set cinoptions=xxx
+setlocal cinoptions=
+setlocal cinoptions=xxx
+setglobal cinoptions=
+setglobal cinoptions=xxx
+set cino=
+set cino=xxx
+setlocal cino=
+setlocal cino=xxx
+setglobal cino=
+setglobal cino=xxx
+set cinoptions&
+set cino&
+if exists('l:saved')
+let [&g:cinoptions, &l:cinoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cinscopedecls()
+if exists('+cinscopedecls') && execute('set!') =~# '\n..cinscopedecls\([=\n]\|$\)'
+let l:saved = [&g:cinscopedecls, &l:cinscopedecls]
+endif
+if exists('+cinscopedecls')
+set cinscopedecls=
+set cinscopedecls=xxx
+setlocal cinscopedecls=
+setlocal cinscopedecls=xxx
+setglobal cinscopedecls=
+setglobal cinscopedecls=xxx
+set cinsd=
+set cinsd=xxx
+setlocal cinsd=
+setlocal cinsd=xxx
+setglobal cinsd=
+setglobal cinsd=xxx
+set cinscopedecls&
+set cinsd&
+if exists('l:saved')
+let [&g:cinscopedecls, &l:cinscopedecls] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cinwords()
+if exists('+cinwords') && execute('set!') =~# '\n..cinwords\([=\n]\|$\)'
+let l:saved = [&g:cinwords, &l:cinwords]
+endif
+if exists('+cinwords')
+set cinwords=
+set cinwords=xxx
+setlocal cinwords=
+setlocal cinwords=xxx
+setglobal cinwords=
+setglobal cinwords=xxx
+set cinw=
+set cinw=xxx
+setlocal cinw=
+setlocal cinw=xxx
+setglobal cinw=
+setglobal cinw=xxx
+set cinwords&
+set cinw&
+if exists('l:saved')
+let [&g:cinwords, &l:cinwords] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_clipboard()
+if exists('+clipboard') && execute('set!') =~# '\n..clipboard\([=\n]\|$\)'
+let l:saved = [&g:clipboard, &l:clipboard]
+endif
+if exists('+clipboard')
+set clipboard=
+set clipboard=unnamed
+set clipboard=unnamedplus
+set clipboard=autoselect
+set clipboard=autoselectplus
+set clipboard=autoselectml
+set clipboard=html
+set clipboard=exclude:vimdisplay
+set clipboard=autoselect,unnamed
+set clipboard=unnamed,exclude:.*
+setlocal clipboard=
+setlocal clipboard=unnamed
+setlocal clipboard=unnamedplus
+setlocal clipboard=autoselect
+setlocal clipboard=autoselectplus
+setlocal clipboard=autoselectml
+setlocal clipboard=html
+setlocal clipboard=exclude:vimdisplay
+setlocal clipboard=autoselect,unnamed
+setlocal clipboard=unnamed,exclude:.*
+setglobal clipboard=
+setglobal clipboard=unnamed
+setglobal clipboard=unnamedplus
+setglobal clipboard=autoselect
+setglobal clipboard=autoselectplus
+setglobal clipboard=autoselectml
+setglobal clipboard=html
+setglobal clipboard=exclude:vimdisplay
+setglobal clipboard=autoselect,unnamed
+setglobal clipboard=unnamed,exclude:.*
+set cb=
+set cb=unnamed
+set cb=unnamedplus
+set cb=autoselect
+set cb=autoselectplus
+set cb=autoselectml
+set cb=html
+set cb=exclude:vimdisplay
+set cb=autoselect,unnamed
+set cb=unnamed,exclude:.*
+setlocal cb=
+setlocal cb=unnamed
+setlocal cb=unnamedplus
+setlocal cb=autoselect
+setlocal cb=autoselectplus
+setlocal cb=autoselectml
+setlocal cb=html
+setlocal cb=exclude:vimdisplay
+setlocal cb=autoselect,unnamed
+setlocal cb=unnamed,exclude:.*
+setglobal cb=
+setglobal cb=unnamed
+setglobal cb=unnamedplus
+setglobal cb=autoselect
+setglobal cb=autoselectplus
+setglobal cb=autoselectml
+setglobal cb=html
+setglobal cb=exclude:vimdisplay
+setglobal cb=autoselect,unnamed
+setglobal cb=unnamed,exclude:.*
+silent! call assert_fails('set clipboard=xxx')
+silent! call assert_fails('set clipboard=exclude:\\ze*')
+silent! call assert_fails('set clipboard=exclude:\\%(')
+silent! call assert_fails('setlocal clipboard=xxx')
+silent! call assert_fails('setlocal clipboard=exclude:\\ze*')
+silent! call assert_fails('setlocal clipboard=exclude:\\%(')
+silent! call assert_fails('setglobal clipboard=xxx')
+silent! call assert_fails('setglobal clipboard=exclude:\\ze*')
+silent! call assert_fails('setglobal clipboard=exclude:\\%(')
+silent! call assert_fails('set cb=xxx')
+silent! call assert_fails('set cb=exclude:\\ze*')
+silent! call assert_fails('set cb=exclude:\\%(')
+silent! call assert_fails('setlocal cb=xxx')
+silent! call assert_fails('setlocal cb=exclude:\\ze*')
+silent! call assert_fails('setlocal cb=exclude:\\%(')
+silent! call assert_fails('setglobal cb=xxx')
+silent! call assert_fails('setglobal cb=exclude:\\ze*')
+silent! call assert_fails('setglobal cb=exclude:\\%(')
+set clipboard&
+set cb&
+if exists('l:saved')
+let [&g:clipboard, &l:clipboard] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_clipmethod()
+if exists('+clipmethod') && execute('set!') =~# '\n..clipmethod\([=\n]\|$\)'
+let l:saved = [&g:clipmethod, &l:clipmethod]
+endif
+if exists('+clipmethod')
+set clipmethod=wayland
+set clipmethod=x11
+set clipmethod=wayland,x11
+set clipmethod=
+setlocal clipmethod=wayland
+setlocal clipmethod=x11
+setlocal clipmethod=wayland,x11
+setlocal clipmethod=
+setglobal clipmethod=wayland
+setglobal clipmethod=x11
+setglobal clipmethod=wayland,x11
+setglobal clipmethod=
+set cpm=wayland
+set cpm=x11
+set cpm=wayland,x11
+set cpm=
+setlocal cpm=wayland
+setlocal cpm=x11
+setlocal cpm=wayland,x11
+setlocal cpm=
+setglobal cpm=wayland
+setglobal cpm=x11
+setglobal cpm=wayland,x11
+setglobal cpm=
+silent! call assert_fails('set clipmethod=xxx')
+silent! call assert_fails('set clipmethod=--')
+silent! call assert_fails('set clipmethod=wayland,,')
+silent! call assert_fails('set clipmethod=,x11')
+silent! call assert_fails('setlocal clipmethod=xxx')
+silent! call assert_fails('setlocal clipmethod=--')
+silent! call assert_fails('setlocal clipmethod=wayland,,')
+silent! call assert_fails('setlocal clipmethod=,x11')
+silent! call assert_fails('setglobal clipmethod=xxx')
+silent! call assert_fails('setglobal clipmethod=--')
+silent! call assert_fails('setglobal clipmethod=wayland,,')
+silent! call assert_fails('setglobal clipmethod=,x11')
+silent! call assert_fails('set cpm=xxx')
+silent! call assert_fails('set cpm=--')
+silent! call assert_fails('set cpm=wayland,,')
+silent! call assert_fails('set cpm=,x11')
+silent! call assert_fails('setlocal cpm=xxx')
+silent! call assert_fails('setlocal cpm=--')
+silent! call assert_fails('setlocal cpm=wayland,,')
+silent! call assert_fails('setlocal cpm=,x11')
+silent! call assert_fails('setglobal cpm=xxx')
+silent! call assert_fails('setglobal cpm=--')
+silent! call assert_fails('setglobal cpm=wayland,,')
+silent! call assert_fails('setglobal cpm=,x11')
+set clipmethod&
+set cpm&
+if exists('l:saved')
+let [&g:clipmethod, &l:clipmethod] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cmdheight()
+if exists('+cmdheight') && execute('set!') =~# '\n..cmdheight\([=\n]\|$\)'
+let l:saved = [&g:cmdheight, &l:cmdheight]
+endif
+if exists('+cmdheight')
+set cmdheight=1
+set cmdheight=2
+set cmdheight=10
+setlocal cmdheight=1
+setlocal cmdheight=2
+setlocal cmdheight=10
+setglobal cmdheight=1
+setglobal cmdheight=2
+setglobal cmdheight=10
+set ch=1
+set ch=2
+set ch=10
+setlocal ch=1
+setlocal ch=2
+setlocal ch=10
+setglobal ch=1
+setglobal ch=2
+setglobal ch=10
+silent! call assert_fails('set cmdheight=-1')
+silent! call assert_fails('set cmdheight=0')
+silent! call assert_fails('setlocal cmdheight=-1')
+silent! call assert_fails('setlocal cmdheight=0')
+silent! call assert_fails('setglobal cmdheight=-1')
+silent! call assert_fails('setglobal cmdheight=0')
+silent! call assert_fails('set ch=-1')
+silent! call assert_fails('set ch=0')
+silent! call assert_fails('setlocal ch=-1')
+silent! call assert_fails('setlocal ch=0')
+silent! call assert_fails('setglobal ch=-1')
+silent! call assert_fails('setglobal ch=0')
+set cmdheight&
+set ch&
+if exists('l:saved')
+let [&g:cmdheight, &l:cmdheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cmdwinheight()
+if exists('+cmdwinheight') && execute('set!') =~# '\n..cmdwinheight\([=\n]\|$\)'
+let l:saved = [&g:cmdwinheight, &l:cmdwinheight]
+endif
+if exists('+cmdwinheight')
+set cmdwinheight=1
+set cmdwinheight=2
+set cmdwinheight=10
+setlocal cmdwinheight=1
+setlocal cmdwinheight=2
+setlocal cmdwinheight=10
+setglobal cmdwinheight=1
+setglobal cmdwinheight=2
+setglobal cmdwinheight=10
+set cwh=1
+set cwh=2
+set cwh=10
+setlocal cwh=1
+setlocal cwh=2
+setlocal cwh=10
+setglobal cwh=1
+setglobal cwh=2
+setglobal cwh=10
+silent! call assert_fails('set cmdwinheight=-1')
+silent! call assert_fails('set cmdwinheight=0')
+silent! call assert_fails('setlocal cmdwinheight=-1')
+silent! call assert_fails('setlocal cmdwinheight=0')
+silent! call assert_fails('setglobal cmdwinheight=-1')
+silent! call assert_fails('setglobal cmdwinheight=0')
+silent! call assert_fails('set cwh=-1')
+silent! call assert_fails('set cwh=0')
+silent! call assert_fails('setlocal cwh=-1')
+silent! call assert_fails('setlocal cwh=0')
+silent! call assert_fails('setglobal cwh=-1')
+silent! call assert_fails('setglobal cwh=0')
+set cmdwinheight&
+set cwh&
+if exists('l:saved')
+let [&g:cmdwinheight, &l:cmdwinheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_colorcolumn()
+if exists('+colorcolumn') && execute('set!') =~# '\n..colorcolumn\([=\n]\|$\)'
+let l:saved = [&g:colorcolumn, &l:colorcolumn]
+endif
+if exists('+colorcolumn')
+set colorcolumn=
+set colorcolumn=8
+set colorcolumn=+2
+set colorcolumn=1,+1,+3
+setlocal colorcolumn=
+setlocal colorcolumn=8
+setlocal colorcolumn=+2
+setlocal colorcolumn=1,+1,+3
+setglobal colorcolumn=
+setglobal colorcolumn=8
+setglobal colorcolumn=+2
+setglobal colorcolumn=1,+1,+3
+set cc=
+set cc=8
+set cc=+2
+set cc=1,+1,+3
+setlocal cc=
+setlocal cc=8
+setlocal cc=+2
+setlocal cc=1,+1,+3
+setglobal cc=
+setglobal cc=8
+setglobal cc=+2
+setglobal cc=1,+1,+3
+silent! call assert_fails('set colorcolumn=xxx')
+silent! call assert_fails('set colorcolumn=-a')
+silent! call assert_fails('set colorcolumn=1,')
+silent! call assert_fails('set colorcolumn=1;')
+silent! call assert_fails('setlocal colorcolumn=xxx')
+silent! call assert_fails('setlocal colorcolumn=-a')
+silent! call assert_fails('setlocal colorcolumn=1,')
+silent! call assert_fails('setlocal colorcolumn=1;')
+silent! call assert_fails('setglobal colorcolumn=xxx')
+silent! call assert_fails('setglobal colorcolumn=-a')
+silent! call assert_fails('setglobal colorcolumn=1,')
+silent! call assert_fails('setglobal colorcolumn=1;')
+silent! call assert_fails('set cc=xxx')
+silent! call assert_fails('set cc=-a')
+silent! call assert_fails('set cc=1,')
+silent! call assert_fails('set cc=1;')
+silent! call assert_fails('setlocal cc=xxx')
+silent! call assert_fails('setlocal cc=-a')
+silent! call assert_fails('setlocal cc=1,')
+silent! call assert_fails('setlocal cc=1;')
+silent! call assert_fails('setglobal cc=xxx')
+silent! call assert_fails('setglobal cc=-a')
+silent! call assert_fails('setglobal cc=1,')
+silent! call assert_fails('setglobal cc=1;')
+set colorcolumn&
+set cc&
+if exists('l:saved')
+let [&g:colorcolumn, &l:colorcolumn] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_columns()
+if exists('+columns') && execute('set!') =~# '\n..columns\([=\n]\|$\)'
+let l:saved = [&g:columns, &l:columns]
+endif
+set t_WS=
+let save_columns = &columns
+if exists('+columns')
+set columns=12
+set columns=80
+set columns=10000
+setlocal columns=12
+setlocal columns=80
+setlocal columns=10000
+setglobal columns=12
+setglobal columns=80
+setglobal columns=10000
+set co=12
+set co=80
+set co=10000
+setlocal co=12
+setlocal co=80
+setlocal co=10000
+setglobal co=12
+setglobal co=80
+setglobal co=10000
+silent! call assert_fails('set columns=-1')
+silent! call assert_fails('set columns=0')
+silent! call assert_fails('set columns=10')
+silent! call assert_fails('setlocal columns=-1')
+silent! call assert_fails('setlocal columns=0')
+silent! call assert_fails('setlocal columns=10')
+silent! call assert_fails('setglobal columns=-1')
+silent! call assert_fails('setglobal columns=0')
+silent! call assert_fails('setglobal columns=10')
+silent! call assert_fails('set co=-1')
+silent! call assert_fails('set co=0')
+silent! call assert_fails('set co=10')
+silent! call assert_fails('setlocal co=-1')
+silent! call assert_fails('setlocal co=0')
+silent! call assert_fails('setlocal co=10')
+silent! call assert_fails('setglobal co=-1')
+silent! call assert_fails('setglobal co=0')
+silent! call assert_fails('setglobal co=10')
+set columns&
+set co&
+if exists('l:saved')
+let [&g:columns, &l:columns] = l:saved
+endif
+endif
+let &columns = save_columns
+set t_WS&
+endfunc
+func Test_opt_set_comments()
+if exists('+comments') && execute('set!') =~# '\n..comments\([=\n]\|$\)'
+let l:saved = [&g:comments, &l:comments]
+endif
+if exists('+comments')
+set comments=
+set comments=b:#
+set comments=b:#,:%
+setlocal comments=
+setlocal comments=b:#
+setlocal comments=b:#,:%
+setglobal comments=
+setglobal comments=b:#
+setglobal comments=b:#,:%
+set com=
+set com=b:#
+set com=b:#,:%
+setlocal com=
+setlocal com=b:#
+setlocal com=b:#,:%
+setglobal com=
+setglobal com=b:#
+setglobal com=b:#,:%
+silent! call assert_fails('set comments=xxx')
+silent! call assert_fails('set comments=-')
+silent! call assert_fails('setlocal comments=xxx')
+silent! call assert_fails('setlocal comments=-')
+silent! call assert_fails('setglobal comments=xxx')
+silent! call assert_fails('setglobal comments=-')
+silent! call assert_fails('set com=xxx')
+silent! call assert_fails('set com=-')
+silent! call assert_fails('setlocal com=xxx')
+silent! call assert_fails('setlocal com=-')
+silent! call assert_fails('setglobal com=xxx')
+silent! call assert_fails('setglobal com=-')
+set comments&
+set com&
+if exists('l:saved')
+let [&g:comments, &l:comments] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_commentstring()
+if exists('+commentstring') && execute('set!') =~# '\n..commentstring\([=\n]\|$\)'
+let l:saved = [&g:commentstring, &l:commentstring]
+endif
+if exists('+commentstring')
+set commentstring=
+set commentstring=/*\ %s\ */
+setlocal commentstring=
+setlocal commentstring=/*\ %s\ */
+setglobal commentstring=
+setglobal commentstring=/*\ %s\ */
+set cms=
+set cms=/*\ %s\ */
+setlocal cms=
+setlocal cms=/*\ %s\ */
+setglobal cms=
+setglobal cms=/*\ %s\ */
+silent! call assert_fails('set commentstring=xxx')
+silent! call assert_fails('setlocal commentstring=xxx')
+silent! call assert_fails('setglobal commentstring=xxx')
+silent! call assert_fails('set cms=xxx')
+silent! call assert_fails('setlocal cms=xxx')
+silent! call assert_fails('setglobal cms=xxx')
+set commentstring&
+set cms&
+if exists('l:saved')
+let [&g:commentstring, &l:commentstring] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_compatible()
+if exists('+compatible') && execute('set!') =~# '\n..compatible\([=\n]\|$\)'
+let l:saved = [&g:compatible, &l:compatible]
+endif
+if exists('+compatible')
+set compatible
+set nocompatible
+set invcompatible
+set compatible!
+setlocal compatible
+setlocal nocompatible
+setlocal invcompatible
+setlocal compatible!
+setglobal compatible
+setglobal nocompatible
+setglobal invcompatible
+setglobal compatible!
+set cp
+set nocp
+set invcp
+set cp!
+setlocal cp
+setlocal nocp
+setlocal invcp
+setlocal cp!
+setglobal cp
+setglobal nocp
+setglobal invcp
+setglobal cp!
+set compatible&
+set cp&
+if exists('l:saved')
+let [&g:compatible, &l:compatible] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_complete()
+if exists('+complete') && execute('set!') =~# '\n..complete\([=\n]\|$\)'
+let l:saved = [&g:complete, &l:complete]
+endif
+if exists('+complete')
+set complete=
+set complete=.
+set complete=w
+set complete=b
+set complete=u
+set complete=U
+set complete=i
+set complete=d
+set complete=]
+set complete=t
+set complete=k
+set complete=kspell
+set complete=k/tmp/dir\\\ with\\\ space/*
+set complete=s
+set complete=s/tmp/dir\\\ with\\\ space/*
+set complete=w,b,k/tmp/dir\\\ with\\\ space/*,s
+setlocal complete=
+setlocal complete=.
+setlocal complete=w
+setlocal complete=b
+setlocal complete=u
+setlocal complete=U
+setlocal complete=i
+setlocal complete=d
+setlocal complete=]
+setlocal complete=t
+setlocal complete=k
+setlocal complete=kspell
+setlocal complete=k/tmp/dir\\\ with\\\ space/*
+setlocal complete=s
+setlocal complete=s/tmp/dir\\\ with\\\ space/*
+setlocal complete=w,b,k/tmp/dir\\\ with\\\ space/*,s
+setglobal complete=
+setglobal complete=.
+setglobal complete=w
+setglobal complete=b
+setglobal complete=u
+setglobal complete=U
+setglobal complete=i
+setglobal complete=d
+setglobal complete=]
+setglobal complete=t
+setglobal complete=k
+setglobal complete=kspell
+setglobal complete=k/tmp/dir\\\ with\\\ space/*
+setglobal complete=s
+setglobal complete=s/tmp/dir\\\ with\\\ space/*
+setglobal complete=w,b,k/tmp/dir\\\ with\\\ space/*,s
+set cpt=
+set cpt=.
+set cpt=w
+set cpt=b
+set cpt=u
+set cpt=U
+set cpt=i
+set cpt=d
+set cpt=]
+set cpt=t
+set cpt=k
+set cpt=kspell
+set cpt=k/tmp/dir\\\ with\\\ space/*
+set cpt=s
+set cpt=s/tmp/dir\\\ with\\\ space/*
+set cpt=w,b,k/tmp/dir\\\ with\\\ space/*,s
+setlocal cpt=
+setlocal cpt=.
+setlocal cpt=w
+setlocal cpt=b
+setlocal cpt=u
+setlocal cpt=U
+setlocal cpt=i
+setlocal cpt=d
+setlocal cpt=]
+setlocal cpt=t
+setlocal cpt=k
+setlocal cpt=kspell
+setlocal cpt=k/tmp/dir\\\ with\\\ space/*
+setlocal cpt=s
+setlocal cpt=s/tmp/dir\\\ with\\\ space/*
+setlocal cpt=w,b,k/tmp/dir\\\ with\\\ space/*,s
+setglobal cpt=
+setglobal cpt=.
+setglobal cpt=w
+setglobal cpt=b
+setglobal cpt=u
+setglobal cpt=U
+setglobal cpt=i
+setglobal cpt=d
+setglobal cpt=]
+setglobal cpt=t
+setglobal cpt=k
+setglobal cpt=kspell
+setglobal cpt=k/tmp/dir\\\ with\\\ space/*
+setglobal cpt=s
+setglobal cpt=s/tmp/dir\\\ with\\\ space/*
+setglobal cpt=w,b,k/tmp/dir\\\ with\\\ space/*,s
+silent! call assert_fails('set complete=xxx')
+silent! call assert_fails('setlocal complete=xxx')
+silent! call assert_fails('setglobal complete=xxx')
+silent! call assert_fails('set cpt=xxx')
+silent! call assert_fails('setlocal cpt=xxx')
+silent! call assert_fails('setglobal cpt=xxx')
+set complete&
+set cpt&
+if exists('l:saved')
+let [&g:complete, &l:complete] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_completefunc()
+if exists('+completefunc') && execute('set!') =~# '\n..completefunc\([=\n]\|$\)'
+let l:saved = [&g:completefunc, &l:completefunc]
+endif
+if exists('+completefunc')
+set completefunc=
+set completefunc=xxx
+setlocal completefunc=
+setlocal completefunc=xxx
+setglobal completefunc=
+setglobal completefunc=xxx
+set cfu=
+set cfu=xxx
+setlocal cfu=
+setlocal cfu=xxx
+setglobal cfu=
+setglobal cfu=xxx
+set completefunc&
+set cfu&
+if exists('l:saved')
+let [&g:completefunc, &l:completefunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_completefuzzycollect()
+if exists('+completefuzzycollect') && execute('set!') =~# '\n..completefuzzycollect\([=\n]\|$\)'
+let l:saved = [&g:completefuzzycollect, &l:completefuzzycollect]
+endif
+if exists('+completefuzzycollect')
+set completefuzzycollect=
+set completefuzzycollect=keyword
+set completefuzzycollect=files
+set completefuzzycollect=whole_line
+set completefuzzycollect=keyword,whole_line
+set completefuzzycollect=files,whole_line
+set completefuzzycollect=keyword,files,whole_line
+setlocal completefuzzycollect=
+setlocal completefuzzycollect=keyword
+setlocal completefuzzycollect=files
+setlocal completefuzzycollect=whole_line
+setlocal completefuzzycollect=keyword,whole_line
+setlocal completefuzzycollect=files,whole_line
+setlocal completefuzzycollect=keyword,files,whole_line
+setglobal completefuzzycollect=
+setglobal completefuzzycollect=keyword
+setglobal completefuzzycollect=files
+setglobal completefuzzycollect=whole_line
+setglobal completefuzzycollect=keyword,whole_line
+setglobal completefuzzycollect=files,whole_line
+setglobal completefuzzycollect=keyword,files,whole_line
+set cfc=
+set cfc=keyword
+set cfc=files
+set cfc=whole_line
+set cfc=keyword,whole_line
+set cfc=files,whole_line
+set cfc=keyword,files,whole_line
+setlocal cfc=
+setlocal cfc=keyword
+setlocal cfc=files
+setlocal cfc=whole_line
+setlocal cfc=keyword,whole_line
+setlocal cfc=files,whole_line
+setlocal cfc=keyword,files,whole_line
+setglobal cfc=
+setglobal cfc=keyword
+setglobal cfc=files
+setglobal cfc=whole_line
+setglobal cfc=keyword,whole_line
+setglobal cfc=files,whole_line
+setglobal cfc=keyword,files,whole_line
+silent! call assert_fails('set completefuzzycollect=xxx')
+silent! call assert_fails('set completefuzzycollect=keyword,,,whole_line,')
+silent! call assert_fails('setlocal completefuzzycollect=xxx')
+silent! call assert_fails('setlocal completefuzzycollect=keyword,,,whole_line,')
+silent! call assert_fails('setglobal completefuzzycollect=xxx')
+silent! call assert_fails('setglobal completefuzzycollect=keyword,,,whole_line,')
+silent! call assert_fails('set cfc=xxx')
+silent! call assert_fails('set cfc=keyword,,,whole_line,')
+silent! call assert_fails('setlocal cfc=xxx')
+silent! call assert_fails('setlocal cfc=keyword,,,whole_line,')
+silent! call assert_fails('setglobal cfc=xxx')
+silent! call assert_fails('setglobal cfc=keyword,,,whole_line,')
+set completefuzzycollect&
+set cfc&
+if exists('l:saved')
+let [&g:completefuzzycollect, &l:completefuzzycollect] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_completeitemalign()
+if exists('+completeitemalign') && execute('set!') =~# '\n..completeitemalign\([=\n]\|$\)'
+let l:saved = [&g:completeitemalign, &l:completeitemalign]
+endif
+if exists('+completeitemalign')
+set completeitemalign=abbr,kind,menu
+set completeitemalign=menu,abbr,kind
+setlocal completeitemalign=abbr,kind,menu
+setlocal completeitemalign=menu,abbr,kind
+setglobal completeitemalign=abbr,kind,menu
+setglobal completeitemalign=menu,abbr,kind
+set cia=abbr,kind,menu
+set cia=menu,abbr,kind
+setlocal cia=abbr,kind,menu
+setlocal cia=menu,abbr,kind
+setglobal cia=abbr,kind,menu
+setglobal cia=menu,abbr,kind
+silent! call assert_fails('set completeitemalign=')
+silent! call assert_fails('set completeitemalign=xxx')
+silent! call assert_fails('set completeitemalign=abbr')
+silent! call assert_fails('set completeitemalign=abbr,menu')
+silent! call assert_fails('set completeitemalign=abbr,menu,kind,abbr')
+silent! call assert_fails('set completeitemalign=abbr1234,kind,menu')
+silent! call assert_fails('setlocal completeitemalign=')
+silent! call assert_fails('setlocal completeitemalign=xxx')
+silent! call assert_fails('setlocal completeitemalign=abbr')
+silent! call assert_fails('setlocal completeitemalign=abbr,menu')
+silent! call assert_fails('setlocal completeitemalign=abbr,menu,kind,abbr')
+silent! call assert_fails('setlocal completeitemalign=abbr1234,kind,menu')
+silent! call assert_fails('setglobal completeitemalign=')
+silent! call assert_fails('setglobal completeitemalign=xxx')
+silent! call assert_fails('setglobal completeitemalign=abbr')
+silent! call assert_fails('setglobal completeitemalign=abbr,menu')
+silent! call assert_fails('setglobal completeitemalign=abbr,menu,kind,abbr')
+silent! call assert_fails('setglobal completeitemalign=abbr1234,kind,menu')
+silent! call assert_fails('set cia=')
+silent! call assert_fails('set cia=xxx')
+silent! call assert_fails('set cia=abbr')
+silent! call assert_fails('set cia=abbr,menu')
+silent! call assert_fails('set cia=abbr,menu,kind,abbr')
+silent! call assert_fails('set cia=abbr1234,kind,menu')
+silent! call assert_fails('setlocal cia=')
+silent! call assert_fails('setlocal cia=xxx')
+silent! call assert_fails('setlocal cia=abbr')
+silent! call assert_fails('setlocal cia=abbr,menu')
+silent! call assert_fails('setlocal cia=abbr,menu,kind,abbr')
+silent! call assert_fails('setlocal cia=abbr1234,kind,menu')
+silent! call assert_fails('setglobal cia=')
+silent! call assert_fails('setglobal cia=xxx')
+silent! call assert_fails('setglobal cia=abbr')
+silent! call assert_fails('setglobal cia=abbr,menu')
+silent! call assert_fails('setglobal cia=abbr,menu,kind,abbr')
+silent! call assert_fails('setglobal cia=abbr1234,kind,menu')
+set completeitemalign&
+set cia&
+if exists('l:saved')
+let [&g:completeitemalign, &l:completeitemalign] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_completeopt()
+if exists('+completeopt') && execute('set!') =~# '\n..completeopt\([=\n]\|$\)'
+let l:saved = [&g:completeopt, &l:completeopt]
+endif
+if exists('+completeopt')
+set completeopt=
+set completeopt=menu
+set completeopt=menuone
+set completeopt=longest
+set completeopt=preview
+set completeopt=popup
+set completeopt=popuphidden
+set completeopt=noinsert
+set completeopt=noselect
+set completeopt=fuzzy
+set completeopt=preinsert
+set completeopt=menu,longest
+setlocal completeopt=
+setlocal completeopt=menu
+setlocal completeopt=menuone
+setlocal completeopt=longest
+setlocal completeopt=preview
+setlocal completeopt=popup
+setlocal completeopt=popuphidden
+setlocal completeopt=noinsert
+setlocal completeopt=noselect
+setlocal completeopt=fuzzy
+setlocal completeopt=preinsert
+setlocal completeopt=menu,longest
+setglobal completeopt=
+setglobal completeopt=menu
+setglobal completeopt=menuone
+setglobal completeopt=longest
+setglobal completeopt=preview
+setglobal completeopt=popup
+setglobal completeopt=popuphidden
+setglobal completeopt=noinsert
+setglobal completeopt=noselect
+setglobal completeopt=fuzzy
+setglobal completeopt=preinsert
+setglobal completeopt=menu,longest
+setlocal completeopt=
+call assert_equal(&g:completeopt, &completeopt)
+set cot=
+set cot=menu
+set cot=menuone
+set cot=longest
+set cot=preview
+set cot=popup
+set cot=popuphidden
+set cot=noinsert
+set cot=noselect
+set cot=fuzzy
+set cot=preinsert
+set cot=menu,longest
+setlocal cot=
+setlocal cot=menu
+setlocal cot=menuone
+setlocal cot=longest
+setlocal cot=preview
+setlocal cot=popup
+setlocal cot=popuphidden
+setlocal cot=noinsert
+setlocal cot=noselect
+setlocal cot=fuzzy
+setlocal cot=preinsert
+setlocal cot=menu,longest
+setglobal cot=
+setglobal cot=menu
+setglobal cot=menuone
+setglobal cot=longest
+setglobal cot=preview
+setglobal cot=popup
+setglobal cot=popuphidden
+setglobal cot=noinsert
+setglobal cot=noselect
+setglobal cot=fuzzy
+setglobal cot=preinsert
+setglobal cot=menu,longest
+setlocal cot=
+call assert_equal(&g:completeopt, &completeopt)
+silent! call assert_fails('set completeopt=xxx')
+silent! call assert_fails('set completeopt=menu,,,longest,')
+silent! call assert_fails('setlocal completeopt=xxx')
+silent! call assert_fails('setlocal completeopt=menu,,,longest,')
+silent! call assert_fails('setglobal completeopt=xxx')
+silent! call assert_fails('setglobal completeopt=menu,,,longest,')
+silent! call assert_fails('set cot=xxx')
+silent! call assert_fails('set cot=menu,,,longest,')
+silent! call assert_fails('setlocal cot=xxx')
+silent! call assert_fails('setlocal cot=menu,,,longest,')
+silent! call assert_fails('setglobal cot=xxx')
+silent! call assert_fails('setglobal cot=menu,,,longest,')
+set completeopt&
+set cot&
+if exists('l:saved')
+let [&g:completeopt, &l:completeopt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_completepopup()
+if exists('+completepopup') && execute('set!') =~# '\n..completepopup\([=\n]\|$\)'
+let l:saved = [&g:completepopup, &l:completepopup]
+endif
+if exists('+completepopup')
+set completepopup=
+set completepopup=height:13
+set completepopup=width:20
+set completepopup=highlight:That
+set completepopup=align:item
+set completepopup=align:menu
+set completepopup=border:on
+set completepopup=border:off
+set completepopup=width:10,height:234,highlight:Mine
+setlocal completepopup=
+setlocal completepopup=height:13
+setlocal completepopup=width:20
+setlocal completepopup=highlight:That
+setlocal completepopup=align:item
+setlocal completepopup=align:menu
+setlocal completepopup=border:on
+setlocal completepopup=border:off
+setlocal completepopup=width:10,height:234,highlight:Mine
+setglobal completepopup=
+setglobal completepopup=height:13
+setglobal completepopup=width:20
+setglobal completepopup=highlight:That
+setglobal completepopup=align:item
+setglobal completepopup=align:menu
+setglobal completepopup=border:on
+setglobal completepopup=border:off
+setglobal completepopup=width:10,height:234,highlight:Mine
+set cpp=
+set cpp=height:13
+set cpp=width:20
+set cpp=highlight:That
+set cpp=align:item
+set cpp=align:menu
+set cpp=border:on
+set cpp=border:off
+set cpp=width:10,height:234,highlight:Mine
+setlocal cpp=
+setlocal cpp=height:13
+setlocal cpp=width:20
+setlocal cpp=highlight:That
+setlocal cpp=align:item
+setlocal cpp=align:menu
+setlocal cpp=border:on
+setlocal cpp=border:off
+setlocal cpp=width:10,height:234,highlight:Mine
+setglobal cpp=
+setglobal cpp=height:13
+setglobal cpp=width:20
+setglobal cpp=highlight:That
+setglobal cpp=align:item
+setglobal cpp=align:menu
+setglobal cpp=border:on
+setglobal cpp=border:off
+setglobal cpp=width:10,height:234,highlight:Mine
+silent! call assert_fails('set completepopup=xxx')
+silent! call assert_fails('set completepopup=xxx:99')
+silent! call assert_fails('set completepopup=height:yes')
+silent! call assert_fails('set completepopup=width:no')
+silent! call assert_fails('set completepopup=align:xxx')
+silent! call assert_fails('set completepopup=border:maybe')
+silent! call assert_fails('set completepopup=border:1')
+silent! call assert_fails('set completepopup=border:')
+silent! call assert_fails('setlocal completepopup=xxx')
+silent! call assert_fails('setlocal completepopup=xxx:99')
+silent! call assert_fails('setlocal completepopup=height:yes')
+silent! call assert_fails('setlocal completepopup=width:no')
+silent! call assert_fails('setlocal completepopup=align:xxx')
+silent! call assert_fails('setlocal completepopup=border:maybe')
+silent! call assert_fails('setlocal completepopup=border:1')
+silent! call assert_fails('setlocal completepopup=border:')
+silent! call assert_fails('setglobal completepopup=xxx')
+silent! call assert_fails('setglobal completepopup=xxx:99')
+silent! call assert_fails('setglobal completepopup=height:yes')
+silent! call assert_fails('setglobal completepopup=width:no')
+silent! call assert_fails('setglobal completepopup=align:xxx')
+silent! call assert_fails('setglobal completepopup=border:maybe')
+silent! call assert_fails('setglobal completepopup=border:1')
+silent! call assert_fails('setglobal completepopup=border:')
+silent! call assert_fails('set cpp=xxx')
+silent! call assert_fails('set cpp=xxx:99')
+silent! call assert_fails('set cpp=height:yes')
+silent! call assert_fails('set cpp=width:no')
+silent! call assert_fails('set cpp=align:xxx')
+silent! call assert_fails('set cpp=border:maybe')
+silent! call assert_fails('set cpp=border:1')
+silent! call assert_fails('set cpp=border:')
+silent! call assert_fails('setlocal cpp=xxx')
+silent! call assert_fails('setlocal cpp=xxx:99')
+silent! call assert_fails('setlocal cpp=height:yes')
+silent! call assert_fails('setlocal cpp=width:no')
+silent! call assert_fails('setlocal cpp=align:xxx')
+silent! call assert_fails('setlocal cpp=border:maybe')
+silent! call assert_fails('setlocal cpp=border:1')
+silent! call assert_fails('setlocal cpp=border:')
+silent! call assert_fails('setglobal cpp=xxx')
+silent! call assert_fails('setglobal cpp=xxx:99')
+silent! call assert_fails('setglobal cpp=height:yes')
+silent! call assert_fails('setglobal cpp=width:no')
+silent! call assert_fails('setglobal cpp=align:xxx')
+silent! call assert_fails('setglobal cpp=border:maybe')
+silent! call assert_fails('setglobal cpp=border:1')
+silent! call assert_fails('setglobal cpp=border:')
+set completepopup&
+set cpp&
+if exists('l:saved')
+let [&g:completepopup, &l:completepopup] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_completeslash()
+if exists('+completeslash') && execute('set!') =~# '\n..completeslash\([=\n]\|$\)'
+let l:saved = [&g:completeslash, &l:completeslash]
+endif
+if exists('+completeslash')
+set completeslash=
+set completeslash=slash
+set completeslash=backslash
+setlocal completeslash=
+setlocal completeslash=slash
+setlocal completeslash=backslash
+setglobal completeslash=
+setglobal completeslash=slash
+setglobal completeslash=backslash
+set csl=
+set csl=slash
+set csl=backslash
+setlocal csl=
+setlocal csl=slash
+setlocal csl=backslash
+setglobal csl=
+setglobal csl=slash
+setglobal csl=backslash
+silent! call assert_fails('set completeslash=xxx')
+silent! call assert_fails('setlocal completeslash=xxx')
+silent! call assert_fails('setglobal completeslash=xxx')
+silent! call assert_fails('set csl=xxx')
+silent! call assert_fails('setlocal csl=xxx')
+silent! call assert_fails('setglobal csl=xxx')
+set completeslash&
+set csl&
+if exists('l:saved')
+let [&g:completeslash, &l:completeslash] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_concealcursor()
+if exists('+concealcursor') && execute('set!') =~# '\n..concealcursor\([=\n]\|$\)'
+let l:saved = [&g:concealcursor, &l:concealcursor]
+endif
+if exists('+concealcursor')
+set concealcursor=
+set concealcursor=n
+set concealcursor=v
+set concealcursor=i
+set concealcursor=c
+set concealcursor=nvic
+setlocal concealcursor=
+setlocal concealcursor=n
+setlocal concealcursor=v
+setlocal concealcursor=i
+setlocal concealcursor=c
+setlocal concealcursor=nvic
+setglobal concealcursor=
+setglobal concealcursor=n
+setglobal concealcursor=v
+setglobal concealcursor=i
+setglobal concealcursor=c
+setglobal concealcursor=nvic
+set cocu=
+set cocu=n
+set cocu=v
+set cocu=i
+set cocu=c
+set cocu=nvic
+setlocal cocu=
+setlocal cocu=n
+setlocal cocu=v
+setlocal cocu=i
+setlocal cocu=c
+setlocal cocu=nvic
+setglobal cocu=
+setglobal cocu=n
+setglobal cocu=v
+setglobal cocu=i
+setglobal cocu=c
+setglobal cocu=nvic
+silent! call assert_fails('set concealcursor=xxx')
+silent! call assert_fails('setlocal concealcursor=xxx')
+silent! call assert_fails('setglobal concealcursor=xxx')
+silent! call assert_fails('set cocu=xxx')
+silent! call assert_fails('setlocal cocu=xxx')
+silent! call assert_fails('setglobal cocu=xxx')
+set concealcursor&
+set cocu&
+if exists('l:saved')
+let [&g:concealcursor, &l:concealcursor] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_conceallevel()
+if exists('+conceallevel') && execute('set!') =~# '\n..conceallevel\([=\n]\|$\)'
+let l:saved = [&g:conceallevel, &l:conceallevel]
+endif
+if exists('+conceallevel')
+set conceallevel=0
+set conceallevel=1
+set conceallevel=2
+set conceallevel=3
+setlocal conceallevel=0
+setlocal conceallevel=1
+setlocal conceallevel=2
+setlocal conceallevel=3
+setglobal conceallevel=0
+setglobal conceallevel=1
+setglobal conceallevel=2
+setglobal conceallevel=3
+set cole=0
+set cole=1
+set cole=2
+set cole=3
+setlocal cole=0
+setlocal cole=1
+setlocal cole=2
+setlocal cole=3
+setglobal cole=0
+setglobal cole=1
+setglobal cole=2
+setglobal cole=3
+silent! call assert_fails('set conceallevel=-1')
+silent! call assert_fails('set conceallevel=4')
+silent! call assert_fails('set conceallevel=99')
+silent! call assert_fails('setlocal conceallevel=-1')
+silent! call assert_fails('setlocal conceallevel=4')
+silent! call assert_fails('setlocal conceallevel=99')
+silent! call assert_fails('setglobal conceallevel=-1')
+silent! call assert_fails('setglobal conceallevel=4')
+silent! call assert_fails('setglobal conceallevel=99')
+silent! call assert_fails('set cole=-1')
+silent! call assert_fails('set cole=4')
+silent! call assert_fails('set cole=99')
+silent! call assert_fails('setlocal cole=-1')
+silent! call assert_fails('setlocal cole=4')
+silent! call assert_fails('setlocal cole=99')
+silent! call assert_fails('setglobal cole=-1')
+silent! call assert_fails('setglobal cole=4')
+silent! call assert_fails('setglobal cole=99')
+set conceallevel&
+set cole&
+if exists('l:saved')
+let [&g:conceallevel, &l:conceallevel] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_confirm()
+if exists('+confirm') && execute('set!') =~# '\n..confirm\([=\n]\|$\)'
+let l:saved = [&g:confirm, &l:confirm]
+endif
+if exists('+confirm')
+set confirm
+set noconfirm
+set invconfirm
+set confirm!
+setlocal confirm
+setlocal noconfirm
+setlocal invconfirm
+setlocal confirm!
+setglobal confirm
+setglobal noconfirm
+setglobal invconfirm
+setglobal confirm!
+set cf
+set nocf
+set invcf
+set cf!
+setlocal cf
+setlocal nocf
+setlocal invcf
+setlocal cf!
+setglobal cf
+setglobal nocf
+setglobal invcf
+setglobal cf!
+set confirm&
+set cf&
+if exists('l:saved')
+let [&g:confirm, &l:confirm] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_conskey()
+if exists('+conskey') && execute('set!') =~# '\n..conskey\([=\n]\|$\)'
+let l:saved = [&g:conskey, &l:conskey]
+endif
+if exists('+conskey')
+set conskey
+set noconskey
+set invconskey
+set conskey!
+setlocal conskey
+setlocal noconskey
+setlocal invconskey
+setlocal conskey!
+setglobal conskey
+setglobal noconskey
+setglobal invconskey
+setglobal conskey!
+set consk
+set noconsk
+set invconsk
+set consk!
+setlocal consk
+setlocal noconsk
+setlocal invconsk
+setlocal consk!
+setglobal consk
+setglobal noconsk
+setglobal invconsk
+setglobal consk!
+set conskey&
+set consk&
+if exists('l:saved')
+let [&g:conskey, &l:conskey] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_copyindent()
+if exists('+copyindent') && execute('set!') =~# '\n..copyindent\([=\n]\|$\)'
+let l:saved = [&g:copyindent, &l:copyindent]
+endif
+if exists('+copyindent')
+set copyindent
+set nocopyindent
+set invcopyindent
+set copyindent!
+setlocal copyindent
+setlocal nocopyindent
+setlocal invcopyindent
+setlocal copyindent!
+setglobal copyindent
+setglobal nocopyindent
+setglobal invcopyindent
+setglobal copyindent!
+set ci
+set noci
+set invci
+set ci!
+setlocal ci
+setlocal noci
+setlocal invci
+setlocal ci!
+setglobal ci
+setglobal noci
+setglobal invci
+setglobal ci!
+set copyindent&
+set ci&
+if exists('l:saved')
+let [&g:copyindent, &l:copyindent] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cpoptions()
+if exists('+cpoptions') && execute('set!') =~# '\n..cpoptions\([=\n]\|$\)'
+let l:saved = [&g:cpoptions, &l:cpoptions]
+endif
+if exists('+cpoptions')
+set cpoptions=
+set cpoptions=xxx
+setlocal cpoptions=
+setlocal cpoptions=xxx
+setglobal cpoptions=
+setglobal cpoptions=xxx
+set cpo=
+set cpo=xxx
+setlocal cpo=
+setlocal cpo=xxx
+setglobal cpo=
+setglobal cpo=xxx
+set cpoptions&
+set cpo&
+if exists('l:saved')
+let [&g:cpoptions, &l:cpoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cryptmethod()
+if exists('+cryptmethod') && execute('set!') =~# '\n..cryptmethod\([=\n]\|$\)'
+let l:saved = [&g:cryptmethod, &l:cryptmethod]
+endif
+if exists('+cryptmethod')
+set cryptmethod=
+set cryptmethod=zip
+setlocal cryptmethod=
+setlocal cryptmethod=zip
+setglobal cryptmethod=
+setglobal cryptmethod=zip
+setlocal cryptmethod=
+call assert_equal(&g:cryptmethod, &cryptmethod)
+set cm=
+set cm=zip
+setlocal cm=
+setlocal cm=zip
+setglobal cm=
+setglobal cm=zip
+setlocal cm=
+call assert_equal(&g:cryptmethod, &cryptmethod)
+silent! call assert_fails('set cryptmethod=xxx')
+silent! call assert_fails('setlocal cryptmethod=xxx')
+silent! call assert_fails('setglobal cryptmethod=xxx')
+silent! call assert_fails('set cm=xxx')
+silent! call assert_fails('setlocal cm=xxx')
+silent! call assert_fails('setglobal cm=xxx')
+set cryptmethod&
+set cm&
+if exists('l:saved')
+let [&g:cryptmethod, &l:cryptmethod] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cscopepathcomp()
+if exists('+cscopepathcomp') && execute('set!') =~# '\n..cscopepathcomp\([=\n]\|$\)'
+let l:saved = [&g:cscopepathcomp, &l:cscopepathcomp]
+endif
+if exists('+cscopepathcomp')
+set cscopepathcomp=-1
+set cscopepathcomp=0
+set cscopepathcomp=100
+setlocal cscopepathcomp=-1
+setlocal cscopepathcomp=0
+setlocal cscopepathcomp=100
+setglobal cscopepathcomp=-1
+setglobal cscopepathcomp=0
+setglobal cscopepathcomp=100
+set cspc=-1
+set cspc=0
+set cspc=100
+setlocal cspc=-1
+setlocal cspc=0
+setlocal cspc=100
+setglobal cspc=-1
+setglobal cspc=0
+setglobal cspc=100
+silent! call assert_fails('set cscopepathcomp=')
+silent! call assert_fails('setlocal cscopepathcomp=')
+silent! call assert_fails('setglobal cscopepathcomp=')
+silent! call assert_fails('set cspc=')
+silent! call assert_fails('setlocal cspc=')
+silent! call assert_fails('setglobal cspc=')
+set cscopepathcomp&
+set cspc&
+if exists('l:saved')
+let [&g:cscopepathcomp, &l:cscopepathcomp] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cscopeprg()
+if exists('+cscopeprg') && execute('set!') =~# '\n..cscopeprg\([=\n]\|$\)'
+let l:saved = [&g:cscopeprg, &l:cscopeprg]
+endif
+if exists('+cscopeprg')
+set cscopeprg=
+set cscopeprg=xxx
+setlocal cscopeprg=
+setlocal cscopeprg=xxx
+setglobal cscopeprg=
+setglobal cscopeprg=xxx
+set csprg=
+set csprg=xxx
+setlocal csprg=
+setlocal csprg=xxx
+setglobal csprg=
+setglobal csprg=xxx
+set cscopeprg&
+set csprg&
+if exists('l:saved')
+let [&g:cscopeprg, &l:cscopeprg] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cscopequickfix()
+if exists('+cscopequickfix') && execute('set!') =~# '\n..cscopequickfix\([=\n]\|$\)'
+let l:saved = [&g:cscopequickfix, &l:cscopequickfix]
+endif
+if exists('+cscopequickfix')
+set cscopequickfix=
+set cscopequickfix=s-
+set cscopequickfix=g-
+set cscopequickfix=d-
+set cscopequickfix=c-
+set cscopequickfix=t-
+set cscopequickfix=e-
+set cscopequickfix=f-
+set cscopequickfix=i-
+set cscopequickfix=a-
+set cscopequickfix=s-,c+,e0
+setlocal cscopequickfix=
+setlocal cscopequickfix=s-
+setlocal cscopequickfix=g-
+setlocal cscopequickfix=d-
+setlocal cscopequickfix=c-
+setlocal cscopequickfix=t-
+setlocal cscopequickfix=e-
+setlocal cscopequickfix=f-
+setlocal cscopequickfix=i-
+setlocal cscopequickfix=a-
+setlocal cscopequickfix=s-,c+,e0
+setglobal cscopequickfix=
+setglobal cscopequickfix=s-
+setglobal cscopequickfix=g-
+setglobal cscopequickfix=d-
+setglobal cscopequickfix=c-
+setglobal cscopequickfix=t-
+setglobal cscopequickfix=e-
+setglobal cscopequickfix=f-
+setglobal cscopequickfix=i-
+setglobal cscopequickfix=a-
+setglobal cscopequickfix=s-,c+,e0
+set csqf=
+set csqf=s-
+set csqf=g-
+set csqf=d-
+set csqf=c-
+set csqf=t-
+set csqf=e-
+set csqf=f-
+set csqf=i-
+set csqf=a-
+set csqf=s-,c+,e0
+setlocal csqf=
+setlocal csqf=s-
+setlocal csqf=g-
+setlocal csqf=d-
+setlocal csqf=c-
+setlocal csqf=t-
+setlocal csqf=e-
+setlocal csqf=f-
+setlocal csqf=i-
+setlocal csqf=a-
+setlocal csqf=s-,c+,e0
+setglobal csqf=
+setglobal csqf=s-
+setglobal csqf=g-
+setglobal csqf=d-
+setglobal csqf=c-
+setglobal csqf=t-
+setglobal csqf=e-
+setglobal csqf=f-
+setglobal csqf=i-
+setglobal csqf=a-
+setglobal csqf=s-,c+,e0
+silent! call assert_fails('set cscopequickfix=xxx')
+silent! call assert_fails('set cscopequickfix=s,g,d')
+silent! call assert_fails('setlocal cscopequickfix=xxx')
+silent! call assert_fails('setlocal cscopequickfix=s,g,d')
+silent! call assert_fails('setglobal cscopequickfix=xxx')
+silent! call assert_fails('setglobal cscopequickfix=s,g,d')
+silent! call assert_fails('set csqf=xxx')
+silent! call assert_fails('set csqf=s,g,d')
+silent! call assert_fails('setlocal csqf=xxx')
+silent! call assert_fails('setlocal csqf=s,g,d')
+silent! call assert_fails('setglobal csqf=xxx')
+silent! call assert_fails('setglobal csqf=s,g,d')
+set cscopequickfix&
+set csqf&
+if exists('l:saved')
+let [&g:cscopequickfix, &l:cscopequickfix] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cscoperelative()
+if exists('+cscoperelative') && execute('set!') =~# '\n..cscoperelative\([=\n]\|$\)'
+let l:saved = [&g:cscoperelative, &l:cscoperelative]
+endif
+if exists('+cscoperelative')
+set cscoperelative
+set nocscoperelative
+set invcscoperelative
+set cscoperelative!
+setlocal cscoperelative
+setlocal nocscoperelative
+setlocal invcscoperelative
+setlocal cscoperelative!
+setglobal cscoperelative
+setglobal nocscoperelative
+setglobal invcscoperelative
+setglobal cscoperelative!
+set csre
+set nocsre
+set invcsre
+set csre!
+setlocal csre
+setlocal nocsre
+setlocal invcsre
+setlocal csre!
+setglobal csre
+setglobal nocsre
+setglobal invcsre
+setglobal csre!
+set cscoperelative&
+set csre&
+if exists('l:saved')
+let [&g:cscoperelative, &l:cscoperelative] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cscopetag()
+if exists('+cscopetag') && execute('set!') =~# '\n..cscopetag\([=\n]\|$\)'
+let l:saved = [&g:cscopetag, &l:cscopetag]
+endif
+if exists('+cscopetag')
+set cscopetag
+set nocscopetag
+set invcscopetag
+set cscopetag!
+setlocal cscopetag
+setlocal nocscopetag
+setlocal invcscopetag
+setlocal cscopetag!
+setglobal cscopetag
+setglobal nocscopetag
+setglobal invcscopetag
+setglobal cscopetag!
+set cst
+set nocst
+set invcst
+set cst!
+setlocal cst
+setlocal nocst
+setlocal invcst
+setlocal cst!
+setglobal cst
+setglobal nocst
+setglobal invcst
+setglobal cst!
+set cscopetag&
+set cst&
+if exists('l:saved')
+let [&g:cscopetag, &l:cscopetag] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cscopetagorder()
+if exists('+cscopetagorder') && execute('set!') =~# '\n..cscopetagorder\([=\n]\|$\)'
+let l:saved = [&g:cscopetagorder, &l:cscopetagorder]
+endif
+if exists('+cscopetagorder')
+set cscopetagorder=-1
+set cscopetagorder=0
+set cscopetagorder=100
+setlocal cscopetagorder=-1
+setlocal cscopetagorder=0
+setlocal cscopetagorder=100
+setglobal cscopetagorder=-1
+setglobal cscopetagorder=0
+setglobal cscopetagorder=100
+set csto=-1
+set csto=0
+set csto=100
+setlocal csto=-1
+setlocal csto=0
+setlocal csto=100
+setglobal csto=-1
+setglobal csto=0
+setglobal csto=100
+silent! call assert_fails('set cscopetagorder=')
+silent! call assert_fails('setlocal cscopetagorder=')
+silent! call assert_fails('setglobal cscopetagorder=')
+silent! call assert_fails('set csto=')
+silent! call assert_fails('setlocal csto=')
+silent! call assert_fails('setglobal csto=')
+set cscopetagorder&
+set csto&
+if exists('l:saved')
+let [&g:cscopetagorder, &l:cscopetagorder] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cscopeverbose()
+if exists('+cscopeverbose') && execute('set!') =~# '\n..cscopeverbose\([=\n]\|$\)'
+let l:saved = [&g:cscopeverbose, &l:cscopeverbose]
+endif
+if exists('+cscopeverbose')
+set cscopeverbose
+set nocscopeverbose
+set invcscopeverbose
+set cscopeverbose!
+setlocal cscopeverbose
+setlocal nocscopeverbose
+setlocal invcscopeverbose
+setlocal cscopeverbose!
+setglobal cscopeverbose
+setglobal nocscopeverbose
+setglobal invcscopeverbose
+setglobal cscopeverbose!
+set csverb
+set nocsverb
+set invcsverb
+set csverb!
+setlocal csverb
+setlocal nocsverb
+setlocal invcsverb
+setlocal csverb!
+setglobal csverb
+setglobal nocsverb
+setglobal invcsverb
+setglobal csverb!
+set cscopeverbose&
+set csverb&
+if exists('l:saved')
+let [&g:cscopeverbose, &l:cscopeverbose] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cursorbind()
+if exists('+cursorbind') && execute('set!') =~# '\n..cursorbind\([=\n]\|$\)'
+let l:saved = [&g:cursorbind, &l:cursorbind]
+endif
+if exists('+cursorbind')
+set cursorbind
+set nocursorbind
+set invcursorbind
+set cursorbind!
+setlocal cursorbind
+setlocal nocursorbind
+setlocal invcursorbind
+setlocal cursorbind!
+setglobal cursorbind
+setglobal nocursorbind
+setglobal invcursorbind
+setglobal cursorbind!
+set crb
+set nocrb
+set invcrb
+set crb!
+setlocal crb
+setlocal nocrb
+setlocal invcrb
+setlocal crb!
+setglobal crb
+setglobal nocrb
+setglobal invcrb
+setglobal crb!
+set cursorbind&
+set crb&
+if exists('l:saved')
+let [&g:cursorbind, &l:cursorbind] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cursorcolumn()
+if exists('+cursorcolumn') && execute('set!') =~# '\n..cursorcolumn\([=\n]\|$\)'
+let l:saved = [&g:cursorcolumn, &l:cursorcolumn]
+endif
+if exists('+cursorcolumn')
+set cursorcolumn
+set nocursorcolumn
+set invcursorcolumn
+set cursorcolumn!
+setlocal cursorcolumn
+setlocal nocursorcolumn
+setlocal invcursorcolumn
+setlocal cursorcolumn!
+setglobal cursorcolumn
+setglobal nocursorcolumn
+setglobal invcursorcolumn
+setglobal cursorcolumn!
+set cuc
+set nocuc
+set invcuc
+set cuc!
+setlocal cuc
+setlocal nocuc
+setlocal invcuc
+setlocal cuc!
+setglobal cuc
+setglobal nocuc
+setglobal invcuc
+setglobal cuc!
+set cursorcolumn&
+set cuc&
+if exists('l:saved')
+let [&g:cursorcolumn, &l:cursorcolumn] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cursorline()
+if exists('+cursorline') && execute('set!') =~# '\n..cursorline\([=\n]\|$\)'
+let l:saved = [&g:cursorline, &l:cursorline]
+endif
+if exists('+cursorline')
+set cursorline
+set nocursorline
+set invcursorline
+set cursorline!
+setlocal cursorline
+setlocal nocursorline
+setlocal invcursorline
+setlocal cursorline!
+setglobal cursorline
+setglobal nocursorline
+setglobal invcursorline
+setglobal cursorline!
+set cul
+set nocul
+set invcul
+set cul!
+setlocal cul
+setlocal nocul
+setlocal invcul
+setlocal cul!
+setglobal cul
+setglobal nocul
+setglobal invcul
+setglobal cul!
+set cursorline&
+set cul&
+if exists('l:saved')
+let [&g:cursorline, &l:cursorline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_cursorlineopt()
+if exists('+cursorlineopt') && execute('set!') =~# '\n..cursorlineopt\([=\n]\|$\)'
+let l:saved = [&g:cursorlineopt, &l:cursorlineopt]
+endif
+if exists('+cursorlineopt')
+set cursorlineopt=both
+set cursorlineopt=line
+set cursorlineopt=number
+set cursorlineopt=screenline
+set cursorlineopt=line,number
+setlocal cursorlineopt=both
+setlocal cursorlineopt=line
+setlocal cursorlineopt=number
+setlocal cursorlineopt=screenline
+setlocal cursorlineopt=line,number
+setglobal cursorlineopt=both
+setglobal cursorlineopt=line
+setglobal cursorlineopt=number
+setglobal cursorlineopt=screenline
+setglobal cursorlineopt=line,number
+set culopt=both
+set culopt=line
+set culopt=number
+set culopt=screenline
+set culopt=line,number
+setlocal culopt=both
+setlocal culopt=line
+setlocal culopt=number
+setlocal culopt=screenline
+setlocal culopt=line,number
+setglobal culopt=both
+setglobal culopt=line
+setglobal culopt=number
+setglobal culopt=screenline
+setglobal culopt=line,number
+silent! call assert_fails('set cursorlineopt=')
+silent! call assert_fails('set cursorlineopt=xxx')
+silent! call assert_fails('set cursorlineopt=line,screenline')
+silent! call assert_fails('setlocal cursorlineopt=')
+silent! call assert_fails('setlocal cursorlineopt=xxx')
+silent! call assert_fails('setlocal cursorlineopt=line,screenline')
+silent! call assert_fails('setglobal cursorlineopt=')
+silent! call assert_fails('setglobal cursorlineopt=xxx')
+silent! call assert_fails('setglobal cursorlineopt=line,screenline')
+silent! call assert_fails('set culopt=')
+silent! call assert_fails('set culopt=xxx')
+silent! call assert_fails('set culopt=line,screenline')
+silent! call assert_fails('setlocal culopt=')
+silent! call assert_fails('setlocal culopt=xxx')
+silent! call assert_fails('setlocal culopt=line,screenline')
+silent! call assert_fails('setglobal culopt=')
+silent! call assert_fails('setglobal culopt=xxx')
+silent! call assert_fails('setglobal culopt=line,screenline')
+set cursorlineopt&
+set culopt&
+if exists('l:saved')
+let [&g:cursorlineopt, &l:cursorlineopt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_debug()
+if exists('+debug') && execute('set!') =~# '\n..debug\([=\n]\|$\)'
+let l:saved = [&g:debug, &l:debug]
+endif
+if exists('+debug')
+set debug=
+set debug=msg
+set debug=throw
+set debug=beep
+setlocal debug=
+setlocal debug=msg
+setlocal debug=throw
+setlocal debug=beep
+setglobal debug=
+setglobal debug=msg
+setglobal debug=throw
+setglobal debug=beep
+set debug=
+set debug=msg
+set debug=throw
+set debug=beep
+setlocal debug=
+setlocal debug=msg
+setlocal debug=throw
+setlocal debug=beep
+setglobal debug=
+setglobal debug=msg
+setglobal debug=throw
+setglobal debug=beep
+silent! call assert_fails('set debug=xxx')
+silent! call assert_fails('setlocal debug=xxx')
+silent! call assert_fails('setglobal debug=xxx')
+silent! call assert_fails('set debug=xxx')
+silent! call assert_fails('setlocal debug=xxx')
+silent! call assert_fails('setglobal debug=xxx')
+set debug&
+set debug&
+if exists('l:saved')
+let [&g:debug, &l:debug] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_define()
+if exists('+define') && execute('set!') =~# '\n..define\([=\n]\|$\)'
+let l:saved = [&g:define, &l:define]
+endif
+if exists('+define')
+set define=
+set define=xxx
+setlocal define=
+setlocal define=xxx
+setglobal define=
+setglobal define=xxx
+setlocal define=
+call assert_equal(&g:define, &define)
+set def=
+set def=xxx
+setlocal def=
+setlocal def=xxx
+setglobal def=
+setglobal def=xxx
+setlocal def=
+call assert_equal(&g:define, &define)
+set define&
+set def&
+if exists('l:saved')
+let [&g:define, &l:define] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_delcombine()
+if exists('+delcombine') && execute('set!') =~# '\n..delcombine\([=\n]\|$\)'
+let l:saved = [&g:delcombine, &l:delcombine]
+endif
+if exists('+delcombine')
+set delcombine
+set nodelcombine
+set invdelcombine
+set delcombine!
+setlocal delcombine
+setlocal nodelcombine
+setlocal invdelcombine
+setlocal delcombine!
+setglobal delcombine
+setglobal nodelcombine
+setglobal invdelcombine
+setglobal delcombine!
+set deco
+set nodeco
+set invdeco
+set deco!
+setlocal deco
+setlocal nodeco
+setlocal invdeco
+setlocal deco!
+setglobal deco
+setglobal nodeco
+setglobal invdeco
+setglobal deco!
+set delcombine&
+set deco&
+if exists('l:saved')
+let [&g:delcombine, &l:delcombine] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_dictionary()
+if exists('+dictionary') && execute('set!') =~# '\n..dictionary\([=\n]\|$\)'
+let l:saved = [&g:dictionary, &l:dictionary]
+endif
+if exists('+dictionary')
+set dictionary=
+set dictionary=xxx
+setlocal dictionary=
+setlocal dictionary=xxx
+setglobal dictionary=
+setglobal dictionary=xxx
+setlocal dictionary=
+call assert_equal(&g:dictionary, &dictionary)
+set dict=
+set dict=xxx
+setlocal dict=
+setlocal dict=xxx
+setglobal dict=
+setglobal dict=xxx
+setlocal dict=
+call assert_equal(&g:dictionary, &dictionary)
+set dictionary&
+set dict&
+if exists('l:saved')
+let [&g:dictionary, &l:dictionary] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_diff()
+if exists('+diff') && execute('set!') =~# '\n..diff\([=\n]\|$\)'
+let l:saved = [&g:diff, &l:diff]
+endif
+if exists('+diff')
+set diff
+set nodiff
+set invdiff
+set diff!
+setlocal diff
+setlocal nodiff
+setlocal invdiff
+setlocal diff!
+setglobal diff
+setglobal nodiff
+setglobal invdiff
+setglobal diff!
+set diff
+set nodiff
+set invdiff
+set diff!
+setlocal diff
+setlocal nodiff
+setlocal invdiff
+setlocal diff!
+setglobal diff
+setglobal nodiff
+setglobal invdiff
+setglobal diff!
+set diff&
+set diff&
+if exists('l:saved')
+let [&g:diff, &l:diff] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_diffanchors()
+if exists('+diffanchors') && execute('set!') =~# '\n..diffanchors\([=\n]\|$\)'
+let l:saved = [&g:diffanchors, &l:diffanchors]
+endif
+if exists('+diffanchors')
+set diffanchors=
+set diffanchors='a
+set diffanchors=/foo/
+set diffanchors='a-1,'>,/foo,xxx/,'b,123
+set diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20
+set diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,
+setlocal diffanchors=
+setlocal diffanchors='a
+setlocal diffanchors=/foo/
+setlocal diffanchors='a-1,'>,/foo,xxx/,'b,123
+setlocal diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20
+setlocal diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,
+setglobal diffanchors=
+setglobal diffanchors='a
+setglobal diffanchors=/foo/
+setglobal diffanchors='a-1,'>,/foo,xxx/,'b,123
+setglobal diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20
+setglobal diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,
+setlocal diffanchors=
+call assert_equal(&g:diffanchors, &diffanchors)
+set dia=
+set dia='a
+set dia=/foo/
+set dia='a-1,'>,/foo,xxx/,'b,123
+set dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20
+set dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,
+setlocal dia=
+setlocal dia='a
+setlocal dia=/foo/
+setlocal dia='a-1,'>,/foo,xxx/,'b,123
+setlocal dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20
+setlocal dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,
+setglobal dia=
+setglobal dia='a
+setglobal dia=/foo/
+setglobal dia='a-1,'>,/foo,xxx/,'b,123
+setglobal dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20
+setglobal dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,
+setlocal dia=
+call assert_equal(&g:diffanchors, &diffanchors)
+silent! call assert_fails('set diffanchors=,')
+silent! call assert_fails('set diffanchors=12,,34')
+silent! call assert_fails('set diffanchors=xxx')
+silent! call assert_fails('set diffanchors=123,xxx')
+silent! call assert_fails('set diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21')
+silent! call assert_fails('setlocal diffanchors=,')
+silent! call assert_fails('setlocal diffanchors=12,,34')
+silent! call assert_fails('setlocal diffanchors=xxx')
+silent! call assert_fails('setlocal diffanchors=123,xxx')
+silent! call assert_fails('setlocal diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21')
+silent! call assert_fails('setglobal diffanchors=,')
+silent! call assert_fails('setglobal diffanchors=12,,34')
+silent! call assert_fails('setglobal diffanchors=xxx')
+silent! call assert_fails('setglobal diffanchors=123,xxx')
+silent! call assert_fails('setglobal diffanchors=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21')
+silent! call assert_fails('set dia=,')
+silent! call assert_fails('set dia=12,,34')
+silent! call assert_fails('set dia=xxx')
+silent! call assert_fails('set dia=123,xxx')
+silent! call assert_fails('set dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21')
+silent! call assert_fails('setlocal dia=,')
+silent! call assert_fails('setlocal dia=12,,34')
+silent! call assert_fails('setlocal dia=xxx')
+silent! call assert_fails('setlocal dia=123,xxx')
+silent! call assert_fails('setlocal dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21')
+silent! call assert_fails('setglobal dia=,')
+silent! call assert_fails('setglobal dia=12,,34')
+silent! call assert_fails('setglobal dia=xxx')
+silent! call assert_fails('setglobal dia=123,xxx')
+silent! call assert_fails('setglobal dia=1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21')
+set diffanchors&
+set dia&
+if exists('l:saved')
+let [&g:diffanchors, &l:diffanchors] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_diffexpr()
+if exists('+diffexpr') && execute('set!') =~# '\n..diffexpr\([=\n]\|$\)'
+let l:saved = [&g:diffexpr, &l:diffexpr]
+endif
+if exists('+diffexpr')
+set diffexpr=
+set diffexpr=xxx
+setlocal diffexpr=
+setlocal diffexpr=xxx
+setglobal diffexpr=
+setglobal diffexpr=xxx
+set dex=
+set dex=xxx
+setlocal dex=
+setlocal dex=xxx
+setglobal dex=
+setglobal dex=xxx
+set diffexpr&
+set dex&
+if exists('l:saved')
+let [&g:diffexpr, &l:diffexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_diffopt()
+if exists('+diffopt') && execute('set!') =~# '\n..diffopt\([=\n]\|$\)'
+let l:saved = [&g:diffopt, &l:diffopt]
+endif
+if exists('+diffopt')
+set diffopt=
+set diffopt=filler
+set diffopt=context:0
+set diffopt=context:999
+set diffopt=iblank
+set diffopt=icase
+set diffopt=iwhite
+set diffopt=iwhiteall
+set diffopt=horizontal
+set diffopt=vertical
+set diffopt=closeoff
+set diffopt=hiddenoff
+set diffopt=foldcolumn:0
+set diffopt=foldcolumn:12
+set diffopt=followwrap
+set diffopt=internal
+set diffopt=indent-heuristic
+set diffopt=algorithm:myers
+set diffopt=icase,iwhite
+set diffopt=algorithm:minimal
+set diffopt=algorithm:patience
+set diffopt=anchor
+set diffopt=algorithm:histogram
+set diffopt=inline:none
+set diffopt=inline:simple
+set diffopt=inline:char
+set diffopt=inline:word
+set diffopt=inline:char,inline:word
+set diffopt=linematch:5
+setlocal diffopt=
+setlocal diffopt=filler
+setlocal diffopt=context:0
+setlocal diffopt=context:999
+setlocal diffopt=iblank
+setlocal diffopt=icase
+setlocal diffopt=iwhite
+setlocal diffopt=iwhiteall
+setlocal diffopt=horizontal
+setlocal diffopt=vertical
+setlocal diffopt=closeoff
+setlocal diffopt=hiddenoff
+setlocal diffopt=foldcolumn:0
+setlocal diffopt=foldcolumn:12
+setlocal diffopt=followwrap
+setlocal diffopt=internal
+setlocal diffopt=indent-heuristic
+setlocal diffopt=algorithm:myers
+setlocal diffopt=icase,iwhite
+setlocal diffopt=algorithm:minimal
+setlocal diffopt=algorithm:patience
+setlocal diffopt=anchor
+setlocal diffopt=algorithm:histogram
+setlocal diffopt=inline:none
+setlocal diffopt=inline:simple
+setlocal diffopt=inline:char
+setlocal diffopt=inline:word
+setlocal diffopt=inline:char,inline:word
+setlocal diffopt=linematch:5
+setglobal diffopt=
+setglobal diffopt=filler
+setglobal diffopt=context:0
+setglobal diffopt=context:999
+setglobal diffopt=iblank
+setglobal diffopt=icase
+setglobal diffopt=iwhite
+setglobal diffopt=iwhiteall
+setglobal diffopt=horizontal
+setglobal diffopt=vertical
+setglobal diffopt=closeoff
+setglobal diffopt=hiddenoff
+setglobal diffopt=foldcolumn:0
+setglobal diffopt=foldcolumn:12
+setglobal diffopt=followwrap
+setglobal diffopt=internal
+setglobal diffopt=indent-heuristic
+setglobal diffopt=algorithm:myers
+setglobal diffopt=icase,iwhite
+setglobal diffopt=algorithm:minimal
+setglobal diffopt=algorithm:patience
+setglobal diffopt=anchor
+setglobal diffopt=algorithm:histogram
+setglobal diffopt=inline:none
+setglobal diffopt=inline:simple
+setglobal diffopt=inline:char
+setglobal diffopt=inline:word
+setglobal diffopt=inline:char,inline:word
+setglobal diffopt=linematch:5
+set dip=
+set dip=filler
+set dip=context:0
+set dip=context:999
+set dip=iblank
+set dip=icase
+set dip=iwhite
+set dip=iwhiteall
+set dip=horizontal
+set dip=vertical
+set dip=closeoff
+set dip=hiddenoff
+set dip=foldcolumn:0
+set dip=foldcolumn:12
+set dip=followwrap
+set dip=internal
+set dip=indent-heuristic
+set dip=algorithm:myers
+set dip=icase,iwhite
+set dip=algorithm:minimal
+set dip=algorithm:patience
+set dip=anchor
+set dip=algorithm:histogram
+set dip=inline:none
+set dip=inline:simple
+set dip=inline:char
+set dip=inline:word
+set dip=inline:char,inline:word
+set dip=linematch:5
+setlocal dip=
+setlocal dip=filler
+setlocal dip=context:0
+setlocal dip=context:999
+setlocal dip=iblank
+setlocal dip=icase
+setlocal dip=iwhite
+setlocal dip=iwhiteall
+setlocal dip=horizontal
+setlocal dip=vertical
+setlocal dip=closeoff
+setlocal dip=hiddenoff
+setlocal dip=foldcolumn:0
+setlocal dip=foldcolumn:12
+setlocal dip=followwrap
+setlocal dip=internal
+setlocal dip=indent-heuristic
+setlocal dip=algorithm:myers
+setlocal dip=icase,iwhite
+setlocal dip=algorithm:minimal
+setlocal dip=algorithm:patience
+setlocal dip=anchor
+setlocal dip=algorithm:histogram
+setlocal dip=inline:none
+setlocal dip=inline:simple
+setlocal dip=inline:char
+setlocal dip=inline:word
+setlocal dip=inline:char,inline:word
+setlocal dip=linematch:5
+setglobal dip=
+setglobal dip=filler
+setglobal dip=context:0
+setglobal dip=context:999
+setglobal dip=iblank
+setglobal dip=icase
+setglobal dip=iwhite
+setglobal dip=iwhiteall
+setglobal dip=horizontal
+setglobal dip=vertical
+setglobal dip=closeoff
+setglobal dip=hiddenoff
+setglobal dip=foldcolumn:0
+setglobal dip=foldcolumn:12
+setglobal dip=followwrap
+setglobal dip=internal
+setglobal dip=indent-heuristic
+setglobal dip=algorithm:myers
+setglobal dip=icase,iwhite
+setglobal dip=algorithm:minimal
+setglobal dip=algorithm:patience
+setglobal dip=anchor
+setglobal dip=algorithm:histogram
+setglobal dip=inline:none
+setglobal dip=inline:simple
+setglobal dip=inline:char
+setglobal dip=inline:word
+setglobal dip=inline:char,inline:word
+setglobal dip=linematch:5
+silent! call assert_fails('set diffopt=xxx')
+silent! call assert_fails('set diffopt=foldcolumn:')
+silent! call assert_fails('set diffopt=foldcolumn:x')
+silent! call assert_fails('set diffopt=foldcolumn:xxx')
+silent! call assert_fails('set diffopt=linematch:')
+silent! call assert_fails('set diffopt=linematch:x')
+silent! call assert_fails('set diffopt=linematch:xxx')
+silent! call assert_fails('set diffopt=algorithm:')
+silent! call assert_fails('set diffopt=algorithm:xxx')
+silent! call assert_fails('set diffopt=context:')
+silent! call assert_fails('set diffopt=context:x')
+silent! call assert_fails('set diffopt=context:xxx')
+silent! call assert_fails('set diffopt=inline:xxx')
+silent! call assert_fails('setlocal diffopt=xxx')
+silent! call assert_fails('setlocal diffopt=foldcolumn:')
+silent! call assert_fails('setlocal diffopt=foldcolumn:x')
+silent! call assert_fails('setlocal diffopt=foldcolumn:xxx')
+silent! call assert_fails('setlocal diffopt=linematch:')
+silent! call assert_fails('setlocal diffopt=linematch:x')
+silent! call assert_fails('setlocal diffopt=linematch:xxx')
+silent! call assert_fails('setlocal diffopt=algorithm:')
+silent! call assert_fails('setlocal diffopt=algorithm:xxx')
+silent! call assert_fails('setlocal diffopt=context:')
+silent! call assert_fails('setlocal diffopt=context:x')
+silent! call assert_fails('setlocal diffopt=context:xxx')
+silent! call assert_fails('setlocal diffopt=inline:xxx')
+silent! call assert_fails('setglobal diffopt=xxx')
+silent! call assert_fails('setglobal diffopt=foldcolumn:')
+silent! call assert_fails('setglobal diffopt=foldcolumn:x')
+silent! call assert_fails('setglobal diffopt=foldcolumn:xxx')
+silent! call assert_fails('setglobal diffopt=linematch:')
+silent! call assert_fails('setglobal diffopt=linematch:x')
+silent! call assert_fails('setglobal diffopt=linematch:xxx')
+silent! call assert_fails('setglobal diffopt=algorithm:')
+silent! call assert_fails('setglobal diffopt=algorithm:xxx')
+silent! call assert_fails('setglobal diffopt=context:')
+silent! call assert_fails('setglobal diffopt=context:x')
+silent! call assert_fails('setglobal diffopt=context:xxx')
+silent! call assert_fails('setglobal diffopt=inline:xxx')
+silent! call assert_fails('set dip=xxx')
+silent! call assert_fails('set dip=foldcolumn:')
+silent! call assert_fails('set dip=foldcolumn:x')
+silent! call assert_fails('set dip=foldcolumn:xxx')
+silent! call assert_fails('set dip=linematch:')
+silent! call assert_fails('set dip=linematch:x')
+silent! call assert_fails('set dip=linematch:xxx')
+silent! call assert_fails('set dip=algorithm:')
+silent! call assert_fails('set dip=algorithm:xxx')
+silent! call assert_fails('set dip=context:')
+silent! call assert_fails('set dip=context:x')
+silent! call assert_fails('set dip=context:xxx')
+silent! call assert_fails('set dip=inline:xxx')
+silent! call assert_fails('setlocal dip=xxx')
+silent! call assert_fails('setlocal dip=foldcolumn:')
+silent! call assert_fails('setlocal dip=foldcolumn:x')
+silent! call assert_fails('setlocal dip=foldcolumn:xxx')
+silent! call assert_fails('setlocal dip=linematch:')
+silent! call assert_fails('setlocal dip=linematch:x')
+silent! call assert_fails('setlocal dip=linematch:xxx')
+silent! call assert_fails('setlocal dip=algorithm:')
+silent! call assert_fails('setlocal dip=algorithm:xxx')
+silent! call assert_fails('setlocal dip=context:')
+silent! call assert_fails('setlocal dip=context:x')
+silent! call assert_fails('setlocal dip=context:xxx')
+silent! call assert_fails('setlocal dip=inline:xxx')
+silent! call assert_fails('setglobal dip=xxx')
+silent! call assert_fails('setglobal dip=foldcolumn:')
+silent! call assert_fails('setglobal dip=foldcolumn:x')
+silent! call assert_fails('setglobal dip=foldcolumn:xxx')
+silent! call assert_fails('setglobal dip=linematch:')
+silent! call assert_fails('setglobal dip=linematch:x')
+silent! call assert_fails('setglobal dip=linematch:xxx')
+silent! call assert_fails('setglobal dip=algorithm:')
+silent! call assert_fails('setglobal dip=algorithm:xxx')
+silent! call assert_fails('setglobal dip=context:')
+silent! call assert_fails('setglobal dip=context:x')
+silent! call assert_fails('setglobal dip=context:xxx')
+silent! call assert_fails('setglobal dip=inline:xxx')
+set diffopt&
+set dip&
+if exists('l:saved')
+let [&g:diffopt, &l:diffopt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_digraph()
+if exists('+digraph') && execute('set!') =~# '\n..digraph\([=\n]\|$\)'
+let l:saved = [&g:digraph, &l:digraph]
+endif
+if exists('+digraph')
+set digraph
+set nodigraph
+set invdigraph
+set digraph!
+setlocal digraph
+setlocal nodigraph
+setlocal invdigraph
+setlocal digraph!
+setglobal digraph
+setglobal nodigraph
+setglobal invdigraph
+setglobal digraph!
+set dg
+set nodg
+set invdg
+set dg!
+setlocal dg
+setlocal nodg
+setlocal invdg
+setlocal dg!
+setglobal dg
+setglobal nodg
+setglobal invdg
+setglobal dg!
+set digraph&
+set dg&
+if exists('l:saved')
+let [&g:digraph, &l:digraph] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_directory()
+if exists('+directory') && execute('set!') =~# '\n..directory\([=\n]\|$\)'
+let l:saved = [&g:directory, &l:directory]
+endif
+if exists('+directory')
+set directory=
+set directory=xxx
+setlocal directory=
+setlocal directory=xxx
+setglobal directory=
+setglobal directory=xxx
+set dir=
+set dir=xxx
+setlocal dir=
+setlocal dir=xxx
+setglobal dir=
+setglobal dir=xxx
+set directory&
+set dir&
+if exists('l:saved')
+let [&g:directory, &l:directory] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_display()
+if exists('+display') && execute('set!') =~# '\n..display\([=\n]\|$\)'
+let l:saved = [&g:display, &l:display]
+endif
+if exists('+display')
+set display=
+set display=lastline
+set display=truncate
+set display=uhex
+set display=lastline,uhex
+setlocal display=
+setlocal display=lastline
+setlocal display=truncate
+setlocal display=uhex
+setlocal display=lastline,uhex
+setglobal display=
+setglobal display=lastline
+setglobal display=truncate
+setglobal display=uhex
+setglobal display=lastline,uhex
+set dy=
+set dy=lastline
+set dy=truncate
+set dy=uhex
+set dy=lastline,uhex
+setlocal dy=
+setlocal dy=lastline
+setlocal dy=truncate
+setlocal dy=uhex
+setlocal dy=lastline,uhex
+setglobal dy=
+setglobal dy=lastline
+setglobal dy=truncate
+setglobal dy=uhex
+setglobal dy=lastline,uhex
+silent! call assert_fails('set display=xxx')
+silent! call assert_fails('setlocal display=xxx')
+silent! call assert_fails('setglobal display=xxx')
+silent! call assert_fails('set dy=xxx')
+silent! call assert_fails('setlocal dy=xxx')
+silent! call assert_fails('setglobal dy=xxx')
+set display&
+set dy&
+if exists('l:saved')
+let [&g:display, &l:display] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_eadirection()
+if exists('+eadirection') && execute('set!') =~# '\n..eadirection\([=\n]\|$\)'
+let l:saved = [&g:eadirection, &l:eadirection]
+endif
+if exists('+eadirection')
+set eadirection=
+set eadirection=both
+set eadirection=ver
+set eadirection=hor
+setlocal eadirection=
+setlocal eadirection=both
+setlocal eadirection=ver
+setlocal eadirection=hor
+setglobal eadirection=
+setglobal eadirection=both
+setglobal eadirection=ver
+setglobal eadirection=hor
+set ead=
+set ead=both
+set ead=ver
+set ead=hor
+setlocal ead=
+setlocal ead=both
+setlocal ead=ver
+setlocal ead=hor
+setglobal ead=
+setglobal ead=both
+setglobal ead=ver
+setglobal ead=hor
+silent! call assert_fails('set eadirection=xxx')
+silent! call assert_fails('set eadirection=ver,hor')
+silent! call assert_fails('setlocal eadirection=xxx')
+silent! call assert_fails('setlocal eadirection=ver,hor')
+silent! call assert_fails('setglobal eadirection=xxx')
+silent! call assert_fails('setglobal eadirection=ver,hor')
+silent! call assert_fails('set ead=xxx')
+silent! call assert_fails('set ead=ver,hor')
+silent! call assert_fails('setlocal ead=xxx')
+silent! call assert_fails('setlocal ead=ver,hor')
+silent! call assert_fails('setglobal ead=xxx')
+silent! call assert_fails('setglobal ead=ver,hor')
+set eadirection&
+set ead&
+if exists('l:saved')
+let [&g:eadirection, &l:eadirection] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_edcompatible()
+if exists('+edcompatible') && execute('set!') =~# '\n..edcompatible\([=\n]\|$\)'
+let l:saved = [&g:edcompatible, &l:edcompatible]
+endif
+if exists('+edcompatible')
+set edcompatible
+set noedcompatible
+set invedcompatible
+set edcompatible!
+setlocal edcompatible
+setlocal noedcompatible
+setlocal invedcompatible
+setlocal edcompatible!
+setglobal edcompatible
+setglobal noedcompatible
+setglobal invedcompatible
+setglobal edcompatible!
+set ed
+set noed
+set inved
+set ed!
+setlocal ed
+setlocal noed
+setlocal inved
+setlocal ed!
+setglobal ed
+setglobal noed
+setglobal inved
+setglobal ed!
+set edcompatible&
+set ed&
+if exists('l:saved')
+let [&g:edcompatible, &l:edcompatible] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_emoji()
+if exists('+emoji') && execute('set!') =~# '\n..emoji\([=\n]\|$\)'
+let l:saved = [&g:emoji, &l:emoji]
+endif
+if exists('+emoji')
+set emoji
+set noemoji
+set invemoji
+set emoji!
+setlocal emoji
+setlocal noemoji
+setlocal invemoji
+setlocal emoji!
+setglobal emoji
+setglobal noemoji
+setglobal invemoji
+setglobal emoji!
+set emo
+set noemo
+set invemo
+set emo!
+setlocal emo
+setlocal noemo
+setlocal invemo
+setlocal emo!
+setglobal emo
+setglobal noemo
+setglobal invemo
+setglobal emo!
+set emoji&
+set emo&
+if exists('l:saved')
+let [&g:emoji, &l:emoji] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_encoding()
+if exists('+encoding') && execute('set!') =~# '\n..encoding\([=\n]\|$\)'
+let l:saved = [&g:encoding, &l:encoding]
+endif
+if exists('+encoding')
+set encoding=latin1
+setlocal encoding=latin1
+setglobal encoding=latin1
+set enc=latin1
+setlocal enc=latin1
+setglobal enc=latin1
+silent! call assert_fails('set encoding=xxx')
+silent! call assert_fails('set encoding=')
+silent! call assert_fails('setlocal encoding=xxx')
+silent! call assert_fails('setlocal encoding=')
+silent! call assert_fails('setglobal encoding=xxx')
+silent! call assert_fails('setglobal encoding=')
+silent! call assert_fails('set enc=xxx')
+silent! call assert_fails('set enc=')
+silent! call assert_fails('setlocal enc=xxx')
+silent! call assert_fails('setlocal enc=')
+silent! call assert_fails('setglobal enc=xxx')
+silent! call assert_fails('setglobal enc=')
+set encoding&
+set enc&
+if exists('l:saved')
+let [&g:encoding, &l:encoding] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_endoffile()
+if exists('+endoffile') && execute('set!') =~# '\n..endoffile\([=\n]\|$\)'
+let l:saved = [&g:endoffile, &l:endoffile]
+endif
+if exists('+endoffile')
+set endoffile
+set noendoffile
+set invendoffile
+set endoffile!
+setlocal endoffile
+setlocal noendoffile
+setlocal invendoffile
+setlocal endoffile!
+setglobal endoffile
+setglobal noendoffile
+setglobal invendoffile
+setglobal endoffile!
+set eof
+set noeof
+set inveof
+set eof!
+setlocal eof
+setlocal noeof
+setlocal inveof
+setlocal eof!
+setglobal eof
+setglobal noeof
+setglobal inveof
+setglobal eof!
+set endoffile&
+set eof&
+if exists('l:saved')
+let [&g:endoffile, &l:endoffile] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_endofline()
+if exists('+endofline') && execute('set!') =~# '\n..endofline\([=\n]\|$\)'
+let l:saved = [&g:endofline, &l:endofline]
+endif
+if exists('+endofline')
+set endofline
+set noendofline
+set invendofline
+set endofline!
+setlocal endofline
+setlocal noendofline
+setlocal invendofline
+setlocal endofline!
+setglobal endofline
+setglobal noendofline
+setglobal invendofline
+setglobal endofline!
+set eol
+set noeol
+set inveol
+set eol!
+setlocal eol
+setlocal noeol
+setlocal inveol
+setlocal eol!
+setglobal eol
+setglobal noeol
+setglobal inveol
+setglobal eol!
+set endofline&
+set eol&
+if exists('l:saved')
+let [&g:endofline, &l:endofline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_equalalways()
+if exists('+equalalways') && execute('set!') =~# '\n..equalalways\([=\n]\|$\)'
+let l:saved = [&g:equalalways, &l:equalalways]
+endif
+if exists('+equalalways')
+set equalalways
+set noequalalways
+set invequalalways
+set equalalways!
+setlocal equalalways
+setlocal noequalalways
+setlocal invequalalways
+setlocal equalalways!
+setglobal equalalways
+setglobal noequalalways
+setglobal invequalalways
+setglobal equalalways!
+set ea
+set noea
+set invea
+set ea!
+setlocal ea
+setlocal noea
+setlocal invea
+setlocal ea!
+setglobal ea
+setglobal noea
+setglobal invea
+setglobal ea!
+set equalalways&
+set ea&
+if exists('l:saved')
+let [&g:equalalways, &l:equalalways] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_equalprg()
+if exists('+equalprg') && execute('set!') =~# '\n..equalprg\([=\n]\|$\)'
+let l:saved = [&g:equalprg, &l:equalprg]
+endif
+if exists('+equalprg')
+set equalprg=
+set equalprg=xxx
+setlocal equalprg=
+setlocal equalprg=xxx
+setglobal equalprg=
+setglobal equalprg=xxx
+setlocal equalprg=
+call assert_equal(&g:equalprg, &equalprg)
+set ep=
+set ep=xxx
+setlocal ep=
+setlocal ep=xxx
+setglobal ep=
+setglobal ep=xxx
+setlocal ep=
+call assert_equal(&g:equalprg, &equalprg)
+set equalprg&
+set ep&
+if exists('l:saved')
+let [&g:equalprg, &l:equalprg] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_errorbells()
+if exists('+errorbells') && execute('set!') =~# '\n..errorbells\([=\n]\|$\)'
+let l:saved = [&g:errorbells, &l:errorbells]
+endif
+if exists('+errorbells')
+set errorbells
+set noerrorbells
+set inverrorbells
+set errorbells!
+setlocal errorbells
+setlocal noerrorbells
+setlocal inverrorbells
+setlocal errorbells!
+setglobal errorbells
+setglobal noerrorbells
+setglobal inverrorbells
+setglobal errorbells!
+set eb
+set noeb
+set inveb
+set eb!
+setlocal eb
+setlocal noeb
+setlocal inveb
+setlocal eb!
+setglobal eb
+setglobal noeb
+setglobal inveb
+setglobal eb!
+set errorbells&
+set eb&
+if exists('l:saved')
+let [&g:errorbells, &l:errorbells] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_errorfile()
+if exists('+errorfile') && execute('set!') =~# '\n..errorfile\([=\n]\|$\)'
+let l:saved = [&g:errorfile, &l:errorfile]
+endif
+if exists('+errorfile')
+set errorfile=
+set errorfile=xxx
+setlocal errorfile=
+setlocal errorfile=xxx
+setglobal errorfile=
+setglobal errorfile=xxx
+set ef=
+set ef=xxx
+setlocal ef=
+setlocal ef=xxx
+setglobal ef=
+setglobal ef=xxx
+set errorfile&
+set ef&
+if exists('l:saved')
+let [&g:errorfile, &l:errorfile] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_errorformat()
+if exists('+errorformat') && execute('set!') =~# '\n..errorformat\([=\n]\|$\)'
+let l:saved = [&g:errorformat, &l:errorformat]
+endif
+if exists('+errorformat')
+set errorformat=
+set errorformat=xxx
+setlocal errorformat=
+setlocal errorformat=xxx
+setglobal errorformat=
+setglobal errorformat=xxx
+setlocal errorformat=
+call assert_equal(&g:errorformat, &errorformat)
+set efm=
+set efm=xxx
+setlocal efm=
+setlocal efm=xxx
+setglobal efm=
+setglobal efm=xxx
+setlocal efm=
+call assert_equal(&g:errorformat, &errorformat)
+set errorformat&
+set efm&
+if exists('l:saved')
+let [&g:errorformat, &l:errorformat] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_esckeys()
+if exists('+esckeys') && execute('set!') =~# '\n..esckeys\([=\n]\|$\)'
+let l:saved = [&g:esckeys, &l:esckeys]
+endif
+if exists('+esckeys')
+set esckeys
+set noesckeys
+set invesckeys
+set esckeys!
+setlocal esckeys
+setlocal noesckeys
+setlocal invesckeys
+setlocal esckeys!
+setglobal esckeys
+setglobal noesckeys
+setglobal invesckeys
+setglobal esckeys!
+set ek
+set noek
+set invek
+set ek!
+setlocal ek
+setlocal noek
+setlocal invek
+setlocal ek!
+setglobal ek
+setglobal noek
+setglobal invek
+setglobal ek!
+set esckeys&
+set ek&
+if exists('l:saved')
+let [&g:esckeys, &l:esckeys] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_eventignore()
+if exists('+eventignore') && execute('set!') =~# '\n..eventignore\([=\n]\|$\)'
+let l:saved = [&g:eventignore, &l:eventignore]
+endif
+if exists('+eventignore')
+set eventignore=
+set eventignore=WinEnter
+set eventignore=WinLeave,winenter
+set eventignore=all,WinEnter
+set eventignore=all,-WinLeave
+setlocal eventignore=
+setlocal eventignore=WinEnter
+setlocal eventignore=WinLeave,winenter
+setlocal eventignore=all,WinEnter
+setlocal eventignore=all,-WinLeave
+setglobal eventignore=
+setglobal eventignore=WinEnter
+setglobal eventignore=WinLeave,winenter
+setglobal eventignore=all,WinEnter
+setglobal eventignore=all,-WinLeave
+set ei=
+set ei=WinEnter
+set ei=WinLeave,winenter
+set ei=all,WinEnter
+set ei=all,-WinLeave
+setlocal ei=
+setlocal ei=WinEnter
+setlocal ei=WinLeave,winenter
+setlocal ei=all,WinEnter
+setlocal ei=all,-WinLeave
+setglobal ei=
+setglobal ei=WinEnter
+setglobal ei=WinLeave,winenter
+setglobal ei=all,WinEnter
+setglobal ei=all,-WinLeave
+silent! call assert_fails('set eventignore=xxx')
+silent! call assert_fails('setlocal eventignore=xxx')
+silent! call assert_fails('setglobal eventignore=xxx')
+silent! call assert_fails('set ei=xxx')
+silent! call assert_fails('setlocal ei=xxx')
+silent! call assert_fails('setglobal ei=xxx')
+set eventignore&
+set ei&
+if exists('l:saved')
+let [&g:eventignore, &l:eventignore] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_eventignorewin()
+if exists('+eventignorewin') && execute('set!') =~# '\n..eventignorewin\([=\n]\|$\)'
+let l:saved = [&g:eventignorewin, &l:eventignorewin]
+endif
+if exists('+eventignorewin')
+set eventignorewin=
+set eventignorewin=WinEnter
+set eventignorewin=WinLeave,winenter
+set eventignorewin=all,WinEnter
+set eventignorewin=all,-WinLeave
+setlocal eventignorewin=
+setlocal eventignorewin=WinEnter
+setlocal eventignorewin=WinLeave,winenter
+setlocal eventignorewin=all,WinEnter
+setlocal eventignorewin=all,-WinLeave
+setglobal eventignorewin=
+setglobal eventignorewin=WinEnter
+setglobal eventignorewin=WinLeave,winenter
+setglobal eventignorewin=all,WinEnter
+setglobal eventignorewin=all,-WinLeave
+set eiw=
+set eiw=WinEnter
+set eiw=WinLeave,winenter
+set eiw=all,WinEnter
+set eiw=all,-WinLeave
+setlocal eiw=
+setlocal eiw=WinEnter
+setlocal eiw=WinLeave,winenter
+setlocal eiw=all,WinEnter
+setlocal eiw=all,-WinLeave
+setglobal eiw=
+setglobal eiw=WinEnter
+setglobal eiw=WinLeave,winenter
+setglobal eiw=all,WinEnter
+setglobal eiw=all,-WinLeave
+silent! call assert_fails('set eventignorewin=xxx')
+silent! call assert_fails('set eventignorewin=WinNew')
+silent! call assert_fails('setlocal eventignorewin=xxx')
+silent! call assert_fails('setlocal eventignorewin=WinNew')
+silent! call assert_fails('setglobal eventignorewin=xxx')
+silent! call assert_fails('setglobal eventignorewin=WinNew')
+silent! call assert_fails('set eiw=xxx')
+silent! call assert_fails('set eiw=WinNew')
+silent! call assert_fails('setlocal eiw=xxx')
+silent! call assert_fails('setlocal eiw=WinNew')
+silent! call assert_fails('setglobal eiw=xxx')
+silent! call assert_fails('setglobal eiw=WinNew')
+set eventignorewin&
+set eiw&
+if exists('l:saved')
+let [&g:eventignorewin, &l:eventignorewin] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_expandtab()
+if exists('+expandtab') && execute('set!') =~# '\n..expandtab\([=\n]\|$\)'
+let l:saved = [&g:expandtab, &l:expandtab]
+endif
+if exists('+expandtab')
+set expandtab
+set noexpandtab
+set invexpandtab
+set expandtab!
+setlocal expandtab
+setlocal noexpandtab
+setlocal invexpandtab
+setlocal expandtab!
+setglobal expandtab
+setglobal noexpandtab
+setglobal invexpandtab
+setglobal expandtab!
+set et
+set noet
+set invet
+set et!
+setlocal et
+setlocal noet
+setlocal invet
+setlocal et!
+setglobal et
+setglobal noet
+setglobal invet
+setglobal et!
+set expandtab&
+set et&
+if exists('l:saved')
+let [&g:expandtab, &l:expandtab] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_exrc()
+if exists('+exrc') && execute('set!') =~# '\n..exrc\([=\n]\|$\)'
+let l:saved = [&g:exrc, &l:exrc]
+endif
+if exists('+exrc')
+set exrc
+set noexrc
+set invexrc
+set exrc!
+setlocal exrc
+setlocal noexrc
+setlocal invexrc
+setlocal exrc!
+setglobal exrc
+setglobal noexrc
+setglobal invexrc
+setglobal exrc!
+set ex
+set noex
+set invex
+set ex!
+setlocal ex
+setlocal noex
+setlocal invex
+setlocal ex!
+setglobal ex
+setglobal noex
+setglobal invex
+setglobal ex!
+set exrc&
+set ex&
+if exists('l:saved')
+let [&g:exrc, &l:exrc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fileencoding()
+if exists('+fileencoding') && execute('set!') =~# '\n..fileencoding\([=\n]\|$\)'
+let l:saved = [&g:fileencoding, &l:fileencoding]
+endif
+if exists('+fileencoding')
+set fileencoding=
+set fileencoding=latin1
+set fileencoding=xxx
+setlocal fileencoding=
+setlocal fileencoding=latin1
+setlocal fileencoding=xxx
+setglobal fileencoding=
+setglobal fileencoding=latin1
+setglobal fileencoding=xxx
+set fenc=
+set fenc=latin1
+set fenc=xxx
+setlocal fenc=
+setlocal fenc=latin1
+setlocal fenc=xxx
+setglobal fenc=
+setglobal fenc=latin1
+setglobal fenc=xxx
+set fileencoding&
+set fenc&
+if exists('l:saved')
+let [&g:fileencoding, &l:fileencoding] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fileencodings()
+if exists('+fileencodings') && execute('set!') =~# '\n..fileencodings\([=\n]\|$\)'
+let l:saved = [&g:fileencodings, &l:fileencodings]
+endif
+if exists('+fileencodings')
+set fileencodings=
+set fileencodings=xxx
+setlocal fileencodings=
+setlocal fileencodings=xxx
+setglobal fileencodings=
+setglobal fileencodings=xxx
+set fencs=
+set fencs=xxx
+setlocal fencs=
+setlocal fencs=xxx
+setglobal fencs=
+setglobal fencs=xxx
+set fileencodings&
+set fencs&
+if exists('l:saved')
+let [&g:fileencodings, &l:fileencodings] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fileformat()
+if exists('+fileformat') && execute('set!') =~# '\n..fileformat\([=\n]\|$\)'
+let l:saved = [&g:fileformat, &l:fileformat]
+endif
+if exists('+fileformat')
+set fileformat=
+set fileformat=dos
+set fileformat=unix
+set fileformat=mac
+setlocal fileformat=
+setlocal fileformat=dos
+setlocal fileformat=unix
+setlocal fileformat=mac
+setglobal fileformat=
+setglobal fileformat=dos
+setglobal fileformat=unix
+setglobal fileformat=mac
+set ff=
+set ff=dos
+set ff=unix
+set ff=mac
+setlocal ff=
+setlocal ff=dos
+setlocal ff=unix
+setlocal ff=mac
+setglobal ff=
+setglobal ff=dos
+setglobal ff=unix
+setglobal ff=mac
+silent! call assert_fails('set fileformat=xxx')
+silent! call assert_fails('setlocal fileformat=xxx')
+silent! call assert_fails('setglobal fileformat=xxx')
+silent! call assert_fails('set ff=xxx')
+silent! call assert_fails('setlocal ff=xxx')
+silent! call assert_fails('setglobal ff=xxx')
+set fileformat&
+set ff&
+if exists('l:saved')
+let [&g:fileformat, &l:fileformat] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fileformats()
+if exists('+fileformats') && execute('set!') =~# '\n..fileformats\([=\n]\|$\)'
+let l:saved = [&g:fileformats, &l:fileformats]
+endif
+if exists('+fileformats')
+set fileformats=
+set fileformats=dos
+set fileformats=dos,unix
+setlocal fileformats=
+setlocal fileformats=dos
+setlocal fileformats=dos,unix
+setglobal fileformats=
+setglobal fileformats=dos
+setglobal fileformats=dos,unix
+set ffs=
+set ffs=dos
+set ffs=dos,unix
+setlocal ffs=
+setlocal ffs=dos
+setlocal ffs=dos,unix
+setglobal ffs=
+setglobal ffs=dos
+setglobal ffs=dos,unix
+silent! call assert_fails('set fileformats=xxx')
+silent! call assert_fails('setlocal fileformats=xxx')
+silent! call assert_fails('setglobal fileformats=xxx')
+silent! call assert_fails('set ffs=xxx')
+silent! call assert_fails('setlocal ffs=xxx')
+silent! call assert_fails('setglobal ffs=xxx')
+set fileformats&
+set ffs&
+if exists('l:saved')
+let [&g:fileformats, &l:fileformats] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fileignorecase()
+if exists('+fileignorecase') && execute('set!') =~# '\n..fileignorecase\([=\n]\|$\)'
+let l:saved = [&g:fileignorecase, &l:fileignorecase]
+endif
+if exists('+fileignorecase')
+set fileignorecase
+set nofileignorecase
+set invfileignorecase
+set fileignorecase!
+setlocal fileignorecase
+setlocal nofileignorecase
+setlocal invfileignorecase
+setlocal fileignorecase!
+setglobal fileignorecase
+setglobal nofileignorecase
+setglobal invfileignorecase
+setglobal fileignorecase!
+set fic
+set nofic
+set invfic
+set fic!
+setlocal fic
+setlocal nofic
+setlocal invfic
+setlocal fic!
+setglobal fic
+setglobal nofic
+setglobal invfic
+setglobal fic!
+set fileignorecase&
+set fic&
+if exists('l:saved')
+let [&g:fileignorecase, &l:fileignorecase] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_filetype()
+if exists('+filetype') && execute('set!') =~# '\n..filetype\([=\n]\|$\)'
+let l:saved = [&g:filetype, &l:filetype]
+endif
+if exists('+filetype')
+set filetype=
+set filetype=xxx
+setlocal filetype=
+setlocal filetype=xxx
+" Skip local-noglobal: setglobal filetype=
+" Skip local-noglobal: setglobal filetype=xxx
+set ft=
+set ft=xxx
+setlocal ft=
+setlocal ft=xxx
+" Skip local-noglobal: setglobal ft=
+" Skip local-noglobal: setglobal ft=xxx
+set filetype&
+set ft&
+if exists('l:saved')
+let [&g:filetype, &l:filetype] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fillchars()
+if exists('+fillchars') && execute('set!') =~# '\n..fillchars\([=\n]\|$\)'
+let l:saved = [&g:fillchars, &l:fillchars]
+endif
+if exists('+fillchars')
+set fillchars=
+set fillchars=stl:x
+set fillchars=stlnc:x
+set fillchars=vert:x
+set fillchars=fold:x
+set fillchars=foldopen:x
+set fillchars=foldclose:x
+set fillchars=foldsep:x
+set fillchars=diff:x
+set fillchars=eob:x
+set fillchars=lastline:x
+set fillchars=trunc:_
+set fillchars=trunc:_,eob:x,trunc:_
+set fillchars=stl:\ ,vert:\|,fold:\\,trunc:…,diff:x
+setlocal fillchars=
+setlocal fillchars=stl:x
+setlocal fillchars=stlnc:x
+setlocal fillchars=vert:x
+setlocal fillchars=fold:x
+setlocal fillchars=foldopen:x
+setlocal fillchars=foldclose:x
+setlocal fillchars=foldsep:x
+setlocal fillchars=diff:x
+setlocal fillchars=eob:x
+setlocal fillchars=lastline:x
+setlocal fillchars=trunc:_
+setlocal fillchars=trunc:_,eob:x,trunc:_
+setlocal fillchars=stl:\ ,vert:\|,fold:\\,trunc:…,diff:x
+setglobal fillchars=
+setglobal fillchars=stl:x
+setglobal fillchars=stlnc:x
+setglobal fillchars=vert:x
+setglobal fillchars=fold:x
+setglobal fillchars=foldopen:x
+setglobal fillchars=foldclose:x
+setglobal fillchars=foldsep:x
+setglobal fillchars=diff:x
+setglobal fillchars=eob:x
+setglobal fillchars=lastline:x
+setglobal fillchars=trunc:_
+setglobal fillchars=trunc:_,eob:x,trunc:_
+setglobal fillchars=stl:\ ,vert:\|,fold:\\,trunc:…,diff:x
+setlocal fillchars=
+call assert_equal(&g:fillchars, &fillchars)
+set fcs=
+set fcs=stl:x
+set fcs=stlnc:x
+set fcs=vert:x
+set fcs=fold:x
+set fcs=foldopen:x
+set fcs=foldclose:x
+set fcs=foldsep:x
+set fcs=diff:x
+set fcs=eob:x
+set fcs=lastline:x
+set fcs=trunc:_
+set fcs=trunc:_,eob:x,trunc:_
+set fcs=stl:\ ,vert:\|,fold:\\,trunc:…,diff:x
+setlocal fcs=
+setlocal fcs=stl:x
+setlocal fcs=stlnc:x
+setlocal fcs=vert:x
+setlocal fcs=fold:x
+setlocal fcs=foldopen:x
+setlocal fcs=foldclose:x
+setlocal fcs=foldsep:x
+setlocal fcs=diff:x
+setlocal fcs=eob:x
+setlocal fcs=lastline:x
+setlocal fcs=trunc:_
+setlocal fcs=trunc:_,eob:x,trunc:_
+setlocal fcs=stl:\ ,vert:\|,fold:\\,trunc:…,diff:x
+setglobal fcs=
+setglobal fcs=stl:x
+setglobal fcs=stlnc:x
+setglobal fcs=vert:x
+setglobal fcs=fold:x
+setglobal fcs=foldopen:x
+setglobal fcs=foldclose:x
+setglobal fcs=foldsep:x
+setglobal fcs=diff:x
+setglobal fcs=eob:x
+setglobal fcs=lastline:x
+setglobal fcs=trunc:_
+setglobal fcs=trunc:_,eob:x,trunc:_
+setglobal fcs=stl:\ ,vert:\|,fold:\\,trunc:…,diff:x
+setlocal fcs=
+call assert_equal(&g:fillchars, &fillchars)
+silent! call assert_fails('set fillchars=xxx')
+silent! call assert_fails('set fillchars=vert:')
+silent! call assert_fails('set fillchars=trunc:')
+silent! call assert_fails('set fillchars=trunc:')
+silent! call assert_fails('setlocal fillchars=xxx')
+silent! call assert_fails('setlocal fillchars=vert:')
+silent! call assert_fails('setlocal fillchars=trunc:')
+silent! call assert_fails('setlocal fillchars=trunc:')
+silent! call assert_fails('setglobal fillchars=xxx')
+silent! call assert_fails('setglobal fillchars=vert:')
+silent! call assert_fails('setglobal fillchars=trunc:')
+silent! call assert_fails('setglobal fillchars=trunc:')
+silent! call assert_fails('set fcs=xxx')
+silent! call assert_fails('set fcs=vert:')
+silent! call assert_fails('set fcs=trunc:')
+silent! call assert_fails('set fcs=trunc:')
+silent! call assert_fails('setlocal fcs=xxx')
+silent! call assert_fails('setlocal fcs=vert:')
+silent! call assert_fails('setlocal fcs=trunc:')
+silent! call assert_fails('setlocal fcs=trunc:')
+silent! call assert_fails('setglobal fcs=xxx')
+silent! call assert_fails('setglobal fcs=vert:')
+silent! call assert_fails('setglobal fcs=trunc:')
+silent! call assert_fails('setglobal fcs=trunc:')
+set fillchars&
+set fcs&
+if exists('l:saved')
+let [&g:fillchars, &l:fillchars] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_findfunc()
+if exists('+findfunc') && execute('set!') =~# '\n..findfunc\([=\n]\|$\)'
+let l:saved = [&g:findfunc, &l:findfunc]
+endif
+if exists('+findfunc')
+set findfunc=
+set findfunc=xxx
+setlocal findfunc=
+setlocal findfunc=xxx
+setglobal findfunc=
+setglobal findfunc=xxx
+setlocal findfunc=
+call assert_equal(&g:findfunc, &findfunc)
+set ffu=
+set ffu=xxx
+setlocal ffu=
+setlocal ffu=xxx
+setglobal ffu=
+setglobal ffu=xxx
+setlocal ffu=
+call assert_equal(&g:findfunc, &findfunc)
+set findfunc&
+set ffu&
+if exists('l:saved')
+let [&g:findfunc, &l:findfunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fixendofline()
+if exists('+fixendofline') && execute('set!') =~# '\n..fixendofline\([=\n]\|$\)'
+let l:saved = [&g:fixendofline, &l:fixendofline]
+endif
+if exists('+fixendofline')
+set fixendofline
+set nofixendofline
+set invfixendofline
+set fixendofline!
+setlocal fixendofline
+setlocal nofixendofline
+setlocal invfixendofline
+setlocal fixendofline!
+setglobal fixendofline
+setglobal nofixendofline
+setglobal invfixendofline
+setglobal fixendofline!
+set fixeol
+set nofixeol
+set invfixeol
+set fixeol!
+setlocal fixeol
+setlocal nofixeol
+setlocal invfixeol
+setlocal fixeol!
+setglobal fixeol
+setglobal nofixeol
+setglobal invfixeol
+setglobal fixeol!
+set fixendofline&
+set fixeol&
+if exists('l:saved')
+let [&g:fixendofline, &l:fixendofline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fkmap()
+if exists('+fkmap') && execute('set!') =~# '\n..fkmap\([=\n]\|$\)'
+let l:saved = [&g:fkmap, &l:fkmap]
+endif
+if exists('+fkmap')
+set fkmap
+set nofkmap
+set invfkmap
+set fkmap!
+setlocal fkmap
+setlocal nofkmap
+setlocal invfkmap
+setlocal fkmap!
+setglobal fkmap
+setglobal nofkmap
+setglobal invfkmap
+setglobal fkmap!
+set fk
+set nofk
+set invfk
+set fk!
+setlocal fk
+setlocal nofk
+setlocal invfk
+setlocal fk!
+setglobal fk
+setglobal nofk
+setglobal invfk
+setglobal fk!
+set fkmap&
+set fk&
+if exists('l:saved')
+let [&g:fkmap, &l:fkmap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_flash()
+if exists('+flash') && execute('set!') =~# '\n..flash\([=\n]\|$\)'
+let l:saved = [&g:flash, &l:flash]
+endif
+if exists('+flash')
+set flash
+set noflash
+set invflash
+set flash!
+setlocal flash
+setlocal noflash
+setlocal invflash
+setlocal flash!
+setglobal flash
+setglobal noflash
+setglobal invflash
+setglobal flash!
+set fl
+set nofl
+set invfl
+set fl!
+setlocal fl
+setlocal nofl
+setlocal invfl
+setlocal fl!
+setglobal fl
+setglobal nofl
+setglobal invfl
+setglobal fl!
+set flash&
+set fl&
+if exists('l:saved')
+let [&g:flash, &l:flash] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldclose()
+if exists('+foldclose') && execute('set!') =~# '\n..foldclose\([=\n]\|$\)'
+let l:saved = [&g:foldclose, &l:foldclose]
+endif
+if exists('+foldclose')
+set foldclose=
+set foldclose=all
+setlocal foldclose=
+setlocal foldclose=all
+setglobal foldclose=
+setglobal foldclose=all
+set fcl=
+set fcl=all
+setlocal fcl=
+setlocal fcl=all
+setglobal fcl=
+setglobal fcl=all
+silent! call assert_fails('set foldclose=xxx')
+silent! call assert_fails('setlocal foldclose=xxx')
+silent! call assert_fails('setglobal foldclose=xxx')
+silent! call assert_fails('set fcl=xxx')
+silent! call assert_fails('setlocal fcl=xxx')
+silent! call assert_fails('setglobal fcl=xxx')
+set foldclose&
+set fcl&
+if exists('l:saved')
+let [&g:foldclose, &l:foldclose] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldcolumn()
+if exists('+foldcolumn') && execute('set!') =~# '\n..foldcolumn\([=\n]\|$\)'
+let l:saved = [&g:foldcolumn, &l:foldcolumn]
+endif
+if exists('+foldcolumn')
+set foldcolumn=0
+set foldcolumn=1
+set foldcolumn=4
+set foldcolumn=12
+setlocal foldcolumn=0
+setlocal foldcolumn=1
+setlocal foldcolumn=4
+setlocal foldcolumn=12
+setglobal foldcolumn=0
+setglobal foldcolumn=1
+setglobal foldcolumn=4
+setglobal foldcolumn=12
+set fdc=0
+set fdc=1
+set fdc=4
+set fdc=12
+setlocal fdc=0
+setlocal fdc=1
+setlocal fdc=4
+setlocal fdc=12
+setglobal fdc=0
+setglobal fdc=1
+setglobal fdc=4
+setglobal fdc=12
+silent! call assert_fails('set foldcolumn=-1')
+silent! call assert_fails('set foldcolumn=13')
+silent! call assert_fails('set foldcolumn=999')
+silent! call assert_fails('setlocal foldcolumn=-1')
+silent! call assert_fails('setlocal foldcolumn=13')
+silent! call assert_fails('setlocal foldcolumn=999')
+silent! call assert_fails('setglobal foldcolumn=-1')
+silent! call assert_fails('setglobal foldcolumn=13')
+silent! call assert_fails('setglobal foldcolumn=999')
+silent! call assert_fails('set fdc=-1')
+silent! call assert_fails('set fdc=13')
+silent! call assert_fails('set fdc=999')
+silent! call assert_fails('setlocal fdc=-1')
+silent! call assert_fails('setlocal fdc=13')
+silent! call assert_fails('setlocal fdc=999')
+silent! call assert_fails('setglobal fdc=-1')
+silent! call assert_fails('setglobal fdc=13')
+silent! call assert_fails('setglobal fdc=999')
+set foldcolumn&
+set fdc&
+if exists('l:saved')
+let [&g:foldcolumn, &l:foldcolumn] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldenable()
+if exists('+foldenable') && execute('set!') =~# '\n..foldenable\([=\n]\|$\)'
+let l:saved = [&g:foldenable, &l:foldenable]
+endif
+if exists('+foldenable')
+set foldenable
+set nofoldenable
+set invfoldenable
+set foldenable!
+setlocal foldenable
+setlocal nofoldenable
+setlocal invfoldenable
+setlocal foldenable!
+setglobal foldenable
+setglobal nofoldenable
+setglobal invfoldenable
+setglobal foldenable!
+set fen
+set nofen
+set invfen
+set fen!
+setlocal fen
+setlocal nofen
+setlocal invfen
+setlocal fen!
+setglobal fen
+setglobal nofen
+setglobal invfen
+setglobal fen!
+set foldenable&
+set fen&
+if exists('l:saved')
+let [&g:foldenable, &l:foldenable] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldexpr()
+if exists('+foldexpr') && execute('set!') =~# '\n..foldexpr\([=\n]\|$\)'
+let l:saved = [&g:foldexpr, &l:foldexpr]
+endif
+if exists('+foldexpr')
+set foldexpr=
+set foldexpr=xxx
+setlocal foldexpr=
+setlocal foldexpr=xxx
+setglobal foldexpr=
+setglobal foldexpr=xxx
+set fde=
+set fde=xxx
+setlocal fde=
+setlocal fde=xxx
+setglobal fde=
+setglobal fde=xxx
+set foldexpr&
+set fde&
+if exists('l:saved')
+let [&g:foldexpr, &l:foldexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldignore()
+if exists('+foldignore') && execute('set!') =~# '\n..foldignore\([=\n]\|$\)'
+let l:saved = [&g:foldignore, &l:foldignore]
+endif
+if exists('+foldignore')
+set foldignore=
+set foldignore=xxx
+setlocal foldignore=
+setlocal foldignore=xxx
+setglobal foldignore=
+setglobal foldignore=xxx
+set fdi=
+set fdi=xxx
+setlocal fdi=
+setlocal fdi=xxx
+setglobal fdi=
+setglobal fdi=xxx
+set foldignore&
+set fdi&
+if exists('l:saved')
+let [&g:foldignore, &l:foldignore] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldlevel()
+if exists('+foldlevel') && execute('set!') =~# '\n..foldlevel\([=\n]\|$\)'
+let l:saved = [&g:foldlevel, &l:foldlevel]
+endif
+if exists('+foldlevel')
+set foldlevel=-1
+set foldlevel=0
+set foldlevel=100
+setlocal foldlevel=-1
+setlocal foldlevel=0
+setlocal foldlevel=100
+setglobal foldlevel=-1
+setglobal foldlevel=0
+setglobal foldlevel=100
+set fdl=-1
+set fdl=0
+set fdl=100
+setlocal fdl=-1
+setlocal fdl=0
+setlocal fdl=100
+setglobal fdl=-1
+setglobal fdl=0
+setglobal fdl=100
+silent! call assert_fails('set foldlevel=')
+silent! call assert_fails('setlocal foldlevel=')
+silent! call assert_fails('setglobal foldlevel=')
+silent! call assert_fails('set fdl=')
+silent! call assert_fails('setlocal fdl=')
+silent! call assert_fails('setglobal fdl=')
+set foldlevel&
+set fdl&
+if exists('l:saved')
+let [&g:foldlevel, &l:foldlevel] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldlevelstart()
+if exists('+foldlevelstart') && execute('set!') =~# '\n..foldlevelstart\([=\n]\|$\)'
+let l:saved = [&g:foldlevelstart, &l:foldlevelstart]
+endif
+if exists('+foldlevelstart')
+set foldlevelstart=-1
+set foldlevelstart=0
+set foldlevelstart=100
+setlocal foldlevelstart=-1
+setlocal foldlevelstart=0
+setlocal foldlevelstart=100
+setglobal foldlevelstart=-1
+setglobal foldlevelstart=0
+setglobal foldlevelstart=100
+set fdls=-1
+set fdls=0
+set fdls=100
+setlocal fdls=-1
+setlocal fdls=0
+setlocal fdls=100
+setglobal fdls=-1
+setglobal fdls=0
+setglobal fdls=100
+silent! call assert_fails('set foldlevelstart=')
+silent! call assert_fails('setlocal foldlevelstart=')
+silent! call assert_fails('setglobal foldlevelstart=')
+silent! call assert_fails('set fdls=')
+silent! call assert_fails('setlocal fdls=')
+silent! call assert_fails('setglobal fdls=')
+set foldlevelstart&
+set fdls&
+if exists('l:saved')
+let [&g:foldlevelstart, &l:foldlevelstart] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldmarker()
+if exists('+foldmarker') && execute('set!') =~# '\n..foldmarker\([=\n]\|$\)'
+let l:saved = [&g:foldmarker, &l:foldmarker]
+endif
+if exists('+foldmarker')
+set foldmarker=((,))
+setlocal foldmarker=((,))
+setglobal foldmarker=((,))
+set fmr=((,))
+setlocal fmr=((,))
+setglobal fmr=((,))
+silent! call assert_fails('set foldmarker=')
+silent! call assert_fails('set foldmarker=xxx')
+silent! call assert_fails('set foldmarker={{{,')
+silent! call assert_fails('setlocal foldmarker=')
+silent! call assert_fails('setlocal foldmarker=xxx')
+silent! call assert_fails('setlocal foldmarker={{{,')
+silent! call assert_fails('setglobal foldmarker=')
+silent! call assert_fails('setglobal foldmarker=xxx')
+silent! call assert_fails('setglobal foldmarker={{{,')
+silent! call assert_fails('set fmr=')
+silent! call assert_fails('set fmr=xxx')
+silent! call assert_fails('set fmr={{{,')
+silent! call assert_fails('setlocal fmr=')
+silent! call assert_fails('setlocal fmr=xxx')
+silent! call assert_fails('setlocal fmr={{{,')
+silent! call assert_fails('setglobal fmr=')
+silent! call assert_fails('setglobal fmr=xxx')
+silent! call assert_fails('setglobal fmr={{{,')
+set foldmarker&
+set fmr&
+if exists('l:saved')
+let [&g:foldmarker, &l:foldmarker] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldmethod()
+if exists('+foldmethod') && execute('set!') =~# '\n..foldmethod\([=\n]\|$\)'
+let l:saved = [&g:foldmethod, &l:foldmethod]
+endif
+if exists('+foldmethod')
+set foldmethod=manual
+set foldmethod=indent
+set foldmethod=expr
+set foldmethod=marker
+set foldmethod=syntax
+set foldmethod=diff
+setlocal foldmethod=manual
+setlocal foldmethod=indent
+setlocal foldmethod=expr
+setlocal foldmethod=marker
+setlocal foldmethod=syntax
+setlocal foldmethod=diff
+setglobal foldmethod=manual
+setglobal foldmethod=indent
+setglobal foldmethod=expr
+setglobal foldmethod=marker
+setglobal foldmethod=syntax
+setglobal foldmethod=diff
+set fdm=manual
+set fdm=indent
+set fdm=expr
+set fdm=marker
+set fdm=syntax
+set fdm=diff
+setlocal fdm=manual
+setlocal fdm=indent
+setlocal fdm=expr
+setlocal fdm=marker
+setlocal fdm=syntax
+setlocal fdm=diff
+setglobal fdm=manual
+setglobal fdm=indent
+setglobal fdm=expr
+setglobal fdm=marker
+setglobal fdm=syntax
+setglobal fdm=diff
+silent! call assert_fails('set foldmethod=')
+silent! call assert_fails('set foldmethod=xxx')
+silent! call assert_fails('set foldmethod=expr,diff')
+silent! call assert_fails('setlocal foldmethod=')
+silent! call assert_fails('setlocal foldmethod=xxx')
+silent! call assert_fails('setlocal foldmethod=expr,diff')
+silent! call assert_fails('setglobal foldmethod=')
+silent! call assert_fails('setglobal foldmethod=xxx')
+silent! call assert_fails('setglobal foldmethod=expr,diff')
+silent! call assert_fails('set fdm=')
+silent! call assert_fails('set fdm=xxx')
+silent! call assert_fails('set fdm=expr,diff')
+silent! call assert_fails('setlocal fdm=')
+silent! call assert_fails('setlocal fdm=xxx')
+silent! call assert_fails('setlocal fdm=expr,diff')
+silent! call assert_fails('setglobal fdm=')
+silent! call assert_fails('setglobal fdm=xxx')
+silent! call assert_fails('setglobal fdm=expr,diff')
+set foldmethod&
+set fdm&
+if exists('l:saved')
+let [&g:foldmethod, &l:foldmethod] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldminlines()
+if exists('+foldminlines') && execute('set!') =~# '\n..foldminlines\([=\n]\|$\)'
+let l:saved = [&g:foldminlines, &l:foldminlines]
+endif
+if exists('+foldminlines')
+set foldminlines=-1
+set foldminlines=0
+set foldminlines=100
+setlocal foldminlines=-1
+setlocal foldminlines=0
+setlocal foldminlines=100
+setglobal foldminlines=-1
+setglobal foldminlines=0
+setglobal foldminlines=100
+set fml=-1
+set fml=0
+set fml=100
+setlocal fml=-1
+setlocal fml=0
+setlocal fml=100
+setglobal fml=-1
+setglobal fml=0
+setglobal fml=100
+silent! call assert_fails('set foldminlines=')
+silent! call assert_fails('setlocal foldminlines=')
+silent! call assert_fails('setglobal foldminlines=')
+silent! call assert_fails('set fml=')
+silent! call assert_fails('setlocal fml=')
+silent! call assert_fails('setglobal fml=')
+set foldminlines&
+set fml&
+if exists('l:saved')
+let [&g:foldminlines, &l:foldminlines] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldnestmax()
+if exists('+foldnestmax') && execute('set!') =~# '\n..foldnestmax\([=\n]\|$\)'
+let l:saved = [&g:foldnestmax, &l:foldnestmax]
+endif
+if exists('+foldnestmax')
+set foldnestmax=-1
+set foldnestmax=0
+set foldnestmax=100
+setlocal foldnestmax=-1
+setlocal foldnestmax=0
+setlocal foldnestmax=100
+setglobal foldnestmax=-1
+setglobal foldnestmax=0
+setglobal foldnestmax=100
+set fdn=-1
+set fdn=0
+set fdn=100
+setlocal fdn=-1
+setlocal fdn=0
+setlocal fdn=100
+setglobal fdn=-1
+setglobal fdn=0
+setglobal fdn=100
+silent! call assert_fails('set foldnestmax=')
+silent! call assert_fails('setlocal foldnestmax=')
+silent! call assert_fails('setglobal foldnestmax=')
+silent! call assert_fails('set fdn=')
+silent! call assert_fails('setlocal fdn=')
+silent! call assert_fails('setglobal fdn=')
+set foldnestmax&
+set fdn&
+if exists('l:saved')
+let [&g:foldnestmax, &l:foldnestmax] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldopen()
+if exists('+foldopen') && execute('set!') =~# '\n..foldopen\([=\n]\|$\)'
+let l:saved = [&g:foldopen, &l:foldopen]
+endif
+if exists('+foldopen')
+set foldopen=
+set foldopen=all
+set foldopen=block
+set foldopen=hor
+set foldopen=insert
+set foldopen=jump
+set foldopen=mark
+set foldopen=percent
+set foldopen=quickfix
+set foldopen=search
+set foldopen=tag
+set foldopen=undo
+set foldopen=hor,jump
+setlocal foldopen=
+setlocal foldopen=all
+setlocal foldopen=block
+setlocal foldopen=hor
+setlocal foldopen=insert
+setlocal foldopen=jump
+setlocal foldopen=mark
+setlocal foldopen=percent
+setlocal foldopen=quickfix
+setlocal foldopen=search
+setlocal foldopen=tag
+setlocal foldopen=undo
+setlocal foldopen=hor,jump
+setglobal foldopen=
+setglobal foldopen=all
+setglobal foldopen=block
+setglobal foldopen=hor
+setglobal foldopen=insert
+setglobal foldopen=jump
+setglobal foldopen=mark
+setglobal foldopen=percent
+setglobal foldopen=quickfix
+setglobal foldopen=search
+setglobal foldopen=tag
+setglobal foldopen=undo
+setglobal foldopen=hor,jump
+set fdo=
+set fdo=all
+set fdo=block
+set fdo=hor
+set fdo=insert
+set fdo=jump
+set fdo=mark
+set fdo=percent
+set fdo=quickfix
+set fdo=search
+set fdo=tag
+set fdo=undo
+set fdo=hor,jump
+setlocal fdo=
+setlocal fdo=all
+setlocal fdo=block
+setlocal fdo=hor
+setlocal fdo=insert
+setlocal fdo=jump
+setlocal fdo=mark
+setlocal fdo=percent
+setlocal fdo=quickfix
+setlocal fdo=search
+setlocal fdo=tag
+setlocal fdo=undo
+setlocal fdo=hor,jump
+setglobal fdo=
+setglobal fdo=all
+setglobal fdo=block
+setglobal fdo=hor
+setglobal fdo=insert
+setglobal fdo=jump
+setglobal fdo=mark
+setglobal fdo=percent
+setglobal fdo=quickfix
+setglobal fdo=search
+setglobal fdo=tag
+setglobal fdo=undo
+setglobal fdo=hor,jump
+silent! call assert_fails('set foldopen=xxx')
+silent! call assert_fails('setlocal foldopen=xxx')
+silent! call assert_fails('setglobal foldopen=xxx')
+silent! call assert_fails('set fdo=xxx')
+silent! call assert_fails('setlocal fdo=xxx')
+silent! call assert_fails('setglobal fdo=xxx')
+set foldopen&
+set fdo&
+if exists('l:saved')
+let [&g:foldopen, &l:foldopen] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_foldtext()
+if exists('+foldtext') && execute('set!') =~# '\n..foldtext\([=\n]\|$\)'
+let l:saved = [&g:foldtext, &l:foldtext]
+endif
+if exists('+foldtext')
+set foldtext=
+set foldtext=xxx
+setlocal foldtext=
+setlocal foldtext=xxx
+setglobal foldtext=
+setglobal foldtext=xxx
+set fdt=
+set fdt=xxx
+setlocal fdt=
+setlocal fdt=xxx
+setglobal fdt=
+setglobal fdt=xxx
+set foldtext&
+set fdt&
+if exists('l:saved')
+let [&g:foldtext, &l:foldtext] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_formatexpr()
+if exists('+formatexpr') && execute('set!') =~# '\n..formatexpr\([=\n]\|$\)'
+let l:saved = [&g:formatexpr, &l:formatexpr]
+endif
+if exists('+formatexpr')
+set formatexpr=
+set formatexpr=xxx
+setlocal formatexpr=
+setlocal formatexpr=xxx
+setglobal formatexpr=
+setglobal formatexpr=xxx
+set fex=
+set fex=xxx
+setlocal fex=
+setlocal fex=xxx
+setglobal fex=
+setglobal fex=xxx
+set formatexpr&
+set fex&
+if exists('l:saved')
+let [&g:formatexpr, &l:formatexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_formatlistpat()
+if exists('+formatlistpat') && execute('set!') =~# '\n..formatlistpat\([=\n]\|$\)'
+let l:saved = [&g:formatlistpat, &l:formatlistpat]
+endif
+if exists('+formatlistpat')
+set formatlistpat=
+set formatlistpat=xxx
+setlocal formatlistpat=
+setlocal formatlistpat=xxx
+setglobal formatlistpat=
+setglobal formatlistpat=xxx
+set flp=
+set flp=xxx
+setlocal flp=
+setlocal flp=xxx
+setglobal flp=
+setglobal flp=xxx
+set formatlistpat&
+set flp&
+if exists('l:saved')
+let [&g:formatlistpat, &l:formatlistpat] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_formatoptions()
+if exists('+formatoptions') && execute('set!') =~# '\n..formatoptions\([=\n]\|$\)'
+let l:saved = [&g:formatoptions, &l:formatoptions]
+endif
+if exists('+formatoptions')
+set formatoptions=
+set formatoptions=t
+set formatoptions=c
+set formatoptions=r
+set formatoptions=o
+set formatoptions=/
+set formatoptions=q
+set formatoptions=w
+set formatoptions=a
+set formatoptions=n
+set formatoptions=2
+set formatoptions=v
+set formatoptions=b
+set formatoptions=l
+set formatoptions=m
+set formatoptions=M
+set formatoptions=B
+set formatoptions=1
+set formatoptions=]
+set formatoptions=j
+set formatoptions=p
+set formatoptions=vt
+set formatoptions=v,t
+setlocal formatoptions=
+setlocal formatoptions=t
+setlocal formatoptions=c
+setlocal formatoptions=r
+setlocal formatoptions=o
+setlocal formatoptions=/
+setlocal formatoptions=q
+setlocal formatoptions=w
+setlocal formatoptions=a
+setlocal formatoptions=n
+setlocal formatoptions=2
+setlocal formatoptions=v
+setlocal formatoptions=b
+setlocal formatoptions=l
+setlocal formatoptions=m
+setlocal formatoptions=M
+setlocal formatoptions=B
+setlocal formatoptions=1
+setlocal formatoptions=]
+setlocal formatoptions=j
+setlocal formatoptions=p
+setlocal formatoptions=vt
+setlocal formatoptions=v,t
+setglobal formatoptions=
+setglobal formatoptions=t
+setglobal formatoptions=c
+setglobal formatoptions=r
+setglobal formatoptions=o
+setglobal formatoptions=/
+setglobal formatoptions=q
+setglobal formatoptions=w
+setglobal formatoptions=a
+setglobal formatoptions=n
+setglobal formatoptions=2
+setglobal formatoptions=v
+setglobal formatoptions=b
+setglobal formatoptions=l
+setglobal formatoptions=m
+setglobal formatoptions=M
+setglobal formatoptions=B
+setglobal formatoptions=1
+setglobal formatoptions=]
+setglobal formatoptions=j
+setglobal formatoptions=p
+setglobal formatoptions=vt
+setglobal formatoptions=v,t
+set fo=
+set fo=t
+set fo=c
+set fo=r
+set fo=o
+set fo=/
+set fo=q
+set fo=w
+set fo=a
+set fo=n
+set fo=2
+set fo=v
+set fo=b
+set fo=l
+set fo=m
+set fo=M
+set fo=B
+set fo=1
+set fo=]
+set fo=j
+set fo=p
+set fo=vt
+set fo=v,t
+setlocal fo=
+setlocal fo=t
+setlocal fo=c
+setlocal fo=r
+setlocal fo=o
+setlocal fo=/
+setlocal fo=q
+setlocal fo=w
+setlocal fo=a
+setlocal fo=n
+setlocal fo=2
+setlocal fo=v
+setlocal fo=b
+setlocal fo=l
+setlocal fo=m
+setlocal fo=M
+setlocal fo=B
+setlocal fo=1
+setlocal fo=]
+setlocal fo=j
+setlocal fo=p
+setlocal fo=vt
+setlocal fo=v,t
+setglobal fo=
+setglobal fo=t
+setglobal fo=c
+setglobal fo=r
+setglobal fo=o
+setglobal fo=/
+setglobal fo=q
+setglobal fo=w
+setglobal fo=a
+setglobal fo=n
+setglobal fo=2
+setglobal fo=v
+setglobal fo=b
+setglobal fo=l
+setglobal fo=m
+setglobal fo=M
+setglobal fo=B
+setglobal fo=1
+setglobal fo=]
+setglobal fo=j
+setglobal fo=p
+setglobal fo=vt
+setglobal fo=v,t
+silent! call assert_fails('set formatoptions=xxx')
+silent! call assert_fails('setlocal formatoptions=xxx')
+silent! call assert_fails('setglobal formatoptions=xxx')
+silent! call assert_fails('set fo=xxx')
+silent! call assert_fails('setlocal fo=xxx')
+silent! call assert_fails('setglobal fo=xxx')
+set formatoptions&
+set fo&
+if exists('l:saved')
+let [&g:formatoptions, &l:formatoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_formatprg()
+if exists('+formatprg') && execute('set!') =~# '\n..formatprg\([=\n]\|$\)'
+let l:saved = [&g:formatprg, &l:formatprg]
+endif
+if exists('+formatprg')
+set formatprg=
+set formatprg=xxx
+setlocal formatprg=
+setlocal formatprg=xxx
+setglobal formatprg=
+setglobal formatprg=xxx
+setlocal formatprg=
+call assert_equal(&g:formatprg, &formatprg)
+set fp=
+set fp=xxx
+setlocal fp=
+setlocal fp=xxx
+setglobal fp=
+setglobal fp=xxx
+setlocal fp=
+call assert_equal(&g:formatprg, &formatprg)
+set formatprg&
+set fp&
+if exists('l:saved')
+let [&g:formatprg, &l:formatprg] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_fsync()
+if exists('+fsync') && execute('set!') =~# '\n..fsync\([=\n]\|$\)'
+let l:saved = [&g:fsync, &l:fsync]
+endif
+if exists('+fsync')
+set fsync
+set nofsync
+set invfsync
+set fsync!
+setlocal fsync
+setlocal nofsync
+setlocal invfsync
+setlocal fsync!
+setglobal fsync
+setglobal nofsync
+setglobal invfsync
+setglobal fsync!
+set fs
+set nofs
+set invfs
+set fs!
+setlocal fs
+setlocal nofs
+setlocal invfs
+setlocal fs!
+setglobal fs
+setglobal nofs
+setglobal invfs
+setglobal fs!
+set fsync&
+set fs&
+if exists('l:saved')
+let [&g:fsync, &l:fsync] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_gdefault()
+if exists('+gdefault') && execute('set!') =~# '\n..gdefault\([=\n]\|$\)'
+let l:saved = [&g:gdefault, &l:gdefault]
+endif
+if exists('+gdefault')
+set gdefault
+set nogdefault
+set invgdefault
+set gdefault!
+setlocal gdefault
+setlocal nogdefault
+setlocal invgdefault
+setlocal gdefault!
+setglobal gdefault
+setglobal nogdefault
+setglobal invgdefault
+setglobal gdefault!
+set gd
+set nogd
+set invgd
+set gd!
+setlocal gd
+setlocal nogd
+setlocal invgd
+setlocal gd!
+setglobal gd
+setglobal nogd
+setglobal invgd
+setglobal gd!
+set gdefault&
+set gd&
+if exists('l:saved')
+let [&g:gdefault, &l:gdefault] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_graphic()
+if exists('+graphic') && execute('set!') =~# '\n..graphic\([=\n]\|$\)'
+let l:saved = [&g:graphic, &l:graphic]
+endif
+if exists('+graphic')
+set graphic
+set nographic
+set invgraphic
+set graphic!
+setlocal graphic
+setlocal nographic
+setlocal invgraphic
+setlocal graphic!
+setglobal graphic
+setglobal nographic
+setglobal invgraphic
+setglobal graphic!
+set gr
+set nogr
+set invgr
+set gr!
+setlocal gr
+setlocal nogr
+setlocal invgr
+setlocal gr!
+setglobal gr
+setglobal nogr
+setglobal invgr
+setglobal gr!
+set graphic&
+set gr&
+if exists('l:saved')
+let [&g:graphic, &l:graphic] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_grepformat()
+if exists('+grepformat') && execute('set!') =~# '\n..grepformat\([=\n]\|$\)'
+let l:saved = [&g:grepformat, &l:grepformat]
+endif
+if exists('+grepformat')
+set grepformat=
+set grepformat=xxx
+setlocal grepformat=
+setlocal grepformat=xxx
+setglobal grepformat=
+setglobal grepformat=xxx
+setlocal grepformat=
+call assert_equal(&g:grepformat, &grepformat)
+set gfm=
+set gfm=xxx
+setlocal gfm=
+setlocal gfm=xxx
+setglobal gfm=
+setglobal gfm=xxx
+setlocal gfm=
+call assert_equal(&g:grepformat, &grepformat)
+set grepformat&
+set gfm&
+if exists('l:saved')
+let [&g:grepformat, &l:grepformat] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_grepprg()
+if exists('+grepprg') && execute('set!') =~# '\n..grepprg\([=\n]\|$\)'
+let l:saved = [&g:grepprg, &l:grepprg]
+endif
+if exists('+grepprg')
+set grepprg=
+set grepprg=xxx
+setlocal grepprg=
+setlocal grepprg=xxx
+setglobal grepprg=
+setglobal grepprg=xxx
+set gp=
+set gp=xxx
+setlocal gp=
+setlocal gp=xxx
+setglobal gp=
+setglobal gp=xxx
+set grepprg&
+set gp&
+if exists('l:saved')
+let [&g:grepprg, &l:grepprg] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guicursor()
+if exists('+guicursor') && execute('set!') =~# '\n..guicursor\([=\n]\|$\)'
+let l:saved = [&g:guicursor, &l:guicursor]
+endif
+if exists('+guicursor')
+set guicursor=
+set guicursor=n:block-Cursor
+setlocal guicursor=
+setlocal guicursor=n:block-Cursor
+setglobal guicursor=
+setglobal guicursor=n:block-Cursor
+set gcr=
+set gcr=n:block-Cursor
+setlocal gcr=
+setlocal gcr=n:block-Cursor
+setglobal gcr=
+setglobal gcr=n:block-Cursor
+silent! call assert_fails('set guicursor=xxx')
+silent! call assert_fails('setlocal guicursor=xxx')
+silent! call assert_fails('setglobal guicursor=xxx')
+silent! call assert_fails('set gcr=xxx')
+silent! call assert_fails('setlocal gcr=xxx')
+silent! call assert_fails('setglobal gcr=xxx')
+set guicursor&
+set gcr&
+if exists('l:saved')
+let [&g:guicursor, &l:guicursor] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guifont()
+if exists('+guifont') && execute('set!') =~# '\n..guifont\([=\n]\|$\)'
+let l:saved = [&g:guifont, &l:guifont]
+endif
+if exists('+guifont')
+set guifont=
+set guifont=fixed
+setlocal guifont=
+setlocal guifont=fixed
+setglobal guifont=
+setglobal guifont=fixed
+set gfn=
+set gfn=fixed
+setlocal gfn=
+setlocal gfn=fixed
+setglobal gfn=
+setglobal gfn=fixed
+set guifont&
+set gfn&
+if exists('l:saved')
+let [&g:guifont, &l:guifont] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guifontset()
+if exists('+guifontset') && execute('set!') =~# '\n..guifontset\([=\n]\|$\)'
+let l:saved = [&g:guifontset, &l:guifontset]
+endif
+if exists('+guifontset')
+set guifontset=
+set guifontset=fixed
+setlocal guifontset=
+setlocal guifontset=fixed
+setglobal guifontset=
+setglobal guifontset=fixed
+set gfs=
+set gfs=fixed
+setlocal gfs=
+setlocal gfs=fixed
+setglobal gfs=
+setglobal gfs=fixed
+set guifontset&
+set gfs&
+if exists('l:saved')
+let [&g:guifontset, &l:guifontset] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guifontwide()
+if exists('+guifontwide') && execute('set!') =~# '\n..guifontwide\([=\n]\|$\)'
+let l:saved = [&g:guifontwide, &l:guifontwide]
+endif
+if exists('+guifontwide')
+set guifontwide=
+set guifontwide=fixed
+setlocal guifontwide=
+setlocal guifontwide=fixed
+setglobal guifontwide=
+setglobal guifontwide=fixed
+set gfw=
+set gfw=fixed
+setlocal gfw=
+setlocal gfw=fixed
+setglobal gfw=
+setglobal gfw=fixed
+set guifontwide&
+set gfw&
+if exists('l:saved')
+let [&g:guifontwide, &l:guifontwide] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guiheadroom()
+if exists('+guiheadroom') && execute('set!') =~# '\n..guiheadroom\([=\n]\|$\)'
+let l:saved = [&g:guiheadroom, &l:guiheadroom]
+endif
+if exists('+guiheadroom')
+set guiheadroom=-1
+set guiheadroom=0
+set guiheadroom=100
+setlocal guiheadroom=-1
+setlocal guiheadroom=0
+setlocal guiheadroom=100
+setglobal guiheadroom=-1
+setglobal guiheadroom=0
+setglobal guiheadroom=100
+set ghr=-1
+set ghr=0
+set ghr=100
+setlocal ghr=-1
+setlocal ghr=0
+setlocal ghr=100
+setglobal ghr=-1
+setglobal ghr=0
+setglobal ghr=100
+silent! call assert_fails('set guiheadroom=')
+silent! call assert_fails('setlocal guiheadroom=')
+silent! call assert_fails('setglobal guiheadroom=')
+silent! call assert_fails('set ghr=')
+silent! call assert_fails('setlocal ghr=')
+silent! call assert_fails('setglobal ghr=')
+set guiheadroom&
+set ghr&
+if exists('l:saved')
+let [&g:guiheadroom, &l:guiheadroom] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guiligatures()
+if exists('+guiligatures') && execute('set!') =~# '\n..guiligatures\([=\n]\|$\)'
+let l:saved = [&g:guiligatures, &l:guiligatures]
+endif
+if exists('+guiligatures')
+set guiligatures=
+set guiligatures=xxx
+setlocal guiligatures=
+setlocal guiligatures=xxx
+setglobal guiligatures=
+setglobal guiligatures=xxx
+set gli=
+set gli=xxx
+setlocal gli=
+setlocal gli=xxx
+setglobal gli=
+setglobal gli=xxx
+set guiligatures&
+set gli&
+if exists('l:saved')
+let [&g:guiligatures, &l:guiligatures] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guioptions()
+if exists('+guioptions') && execute('set!') =~# '\n..guioptions\([=\n]\|$\)'
+let l:saved = [&g:guioptions, &l:guioptions]
+endif
+if exists('+guioptions')
+set guioptions=
+set guioptions=!
+set guioptions=a
+set guioptions=P
+set guioptions=A
+set guioptions=c
+set guioptions=d
+set guioptions=e
+set guioptions=f
+set guioptions=i
+set guioptions=m
+set guioptions=M
+set guioptions=g
+set guioptions=t
+set guioptions=T
+set guioptions=r
+set guioptions=R
+set guioptions=l
+set guioptions=L
+set guioptions=b
+set guioptions=h
+set guioptions=v
+set guioptions=p
+set guioptions=F
+set guioptions=k
+set guioptions=!abvR
+setlocal guioptions=
+setlocal guioptions=!
+setlocal guioptions=a
+setlocal guioptions=P
+setlocal guioptions=A
+setlocal guioptions=c
+setlocal guioptions=d
+setlocal guioptions=e
+setlocal guioptions=f
+setlocal guioptions=i
+setlocal guioptions=m
+setlocal guioptions=M
+setlocal guioptions=g
+setlocal guioptions=t
+setlocal guioptions=T
+setlocal guioptions=r
+setlocal guioptions=R
+setlocal guioptions=l
+setlocal guioptions=L
+setlocal guioptions=b
+setlocal guioptions=h
+setlocal guioptions=v
+setlocal guioptions=p
+setlocal guioptions=F
+setlocal guioptions=k
+setlocal guioptions=!abvR
+setglobal guioptions=
+setglobal guioptions=!
+setglobal guioptions=a
+setglobal guioptions=P
+setglobal guioptions=A
+setglobal guioptions=c
+setglobal guioptions=d
+setglobal guioptions=e
+setglobal guioptions=f
+setglobal guioptions=i
+setglobal guioptions=m
+setglobal guioptions=M
+setglobal guioptions=g
+setglobal guioptions=t
+setglobal guioptions=T
+setglobal guioptions=r
+setglobal guioptions=R
+setglobal guioptions=l
+setglobal guioptions=L
+setglobal guioptions=b
+setglobal guioptions=h
+setglobal guioptions=v
+setglobal guioptions=p
+setglobal guioptions=F
+setglobal guioptions=k
+setglobal guioptions=!abvR
+set go=
+set go=!
+set go=a
+set go=P
+set go=A
+set go=c
+set go=d
+set go=e
+set go=f
+set go=i
+set go=m
+set go=M
+set go=g
+set go=t
+set go=T
+set go=r
+set go=R
+set go=l
+set go=L
+set go=b
+set go=h
+set go=v
+set go=p
+set go=F
+set go=k
+set go=!abvR
+setlocal go=
+setlocal go=!
+setlocal go=a
+setlocal go=P
+setlocal go=A
+setlocal go=c
+setlocal go=d
+setlocal go=e
+setlocal go=f
+setlocal go=i
+setlocal go=m
+setlocal go=M
+setlocal go=g
+setlocal go=t
+setlocal go=T
+setlocal go=r
+setlocal go=R
+setlocal go=l
+setlocal go=L
+setlocal go=b
+setlocal go=h
+setlocal go=v
+setlocal go=p
+setlocal go=F
+setlocal go=k
+setlocal go=!abvR
+setglobal go=
+setglobal go=!
+setglobal go=a
+setglobal go=P
+setglobal go=A
+setglobal go=c
+setglobal go=d
+setglobal go=e
+setglobal go=f
+setglobal go=i
+setglobal go=m
+setglobal go=M
+setglobal go=g
+setglobal go=t
+setglobal go=T
+setglobal go=r
+setglobal go=R
+setglobal go=l
+setglobal go=L
+setglobal go=b
+setglobal go=h
+setglobal go=v
+setglobal go=p
+setglobal go=F
+setglobal go=k
+setglobal go=!abvR
+silent! call assert_fails('set guioptions=xxx')
+silent! call assert_fails('set guioptions=a,b')
+silent! call assert_fails('setlocal guioptions=xxx')
+silent! call assert_fails('setlocal guioptions=a,b')
+silent! call assert_fails('setglobal guioptions=xxx')
+silent! call assert_fails('setglobal guioptions=a,b')
+silent! call assert_fails('set go=xxx')
+silent! call assert_fails('set go=a,b')
+silent! call assert_fails('setlocal go=xxx')
+silent! call assert_fails('setlocal go=a,b')
+silent! call assert_fails('setglobal go=xxx')
+silent! call assert_fails('setglobal go=a,b')
+set guioptions&
+set go&
+if exists('l:saved')
+let [&g:guioptions, &l:guioptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guipty()
+if exists('+guipty') && execute('set!') =~# '\n..guipty\([=\n]\|$\)'
+let l:saved = [&g:guipty, &l:guipty]
+endif
+if exists('+guipty')
+set guipty
+set noguipty
+set invguipty
+set guipty!
+setlocal guipty
+setlocal noguipty
+setlocal invguipty
+setlocal guipty!
+setglobal guipty
+setglobal noguipty
+setglobal invguipty
+setglobal guipty!
+set guipty
+set noguipty
+set invguipty
+set guipty!
+setlocal guipty
+setlocal noguipty
+setlocal invguipty
+setlocal guipty!
+setglobal guipty
+setglobal noguipty
+setglobal invguipty
+setglobal guipty!
+set guipty&
+set guipty&
+if exists('l:saved')
+let [&g:guipty, &l:guipty] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guitablabel()
+if exists('+guitablabel') && execute('set!') =~# '\n..guitablabel\([=\n]\|$\)'
+let l:saved = [&g:guitablabel, &l:guitablabel]
+endif
+if exists('+guitablabel')
+set guitablabel=
+set guitablabel=xxx
+setlocal guitablabel=
+setlocal guitablabel=xxx
+setglobal guitablabel=
+setglobal guitablabel=xxx
+set gtl=
+set gtl=xxx
+setlocal gtl=
+setlocal gtl=xxx
+setglobal gtl=
+setglobal gtl=xxx
+set guitablabel&
+set gtl&
+if exists('l:saved')
+let [&g:guitablabel, &l:guitablabel] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_guitabtooltip()
+if exists('+guitabtooltip') && execute('set!') =~# '\n..guitabtooltip\([=\n]\|$\)'
+let l:saved = [&g:guitabtooltip, &l:guitabtooltip]
+endif
+if exists('+guitabtooltip')
+set guitabtooltip=
+set guitabtooltip=xxx
+setlocal guitabtooltip=
+setlocal guitabtooltip=xxx
+setglobal guitabtooltip=
+setglobal guitabtooltip=xxx
+set gtt=
+set gtt=xxx
+setlocal gtt=
+setlocal gtt=xxx
+setglobal gtt=
+setglobal gtt=xxx
+set guitabtooltip&
+set gtt&
+if exists('l:saved')
+let [&g:guitabtooltip, &l:guitabtooltip] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_hardtabs()
+if exists('+hardtabs') && execute('set!') =~# '\n..hardtabs\([=\n]\|$\)'
+let l:saved = [&g:hardtabs, &l:hardtabs]
+endif
+if exists('+hardtabs')
+set hardtabs=-1
+set hardtabs=0
+set hardtabs=100
+setlocal hardtabs=-1
+setlocal hardtabs=0
+setlocal hardtabs=100
+setglobal hardtabs=-1
+setglobal hardtabs=0
+setglobal hardtabs=100
+set ht=-1
+set ht=0
+set ht=100
+setlocal ht=-1
+setlocal ht=0
+setlocal ht=100
+setglobal ht=-1
+setglobal ht=0
+setglobal ht=100
+silent! call assert_fails('set hardtabs=')
+silent! call assert_fails('setlocal hardtabs=')
+silent! call assert_fails('setglobal hardtabs=')
+silent! call assert_fails('set ht=')
+silent! call assert_fails('setlocal ht=')
+silent! call assert_fails('setglobal ht=')
+set hardtabs&
+set ht&
+if exists('l:saved')
+let [&g:hardtabs, &l:hardtabs] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_helpfile()
+if exists('+helpfile') && execute('set!') =~# '\n..helpfile\([=\n]\|$\)'
+let l:saved = [&g:helpfile, &l:helpfile]
+endif
+if exists('+helpfile')
+set helpfile=
+set helpfile=xxx
+setlocal helpfile=
+setlocal helpfile=xxx
+setglobal helpfile=
+setglobal helpfile=xxx
+set hf=
+set hf=xxx
+setlocal hf=
+setlocal hf=xxx
+setglobal hf=
+setglobal hf=xxx
+set helpfile&
+set hf&
+if exists('l:saved')
+let [&g:helpfile, &l:helpfile] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_helpheight()
+if exists('+helpheight') && execute('set!') =~# '\n..helpheight\([=\n]\|$\)'
+let l:saved = [&g:helpheight, &l:helpheight]
+endif
+if exists('+helpheight')
+set helpheight=0
+set helpheight=10
+set helpheight=100
+setlocal helpheight=0
+setlocal helpheight=10
+setlocal helpheight=100
+setglobal helpheight=0
+setglobal helpheight=10
+setglobal helpheight=100
+set hh=0
+set hh=10
+set hh=100
+setlocal hh=0
+setlocal hh=10
+setlocal hh=100
+setglobal hh=0
+setglobal hh=10
+setglobal hh=100
+silent! call assert_fails('set helpheight=-1')
+silent! call assert_fails('setlocal helpheight=-1')
+silent! call assert_fails('setglobal helpheight=-1')
+silent! call assert_fails('set hh=-1')
+silent! call assert_fails('setlocal hh=-1')
+silent! call assert_fails('setglobal hh=-1')
+set helpheight&
+set hh&
+if exists('l:saved')
+let [&g:helpheight, &l:helpheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_helplang()
+if exists('+helplang') && execute('set!') =~# '\n..helplang\([=\n]\|$\)'
+let l:saved = [&g:helplang, &l:helplang]
+endif
+if exists('+helplang')
+set helplang=
+set helplang=de
+set helplang=de,it
+setlocal helplang=
+setlocal helplang=de
+setlocal helplang=de,it
+setglobal helplang=
+setglobal helplang=de
+setglobal helplang=de,it
+set hlg=
+set hlg=de
+set hlg=de,it
+setlocal hlg=
+setlocal hlg=de
+setlocal hlg=de,it
+setglobal hlg=
+setglobal hlg=de
+setglobal hlg=de,it
+silent! call assert_fails('set helplang=xxx')
+silent! call assert_fails('setlocal helplang=xxx')
+silent! call assert_fails('setglobal helplang=xxx')
+silent! call assert_fails('set hlg=xxx')
+silent! call assert_fails('setlocal hlg=xxx')
+silent! call assert_fails('setglobal hlg=xxx')
+set helplang&
+set hlg&
+if exists('l:saved')
+let [&g:helplang, &l:helplang] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_hidden()
+if exists('+hidden') && execute('set!') =~# '\n..hidden\([=\n]\|$\)'
+let l:saved = [&g:hidden, &l:hidden]
+endif
+if exists('+hidden')
+set hidden
+set nohidden
+set invhidden
+set hidden!
+setlocal hidden
+setlocal nohidden
+setlocal invhidden
+setlocal hidden!
+setglobal hidden
+setglobal nohidden
+setglobal invhidden
+setglobal hidden!
+set hid
+set nohid
+set invhid
+set hid!
+setlocal hid
+setlocal nohid
+setlocal invhid
+setlocal hid!
+setglobal hid
+setglobal nohid
+setglobal invhid
+setglobal hid!
+set hidden&
+set hid&
+if exists('l:saved')
+let [&g:hidden, &l:hidden] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_highlight()
+if exists('+highlight') && execute('set!') =~# '\n..highlight\([=\n]\|$\)'
+let l:saved = [&g:highlight, &l:highlight]
+endif
+if exists('+highlight')
+set highlight=
+set highlight=e:Error
+setlocal highlight=
+setlocal highlight=e:Error
+setglobal highlight=
+setglobal highlight=e:Error
+set hl=
+set hl=e:Error
+setlocal hl=
+setlocal hl=e:Error
+setglobal hl=
+setglobal hl=e:Error
+silent! call assert_fails('set highlight=xxx')
+silent! call assert_fails('setlocal highlight=xxx')
+silent! call assert_fails('setglobal highlight=xxx')
+silent! call assert_fails('set hl=xxx')
+silent! call assert_fails('setlocal hl=xxx')
+silent! call assert_fails('setglobal hl=xxx')
+set highlight&
+set hl&
+if exists('l:saved')
+let [&g:highlight, &l:highlight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_history()
+if exists('+history') && execute('set!') =~# '\n..history\([=\n]\|$\)'
+let l:saved = [&g:history, &l:history]
+endif
+if exists('+history')
+set history=0
+set history=1
+set history=100
+set history=10000
+setlocal history=0
+setlocal history=1
+setlocal history=100
+setlocal history=10000
+setglobal history=0
+setglobal history=1
+setglobal history=100
+setglobal history=10000
+set hi=0
+set hi=1
+set hi=100
+set hi=10000
+setlocal hi=0
+setlocal hi=1
+setlocal hi=100
+setlocal hi=10000
+setglobal hi=0
+setglobal hi=1
+setglobal hi=100
+setglobal hi=10000
+silent! call assert_fails('set history=-1')
+silent! call assert_fails('set history=10001')
+silent! call assert_fails('setlocal history=-1')
+silent! call assert_fails('setlocal history=10001')
+silent! call assert_fails('setglobal history=-1')
+silent! call assert_fails('setglobal history=10001')
+silent! call assert_fails('set hi=-1')
+silent! call assert_fails('set hi=10001')
+silent! call assert_fails('setlocal hi=-1')
+silent! call assert_fails('setlocal hi=10001')
+silent! call assert_fails('setglobal hi=-1')
+silent! call assert_fails('setglobal hi=10001')
+set history&
+set hi&
+if exists('l:saved')
+let [&g:history, &l:history] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_hkmap()
+if exists('+hkmap') && execute('set!') =~# '\n..hkmap\([=\n]\|$\)'
+let l:saved = [&g:hkmap, &l:hkmap]
+endif
+if exists('+hkmap')
+set hkmap
+set nohkmap
+set invhkmap
+set hkmap!
+setlocal hkmap
+setlocal nohkmap
+setlocal invhkmap
+setlocal hkmap!
+setglobal hkmap
+setglobal nohkmap
+setglobal invhkmap
+setglobal hkmap!
+set hk
+set nohk
+set invhk
+set hk!
+setlocal hk
+setlocal nohk
+setlocal invhk
+setlocal hk!
+setglobal hk
+setglobal nohk
+setglobal invhk
+setglobal hk!
+set hkmap&
+set hk&
+if exists('l:saved')
+let [&g:hkmap, &l:hkmap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_hkmapp()
+if exists('+hkmapp') && execute('set!') =~# '\n..hkmapp\([=\n]\|$\)'
+let l:saved = [&g:hkmapp, &l:hkmapp]
+endif
+if exists('+hkmapp')
+set hkmapp
+set nohkmapp
+set invhkmapp
+set hkmapp!
+setlocal hkmapp
+setlocal nohkmapp
+setlocal invhkmapp
+setlocal hkmapp!
+setglobal hkmapp
+setglobal nohkmapp
+setglobal invhkmapp
+setglobal hkmapp!
+set hkp
+set nohkp
+set invhkp
+set hkp!
+setlocal hkp
+setlocal nohkp
+setlocal invhkp
+setlocal hkp!
+setglobal hkp
+setglobal nohkp
+setglobal invhkp
+setglobal hkp!
+set hkmapp&
+set hkp&
+if exists('l:saved')
+let [&g:hkmapp, &l:hkmapp] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_hlsearch()
+if exists('+hlsearch') && execute('set!') =~# '\n..hlsearch\([=\n]\|$\)'
+let l:saved = [&g:hlsearch, &l:hlsearch]
+endif
+if exists('+hlsearch')
+set hlsearch
+set nohlsearch
+set invhlsearch
+set hlsearch!
+setlocal hlsearch
+setlocal nohlsearch
+setlocal invhlsearch
+setlocal hlsearch!
+setglobal hlsearch
+setglobal nohlsearch
+setglobal invhlsearch
+setglobal hlsearch!
+set hls
+set nohls
+set invhls
+set hls!
+setlocal hls
+setlocal nohls
+setlocal invhls
+setlocal hls!
+setglobal hls
+setglobal nohls
+setglobal invhls
+setglobal hls!
+set hlsearch&
+set hls&
+if exists('l:saved')
+let [&g:hlsearch, &l:hlsearch] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_icon()
+if exists('+icon') && execute('set!') =~# '\n..icon\([=\n]\|$\)'
+let l:saved = [&g:icon, &l:icon]
+endif
+if exists('+icon')
+set icon
+set noicon
+set invicon
+set icon!
+setlocal icon
+setlocal noicon
+setlocal invicon
+setlocal icon!
+setglobal icon
+setglobal noicon
+setglobal invicon
+setglobal icon!
+set icon
+set noicon
+set invicon
+set icon!
+setlocal icon
+setlocal noicon
+setlocal invicon
+setlocal icon!
+setglobal icon
+setglobal noicon
+setglobal invicon
+setglobal icon!
+set icon&
+set icon&
+if exists('l:saved')
+let [&g:icon, &l:icon] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_iconstring()
+if exists('+iconstring') && execute('set!') =~# '\n..iconstring\([=\n]\|$\)'
+let l:saved = [&g:iconstring, &l:iconstring]
+endif
+if exists('+iconstring')
+set iconstring=
+set iconstring=xxx
+setlocal iconstring=
+setlocal iconstring=xxx
+setglobal iconstring=
+setglobal iconstring=xxx
+set iconstring=
+set iconstring=xxx
+setlocal iconstring=
+setlocal iconstring=xxx
+setglobal iconstring=
+setglobal iconstring=xxx
+set iconstring&
+set iconstring&
+if exists('l:saved')
+let [&g:iconstring, &l:iconstring] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ignorecase()
+if exists('+ignorecase') && execute('set!') =~# '\n..ignorecase\([=\n]\|$\)'
+let l:saved = [&g:ignorecase, &l:ignorecase]
+endif
+if exists('+ignorecase')
+set ignorecase
+set noignorecase
+set invignorecase
+set ignorecase!
+setlocal ignorecase
+setlocal noignorecase
+setlocal invignorecase
+setlocal ignorecase!
+setglobal ignorecase
+setglobal noignorecase
+setglobal invignorecase
+setglobal ignorecase!
+set ic
+set noic
+set invic
+set ic!
+setlocal ic
+setlocal noic
+setlocal invic
+setlocal ic!
+setglobal ic
+setglobal noic
+setglobal invic
+setglobal ic!
+set ignorecase&
+set ic&
+if exists('l:saved')
+let [&g:ignorecase, &l:ignorecase] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_imactivatefunc()
+if exists('+imactivatefunc') && execute('set!') =~# '\n..imactivatefunc\([=\n]\|$\)'
+let l:saved = [&g:imactivatefunc, &l:imactivatefunc]
+endif
+if exists('+imactivatefunc')
+set imactivatefunc=
+set imactivatefunc=xxx
+setlocal imactivatefunc=
+setlocal imactivatefunc=xxx
+setglobal imactivatefunc=
+setglobal imactivatefunc=xxx
+set imaf=
+set imaf=xxx
+setlocal imaf=
+setlocal imaf=xxx
+setglobal imaf=
+setglobal imaf=xxx
+set imactivatefunc&
+set imaf&
+if exists('l:saved')
+let [&g:imactivatefunc, &l:imactivatefunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_imactivatekey()
+if exists('+imactivatekey') && execute('set!') =~# '\n..imactivatekey\([=\n]\|$\)'
+let l:saved = [&g:imactivatekey, &l:imactivatekey]
+endif
+if exists('+imactivatekey')
+set imactivatekey=
+set imactivatekey=S-space
+setlocal imactivatekey=
+setlocal imactivatekey=S-space
+setglobal imactivatekey=
+setglobal imactivatekey=S-space
+set imak=
+set imak=S-space
+setlocal imak=
+setlocal imak=S-space
+setglobal imak=
+setglobal imak=S-space
+silent! call assert_fails('set imactivatekey=xxx')
+silent! call assert_fails('setlocal imactivatekey=xxx')
+silent! call assert_fails('setglobal imactivatekey=xxx')
+silent! call assert_fails('set imak=xxx')
+silent! call assert_fails('setlocal imak=xxx')
+silent! call assert_fails('setglobal imak=xxx')
+set imactivatekey&
+set imak&
+if exists('l:saved')
+let [&g:imactivatekey, &l:imactivatekey] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_imcmdline()
+if exists('+imcmdline') && execute('set!') =~# '\n..imcmdline\([=\n]\|$\)'
+let l:saved = [&g:imcmdline, &l:imcmdline]
+endif
+if exists('+imcmdline')
+set imcmdline
+set noimcmdline
+set invimcmdline
+set imcmdline!
+setlocal imcmdline
+setlocal noimcmdline
+setlocal invimcmdline
+setlocal imcmdline!
+setglobal imcmdline
+setglobal noimcmdline
+setglobal invimcmdline
+setglobal imcmdline!
+set imc
+set noimc
+set invimc
+set imc!
+setlocal imc
+setlocal noimc
+setlocal invimc
+setlocal imc!
+setglobal imc
+setglobal noimc
+setglobal invimc
+setglobal imc!
+set imcmdline&
+set imc&
+if exists('l:saved')
+let [&g:imcmdline, &l:imcmdline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_imdisable()
+if exists('+imdisable') && execute('set!') =~# '\n..imdisable\([=\n]\|$\)'
+let l:saved = [&g:imdisable, &l:imdisable]
+endif
+if exists('+imdisable')
+set imdisable
+set noimdisable
+set invimdisable
+set imdisable!
+setlocal imdisable
+setlocal noimdisable
+setlocal invimdisable
+setlocal imdisable!
+setglobal imdisable
+setglobal noimdisable
+setglobal invimdisable
+setglobal imdisable!
+set imd
+set noimd
+set invimd
+set imd!
+setlocal imd
+setlocal noimd
+setlocal invimd
+setlocal imd!
+setglobal imd
+setglobal noimd
+setglobal invimd
+setglobal imd!
+set imdisable&
+set imd&
+if exists('l:saved')
+let [&g:imdisable, &l:imdisable] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_iminsert()
+if exists('+iminsert') && execute('set!') =~# '\n..iminsert\([=\n]\|$\)'
+let l:saved = [&g:iminsert, &l:iminsert]
+endif
+if exists('+iminsert')
+set iminsert=0
+set iminsert=1
+set iminsert=2
+setlocal iminsert=0
+setlocal iminsert=1
+setlocal iminsert=2
+setglobal iminsert=0
+setglobal iminsert=1
+setglobal iminsert=2
+set imi=0
+set imi=1
+set imi=2
+setlocal imi=0
+setlocal imi=1
+setlocal imi=2
+setglobal imi=0
+setglobal imi=1
+setglobal imi=2
+silent! call assert_fails('set iminsert=-1')
+silent! call assert_fails('set iminsert=3')
+silent! call assert_fails('set iminsert=999')
+silent! call assert_fails('setlocal iminsert=-1')
+silent! call assert_fails('setlocal iminsert=3')
+silent! call assert_fails('setlocal iminsert=999')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal iminsert=-1')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal iminsert=3')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal iminsert=999')
+silent! call assert_fails('set imi=-1')
+silent! call assert_fails('set imi=3')
+silent! call assert_fails('set imi=999')
+silent! call assert_fails('setlocal imi=-1')
+silent! call assert_fails('setlocal imi=3')
+silent! call assert_fails('setlocal imi=999')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal imi=-1')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal imi=3')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal imi=999')
+set iminsert&
+set imi&
+if exists('l:saved')
+let [&g:iminsert, &l:iminsert] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_imsearch()
+if exists('+imsearch') && execute('set!') =~# '\n..imsearch\([=\n]\|$\)'
+let l:saved = [&g:imsearch, &l:imsearch]
+endif
+if exists('+imsearch')
+set imsearch=-1
+set imsearch=0
+set imsearch=1
+set imsearch=2
+setlocal imsearch=-1
+setlocal imsearch=0
+setlocal imsearch=1
+setlocal imsearch=2
+setglobal imsearch=-1
+setglobal imsearch=0
+setglobal imsearch=1
+setglobal imsearch=2
+set ims=-1
+set ims=0
+set ims=1
+set ims=2
+setlocal ims=-1
+setlocal ims=0
+setlocal ims=1
+setlocal ims=2
+setglobal ims=-1
+setglobal ims=0
+setglobal ims=1
+setglobal ims=2
+silent! call assert_fails('set imsearch=-2')
+silent! call assert_fails('set imsearch=3')
+silent! call assert_fails('set imsearch=999')
+silent! call assert_fails('setlocal imsearch=-2')
+silent! call assert_fails('setlocal imsearch=3')
+silent! call assert_fails('setlocal imsearch=999')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal imsearch=-2')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal imsearch=3')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal imsearch=999')
+silent! call assert_fails('set ims=-2')
+silent! call assert_fails('set ims=3')
+silent! call assert_fails('set ims=999')
+silent! call assert_fails('setlocal ims=-2')
+silent! call assert_fails('setlocal ims=3')
+silent! call assert_fails('setlocal ims=999')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal ims=-2')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal ims=3')
+" Skip The global value is always overwritten by the local value: silent! call assert_fails('setglobal ims=999')
+set imsearch&
+set ims&
+if exists('l:saved')
+let [&g:imsearch, &l:imsearch] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_imstatusfunc()
+if exists('+imstatusfunc') && execute('set!') =~# '\n..imstatusfunc\([=\n]\|$\)'
+let l:saved = [&g:imstatusfunc, &l:imstatusfunc]
+endif
+if exists('+imstatusfunc')
+set imstatusfunc=
+set imstatusfunc=xxx
+setlocal imstatusfunc=
+setlocal imstatusfunc=xxx
+setglobal imstatusfunc=
+setglobal imstatusfunc=xxx
+set imsf=
+set imsf=xxx
+setlocal imsf=
+setlocal imsf=xxx
+setglobal imsf=
+setglobal imsf=xxx
+set imstatusfunc&
+set imsf&
+if exists('l:saved')
+let [&g:imstatusfunc, &l:imstatusfunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_imstyle()
+if exists('+imstyle') && execute('set!') =~# '\n..imstyle\([=\n]\|$\)'
+let l:saved = [&g:imstyle, &l:imstyle]
+endif
+if exists('+imstyle')
+set imstyle=0
+set imstyle=1
+setlocal imstyle=0
+setlocal imstyle=1
+setglobal imstyle=0
+setglobal imstyle=1
+set imst=0
+set imst=1
+setlocal imst=0
+setlocal imst=1
+setglobal imst=0
+setglobal imst=1
+silent! call assert_fails('set imstyle=-1')
+silent! call assert_fails('set imstyle=2')
+silent! call assert_fails('set imstyle=999')
+silent! call assert_fails('setlocal imstyle=-1')
+silent! call assert_fails('setlocal imstyle=2')
+silent! call assert_fails('setlocal imstyle=999')
+silent! call assert_fails('setglobal imstyle=-1')
+silent! call assert_fails('setglobal imstyle=2')
+silent! call assert_fails('setglobal imstyle=999')
+silent! call assert_fails('set imst=-1')
+silent! call assert_fails('set imst=2')
+silent! call assert_fails('set imst=999')
+silent! call assert_fails('setlocal imst=-1')
+silent! call assert_fails('setlocal imst=2')
+silent! call assert_fails('setlocal imst=999')
+silent! call assert_fails('setglobal imst=-1')
+silent! call assert_fails('setglobal imst=2')
+silent! call assert_fails('setglobal imst=999')
+set imstyle&
+set imst&
+if exists('l:saved')
+let [&g:imstyle, &l:imstyle] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_include()
+if exists('+include') && execute('set!') =~# '\n..include\([=\n]\|$\)'
+let l:saved = [&g:include, &l:include]
+endif
+if exists('+include')
+set include=
+set include=xxx
+setlocal include=
+setlocal include=xxx
+setglobal include=
+setglobal include=xxx
+setlocal include=
+call assert_equal(&g:include, &include)
+set inc=
+set inc=xxx
+setlocal inc=
+setlocal inc=xxx
+setglobal inc=
+setglobal inc=xxx
+setlocal inc=
+call assert_equal(&g:include, &include)
+set include&
+set inc&
+if exists('l:saved')
+let [&g:include, &l:include] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_includeexpr()
+if exists('+includeexpr') && execute('set!') =~# '\n..includeexpr\([=\n]\|$\)'
+let l:saved = [&g:includeexpr, &l:includeexpr]
+endif
+if exists('+includeexpr')
+set includeexpr=
+set includeexpr=xxx
+setlocal includeexpr=
+setlocal includeexpr=xxx
+setglobal includeexpr=
+setglobal includeexpr=xxx
+set inex=
+set inex=xxx
+setlocal inex=
+setlocal inex=xxx
+setglobal inex=
+setglobal inex=xxx
+set includeexpr&
+set inex&
+if exists('l:saved')
+let [&g:includeexpr, &l:includeexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_incsearch()
+if exists('+incsearch') && execute('set!') =~# '\n..incsearch\([=\n]\|$\)'
+let l:saved = [&g:incsearch, &l:incsearch]
+endif
+if exists('+incsearch')
+set incsearch
+set noincsearch
+set invincsearch
+set incsearch!
+setlocal incsearch
+setlocal noincsearch
+setlocal invincsearch
+setlocal incsearch!
+setglobal incsearch
+setglobal noincsearch
+setglobal invincsearch
+setglobal incsearch!
+set is
+set nois
+set invis
+set is!
+setlocal is
+setlocal nois
+setlocal invis
+setlocal is!
+setglobal is
+setglobal nois
+setglobal invis
+setglobal is!
+set incsearch&
+set is&
+if exists('l:saved')
+let [&g:incsearch, &l:incsearch] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_indentexpr()
+if exists('+indentexpr') && execute('set!') =~# '\n..indentexpr\([=\n]\|$\)'
+let l:saved = [&g:indentexpr, &l:indentexpr]
+endif
+if exists('+indentexpr')
+set indentexpr=
+set indentexpr=xxx
+setlocal indentexpr=
+setlocal indentexpr=xxx
+setglobal indentexpr=
+setglobal indentexpr=xxx
+set inde=
+set inde=xxx
+setlocal inde=
+setlocal inde=xxx
+setglobal inde=
+setglobal inde=xxx
+set indentexpr&
+set inde&
+if exists('l:saved')
+let [&g:indentexpr, &l:indentexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_indentkeys()
+if exists('+indentkeys') && execute('set!') =~# '\n..indentkeys\([=\n]\|$\)'
+let l:saved = [&g:indentkeys, &l:indentkeys]
+endif
+if exists('+indentkeys')
+set indentkeys=
+set indentkeys=xxx
+setlocal indentkeys=
+setlocal indentkeys=xxx
+setglobal indentkeys=
+setglobal indentkeys=xxx
+set indk=
+set indk=xxx
+setlocal indk=
+setlocal indk=xxx
+setglobal indk=
+setglobal indk=xxx
+set indentkeys&
+set indk&
+if exists('l:saved')
+let [&g:indentkeys, &l:indentkeys] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_infercase()
+if exists('+infercase') && execute('set!') =~# '\n..infercase\([=\n]\|$\)'
+let l:saved = [&g:infercase, &l:infercase]
+endif
+if exists('+infercase')
+set infercase
+set noinfercase
+set invinfercase
+set infercase!
+setlocal infercase
+setlocal noinfercase
+setlocal invinfercase
+setlocal infercase!
+setglobal infercase
+setglobal noinfercase
+setglobal invinfercase
+setglobal infercase!
+set inf
+set noinf
+set invinf
+set inf!
+setlocal inf
+setlocal noinf
+setlocal invinf
+setlocal inf!
+setglobal inf
+setglobal noinf
+setglobal invinf
+setglobal inf!
+set infercase&
+set inf&
+if exists('l:saved')
+let [&g:infercase, &l:infercase] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_insertmode()
+if exists('+insertmode') && execute('set!') =~# '\n..insertmode\([=\n]\|$\)'
+let l:saved = [&g:insertmode, &l:insertmode]
+endif
+if exists('+insertmode')
+set insertmode
+set noinsertmode
+set invinsertmode
+set insertmode!
+setlocal insertmode
+setlocal noinsertmode
+setlocal invinsertmode
+setlocal insertmode!
+setglobal insertmode
+setglobal noinsertmode
+setglobal invinsertmode
+setglobal insertmode!
+set im
+set noim
+set invim
+set im!
+setlocal im
+setlocal noim
+setlocal invim
+setlocal im!
+setglobal im
+setglobal noim
+setglobal invim
+setglobal im!
+set insertmode&
+set im&
+if exists('l:saved')
+let [&g:insertmode, &l:insertmode] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_isexpand()
+if exists('+isexpand') && execute('set!') =~# '\n..isexpand\([=\n]\|$\)'
+let l:saved = [&g:isexpand, &l:isexpand]
+endif
+if exists('+isexpand')
+set isexpand=
+set isexpand=.,->
+set isexpand=/,/*,\\,
+setlocal isexpand=
+setlocal isexpand=.,->
+setlocal isexpand=/,/*,\\,
+setglobal isexpand=
+setglobal isexpand=.,->
+setglobal isexpand=/,/*,\\,
+set ise=
+set ise=.,->
+set ise=/,/*,\\,
+setlocal ise=
+setlocal ise=.,->
+setlocal ise=/,/*,\\,
+setglobal ise=
+setglobal ise=.,->
+setglobal ise=/,/*,\\,
+silent! call assert_fails('set isexpand=,,')
+silent! call assert_fails('set isexpand=\\,,')
+silent! call assert_fails('setlocal isexpand=,,')
+silent! call assert_fails('setlocal isexpand=\\,,')
+silent! call assert_fails('setglobal isexpand=,,')
+silent! call assert_fails('setglobal isexpand=\\,,')
+silent! call assert_fails('set ise=,,')
+silent! call assert_fails('set ise=\\,,')
+silent! call assert_fails('setlocal ise=,,')
+silent! call assert_fails('setlocal ise=\\,,')
+silent! call assert_fails('setglobal ise=,,')
+silent! call assert_fails('setglobal ise=\\,,')
+set isexpand&
+set ise&
+if exists('l:saved')
+let [&g:isexpand, &l:isexpand] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_isfname()
+if exists('+isfname') && execute('set!') =~# '\n..isfname\([=\n]\|$\)'
+let l:saved = [&g:isfname, &l:isfname]
+endif
+if exists('+isfname')
+set isfname=
+set isfname=@
+set isfname=@,48-52
+setlocal isfname=
+setlocal isfname=@
+setlocal isfname=@,48-52
+setglobal isfname=
+setglobal isfname=@
+setglobal isfname=@,48-52
+set isf=
+set isf=@
+set isf=@,48-52
+setlocal isf=
+setlocal isf=@
+setlocal isf=@,48-52
+setglobal isf=
+setglobal isf=@
+setglobal isf=@,48-52
+silent! call assert_fails('set isfname=xxx')
+silent! call assert_fails('set isfname=@48')
+silent! call assert_fails('setlocal isfname=xxx')
+silent! call assert_fails('setlocal isfname=@48')
+silent! call assert_fails('setglobal isfname=xxx')
+silent! call assert_fails('setglobal isfname=@48')
+silent! call assert_fails('set isf=xxx')
+silent! call assert_fails('set isf=@48')
+silent! call assert_fails('setlocal isf=xxx')
+silent! call assert_fails('setlocal isf=@48')
+silent! call assert_fails('setglobal isf=xxx')
+silent! call assert_fails('setglobal isf=@48')
+set isfname&
+set isf&
+if exists('l:saved')
+let [&g:isfname, &l:isfname] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_isident()
+if exists('+isident') && execute('set!') =~# '\n..isident\([=\n]\|$\)'
+let l:saved = [&g:isident, &l:isident]
+endif
+if exists('+isident')
+set isident=
+set isident=@
+set isident=@,48-52
+setlocal isident=
+setlocal isident=@
+setlocal isident=@,48-52
+setglobal isident=
+setglobal isident=@
+setglobal isident=@,48-52
+set isi=
+set isi=@
+set isi=@,48-52
+setlocal isi=
+setlocal isi=@
+setlocal isi=@,48-52
+setglobal isi=
+setglobal isi=@
+setglobal isi=@,48-52
+silent! call assert_fails('set isident=xxx')
+silent! call assert_fails('set isident=@48')
+silent! call assert_fails('setlocal isident=xxx')
+silent! call assert_fails('setlocal isident=@48')
+silent! call assert_fails('setglobal isident=xxx')
+silent! call assert_fails('setglobal isident=@48')
+silent! call assert_fails('set isi=xxx')
+silent! call assert_fails('set isi=@48')
+silent! call assert_fails('setlocal isi=xxx')
+silent! call assert_fails('setlocal isi=@48')
+silent! call assert_fails('setglobal isi=xxx')
+silent! call assert_fails('setglobal isi=@48')
+set isident&
+set isi&
+if exists('l:saved')
+let [&g:isident, &l:isident] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_iskeyword()
+if exists('+iskeyword') && execute('set!') =~# '\n..iskeyword\([=\n]\|$\)'
+let l:saved = [&g:iskeyword, &l:iskeyword]
+endif
+if exists('+iskeyword')
+set iskeyword=
+set iskeyword=@
+set iskeyword=@,48-52
+setlocal iskeyword=
+setlocal iskeyword=@
+setlocal iskeyword=@,48-52
+setglobal iskeyword=
+setglobal iskeyword=@
+setglobal iskeyword=@,48-52
+set isk=
+set isk=@
+set isk=@,48-52
+setlocal isk=
+setlocal isk=@
+setlocal isk=@,48-52
+setglobal isk=
+setglobal isk=@
+setglobal isk=@,48-52
+silent! call assert_fails('set iskeyword=xxx')
+silent! call assert_fails('set iskeyword=@48')
+silent! call assert_fails('setlocal iskeyword=xxx')
+silent! call assert_fails('setlocal iskeyword=@48')
+silent! call assert_fails('setglobal iskeyword=xxx')
+silent! call assert_fails('setglobal iskeyword=@48')
+silent! call assert_fails('set isk=xxx')
+silent! call assert_fails('set isk=@48')
+silent! call assert_fails('setlocal isk=xxx')
+silent! call assert_fails('setlocal isk=@48')
+silent! call assert_fails('setglobal isk=xxx')
+silent! call assert_fails('setglobal isk=@48')
+set iskeyword&
+set isk&
+if exists('l:saved')
+let [&g:iskeyword, &l:iskeyword] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_isprint()
+if exists('+isprint') && execute('set!') =~# '\n..isprint\([=\n]\|$\)'
+let l:saved = [&g:isprint, &l:isprint]
+endif
+if exists('+isprint')
+set isprint=
+set isprint=@
+set isprint=@,48-52
+setlocal isprint=
+setlocal isprint=@
+setlocal isprint=@,48-52
+setglobal isprint=
+setglobal isprint=@
+setglobal isprint=@,48-52
+set isp=
+set isp=@
+set isp=@,48-52
+setlocal isp=
+setlocal isp=@
+setlocal isp=@,48-52
+setglobal isp=
+setglobal isp=@
+setglobal isp=@,48-52
+silent! call assert_fails('set isprint=xxx')
+silent! call assert_fails('set isprint=@48')
+silent! call assert_fails('setlocal isprint=xxx')
+silent! call assert_fails('setlocal isprint=@48')
+silent! call assert_fails('setglobal isprint=xxx')
+silent! call assert_fails('setglobal isprint=@48')
+silent! call assert_fails('set isp=xxx')
+silent! call assert_fails('set isp=@48')
+silent! call assert_fails('setlocal isp=xxx')
+silent! call assert_fails('setlocal isp=@48')
+silent! call assert_fails('setglobal isp=xxx')
+silent! call assert_fails('setglobal isp=@48')
+set isprint&
+set isp&
+if exists('l:saved')
+let [&g:isprint, &l:isprint] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_joinspaces()
+if exists('+joinspaces') && execute('set!') =~# '\n..joinspaces\([=\n]\|$\)'
+let l:saved = [&g:joinspaces, &l:joinspaces]
+endif
+if exists('+joinspaces')
+set joinspaces
+set nojoinspaces
+set invjoinspaces
+set joinspaces!
+setlocal joinspaces
+setlocal nojoinspaces
+setlocal invjoinspaces
+setlocal joinspaces!
+setglobal joinspaces
+setglobal nojoinspaces
+setglobal invjoinspaces
+setglobal joinspaces!
+set js
+set nojs
+set invjs
+set js!
+setlocal js
+setlocal nojs
+setlocal invjs
+setlocal js!
+setglobal js
+setglobal nojs
+setglobal invjs
+setglobal js!
+set joinspaces&
+set js&
+if exists('l:saved')
+let [&g:joinspaces, &l:joinspaces] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_jumpoptions()
+if exists('+jumpoptions') && execute('set!') =~# '\n..jumpoptions\([=\n]\|$\)'
+let l:saved = [&g:jumpoptions, &l:jumpoptions]
+endif
+if exists('+jumpoptions')
+set jumpoptions=
+set jumpoptions=stack
+setlocal jumpoptions=
+setlocal jumpoptions=stack
+setglobal jumpoptions=
+setglobal jumpoptions=stack
+set jop=
+set jop=stack
+setlocal jop=
+setlocal jop=stack
+setglobal jop=
+setglobal jop=stack
+silent! call assert_fails('set jumpoptions=xxx')
+silent! call assert_fails('setlocal jumpoptions=xxx')
+silent! call assert_fails('setglobal jumpoptions=xxx')
+silent! call assert_fails('set jop=xxx')
+silent! call assert_fails('setlocal jop=xxx')
+silent! call assert_fails('setglobal jop=xxx')
+set jumpoptions&
+set jop&
+if exists('l:saved')
+let [&g:jumpoptions, &l:jumpoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_key()
+if exists('+key') && execute('set!') =~# '\n..key\([=\n]\|$\)'
+let l:saved = [&g:key, &l:key]
+endif
+if exists('+key')
+set key=
+set key=xxx
+setlocal key=
+setlocal key=xxx
+setglobal key=
+setglobal key=xxx
+set key=
+set key=xxx
+setlocal key=
+setlocal key=xxx
+setglobal key=
+setglobal key=xxx
+set key&
+set key&
+if exists('l:saved')
+let [&g:key, &l:key] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_keymap()
+if exists('+keymap') && execute('set!') =~# '\n..keymap\([=\n]\|$\)'
+let l:saved = [&g:keymap, &l:keymap]
+endif
+if exists('+keymap')
+set keymap=
+set keymap=accents
+setlocal keymap=
+setlocal keymap=accents
+setglobal keymap=
+setglobal keymap=accents
+set kmp=
+set kmp=accents
+setlocal kmp=
+setlocal kmp=accents
+setglobal kmp=
+setglobal kmp=accents
+silent! call assert_fails('set keymap=/')
+silent! call assert_fails('setlocal keymap=/')
+silent! call assert_fails('setglobal keymap=/')
+silent! call assert_fails('set kmp=/')
+silent! call assert_fails('setlocal kmp=/')
+silent! call assert_fails('setglobal kmp=/')
+set keymap&
+set kmp&
+if exists('l:saved')
+let [&g:keymap, &l:keymap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_keymodel()
+if exists('+keymodel') && execute('set!') =~# '\n..keymodel\([=\n]\|$\)'
+let l:saved = [&g:keymodel, &l:keymodel]
+endif
+if exists('+keymodel')
+set keymodel=
+set keymodel=startsel
+set keymodel=stopsel
+set keymodel=startsel,stopsel
+setlocal keymodel=
+setlocal keymodel=startsel
+setlocal keymodel=stopsel
+setlocal keymodel=startsel,stopsel
+setglobal keymodel=
+setglobal keymodel=startsel
+setglobal keymodel=stopsel
+setglobal keymodel=startsel,stopsel
+set km=
+set km=startsel
+set km=stopsel
+set km=startsel,stopsel
+setlocal km=
+setlocal km=startsel
+setlocal km=stopsel
+setlocal km=startsel,stopsel
+setglobal km=
+setglobal km=startsel
+setglobal km=stopsel
+setglobal km=startsel,stopsel
+silent! call assert_fails('set keymodel=xxx')
+silent! call assert_fails('setlocal keymodel=xxx')
+silent! call assert_fails('setglobal keymodel=xxx')
+silent! call assert_fails('set km=xxx')
+silent! call assert_fails('setlocal km=xxx')
+silent! call assert_fails('setglobal km=xxx')
+set keymodel&
+set km&
+if exists('l:saved')
+let [&g:keymodel, &l:keymodel] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_keyprotocol()
+if exists('+keyprotocol') && execute('set!') =~# '\n..keyprotocol\([=\n]\|$\)'
+let l:saved = [&g:keyprotocol, &l:keyprotocol]
+endif
+if exists('+keyprotocol')
+set keyprotocol=
+set keyprotocol=xxx:none
+set keyprotocol=yyy:mok2
+set keyprotocol=zzz:kitty
+setlocal keyprotocol=
+setlocal keyprotocol=xxx:none
+setlocal keyprotocol=yyy:mok2
+setlocal keyprotocol=zzz:kitty
+setglobal keyprotocol=
+setglobal keyprotocol=xxx:none
+setglobal keyprotocol=yyy:mok2
+setglobal keyprotocol=zzz:kitty
+set kpc=
+set kpc=xxx:none
+set kpc=yyy:mok2
+set kpc=zzz:kitty
+setlocal kpc=
+setlocal kpc=xxx:none
+setlocal kpc=yyy:mok2
+setlocal kpc=zzz:kitty
+setglobal kpc=
+setglobal kpc=xxx:none
+setglobal kpc=yyy:mok2
+setglobal kpc=zzz:kitty
+silent! call assert_fails('set keyprotocol=xxx')
+silent! call assert_fails('set keyprotocol=:none')
+silent! call assert_fails('set keyprotocol=xxx:')
+silent! call assert_fails('set keyprotocol=x:non')
+silent! call assert_fails('set keyprotocol=y:mok3')
+silent! call assert_fails('set keyprotocol=z:kittty')
+silent! call assert_fails('setlocal keyprotocol=xxx')
+silent! call assert_fails('setlocal keyprotocol=:none')
+silent! call assert_fails('setlocal keyprotocol=xxx:')
+silent! call assert_fails('setlocal keyprotocol=x:non')
+silent! call assert_fails('setlocal keyprotocol=y:mok3')
+silent! call assert_fails('setlocal keyprotocol=z:kittty')
+silent! call assert_fails('setglobal keyprotocol=xxx')
+silent! call assert_fails('setglobal keyprotocol=:none')
+silent! call assert_fails('setglobal keyprotocol=xxx:')
+silent! call assert_fails('setglobal keyprotocol=x:non')
+silent! call assert_fails('setglobal keyprotocol=y:mok3')
+silent! call assert_fails('setglobal keyprotocol=z:kittty')
+silent! call assert_fails('set kpc=xxx')
+silent! call assert_fails('set kpc=:none')
+silent! call assert_fails('set kpc=xxx:')
+silent! call assert_fails('set kpc=x:non')
+silent! call assert_fails('set kpc=y:mok3')
+silent! call assert_fails('set kpc=z:kittty')
+silent! call assert_fails('setlocal kpc=xxx')
+silent! call assert_fails('setlocal kpc=:none')
+silent! call assert_fails('setlocal kpc=xxx:')
+silent! call assert_fails('setlocal kpc=x:non')
+silent! call assert_fails('setlocal kpc=y:mok3')
+silent! call assert_fails('setlocal kpc=z:kittty')
+silent! call assert_fails('setglobal kpc=xxx')
+silent! call assert_fails('setglobal kpc=:none')
+silent! call assert_fails('setglobal kpc=xxx:')
+silent! call assert_fails('setglobal kpc=x:non')
+silent! call assert_fails('setglobal kpc=y:mok3')
+silent! call assert_fails('setglobal kpc=z:kittty')
+set keyprotocol&
+set kpc&
+if exists('l:saved')
+let [&g:keyprotocol, &l:keyprotocol] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_keywordprg()
+if exists('+keywordprg') && execute('set!') =~# '\n..keywordprg\([=\n]\|$\)'
+let l:saved = [&g:keywordprg, &l:keywordprg]
+endif
+if exists('+keywordprg')
+set keywordprg=
+set keywordprg=xxx
+setlocal keywordprg=
+setlocal keywordprg=xxx
+setglobal keywordprg=
+setglobal keywordprg=xxx
+set kp=
+set kp=xxx
+setlocal kp=
+setlocal kp=xxx
+setglobal kp=
+setglobal kp=xxx
+set keywordprg&
+set kp&
+if exists('l:saved')
+let [&g:keywordprg, &l:keywordprg] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_langmap()
+if exists('+langmap') && execute('set!') =~# '\n..langmap\([=\n]\|$\)'
+let l:saved = [&g:langmap, &l:langmap]
+endif
+if exists('+langmap')
+set langmap=
+set langmap=xX
+set langmap=aA,bB
+setlocal langmap=
+setlocal langmap=xX
+setlocal langmap=aA,bB
+setglobal langmap=
+setglobal langmap=xX
+setglobal langmap=aA,bB
+set lmap=
+set lmap=xX
+set lmap=aA,bB
+setlocal lmap=
+setlocal lmap=xX
+setlocal lmap=aA,bB
+setglobal lmap=
+setglobal lmap=xX
+setglobal lmap=aA,bB
+silent! call assert_fails('set langmap=xxx')
+silent! call assert_fails('setlocal langmap=xxx')
+silent! call assert_fails('setglobal langmap=xxx')
+silent! call assert_fails('set lmap=xxx')
+silent! call assert_fails('setlocal lmap=xxx')
+silent! call assert_fails('setglobal lmap=xxx')
+set langmap&
+set lmap&
+if exists('l:saved')
+let [&g:langmap, &l:langmap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_langmenu()
+if exists('+langmenu') && execute('set!') =~# '\n..langmenu\([=\n]\|$\)'
+let l:saved = [&g:langmenu, &l:langmenu]
+endif
+if exists('+langmenu')
+set langmenu=
+set langmenu=xxx
+setlocal langmenu=
+setlocal langmenu=xxx
+setglobal langmenu=
+setglobal langmenu=xxx
+set lm=
+set lm=xxx
+setlocal lm=
+setlocal lm=xxx
+setglobal lm=
+setglobal lm=xxx
+set langmenu&
+set lm&
+if exists('l:saved')
+let [&g:langmenu, &l:langmenu] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_langnoremap()
+if exists('+langnoremap') && execute('set!') =~# '\n..langnoremap\([=\n]\|$\)'
+let l:saved = [&g:langnoremap, &l:langnoremap]
+endif
+if exists('+langnoremap')
+set langnoremap
+set nolangnoremap
+set invlangnoremap
+set langnoremap!
+setlocal langnoremap
+setlocal nolangnoremap
+setlocal invlangnoremap
+setlocal langnoremap!
+setglobal langnoremap
+setglobal nolangnoremap
+setglobal invlangnoremap
+setglobal langnoremap!
+set lnr
+set nolnr
+set invlnr
+set lnr!
+setlocal lnr
+setlocal nolnr
+setlocal invlnr
+setlocal lnr!
+setglobal lnr
+setglobal nolnr
+setglobal invlnr
+setglobal lnr!
+set langnoremap&
+set lnr&
+if exists('l:saved')
+let [&g:langnoremap, &l:langnoremap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_langremap()
+if exists('+langremap') && execute('set!') =~# '\n..langremap\([=\n]\|$\)'
+let l:saved = [&g:langremap, &l:langremap]
+endif
+if exists('+langremap')
+set langremap
+set nolangremap
+set invlangremap
+set langremap!
+setlocal langremap
+setlocal nolangremap
+setlocal invlangremap
+setlocal langremap!
+setglobal langremap
+setglobal nolangremap
+setglobal invlangremap
+setglobal langremap!
+set lrm
+set nolrm
+set invlrm
+set lrm!
+setlocal lrm
+setlocal nolrm
+setlocal invlrm
+setlocal lrm!
+setglobal lrm
+setglobal nolrm
+setglobal invlrm
+setglobal lrm!
+set langremap&
+set lrm&
+if exists('l:saved')
+let [&g:langremap, &l:langremap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_laststatus()
+if exists('+laststatus') && execute('set!') =~# '\n..laststatus\([=\n]\|$\)'
+let l:saved = [&g:laststatus, &l:laststatus]
+endif
+if exists('+laststatus')
+set laststatus=-1
+set laststatus=0
+set laststatus=100
+setlocal laststatus=-1
+setlocal laststatus=0
+setlocal laststatus=100
+setglobal laststatus=-1
+setglobal laststatus=0
+setglobal laststatus=100
+set ls=-1
+set ls=0
+set ls=100
+setlocal ls=-1
+setlocal ls=0
+setlocal ls=100
+setglobal ls=-1
+setglobal ls=0
+setglobal ls=100
+silent! call assert_fails('set laststatus=')
+silent! call assert_fails('setlocal laststatus=')
+silent! call assert_fails('setglobal laststatus=')
+silent! call assert_fails('set ls=')
+silent! call assert_fails('setlocal ls=')
+silent! call assert_fails('setglobal ls=')
+set laststatus&
+set ls&
+if exists('l:saved')
+let [&g:laststatus, &l:laststatus] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_lazyredraw()
+if exists('+lazyredraw') && execute('set!') =~# '\n..lazyredraw\([=\n]\|$\)'
+let l:saved = [&g:lazyredraw, &l:lazyredraw]
+endif
+if exists('+lazyredraw')
+set lazyredraw
+set nolazyredraw
+set invlazyredraw
+set lazyredraw!
+setlocal lazyredraw
+setlocal nolazyredraw
+setlocal invlazyredraw
+setlocal lazyredraw!
+setglobal lazyredraw
+setglobal nolazyredraw
+setglobal invlazyredraw
+setglobal lazyredraw!
+set lz
+set nolz
+set invlz
+set lz!
+setlocal lz
+setlocal nolz
+setlocal invlz
+setlocal lz!
+setglobal lz
+setglobal nolz
+setglobal invlz
+setglobal lz!
+set lazyredraw&
+set lz&
+if exists('l:saved')
+let [&g:lazyredraw, &l:lazyredraw] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_lhistory()
+if exists('+lhistory') && execute('set!') =~# '\n..lhistory\([=\n]\|$\)'
+let l:saved = [&g:lhistory, &l:lhistory]
+endif
+if exists('+lhistory')
+set lhistory=1
+set lhistory=2
+set lhistory=10
+set lhistory=50
+setlocal lhistory=1
+setlocal lhistory=2
+setlocal lhistory=10
+setlocal lhistory=50
+setglobal lhistory=1
+setglobal lhistory=2
+setglobal lhistory=10
+setglobal lhistory=50
+set lhi=1
+set lhi=2
+set lhi=10
+set lhi=50
+setlocal lhi=1
+setlocal lhi=2
+setlocal lhi=10
+setlocal lhi=50
+setglobal lhi=1
+setglobal lhi=2
+setglobal lhi=10
+setglobal lhi=50
+silent! call assert_fails('set lhistory=1000')
+silent! call assert_fails('set lhistory=-1')
+silent! call assert_fails('setlocal lhistory=1000')
+silent! call assert_fails('setlocal lhistory=-1')
+silent! call assert_fails('setglobal lhistory=1000')
+silent! call assert_fails('setglobal lhistory=-1')
+silent! call assert_fails('set lhi=1000')
+silent! call assert_fails('set lhi=-1')
+silent! call assert_fails('setlocal lhi=1000')
+silent! call assert_fails('setlocal lhi=-1')
+silent! call assert_fails('setglobal lhi=1000')
+silent! call assert_fails('setglobal lhi=-1')
+set lhistory&
+set lhi&
+if exists('l:saved')
+let [&g:lhistory, &l:lhistory] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_linebreak()
+if exists('+linebreak') && execute('set!') =~# '\n..linebreak\([=\n]\|$\)'
+let l:saved = [&g:linebreak, &l:linebreak]
+endif
+if exists('+linebreak')
+set linebreak
+set nolinebreak
+set invlinebreak
+set linebreak!
+setlocal linebreak
+setlocal nolinebreak
+setlocal invlinebreak
+setlocal linebreak!
+setglobal linebreak
+setglobal nolinebreak
+setglobal invlinebreak
+setglobal linebreak!
+set lbr
+set nolbr
+set invlbr
+set lbr!
+setlocal lbr
+setlocal nolbr
+setlocal invlbr
+setlocal lbr!
+setglobal lbr
+setglobal nolbr
+setglobal invlbr
+setglobal lbr!
+set linebreak&
+set lbr&
+if exists('l:saved')
+let [&g:linebreak, &l:linebreak] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_lines()
+if exists('+lines') && execute('set!') =~# '\n..lines\([=\n]\|$\)'
+let l:saved = [&g:lines, &l:lines]
+endif
+set t_WS=
+let save_lines = &lines
+if exists('+lines')
+set lines=2
+set lines=24
+set lines=1000
+setlocal lines=2
+setlocal lines=24
+setlocal lines=1000
+setglobal lines=2
+setglobal lines=24
+setglobal lines=1000
+set lines=2
+set lines=24
+set lines=1000
+setlocal lines=2
+setlocal lines=24
+setlocal lines=1000
+setglobal lines=2
+setglobal lines=24
+setglobal lines=1000
+silent! call assert_fails('set lines=-1')
+silent! call assert_fails('set lines=0')
+silent! call assert_fails('set lines=1')
+silent! call assert_fails('setlocal lines=-1')
+silent! call assert_fails('setlocal lines=0')
+silent! call assert_fails('setlocal lines=1')
+silent! call assert_fails('setglobal lines=-1')
+silent! call assert_fails('setglobal lines=0')
+silent! call assert_fails('setglobal lines=1')
+silent! call assert_fails('set lines=-1')
+silent! call assert_fails('set lines=0')
+silent! call assert_fails('set lines=1')
+silent! call assert_fails('setlocal lines=-1')
+silent! call assert_fails('setlocal lines=0')
+silent! call assert_fails('setlocal lines=1')
+silent! call assert_fails('setglobal lines=-1')
+silent! call assert_fails('setglobal lines=0')
+silent! call assert_fails('setglobal lines=1')
+set lines&
+set lines&
+if exists('l:saved')
+let [&g:lines, &l:lines] = l:saved
+endif
+endif
+let &lines = save_lines
+set t_WS&
+endfunc
+func Test_opt_set_linespace()
+if exists('+linespace') && execute('set!') =~# '\n..linespace\([=\n]\|$\)'
+let l:saved = [&g:linespace, &l:linespace]
+endif
+if exists('+linespace')
+set linespace=-1
+set linespace=0
+set linespace=2
+set linespace=4
+set linespace=999
+setlocal linespace=-1
+setlocal linespace=0
+setlocal linespace=2
+setlocal linespace=4
+setlocal linespace=999
+setglobal linespace=-1
+setglobal linespace=0
+setglobal linespace=2
+setglobal linespace=4
+setglobal linespace=999
+set lsp=-1
+set lsp=0
+set lsp=2
+set lsp=4
+set lsp=999
+setlocal lsp=-1
+setlocal lsp=0
+setlocal lsp=2
+setlocal lsp=4
+setlocal lsp=999
+setglobal lsp=-1
+setglobal lsp=0
+setglobal lsp=2
+setglobal lsp=4
+setglobal lsp=999
+silent! call assert_fails('set linespace=')
+silent! call assert_fails('setlocal linespace=')
+silent! call assert_fails('setglobal linespace=')
+silent! call assert_fails('set lsp=')
+silent! call assert_fails('setlocal lsp=')
+silent! call assert_fails('setglobal lsp=')
+set linespace&
+set lsp&
+if exists('l:saved')
+let [&g:linespace, &l:linespace] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_lisp()
+if exists('+lisp') && execute('set!') =~# '\n..lisp\([=\n]\|$\)'
+let l:saved = [&g:lisp, &l:lisp]
+endif
+if exists('+lisp')
+set lisp
+set nolisp
+set invlisp
+set lisp!
+setlocal lisp
+setlocal nolisp
+setlocal invlisp
+setlocal lisp!
+setglobal lisp
+setglobal nolisp
+setglobal invlisp
+setglobal lisp!
+set lisp
+set nolisp
+set invlisp
+set lisp!
+setlocal lisp
+setlocal nolisp
+setlocal invlisp
+setlocal lisp!
+setglobal lisp
+setglobal nolisp
+setglobal invlisp
+setglobal lisp!
+set lisp&
+set lisp&
+if exists('l:saved')
+let [&g:lisp, &l:lisp] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_lispoptions()
+if exists('+lispoptions') && execute('set!') =~# '\n..lispoptions\([=\n]\|$\)'
+let l:saved = [&g:lispoptions, &l:lispoptions]
+endif
+if exists('+lispoptions')
+set lispoptions=
+set lispoptions=expr:0
+set lispoptions=expr:1
+setlocal lispoptions=
+setlocal lispoptions=expr:0
+setlocal lispoptions=expr:1
+setglobal lispoptions=
+setglobal lispoptions=expr:0
+setglobal lispoptions=expr:1
+set lop=
+set lop=expr:0
+set lop=expr:1
+setlocal lop=
+setlocal lop=expr:0
+setlocal lop=expr:1
+setglobal lop=
+setglobal lop=expr:0
+setglobal lop=expr:1
+silent! call assert_fails('set lispoptions=xxx')
+silent! call assert_fails('set lispoptions=expr:x')
+silent! call assert_fails('set lispoptions=expr:')
+silent! call assert_fails('setlocal lispoptions=xxx')
+silent! call assert_fails('setlocal lispoptions=expr:x')
+silent! call assert_fails('setlocal lispoptions=expr:')
+silent! call assert_fails('setglobal lispoptions=xxx')
+silent! call assert_fails('setglobal lispoptions=expr:x')
+silent! call assert_fails('setglobal lispoptions=expr:')
+silent! call assert_fails('set lop=xxx')
+silent! call assert_fails('set lop=expr:x')
+silent! call assert_fails('set lop=expr:')
+silent! call assert_fails('setlocal lop=xxx')
+silent! call assert_fails('setlocal lop=expr:x')
+silent! call assert_fails('setlocal lop=expr:')
+silent! call assert_fails('setglobal lop=xxx')
+silent! call assert_fails('setglobal lop=expr:x')
+silent! call assert_fails('setglobal lop=expr:')
+set lispoptions&
+set lop&
+if exists('l:saved')
+let [&g:lispoptions, &l:lispoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_lispwords()
+if exists('+lispwords') && execute('set!') =~# '\n..lispwords\([=\n]\|$\)'
+let l:saved = [&g:lispwords, &l:lispwords]
+endif
+if exists('+lispwords')
+set lispwords=
+set lispwords=xxx
+setlocal lispwords=
+setlocal lispwords=xxx
+setglobal lispwords=
+setglobal lispwords=xxx
+setlocal lispwords=
+call assert_equal(&g:lispwords, &lispwords)
+set lw=
+set lw=xxx
+setlocal lw=
+setlocal lw=xxx
+setglobal lw=
+setglobal lw=xxx
+setlocal lw=
+call assert_equal(&g:lispwords, &lispwords)
+set lispwords&
+set lw&
+if exists('l:saved')
+let [&g:lispwords, &l:lispwords] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_list()
+if exists('+list') && execute('set!') =~# '\n..list\([=\n]\|$\)'
+let l:saved = [&g:list, &l:list]
+endif
+if exists('+list')
+set list
+set nolist
+set invlist
+set list!
+setlocal list
+setlocal nolist
+setlocal invlist
+setlocal list!
+setglobal list
+setglobal nolist
+setglobal invlist
+setglobal list!
+set list
+set nolist
+set invlist
+set list!
+setlocal list
+setlocal nolist
+setlocal invlist
+setlocal list!
+setglobal list
+setglobal nolist
+setglobal invlist
+setglobal list!
+set list&
+set list&
+if exists('l:saved')
+let [&g:list, &l:list] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_listchars()
+if exists('+listchars') && execute('set!') =~# '\n..listchars\([=\n]\|$\)'
+let l:saved = [&g:listchars, &l:listchars]
+endif
+if exists('+listchars')
+set listchars=
+set listchars=eol:x
+set listchars=tab:xy
+set listchars=tab:xyz
+set listchars=space:x
+set listchars=multispace:xxxy
+set listchars=lead:x
+set listchars=leadmultispace:xxxy
+set listchars=trail:x
+set listchars=extends:x
+set listchars=precedes:x
+set listchars=conceal:x
+set listchars=nbsp:x
+set listchars=eol:\\x24
+set listchars=eol:\\u21b5
+set listchars=eol:\\U000021b5
+set listchars=eol:x,space:y
+setlocal listchars=
+setlocal listchars=eol:x
+setlocal listchars=tab:xy
+setlocal listchars=tab:xyz
+setlocal listchars=space:x
+setlocal listchars=multispace:xxxy
+setlocal listchars=lead:x
+setlocal listchars=leadmultispace:xxxy
+setlocal listchars=trail:x
+setlocal listchars=extends:x
+setlocal listchars=precedes:x
+setlocal listchars=conceal:x
+setlocal listchars=nbsp:x
+setlocal listchars=eol:\\x24
+setlocal listchars=eol:\\u21b5
+setlocal listchars=eol:\\U000021b5
+setlocal listchars=eol:x,space:y
+setglobal listchars=
+setglobal listchars=eol:x
+setglobal listchars=tab:xy
+setglobal listchars=tab:xyz
+setglobal listchars=space:x
+setglobal listchars=multispace:xxxy
+setglobal listchars=lead:x
+setglobal listchars=leadmultispace:xxxy
+setglobal listchars=trail:x
+setglobal listchars=extends:x
+setglobal listchars=precedes:x
+setglobal listchars=conceal:x
+setglobal listchars=nbsp:x
+setglobal listchars=eol:\\x24
+setglobal listchars=eol:\\u21b5
+setglobal listchars=eol:\\U000021b5
+setglobal listchars=eol:x,space:y
+setlocal listchars=
+call assert_equal(&g:listchars, &listchars)
+set lcs=
+set lcs=eol:x
+set lcs=tab:xy
+set lcs=tab:xyz
+set lcs=space:x
+set lcs=multispace:xxxy
+set lcs=lead:x
+set lcs=leadmultispace:xxxy
+set lcs=trail:x
+set lcs=extends:x
+set lcs=precedes:x
+set lcs=conceal:x
+set lcs=nbsp:x
+set lcs=eol:\\x24
+set lcs=eol:\\u21b5
+set lcs=eol:\\U000021b5
+set lcs=eol:x,space:y
+setlocal lcs=
+setlocal lcs=eol:x
+setlocal lcs=tab:xy
+setlocal lcs=tab:xyz
+setlocal lcs=space:x
+setlocal lcs=multispace:xxxy
+setlocal lcs=lead:x
+setlocal lcs=leadmultispace:xxxy
+setlocal lcs=trail:x
+setlocal lcs=extends:x
+setlocal lcs=precedes:x
+setlocal lcs=conceal:x
+setlocal lcs=nbsp:x
+setlocal lcs=eol:\\x24
+setlocal lcs=eol:\\u21b5
+setlocal lcs=eol:\\U000021b5
+setlocal lcs=eol:x,space:y
+setglobal lcs=
+setglobal lcs=eol:x
+setglobal lcs=tab:xy
+setglobal lcs=tab:xyz
+setglobal lcs=space:x
+setglobal lcs=multispace:xxxy
+setglobal lcs=lead:x
+setglobal lcs=leadmultispace:xxxy
+setglobal lcs=trail:x
+setglobal lcs=extends:x
+setglobal lcs=precedes:x
+setglobal lcs=conceal:x
+setglobal lcs=nbsp:x
+setglobal lcs=eol:\\x24
+setglobal lcs=eol:\\u21b5
+setglobal lcs=eol:\\U000021b5
+setglobal lcs=eol:x,space:y
+setlocal lcs=
+call assert_equal(&g:listchars, &listchars)
+silent! call assert_fails('set listchars=xxx')
+silent! call assert_fails('set listchars=eol:')
+silent! call assert_fails('setlocal listchars=xxx')
+silent! call assert_fails('setlocal listchars=eol:')
+silent! call assert_fails('setglobal listchars=xxx')
+silent! call assert_fails('setglobal listchars=eol:')
+silent! call assert_fails('set lcs=xxx')
+silent! call assert_fails('set lcs=eol:')
+silent! call assert_fails('setlocal lcs=xxx')
+silent! call assert_fails('setlocal lcs=eol:')
+silent! call assert_fails('setglobal lcs=xxx')
+silent! call assert_fails('setglobal lcs=eol:')
+set listchars&
+set lcs&
+if exists('l:saved')
+let [&g:listchars, &l:listchars] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_loadplugins()
+if exists('+loadplugins') && execute('set!') =~# '\n..loadplugins\([=\n]\|$\)'
+let l:saved = [&g:loadplugins, &l:loadplugins]
+endif
+if exists('+loadplugins')
+set loadplugins
+set noloadplugins
+set invloadplugins
+set loadplugins!
+setlocal loadplugins
+setlocal noloadplugins
+setlocal invloadplugins
+setlocal loadplugins!
+setglobal loadplugins
+setglobal noloadplugins
+setglobal invloadplugins
+setglobal loadplugins!
+set lpl
+set nolpl
+set invlpl
+set lpl!
+setlocal lpl
+setlocal nolpl
+setlocal invlpl
+setlocal lpl!
+setglobal lpl
+setglobal nolpl
+setglobal invlpl
+setglobal lpl!
+set loadplugins&
+set lpl&
+if exists('l:saved')
+let [&g:loadplugins, &l:loadplugins] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_macatsui()
+if exists('+macatsui') && execute('set!') =~# '\n..macatsui\([=\n]\|$\)'
+let l:saved = [&g:macatsui, &l:macatsui]
+endif
+if exists('+macatsui')
+set macatsui
+set nomacatsui
+set invmacatsui
+set macatsui!
+setlocal macatsui
+setlocal nomacatsui
+setlocal invmacatsui
+setlocal macatsui!
+setglobal macatsui
+setglobal nomacatsui
+setglobal invmacatsui
+setglobal macatsui!
+set macatsui
+set nomacatsui
+set invmacatsui
+set macatsui!
+setlocal macatsui
+setlocal nomacatsui
+setlocal invmacatsui
+setlocal macatsui!
+setglobal macatsui
+setglobal nomacatsui
+setglobal invmacatsui
+setglobal macatsui!
+set macatsui&
+set macatsui&
+if exists('l:saved')
+let [&g:macatsui, &l:macatsui] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_magic()
+if exists('+magic') && execute('set!') =~# '\n..magic\([=\n]\|$\)'
+let l:saved = [&g:magic, &l:magic]
+endif
+if exists('+magic')
+set magic
+set nomagic
+set invmagic
+set magic!
+setlocal magic
+setlocal nomagic
+setlocal invmagic
+setlocal magic!
+setglobal magic
+setglobal nomagic
+setglobal invmagic
+setglobal magic!
+set magic
+set nomagic
+set invmagic
+set magic!
+setlocal magic
+setlocal nomagic
+setlocal invmagic
+setlocal magic!
+setglobal magic
+setglobal nomagic
+setglobal invmagic
+setglobal magic!
+set magic&
+set magic&
+if exists('l:saved')
+let [&g:magic, &l:magic] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_makeef()
+if exists('+makeef') && execute('set!') =~# '\n..makeef\([=\n]\|$\)'
+let l:saved = [&g:makeef, &l:makeef]
+endif
+if exists('+makeef')
+set makeef=
+set makeef=xxx
+setlocal makeef=
+setlocal makeef=xxx
+setglobal makeef=
+setglobal makeef=xxx
+set mef=
+set mef=xxx
+setlocal mef=
+setlocal mef=xxx
+setglobal mef=
+setglobal mef=xxx
+set makeef&
+set mef&
+if exists('l:saved')
+let [&g:makeef, &l:makeef] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_makeencoding()
+if exists('+makeencoding') && execute('set!') =~# '\n..makeencoding\([=\n]\|$\)'
+let l:saved = [&g:makeencoding, &l:makeencoding]
+endif
+if exists('+makeencoding')
+set makeencoding=
+set makeencoding=xxx
+setlocal makeencoding=
+setlocal makeencoding=xxx
+setglobal makeencoding=
+setglobal makeencoding=xxx
+setlocal makeencoding=
+call assert_equal(&g:makeencoding, &makeencoding)
+set menc=
+set menc=xxx
+setlocal menc=
+setlocal menc=xxx
+setglobal menc=
+setglobal menc=xxx
+setlocal menc=
+call assert_equal(&g:makeencoding, &makeencoding)
+set makeencoding&
+set menc&
+if exists('l:saved')
+let [&g:makeencoding, &l:makeencoding] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_makeprg()
+if exists('+makeprg') && execute('set!') =~# '\n..makeprg\([=\n]\|$\)'
+let l:saved = [&g:makeprg, &l:makeprg]
+endif
+if exists('+makeprg')
+set makeprg=
+set makeprg=xxx
+setlocal makeprg=
+setlocal makeprg=xxx
+setglobal makeprg=
+setglobal makeprg=xxx
+setlocal makeprg=
+call assert_equal(&g:makeprg, &makeprg)
+set mp=
+set mp=xxx
+setlocal mp=
+setlocal mp=xxx
+setglobal mp=
+setglobal mp=xxx
+setlocal mp=
+call assert_equal(&g:makeprg, &makeprg)
+set makeprg&
+set mp&
+if exists('l:saved')
+let [&g:makeprg, &l:makeprg] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_matchpairs()
+if exists('+matchpairs') && execute('set!') =~# '\n..matchpairs\([=\n]\|$\)'
+let l:saved = [&g:matchpairs, &l:matchpairs]
+endif
+if exists('+matchpairs')
+set matchpairs=
+set matchpairs=(:)
+set matchpairs=(:),<:>
+setlocal matchpairs=
+setlocal matchpairs=(:)
+setlocal matchpairs=(:),<:>
+setglobal matchpairs=
+setglobal matchpairs=(:)
+setglobal matchpairs=(:),<:>
+set mps=
+set mps=(:)
+set mps=(:),<:>
+setlocal mps=
+setlocal mps=(:)
+setlocal mps=(:),<:>
+setglobal mps=
+setglobal mps=(:)
+setglobal mps=(:),<:>
+silent! call assert_fails('set matchpairs=xxx')
+silent! call assert_fails('setlocal matchpairs=xxx')
+silent! call assert_fails('setglobal matchpairs=xxx')
+silent! call assert_fails('set mps=xxx')
+silent! call assert_fails('setlocal mps=xxx')
+silent! call assert_fails('setglobal mps=xxx')
+set matchpairs&
+set mps&
+if exists('l:saved')
+let [&g:matchpairs, &l:matchpairs] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_matchtime()
+if exists('+matchtime') && execute('set!') =~# '\n..matchtime\([=\n]\|$\)'
+let l:saved = [&g:matchtime, &l:matchtime]
+endif
+if exists('+matchtime')
+set matchtime=-1
+set matchtime=0
+set matchtime=100
+setlocal matchtime=-1
+setlocal matchtime=0
+setlocal matchtime=100
+setglobal matchtime=-1
+setglobal matchtime=0
+setglobal matchtime=100
+set mat=-1
+set mat=0
+set mat=100
+setlocal mat=-1
+setlocal mat=0
+setlocal mat=100
+setglobal mat=-1
+setglobal mat=0
+setglobal mat=100
+silent! call assert_fails('set matchtime=')
+silent! call assert_fails('setlocal matchtime=')
+silent! call assert_fails('setglobal matchtime=')
+silent! call assert_fails('set mat=')
+silent! call assert_fails('setlocal mat=')
+silent! call assert_fails('setglobal mat=')
+set matchtime&
+set mat&
+if exists('l:saved')
+let [&g:matchtime, &l:matchtime] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_maxcombine()
+if exists('+maxcombine') && execute('set!') =~# '\n..maxcombine\([=\n]\|$\)'
+let l:saved = [&g:maxcombine, &l:maxcombine]
+endif
+if exists('+maxcombine')
+set maxcombine=-1
+set maxcombine=0
+set maxcombine=100
+setlocal maxcombine=-1
+setlocal maxcombine=0
+setlocal maxcombine=100
+setglobal maxcombine=-1
+setglobal maxcombine=0
+setglobal maxcombine=100
+set mco=-1
+set mco=0
+set mco=100
+setlocal mco=-1
+setlocal mco=0
+setlocal mco=100
+setglobal mco=-1
+setglobal mco=0
+setglobal mco=100
+silent! call assert_fails('set maxcombine=')
+silent! call assert_fails('setlocal maxcombine=')
+silent! call assert_fails('setglobal maxcombine=')
+silent! call assert_fails('set mco=')
+silent! call assert_fails('setlocal mco=')
+silent! call assert_fails('setglobal mco=')
+set maxcombine&
+set mco&
+if exists('l:saved')
+let [&g:maxcombine, &l:maxcombine] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_maxfuncdepth()
+if exists('+maxfuncdepth') && execute('set!') =~# '\n..maxfuncdepth\([=\n]\|$\)'
+let l:saved = [&g:maxfuncdepth, &l:maxfuncdepth]
+endif
+if exists('+maxfuncdepth')
+set maxfuncdepth=-1
+set maxfuncdepth=0
+set maxfuncdepth=100
+setlocal maxfuncdepth=-1
+setlocal maxfuncdepth=0
+setlocal maxfuncdepth=100
+setglobal maxfuncdepth=-1
+setglobal maxfuncdepth=0
+setglobal maxfuncdepth=100
+set mfd=-1
+set mfd=0
+set mfd=100
+setlocal mfd=-1
+setlocal mfd=0
+setlocal mfd=100
+setglobal mfd=-1
+setglobal mfd=0
+setglobal mfd=100
+silent! call assert_fails('set maxfuncdepth=')
+silent! call assert_fails('setlocal maxfuncdepth=')
+silent! call assert_fails('setglobal maxfuncdepth=')
+silent! call assert_fails('set mfd=')
+silent! call assert_fails('setlocal mfd=')
+silent! call assert_fails('setglobal mfd=')
+set maxfuncdepth&
+set mfd&
+if exists('l:saved')
+let [&g:maxfuncdepth, &l:maxfuncdepth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_maxmapdepth()
+if exists('+maxmapdepth') && execute('set!') =~# '\n..maxmapdepth\([=\n]\|$\)'
+let l:saved = [&g:maxmapdepth, &l:maxmapdepth]
+endif
+if exists('+maxmapdepth')
+set maxmapdepth=-1
+set maxmapdepth=0
+set maxmapdepth=100
+setlocal maxmapdepth=-1
+setlocal maxmapdepth=0
+setlocal maxmapdepth=100
+setglobal maxmapdepth=-1
+setglobal maxmapdepth=0
+setglobal maxmapdepth=100
+set mmd=-1
+set mmd=0
+set mmd=100
+setlocal mmd=-1
+setlocal mmd=0
+setlocal mmd=100
+setglobal mmd=-1
+setglobal mmd=0
+setglobal mmd=100
+silent! call assert_fails('set maxmapdepth=')
+silent! call assert_fails('setlocal maxmapdepth=')
+silent! call assert_fails('setglobal maxmapdepth=')
+silent! call assert_fails('set mmd=')
+silent! call assert_fails('setlocal mmd=')
+silent! call assert_fails('setglobal mmd=')
+set maxmapdepth&
+set mmd&
+if exists('l:saved')
+let [&g:maxmapdepth, &l:maxmapdepth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_maxmem()
+if exists('+maxmem') && execute('set!') =~# '\n..maxmem\([=\n]\|$\)'
+let l:saved = [&g:maxmem, &l:maxmem]
+endif
+if exists('+maxmem')
+set maxmem=-1
+set maxmem=0
+set maxmem=100
+setlocal maxmem=-1
+setlocal maxmem=0
+setlocal maxmem=100
+setglobal maxmem=-1
+setglobal maxmem=0
+setglobal maxmem=100
+set mm=-1
+set mm=0
+set mm=100
+setlocal mm=-1
+setlocal mm=0
+setlocal mm=100
+setglobal mm=-1
+setglobal mm=0
+setglobal mm=100
+silent! call assert_fails('set maxmem=')
+silent! call assert_fails('setlocal maxmem=')
+silent! call assert_fails('setglobal maxmem=')
+silent! call assert_fails('set mm=')
+silent! call assert_fails('setlocal mm=')
+silent! call assert_fails('setglobal mm=')
+set maxmem&
+set mm&
+if exists('l:saved')
+let [&g:maxmem, &l:maxmem] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_maxmempattern()
+if exists('+maxmempattern') && execute('set!') =~# '\n..maxmempattern\([=\n]\|$\)'
+let l:saved = [&g:maxmempattern, &l:maxmempattern]
+endif
+if exists('+maxmempattern')
+set maxmempattern=-1
+set maxmempattern=0
+set maxmempattern=100
+setlocal maxmempattern=-1
+setlocal maxmempattern=0
+setlocal maxmempattern=100
+setglobal maxmempattern=-1
+setglobal maxmempattern=0
+setglobal maxmempattern=100
+set mmp=-1
+set mmp=0
+set mmp=100
+setlocal mmp=-1
+setlocal mmp=0
+setlocal mmp=100
+setglobal mmp=-1
+setglobal mmp=0
+setglobal mmp=100
+silent! call assert_fails('set maxmempattern=')
+silent! call assert_fails('setlocal maxmempattern=')
+silent! call assert_fails('setglobal maxmempattern=')
+silent! call assert_fails('set mmp=')
+silent! call assert_fails('setlocal mmp=')
+silent! call assert_fails('setglobal mmp=')
+set maxmempattern&
+set mmp&
+if exists('l:saved')
+let [&g:maxmempattern, &l:maxmempattern] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_maxmemtot()
+if exists('+maxmemtot') && execute('set!') =~# '\n..maxmemtot\([=\n]\|$\)'
+let l:saved = [&g:maxmemtot, &l:maxmemtot]
+endif
+if exists('+maxmemtot')
+set maxmemtot=-1
+set maxmemtot=0
+set maxmemtot=100
+setlocal maxmemtot=-1
+setlocal maxmemtot=0
+setlocal maxmemtot=100
+setglobal maxmemtot=-1
+setglobal maxmemtot=0
+setglobal maxmemtot=100
+set mmt=-1
+set mmt=0
+set mmt=100
+setlocal mmt=-1
+setlocal mmt=0
+setlocal mmt=100
+setglobal mmt=-1
+setglobal mmt=0
+setglobal mmt=100
+silent! call assert_fails('set maxmemtot=')
+silent! call assert_fails('setlocal maxmemtot=')
+silent! call assert_fails('setglobal maxmemtot=')
+silent! call assert_fails('set mmt=')
+silent! call assert_fails('setlocal mmt=')
+silent! call assert_fails('setglobal mmt=')
+set maxmemtot&
+set mmt&
+if exists('l:saved')
+let [&g:maxmemtot, &l:maxmemtot] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_maxsearchcount()
+if exists('+maxsearchcount') && execute('set!') =~# '\n..maxsearchcount\([=\n]\|$\)'
+let l:saved = [&g:maxsearchcount, &l:maxsearchcount]
+endif
+if exists('+maxsearchcount')
+set maxsearchcount=1
+set maxsearchcount=10
+set maxsearchcount=100
+set maxsearchcount=1000
+setlocal maxsearchcount=1
+setlocal maxsearchcount=10
+setlocal maxsearchcount=100
+setlocal maxsearchcount=1000
+setglobal maxsearchcount=1
+setglobal maxsearchcount=10
+setglobal maxsearchcount=100
+setglobal maxsearchcount=1000
+set msc=1
+set msc=10
+set msc=100
+set msc=1000
+setlocal msc=1
+setlocal msc=10
+setlocal msc=100
+setlocal msc=1000
+setglobal msc=1
+setglobal msc=10
+setglobal msc=100
+setglobal msc=1000
+silent! call assert_fails('set maxsearchcount=0')
+silent! call assert_fails('set maxsearchcount=-1')
+silent! call assert_fails('set maxsearchcount=10000')
+silent! call assert_fails('setlocal maxsearchcount=0')
+silent! call assert_fails('setlocal maxsearchcount=-1')
+silent! call assert_fails('setlocal maxsearchcount=10000')
+silent! call assert_fails('setglobal maxsearchcount=0')
+silent! call assert_fails('setglobal maxsearchcount=-1')
+silent! call assert_fails('setglobal maxsearchcount=10000')
+silent! call assert_fails('set msc=0')
+silent! call assert_fails('set msc=-1')
+silent! call assert_fails('set msc=10000')
+silent! call assert_fails('setlocal msc=0')
+silent! call assert_fails('setlocal msc=-1')
+silent! call assert_fails('setlocal msc=10000')
+silent! call assert_fails('setglobal msc=0')
+silent! call assert_fails('setglobal msc=-1')
+silent! call assert_fails('setglobal msc=10000')
+set maxsearchcount&
+set msc&
+if exists('l:saved')
+let [&g:maxsearchcount, &l:maxsearchcount] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_menuitems()
+if exists('+menuitems') && execute('set!') =~# '\n..menuitems\([=\n]\|$\)'
+let l:saved = [&g:menuitems, &l:menuitems]
+endif
+if exists('+menuitems')
+set menuitems=-1
+set menuitems=0
+set menuitems=100
+setlocal menuitems=-1
+setlocal menuitems=0
+setlocal menuitems=100
+setglobal menuitems=-1
+setglobal menuitems=0
+setglobal menuitems=100
+set mis=-1
+set mis=0
+set mis=100
+setlocal mis=-1
+setlocal mis=0
+setlocal mis=100
+setglobal mis=-1
+setglobal mis=0
+setglobal mis=100
+silent! call assert_fails('set menuitems=')
+silent! call assert_fails('setlocal menuitems=')
+silent! call assert_fails('setglobal menuitems=')
+silent! call assert_fails('set mis=')
+silent! call assert_fails('setlocal mis=')
+silent! call assert_fails('setglobal mis=')
+set menuitems&
+set mis&
+if exists('l:saved')
+let [&g:menuitems, &l:menuitems] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mesg()
+if exists('+mesg') && execute('set!') =~# '\n..mesg\([=\n]\|$\)'
+let l:saved = [&g:mesg, &l:mesg]
+endif
+if exists('+mesg')
+set mesg
+set nomesg
+set invmesg
+set mesg!
+setlocal mesg
+setlocal nomesg
+setlocal invmesg
+setlocal mesg!
+setglobal mesg
+setglobal nomesg
+setglobal invmesg
+setglobal mesg!
+set mesg
+set nomesg
+set invmesg
+set mesg!
+setlocal mesg
+setlocal nomesg
+setlocal invmesg
+setlocal mesg!
+setglobal mesg
+setglobal nomesg
+setglobal invmesg
+setglobal mesg!
+set mesg&
+set mesg&
+if exists('l:saved')
+let [&g:mesg, &l:mesg] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_messagesopt()
+if exists('+messagesopt') && execute('set!') =~# '\n..messagesopt\([=\n]\|$\)'
+let l:saved = [&g:messagesopt, &l:messagesopt]
+endif
+if exists('+messagesopt')
+set messagesopt=hit-enter,history:1
+set messagesopt=hit-enter,history:10000
+set messagesopt=history:100,wait:100
+set messagesopt=history:0,wait:0
+set messagesopt=hit-enter,history:1,wait:1
+setlocal messagesopt=hit-enter,history:1
+setlocal messagesopt=hit-enter,history:10000
+setlocal messagesopt=history:100,wait:100
+setlocal messagesopt=history:0,wait:0
+setlocal messagesopt=hit-enter,history:1,wait:1
+setglobal messagesopt=hit-enter,history:1
+setglobal messagesopt=hit-enter,history:10000
+setglobal messagesopt=history:100,wait:100
+setglobal messagesopt=history:0,wait:0
+setglobal messagesopt=hit-enter,history:1,wait:1
+set mopt=hit-enter,history:1
+set mopt=hit-enter,history:10000
+set mopt=history:100,wait:100
+set mopt=history:0,wait:0
+set mopt=hit-enter,history:1,wait:1
+setlocal mopt=hit-enter,history:1
+setlocal mopt=hit-enter,history:10000
+setlocal mopt=history:100,wait:100
+setlocal mopt=history:0,wait:0
+setlocal mopt=hit-enter,history:1,wait:1
+setglobal mopt=hit-enter,history:1
+setglobal mopt=hit-enter,history:10000
+setglobal mopt=history:100,wait:100
+setglobal mopt=history:0,wait:0
+setglobal mopt=hit-enter,history:1,wait:1
+silent! call assert_fails('set messagesopt=xxx')
+silent! call assert_fails('set messagesopt=history:500')
+silent! call assert_fails('set messagesopt=hit-enter,history:-1')
+silent! call assert_fails('set messagesopt=hit-enter,history:10001')
+silent! call assert_fails('set messagesopt=history:0,wait:10001')
+silent! call assert_fails('set messagesopt=hit-enter')
+silent! call assert_fails('set messagesopt=history:10,wait:99999999999999999999')
+silent! call assert_fails('set messagesopt=history:99999999999999999999,wait:10')
+silent! call assert_fails('set messagesopt=wait:10')
+silent! call assert_fails('set messagesopt=history:-10')
+silent! call assert_fails('set messagesopt=history:10,wait:-10')
+silent! call assert_fails('setlocal messagesopt=xxx')
+silent! call assert_fails('setlocal messagesopt=history:500')
+silent! call assert_fails('setlocal messagesopt=hit-enter,history:-1')
+silent! call assert_fails('setlocal messagesopt=hit-enter,history:10001')
+silent! call assert_fails('setlocal messagesopt=history:0,wait:10001')
+silent! call assert_fails('setlocal messagesopt=hit-enter')
+silent! call assert_fails('setlocal messagesopt=history:10,wait:99999999999999999999')
+silent! call assert_fails('setlocal messagesopt=history:99999999999999999999,wait:10')
+silent! call assert_fails('setlocal messagesopt=wait:10')
+silent! call assert_fails('setlocal messagesopt=history:-10')
+silent! call assert_fails('setlocal messagesopt=history:10,wait:-10')
+silent! call assert_fails('setglobal messagesopt=xxx')
+silent! call assert_fails('setglobal messagesopt=history:500')
+silent! call assert_fails('setglobal messagesopt=hit-enter,history:-1')
+silent! call assert_fails('setglobal messagesopt=hit-enter,history:10001')
+silent! call assert_fails('setglobal messagesopt=history:0,wait:10001')
+silent! call assert_fails('setglobal messagesopt=hit-enter')
+silent! call assert_fails('setglobal messagesopt=history:10,wait:99999999999999999999')
+silent! call assert_fails('setglobal messagesopt=history:99999999999999999999,wait:10')
+silent! call assert_fails('setglobal messagesopt=wait:10')
+silent! call assert_fails('setglobal messagesopt=history:-10')
+silent! call assert_fails('setglobal messagesopt=history:10,wait:-10')
+silent! call assert_fails('set mopt=xxx')
+silent! call assert_fails('set mopt=history:500')
+silent! call assert_fails('set mopt=hit-enter,history:-1')
+silent! call assert_fails('set mopt=hit-enter,history:10001')
+silent! call assert_fails('set mopt=history:0,wait:10001')
+silent! call assert_fails('set mopt=hit-enter')
+silent! call assert_fails('set mopt=history:10,wait:99999999999999999999')
+silent! call assert_fails('set mopt=history:99999999999999999999,wait:10')
+silent! call assert_fails('set mopt=wait:10')
+silent! call assert_fails('set mopt=history:-10')
+silent! call assert_fails('set mopt=history:10,wait:-10')
+silent! call assert_fails('setlocal mopt=xxx')
+silent! call assert_fails('setlocal mopt=history:500')
+silent! call assert_fails('setlocal mopt=hit-enter,history:-1')
+silent! call assert_fails('setlocal mopt=hit-enter,history:10001')
+silent! call assert_fails('setlocal mopt=history:0,wait:10001')
+silent! call assert_fails('setlocal mopt=hit-enter')
+silent! call assert_fails('setlocal mopt=history:10,wait:99999999999999999999')
+silent! call assert_fails('setlocal mopt=history:99999999999999999999,wait:10')
+silent! call assert_fails('setlocal mopt=wait:10')
+silent! call assert_fails('setlocal mopt=history:-10')
+silent! call assert_fails('setlocal mopt=history:10,wait:-10')
+silent! call assert_fails('setglobal mopt=xxx')
+silent! call assert_fails('setglobal mopt=history:500')
+silent! call assert_fails('setglobal mopt=hit-enter,history:-1')
+silent! call assert_fails('setglobal mopt=hit-enter,history:10001')
+silent! call assert_fails('setglobal mopt=history:0,wait:10001')
+silent! call assert_fails('setglobal mopt=hit-enter')
+silent! call assert_fails('setglobal mopt=history:10,wait:99999999999999999999')
+silent! call assert_fails('setglobal mopt=history:99999999999999999999,wait:10')
+silent! call assert_fails('setglobal mopt=wait:10')
+silent! call assert_fails('setglobal mopt=history:-10')
+silent! call assert_fails('setglobal mopt=history:10,wait:-10')
+set messagesopt&
+set mopt&
+if exists('l:saved')
+let [&g:messagesopt, &l:messagesopt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mkspellmem()
+if exists('+mkspellmem') && execute('set!') =~# '\n..mkspellmem\([=\n]\|$\)'
+let l:saved = [&g:mkspellmem, &l:mkspellmem]
+endif
+if exists('+mkspellmem')
+set mkspellmem=10000,100,12
+setlocal mkspellmem=10000,100,12
+setglobal mkspellmem=10000,100,12
+set msm=10000,100,12
+setlocal msm=10000,100,12
+setglobal msm=10000,100,12
+silent! call assert_fails('set mkspellmem=')
+silent! call assert_fails('set mkspellmem=xxx')
+silent! call assert_fails('set mkspellmem=10000,100')
+silent! call assert_fails('setlocal mkspellmem=')
+silent! call assert_fails('setlocal mkspellmem=xxx')
+silent! call assert_fails('setlocal mkspellmem=10000,100')
+silent! call assert_fails('setglobal mkspellmem=')
+silent! call assert_fails('setglobal mkspellmem=xxx')
+silent! call assert_fails('setglobal mkspellmem=10000,100')
+silent! call assert_fails('set msm=')
+silent! call assert_fails('set msm=xxx')
+silent! call assert_fails('set msm=10000,100')
+silent! call assert_fails('setlocal msm=')
+silent! call assert_fails('setlocal msm=xxx')
+silent! call assert_fails('setlocal msm=10000,100')
+silent! call assert_fails('setglobal msm=')
+silent! call assert_fails('setglobal msm=xxx')
+silent! call assert_fails('setglobal msm=10000,100')
+set mkspellmem&
+set msm&
+if exists('l:saved')
+let [&g:mkspellmem, &l:mkspellmem] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_modeline()
+if exists('+modeline') && execute('set!') =~# '\n..modeline\([=\n]\|$\)'
+let l:saved = [&g:modeline, &l:modeline]
+endif
+if exists('+modeline')
+set modeline
+set nomodeline
+set invmodeline
+set modeline!
+setlocal modeline
+setlocal nomodeline
+setlocal invmodeline
+setlocal modeline!
+setglobal modeline
+setglobal nomodeline
+setglobal invmodeline
+setglobal modeline!
+set ml
+set noml
+set invml
+set ml!
+setlocal ml
+setlocal noml
+setlocal invml
+setlocal ml!
+setglobal ml
+setglobal noml
+setglobal invml
+setglobal ml!
+set modeline&
+set ml&
+if exists('l:saved')
+let [&g:modeline, &l:modeline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_modelineexpr()
+if exists('+modelineexpr') && execute('set!') =~# '\n..modelineexpr\([=\n]\|$\)'
+let l:saved = [&g:modelineexpr, &l:modelineexpr]
+endif
+if exists('+modelineexpr')
+set modelineexpr
+set nomodelineexpr
+set invmodelineexpr
+set modelineexpr!
+setlocal modelineexpr
+setlocal nomodelineexpr
+setlocal invmodelineexpr
+setlocal modelineexpr!
+setglobal modelineexpr
+setglobal nomodelineexpr
+setglobal invmodelineexpr
+setglobal modelineexpr!
+set mle
+set nomle
+set invmle
+set mle!
+setlocal mle
+setlocal nomle
+setlocal invmle
+setlocal mle!
+setglobal mle
+setglobal nomle
+setglobal invmle
+setglobal mle!
+set modelineexpr&
+set mle&
+if exists('l:saved')
+let [&g:modelineexpr, &l:modelineexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_modelines()
+if exists('+modelines') && execute('set!') =~# '\n..modelines\([=\n]\|$\)'
+let l:saved = [&g:modelines, &l:modelines]
+endif
+if exists('+modelines')
+set modelines=-1
+set modelines=0
+set modelines=100
+setlocal modelines=-1
+setlocal modelines=0
+setlocal modelines=100
+setglobal modelines=-1
+setglobal modelines=0
+setglobal modelines=100
+set mls=-1
+set mls=0
+set mls=100
+setlocal mls=-1
+setlocal mls=0
+setlocal mls=100
+setglobal mls=-1
+setglobal mls=0
+setglobal mls=100
+silent! call assert_fails('set modelines=')
+silent! call assert_fails('setlocal modelines=')
+silent! call assert_fails('setglobal modelines=')
+silent! call assert_fails('set mls=')
+silent! call assert_fails('setlocal mls=')
+silent! call assert_fails('setglobal mls=')
+set modelines&
+set mls&
+if exists('l:saved')
+let [&g:modelines, &l:modelines] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_modifiable()
+if exists('+modifiable') && execute('set!') =~# '\n..modifiable\([=\n]\|$\)'
+let l:saved = [&g:modifiable, &l:modifiable]
+endif
+if exists('+modifiable')
+set modifiable
+set nomodifiable
+set invmodifiable
+set modifiable!
+setlocal modifiable
+setlocal nomodifiable
+setlocal invmodifiable
+setlocal modifiable!
+setglobal modifiable
+setglobal nomodifiable
+setglobal invmodifiable
+setglobal modifiable!
+set ma
+set noma
+set invma
+set ma!
+setlocal ma
+setlocal noma
+setlocal invma
+setlocal ma!
+setglobal ma
+setglobal noma
+setglobal invma
+setglobal ma!
+set modifiable&
+set ma&
+if exists('l:saved')
+let [&g:modifiable, &l:modifiable] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_modified()
+if exists('+modified') && execute('set!') =~# '\n..modified\([=\n]\|$\)'
+let l:saved = [&g:modified, &l:modified]
+endif
+if exists('+modified')
+set modified
+set nomodified
+set invmodified
+set modified!
+setlocal modified
+setlocal nomodified
+setlocal invmodified
+setlocal modified!
+setglobal modified
+setglobal nomodified
+setglobal invmodified
+setglobal modified!
+set mod
+set nomod
+set invmod
+set mod!
+setlocal mod
+setlocal nomod
+setlocal invmod
+setlocal mod!
+setglobal mod
+setglobal nomod
+setglobal invmod
+setglobal mod!
+set modified&
+set mod&
+if exists('l:saved')
+let [&g:modified, &l:modified] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_more()
+if exists('+more') && execute('set!') =~# '\n..more\([=\n]\|$\)'
+let l:saved = [&g:more, &l:more]
+endif
+if exists('+more')
+set more
+set nomore
+set invmore
+set more!
+setlocal more
+setlocal nomore
+setlocal invmore
+setlocal more!
+setglobal more
+setglobal nomore
+setglobal invmore
+setglobal more!
+set more
+set nomore
+set invmore
+set more!
+setlocal more
+setlocal nomore
+setlocal invmore
+setlocal more!
+setglobal more
+setglobal nomore
+setglobal invmore
+setglobal more!
+set more&
+set more&
+if exists('l:saved')
+let [&g:more, &l:more] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mouse()
+if exists('+mouse') && execute('set!') =~# '\n..mouse\([=\n]\|$\)'
+let l:saved = [&g:mouse, &l:mouse]
+endif
+if exists('+mouse')
+set mouse=
+set mouse=n
+set mouse=v
+set mouse=i
+set mouse=c
+set mouse=h
+set mouse=a
+set mouse=r
+set mouse=nvi
+setlocal mouse=
+setlocal mouse=n
+setlocal mouse=v
+setlocal mouse=i
+setlocal mouse=c
+setlocal mouse=h
+setlocal mouse=a
+setlocal mouse=r
+setlocal mouse=nvi
+setglobal mouse=
+setglobal mouse=n
+setglobal mouse=v
+setglobal mouse=i
+setglobal mouse=c
+setglobal mouse=h
+setglobal mouse=a
+setglobal mouse=r
+setglobal mouse=nvi
+set mouse=
+set mouse=n
+set mouse=v
+set mouse=i
+set mouse=c
+set mouse=h
+set mouse=a
+set mouse=r
+set mouse=nvi
+setlocal mouse=
+setlocal mouse=n
+setlocal mouse=v
+setlocal mouse=i
+setlocal mouse=c
+setlocal mouse=h
+setlocal mouse=a
+setlocal mouse=r
+setlocal mouse=nvi
+setglobal mouse=
+setglobal mouse=n
+setglobal mouse=v
+setglobal mouse=i
+setglobal mouse=c
+setglobal mouse=h
+setglobal mouse=a
+setglobal mouse=r
+setglobal mouse=nvi
+silent! call assert_fails('set mouse=xxx')
+silent! call assert_fails('set mouse=n,v,i')
+silent! call assert_fails('setlocal mouse=xxx')
+silent! call assert_fails('setlocal mouse=n,v,i')
+silent! call assert_fails('setglobal mouse=xxx')
+silent! call assert_fails('setglobal mouse=n,v,i')
+silent! call assert_fails('set mouse=xxx')
+silent! call assert_fails('set mouse=n,v,i')
+silent! call assert_fails('setlocal mouse=xxx')
+silent! call assert_fails('setlocal mouse=n,v,i')
+silent! call assert_fails('setglobal mouse=xxx')
+silent! call assert_fails('setglobal mouse=n,v,i')
+set mouse&
+set mouse&
+if exists('l:saved')
+let [&g:mouse, &l:mouse] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mousefocus()
+if exists('+mousefocus') && execute('set!') =~# '\n..mousefocus\([=\n]\|$\)'
+let l:saved = [&g:mousefocus, &l:mousefocus]
+endif
+if exists('+mousefocus')
+set mousefocus
+set nomousefocus
+set invmousefocus
+set mousefocus!
+setlocal mousefocus
+setlocal nomousefocus
+setlocal invmousefocus
+setlocal mousefocus!
+setglobal mousefocus
+setglobal nomousefocus
+setglobal invmousefocus
+setglobal mousefocus!
+set mousef
+set nomousef
+set invmousef
+set mousef!
+setlocal mousef
+setlocal nomousef
+setlocal invmousef
+setlocal mousef!
+setglobal mousef
+setglobal nomousef
+setglobal invmousef
+setglobal mousef!
+set mousefocus&
+set mousef&
+if exists('l:saved')
+let [&g:mousefocus, &l:mousefocus] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mousehide()
+if exists('+mousehide') && execute('set!') =~# '\n..mousehide\([=\n]\|$\)'
+let l:saved = [&g:mousehide, &l:mousehide]
+endif
+if exists('+mousehide')
+set mousehide
+set nomousehide
+set invmousehide
+set mousehide!
+setlocal mousehide
+setlocal nomousehide
+setlocal invmousehide
+setlocal mousehide!
+setglobal mousehide
+setglobal nomousehide
+setglobal invmousehide
+setglobal mousehide!
+set mh
+set nomh
+set invmh
+set mh!
+setlocal mh
+setlocal nomh
+setlocal invmh
+setlocal mh!
+setglobal mh
+setglobal nomh
+setglobal invmh
+setglobal mh!
+set mousehide&
+set mh&
+if exists('l:saved')
+let [&g:mousehide, &l:mousehide] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mousemodel()
+if exists('+mousemodel') && execute('set!') =~# '\n..mousemodel\([=\n]\|$\)'
+let l:saved = [&g:mousemodel, &l:mousemodel]
+endif
+if exists('+mousemodel')
+set mousemodel=
+set mousemodel=extend
+set mousemodel=popup
+set mousemodel=popup_setpos
+setlocal mousemodel=
+setlocal mousemodel=extend
+setlocal mousemodel=popup
+setlocal mousemodel=popup_setpos
+setglobal mousemodel=
+setglobal mousemodel=extend
+setglobal mousemodel=popup
+setglobal mousemodel=popup_setpos
+set mousem=
+set mousem=extend
+set mousem=popup
+set mousem=popup_setpos
+setlocal mousem=
+setlocal mousem=extend
+setlocal mousem=popup
+setlocal mousem=popup_setpos
+setglobal mousem=
+setglobal mousem=extend
+setglobal mousem=popup
+setglobal mousem=popup_setpos
+silent! call assert_fails('set mousemodel=xxx')
+silent! call assert_fails('setlocal mousemodel=xxx')
+silent! call assert_fails('setglobal mousemodel=xxx')
+silent! call assert_fails('set mousem=xxx')
+silent! call assert_fails('setlocal mousem=xxx')
+silent! call assert_fails('setglobal mousem=xxx')
+set mousemodel&
+set mousem&
+if exists('l:saved')
+let [&g:mousemodel, &l:mousemodel] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mousemoveevent()
+if exists('+mousemoveevent') && execute('set!') =~# '\n..mousemoveevent\([=\n]\|$\)'
+let l:saved = [&g:mousemoveevent, &l:mousemoveevent]
+endif
+if exists('+mousemoveevent')
+set mousemoveevent
+set nomousemoveevent
+set invmousemoveevent
+set mousemoveevent!
+setlocal mousemoveevent
+setlocal nomousemoveevent
+setlocal invmousemoveevent
+setlocal mousemoveevent!
+setglobal mousemoveevent
+setglobal nomousemoveevent
+setglobal invmousemoveevent
+setglobal mousemoveevent!
+set mousemev
+set nomousemev
+set invmousemev
+set mousemev!
+setlocal mousemev
+setlocal nomousemev
+setlocal invmousemev
+setlocal mousemev!
+setglobal mousemev
+setglobal nomousemev
+setglobal invmousemev
+setglobal mousemev!
+set mousemoveevent&
+set mousemev&
+if exists('l:saved')
+let [&g:mousemoveevent, &l:mousemoveevent] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mouseshape()
+if exists('+mouseshape') && execute('set!') =~# '\n..mouseshape\([=\n]\|$\)'
+let l:saved = [&g:mouseshape, &l:mouseshape]
+endif
+if exists('+mouseshape')
+set mouseshape=
+set mouseshape=n:arrow
+setlocal mouseshape=
+setlocal mouseshape=n:arrow
+setglobal mouseshape=
+setglobal mouseshape=n:arrow
+set mouses=
+set mouses=n:arrow
+setlocal mouses=
+setlocal mouses=n:arrow
+setglobal mouses=
+setglobal mouses=n:arrow
+silent! call assert_fails('set mouseshape=xxx')
+silent! call assert_fails('setlocal mouseshape=xxx')
+silent! call assert_fails('setglobal mouseshape=xxx')
+silent! call assert_fails('set mouses=xxx')
+silent! call assert_fails('setlocal mouses=xxx')
+silent! call assert_fails('setglobal mouses=xxx')
+set mouseshape&
+set mouses&
+if exists('l:saved')
+let [&g:mouseshape, &l:mouseshape] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mousetime()
+if exists('+mousetime') && execute('set!') =~# '\n..mousetime\([=\n]\|$\)'
+let l:saved = [&g:mousetime, &l:mousetime]
+endif
+if exists('+mousetime')
+set mousetime=-1
+set mousetime=0
+set mousetime=100
+setlocal mousetime=-1
+setlocal mousetime=0
+setlocal mousetime=100
+setglobal mousetime=-1
+setglobal mousetime=0
+setglobal mousetime=100
+set mouset=-1
+set mouset=0
+set mouset=100
+setlocal mouset=-1
+setlocal mouset=0
+setlocal mouset=100
+setglobal mouset=-1
+setglobal mouset=0
+setglobal mouset=100
+silent! call assert_fails('set mousetime=')
+silent! call assert_fails('setlocal mousetime=')
+silent! call assert_fails('setglobal mousetime=')
+silent! call assert_fails('set mouset=')
+silent! call assert_fails('setlocal mouset=')
+silent! call assert_fails('setglobal mouset=')
+set mousetime&
+set mouset&
+if exists('l:saved')
+let [&g:mousetime, &l:mousetime] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mzquantum()
+if exists('+mzquantum') && execute('set!') =~# '\n..mzquantum\([=\n]\|$\)'
+let l:saved = [&g:mzquantum, &l:mzquantum]
+endif
+if exists('+mzquantum')
+set mzquantum=-1
+set mzquantum=0
+set mzquantum=100
+setlocal mzquantum=-1
+setlocal mzquantum=0
+setlocal mzquantum=100
+setglobal mzquantum=-1
+setglobal mzquantum=0
+setglobal mzquantum=100
+set mzq=-1
+set mzq=0
+set mzq=100
+setlocal mzq=-1
+setlocal mzq=0
+setlocal mzq=100
+setglobal mzq=-1
+setglobal mzq=0
+setglobal mzq=100
+silent! call assert_fails('set mzquantum=')
+silent! call assert_fails('setlocal mzquantum=')
+silent! call assert_fails('setglobal mzquantum=')
+silent! call assert_fails('set mzq=')
+silent! call assert_fails('setlocal mzq=')
+silent! call assert_fails('setglobal mzq=')
+set mzquantum&
+set mzq&
+if exists('l:saved')
+let [&g:mzquantum, &l:mzquantum] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mzschemedll()
+if exists('+mzschemedll') && execute('set!') =~# '\n..mzschemedll\([=\n]\|$\)'
+let l:saved = [&g:mzschemedll, &l:mzschemedll]
+endif
+if exists('+mzschemedll')
+set mzschemedll=
+set mzschemedll=xxx
+setlocal mzschemedll=
+setlocal mzschemedll=xxx
+setglobal mzschemedll=
+setglobal mzschemedll=xxx
+set mzschemedll=
+set mzschemedll=xxx
+setlocal mzschemedll=
+setlocal mzschemedll=xxx
+setglobal mzschemedll=
+setglobal mzschemedll=xxx
+set mzschemedll&
+set mzschemedll&
+if exists('l:saved')
+let [&g:mzschemedll, &l:mzschemedll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_mzschemegcdll()
+if exists('+mzschemegcdll') && execute('set!') =~# '\n..mzschemegcdll\([=\n]\|$\)'
+let l:saved = [&g:mzschemegcdll, &l:mzschemegcdll]
+endif
+if exists('+mzschemegcdll')
+set mzschemegcdll=
+set mzschemegcdll=xxx
+setlocal mzschemegcdll=
+setlocal mzschemegcdll=xxx
+setglobal mzschemegcdll=
+setglobal mzschemegcdll=xxx
+set mzschemegcdll=
+set mzschemegcdll=xxx
+setlocal mzschemegcdll=
+setlocal mzschemegcdll=xxx
+setglobal mzschemegcdll=
+setglobal mzschemegcdll=xxx
+set mzschemegcdll&
+set mzschemegcdll&
+if exists('l:saved')
+let [&g:mzschemegcdll, &l:mzschemegcdll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_novice()
+if exists('+novice') && execute('set!') =~# '\n..novice\([=\n]\|$\)'
+let l:saved = [&g:novice, &l:novice]
+endif
+if exists('+novice')
+set novice
+set nonovice
+set invnovice
+set novice!
+setlocal novice
+setlocal nonovice
+setlocal invnovice
+setlocal novice!
+setglobal novice
+setglobal nonovice
+setglobal invnovice
+setglobal novice!
+set novice
+set nonovice
+set invnovice
+set novice!
+setlocal novice
+setlocal nonovice
+setlocal invnovice
+setlocal novice!
+setglobal novice
+setglobal nonovice
+setglobal invnovice
+setglobal novice!
+set novice&
+set novice&
+if exists('l:saved')
+let [&g:novice, &l:novice] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_nrformats()
+if exists('+nrformats') && execute('set!') =~# '\n..nrformats\([=\n]\|$\)'
+let l:saved = [&g:nrformats, &l:nrformats]
+endif
+if exists('+nrformats')
+set nrformats=
+set nrformats=alpha
+set nrformats=octal
+set nrformats=hex
+set nrformats=bin
+set nrformats=unsigned
+set nrformats=blank
+set nrformats=alpha,hex,bin
+setlocal nrformats=
+setlocal nrformats=alpha
+setlocal nrformats=octal
+setlocal nrformats=hex
+setlocal nrformats=bin
+setlocal nrformats=unsigned
+setlocal nrformats=blank
+setlocal nrformats=alpha,hex,bin
+setglobal nrformats=
+setglobal nrformats=alpha
+setglobal nrformats=octal
+setglobal nrformats=hex
+setglobal nrformats=bin
+setglobal nrformats=unsigned
+setglobal nrformats=blank
+setglobal nrformats=alpha,hex,bin
+set nf=
+set nf=alpha
+set nf=octal
+set nf=hex
+set nf=bin
+set nf=unsigned
+set nf=blank
+set nf=alpha,hex,bin
+setlocal nf=
+setlocal nf=alpha
+setlocal nf=octal
+setlocal nf=hex
+setlocal nf=bin
+setlocal nf=unsigned
+setlocal nf=blank
+setlocal nf=alpha,hex,bin
+setglobal nf=
+setglobal nf=alpha
+setglobal nf=octal
+setglobal nf=hex
+setglobal nf=bin
+setglobal nf=unsigned
+setglobal nf=blank
+setglobal nf=alpha,hex,bin
+silent! call assert_fails('set nrformats=xxx')
+silent! call assert_fails('setlocal nrformats=xxx')
+silent! call assert_fails('setglobal nrformats=xxx')
+silent! call assert_fails('set nf=xxx')
+silent! call assert_fails('setlocal nf=xxx')
+silent! call assert_fails('setglobal nf=xxx')
+set nrformats&
+set nf&
+if exists('l:saved')
+let [&g:nrformats, &l:nrformats] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_number()
+if exists('+number') && execute('set!') =~# '\n..number\([=\n]\|$\)'
+let l:saved = [&g:number, &l:number]
+endif
+if exists('+number')
+set number
+set nonumber
+set invnumber
+set number!
+setlocal number
+setlocal nonumber
+setlocal invnumber
+setlocal number!
+setglobal number
+setglobal nonumber
+setglobal invnumber
+setglobal number!
+set nu
+set nonu
+set invnu
+set nu!
+setlocal nu
+setlocal nonu
+setlocal invnu
+setlocal nu!
+setglobal nu
+setglobal nonu
+setglobal invnu
+setglobal nu!
+set number&
+set nu&
+if exists('l:saved')
+let [&g:number, &l:number] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_numberwidth()
+if exists('+numberwidth') && execute('set!') =~# '\n..numberwidth\([=\n]\|$\)'
+let l:saved = [&g:numberwidth, &l:numberwidth]
+endif
+if exists('+numberwidth')
+set numberwidth=1
+set numberwidth=4
+set numberwidth=8
+set numberwidth=10
+set numberwidth=11
+set numberwidth=20
+setlocal numberwidth=1
+setlocal numberwidth=4
+setlocal numberwidth=8
+setlocal numberwidth=10
+setlocal numberwidth=11
+setlocal numberwidth=20
+setglobal numberwidth=1
+setglobal numberwidth=4
+setglobal numberwidth=8
+setglobal numberwidth=10
+setglobal numberwidth=11
+setglobal numberwidth=20
+set nuw=1
+set nuw=4
+set nuw=8
+set nuw=10
+set nuw=11
+set nuw=20
+setlocal nuw=1
+setlocal nuw=4
+setlocal nuw=8
+setlocal nuw=10
+setlocal nuw=11
+setlocal nuw=20
+setglobal nuw=1
+setglobal nuw=4
+setglobal nuw=8
+setglobal nuw=10
+setglobal nuw=11
+setglobal nuw=20
+silent! call assert_fails('set numberwidth=-1')
+silent! call assert_fails('set numberwidth=0')
+silent! call assert_fails('set numberwidth=21')
+silent! call assert_fails('setlocal numberwidth=-1')
+silent! call assert_fails('setlocal numberwidth=0')
+silent! call assert_fails('setlocal numberwidth=21')
+silent! call assert_fails('setglobal numberwidth=-1')
+silent! call assert_fails('setglobal numberwidth=0')
+silent! call assert_fails('setglobal numberwidth=21')
+silent! call assert_fails('set nuw=-1')
+silent! call assert_fails('set nuw=0')
+silent! call assert_fails('set nuw=21')
+silent! call assert_fails('setlocal nuw=-1')
+silent! call assert_fails('setlocal nuw=0')
+silent! call assert_fails('setlocal nuw=21')
+silent! call assert_fails('setglobal nuw=-1')
+silent! call assert_fails('setglobal nuw=0')
+silent! call assert_fails('setglobal nuw=21')
+set numberwidth&
+set nuw&
+if exists('l:saved')
+let [&g:numberwidth, &l:numberwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_omnifunc()
+if exists('+omnifunc') && execute('set!') =~# '\n..omnifunc\([=\n]\|$\)'
+let l:saved = [&g:omnifunc, &l:omnifunc]
+endif
+if exists('+omnifunc')
+set omnifunc=
+set omnifunc=xxx
+setlocal omnifunc=
+setlocal omnifunc=xxx
+setglobal omnifunc=
+setglobal omnifunc=xxx
+set ofu=
+set ofu=xxx
+setlocal ofu=
+setlocal ofu=xxx
+setglobal ofu=
+setglobal ofu=xxx
+set omnifunc&
+set ofu&
+if exists('l:saved')
+let [&g:omnifunc, &l:omnifunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_open()
+if exists('+open') && execute('set!') =~# '\n..open\([=\n]\|$\)'
+let l:saved = [&g:open, &l:open]
+endif
+if exists('+open')
+set open
+set noopen
+set invopen
+set open!
+setlocal open
+setlocal noopen
+setlocal invopen
+setlocal open!
+setglobal open
+setglobal noopen
+setglobal invopen
+setglobal open!
+set open
+set noopen
+set invopen
+set open!
+setlocal open
+setlocal noopen
+setlocal invopen
+setlocal open!
+setglobal open
+setglobal noopen
+setglobal invopen
+setglobal open!
+set open&
+set open&
+if exists('l:saved')
+let [&g:open, &l:open] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_opendevice()
+if exists('+opendevice') && execute('set!') =~# '\n..opendevice\([=\n]\|$\)'
+let l:saved = [&g:opendevice, &l:opendevice]
+endif
+if exists('+opendevice')
+set opendevice
+set noopendevice
+set invopendevice
+set opendevice!
+setlocal opendevice
+setlocal noopendevice
+setlocal invopendevice
+setlocal opendevice!
+setglobal opendevice
+setglobal noopendevice
+setglobal invopendevice
+setglobal opendevice!
+set odev
+set noodev
+set invodev
+set odev!
+setlocal odev
+setlocal noodev
+setlocal invodev
+setlocal odev!
+setglobal odev
+setglobal noodev
+setglobal invodev
+setglobal odev!
+set opendevice&
+set odev&
+if exists('l:saved')
+let [&g:opendevice, &l:opendevice] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_operatorfunc()
+if exists('+operatorfunc') && execute('set!') =~# '\n..operatorfunc\([=\n]\|$\)'
+let l:saved = [&g:operatorfunc, &l:operatorfunc]
+endif
+if exists('+operatorfunc')
+set operatorfunc=
+set operatorfunc=xxx
+setlocal operatorfunc=
+setlocal operatorfunc=xxx
+setglobal operatorfunc=
+setglobal operatorfunc=xxx
+set opfunc=
+set opfunc=xxx
+setlocal opfunc=
+setlocal opfunc=xxx
+setglobal opfunc=
+setglobal opfunc=xxx
+set operatorfunc&
+set opfunc&
+if exists('l:saved')
+let [&g:operatorfunc, &l:operatorfunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_optimize()
+if exists('+optimize') && execute('set!') =~# '\n..optimize\([=\n]\|$\)'
+let l:saved = [&g:optimize, &l:optimize]
+endif
+if exists('+optimize')
+set optimize
+set nooptimize
+set invoptimize
+set optimize!
+setlocal optimize
+setlocal nooptimize
+setlocal invoptimize
+setlocal optimize!
+setglobal optimize
+setglobal nooptimize
+setglobal invoptimize
+setglobal optimize!
+set opt
+set noopt
+set invopt
+set opt!
+setlocal opt
+setlocal noopt
+setlocal invopt
+setlocal opt!
+setglobal opt
+setglobal noopt
+setglobal invopt
+setglobal opt!
+set optimize&
+set opt&
+if exists('l:saved')
+let [&g:optimize, &l:optimize] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_osfiletype()
+if exists('+osfiletype') && execute('set!') =~# '\n..osfiletype\([=\n]\|$\)'
+let l:saved = [&g:osfiletype, &l:osfiletype]
+endif
+if exists('+osfiletype')
+set osfiletype=
+set osfiletype=xxx
+setlocal osfiletype=
+setlocal osfiletype=xxx
+setglobal osfiletype=
+setglobal osfiletype=xxx
+set oft=
+set oft=xxx
+setlocal oft=
+setlocal oft=xxx
+setglobal oft=
+setglobal oft=xxx
+set osfiletype&
+set oft&
+if exists('l:saved')
+let [&g:osfiletype, &l:osfiletype] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_packpath()
+if exists('+packpath') && execute('set!') =~# '\n..packpath\([=\n]\|$\)'
+let l:saved = [&g:packpath, &l:packpath]
+endif
+if exists('+packpath')
+set packpath=
+set packpath=xxx
+setlocal packpath=
+setlocal packpath=xxx
+setglobal packpath=
+setglobal packpath=xxx
+set pp=
+set pp=xxx
+setlocal pp=
+setlocal pp=xxx
+setglobal pp=
+setglobal pp=xxx
+set packpath&
+set pp&
+if exists('l:saved')
+let [&g:packpath, &l:packpath] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_paragraphs()
+if exists('+paragraphs') && execute('set!') =~# '\n..paragraphs\([=\n]\|$\)'
+let l:saved = [&g:paragraphs, &l:paragraphs]
+endif
+if exists('+paragraphs')
+set paragraphs=
+set paragraphs=xxx
+setlocal paragraphs=
+setlocal paragraphs=xxx
+setglobal paragraphs=
+setglobal paragraphs=xxx
+set para=
+set para=xxx
+setlocal para=
+setlocal para=xxx
+setglobal para=
+setglobal para=xxx
+set paragraphs&
+set para&
+if exists('l:saved')
+let [&g:paragraphs, &l:paragraphs] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_paste()
+if exists('+paste') && execute('set!') =~# '\n..paste\([=\n]\|$\)'
+let l:saved = [&g:paste, &l:paste]
+endif
+if exists('+paste')
+set paste
+set nopaste
+set invpaste
+set paste!
+setlocal paste
+setlocal nopaste
+setlocal invpaste
+setlocal paste!
+setglobal paste
+setglobal nopaste
+setglobal invpaste
+setglobal paste!
+set paste
+set nopaste
+set invpaste
+set paste!
+setlocal paste
+setlocal nopaste
+setlocal invpaste
+setlocal paste!
+setglobal paste
+setglobal nopaste
+setglobal invpaste
+setglobal paste!
+set paste&
+set paste&
+if exists('l:saved')
+let [&g:paste, &l:paste] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_pastetoggle()
+if exists('+pastetoggle') && execute('set!') =~# '\n..pastetoggle\([=\n]\|$\)'
+let l:saved = [&g:pastetoggle, &l:pastetoggle]
+endif
+if exists('+pastetoggle')
+set pastetoggle=
+set pastetoggle=xxx
+setlocal pastetoggle=
+setlocal pastetoggle=xxx
+setglobal pastetoggle=
+setglobal pastetoggle=xxx
+set pt=
+set pt=xxx
+setlocal pt=
+setlocal pt=xxx
+setglobal pt=
+setglobal pt=xxx
+set pastetoggle&
+set pt&
+if exists('l:saved')
+let [&g:pastetoggle, &l:pastetoggle] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_patchexpr()
+if exists('+patchexpr') && execute('set!') =~# '\n..patchexpr\([=\n]\|$\)'
+let l:saved = [&g:patchexpr, &l:patchexpr]
+endif
+if exists('+patchexpr')
+set patchexpr=
+set patchexpr=xxx
+setlocal patchexpr=
+setlocal patchexpr=xxx
+setglobal patchexpr=
+setglobal patchexpr=xxx
+set pex=
+set pex=xxx
+setlocal pex=
+setlocal pex=xxx
+setglobal pex=
+setglobal pex=xxx
+set patchexpr&
+set pex&
+if exists('l:saved')
+let [&g:patchexpr, &l:patchexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_patchmode()
+if exists('+patchmode') && execute('set!') =~# '\n..patchmode\([=\n]\|$\)'
+let l:saved = [&g:patchmode, &l:patchmode]
+endif
+if exists('+patchmode')
+set patchmode=
+set patchmode=xxx
+set patchmode=.x
+setlocal patchmode=
+setlocal patchmode=xxx
+setlocal patchmode=.x
+setglobal patchmode=
+setglobal patchmode=xxx
+setglobal patchmode=.x
+set pm=
+set pm=xxx
+set pm=.x
+setlocal pm=
+setlocal pm=xxx
+setlocal pm=.x
+setglobal pm=
+setglobal pm=xxx
+setglobal pm=.x
+silent! call assert_fails('set patchmode=~')
+silent! call assert_fails('set patchmode=*')
+silent! call assert_fails('setlocal patchmode=~')
+silent! call assert_fails('setlocal patchmode=*')
+silent! call assert_fails('setglobal patchmode=~')
+silent! call assert_fails('setglobal patchmode=*')
+silent! call assert_fails('set pm=~')
+silent! call assert_fails('set pm=*')
+silent! call assert_fails('setlocal pm=~')
+silent! call assert_fails('setlocal pm=*')
+silent! call assert_fails('setglobal pm=~')
+silent! call assert_fails('setglobal pm=*')
+set patchmode&
+set pm&
+if exists('l:saved')
+let [&g:patchmode, &l:patchmode] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_path()
+if exists('+path') && execute('set!') =~# '\n..path\([=\n]\|$\)'
+let l:saved = [&g:path, &l:path]
+endif
+if exists('+path')
+set path=
+set path=xxx
+setlocal path=
+setlocal path=xxx
+setglobal path=
+setglobal path=xxx
+set pa=
+set pa=xxx
+setlocal pa=
+setlocal pa=xxx
+setglobal pa=
+setglobal pa=xxx
+set path&
+set pa&
+if exists('l:saved')
+let [&g:path, &l:path] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_pathidletime()
+if exists('+pathidletime') && execute('set!') =~# '\n..pathidletime\([=\n]\|$\)'
+let l:saved = [&g:pathidletime, &l:pathidletime]
+endif
+if exists('+pathidletime')
+set pathidletime=0
+set pathidletime=10
+set pathidletime=100
+setlocal pathidletime=0
+setlocal pathidletime=10
+setlocal pathidletime=100
+setglobal pathidletime=0
+setglobal pathidletime=10
+setglobal pathidletime=100
+set pit=0
+set pit=10
+set pit=100
+setlocal pit=0
+setlocal pit=10
+setlocal pit=100
+setglobal pit=0
+setglobal pit=10
+setglobal pit=100
+silent! call assert_fails('set pathidletime=-1')
+silent! call assert_fails('setlocal pathidletime=-1')
+silent! call assert_fails('setglobal pathidletime=-1')
+silent! call assert_fails('set pit=-1')
+silent! call assert_fails('setlocal pit=-1')
+silent! call assert_fails('setglobal pit=-1')
+set pathidletime&
+set pit&
+if exists('l:saved')
+let [&g:pathidletime, &l:pathidletime] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_preserveindent()
+if exists('+preserveindent') && execute('set!') =~# '\n..preserveindent\([=\n]\|$\)'
+let l:saved = [&g:preserveindent, &l:preserveindent]
+endif
+if exists('+preserveindent')
+set preserveindent
+set nopreserveindent
+set invpreserveindent
+set preserveindent!
+setlocal preserveindent
+setlocal nopreserveindent
+setlocal invpreserveindent
+setlocal preserveindent!
+setglobal preserveindent
+setglobal nopreserveindent
+setglobal invpreserveindent
+setglobal preserveindent!
+set pi
+set nopi
+set invpi
+set pi!
+setlocal pi
+setlocal nopi
+setlocal invpi
+setlocal pi!
+setglobal pi
+setglobal nopi
+setglobal invpi
+setglobal pi!
+set preserveindent&
+set pi&
+if exists('l:saved')
+let [&g:preserveindent, &l:preserveindent] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_previewheight()
+if exists('+previewheight') && execute('set!') =~# '\n..previewheight\([=\n]\|$\)'
+let l:saved = [&g:previewheight, &l:previewheight]
+endif
+if exists('+previewheight')
+set previewheight=-1
+set previewheight=0
+set previewheight=100
+setlocal previewheight=-1
+setlocal previewheight=0
+setlocal previewheight=100
+setglobal previewheight=-1
+setglobal previewheight=0
+setglobal previewheight=100
+set pvh=-1
+set pvh=0
+set pvh=100
+setlocal pvh=-1
+setlocal pvh=0
+setlocal pvh=100
+setglobal pvh=-1
+setglobal pvh=0
+setglobal pvh=100
+silent! call assert_fails('set previewheight=')
+silent! call assert_fails('setlocal previewheight=')
+silent! call assert_fails('setglobal previewheight=')
+silent! call assert_fails('set pvh=')
+silent! call assert_fails('setlocal pvh=')
+silent! call assert_fails('setglobal pvh=')
+set previewheight&
+set pvh&
+if exists('l:saved')
+let [&g:previewheight, &l:previewheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_previewpopup()
+if exists('+previewpopup') && execute('set!') =~# '\n..previewpopup\([=\n]\|$\)'
+let l:saved = [&g:previewpopup, &l:previewpopup]
+endif
+if exists('+previewpopup')
+set previewpopup=
+set previewpopup=height:13
+set previewpopup=width:20
+set previewpopup=highlight:That
+set previewpopup=align:item
+set previewpopup=align:menu
+set previewpopup=border:on
+set previewpopup=border:off
+set previewpopup=width:10,height:234,highlight:Mine
+setlocal previewpopup=
+setlocal previewpopup=height:13
+setlocal previewpopup=width:20
+setlocal previewpopup=highlight:That
+setlocal previewpopup=align:item
+setlocal previewpopup=align:menu
+setlocal previewpopup=border:on
+setlocal previewpopup=border:off
+setlocal previewpopup=width:10,height:234,highlight:Mine
+setglobal previewpopup=
+setglobal previewpopup=height:13
+setglobal previewpopup=width:20
+setglobal previewpopup=highlight:That
+setglobal previewpopup=align:item
+setglobal previewpopup=align:menu
+setglobal previewpopup=border:on
+setglobal previewpopup=border:off
+setglobal previewpopup=width:10,height:234,highlight:Mine
+set pvp=
+set pvp=height:13
+set pvp=width:20
+set pvp=highlight:That
+set pvp=align:item
+set pvp=align:menu
+set pvp=border:on
+set pvp=border:off
+set pvp=width:10,height:234,highlight:Mine
+setlocal pvp=
+setlocal pvp=height:13
+setlocal pvp=width:20
+setlocal pvp=highlight:That
+setlocal pvp=align:item
+setlocal pvp=align:menu
+setlocal pvp=border:on
+setlocal pvp=border:off
+setlocal pvp=width:10,height:234,highlight:Mine
+setglobal pvp=
+setglobal pvp=height:13
+setglobal pvp=width:20
+setglobal pvp=highlight:That
+setglobal pvp=align:item
+setglobal pvp=align:menu
+setglobal pvp=border:on
+setglobal pvp=border:off
+setglobal pvp=width:10,height:234,highlight:Mine
+silent! call assert_fails('set previewpopup=xxx')
+silent! call assert_fails('set previewpopup=xxx:99')
+silent! call assert_fails('set previewpopup=height:yes')
+silent! call assert_fails('set previewpopup=width:no')
+silent! call assert_fails('set previewpopup=align:xxx')
+silent! call assert_fails('set previewpopup=border:maybe')
+silent! call assert_fails('set previewpopup=border:1')
+silent! call assert_fails('set previewpopup=border:')
+silent! call assert_fails('setlocal previewpopup=xxx')
+silent! call assert_fails('setlocal previewpopup=xxx:99')
+silent! call assert_fails('setlocal previewpopup=height:yes')
+silent! call assert_fails('setlocal previewpopup=width:no')
+silent! call assert_fails('setlocal previewpopup=align:xxx')
+silent! call assert_fails('setlocal previewpopup=border:maybe')
+silent! call assert_fails('setlocal previewpopup=border:1')
+silent! call assert_fails('setlocal previewpopup=border:')
+silent! call assert_fails('setglobal previewpopup=xxx')
+silent! call assert_fails('setglobal previewpopup=xxx:99')
+silent! call assert_fails('setglobal previewpopup=height:yes')
+silent! call assert_fails('setglobal previewpopup=width:no')
+silent! call assert_fails('setglobal previewpopup=align:xxx')
+silent! call assert_fails('setglobal previewpopup=border:maybe')
+silent! call assert_fails('setglobal previewpopup=border:1')
+silent! call assert_fails('setglobal previewpopup=border:')
+silent! call assert_fails('set pvp=xxx')
+silent! call assert_fails('set pvp=xxx:99')
+silent! call assert_fails('set pvp=height:yes')
+silent! call assert_fails('set pvp=width:no')
+silent! call assert_fails('set pvp=align:xxx')
+silent! call assert_fails('set pvp=border:maybe')
+silent! call assert_fails('set pvp=border:1')
+silent! call assert_fails('set pvp=border:')
+silent! call assert_fails('setlocal pvp=xxx')
+silent! call assert_fails('setlocal pvp=xxx:99')
+silent! call assert_fails('setlocal pvp=height:yes')
+silent! call assert_fails('setlocal pvp=width:no')
+silent! call assert_fails('setlocal pvp=align:xxx')
+silent! call assert_fails('setlocal pvp=border:maybe')
+silent! call assert_fails('setlocal pvp=border:1')
+silent! call assert_fails('setlocal pvp=border:')
+silent! call assert_fails('setglobal pvp=xxx')
+silent! call assert_fails('setglobal pvp=xxx:99')
+silent! call assert_fails('setglobal pvp=height:yes')
+silent! call assert_fails('setglobal pvp=width:no')
+silent! call assert_fails('setglobal pvp=align:xxx')
+silent! call assert_fails('setglobal pvp=border:maybe')
+silent! call assert_fails('setglobal pvp=border:1')
+silent! call assert_fails('setglobal pvp=border:')
+set previewpopup&
+set pvp&
+if exists('l:saved')
+let [&g:previewpopup, &l:previewpopup] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_previewwindow()
+if exists('+previewwindow') && execute('set!') =~# '\n..previewwindow\([=\n]\|$\)'
+let l:saved = [&g:previewwindow, &l:previewwindow]
+endif
+if exists('+previewwindow')
+set previewwindow
+set nopreviewwindow
+set invpreviewwindow
+set previewwindow!
+setlocal previewwindow
+setlocal nopreviewwindow
+setlocal invpreviewwindow
+setlocal previewwindow!
+setglobal previewwindow
+setglobal nopreviewwindow
+setglobal invpreviewwindow
+setglobal previewwindow!
+set pvw
+set nopvw
+set invpvw
+set pvw!
+setlocal pvw
+setlocal nopvw
+setlocal invpvw
+setlocal pvw!
+setglobal pvw
+setglobal nopvw
+setglobal invpvw
+setglobal pvw!
+set previewwindow&
+set pvw&
+if exists('l:saved')
+let [&g:previewwindow, &l:previewwindow] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printdevice()
+if exists('+printdevice') && execute('set!') =~# '\n..printdevice\([=\n]\|$\)'
+let l:saved = [&g:printdevice, &l:printdevice]
+endif
+if exists('+printdevice')
+set printdevice=
+set printdevice=xxx
+setlocal printdevice=
+setlocal printdevice=xxx
+setglobal printdevice=
+setglobal printdevice=xxx
+set pdev=
+set pdev=xxx
+setlocal pdev=
+setlocal pdev=xxx
+setglobal pdev=
+setglobal pdev=xxx
+set printdevice&
+set pdev&
+if exists('l:saved')
+let [&g:printdevice, &l:printdevice] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printencoding()
+if exists('+printencoding') && execute('set!') =~# '\n..printencoding\([=\n]\|$\)'
+let l:saved = [&g:printencoding, &l:printencoding]
+endif
+if exists('+printencoding')
+set printencoding=
+set printencoding=xxx
+setlocal printencoding=
+setlocal printencoding=xxx
+setglobal printencoding=
+setglobal printencoding=xxx
+set penc=
+set penc=xxx
+setlocal penc=
+setlocal penc=xxx
+setglobal penc=
+setglobal penc=xxx
+set printencoding&
+set penc&
+if exists('l:saved')
+let [&g:printencoding, &l:printencoding] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printexpr()
+if exists('+printexpr') && execute('set!') =~# '\n..printexpr\([=\n]\|$\)'
+let l:saved = [&g:printexpr, &l:printexpr]
+endif
+if exists('+printexpr')
+set printexpr=
+set printexpr=xxx
+setlocal printexpr=
+setlocal printexpr=xxx
+setglobal printexpr=
+setglobal printexpr=xxx
+set pexpr=
+set pexpr=xxx
+setlocal pexpr=
+setlocal pexpr=xxx
+setglobal pexpr=
+setglobal pexpr=xxx
+set printexpr&
+set pexpr&
+if exists('l:saved')
+let [&g:printexpr, &l:printexpr] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printfont()
+if exists('+printfont') && execute('set!') =~# '\n..printfont\([=\n]\|$\)'
+let l:saved = [&g:printfont, &l:printfont]
+endif
+if exists('+printfont')
+set printfont=
+set printfont=xxx
+setlocal printfont=
+setlocal printfont=xxx
+setglobal printfont=
+setglobal printfont=xxx
+set pfn=
+set pfn=xxx
+setlocal pfn=
+setlocal pfn=xxx
+setglobal pfn=
+setglobal pfn=xxx
+set printfont&
+set pfn&
+if exists('l:saved')
+let [&g:printfont, &l:printfont] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printheader()
+if exists('+printheader') && execute('set!') =~# '\n..printheader\([=\n]\|$\)'
+let l:saved = [&g:printheader, &l:printheader]
+endif
+if exists('+printheader')
+set printheader=
+set printheader=xxx
+setlocal printheader=
+setlocal printheader=xxx
+setglobal printheader=
+setglobal printheader=xxx
+set pheader=
+set pheader=xxx
+setlocal pheader=
+setlocal pheader=xxx
+setglobal pheader=
+setglobal pheader=xxx
+set printheader&
+set pheader&
+if exists('l:saved')
+let [&g:printheader, &l:printheader] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printmbcharset()
+if exists('+printmbcharset') && execute('set!') =~# '\n..printmbcharset\([=\n]\|$\)'
+let l:saved = [&g:printmbcharset, &l:printmbcharset]
+endif
+if exists('+printmbcharset')
+set printmbcharset=
+set printmbcharset=xxx
+setlocal printmbcharset=
+setlocal printmbcharset=xxx
+setglobal printmbcharset=
+setglobal printmbcharset=xxx
+set pmbcs=
+set pmbcs=xxx
+setlocal pmbcs=
+setlocal pmbcs=xxx
+setglobal pmbcs=
+setglobal pmbcs=xxx
+set printmbcharset&
+set pmbcs&
+if exists('l:saved')
+let [&g:printmbcharset, &l:printmbcharset] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printmbfont()
+if exists('+printmbfont') && execute('set!') =~# '\n..printmbfont\([=\n]\|$\)'
+let l:saved = [&g:printmbfont, &l:printmbfont]
+endif
+if exists('+printmbfont')
+set printmbfont=
+set printmbfont=r:some
+set printmbfont=b:some
+set printmbfont=i:some
+set printmbfont=o:some
+set printmbfont=c:yes
+set printmbfont=c:no
+set printmbfont=a:yes
+set printmbfont=a:no
+set printmbfont=b:Bold,c:yes
+setlocal printmbfont=
+setlocal printmbfont=r:some
+setlocal printmbfont=b:some
+setlocal printmbfont=i:some
+setlocal printmbfont=o:some
+setlocal printmbfont=c:yes
+setlocal printmbfont=c:no
+setlocal printmbfont=a:yes
+setlocal printmbfont=a:no
+setlocal printmbfont=b:Bold,c:yes
+setglobal printmbfont=
+setglobal printmbfont=r:some
+setglobal printmbfont=b:some
+setglobal printmbfont=i:some
+setglobal printmbfont=o:some
+setglobal printmbfont=c:yes
+setglobal printmbfont=c:no
+setglobal printmbfont=a:yes
+setglobal printmbfont=a:no
+setglobal printmbfont=b:Bold,c:yes
+set pmbfn=
+set pmbfn=r:some
+set pmbfn=b:some
+set pmbfn=i:some
+set pmbfn=o:some
+set pmbfn=c:yes
+set pmbfn=c:no
+set pmbfn=a:yes
+set pmbfn=a:no
+set pmbfn=b:Bold,c:yes
+setlocal pmbfn=
+setlocal pmbfn=r:some
+setlocal pmbfn=b:some
+setlocal pmbfn=i:some
+setlocal pmbfn=o:some
+setlocal pmbfn=c:yes
+setlocal pmbfn=c:no
+setlocal pmbfn=a:yes
+setlocal pmbfn=a:no
+setlocal pmbfn=b:Bold,c:yes
+setglobal pmbfn=
+setglobal pmbfn=r:some
+setglobal pmbfn=b:some
+setglobal pmbfn=i:some
+setglobal pmbfn=o:some
+setglobal pmbfn=c:yes
+setglobal pmbfn=c:no
+setglobal pmbfn=a:yes
+setglobal pmbfn=a:no
+setglobal pmbfn=b:Bold,c:yes
+silent! call assert_fails('set printmbfont=xxx')
+silent! call assert_fails('set printmbfont=xxx,c:yes')
+silent! call assert_fails('set printmbfont=xxx:')
+silent! call assert_fails('set printmbfont=xxx:,c:yes')
+silent! call assert_fails('setlocal printmbfont=xxx')
+silent! call assert_fails('setlocal printmbfont=xxx,c:yes')
+silent! call assert_fails('setlocal printmbfont=xxx:')
+silent! call assert_fails('setlocal printmbfont=xxx:,c:yes')
+silent! call assert_fails('setglobal printmbfont=xxx')
+silent! call assert_fails('setglobal printmbfont=xxx,c:yes')
+silent! call assert_fails('setglobal printmbfont=xxx:')
+silent! call assert_fails('setglobal printmbfont=xxx:,c:yes')
+silent! call assert_fails('set pmbfn=xxx')
+silent! call assert_fails('set pmbfn=xxx,c:yes')
+silent! call assert_fails('set pmbfn=xxx:')
+silent! call assert_fails('set pmbfn=xxx:,c:yes')
+silent! call assert_fails('setlocal pmbfn=xxx')
+silent! call assert_fails('setlocal pmbfn=xxx,c:yes')
+silent! call assert_fails('setlocal pmbfn=xxx:')
+silent! call assert_fails('setlocal pmbfn=xxx:,c:yes')
+silent! call assert_fails('setglobal pmbfn=xxx')
+silent! call assert_fails('setglobal pmbfn=xxx,c:yes')
+silent! call assert_fails('setglobal pmbfn=xxx:')
+silent! call assert_fails('setglobal pmbfn=xxx:,c:yes')
+set printmbfont&
+set pmbfn&
+if exists('l:saved')
+let [&g:printmbfont, &l:printmbfont] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_printoptions()
+if exists('+printoptions') && execute('set!') =~# '\n..printoptions\([=\n]\|$\)'
+let l:saved = [&g:printoptions, &l:printoptions]
+endif
+if exists('+printoptions')
+set printoptions=
+set printoptions=header:0
+set printoptions=left:10pc,top:5pc
+setlocal printoptions=
+setlocal printoptions=header:0
+setlocal printoptions=left:10pc,top:5pc
+setglobal printoptions=
+setglobal printoptions=header:0
+setglobal printoptions=left:10pc,top:5pc
+set popt=
+set popt=header:0
+set popt=left:10pc,top:5pc
+setlocal popt=
+setlocal popt=header:0
+setlocal popt=left:10pc,top:5pc
+setglobal popt=
+setglobal popt=header:0
+setglobal popt=left:10pc,top:5pc
+silent! call assert_fails('set printoptions=xxx')
+silent! call assert_fails('set printoptions=header:-1')
+silent! call assert_fails('setlocal printoptions=xxx')
+silent! call assert_fails('setlocal printoptions=header:-1')
+silent! call assert_fails('setglobal printoptions=xxx')
+silent! call assert_fails('setglobal printoptions=header:-1')
+silent! call assert_fails('set popt=xxx')
+silent! call assert_fails('set popt=header:-1')
+silent! call assert_fails('setlocal popt=xxx')
+silent! call assert_fails('setlocal popt=header:-1')
+silent! call assert_fails('setglobal popt=xxx')
+silent! call assert_fails('setglobal popt=header:-1')
+set printoptions&
+set popt&
+if exists('l:saved')
+let [&g:printoptions, &l:printoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_prompt()
+if exists('+prompt') && execute('set!') =~# '\n..prompt\([=\n]\|$\)'
+let l:saved = [&g:prompt, &l:prompt]
+endif
+if exists('+prompt')
+set prompt
+set noprompt
+set invprompt
+set prompt!
+setlocal prompt
+setlocal noprompt
+setlocal invprompt
+setlocal prompt!
+setglobal prompt
+setglobal noprompt
+setglobal invprompt
+setglobal prompt!
+set prompt
+set noprompt
+set invprompt
+set prompt!
+setlocal prompt
+setlocal noprompt
+setlocal invprompt
+setlocal prompt!
+setglobal prompt
+setglobal noprompt
+setglobal invprompt
+setglobal prompt!
+set prompt&
+set prompt&
+if exists('l:saved')
+let [&g:prompt, &l:prompt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_pumheight()
+if exists('+pumheight') && execute('set!') =~# '\n..pumheight\([=\n]\|$\)'
+let l:saved = [&g:pumheight, &l:pumheight]
+endif
+if exists('+pumheight')
+set pumheight=-1
+set pumheight=0
+set pumheight=100
+setlocal pumheight=-1
+setlocal pumheight=0
+setlocal pumheight=100
+setglobal pumheight=-1
+setglobal pumheight=0
+setglobal pumheight=100
+set ph=-1
+set ph=0
+set ph=100
+setlocal ph=-1
+setlocal ph=0
+setlocal ph=100
+setglobal ph=-1
+setglobal ph=0
+setglobal ph=100
+silent! call assert_fails('set pumheight=')
+silent! call assert_fails('setlocal pumheight=')
+silent! call assert_fails('setglobal pumheight=')
+silent! call assert_fails('set ph=')
+silent! call assert_fails('setlocal ph=')
+silent! call assert_fails('setglobal ph=')
+set pumheight&
+set ph&
+if exists('l:saved')
+let [&g:pumheight, &l:pumheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_pummaxwidth()
+if exists('+pummaxwidth') && execute('set!') =~# '\n..pummaxwidth\([=\n]\|$\)'
+let l:saved = [&g:pummaxwidth, &l:pummaxwidth]
+endif
+if exists('+pummaxwidth')
+set pummaxwidth=-1
+set pummaxwidth=0
+set pummaxwidth=100
+setlocal pummaxwidth=-1
+setlocal pummaxwidth=0
+setlocal pummaxwidth=100
+setglobal pummaxwidth=-1
+setglobal pummaxwidth=0
+setglobal pummaxwidth=100
+set pmw=-1
+set pmw=0
+set pmw=100
+setlocal pmw=-1
+setlocal pmw=0
+setlocal pmw=100
+setglobal pmw=-1
+setglobal pmw=0
+setglobal pmw=100
+silent! call assert_fails('set pummaxwidth=')
+silent! call assert_fails('setlocal pummaxwidth=')
+silent! call assert_fails('setglobal pummaxwidth=')
+silent! call assert_fails('set pmw=')
+silent! call assert_fails('setlocal pmw=')
+silent! call assert_fails('setglobal pmw=')
+set pummaxwidth&
+set pmw&
+if exists('l:saved')
+let [&g:pummaxwidth, &l:pummaxwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_pumwidth()
+if exists('+pumwidth') && execute('set!') =~# '\n..pumwidth\([=\n]\|$\)'
+let l:saved = [&g:pumwidth, &l:pumwidth]
+endif
+if exists('+pumwidth')
+set pumwidth=-1
+set pumwidth=0
+set pumwidth=100
+setlocal pumwidth=-1
+setlocal pumwidth=0
+setlocal pumwidth=100
+setglobal pumwidth=-1
+setglobal pumwidth=0
+setglobal pumwidth=100
+set pw=-1
+set pw=0
+set pw=100
+setlocal pw=-1
+setlocal pw=0
+setlocal pw=100
+setglobal pw=-1
+setglobal pw=0
+setglobal pw=100
+silent! call assert_fails('set pumwidth=')
+silent! call assert_fails('setlocal pumwidth=')
+silent! call assert_fails('setglobal pumwidth=')
+silent! call assert_fails('set pw=')
+silent! call assert_fails('setlocal pw=')
+silent! call assert_fails('setglobal pw=')
+set pumwidth&
+set pw&
+if exists('l:saved')
+let [&g:pumwidth, &l:pumwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_pythonhome()
+if exists('+pythonhome') && execute('set!') =~# '\n..pythonhome\([=\n]\|$\)'
+let l:saved = [&g:pythonhome, &l:pythonhome]
+endif
+if exists('+pythonhome')
+set pythonhome=
+set pythonhome=xxx
+setlocal pythonhome=
+setlocal pythonhome=xxx
+setglobal pythonhome=
+setglobal pythonhome=xxx
+set pythonhome=
+set pythonhome=xxx
+setlocal pythonhome=
+setlocal pythonhome=xxx
+setglobal pythonhome=
+setglobal pythonhome=xxx
+set pythonhome&
+set pythonhome&
+if exists('l:saved')
+let [&g:pythonhome, &l:pythonhome] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_pythonthreehome()
+if exists('+pythonthreehome') && execute('set!') =~# '\n..pythonthreehome\([=\n]\|$\)'
+let l:saved = [&g:pythonthreehome, &l:pythonthreehome]
+endif
+if exists('+pythonthreehome')
+set pythonthreehome=
+set pythonthreehome=xxx
+setlocal pythonthreehome=
+setlocal pythonthreehome=xxx
+setglobal pythonthreehome=
+setglobal pythonthreehome=xxx
+set pythonthreehome=
+set pythonthreehome=xxx
+setlocal pythonthreehome=
+setlocal pythonthreehome=xxx
+setglobal pythonthreehome=
+setglobal pythonthreehome=xxx
+set pythonthreehome&
+set pythonthreehome&
+if exists('l:saved')
+let [&g:pythonthreehome, &l:pythonthreehome] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_quickfixtextfunc()
+if exists('+quickfixtextfunc') && execute('set!') =~# '\n..quickfixtextfunc\([=\n]\|$\)'
+let l:saved = [&g:quickfixtextfunc, &l:quickfixtextfunc]
+endif
+if exists('+quickfixtextfunc')
+set quickfixtextfunc=
+set quickfixtextfunc=xxx
+setlocal quickfixtextfunc=
+setlocal quickfixtextfunc=xxx
+setglobal quickfixtextfunc=
+setglobal quickfixtextfunc=xxx
+set qftf=
+set qftf=xxx
+setlocal qftf=
+setlocal qftf=xxx
+setglobal qftf=
+setglobal qftf=xxx
+set quickfixtextfunc&
+set qftf&
+if exists('l:saved')
+let [&g:quickfixtextfunc, &l:quickfixtextfunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_quoteescape()
+if exists('+quoteescape') && execute('set!') =~# '\n..quoteescape\([=\n]\|$\)'
+let l:saved = [&g:quoteescape, &l:quoteescape]
+endif
+if exists('+quoteescape')
+set quoteescape=
+set quoteescape=xxx
+setlocal quoteescape=
+setlocal quoteescape=xxx
+setglobal quoteescape=
+setglobal quoteescape=xxx
+set qe=
+set qe=xxx
+setlocal qe=
+setlocal qe=xxx
+setglobal qe=
+setglobal qe=xxx
+set quoteescape&
+set qe&
+if exists('l:saved')
+let [&g:quoteescape, &l:quoteescape] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_readonly()
+if exists('+readonly') && execute('set!') =~# '\n..readonly\([=\n]\|$\)'
+let l:saved = [&g:readonly, &l:readonly]
+endif
+if exists('+readonly')
+set readonly
+set noreadonly
+set invreadonly
+set readonly!
+setlocal readonly
+setlocal noreadonly
+setlocal invreadonly
+setlocal readonly!
+setglobal readonly
+setglobal noreadonly
+setglobal invreadonly
+setglobal readonly!
+set ro
+set noro
+set invro
+set ro!
+setlocal ro
+setlocal noro
+setlocal invro
+setlocal ro!
+setglobal ro
+setglobal noro
+setglobal invro
+setglobal ro!
+set readonly&
+set ro&
+if exists('l:saved')
+let [&g:readonly, &l:readonly] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_redraw()
+if exists('+redraw') && execute('set!') =~# '\n..redraw\([=\n]\|$\)'
+let l:saved = [&g:redraw, &l:redraw]
+endif
+if exists('+redraw')
+set redraw
+set noredraw
+set invredraw
+set redraw!
+setlocal redraw
+setlocal noredraw
+setlocal invredraw
+setlocal redraw!
+setglobal redraw
+setglobal noredraw
+setglobal invredraw
+setglobal redraw!
+set redraw
+set noredraw
+set invredraw
+set redraw!
+setlocal redraw
+setlocal noredraw
+setlocal invredraw
+setlocal redraw!
+setglobal redraw
+setglobal noredraw
+setglobal invredraw
+setglobal redraw!
+set redraw&
+set redraw&
+if exists('l:saved')
+let [&g:redraw, &l:redraw] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_redrawtime()
+if exists('+redrawtime') && execute('set!') =~# '\n..redrawtime\([=\n]\|$\)'
+let l:saved = [&g:redrawtime, &l:redrawtime]
+endif
+if exists('+redrawtime')
+set redrawtime=-1
+set redrawtime=0
+set redrawtime=100
+setlocal redrawtime=-1
+setlocal redrawtime=0
+setlocal redrawtime=100
+setglobal redrawtime=-1
+setglobal redrawtime=0
+setglobal redrawtime=100
+set rdt=-1
+set rdt=0
+set rdt=100
+setlocal rdt=-1
+setlocal rdt=0
+setlocal rdt=100
+setglobal rdt=-1
+setglobal rdt=0
+setglobal rdt=100
+silent! call assert_fails('set redrawtime=')
+silent! call assert_fails('setlocal redrawtime=')
+silent! call assert_fails('setglobal redrawtime=')
+silent! call assert_fails('set rdt=')
+silent! call assert_fails('setlocal rdt=')
+silent! call assert_fails('setglobal rdt=')
+set redrawtime&
+set rdt&
+if exists('l:saved')
+let [&g:redrawtime, &l:redrawtime] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_regexpengine()
+if exists('+regexpengine') && execute('set!') =~# '\n..regexpengine\([=\n]\|$\)'
+let l:saved = [&g:regexpengine, &l:regexpengine]
+endif
+if exists('+regexpengine')
+set regexpengine=0
+set regexpengine=1
+set regexpengine=2
+set regexpengine=3
+setlocal regexpengine=0
+setlocal regexpengine=1
+setlocal regexpengine=2
+setlocal regexpengine=3
+setglobal regexpengine=0
+setglobal regexpengine=1
+setglobal regexpengine=2
+setglobal regexpengine=3
+set re=0
+set re=1
+set re=2
+set re=3
+setlocal re=0
+setlocal re=1
+setlocal re=2
+setlocal re=3
+setglobal re=0
+setglobal re=1
+setglobal re=2
+setglobal re=3
+silent! call assert_fails('set regexpengine=-1')
+silent! call assert_fails('set regexpengine=4')
+silent! call assert_fails('set regexpengine=999')
+silent! call assert_fails('setlocal regexpengine=-1')
+silent! call assert_fails('setlocal regexpengine=4')
+silent! call assert_fails('setlocal regexpengine=999')
+silent! call assert_fails('setglobal regexpengine=-1')
+silent! call assert_fails('setglobal regexpengine=4')
+silent! call assert_fails('setglobal regexpengine=999')
+silent! call assert_fails('set re=-1')
+silent! call assert_fails('set re=4')
+silent! call assert_fails('set re=999')
+silent! call assert_fails('setlocal re=-1')
+silent! call assert_fails('setlocal re=4')
+silent! call assert_fails('setlocal re=999')
+silent! call assert_fails('setglobal re=-1')
+silent! call assert_fails('setglobal re=4')
+silent! call assert_fails('setglobal re=999')
+set regexpengine&
+set re&
+if exists('l:saved')
+let [&g:regexpengine, &l:regexpengine] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_relativenumber()
+if exists('+relativenumber') && execute('set!') =~# '\n..relativenumber\([=\n]\|$\)'
+let l:saved = [&g:relativenumber, &l:relativenumber]
+endif
+if exists('+relativenumber')
+set relativenumber
+set norelativenumber
+set invrelativenumber
+set relativenumber!
+setlocal relativenumber
+setlocal norelativenumber
+setlocal invrelativenumber
+setlocal relativenumber!
+setglobal relativenumber
+setglobal norelativenumber
+setglobal invrelativenumber
+setglobal relativenumber!
+set rnu
+set nornu
+set invrnu
+set rnu!
+setlocal rnu
+setlocal nornu
+setlocal invrnu
+setlocal rnu!
+setglobal rnu
+setglobal nornu
+setglobal invrnu
+setglobal rnu!
+set relativenumber&
+set rnu&
+if exists('l:saved')
+let [&g:relativenumber, &l:relativenumber] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_remap()
+if exists('+remap') && execute('set!') =~# '\n..remap\([=\n]\|$\)'
+let l:saved = [&g:remap, &l:remap]
+endif
+if exists('+remap')
+set remap
+set noremap
+set invremap
+set remap!
+setlocal remap
+setlocal noremap
+setlocal invremap
+setlocal remap!
+setglobal remap
+setglobal noremap
+setglobal invremap
+setglobal remap!
+set remap
+set noremap
+set invremap
+set remap!
+setlocal remap
+setlocal noremap
+setlocal invremap
+setlocal remap!
+setglobal remap
+setglobal noremap
+setglobal invremap
+setglobal remap!
+set remap&
+set remap&
+if exists('l:saved')
+let [&g:remap, &l:remap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_renderoptions()
+if exists('+renderoptions') && execute('set!') =~# '\n..renderoptions\([=\n]\|$\)'
+let l:saved = [&g:renderoptions, &l:renderoptions]
+endif
+if exists('+renderoptions')
+set renderoptions=
+setlocal renderoptions=
+setglobal renderoptions=
+set rop=
+setlocal rop=
+setglobal rop=
+silent! call assert_fails('set renderoptions=xxx')
+silent! call assert_fails('setlocal renderoptions=xxx')
+silent! call assert_fails('setglobal renderoptions=xxx')
+silent! call assert_fails('set rop=xxx')
+silent! call assert_fails('setlocal rop=xxx')
+silent! call assert_fails('setglobal rop=xxx')
+set renderoptions&
+set rop&
+if exists('l:saved')
+let [&g:renderoptions, &l:renderoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_report()
+if exists('+report') && execute('set!') =~# '\n..report\([=\n]\|$\)'
+let l:saved = [&g:report, &l:report]
+endif
+if exists('+report')
+set report=0
+set report=1
+set report=2
+set report=9999
+setlocal report=0
+setlocal report=1
+setlocal report=2
+setlocal report=9999
+setglobal report=0
+setglobal report=1
+setglobal report=2
+setglobal report=9999
+set report=0
+set report=1
+set report=2
+set report=9999
+setlocal report=0
+setlocal report=1
+setlocal report=2
+setlocal report=9999
+setglobal report=0
+setglobal report=1
+setglobal report=2
+setglobal report=9999
+silent! call assert_fails('set report=-1')
+silent! call assert_fails('setlocal report=-1')
+silent! call assert_fails('setglobal report=-1')
+silent! call assert_fails('set report=-1')
+silent! call assert_fails('setlocal report=-1')
+silent! call assert_fails('setglobal report=-1')
+set report&
+set report&
+if exists('l:saved')
+let [&g:report, &l:report] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_restorescreen()
+if exists('+restorescreen') && execute('set!') =~# '\n..restorescreen\([=\n]\|$\)'
+let l:saved = [&g:restorescreen, &l:restorescreen]
+endif
+if exists('+restorescreen')
+set restorescreen
+set norestorescreen
+set invrestorescreen
+set restorescreen!
+setlocal restorescreen
+setlocal norestorescreen
+setlocal invrestorescreen
+setlocal restorescreen!
+setglobal restorescreen
+setglobal norestorescreen
+setglobal invrestorescreen
+setglobal restorescreen!
+set rs
+set nors
+set invrs
+set rs!
+setlocal rs
+setlocal nors
+setlocal invrs
+setlocal rs!
+setglobal rs
+setglobal nors
+setglobal invrs
+setglobal rs!
+set restorescreen&
+set rs&
+if exists('l:saved')
+let [&g:restorescreen, &l:restorescreen] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_revins()
+if exists('+revins') && execute('set!') =~# '\n..revins\([=\n]\|$\)'
+let l:saved = [&g:revins, &l:revins]
+endif
+if exists('+revins')
+set revins
+set norevins
+set invrevins
+set revins!
+setlocal revins
+setlocal norevins
+setlocal invrevins
+setlocal revins!
+setglobal revins
+setglobal norevins
+setglobal invrevins
+setglobal revins!
+set ri
+set nori
+set invri
+set ri!
+setlocal ri
+setlocal nori
+setlocal invri
+setlocal ri!
+setglobal ri
+setglobal nori
+setglobal invri
+setglobal ri!
+set revins&
+set ri&
+if exists('l:saved')
+let [&g:revins, &l:revins] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_rightleft()
+if exists('+rightleft') && execute('set!') =~# '\n..rightleft\([=\n]\|$\)'
+let l:saved = [&g:rightleft, &l:rightleft]
+endif
+if exists('+rightleft')
+set rightleft
+set norightleft
+set invrightleft
+set rightleft!
+setlocal rightleft
+setlocal norightleft
+setlocal invrightleft
+setlocal rightleft!
+setglobal rightleft
+setglobal norightleft
+setglobal invrightleft
+setglobal rightleft!
+set rl
+set norl
+set invrl
+set rl!
+setlocal rl
+setlocal norl
+setlocal invrl
+setlocal rl!
+setglobal rl
+setglobal norl
+setglobal invrl
+setglobal rl!
+set rightleft&
+set rl&
+if exists('l:saved')
+let [&g:rightleft, &l:rightleft] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_rightleftcmd()
+if exists('+rightleftcmd') && execute('set!') =~# '\n..rightleftcmd\([=\n]\|$\)'
+let l:saved = [&g:rightleftcmd, &l:rightleftcmd]
+endif
+if exists('+rightleftcmd')
+set rightleftcmd=search
+setlocal rightleftcmd=search
+setglobal rightleftcmd=search
+set rlc=search
+setlocal rlc=search
+setglobal rlc=search
+silent! call assert_fails('set rightleftcmd=xxx')
+silent! call assert_fails('setlocal rightleftcmd=xxx')
+silent! call assert_fails('setglobal rightleftcmd=xxx')
+silent! call assert_fails('set rlc=xxx')
+silent! call assert_fails('setlocal rlc=xxx')
+silent! call assert_fails('setglobal rlc=xxx')
+set rightleftcmd&
+set rlc&
+if exists('l:saved')
+let [&g:rightleftcmd, &l:rightleftcmd] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ruler()
+if exists('+ruler') && execute('set!') =~# '\n..ruler\([=\n]\|$\)'
+let l:saved = [&g:ruler, &l:ruler]
+endif
+if exists('+ruler')
+set ruler
+set noruler
+set invruler
+set ruler!
+setlocal ruler
+setlocal noruler
+setlocal invruler
+setlocal ruler!
+setglobal ruler
+setglobal noruler
+setglobal invruler
+setglobal ruler!
+set ru
+set noru
+set invru
+set ru!
+setlocal ru
+setlocal noru
+setlocal invru
+setlocal ru!
+setglobal ru
+setglobal noru
+setglobal invru
+setglobal ru!
+set ruler&
+set ru&
+if exists('l:saved')
+let [&g:ruler, &l:ruler] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_rulerformat()
+if exists('+rulerformat') && execute('set!') =~# '\n..rulerformat\([=\n]\|$\)'
+let l:saved = [&g:rulerformat, &l:rulerformat]
+endif
+if exists('+rulerformat')
+set rulerformat=
+set rulerformat=xxx
+setlocal rulerformat=
+setlocal rulerformat=xxx
+setglobal rulerformat=
+setglobal rulerformat=xxx
+set ruf=
+set ruf=xxx
+setlocal ruf=
+setlocal ruf=xxx
+setglobal ruf=
+setglobal ruf=xxx
+silent! call assert_fails('set rulerformat=%-')
+silent! call assert_fails('set rulerformat=%(')
+silent! call assert_fails('set rulerformat=%15(%%')
+silent! call assert_fails('setlocal rulerformat=%-')
+silent! call assert_fails('setlocal rulerformat=%(')
+silent! call assert_fails('setlocal rulerformat=%15(%%')
+silent! call assert_fails('setglobal rulerformat=%-')
+silent! call assert_fails('setglobal rulerformat=%(')
+silent! call assert_fails('setglobal rulerformat=%15(%%')
+silent! call assert_fails('set ruf=%-')
+silent! call assert_fails('set ruf=%(')
+silent! call assert_fails('set ruf=%15(%%')
+silent! call assert_fails('setlocal ruf=%-')
+silent! call assert_fails('setlocal ruf=%(')
+silent! call assert_fails('setlocal ruf=%15(%%')
+silent! call assert_fails('setglobal ruf=%-')
+silent! call assert_fails('setglobal ruf=%(')
+silent! call assert_fails('setglobal ruf=%15(%%')
+set rulerformat&
+set ruf&
+if exists('l:saved')
+let [&g:rulerformat, &l:rulerformat] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_runtimepath()
+if exists('+runtimepath') && execute('set!') =~# '\n..runtimepath\([=\n]\|$\)'
+let l:saved = [&g:runtimepath, &l:runtimepath]
+endif
+if exists('+runtimepath')
+set runtimepath=
+set runtimepath=xxx
+setlocal runtimepath=
+setlocal runtimepath=xxx
+setglobal runtimepath=
+setglobal runtimepath=xxx
+set rtp=
+set rtp=xxx
+setlocal rtp=
+setlocal rtp=xxx
+setglobal rtp=
+setglobal rtp=xxx
+set runtimepath&
+set rtp&
+if exists('l:saved')
+let [&g:runtimepath, &l:runtimepath] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_scroll()
+if exists('+scroll') && execute('set!') =~# '\n..scroll\([=\n]\|$\)'
+let l:saved = [&g:scroll, &l:scroll]
+endif
+if exists('+scroll')
+set scroll=0
+set scroll=1
+set scroll=2
+set scroll=15
+setlocal scroll=0
+setlocal scroll=1
+setlocal scroll=2
+setlocal scroll=15
+" Skip local-noglobal: setglobal scroll=0
+" Skip local-noglobal: setglobal scroll=1
+" Skip local-noglobal: setglobal scroll=2
+" Skip local-noglobal: setglobal scroll=15
+set scr=0
+set scr=1
+set scr=2
+set scr=15
+setlocal scr=0
+setlocal scr=1
+setlocal scr=2
+setlocal scr=15
+" Skip local-noglobal: setglobal scr=0
+" Skip local-noglobal: setglobal scr=1
+" Skip local-noglobal: setglobal scr=2
+" Skip local-noglobal: setglobal scr=15
+silent! call assert_fails('set scroll=-1')
+silent! call assert_fails('set scroll=999')
+silent! call assert_fails('setlocal scroll=-1')
+silent! call assert_fails('setlocal scroll=999')
+" Skip local-noglobal: silent! call assert_fails('setglobal scroll=-1')
+" Skip local-noglobal: silent! call assert_fails('setglobal scroll=999')
+silent! call assert_fails('set scr=-1')
+silent! call assert_fails('set scr=999')
+silent! call assert_fails('setlocal scr=-1')
+silent! call assert_fails('setlocal scr=999')
+" Skip local-noglobal: silent! call assert_fails('setglobal scr=-1')
+" Skip local-noglobal: silent! call assert_fails('setglobal scr=999')
+set scroll&
+set scr&
+if exists('l:saved')
+let [&g:scroll, &l:scroll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_scrollbind()
+if exists('+scrollbind') && execute('set!') =~# '\n..scrollbind\([=\n]\|$\)'
+let l:saved = [&g:scrollbind, &l:scrollbind]
+endif
+if exists('+scrollbind')
+set scrollbind
+set noscrollbind
+set invscrollbind
+set scrollbind!
+setlocal scrollbind
+setlocal noscrollbind
+setlocal invscrollbind
+setlocal scrollbind!
+setglobal scrollbind
+setglobal noscrollbind
+setglobal invscrollbind
+setglobal scrollbind!
+set scb
+set noscb
+set invscb
+set scb!
+setlocal scb
+setlocal noscb
+setlocal invscb
+setlocal scb!
+setglobal scb
+setglobal noscb
+setglobal invscb
+setglobal scb!
+set scrollbind&
+set scb&
+if exists('l:saved')
+let [&g:scrollbind, &l:scrollbind] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_scrollfocus()
+if exists('+scrollfocus') && execute('set!') =~# '\n..scrollfocus\([=\n]\|$\)'
+let l:saved = [&g:scrollfocus, &l:scrollfocus]
+endif
+if exists('+scrollfocus')
+set scrollfocus
+set noscrollfocus
+set invscrollfocus
+set scrollfocus!
+setlocal scrollfocus
+setlocal noscrollfocus
+setlocal invscrollfocus
+setlocal scrollfocus!
+setglobal scrollfocus
+setglobal noscrollfocus
+setglobal invscrollfocus
+setglobal scrollfocus!
+set scf
+set noscf
+set invscf
+set scf!
+setlocal scf
+setlocal noscf
+setlocal invscf
+setlocal scf!
+setglobal scf
+setglobal noscf
+setglobal invscf
+setglobal scf!
+set scrollfocus&
+set scf&
+if exists('l:saved')
+let [&g:scrollfocus, &l:scrollfocus] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_scrolljump()
+if exists('+scrolljump') && execute('set!') =~# '\n..scrolljump\([=\n]\|$\)'
+let l:saved = [&g:scrolljump, &l:scrolljump]
+endif
+if exists('+scrolljump')
+set scrolljump=-100
+set scrolljump=-1
+set scrolljump=0
+set scrolljump=1
+set scrolljump=2
+set scrolljump=15
+setlocal scrolljump=-100
+setlocal scrolljump=-1
+setlocal scrolljump=0
+setlocal scrolljump=1
+setlocal scrolljump=2
+setlocal scrolljump=15
+setglobal scrolljump=-100
+setglobal scrolljump=-1
+setglobal scrolljump=0
+setglobal scrolljump=1
+setglobal scrolljump=2
+setglobal scrolljump=15
+set sj=-100
+set sj=-1
+set sj=0
+set sj=1
+set sj=2
+set sj=15
+setlocal sj=-100
+setlocal sj=-1
+setlocal sj=0
+setlocal sj=1
+setlocal sj=2
+setlocal sj=15
+setglobal sj=-100
+setglobal sj=-1
+setglobal sj=0
+setglobal sj=1
+setglobal sj=2
+setglobal sj=15
+silent! call assert_fails('set scrolljump=-101')
+silent! call assert_fails('set scrolljump=999')
+silent! call assert_fails('setlocal scrolljump=-101')
+silent! call assert_fails('setlocal scrolljump=999')
+silent! call assert_fails('setglobal scrolljump=-101')
+silent! call assert_fails('setglobal scrolljump=999')
+silent! call assert_fails('set sj=-101')
+silent! call assert_fails('set sj=999')
+silent! call assert_fails('setlocal sj=-101')
+silent! call assert_fails('setlocal sj=999')
+silent! call assert_fails('setglobal sj=-101')
+silent! call assert_fails('setglobal sj=999')
+set scrolljump&
+set sj&
+if exists('l:saved')
+let [&g:scrolljump, &l:scrolljump] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_scrolloff()
+if exists('+scrolloff') && execute('set!') =~# '\n..scrolloff\([=\n]\|$\)'
+let l:saved = [&g:scrolloff, &l:scrolloff]
+endif
+if exists('+scrolloff')
+set scrolloff=0
+set scrolloff=1
+set scrolloff=8
+set scrolloff=999
+setlocal scrolloff=0
+setlocal scrolloff=1
+setlocal scrolloff=8
+setlocal scrolloff=999
+setglobal scrolloff=0
+setglobal scrolloff=1
+setglobal scrolloff=8
+setglobal scrolloff=999
+setlocal scrolloff=-1
+call assert_equal(&g:scrolloff, &scrolloff)
+set so=0
+set so=1
+set so=8
+set so=999
+setlocal so=0
+setlocal so=1
+setlocal so=8
+setlocal so=999
+setglobal so=0
+setglobal so=1
+setglobal so=8
+setglobal so=999
+setlocal so=-1
+call assert_equal(&g:scrolloff, &scrolloff)
+silent! call assert_fails('set scrolloff=-1')
+" Skip global-local: silent! call assert_fails('setlocal scrolloff=-1')
+silent! call assert_fails('setglobal scrolloff=-1')
+silent! call assert_fails('set so=-1')
+" Skip global-local: silent! call assert_fails('setlocal so=-1')
+silent! call assert_fails('setglobal so=-1')
+set scrolloff&
+set so&
+if exists('l:saved')
+let [&g:scrolloff, &l:scrolloff] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_scrollopt()
+if exists('+scrollopt') && execute('set!') =~# '\n..scrollopt\([=\n]\|$\)'
+let l:saved = [&g:scrollopt, &l:scrollopt]
+endif
+if exists('+scrollopt')
+set scrollopt=
+set scrollopt=ver
+set scrollopt=hor
+set scrollopt=jump
+set scrollopt=ver,hor
+setlocal scrollopt=
+setlocal scrollopt=ver
+setlocal scrollopt=hor
+setlocal scrollopt=jump
+setlocal scrollopt=ver,hor
+setglobal scrollopt=
+setglobal scrollopt=ver
+setglobal scrollopt=hor
+setglobal scrollopt=jump
+setglobal scrollopt=ver,hor
+set sbo=
+set sbo=ver
+set sbo=hor
+set sbo=jump
+set sbo=ver,hor
+setlocal sbo=
+setlocal sbo=ver
+setlocal sbo=hor
+setlocal sbo=jump
+setlocal sbo=ver,hor
+setglobal sbo=
+setglobal sbo=ver
+setglobal sbo=hor
+setglobal sbo=jump
+setglobal sbo=ver,hor
+silent! call assert_fails('set scrollopt=xxx')
+silent! call assert_fails('setlocal scrollopt=xxx')
+silent! call assert_fails('setglobal scrollopt=xxx')
+silent! call assert_fails('set sbo=xxx')
+silent! call assert_fails('setlocal sbo=xxx')
+silent! call assert_fails('setglobal sbo=xxx')
+set scrollopt&
+set sbo&
+if exists('l:saved')
+let [&g:scrollopt, &l:scrollopt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_sections()
+if exists('+sections') && execute('set!') =~# '\n..sections\([=\n]\|$\)'
+let l:saved = [&g:sections, &l:sections]
+endif
+if exists('+sections')
+set sections=
+set sections=xxx
+setlocal sections=
+setlocal sections=xxx
+setglobal sections=
+setglobal sections=xxx
+set sect=
+set sect=xxx
+setlocal sect=
+setlocal sect=xxx
+setglobal sect=
+setglobal sect=xxx
+set sections&
+set sect&
+if exists('l:saved')
+let [&g:sections, &l:sections] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_secure()
+if exists('+secure') && execute('set!') =~# '\n..secure\([=\n]\|$\)'
+let l:saved = [&g:secure, &l:secure]
+endif
+if exists('+secure')
+set secure
+set nosecure
+set invsecure
+set secure!
+setlocal secure
+setlocal nosecure
+setlocal invsecure
+setlocal secure!
+setglobal secure
+setglobal nosecure
+setglobal invsecure
+setglobal secure!
+set secure
+set nosecure
+set invsecure
+set secure!
+setlocal secure
+setlocal nosecure
+setlocal invsecure
+setlocal secure!
+setglobal secure
+setglobal nosecure
+setglobal invsecure
+setglobal secure!
+set secure&
+set secure&
+if exists('l:saved')
+let [&g:secure, &l:secure] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_selection()
+if exists('+selection') && execute('set!') =~# '\n..selection\([=\n]\|$\)'
+let l:saved = [&g:selection, &l:selection]
+endif
+if exists('+selection')
+set selection=old
+set selection=inclusive
+set selection=exclusive
+setlocal selection=old
+setlocal selection=inclusive
+setlocal selection=exclusive
+setglobal selection=old
+setglobal selection=inclusive
+setglobal selection=exclusive
+set sel=old
+set sel=inclusive
+set sel=exclusive
+setlocal sel=old
+setlocal sel=inclusive
+setlocal sel=exclusive
+setglobal sel=old
+setglobal sel=inclusive
+setglobal sel=exclusive
+silent! call assert_fails('set selection=')
+silent! call assert_fails('set selection=xxx')
+silent! call assert_fails('setlocal selection=')
+silent! call assert_fails('setlocal selection=xxx')
+silent! call assert_fails('setglobal selection=')
+silent! call assert_fails('setglobal selection=xxx')
+silent! call assert_fails('set sel=')
+silent! call assert_fails('set sel=xxx')
+silent! call assert_fails('setlocal sel=')
+silent! call assert_fails('setlocal sel=xxx')
+silent! call assert_fails('setglobal sel=')
+silent! call assert_fails('setglobal sel=xxx')
+set selection&
+set sel&
+if exists('l:saved')
+let [&g:selection, &l:selection] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_selectmode()
+if exists('+selectmode') && execute('set!') =~# '\n..selectmode\([=\n]\|$\)'
+let l:saved = [&g:selectmode, &l:selectmode]
+endif
+if exists('+selectmode')
+set selectmode=
+set selectmode=mouse
+set selectmode=key
+set selectmode=cmd
+set selectmode=key,cmd
+setlocal selectmode=
+setlocal selectmode=mouse
+setlocal selectmode=key
+setlocal selectmode=cmd
+setlocal selectmode=key,cmd
+setglobal selectmode=
+setglobal selectmode=mouse
+setglobal selectmode=key
+setglobal selectmode=cmd
+setglobal selectmode=key,cmd
+set slm=
+set slm=mouse
+set slm=key
+set slm=cmd
+set slm=key,cmd
+setlocal slm=
+setlocal slm=mouse
+setlocal slm=key
+setlocal slm=cmd
+setlocal slm=key,cmd
+setglobal slm=
+setglobal slm=mouse
+setglobal slm=key
+setglobal slm=cmd
+setglobal slm=key,cmd
+silent! call assert_fails('set selectmode=xxx')
+silent! call assert_fails('setlocal selectmode=xxx')
+silent! call assert_fails('setglobal selectmode=xxx')
+silent! call assert_fails('set slm=xxx')
+silent! call assert_fails('setlocal slm=xxx')
+silent! call assert_fails('setglobal slm=xxx')
+set selectmode&
+set slm&
+if exists('l:saved')
+let [&g:selectmode, &l:selectmode] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_sessionoptions()
+if exists('+sessionoptions') && execute('set!') =~# '\n..sessionoptions\([=\n]\|$\)'
+let l:saved = [&g:sessionoptions, &l:sessionoptions]
+endif
+if exists('+sessionoptions')
+set sessionoptions=
+set sessionoptions=blank
+set sessionoptions=curdir
+set sessionoptions=sesdir
+set sessionoptions=help,options,slash
+setlocal sessionoptions=
+setlocal sessionoptions=blank
+setlocal sessionoptions=curdir
+setlocal sessionoptions=sesdir
+setlocal sessionoptions=help,options,slash
+setglobal sessionoptions=
+setglobal sessionoptions=blank
+setglobal sessionoptions=curdir
+setglobal sessionoptions=sesdir
+setglobal sessionoptions=help,options,slash
+set ssop=
+set ssop=blank
+set ssop=curdir
+set ssop=sesdir
+set ssop=help,options,slash
+setlocal ssop=
+setlocal ssop=blank
+setlocal ssop=curdir
+setlocal ssop=sesdir
+setlocal ssop=help,options,slash
+setglobal ssop=
+setglobal ssop=blank
+setglobal ssop=curdir
+setglobal ssop=sesdir
+setglobal ssop=help,options,slash
+silent! call assert_fails('set sessionoptions=xxx')
+silent! call assert_fails('set sessionoptions=curdir,sesdir')
+silent! call assert_fails('setlocal sessionoptions=xxx')
+silent! call assert_fails('setlocal sessionoptions=curdir,sesdir')
+silent! call assert_fails('setglobal sessionoptions=xxx')
+silent! call assert_fails('setglobal sessionoptions=curdir,sesdir')
+silent! call assert_fails('set ssop=xxx')
+silent! call assert_fails('set ssop=curdir,sesdir')
+silent! call assert_fails('setlocal ssop=xxx')
+silent! call assert_fails('setlocal ssop=curdir,sesdir')
+silent! call assert_fails('setglobal ssop=xxx')
+silent! call assert_fails('setglobal ssop=curdir,sesdir')
+set sessionoptions&
+set ssop&
+if exists('l:saved')
+let [&g:sessionoptions, &l:sessionoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shell()
+if exists('+shell') && execute('set!') =~# '\n..shell\([=\n]\|$\)'
+let l:saved = [&g:shell, &l:shell]
+endif
+if exists('+shell')
+set shell=
+set shell=xxx
+setlocal shell=
+setlocal shell=xxx
+setglobal shell=
+setglobal shell=xxx
+set sh=
+set sh=xxx
+setlocal sh=
+setlocal sh=xxx
+setglobal sh=
+setglobal sh=xxx
+set shell&
+set sh&
+if exists('l:saved')
+let [&g:shell, &l:shell] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shellcmdflag()
+if exists('+shellcmdflag') && execute('set!') =~# '\n..shellcmdflag\([=\n]\|$\)'
+let l:saved = [&g:shellcmdflag, &l:shellcmdflag]
+endif
+if exists('+shellcmdflag')
+set shellcmdflag=
+set shellcmdflag=xxx
+setlocal shellcmdflag=
+setlocal shellcmdflag=xxx
+setglobal shellcmdflag=
+setglobal shellcmdflag=xxx
+set shcf=
+set shcf=xxx
+setlocal shcf=
+setlocal shcf=xxx
+setglobal shcf=
+setglobal shcf=xxx
+set shellcmdflag&
+set shcf&
+if exists('l:saved')
+let [&g:shellcmdflag, &l:shellcmdflag] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shellpipe()
+if exists('+shellpipe') && execute('set!') =~# '\n..shellpipe\([=\n]\|$\)'
+let l:saved = [&g:shellpipe, &l:shellpipe]
+endif
+if exists('+shellpipe')
+set shellpipe=
+set shellpipe=xxx
+setlocal shellpipe=
+setlocal shellpipe=xxx
+setglobal shellpipe=
+setglobal shellpipe=xxx
+set sp=
+set sp=xxx
+setlocal sp=
+setlocal sp=xxx
+setglobal sp=
+setglobal sp=xxx
+set shellpipe&
+set sp&
+if exists('l:saved')
+let [&g:shellpipe, &l:shellpipe] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shellquote()
+if exists('+shellquote') && execute('set!') =~# '\n..shellquote\([=\n]\|$\)'
+let l:saved = [&g:shellquote, &l:shellquote]
+endif
+if exists('+shellquote')
+set shellquote=
+set shellquote=xxx
+setlocal shellquote=
+setlocal shellquote=xxx
+setglobal shellquote=
+setglobal shellquote=xxx
+set shq=
+set shq=xxx
+setlocal shq=
+setlocal shq=xxx
+setglobal shq=
+setglobal shq=xxx
+set shellquote&
+set shq&
+if exists('l:saved')
+let [&g:shellquote, &l:shellquote] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shellredir()
+if exists('+shellredir') && execute('set!') =~# '\n..shellredir\([=\n]\|$\)'
+let l:saved = [&g:shellredir, &l:shellredir]
+endif
+if exists('+shellredir')
+set shellredir=
+set shellredir=xxx
+setlocal shellredir=
+setlocal shellredir=xxx
+setglobal shellredir=
+setglobal shellredir=xxx
+set srr=
+set srr=xxx
+setlocal srr=
+setlocal srr=xxx
+setglobal srr=
+setglobal srr=xxx
+set shellredir&
+set srr&
+if exists('l:saved')
+let [&g:shellredir, &l:shellredir] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shellslash()
+if exists('+shellslash') && execute('set!') =~# '\n..shellslash\([=\n]\|$\)'
+let l:saved = [&g:shellslash, &l:shellslash]
+endif
+if exists('+shellslash')
+set shellslash
+set noshellslash
+set invshellslash
+set shellslash!
+setlocal shellslash
+setlocal noshellslash
+setlocal invshellslash
+setlocal shellslash!
+setglobal shellslash
+setglobal noshellslash
+setglobal invshellslash
+setglobal shellslash!
+set ssl
+set nossl
+set invssl
+set ssl!
+setlocal ssl
+setlocal nossl
+setlocal invssl
+setlocal ssl!
+setglobal ssl
+setglobal nossl
+setglobal invssl
+setglobal ssl!
+set shellslash&
+set ssl&
+if exists('l:saved')
+let [&g:shellslash, &l:shellslash] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shelltemp()
+if exists('+shelltemp') && execute('set!') =~# '\n..shelltemp\([=\n]\|$\)'
+let l:saved = [&g:shelltemp, &l:shelltemp]
+endif
+if exists('+shelltemp')
+set shelltemp
+set noshelltemp
+set invshelltemp
+set shelltemp!
+setlocal shelltemp
+setlocal noshelltemp
+setlocal invshelltemp
+setlocal shelltemp!
+setglobal shelltemp
+setglobal noshelltemp
+setglobal invshelltemp
+setglobal shelltemp!
+set stmp
+set nostmp
+set invstmp
+set stmp!
+setlocal stmp
+setlocal nostmp
+setlocal invstmp
+setlocal stmp!
+setglobal stmp
+setglobal nostmp
+setglobal invstmp
+setglobal stmp!
+set shelltemp&
+set stmp&
+if exists('l:saved')
+let [&g:shelltemp, &l:shelltemp] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shelltype()
+if exists('+shelltype') && execute('set!') =~# '\n..shelltype\([=\n]\|$\)'
+let l:saved = [&g:shelltype, &l:shelltype]
+endif
+if exists('+shelltype')
+set shelltype=-1
+set shelltype=0
+set shelltype=100
+setlocal shelltype=-1
+setlocal shelltype=0
+setlocal shelltype=100
+setglobal shelltype=-1
+setglobal shelltype=0
+setglobal shelltype=100
+set st=-1
+set st=0
+set st=100
+setlocal st=-1
+setlocal st=0
+setlocal st=100
+setglobal st=-1
+setglobal st=0
+setglobal st=100
+silent! call assert_fails('set shelltype=')
+silent! call assert_fails('setlocal shelltype=')
+silent! call assert_fails('setglobal shelltype=')
+silent! call assert_fails('set st=')
+silent! call assert_fails('setlocal st=')
+silent! call assert_fails('setglobal st=')
+set shelltype&
+set st&
+if exists('l:saved')
+let [&g:shelltype, &l:shelltype] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shellxescape()
+if exists('+shellxescape') && execute('set!') =~# '\n..shellxescape\([=\n]\|$\)'
+let l:saved = [&g:shellxescape, &l:shellxescape]
+endif
+if exists('+shellxescape')
+set shellxescape=
+set shellxescape=xxx
+setlocal shellxescape=
+setlocal shellxescape=xxx
+setglobal shellxescape=
+setglobal shellxescape=xxx
+set sxe=
+set sxe=xxx
+setlocal sxe=
+setlocal sxe=xxx
+setglobal sxe=
+setglobal sxe=xxx
+set shellxescape&
+set sxe&
+if exists('l:saved')
+let [&g:shellxescape, &l:shellxescape] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shellxquote()
+if exists('+shellxquote') && execute('set!') =~# '\n..shellxquote\([=\n]\|$\)'
+let l:saved = [&g:shellxquote, &l:shellxquote]
+endif
+if exists('+shellxquote')
+set shellxquote=
+set shellxquote=xxx
+setlocal shellxquote=
+setlocal shellxquote=xxx
+setglobal shellxquote=
+setglobal shellxquote=xxx
+set sxq=
+set sxq=xxx
+setlocal sxq=
+setlocal sxq=xxx
+setglobal sxq=
+setglobal sxq=xxx
+set shellxquote&
+set sxq&
+if exists('l:saved')
+let [&g:shellxquote, &l:shellxquote] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shiftround()
+if exists('+shiftround') && execute('set!') =~# '\n..shiftround\([=\n]\|$\)'
+let l:saved = [&g:shiftround, &l:shiftround]
+endif
+if exists('+shiftround')
+set shiftround
+set noshiftround
+set invshiftround
+set shiftround!
+setlocal shiftround
+setlocal noshiftround
+setlocal invshiftround
+setlocal shiftround!
+setglobal shiftround
+setglobal noshiftround
+setglobal invshiftround
+setglobal shiftround!
+set sr
+set nosr
+set invsr
+set sr!
+setlocal sr
+setlocal nosr
+setlocal invsr
+setlocal sr!
+setglobal sr
+setglobal nosr
+setglobal invsr
+setglobal sr!
+set shiftround&
+set sr&
+if exists('l:saved')
+let [&g:shiftround, &l:shiftround] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shiftwidth()
+if exists('+shiftwidth') && execute('set!') =~# '\n..shiftwidth\([=\n]\|$\)'
+let l:saved = [&g:shiftwidth, &l:shiftwidth]
+endif
+if exists('+shiftwidth')
+set shiftwidth=0
+set shiftwidth=1
+set shiftwidth=8
+set shiftwidth=999
+setlocal shiftwidth=0
+setlocal shiftwidth=1
+setlocal shiftwidth=8
+setlocal shiftwidth=999
+setglobal shiftwidth=0
+setglobal shiftwidth=1
+setglobal shiftwidth=8
+setglobal shiftwidth=999
+set sw=0
+set sw=1
+set sw=8
+set sw=999
+setlocal sw=0
+setlocal sw=1
+setlocal sw=8
+setlocal sw=999
+setglobal sw=0
+setglobal sw=1
+setglobal sw=8
+setglobal sw=999
+silent! call assert_fails('set shiftwidth=-1')
+silent! call assert_fails('setlocal shiftwidth=-1')
+silent! call assert_fails('setglobal shiftwidth=-1')
+silent! call assert_fails('set sw=-1')
+silent! call assert_fails('setlocal sw=-1')
+silent! call assert_fails('setglobal sw=-1')
+set shiftwidth&
+set sw&
+if exists('l:saved')
+let [&g:shiftwidth, &l:shiftwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shortmess()
+if exists('+shortmess') && execute('set!') =~# '\n..shortmess\([=\n]\|$\)'
+let l:saved = [&g:shortmess, &l:shortmess]
+endif
+if exists('+shortmess')
+set shortmess=
+set shortmess=xxx
+setlocal shortmess=
+setlocal shortmess=xxx
+setglobal shortmess=
+setglobal shortmess=xxx
+set shm=
+set shm=xxx
+setlocal shm=
+setlocal shm=xxx
+setglobal shm=
+setglobal shm=xxx
+set shortmess&
+set shm&
+if exists('l:saved')
+let [&g:shortmess, &l:shortmess] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_shortname()
+if exists('+shortname') && execute('set!') =~# '\n..shortname\([=\n]\|$\)'
+let l:saved = [&g:shortname, &l:shortname]
+endif
+if exists('+shortname')
+set shortname
+set noshortname
+set invshortname
+set shortname!
+setlocal shortname
+setlocal noshortname
+setlocal invshortname
+setlocal shortname!
+setglobal shortname
+setglobal noshortname
+setglobal invshortname
+setglobal shortname!
+set sn
+set nosn
+set invsn
+set sn!
+setlocal sn
+setlocal nosn
+setlocal invsn
+setlocal sn!
+setglobal sn
+setglobal nosn
+setglobal invsn
+setglobal sn!
+set shortname&
+set sn&
+if exists('l:saved')
+let [&g:shortname, &l:shortname] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showbreak()
+if exists('+showbreak') && execute('set!') =~# '\n..showbreak\([=\n]\|$\)'
+let l:saved = [&g:showbreak, &l:showbreak]
+endif
+if exists('+showbreak')
+set showbreak=
+set showbreak=xxx
+setlocal showbreak=
+setlocal showbreak=xxx
+setglobal showbreak=
+setglobal showbreak=xxx
+setlocal showbreak=
+call assert_equal(&g:showbreak, &showbreak)
+set sbr=
+set sbr=xxx
+setlocal sbr=
+setlocal sbr=xxx
+setglobal sbr=
+setglobal sbr=xxx
+setlocal sbr=
+call assert_equal(&g:showbreak, &showbreak)
+set showbreak&
+set sbr&
+if exists('l:saved')
+let [&g:showbreak, &l:showbreak] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showcmd()
+if exists('+showcmd') && execute('set!') =~# '\n..showcmd\([=\n]\|$\)'
+let l:saved = [&g:showcmd, &l:showcmd]
+endif
+if exists('+showcmd')
+set showcmd
+set noshowcmd
+set invshowcmd
+set showcmd!
+setlocal showcmd
+setlocal noshowcmd
+setlocal invshowcmd
+setlocal showcmd!
+setglobal showcmd
+setglobal noshowcmd
+setglobal invshowcmd
+setglobal showcmd!
+set sc
+set nosc
+set invsc
+set sc!
+setlocal sc
+setlocal nosc
+setlocal invsc
+setlocal sc!
+setglobal sc
+setglobal nosc
+setglobal invsc
+setglobal sc!
+set showcmd&
+set sc&
+if exists('l:saved')
+let [&g:showcmd, &l:showcmd] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showcmdloc()
+if exists('+showcmdloc') && execute('set!') =~# '\n..showcmdloc\([=\n]\|$\)'
+let l:saved = [&g:showcmdloc, &l:showcmdloc]
+endif
+if exists('+showcmdloc')
+set showcmdloc=
+set showcmdloc=last
+set showcmdloc=statusline
+set showcmdloc=tabline
+setlocal showcmdloc=
+setlocal showcmdloc=last
+setlocal showcmdloc=statusline
+setlocal showcmdloc=tabline
+setglobal showcmdloc=
+setglobal showcmdloc=last
+setglobal showcmdloc=statusline
+setglobal showcmdloc=tabline
+set sloc=
+set sloc=last
+set sloc=statusline
+set sloc=tabline
+setlocal sloc=
+setlocal sloc=last
+setlocal sloc=statusline
+setlocal sloc=tabline
+setglobal sloc=
+setglobal sloc=last
+setglobal sloc=statusline
+setglobal sloc=tabline
+silent! call assert_fails('set showcmdloc=xxx')
+silent! call assert_fails('setlocal showcmdloc=xxx')
+silent! call assert_fails('setglobal showcmdloc=xxx')
+silent! call assert_fails('set sloc=xxx')
+silent! call assert_fails('setlocal sloc=xxx')
+silent! call assert_fails('setglobal sloc=xxx')
+set showcmdloc&
+set sloc&
+if exists('l:saved')
+let [&g:showcmdloc, &l:showcmdloc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showfulltag()
+if exists('+showfulltag') && execute('set!') =~# '\n..showfulltag\([=\n]\|$\)'
+let l:saved = [&g:showfulltag, &l:showfulltag]
+endif
+if exists('+showfulltag')
+set showfulltag
+set noshowfulltag
+set invshowfulltag
+set showfulltag!
+setlocal showfulltag
+setlocal noshowfulltag
+setlocal invshowfulltag
+setlocal showfulltag!
+setglobal showfulltag
+setglobal noshowfulltag
+setglobal invshowfulltag
+setglobal showfulltag!
+set sft
+set nosft
+set invsft
+set sft!
+setlocal sft
+setlocal nosft
+setlocal invsft
+setlocal sft!
+setglobal sft
+setglobal nosft
+setglobal invsft
+setglobal sft!
+set showfulltag&
+set sft&
+if exists('l:saved')
+let [&g:showfulltag, &l:showfulltag] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showmatch()
+if exists('+showmatch') && execute('set!') =~# '\n..showmatch\([=\n]\|$\)'
+let l:saved = [&g:showmatch, &l:showmatch]
+endif
+if exists('+showmatch')
+set showmatch
+set noshowmatch
+set invshowmatch
+set showmatch!
+setlocal showmatch
+setlocal noshowmatch
+setlocal invshowmatch
+setlocal showmatch!
+setglobal showmatch
+setglobal noshowmatch
+setglobal invshowmatch
+setglobal showmatch!
+set sm
+set nosm
+set invsm
+set sm!
+setlocal sm
+setlocal nosm
+setlocal invsm
+setlocal sm!
+setglobal sm
+setglobal nosm
+setglobal invsm
+setglobal sm!
+set showmatch&
+set sm&
+if exists('l:saved')
+let [&g:showmatch, &l:showmatch] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showmode()
+if exists('+showmode') && execute('set!') =~# '\n..showmode\([=\n]\|$\)'
+let l:saved = [&g:showmode, &l:showmode]
+endif
+if exists('+showmode')
+set showmode
+set noshowmode
+set invshowmode
+set showmode!
+setlocal showmode
+setlocal noshowmode
+setlocal invshowmode
+setlocal showmode!
+setglobal showmode
+setglobal noshowmode
+setglobal invshowmode
+setglobal showmode!
+set smd
+set nosmd
+set invsmd
+set smd!
+setlocal smd
+setlocal nosmd
+setlocal invsmd
+setlocal smd!
+setglobal smd
+setglobal nosmd
+setglobal invsmd
+setglobal smd!
+set showmode&
+set smd&
+if exists('l:saved')
+let [&g:showmode, &l:showmode] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showtabline()
+if exists('+showtabline') && execute('set!') =~# '\n..showtabline\([=\n]\|$\)'
+let l:saved = [&g:showtabline, &l:showtabline]
+endif
+if exists('+showtabline')
+set showtabline=-1
+set showtabline=0
+set showtabline=100
+setlocal showtabline=-1
+setlocal showtabline=0
+setlocal showtabline=100
+setglobal showtabline=-1
+setglobal showtabline=0
+setglobal showtabline=100
+set stal=-1
+set stal=0
+set stal=100
+setlocal stal=-1
+setlocal stal=0
+setlocal stal=100
+setglobal stal=-1
+setglobal stal=0
+setglobal stal=100
+silent! call assert_fails('set showtabline=')
+silent! call assert_fails('setlocal showtabline=')
+silent! call assert_fails('setglobal showtabline=')
+silent! call assert_fails('set stal=')
+silent! call assert_fails('setlocal stal=')
+silent! call assert_fails('setglobal stal=')
+set showtabline&
+set stal&
+if exists('l:saved')
+let [&g:showtabline, &l:showtabline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_showtabpanel()
+if exists('+showtabpanel') && execute('set!') =~# '\n..showtabpanel\([=\n]\|$\)'
+let l:saved = [&g:showtabpanel, &l:showtabpanel]
+endif
+if exists('+showtabpanel')
+set showtabpanel=0
+set showtabpanel=1
+set showtabpanel=2
+setlocal showtabpanel=0
+setlocal showtabpanel=1
+setlocal showtabpanel=2
+setglobal showtabpanel=0
+setglobal showtabpanel=1
+setglobal showtabpanel=2
+set stpl=0
+set stpl=1
+set stpl=2
+setlocal stpl=0
+setlocal stpl=1
+setlocal stpl=2
+setglobal stpl=0
+setglobal stpl=1
+setglobal stpl=2
+set showtabpanel&
+set stpl&
+if exists('l:saved')
+let [&g:showtabpanel, &l:showtabpanel] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_sidescroll()
+if exists('+sidescroll') && execute('set!') =~# '\n..sidescroll\([=\n]\|$\)'
+let l:saved = [&g:sidescroll, &l:sidescroll]
+endif
+if exists('+sidescroll')
+set sidescroll=0
+set sidescroll=1
+set sidescroll=8
+set sidescroll=999
+setlocal sidescroll=0
+setlocal sidescroll=1
+setlocal sidescroll=8
+setlocal sidescroll=999
+setglobal sidescroll=0
+setglobal sidescroll=1
+setglobal sidescroll=8
+setglobal sidescroll=999
+set ss=0
+set ss=1
+set ss=8
+set ss=999
+setlocal ss=0
+setlocal ss=1
+setlocal ss=8
+setlocal ss=999
+setglobal ss=0
+setglobal ss=1
+setglobal ss=8
+setglobal ss=999
+silent! call assert_fails('set sidescroll=-1')
+silent! call assert_fails('setlocal sidescroll=-1')
+silent! call assert_fails('setglobal sidescroll=-1')
+silent! call assert_fails('set ss=-1')
+silent! call assert_fails('setlocal ss=-1')
+silent! call assert_fails('setglobal ss=-1')
+set sidescroll&
+set ss&
+if exists('l:saved')
+let [&g:sidescroll, &l:sidescroll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_sidescrolloff()
+if exists('+sidescrolloff') && execute('set!') =~# '\n..sidescrolloff\([=\n]\|$\)'
+let l:saved = [&g:sidescrolloff, &l:sidescrolloff]
+endif
+if exists('+sidescrolloff')
+set sidescrolloff=0
+set sidescrolloff=1
+set sidescrolloff=8
+set sidescrolloff=999
+setlocal sidescrolloff=0
+setlocal sidescrolloff=1
+setlocal sidescrolloff=8
+setlocal sidescrolloff=999
+setglobal sidescrolloff=0
+setglobal sidescrolloff=1
+setglobal sidescrolloff=8
+setglobal sidescrolloff=999
+setlocal sidescrolloff=-1
+call assert_equal(&g:sidescrolloff, &sidescrolloff)
+set siso=0
+set siso=1
+set siso=8
+set siso=999
+setlocal siso=0
+setlocal siso=1
+setlocal siso=8
+setlocal siso=999
+setglobal siso=0
+setglobal siso=1
+setglobal siso=8
+setglobal siso=999
+setlocal siso=-1
+call assert_equal(&g:sidescrolloff, &sidescrolloff)
+silent! call assert_fails('set sidescrolloff=-1')
+" Skip global-local: silent! call assert_fails('setlocal sidescrolloff=-1')
+silent! call assert_fails('setglobal sidescrolloff=-1')
+silent! call assert_fails('set siso=-1')
+" Skip global-local: silent! call assert_fails('setlocal siso=-1')
+silent! call assert_fails('setglobal siso=-1')
+set sidescrolloff&
+set siso&
+if exists('l:saved')
+let [&g:sidescrolloff, &l:sidescrolloff] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_signcolumn()
+if exists('+signcolumn') && execute('set!') =~# '\n..signcolumn\([=\n]\|$\)'
+let l:saved = [&g:signcolumn, &l:signcolumn]
+endif
+if exists('+signcolumn')
+set signcolumn=
+set signcolumn=auto
+set signcolumn=no
+set signcolumn=yes
+set signcolumn=number
+setlocal signcolumn=
+setlocal signcolumn=auto
+setlocal signcolumn=no
+setlocal signcolumn=yes
+setlocal signcolumn=number
+setglobal signcolumn=
+setglobal signcolumn=auto
+setglobal signcolumn=no
+setglobal signcolumn=yes
+setglobal signcolumn=number
+set scl=
+set scl=auto
+set scl=no
+set scl=yes
+set scl=number
+setlocal scl=
+setlocal scl=auto
+setlocal scl=no
+setlocal scl=yes
+setlocal scl=number
+setglobal scl=
+setglobal scl=auto
+setglobal scl=no
+setglobal scl=yes
+setglobal scl=number
+silent! call assert_fails('set signcolumn=xxx')
+silent! call assert_fails('set signcolumn=no,yes')
+silent! call assert_fails('setlocal signcolumn=xxx')
+silent! call assert_fails('setlocal signcolumn=no,yes')
+silent! call assert_fails('setglobal signcolumn=xxx')
+silent! call assert_fails('setglobal signcolumn=no,yes')
+silent! call assert_fails('set scl=xxx')
+silent! call assert_fails('set scl=no,yes')
+silent! call assert_fails('setlocal scl=xxx')
+silent! call assert_fails('setlocal scl=no,yes')
+silent! call assert_fails('setglobal scl=xxx')
+silent! call assert_fails('setglobal scl=no,yes')
+set signcolumn&
+set scl&
+if exists('l:saved')
+let [&g:signcolumn, &l:signcolumn] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_slowopen()
+if exists('+slowopen') && execute('set!') =~# '\n..slowopen\([=\n]\|$\)'
+let l:saved = [&g:slowopen, &l:slowopen]
+endif
+if exists('+slowopen')
+set slowopen
+set noslowopen
+set invslowopen
+set slowopen!
+setlocal slowopen
+setlocal noslowopen
+setlocal invslowopen
+setlocal slowopen!
+setglobal slowopen
+setglobal noslowopen
+setglobal invslowopen
+setglobal slowopen!
+set slow
+set noslow
+set invslow
+set slow!
+setlocal slow
+setlocal noslow
+setlocal invslow
+setlocal slow!
+setglobal slow
+setglobal noslow
+setglobal invslow
+setglobal slow!
+set slowopen&
+set slow&
+if exists('l:saved')
+let [&g:slowopen, &l:slowopen] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_smartcase()
+if exists('+smartcase') && execute('set!') =~# '\n..smartcase\([=\n]\|$\)'
+let l:saved = [&g:smartcase, &l:smartcase]
+endif
+if exists('+smartcase')
+set smartcase
+set nosmartcase
+set invsmartcase
+set smartcase!
+setlocal smartcase
+setlocal nosmartcase
+setlocal invsmartcase
+setlocal smartcase!
+setglobal smartcase
+setglobal nosmartcase
+setglobal invsmartcase
+setglobal smartcase!
+set scs
+set noscs
+set invscs
+set scs!
+setlocal scs
+setlocal noscs
+setlocal invscs
+setlocal scs!
+setglobal scs
+setglobal noscs
+setglobal invscs
+setglobal scs!
+set smartcase&
+set scs&
+if exists('l:saved')
+let [&g:smartcase, &l:smartcase] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_smartindent()
+if exists('+smartindent') && execute('set!') =~# '\n..smartindent\([=\n]\|$\)'
+let l:saved = [&g:smartindent, &l:smartindent]
+endif
+if exists('+smartindent')
+set smartindent
+set nosmartindent
+set invsmartindent
+set smartindent!
+setlocal smartindent
+setlocal nosmartindent
+setlocal invsmartindent
+setlocal smartindent!
+setglobal smartindent
+setglobal nosmartindent
+setglobal invsmartindent
+setglobal smartindent!
+set si
+set nosi
+set invsi
+set si!
+setlocal si
+setlocal nosi
+setlocal invsi
+setlocal si!
+setglobal si
+setglobal nosi
+setglobal invsi
+setglobal si!
+set smartindent&
+set si&
+if exists('l:saved')
+let [&g:smartindent, &l:smartindent] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_smarttab()
+if exists('+smarttab') && execute('set!') =~# '\n..smarttab\([=\n]\|$\)'
+let l:saved = [&g:smarttab, &l:smarttab]
+endif
+if exists('+smarttab')
+set smarttab
+set nosmarttab
+set invsmarttab
+set smarttab!
+setlocal smarttab
+setlocal nosmarttab
+setlocal invsmarttab
+setlocal smarttab!
+setglobal smarttab
+setglobal nosmarttab
+setglobal invsmarttab
+setglobal smarttab!
+set sta
+set nosta
+set invsta
+set sta!
+setlocal sta
+setlocal nosta
+setlocal invsta
+setlocal sta!
+setglobal sta
+setglobal nosta
+setglobal invsta
+setglobal sta!
+set smarttab&
+set sta&
+if exists('l:saved')
+let [&g:smarttab, &l:smarttab] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_smoothscroll()
+if exists('+smoothscroll') && execute('set!') =~# '\n..smoothscroll\([=\n]\|$\)'
+let l:saved = [&g:smoothscroll, &l:smoothscroll]
+endif
+if exists('+smoothscroll')
+set smoothscroll
+set nosmoothscroll
+set invsmoothscroll
+set smoothscroll!
+setlocal smoothscroll
+setlocal nosmoothscroll
+setlocal invsmoothscroll
+setlocal smoothscroll!
+setglobal smoothscroll
+setglobal nosmoothscroll
+setglobal invsmoothscroll
+setglobal smoothscroll!
+set sms
+set nosms
+set invsms
+set sms!
+setlocal sms
+setlocal nosms
+setlocal invsms
+setlocal sms!
+setglobal sms
+setglobal nosms
+setglobal invsms
+setglobal sms!
+set smoothscroll&
+set sms&
+if exists('l:saved')
+let [&g:smoothscroll, &l:smoothscroll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_softtabstop()
+if exists('+softtabstop') && execute('set!') =~# '\n..softtabstop\([=\n]\|$\)'
+let l:saved = [&g:softtabstop, &l:softtabstop]
+endif
+if exists('+softtabstop')
+set softtabstop=-1
+set softtabstop=0
+set softtabstop=100
+setlocal softtabstop=-1
+setlocal softtabstop=0
+setlocal softtabstop=100
+setglobal softtabstop=-1
+setglobal softtabstop=0
+setglobal softtabstop=100
+set sts=-1
+set sts=0
+set sts=100
+setlocal sts=-1
+setlocal sts=0
+setlocal sts=100
+setglobal sts=-1
+setglobal sts=0
+setglobal sts=100
+silent! call assert_fails('set softtabstop=')
+silent! call assert_fails('setlocal softtabstop=')
+silent! call assert_fails('setglobal softtabstop=')
+silent! call assert_fails('set sts=')
+silent! call assert_fails('setlocal sts=')
+silent! call assert_fails('setglobal sts=')
+set softtabstop&
+set sts&
+if exists('l:saved')
+let [&g:softtabstop, &l:softtabstop] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_sourceany()
+if exists('+sourceany') && execute('set!') =~# '\n..sourceany\([=\n]\|$\)'
+let l:saved = [&g:sourceany, &l:sourceany]
+endif
+if exists('+sourceany')
+set sourceany
+set nosourceany
+set invsourceany
+set sourceany!
+setlocal sourceany
+setlocal nosourceany
+setlocal invsourceany
+setlocal sourceany!
+setglobal sourceany
+setglobal nosourceany
+setglobal invsourceany
+setglobal sourceany!
+set sourceany
+set nosourceany
+set invsourceany
+set sourceany!
+setlocal sourceany
+setlocal nosourceany
+setlocal invsourceany
+setlocal sourceany!
+setglobal sourceany
+setglobal nosourceany
+setglobal invsourceany
+setglobal sourceany!
+set sourceany&
+set sourceany&
+if exists('l:saved')
+let [&g:sourceany, &l:sourceany] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_spell()
+if exists('+spell') && execute('set!') =~# '\n..spell\([=\n]\|$\)'
+let l:saved = [&g:spell, &l:spell]
+endif
+if exists('+spell')
+set spell
+set nospell
+set invspell
+set spell!
+setlocal spell
+setlocal nospell
+setlocal invspell
+setlocal spell!
+setglobal spell
+setglobal nospell
+setglobal invspell
+setglobal spell!
+set spell
+set nospell
+set invspell
+set spell!
+setlocal spell
+setlocal nospell
+setlocal invspell
+setlocal spell!
+setglobal spell
+setglobal nospell
+setglobal invspell
+setglobal spell!
+set spell&
+set spell&
+if exists('l:saved')
+let [&g:spell, &l:spell] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_spellcapcheck()
+if exists('+spellcapcheck') && execute('set!') =~# '\n..spellcapcheck\([=\n]\|$\)'
+let l:saved = [&g:spellcapcheck, &l:spellcapcheck]
+endif
+if exists('+spellcapcheck')
+set spellcapcheck=
+set spellcapcheck=xxx
+setlocal spellcapcheck=
+setlocal spellcapcheck=xxx
+setglobal spellcapcheck=
+setglobal spellcapcheck=xxx
+set spc=
+set spc=xxx
+setlocal spc=
+setlocal spc=xxx
+setglobal spc=
+setglobal spc=xxx
+set spellcapcheck&
+set spc&
+if exists('l:saved')
+let [&g:spellcapcheck, &l:spellcapcheck] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_spellfile()
+if exists('+spellfile') && execute('set!') =~# '\n..spellfile\([=\n]\|$\)'
+let l:saved = [&g:spellfile, &l:spellfile]
+endif
+if exists('+spellfile')
+set spellfile=
+set spellfile=file.en.add
+set spellfile=xxx.en.add,yyy.gb.add,zzz.ja.add
+set spellfile=/tmp/dir\ with\ space/en.utf-8.add
+set spellfile=/tmp/dir\\,with\\,comma/en.utf-8.add
+setlocal spellfile=
+setlocal spellfile=file.en.add
+setlocal spellfile=xxx.en.add,yyy.gb.add,zzz.ja.add
+setlocal spellfile=/tmp/dir\ with\ space/en.utf-8.add
+setlocal spellfile=/tmp/dir\\,with\\,comma/en.utf-8.add
+setglobal spellfile=
+setglobal spellfile=file.en.add
+setglobal spellfile=xxx.en.add,yyy.gb.add,zzz.ja.add
+setglobal spellfile=/tmp/dir\ with\ space/en.utf-8.add
+setglobal spellfile=/tmp/dir\\,with\\,comma/en.utf-8.add
+set spf=
+set spf=file.en.add
+set spf=xxx.en.add,yyy.gb.add,zzz.ja.add
+set spf=/tmp/dir\ with\ space/en.utf-8.add
+set spf=/tmp/dir\\,with\\,comma/en.utf-8.add
+setlocal spf=
+setlocal spf=file.en.add
+setlocal spf=xxx.en.add,yyy.gb.add,zzz.ja.add
+setlocal spf=/tmp/dir\ with\ space/en.utf-8.add
+setlocal spf=/tmp/dir\\,with\\,comma/en.utf-8.add
+setglobal spf=
+setglobal spf=file.en.add
+setglobal spf=xxx.en.add,yyy.gb.add,zzz.ja.add
+setglobal spf=/tmp/dir\ with\ space/en.utf-8.add
+setglobal spf=/tmp/dir\\,with\\,comma/en.utf-8.add
+silent! call assert_fails('set spellfile=xxx')
+silent! call assert_fails('set spellfile=/tmp/file')
+silent! call assert_fails('set spellfile=/tmp/dir*with:invalid?char/file.en.add')
+silent! call assert_fails('set spellfile=,file.en.add')
+silent! call assert_fails('set spellfile=xxx,yyy.en.add')
+silent! call assert_fails('set spellfile=xxx.en.add,yyy,zzz.ja.add')
+silent! call assert_fails('setlocal spellfile=xxx')
+silent! call assert_fails('setlocal spellfile=/tmp/file')
+silent! call assert_fails('setlocal spellfile=/tmp/dir*with:invalid?char/file.en.add')
+silent! call assert_fails('setlocal spellfile=,file.en.add')
+silent! call assert_fails('setlocal spellfile=xxx,yyy.en.add')
+silent! call assert_fails('setlocal spellfile=xxx.en.add,yyy,zzz.ja.add')
+silent! call assert_fails('setglobal spellfile=xxx')
+silent! call assert_fails('setglobal spellfile=/tmp/file')
+silent! call assert_fails('setglobal spellfile=/tmp/dir*with:invalid?char/file.en.add')
+silent! call assert_fails('setglobal spellfile=,file.en.add')
+silent! call assert_fails('setglobal spellfile=xxx,yyy.en.add')
+silent! call assert_fails('setglobal spellfile=xxx.en.add,yyy,zzz.ja.add')
+silent! call assert_fails('set spf=xxx')
+silent! call assert_fails('set spf=/tmp/file')
+silent! call assert_fails('set spf=/tmp/dir*with:invalid?char/file.en.add')
+silent! call assert_fails('set spf=,file.en.add')
+silent! call assert_fails('set spf=xxx,yyy.en.add')
+silent! call assert_fails('set spf=xxx.en.add,yyy,zzz.ja.add')
+silent! call assert_fails('setlocal spf=xxx')
+silent! call assert_fails('setlocal spf=/tmp/file')
+silent! call assert_fails('setlocal spf=/tmp/dir*with:invalid?char/file.en.add')
+silent! call assert_fails('setlocal spf=,file.en.add')
+silent! call assert_fails('setlocal spf=xxx,yyy.en.add')
+silent! call assert_fails('setlocal spf=xxx.en.add,yyy,zzz.ja.add')
+silent! call assert_fails('setglobal spf=xxx')
+silent! call assert_fails('setglobal spf=/tmp/file')
+silent! call assert_fails('setglobal spf=/tmp/dir*with:invalid?char/file.en.add')
+silent! call assert_fails('setglobal spf=,file.en.add')
+silent! call assert_fails('setglobal spf=xxx,yyy.en.add')
+silent! call assert_fails('setglobal spf=xxx.en.add,yyy,zzz.ja.add')
+set spellfile&
+set spf&
+if exists('l:saved')
+let [&g:spellfile, &l:spellfile] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_spelllang()
+if exists('+spelllang') && execute('set!') =~# '\n..spelllang\([=\n]\|$\)'
+let l:saved = [&g:spelllang, &l:spelllang]
+endif
+if exists('+spelllang')
+set spelllang=
+set spelllang=xxx
+set spelllang=sr@latin
+setlocal spelllang=
+setlocal spelllang=xxx
+setlocal spelllang=sr@latin
+setglobal spelllang=
+setglobal spelllang=xxx
+setglobal spelllang=sr@latin
+set spl=
+set spl=xxx
+set spl=sr@latin
+setlocal spl=
+setlocal spl=xxx
+setlocal spl=sr@latin
+setglobal spl=
+setglobal spl=xxx
+setglobal spl=sr@latin
+silent! call assert_fails('set spelllang=not&lang')
+silent! call assert_fails('set spelllang=that\there')
+silent! call assert_fails('setlocal spelllang=not&lang')
+silent! call assert_fails('setlocal spelllang=that\there')
+silent! call assert_fails('setglobal spelllang=not&lang')
+silent! call assert_fails('setglobal spelllang=that\there')
+silent! call assert_fails('set spl=not&lang')
+silent! call assert_fails('set spl=that\there')
+silent! call assert_fails('setlocal spl=not&lang')
+silent! call assert_fails('setlocal spl=that\there')
+silent! call assert_fails('setglobal spl=not&lang')
+silent! call assert_fails('setglobal spl=that\there')
+set spelllang&
+set spl&
+if exists('l:saved')
+let [&g:spelllang, &l:spelllang] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_spelloptions()
+if exists('+spelloptions') && execute('set!') =~# '\n..spelloptions\([=\n]\|$\)'
+let l:saved = [&g:spelloptions, &l:spelloptions]
+endif
+if exists('+spelloptions')
+set spelloptions=
+set spelloptions=camel
+setlocal spelloptions=
+setlocal spelloptions=camel
+setglobal spelloptions=
+setglobal spelloptions=camel
+set spo=
+set spo=camel
+setlocal spo=
+setlocal spo=camel
+setglobal spo=
+setglobal spo=camel
+silent! call assert_fails('set spelloptions=xxx')
+silent! call assert_fails('setlocal spelloptions=xxx')
+silent! call assert_fails('setglobal spelloptions=xxx')
+silent! call assert_fails('set spo=xxx')
+silent! call assert_fails('setlocal spo=xxx')
+silent! call assert_fails('setglobal spo=xxx')
+set spelloptions&
+set spo&
+if exists('l:saved')
+let [&g:spelloptions, &l:spelloptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_spellsuggest()
+if exists('+spellsuggest') && execute('set!') =~# '\n..spellsuggest\([=\n]\|$\)'
+let l:saved = [&g:spellsuggest, &l:spellsuggest]
+endif
+if exists('+spellsuggest')
+set spellsuggest=
+set spellsuggest=best
+set spellsuggest=double
+set spellsuggest=fast
+set spellsuggest=100
+set spellsuggest=timeout:100
+set spellsuggest=timeout:-1
+set spellsuggest=file:/tmp/file
+set spellsuggest=expr:Func()
+set spellsuggest=double,33
+setlocal spellsuggest=
+setlocal spellsuggest=best
+setlocal spellsuggest=double
+setlocal spellsuggest=fast
+setlocal spellsuggest=100
+setlocal spellsuggest=timeout:100
+setlocal spellsuggest=timeout:-1
+setlocal spellsuggest=file:/tmp/file
+setlocal spellsuggest=expr:Func()
+setlocal spellsuggest=double,33
+setglobal spellsuggest=
+setglobal spellsuggest=best
+setglobal spellsuggest=double
+setglobal spellsuggest=fast
+setglobal spellsuggest=100
+setglobal spellsuggest=timeout:100
+setglobal spellsuggest=timeout:-1
+setglobal spellsuggest=file:/tmp/file
+setglobal spellsuggest=expr:Func()
+setglobal spellsuggest=double,33
+set sps=
+set sps=best
+set sps=double
+set sps=fast
+set sps=100
+set sps=timeout:100
+set sps=timeout:-1
+set sps=file:/tmp/file
+set sps=expr:Func()
+set sps=double,33
+setlocal sps=
+setlocal sps=best
+setlocal sps=double
+setlocal sps=fast
+setlocal sps=100
+setlocal sps=timeout:100
+setlocal sps=timeout:-1
+setlocal sps=file:/tmp/file
+setlocal sps=expr:Func()
+setlocal sps=double,33
+setglobal sps=
+setglobal sps=best
+setglobal sps=double
+setglobal sps=fast
+setglobal sps=100
+setglobal sps=timeout:100
+setglobal sps=timeout:-1
+setglobal sps=file:/tmp/file
+setglobal sps=expr:Func()
+setglobal sps=double,33
+silent! call assert_fails('set spellsuggest=xxx')
+silent! call assert_fails('set spellsuggest=-1')
+silent! call assert_fails('set spellsuggest=timeout:')
+silent! call assert_fails('set spellsuggest=best,double')
+silent! call assert_fails('set spellsuggest=double,fast')
+silent! call assert_fails('setlocal spellsuggest=xxx')
+silent! call assert_fails('setlocal spellsuggest=-1')
+silent! call assert_fails('setlocal spellsuggest=timeout:')
+silent! call assert_fails('setlocal spellsuggest=best,double')
+silent! call assert_fails('setlocal spellsuggest=double,fast')
+silent! call assert_fails('setglobal spellsuggest=xxx')
+silent! call assert_fails('setglobal spellsuggest=-1')
+silent! call assert_fails('setglobal spellsuggest=timeout:')
+silent! call assert_fails('setglobal spellsuggest=best,double')
+silent! call assert_fails('setglobal spellsuggest=double,fast')
+silent! call assert_fails('set sps=xxx')
+silent! call assert_fails('set sps=-1')
+silent! call assert_fails('set sps=timeout:')
+silent! call assert_fails('set sps=best,double')
+silent! call assert_fails('set sps=double,fast')
+silent! call assert_fails('setlocal sps=xxx')
+silent! call assert_fails('setlocal sps=-1')
+silent! call assert_fails('setlocal sps=timeout:')
+silent! call assert_fails('setlocal sps=best,double')
+silent! call assert_fails('setlocal sps=double,fast')
+silent! call assert_fails('setglobal sps=xxx')
+silent! call assert_fails('setglobal sps=-1')
+silent! call assert_fails('setglobal sps=timeout:')
+silent! call assert_fails('setglobal sps=best,double')
+silent! call assert_fails('setglobal sps=double,fast')
+set spellsuggest&
+set sps&
+if exists('l:saved')
+let [&g:spellsuggest, &l:spellsuggest] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_splitbelow()
+if exists('+splitbelow') && execute('set!') =~# '\n..splitbelow\([=\n]\|$\)'
+let l:saved = [&g:splitbelow, &l:splitbelow]
+endif
+if exists('+splitbelow')
+set splitbelow
+set nosplitbelow
+set invsplitbelow
+set splitbelow!
+setlocal splitbelow
+setlocal nosplitbelow
+setlocal invsplitbelow
+setlocal splitbelow!
+setglobal splitbelow
+setglobal nosplitbelow
+setglobal invsplitbelow
+setglobal splitbelow!
+set sb
+set nosb
+set invsb
+set sb!
+setlocal sb
+setlocal nosb
+setlocal invsb
+setlocal sb!
+setglobal sb
+setglobal nosb
+setglobal invsb
+setglobal sb!
+set splitbelow&
+set sb&
+if exists('l:saved')
+let [&g:splitbelow, &l:splitbelow] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_splitkeep()
+if exists('+splitkeep') && execute('set!') =~# '\n..splitkeep\([=\n]\|$\)'
+let l:saved = [&g:splitkeep, &l:splitkeep]
+endif
+if exists('+splitkeep')
+set splitkeep=
+set splitkeep=cursor
+set splitkeep=screen
+set splitkeep=topline
+setlocal splitkeep=
+setlocal splitkeep=cursor
+setlocal splitkeep=screen
+setlocal splitkeep=topline
+setglobal splitkeep=
+setglobal splitkeep=cursor
+setglobal splitkeep=screen
+setglobal splitkeep=topline
+set spk=
+set spk=cursor
+set spk=screen
+set spk=topline
+setlocal spk=
+setlocal spk=cursor
+setlocal spk=screen
+setlocal spk=topline
+setglobal spk=
+setglobal spk=cursor
+setglobal spk=screen
+setglobal spk=topline
+silent! call assert_fails('set splitkeep=xxx')
+silent! call assert_fails('setlocal splitkeep=xxx')
+silent! call assert_fails('setglobal splitkeep=xxx')
+silent! call assert_fails('set spk=xxx')
+silent! call assert_fails('setlocal spk=xxx')
+silent! call assert_fails('setglobal spk=xxx')
+set splitkeep&
+set spk&
+if exists('l:saved')
+let [&g:splitkeep, &l:splitkeep] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_splitright()
+if exists('+splitright') && execute('set!') =~# '\n..splitright\([=\n]\|$\)'
+let l:saved = [&g:splitright, &l:splitright]
+endif
+if exists('+splitright')
+set splitright
+set nosplitright
+set invsplitright
+set splitright!
+setlocal splitright
+setlocal nosplitright
+setlocal invsplitright
+setlocal splitright!
+setglobal splitright
+setglobal nosplitright
+setglobal invsplitright
+setglobal splitright!
+set spr
+set nospr
+set invspr
+set spr!
+setlocal spr
+setlocal nospr
+setlocal invspr
+setlocal spr!
+setglobal spr
+setglobal nospr
+setglobal invspr
+setglobal spr!
+set splitright&
+set spr&
+if exists('l:saved')
+let [&g:splitright, &l:splitright] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_startofline()
+if exists('+startofline') && execute('set!') =~# '\n..startofline\([=\n]\|$\)'
+let l:saved = [&g:startofline, &l:startofline]
+endif
+if exists('+startofline')
+set startofline
+set nostartofline
+set invstartofline
+set startofline!
+setlocal startofline
+setlocal nostartofline
+setlocal invstartofline
+setlocal startofline!
+setglobal startofline
+setglobal nostartofline
+setglobal invstartofline
+setglobal startofline!
+set sol
+set nosol
+set invsol
+set sol!
+setlocal sol
+setlocal nosol
+setlocal invsol
+setlocal sol!
+setglobal sol
+setglobal nosol
+setglobal invsol
+setglobal sol!
+set startofline&
+set sol&
+if exists('l:saved')
+let [&g:startofline, &l:startofline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_statusline()
+if exists('+statusline') && execute('set!') =~# '\n..statusline\([=\n]\|$\)'
+let l:saved = [&g:statusline, &l:statusline]
+endif
+if exists('+statusline')
+set statusline=
+set statusline=xxx
+setlocal statusline=
+setlocal statusline=xxx
+setglobal statusline=
+setglobal statusline=xxx
+setlocal statusline=
+call assert_equal(&g:statusline, &statusline)
+set stl=
+set stl=xxx
+setlocal stl=
+setlocal stl=xxx
+setglobal stl=
+setglobal stl=xxx
+setlocal stl=
+call assert_equal(&g:statusline, &statusline)
+silent! call assert_fails('set statusline=%$')
+silent! call assert_fails('set statusline=%{')
+silent! call assert_fails('set statusline=%{%')
+silent! call assert_fails('set statusline=%{%}')
+silent! call assert_fails('set statusline=%(')
+silent! call assert_fails('set statusline=%)')
+silent! call assert_fails('setlocal statusline=%$')
+silent! call assert_fails('setlocal statusline=%{')
+silent! call assert_fails('setlocal statusline=%{%')
+silent! call assert_fails('setlocal statusline=%{%}')
+silent! call assert_fails('setlocal statusline=%(')
+silent! call assert_fails('setlocal statusline=%)')
+silent! call assert_fails('setglobal statusline=%$')
+silent! call assert_fails('setglobal statusline=%{')
+silent! call assert_fails('setglobal statusline=%{%')
+silent! call assert_fails('setglobal statusline=%{%}')
+silent! call assert_fails('setglobal statusline=%(')
+silent! call assert_fails('setglobal statusline=%)')
+silent! call assert_fails('set stl=%$')
+silent! call assert_fails('set stl=%{')
+silent! call assert_fails('set stl=%{%')
+silent! call assert_fails('set stl=%{%}')
+silent! call assert_fails('set stl=%(')
+silent! call assert_fails('set stl=%)')
+silent! call assert_fails('setlocal stl=%$')
+silent! call assert_fails('setlocal stl=%{')
+silent! call assert_fails('setlocal stl=%{%')
+silent! call assert_fails('setlocal stl=%{%}')
+silent! call assert_fails('setlocal stl=%(')
+silent! call assert_fails('setlocal stl=%)')
+silent! call assert_fails('setglobal stl=%$')
+silent! call assert_fails('setglobal stl=%{')
+silent! call assert_fails('setglobal stl=%{%')
+silent! call assert_fails('setglobal stl=%{%}')
+silent! call assert_fails('setglobal stl=%(')
+silent! call assert_fails('setglobal stl=%)')
+set statusline&
+set stl&
+if exists('l:saved')
+let [&g:statusline, &l:statusline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_suffixes()
+if exists('+suffixes') && execute('set!') =~# '\n..suffixes\([=\n]\|$\)'
+let l:saved = [&g:suffixes, &l:suffixes]
+endif
+if exists('+suffixes')
+set suffixes=
+set suffixes=xxx
+setlocal suffixes=
+setlocal suffixes=xxx
+setglobal suffixes=
+setglobal suffixes=xxx
+set su=
+set su=xxx
+setlocal su=
+setlocal su=xxx
+setglobal su=
+setglobal su=xxx
+set suffixes&
+set su&
+if exists('l:saved')
+let [&g:suffixes, &l:suffixes] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_suffixesadd()
+if exists('+suffixesadd') && execute('set!') =~# '\n..suffixesadd\([=\n]\|$\)'
+let l:saved = [&g:suffixesadd, &l:suffixesadd]
+endif
+if exists('+suffixesadd')
+set suffixesadd=
+set suffixesadd=xxx
+setlocal suffixesadd=
+setlocal suffixesadd=xxx
+setglobal suffixesadd=
+setglobal suffixesadd=xxx
+set sua=
+set sua=xxx
+setlocal sua=
+setlocal sua=xxx
+setglobal sua=
+setglobal sua=xxx
+set suffixesadd&
+set sua&
+if exists('l:saved')
+let [&g:suffixesadd, &l:suffixesadd] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_swapfile()
+if exists('+swapfile') && execute('set!') =~# '\n..swapfile\([=\n]\|$\)'
+let l:saved = [&g:swapfile, &l:swapfile]
+endif
+if exists('+swapfile')
+set swapfile
+set noswapfile
+set invswapfile
+set swapfile!
+setlocal swapfile
+setlocal noswapfile
+setlocal invswapfile
+setlocal swapfile!
+setglobal swapfile
+setglobal noswapfile
+setglobal invswapfile
+setglobal swapfile!
+set swf
+set noswf
+set invswf
+set swf!
+setlocal swf
+setlocal noswf
+setlocal invswf
+setlocal swf!
+setglobal swf
+setglobal noswf
+setglobal invswf
+setglobal swf!
+set swapfile&
+set swf&
+if exists('l:saved')
+let [&g:swapfile, &l:swapfile] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_swapsync()
+if exists('+swapsync') && execute('set!') =~# '\n..swapsync\([=\n]\|$\)'
+let l:saved = [&g:swapsync, &l:swapsync]
+endif
+if exists('+swapsync')
+set swapsync=
+set swapsync=sync
+set swapsync=fsync
+setlocal swapsync=
+setlocal swapsync=sync
+setlocal swapsync=fsync
+setglobal swapsync=
+setglobal swapsync=sync
+setglobal swapsync=fsync
+set sws=
+set sws=sync
+set sws=fsync
+setlocal sws=
+setlocal sws=sync
+setlocal sws=fsync
+setglobal sws=
+setglobal sws=sync
+setglobal sws=fsync
+silent! call assert_fails('set swapsync=xxx')
+silent! call assert_fails('setlocal swapsync=xxx')
+silent! call assert_fails('setglobal swapsync=xxx')
+silent! call assert_fails('set sws=xxx')
+silent! call assert_fails('setlocal sws=xxx')
+silent! call assert_fails('setglobal sws=xxx')
+set swapsync&
+set sws&
+if exists('l:saved')
+let [&g:swapsync, &l:swapsync] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_switchbuf()
+if exists('+switchbuf') && execute('set!') =~# '\n..switchbuf\([=\n]\|$\)'
+let l:saved = [&g:switchbuf, &l:switchbuf]
+endif
+if exists('+switchbuf')
+set switchbuf=
+set switchbuf=useopen
+set switchbuf=usetab
+set switchbuf=split
+set switchbuf=vsplit
+set switchbuf=newtab
+set switchbuf=uselast
+set switchbuf=split,newtab
+setlocal switchbuf=
+setlocal switchbuf=useopen
+setlocal switchbuf=usetab
+setlocal switchbuf=split
+setlocal switchbuf=vsplit
+setlocal switchbuf=newtab
+setlocal switchbuf=uselast
+setlocal switchbuf=split,newtab
+setglobal switchbuf=
+setglobal switchbuf=useopen
+setglobal switchbuf=usetab
+setglobal switchbuf=split
+setglobal switchbuf=vsplit
+setglobal switchbuf=newtab
+setglobal switchbuf=uselast
+setglobal switchbuf=split,newtab
+set swb=
+set swb=useopen
+set swb=usetab
+set swb=split
+set swb=vsplit
+set swb=newtab
+set swb=uselast
+set swb=split,newtab
+setlocal swb=
+setlocal swb=useopen
+setlocal swb=usetab
+setlocal swb=split
+setlocal swb=vsplit
+setlocal swb=newtab
+setlocal swb=uselast
+setlocal swb=split,newtab
+setglobal swb=
+setglobal swb=useopen
+setglobal swb=usetab
+setglobal swb=split
+setglobal swb=vsplit
+setglobal swb=newtab
+setglobal swb=uselast
+setglobal swb=split,newtab
+silent! call assert_fails('set switchbuf=xxx')
+silent! call assert_fails('setlocal switchbuf=xxx')
+silent! call assert_fails('setglobal switchbuf=xxx')
+silent! call assert_fails('set swb=xxx')
+silent! call assert_fails('setlocal swb=xxx')
+silent! call assert_fails('setglobal swb=xxx')
+set switchbuf&
+set swb&
+if exists('l:saved')
+let [&g:switchbuf, &l:switchbuf] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_synidletime()
+if exists('+synidletime') && execute('set!') =~# '\n..synidletime\([=\n]\|$\)'
+let l:saved = [&g:synidletime, &l:synidletime]
+endif
+if exists('+synidletime')
+set synidletime=0
+set synidletime=10
+set synidletime=100
+setlocal synidletime=0
+setlocal synidletime=10
+setlocal synidletime=100
+setglobal synidletime=0
+setglobal synidletime=10
+setglobal synidletime=100
+set sit=0
+set sit=10
+set sit=100
+setlocal sit=0
+setlocal sit=10
+setlocal sit=100
+setglobal sit=0
+setglobal sit=10
+setglobal sit=100
+silent! call assert_fails('set synidletime=-1')
+silent! call assert_fails('setlocal synidletime=-1')
+silent! call assert_fails('setglobal synidletime=-1')
+silent! call assert_fails('set sit=-1')
+silent! call assert_fails('setlocal sit=-1')
+silent! call assert_fails('setglobal sit=-1')
+set synidletime&
+set sit&
+if exists('l:saved')
+let [&g:synidletime, &l:synidletime] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_synmaxcol()
+if exists('+synmaxcol') && execute('set!') =~# '\n..synmaxcol\([=\n]\|$\)'
+let l:saved = [&g:synmaxcol, &l:synmaxcol]
+endif
+if exists('+synmaxcol')
+set synmaxcol=-1
+set synmaxcol=0
+set synmaxcol=100
+setlocal synmaxcol=-1
+setlocal synmaxcol=0
+setlocal synmaxcol=100
+setglobal synmaxcol=-1
+setglobal synmaxcol=0
+setglobal synmaxcol=100
+set smc=-1
+set smc=0
+set smc=100
+setlocal smc=-1
+setlocal smc=0
+setlocal smc=100
+setglobal smc=-1
+setglobal smc=0
+setglobal smc=100
+silent! call assert_fails('set synmaxcol=')
+silent! call assert_fails('setlocal synmaxcol=')
+silent! call assert_fails('setglobal synmaxcol=')
+silent! call assert_fails('set smc=')
+silent! call assert_fails('setlocal smc=')
+silent! call assert_fails('setglobal smc=')
+set synmaxcol&
+set smc&
+if exists('l:saved')
+let [&g:synmaxcol, &l:synmaxcol] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_syntax()
+if exists('+syntax') && execute('set!') =~# '\n..syntax\([=\n]\|$\)'
+let l:saved = [&g:syntax, &l:syntax]
+endif
+if exists('+syntax')
+set syntax=
+set syntax=xxx
+setlocal syntax=
+setlocal syntax=xxx
+" Skip local-noglobal: setglobal syntax=
+" Skip local-noglobal: setglobal syntax=xxx
+set syn=
+set syn=xxx
+setlocal syn=
+setlocal syn=xxx
+" Skip local-noglobal: setglobal syn=
+" Skip local-noglobal: setglobal syn=xxx
+set syntax&
+set syn&
+if exists('l:saved')
+let [&g:syntax, &l:syntax] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tabclose()
+if exists('+tabclose') && execute('set!') =~# '\n..tabclose\([=\n]\|$\)'
+let l:saved = [&g:tabclose, &l:tabclose]
+endif
+if exists('+tabclose')
+set tabclose=
+set tabclose=left
+set tabclose=uselast
+set tabclose=left,uselast
+setlocal tabclose=
+setlocal tabclose=left
+setlocal tabclose=uselast
+setlocal tabclose=left,uselast
+setglobal tabclose=
+setglobal tabclose=left
+setglobal tabclose=uselast
+setglobal tabclose=left,uselast
+set tcl=
+set tcl=left
+set tcl=uselast
+set tcl=left,uselast
+setlocal tcl=
+setlocal tcl=left
+setlocal tcl=uselast
+setlocal tcl=left,uselast
+setglobal tcl=
+setglobal tcl=left
+setglobal tcl=uselast
+setglobal tcl=left,uselast
+silent! call assert_fails('set tabclose=xxx')
+silent! call assert_fails('setlocal tabclose=xxx')
+silent! call assert_fails('setglobal tabclose=xxx')
+silent! call assert_fails('set tcl=xxx')
+silent! call assert_fails('setlocal tcl=xxx')
+silent! call assert_fails('setglobal tcl=xxx')
+set tabclose&
+set tcl&
+if exists('l:saved')
+let [&g:tabclose, &l:tabclose] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tabline()
+if exists('+tabline') && execute('set!') =~# '\n..tabline\([=\n]\|$\)'
+let l:saved = [&g:tabline, &l:tabline]
+endif
+if exists('+tabline')
+set tabline=
+set tabline=xxx
+setlocal tabline=
+setlocal tabline=xxx
+setglobal tabline=
+setglobal tabline=xxx
+set tal=
+set tal=xxx
+setlocal tal=
+setlocal tal=xxx
+setglobal tal=
+setglobal tal=xxx
+silent! call assert_fails('set tabline=%$')
+silent! call assert_fails('set tabline=%{')
+silent! call assert_fails('set tabline=%{%')
+silent! call assert_fails('set tabline=%{%}')
+silent! call assert_fails('set tabline=%(')
+silent! call assert_fails('set tabline=%)')
+silent! call assert_fails('setlocal tabline=%$')
+silent! call assert_fails('setlocal tabline=%{')
+silent! call assert_fails('setlocal tabline=%{%')
+silent! call assert_fails('setlocal tabline=%{%}')
+silent! call assert_fails('setlocal tabline=%(')
+silent! call assert_fails('setlocal tabline=%)')
+silent! call assert_fails('setglobal tabline=%$')
+silent! call assert_fails('setglobal tabline=%{')
+silent! call assert_fails('setglobal tabline=%{%')
+silent! call assert_fails('setglobal tabline=%{%}')
+silent! call assert_fails('setglobal tabline=%(')
+silent! call assert_fails('setglobal tabline=%)')
+silent! call assert_fails('set tal=%$')
+silent! call assert_fails('set tal=%{')
+silent! call assert_fails('set tal=%{%')
+silent! call assert_fails('set tal=%{%}')
+silent! call assert_fails('set tal=%(')
+silent! call assert_fails('set tal=%)')
+silent! call assert_fails('setlocal tal=%$')
+silent! call assert_fails('setlocal tal=%{')
+silent! call assert_fails('setlocal tal=%{%')
+silent! call assert_fails('setlocal tal=%{%}')
+silent! call assert_fails('setlocal tal=%(')
+silent! call assert_fails('setlocal tal=%)')
+silent! call assert_fails('setglobal tal=%$')
+silent! call assert_fails('setglobal tal=%{')
+silent! call assert_fails('setglobal tal=%{%')
+silent! call assert_fails('setglobal tal=%{%}')
+silent! call assert_fails('setglobal tal=%(')
+silent! call assert_fails('setglobal tal=%)')
+set tabline&
+set tal&
+if exists('l:saved')
+let [&g:tabline, &l:tabline] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tabpagemax()
+if exists('+tabpagemax') && execute('set!') =~# '\n..tabpagemax\([=\n]\|$\)'
+let l:saved = [&g:tabpagemax, &l:tabpagemax]
+endif
+if exists('+tabpagemax')
+set tabpagemax=-1
+set tabpagemax=0
+set tabpagemax=100
+setlocal tabpagemax=-1
+setlocal tabpagemax=0
+setlocal tabpagemax=100
+setglobal tabpagemax=-1
+setglobal tabpagemax=0
+setglobal tabpagemax=100
+set tpm=-1
+set tpm=0
+set tpm=100
+setlocal tpm=-1
+setlocal tpm=0
+setlocal tpm=100
+setglobal tpm=-1
+setglobal tpm=0
+setglobal tpm=100
+silent! call assert_fails('set tabpagemax=')
+silent! call assert_fails('setlocal tabpagemax=')
+silent! call assert_fails('setglobal tabpagemax=')
+silent! call assert_fails('set tpm=')
+silent! call assert_fails('setlocal tpm=')
+silent! call assert_fails('setglobal tpm=')
+set tabpagemax&
+set tpm&
+if exists('l:saved')
+let [&g:tabpagemax, &l:tabpagemax] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tabpanel()
+if exists('+tabpanel') && execute('set!') =~# '\n..tabpanel\([=\n]\|$\)'
+let l:saved = [&g:tabpanel, &l:tabpanel]
+endif
+if exists('+tabpanel')
+set tabpanel=
+set tabpanel=aaa
+set tabpanel=bbb
+setlocal tabpanel=
+setlocal tabpanel=aaa
+setlocal tabpanel=bbb
+setglobal tabpanel=
+setglobal tabpanel=aaa
+setglobal tabpanel=bbb
+set tpl=
+set tpl=aaa
+set tpl=bbb
+setlocal tpl=
+setlocal tpl=aaa
+setlocal tpl=bbb
+setglobal tpl=
+setglobal tpl=aaa
+setglobal tpl=bbb
+set tabpanel&
+set tpl&
+if exists('l:saved')
+let [&g:tabpanel, &l:tabpanel] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tabpanelopt()
+if exists('+tabpanelopt') && execute('set!') =~# '\n..tabpanelopt\([=\n]\|$\)'
+let l:saved = [&g:tabpanelopt, &l:tabpanelopt]
+endif
+if exists('+tabpanelopt')
+set tabpanelopt=
+set tabpanelopt=align:left
+set tabpanelopt=align:right
+set tabpanelopt=vert
+set tabpanelopt=columns:0
+set tabpanelopt=columns:20
+set tabpanelopt=columns:999
+setlocal tabpanelopt=
+setlocal tabpanelopt=align:left
+setlocal tabpanelopt=align:right
+setlocal tabpanelopt=vert
+setlocal tabpanelopt=columns:0
+setlocal tabpanelopt=columns:20
+setlocal tabpanelopt=columns:999
+setglobal tabpanelopt=
+setglobal tabpanelopt=align:left
+setglobal tabpanelopt=align:right
+setglobal tabpanelopt=vert
+setglobal tabpanelopt=columns:0
+setglobal tabpanelopt=columns:20
+setglobal tabpanelopt=columns:999
+set tplo=
+set tplo=align:left
+set tplo=align:right
+set tplo=vert
+set tplo=columns:0
+set tplo=columns:20
+set tplo=columns:999
+setlocal tplo=
+setlocal tplo=align:left
+setlocal tplo=align:right
+setlocal tplo=vert
+setlocal tplo=columns:0
+setlocal tplo=columns:20
+setlocal tplo=columns:999
+setglobal tplo=
+setglobal tplo=align:left
+setglobal tplo=align:right
+setglobal tplo=vert
+setglobal tplo=columns:0
+setglobal tplo=columns:20
+setglobal tplo=columns:999
+silent! call assert_fails('set tabpanelopt=xxx')
+silent! call assert_fails('set tabpanelopt=align:')
+silent! call assert_fails('set tabpanelopt=align:middle')
+silent! call assert_fails('set tabpanelopt=colomns:')
+silent! call assert_fails('set tabpanelopt=cols:10')
+silent! call assert_fails('set tabpanelopt=cols:-1')
+silent! call assert_fails('setlocal tabpanelopt=xxx')
+silent! call assert_fails('setlocal tabpanelopt=align:')
+silent! call assert_fails('setlocal tabpanelopt=align:middle')
+silent! call assert_fails('setlocal tabpanelopt=colomns:')
+silent! call assert_fails('setlocal tabpanelopt=cols:10')
+silent! call assert_fails('setlocal tabpanelopt=cols:-1')
+silent! call assert_fails('setglobal tabpanelopt=xxx')
+silent! call assert_fails('setglobal tabpanelopt=align:')
+silent! call assert_fails('setglobal tabpanelopt=align:middle')
+silent! call assert_fails('setglobal tabpanelopt=colomns:')
+silent! call assert_fails('setglobal tabpanelopt=cols:10')
+silent! call assert_fails('setglobal tabpanelopt=cols:-1')
+silent! call assert_fails('set tplo=xxx')
+silent! call assert_fails('set tplo=align:')
+silent! call assert_fails('set tplo=align:middle')
+silent! call assert_fails('set tplo=colomns:')
+silent! call assert_fails('set tplo=cols:10')
+silent! call assert_fails('set tplo=cols:-1')
+silent! call assert_fails('setlocal tplo=xxx')
+silent! call assert_fails('setlocal tplo=align:')
+silent! call assert_fails('setlocal tplo=align:middle')
+silent! call assert_fails('setlocal tplo=colomns:')
+silent! call assert_fails('setlocal tplo=cols:10')
+silent! call assert_fails('setlocal tplo=cols:-1')
+silent! call assert_fails('setglobal tplo=xxx')
+silent! call assert_fails('setglobal tplo=align:')
+silent! call assert_fails('setglobal tplo=align:middle')
+silent! call assert_fails('setglobal tplo=colomns:')
+silent! call assert_fails('setglobal tplo=cols:10')
+silent! call assert_fails('setglobal tplo=cols:-1')
+set tabpanelopt&
+set tplo&
+if exists('l:saved')
+let [&g:tabpanelopt, &l:tabpanelopt] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tabstop()
+if exists('+tabstop') && execute('set!') =~# '\n..tabstop\([=\n]\|$\)'
+let l:saved = [&g:tabstop, &l:tabstop]
+endif
+if exists('+tabstop')
+set tabstop=1
+set tabstop=4
+set tabstop=8
+set tabstop=12
+set tabstop=9999
+setlocal tabstop=1
+setlocal tabstop=4
+setlocal tabstop=8
+setlocal tabstop=12
+setlocal tabstop=9999
+setglobal tabstop=1
+setglobal tabstop=4
+setglobal tabstop=8
+setglobal tabstop=12
+setglobal tabstop=9999
+set ts=1
+set ts=4
+set ts=8
+set ts=12
+set ts=9999
+setlocal ts=1
+setlocal ts=4
+setlocal ts=8
+setlocal ts=12
+setlocal ts=9999
+setglobal ts=1
+setglobal ts=4
+setglobal ts=8
+setglobal ts=12
+setglobal ts=9999
+silent! call assert_fails('set tabstop=-1')
+silent! call assert_fails('set tabstop=0')
+silent! call assert_fails('set tabstop=10000')
+silent! call assert_fails('setlocal tabstop=-1')
+silent! call assert_fails('setlocal tabstop=0')
+silent! call assert_fails('setlocal tabstop=10000')
+silent! call assert_fails('setglobal tabstop=-1')
+silent! call assert_fails('setglobal tabstop=0')
+silent! call assert_fails('setglobal tabstop=10000')
+silent! call assert_fails('set ts=-1')
+silent! call assert_fails('set ts=0')
+silent! call assert_fails('set ts=10000')
+silent! call assert_fails('setlocal ts=-1')
+silent! call assert_fails('setlocal ts=0')
+silent! call assert_fails('setlocal ts=10000')
+silent! call assert_fails('setglobal ts=-1')
+silent! call assert_fails('setglobal ts=0')
+silent! call assert_fails('setglobal ts=10000')
+set tabstop&
+set ts&
+if exists('l:saved')
+let [&g:tabstop, &l:tabstop] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tagbsearch()
+if exists('+tagbsearch') && execute('set!') =~# '\n..tagbsearch\([=\n]\|$\)'
+let l:saved = [&g:tagbsearch, &l:tagbsearch]
+endif
+if exists('+tagbsearch')
+set tagbsearch
+set notagbsearch
+set invtagbsearch
+set tagbsearch!
+setlocal tagbsearch
+setlocal notagbsearch
+setlocal invtagbsearch
+setlocal tagbsearch!
+setglobal tagbsearch
+setglobal notagbsearch
+setglobal invtagbsearch
+setglobal tagbsearch!
+set tbs
+set notbs
+set invtbs
+set tbs!
+setlocal tbs
+setlocal notbs
+setlocal invtbs
+setlocal tbs!
+setglobal tbs
+setglobal notbs
+setglobal invtbs
+setglobal tbs!
+set tagbsearch&
+set tbs&
+if exists('l:saved')
+let [&g:tagbsearch, &l:tagbsearch] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tagcase()
+if exists('+tagcase') && execute('set!') =~# '\n..tagcase\([=\n]\|$\)'
+let l:saved = [&g:tagcase, &l:tagcase]
+endif
+if exists('+tagcase')
+set tagcase=followic
+set tagcase=followscs
+set tagcase=ignore
+set tagcase=match
+set tagcase=smart
+setlocal tagcase=followic
+setlocal tagcase=followscs
+setlocal tagcase=ignore
+setlocal tagcase=match
+setlocal tagcase=smart
+setglobal tagcase=followic
+setglobal tagcase=followscs
+setglobal tagcase=ignore
+setglobal tagcase=match
+setglobal tagcase=smart
+setlocal tagcase=
+call assert_equal(&g:tagcase, &tagcase)
+set tc=followic
+set tc=followscs
+set tc=ignore
+set tc=match
+set tc=smart
+setlocal tc=followic
+setlocal tc=followscs
+setlocal tc=ignore
+setlocal tc=match
+setlocal tc=smart
+setglobal tc=followic
+setglobal tc=followscs
+setglobal tc=ignore
+setglobal tc=match
+setglobal tc=smart
+setlocal tc=
+call assert_equal(&g:tagcase, &tagcase)
+silent! call assert_fails('set tagcase=')
+silent! call assert_fails('set tagcase=xxx')
+silent! call assert_fails('set tagcase=smart,match')
+" Skip global-local: silent! call assert_fails('setlocal tagcase=')
+silent! call assert_fails('setlocal tagcase=xxx')
+silent! call assert_fails('setlocal tagcase=smart,match')
+silent! call assert_fails('setglobal tagcase=')
+silent! call assert_fails('setglobal tagcase=xxx')
+silent! call assert_fails('setglobal tagcase=smart,match')
+silent! call assert_fails('set tc=')
+silent! call assert_fails('set tc=xxx')
+silent! call assert_fails('set tc=smart,match')
+" Skip global-local: silent! call assert_fails('setlocal tc=')
+silent! call assert_fails('setlocal tc=xxx')
+silent! call assert_fails('setlocal tc=smart,match')
+silent! call assert_fails('setglobal tc=')
+silent! call assert_fails('setglobal tc=xxx')
+silent! call assert_fails('setglobal tc=smart,match')
+set tagcase&
+set tc&
+if exists('l:saved')
+let [&g:tagcase, &l:tagcase] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tagfunc()
+if exists('+tagfunc') && execute('set!') =~# '\n..tagfunc\([=\n]\|$\)'
+let l:saved = [&g:tagfunc, &l:tagfunc]
+endif
+if exists('+tagfunc')
+set tagfunc=
+set tagfunc=xxx
+setlocal tagfunc=
+setlocal tagfunc=xxx
+setglobal tagfunc=
+setglobal tagfunc=xxx
+set tfu=
+set tfu=xxx
+setlocal tfu=
+setlocal tfu=xxx
+setglobal tfu=
+setglobal tfu=xxx
+set tagfunc&
+set tfu&
+if exists('l:saved')
+let [&g:tagfunc, &l:tagfunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_taglength()
+if exists('+taglength') && execute('set!') =~# '\n..taglength\([=\n]\|$\)'
+let l:saved = [&g:taglength, &l:taglength]
+endif
+if exists('+taglength')
+set taglength=-1
+set taglength=0
+set taglength=100
+setlocal taglength=-1
+setlocal taglength=0
+setlocal taglength=100
+setglobal taglength=-1
+setglobal taglength=0
+setglobal taglength=100
+set tl=-1
+set tl=0
+set tl=100
+setlocal tl=-1
+setlocal tl=0
+setlocal tl=100
+setglobal tl=-1
+setglobal tl=0
+setglobal tl=100
+silent! call assert_fails('set taglength=')
+silent! call assert_fails('setlocal taglength=')
+silent! call assert_fails('setglobal taglength=')
+silent! call assert_fails('set tl=')
+silent! call assert_fails('setlocal tl=')
+silent! call assert_fails('setglobal tl=')
+set taglength&
+set tl&
+if exists('l:saved')
+let [&g:taglength, &l:taglength] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tagrelative()
+if exists('+tagrelative') && execute('set!') =~# '\n..tagrelative\([=\n]\|$\)'
+let l:saved = [&g:tagrelative, &l:tagrelative]
+endif
+if exists('+tagrelative')
+set tagrelative
+set notagrelative
+set invtagrelative
+set tagrelative!
+setlocal tagrelative
+setlocal notagrelative
+setlocal invtagrelative
+setlocal tagrelative!
+setglobal tagrelative
+setglobal notagrelative
+setglobal invtagrelative
+setglobal tagrelative!
+set tr
+set notr
+set invtr
+set tr!
+setlocal tr
+setlocal notr
+setlocal invtr
+setlocal tr!
+setglobal tr
+setglobal notr
+setglobal invtr
+setglobal tr!
+set tagrelative&
+set tr&
+if exists('l:saved')
+let [&g:tagrelative, &l:tagrelative] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tags()
+if exists('+tags') && execute('set!') =~# '\n..tags\([=\n]\|$\)'
+let l:saved = [&g:tags, &l:tags]
+endif
+if exists('+tags')
+set tags=
+set tags=xxx
+setlocal tags=
+setlocal tags=xxx
+setglobal tags=
+setglobal tags=xxx
+set tag=
+set tag=xxx
+setlocal tag=
+setlocal tag=xxx
+setglobal tag=
+setglobal tag=xxx
+set tags&
+set tag&
+if exists('l:saved')
+let [&g:tags, &l:tags] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tagstack()
+if exists('+tagstack') && execute('set!') =~# '\n..tagstack\([=\n]\|$\)'
+let l:saved = [&g:tagstack, &l:tagstack]
+endif
+if exists('+tagstack')
+set tagstack
+set notagstack
+set invtagstack
+set tagstack!
+setlocal tagstack
+setlocal notagstack
+setlocal invtagstack
+setlocal tagstack!
+setglobal tagstack
+setglobal notagstack
+setglobal invtagstack
+setglobal tagstack!
+set tgst
+set notgst
+set invtgst
+set tgst!
+setlocal tgst
+setlocal notgst
+setlocal invtgst
+setlocal tgst!
+setglobal tgst
+setglobal notgst
+setglobal invtgst
+setglobal tgst!
+set tagstack&
+set tgst&
+if exists('l:saved')
+let [&g:tagstack, &l:tagstack] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_termbidi()
+if exists('+termbidi') && execute('set!') =~# '\n..termbidi\([=\n]\|$\)'
+let l:saved = [&g:termbidi, &l:termbidi]
+endif
+if exists('+termbidi')
+set termbidi
+set notermbidi
+set invtermbidi
+set termbidi!
+setlocal termbidi
+setlocal notermbidi
+setlocal invtermbidi
+setlocal termbidi!
+setglobal termbidi
+setglobal notermbidi
+setglobal invtermbidi
+setglobal termbidi!
+set tbidi
+set notbidi
+set invtbidi
+set tbidi!
+setlocal tbidi
+setlocal notbidi
+setlocal invtbidi
+setlocal tbidi!
+setglobal tbidi
+setglobal notbidi
+setglobal invtbidi
+setglobal tbidi!
+set termbidi&
+set tbidi&
+if exists('l:saved')
+let [&g:termbidi, &l:termbidi] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_termencoding()
+if exists('+termencoding') && execute('set!') =~# '\n..termencoding\([=\n]\|$\)'
+let l:saved = [&g:termencoding, &l:termencoding]
+endif
+if exists('+termencoding')
+set termencoding=
+set termencoding=utf-8
+setlocal termencoding=
+setlocal termencoding=utf-8
+setglobal termencoding=
+setglobal termencoding=utf-8
+set tenc=
+set tenc=utf-8
+setlocal tenc=
+setlocal tenc=utf-8
+setglobal tenc=
+setglobal tenc=utf-8
+silent! call assert_fails('set termencoding=xxx')
+silent! call assert_fails('setlocal termencoding=xxx')
+silent! call assert_fails('setglobal termencoding=xxx')
+silent! call assert_fails('set tenc=xxx')
+silent! call assert_fails('setlocal tenc=xxx')
+silent! call assert_fails('setglobal tenc=xxx')
+set termencoding&
+set tenc&
+if exists('l:saved')
+let [&g:termencoding, &l:termencoding] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_termguicolors()
+if exists('+termguicolors') && execute('set!') =~# '\n..termguicolors\([=\n]\|$\)'
+let l:saved = [&g:termguicolors, &l:termguicolors]
+endif
+if exists('+termguicolors')
+set termguicolors
+set notermguicolors
+set invtermguicolors
+set termguicolors!
+setlocal termguicolors
+setlocal notermguicolors
+setlocal invtermguicolors
+setlocal termguicolors!
+setglobal termguicolors
+setglobal notermguicolors
+setglobal invtermguicolors
+setglobal termguicolors!
+set tgc
+set notgc
+set invtgc
+set tgc!
+setlocal tgc
+setlocal notgc
+setlocal invtgc
+setlocal tgc!
+setglobal tgc
+setglobal notgc
+setglobal invtgc
+setglobal tgc!
+set termguicolors&
+set tgc&
+if exists('l:saved')
+let [&g:termguicolors, &l:termguicolors] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_termwinkey()
+if exists('+termwinkey') && execute('set!') =~# '\n..termwinkey\([=\n]\|$\)'
+let l:saved = [&g:termwinkey, &l:termwinkey]
+endif
+if exists('+termwinkey')
+set termwinkey=
+set termwinkey=f
+set termwinkey=^Y
+set termwinkey=^@
+set termwinkey=<Esc>
+set termwinkey=<t_xx>
+set termwinkey=B
+set termwinkey=<
+set termwinkey=^
+setlocal termwinkey=
+setlocal termwinkey=f
+setlocal termwinkey=^Y
+setlocal termwinkey=^@
+setlocal termwinkey=<Esc>
+setlocal termwinkey=<t_xx>
+setlocal termwinkey=B
+setlocal termwinkey=<
+setlocal termwinkey=^
+setglobal termwinkey=
+setglobal termwinkey=f
+setglobal termwinkey=^Y
+setglobal termwinkey=^@
+setglobal termwinkey=<Esc>
+setglobal termwinkey=<t_xx>
+setglobal termwinkey=B
+setglobal termwinkey=<
+setglobal termwinkey=^
+set twk=
+set twk=f
+set twk=^Y
+set twk=^@
+set twk=<Esc>
+set twk=<t_xx>
+set twk=B
+set twk=<
+set twk=^
+setlocal twk=
+setlocal twk=f
+setlocal twk=^Y
+setlocal twk=^@
+setlocal twk=<Esc>
+setlocal twk=<t_xx>
+setlocal twk=B
+setlocal twk=<
+setlocal twk=^
+setglobal twk=
+setglobal twk=f
+setglobal twk=^Y
+setglobal twk=^@
+setglobal twk=<Esc>
+setglobal twk=<t_xx>
+setglobal twk=B
+setglobal twk=<
+setglobal twk=^
+silent! call assert_fails('set termwinkey=<xxx>')
+silent! call assert_fails('set termwinkey=<t_xxx>')
+silent! call assert_fails('set termwinkey=<Esc')
+silent! call assert_fails('set termwinkey=<t_xx')
+silent! call assert_fails('setlocal termwinkey=<xxx>')
+silent! call assert_fails('setlocal termwinkey=<t_xxx>')
+silent! call assert_fails('setlocal termwinkey=<Esc')
+silent! call assert_fails('setlocal termwinkey=<t_xx')
+silent! call assert_fails('setglobal termwinkey=<xxx>')
+silent! call assert_fails('setglobal termwinkey=<t_xxx>')
+silent! call assert_fails('setglobal termwinkey=<Esc')
+silent! call assert_fails('setglobal termwinkey=<t_xx')
+silent! call assert_fails('set twk=<xxx>')
+silent! call assert_fails('set twk=<t_xxx>')
+silent! call assert_fails('set twk=<Esc')
+silent! call assert_fails('set twk=<t_xx')
+silent! call assert_fails('setlocal twk=<xxx>')
+silent! call assert_fails('setlocal twk=<t_xxx>')
+silent! call assert_fails('setlocal twk=<Esc')
+silent! call assert_fails('setlocal twk=<t_xx')
+silent! call assert_fails('setglobal twk=<xxx>')
+silent! call assert_fails('setglobal twk=<t_xxx>')
+silent! call assert_fails('setglobal twk=<Esc')
+silent! call assert_fails('setglobal twk=<t_xx')
+set termwinkey&
+set twk&
+if exists('l:saved')
+let [&g:termwinkey, &l:termwinkey] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_termwinscroll()
+if exists('+termwinscroll') && execute('set!') =~# '\n..termwinscroll\([=\n]\|$\)'
+let l:saved = [&g:termwinscroll, &l:termwinscroll]
+endif
+if exists('+termwinscroll')
+set termwinscroll=1
+set termwinscroll=100
+set termwinscroll=99999
+setlocal termwinscroll=1
+setlocal termwinscroll=100
+setlocal termwinscroll=99999
+setglobal termwinscroll=1
+setglobal termwinscroll=100
+setglobal termwinscroll=99999
+set twsl=1
+set twsl=100
+set twsl=99999
+setlocal twsl=1
+setlocal twsl=100
+setlocal twsl=99999
+setglobal twsl=1
+setglobal twsl=100
+setglobal twsl=99999
+silent! call assert_fails('set termwinscroll=-1')
+silent! call assert_fails('set termwinscroll=0')
+silent! call assert_fails('setlocal termwinscroll=-1')
+silent! call assert_fails('setlocal termwinscroll=0')
+silent! call assert_fails('setglobal termwinscroll=-1')
+silent! call assert_fails('setglobal termwinscroll=0')
+silent! call assert_fails('set twsl=-1')
+silent! call assert_fails('set twsl=0')
+silent! call assert_fails('setlocal twsl=-1')
+silent! call assert_fails('setlocal twsl=0')
+silent! call assert_fails('setglobal twsl=-1')
+silent! call assert_fails('setglobal twsl=0')
+set termwinscroll&
+set twsl&
+if exists('l:saved')
+let [&g:termwinscroll, &l:termwinscroll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_termwinsize()
+if exists('+termwinsize') && execute('set!') =~# '\n..termwinsize\([=\n]\|$\)'
+let l:saved = [&g:termwinsize, &l:termwinsize]
+endif
+if exists('+termwinsize')
+set termwinsize=
+set termwinsize=24x80
+set termwinsize=0x80
+set termwinsize=32x0
+set termwinsize=0x0
+setlocal termwinsize=
+setlocal termwinsize=24x80
+setlocal termwinsize=0x80
+setlocal termwinsize=32x0
+setlocal termwinsize=0x0
+setglobal termwinsize=
+setglobal termwinsize=24x80
+setglobal termwinsize=0x80
+setglobal termwinsize=32x0
+setglobal termwinsize=0x0
+set tws=
+set tws=24x80
+set tws=0x80
+set tws=32x0
+set tws=0x0
+setlocal tws=
+setlocal tws=24x80
+setlocal tws=0x80
+setlocal tws=32x0
+setlocal tws=0x0
+setglobal tws=
+setglobal tws=24x80
+setglobal tws=0x80
+setglobal tws=32x0
+setglobal tws=0x0
+silent! call assert_fails('set termwinsize=xxx')
+silent! call assert_fails('set termwinsize=80')
+silent! call assert_fails('set termwinsize=8ax9')
+silent! call assert_fails('set termwinsize=24x80b')
+silent! call assert_fails('setlocal termwinsize=xxx')
+silent! call assert_fails('setlocal termwinsize=80')
+silent! call assert_fails('setlocal termwinsize=8ax9')
+silent! call assert_fails('setlocal termwinsize=24x80b')
+silent! call assert_fails('setglobal termwinsize=xxx')
+silent! call assert_fails('setglobal termwinsize=80')
+silent! call assert_fails('setglobal termwinsize=8ax9')
+silent! call assert_fails('setglobal termwinsize=24x80b')
+silent! call assert_fails('set tws=xxx')
+silent! call assert_fails('set tws=80')
+silent! call assert_fails('set tws=8ax9')
+silent! call assert_fails('set tws=24x80b')
+silent! call assert_fails('setlocal tws=xxx')
+silent! call assert_fails('setlocal tws=80')
+silent! call assert_fails('setlocal tws=8ax9')
+silent! call assert_fails('setlocal tws=24x80b')
+silent! call assert_fails('setglobal tws=xxx')
+silent! call assert_fails('setglobal tws=80')
+silent! call assert_fails('setglobal tws=8ax9')
+silent! call assert_fails('setglobal tws=24x80b')
+set termwinsize&
+set tws&
+if exists('l:saved')
+let [&g:termwinsize, &l:termwinsize] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_termwintype()
+if exists('+termwintype') && execute('set!') =~# '\n..termwintype\([=\n]\|$\)'
+let l:saved = [&g:termwintype, &l:termwintype]
+endif
+if exists('+termwintype')
+set termwintype=
+set termwintype=winpty
+set termwintype=conpty
+setlocal termwintype=
+setlocal termwintype=winpty
+setlocal termwintype=conpty
+setglobal termwintype=
+setglobal termwintype=winpty
+setglobal termwintype=conpty
+set twt=
+set twt=winpty
+set twt=conpty
+setlocal twt=
+setlocal twt=winpty
+setlocal twt=conpty
+setglobal twt=
+setglobal twt=winpty
+setglobal twt=conpty
+silent! call assert_fails('set termwintype=xxx')
+silent! call assert_fails('setlocal termwintype=xxx')
+silent! call assert_fails('setglobal termwintype=xxx')
+silent! call assert_fails('set twt=xxx')
+silent! call assert_fails('setlocal twt=xxx')
+silent! call assert_fails('setglobal twt=xxx')
+set termwintype&
+set twt&
+if exists('l:saved')
+let [&g:termwintype, &l:termwintype] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_terse()
+if exists('+terse') && execute('set!') =~# '\n..terse\([=\n]\|$\)'
+let l:saved = [&g:terse, &l:terse]
+endif
+if exists('+terse')
+set terse
+set noterse
+set invterse
+set terse!
+setlocal terse
+setlocal noterse
+setlocal invterse
+setlocal terse!
+setglobal terse
+setglobal noterse
+setglobal invterse
+setglobal terse!
+set terse
+set noterse
+set invterse
+set terse!
+setlocal terse
+setlocal noterse
+setlocal invterse
+setlocal terse!
+setglobal terse
+setglobal noterse
+setglobal invterse
+setglobal terse!
+set terse&
+set terse&
+if exists('l:saved')
+let [&g:terse, &l:terse] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_textauto()
+if exists('+textauto') && execute('set!') =~# '\n..textauto\([=\n]\|$\)'
+let l:saved = [&g:textauto, &l:textauto]
+endif
+if exists('+textauto')
+set textauto
+set notextauto
+set invtextauto
+set textauto!
+setlocal textauto
+setlocal notextauto
+setlocal invtextauto
+setlocal textauto!
+setglobal textauto
+setglobal notextauto
+setglobal invtextauto
+setglobal textauto!
+set ta
+set nota
+set invta
+set ta!
+setlocal ta
+setlocal nota
+setlocal invta
+setlocal ta!
+setglobal ta
+setglobal nota
+setglobal invta
+setglobal ta!
+set textauto&
+set ta&
+if exists('l:saved')
+let [&g:textauto, &l:textauto] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_textmode()
+if exists('+textmode') && execute('set!') =~# '\n..textmode\([=\n]\|$\)'
+let l:saved = [&g:textmode, &l:textmode]
+endif
+if exists('+textmode')
+set textmode
+set notextmode
+set invtextmode
+set textmode!
+setlocal textmode
+setlocal notextmode
+setlocal invtextmode
+setlocal textmode!
+setglobal textmode
+setglobal notextmode
+setglobal invtextmode
+setglobal textmode!
+set tx
+set notx
+set invtx
+set tx!
+setlocal tx
+setlocal notx
+setlocal invtx
+setlocal tx!
+setglobal tx
+setglobal notx
+setglobal invtx
+setglobal tx!
+set textmode&
+set tx&
+if exists('l:saved')
+let [&g:textmode, &l:textmode] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_textwidth()
+if exists('+textwidth') && execute('set!') =~# '\n..textwidth\([=\n]\|$\)'
+let l:saved = [&g:textwidth, &l:textwidth]
+endif
+if exists('+textwidth')
+set textwidth=0
+set textwidth=1
+set textwidth=8
+set textwidth=99
+setlocal textwidth=0
+setlocal textwidth=1
+setlocal textwidth=8
+setlocal textwidth=99
+setglobal textwidth=0
+setglobal textwidth=1
+setglobal textwidth=8
+setglobal textwidth=99
+set tw=0
+set tw=1
+set tw=8
+set tw=99
+setlocal tw=0
+setlocal tw=1
+setlocal tw=8
+setlocal tw=99
+setglobal tw=0
+setglobal tw=1
+setglobal tw=8
+setglobal tw=99
+silent! call assert_fails('set textwidth=-1')
+silent! call assert_fails('setlocal textwidth=-1')
+silent! call assert_fails('setglobal textwidth=-1')
+silent! call assert_fails('set tw=-1')
+silent! call assert_fails('setlocal tw=-1')
+silent! call assert_fails('setglobal tw=-1')
+set textwidth&
+set tw&
+if exists('l:saved')
+let [&g:textwidth, &l:textwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_thesaurus()
+if exists('+thesaurus') && execute('set!') =~# '\n..thesaurus\([=\n]\|$\)'
+let l:saved = [&g:thesaurus, &l:thesaurus]
+endif
+if exists('+thesaurus')
+set thesaurus=
+set thesaurus=xxx
+setlocal thesaurus=
+setlocal thesaurus=xxx
+setglobal thesaurus=
+setglobal thesaurus=xxx
+setlocal thesaurus=
+call assert_equal(&g:thesaurus, &thesaurus)
+set tsr=
+set tsr=xxx
+setlocal tsr=
+setlocal tsr=xxx
+setglobal tsr=
+setglobal tsr=xxx
+setlocal tsr=
+call assert_equal(&g:thesaurus, &thesaurus)
+set thesaurus&
+set tsr&
+if exists('l:saved')
+let [&g:thesaurus, &l:thesaurus] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_thesaurusfunc()
+if exists('+thesaurusfunc') && execute('set!') =~# '\n..thesaurusfunc\([=\n]\|$\)'
+let l:saved = [&g:thesaurusfunc, &l:thesaurusfunc]
+endif
+if exists('+thesaurusfunc')
+set thesaurusfunc=
+set thesaurusfunc=xxx
+setlocal thesaurusfunc=
+setlocal thesaurusfunc=xxx
+setglobal thesaurusfunc=
+setglobal thesaurusfunc=xxx
+setlocal thesaurusfunc=
+call assert_equal(&g:thesaurusfunc, &thesaurusfunc)
+set tsrfu=
+set tsrfu=xxx
+setlocal tsrfu=
+setlocal tsrfu=xxx
+setglobal tsrfu=
+setglobal tsrfu=xxx
+setlocal tsrfu=
+call assert_equal(&g:thesaurusfunc, &thesaurusfunc)
+set thesaurusfunc&
+set tsrfu&
+if exists('l:saved')
+let [&g:thesaurusfunc, &l:thesaurusfunc] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_tildeop()
+if exists('+tildeop') && execute('set!') =~# '\n..tildeop\([=\n]\|$\)'
+let l:saved = [&g:tildeop, &l:tildeop]
+endif
+if exists('+tildeop')
+set tildeop
+set notildeop
+set invtildeop
+set tildeop!
+setlocal tildeop
+setlocal notildeop
+setlocal invtildeop
+setlocal tildeop!
+setglobal tildeop
+setglobal notildeop
+setglobal invtildeop
+setglobal tildeop!
+set top
+set notop
+set invtop
+set top!
+setlocal top
+setlocal notop
+setlocal invtop
+setlocal top!
+setglobal top
+setglobal notop
+setglobal invtop
+setglobal top!
+set tildeop&
+set top&
+if exists('l:saved')
+let [&g:tildeop, &l:tildeop] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_timeout()
+if exists('+timeout') && execute('set!') =~# '\n..timeout\([=\n]\|$\)'
+let l:saved = [&g:timeout, &l:timeout]
+endif
+if exists('+timeout')
+set timeout
+set notimeout
+set invtimeout
+set timeout!
+setlocal timeout
+setlocal notimeout
+setlocal invtimeout
+setlocal timeout!
+setglobal timeout
+setglobal notimeout
+setglobal invtimeout
+setglobal timeout!
+set to
+set noto
+set invto
+set to!
+setlocal to
+setlocal noto
+setlocal invto
+setlocal to!
+setglobal to
+setglobal noto
+setglobal invto
+setglobal to!
+set timeout&
+set to&
+if exists('l:saved')
+let [&g:timeout, &l:timeout] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_timeoutlen()
+if exists('+timeoutlen') && execute('set!') =~# '\n..timeoutlen\([=\n]\|$\)'
+let l:saved = [&g:timeoutlen, &l:timeoutlen]
+endif
+if exists('+timeoutlen')
+set timeoutlen=0
+set timeoutlen=8
+set timeoutlen=99999
+setlocal timeoutlen=0
+setlocal timeoutlen=8
+setlocal timeoutlen=99999
+setglobal timeoutlen=0
+setglobal timeoutlen=8
+setglobal timeoutlen=99999
+set tm=0
+set tm=8
+set tm=99999
+setlocal tm=0
+setlocal tm=8
+setlocal tm=99999
+setglobal tm=0
+setglobal tm=8
+setglobal tm=99999
+silent! call assert_fails('set timeoutlen=-1')
+silent! call assert_fails('setlocal timeoutlen=-1')
+silent! call assert_fails('setglobal timeoutlen=-1')
+silent! call assert_fails('set tm=-1')
+silent! call assert_fails('setlocal tm=-1')
+silent! call assert_fails('setglobal tm=-1')
+set timeoutlen&
+set tm&
+if exists('l:saved')
+let [&g:timeoutlen, &l:timeoutlen] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_title()
+if exists('+title') && execute('set!') =~# '\n..title\([=\n]\|$\)'
+let l:saved = [&g:title, &l:title]
+endif
+if exists('+title')
+set title
+set notitle
+set invtitle
+set title!
+setlocal title
+setlocal notitle
+setlocal invtitle
+setlocal title!
+setglobal title
+setglobal notitle
+setglobal invtitle
+setglobal title!
+set title
+set notitle
+set invtitle
+set title!
+setlocal title
+setlocal notitle
+setlocal invtitle
+setlocal title!
+setglobal title
+setglobal notitle
+setglobal invtitle
+setglobal title!
+set title&
+set title&
+if exists('l:saved')
+let [&g:title, &l:title] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_titlelen()
+if exists('+titlelen') && execute('set!') =~# '\n..titlelen\([=\n]\|$\)'
+let l:saved = [&g:titlelen, &l:titlelen]
+endif
+if exists('+titlelen')
+set titlelen=0
+set titlelen=1
+set titlelen=8
+set titlelen=9999
+setlocal titlelen=0
+setlocal titlelen=1
+setlocal titlelen=8
+setlocal titlelen=9999
+setglobal titlelen=0
+setglobal titlelen=1
+setglobal titlelen=8
+setglobal titlelen=9999
+set titlelen=0
+set titlelen=1
+set titlelen=8
+set titlelen=9999
+setlocal titlelen=0
+setlocal titlelen=1
+setlocal titlelen=8
+setlocal titlelen=9999
+setglobal titlelen=0
+setglobal titlelen=1
+setglobal titlelen=8
+setglobal titlelen=9999
+silent! call assert_fails('set titlelen=-1')
+silent! call assert_fails('setlocal titlelen=-1')
+silent! call assert_fails('setglobal titlelen=-1')
+silent! call assert_fails('set titlelen=-1')
+silent! call assert_fails('setlocal titlelen=-1')
+silent! call assert_fails('setglobal titlelen=-1')
+set titlelen&
+set titlelen&
+if exists('l:saved')
+let [&g:titlelen, &l:titlelen] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_titleold()
+if exists('+titleold') && execute('set!') =~# '\n..titleold\([=\n]\|$\)'
+let l:saved = [&g:titleold, &l:titleold]
+endif
+if exists('+titleold')
+set titleold=
+set titleold=xxx
+setlocal titleold=
+setlocal titleold=xxx
+setglobal titleold=
+setglobal titleold=xxx
+set titleold=
+set titleold=xxx
+setlocal titleold=
+setlocal titleold=xxx
+setglobal titleold=
+setglobal titleold=xxx
+set titleold&
+set titleold&
+if exists('l:saved')
+let [&g:titleold, &l:titleold] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_titlestring()
+if exists('+titlestring') && execute('set!') =~# '\n..titlestring\([=\n]\|$\)'
+let l:saved = [&g:titlestring, &l:titlestring]
+endif
+if exists('+titlestring')
+set titlestring=
+set titlestring=xxx
+set titlestring=%(
+setlocal titlestring=
+setlocal titlestring=xxx
+setlocal titlestring=%(
+setglobal titlestring=
+setglobal titlestring=xxx
+setglobal titlestring=%(
+set titlestring=
+set titlestring=xxx
+set titlestring=%(
+setlocal titlestring=
+setlocal titlestring=xxx
+setlocal titlestring=%(
+setglobal titlestring=
+setglobal titlestring=xxx
+setglobal titlestring=%(
+set titlestring&
+set titlestring&
+if exists('l:saved')
+let [&g:titlestring, &l:titlestring] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_toolbar()
+if exists('+toolbar') && execute('set!') =~# '\n..toolbar\([=\n]\|$\)'
+let l:saved = [&g:toolbar, &l:toolbar]
+endif
+if exists('+toolbar')
+set toolbar=
+set toolbar=icons
+set toolbar=text
+set toolbar=horiz
+set toolbar=tooltips
+set toolbar=icons,text
+setlocal toolbar=
+setlocal toolbar=icons
+setlocal toolbar=text
+setlocal toolbar=horiz
+setlocal toolbar=tooltips
+setlocal toolbar=icons,text
+setglobal toolbar=
+setglobal toolbar=icons
+setglobal toolbar=text
+setglobal toolbar=horiz
+setglobal toolbar=tooltips
+setglobal toolbar=icons,text
+set tb=
+set tb=icons
+set tb=text
+set tb=horiz
+set tb=tooltips
+set tb=icons,text
+setlocal tb=
+setlocal tb=icons
+setlocal tb=text
+setlocal tb=horiz
+setlocal tb=tooltips
+setlocal tb=icons,text
+setglobal tb=
+setglobal tb=icons
+setglobal tb=text
+setglobal tb=horiz
+setglobal tb=tooltips
+setglobal tb=icons,text
+silent! call assert_fails('set toolbar=xxx')
+silent! call assert_fails('setlocal toolbar=xxx')
+silent! call assert_fails('setglobal toolbar=xxx')
+silent! call assert_fails('set tb=xxx')
+silent! call assert_fails('setlocal tb=xxx')
+silent! call assert_fails('setglobal tb=xxx')
+set toolbar&
+set tb&
+if exists('l:saved')
+let [&g:toolbar, &l:toolbar] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_toolbariconsize()
+if exists('+toolbariconsize') && execute('set!') =~# '\n..toolbariconsize\([=\n]\|$\)'
+let l:saved = [&g:toolbariconsize, &l:toolbariconsize]
+endif
+if exists('+toolbariconsize')
+set toolbariconsize=
+set toolbariconsize=tiny
+set toolbariconsize=small
+set toolbariconsize=medium
+set toolbariconsize=large
+set toolbariconsize=huge
+set toolbariconsize=giant
+setlocal toolbariconsize=
+setlocal toolbariconsize=tiny
+setlocal toolbariconsize=small
+setlocal toolbariconsize=medium
+setlocal toolbariconsize=large
+setlocal toolbariconsize=huge
+setlocal toolbariconsize=giant
+setglobal toolbariconsize=
+setglobal toolbariconsize=tiny
+setglobal toolbariconsize=small
+setglobal toolbariconsize=medium
+setglobal toolbariconsize=large
+setglobal toolbariconsize=huge
+setglobal toolbariconsize=giant
+set tbis=
+set tbis=tiny
+set tbis=small
+set tbis=medium
+set tbis=large
+set tbis=huge
+set tbis=giant
+setlocal tbis=
+setlocal tbis=tiny
+setlocal tbis=small
+setlocal tbis=medium
+setlocal tbis=large
+setlocal tbis=huge
+setlocal tbis=giant
+setglobal tbis=
+setglobal tbis=tiny
+setglobal tbis=small
+setglobal tbis=medium
+setglobal tbis=large
+setglobal tbis=huge
+setglobal tbis=giant
+silent! call assert_fails('set toolbariconsize=xxx')
+silent! call assert_fails('setlocal toolbariconsize=xxx')
+silent! call assert_fails('setglobal toolbariconsize=xxx')
+silent! call assert_fails('set tbis=xxx')
+silent! call assert_fails('setlocal tbis=xxx')
+silent! call assert_fails('setglobal tbis=xxx')
+set toolbariconsize&
+set tbis&
+if exists('l:saved')
+let [&g:toolbariconsize, &l:toolbariconsize] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ttimeout()
+if exists('+ttimeout') && execute('set!') =~# '\n..ttimeout\([=\n]\|$\)'
+let l:saved = [&g:ttimeout, &l:ttimeout]
+endif
+if exists('+ttimeout')
+set ttimeout
+set nottimeout
+set invttimeout
+set ttimeout!
+setlocal ttimeout
+setlocal nottimeout
+setlocal invttimeout
+setlocal ttimeout!
+setglobal ttimeout
+setglobal nottimeout
+setglobal invttimeout
+setglobal ttimeout!
+set ttimeout
+set nottimeout
+set invttimeout
+set ttimeout!
+setlocal ttimeout
+setlocal nottimeout
+setlocal invttimeout
+setlocal ttimeout!
+setglobal ttimeout
+setglobal nottimeout
+setglobal invttimeout
+setglobal ttimeout!
+set ttimeout&
+set ttimeout&
+if exists('l:saved')
+let [&g:ttimeout, &l:ttimeout] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ttimeoutlen()
+if exists('+ttimeoutlen') && execute('set!') =~# '\n..ttimeoutlen\([=\n]\|$\)'
+let l:saved = [&g:ttimeoutlen, &l:ttimeoutlen]
+endif
+if exists('+ttimeoutlen')
+set ttimeoutlen=-1
+set ttimeoutlen=0
+set ttimeoutlen=100
+setlocal ttimeoutlen=-1
+setlocal ttimeoutlen=0
+setlocal ttimeoutlen=100
+setglobal ttimeoutlen=-1
+setglobal ttimeoutlen=0
+setglobal ttimeoutlen=100
+set ttm=-1
+set ttm=0
+set ttm=100
+setlocal ttm=-1
+setlocal ttm=0
+setlocal ttm=100
+setglobal ttm=-1
+setglobal ttm=0
+setglobal ttm=100
+silent! call assert_fails('set ttimeoutlen=')
+silent! call assert_fails('setlocal ttimeoutlen=')
+silent! call assert_fails('setglobal ttimeoutlen=')
+silent! call assert_fails('set ttm=')
+silent! call assert_fails('setlocal ttm=')
+silent! call assert_fails('setglobal ttm=')
+set ttimeoutlen&
+set ttm&
+if exists('l:saved')
+let [&g:ttimeoutlen, &l:ttimeoutlen] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ttybuiltin()
+if exists('+ttybuiltin') && execute('set!') =~# '\n..ttybuiltin\([=\n]\|$\)'
+let l:saved = [&g:ttybuiltin, &l:ttybuiltin]
+endif
+if exists('+ttybuiltin')
+set ttybuiltin
+set nottybuiltin
+set invttybuiltin
+set ttybuiltin!
+setlocal ttybuiltin
+setlocal nottybuiltin
+setlocal invttybuiltin
+setlocal ttybuiltin!
+setglobal ttybuiltin
+setglobal nottybuiltin
+setglobal invttybuiltin
+setglobal ttybuiltin!
+set tbi
+set notbi
+set invtbi
+set tbi!
+setlocal tbi
+setlocal notbi
+setlocal invtbi
+setlocal tbi!
+setglobal tbi
+setglobal notbi
+setglobal invtbi
+setglobal tbi!
+set ttybuiltin&
+set tbi&
+if exists('l:saved')
+let [&g:ttybuiltin, &l:ttybuiltin] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ttyfast()
+if exists('+ttyfast') && execute('set!') =~# '\n..ttyfast\([=\n]\|$\)'
+let l:saved = [&g:ttyfast, &l:ttyfast]
+endif
+if exists('+ttyfast')
+set ttyfast
+set nottyfast
+set invttyfast
+set ttyfast!
+setlocal ttyfast
+setlocal nottyfast
+setlocal invttyfast
+setlocal ttyfast!
+setglobal ttyfast
+setglobal nottyfast
+setglobal invttyfast
+setglobal ttyfast!
+set tf
+set notf
+set invtf
+set tf!
+setlocal tf
+setlocal notf
+setlocal invtf
+setlocal tf!
+setglobal tf
+setglobal notf
+setglobal invtf
+setglobal tf!
+set ttyfast&
+set tf&
+if exists('l:saved')
+let [&g:ttyfast, &l:ttyfast] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ttymouse()
+if exists('+ttymouse') && execute('set!') =~# '\n..ttymouse\([=\n]\|$\)'
+let l:saved = [&g:ttymouse, &l:ttymouse]
+endif
+if exists('+ttymouse')
+set ttymouse=
+set ttymouse=xterm
+setlocal ttymouse=
+setlocal ttymouse=xterm
+setglobal ttymouse=
+setglobal ttymouse=xterm
+set ttym=
+set ttym=xterm
+setlocal ttym=
+setlocal ttym=xterm
+setglobal ttym=
+setglobal ttym=xterm
+silent! call assert_fails('set ttymouse=xxx')
+silent! call assert_fails('setlocal ttymouse=xxx')
+silent! call assert_fails('setglobal ttymouse=xxx')
+silent! call assert_fails('set ttym=xxx')
+silent! call assert_fails('setlocal ttym=xxx')
+silent! call assert_fails('setglobal ttym=xxx')
+set ttymouse&
+set ttym&
+if exists('l:saved')
+let [&g:ttymouse, &l:ttymouse] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_ttyscroll()
+if exists('+ttyscroll') && execute('set!') =~# '\n..ttyscroll\([=\n]\|$\)'
+let l:saved = [&g:ttyscroll, &l:ttyscroll]
+endif
+if exists('+ttyscroll')
+set ttyscroll=-1
+set ttyscroll=0
+set ttyscroll=100
+setlocal ttyscroll=-1
+setlocal ttyscroll=0
+setlocal ttyscroll=100
+setglobal ttyscroll=-1
+setglobal ttyscroll=0
+setglobal ttyscroll=100
+set tsl=-1
+set tsl=0
+set tsl=100
+setlocal tsl=-1
+setlocal tsl=0
+setlocal tsl=100
+setglobal tsl=-1
+setglobal tsl=0
+setglobal tsl=100
+silent! call assert_fails('set ttyscroll=')
+silent! call assert_fails('setlocal ttyscroll=')
+silent! call assert_fails('setglobal ttyscroll=')
+silent! call assert_fails('set tsl=')
+silent! call assert_fails('setlocal tsl=')
+silent! call assert_fails('setglobal tsl=')
+set ttyscroll&
+set tsl&
+if exists('l:saved')
+let [&g:ttyscroll, &l:ttyscroll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_undodir()
+if exists('+undodir') && execute('set!') =~# '\n..undodir\([=\n]\|$\)'
+let l:saved = [&g:undodir, &l:undodir]
+endif
+if exists('+undodir')
+set undodir=
+set undodir=xxx
+setlocal undodir=
+setlocal undodir=xxx
+setglobal undodir=
+setglobal undodir=xxx
+set udir=
+set udir=xxx
+setlocal udir=
+setlocal udir=xxx
+setglobal udir=
+setglobal udir=xxx
+set undodir&
+set udir&
+if exists('l:saved')
+let [&g:undodir, &l:undodir] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_undofile()
+if exists('+undofile') && execute('set!') =~# '\n..undofile\([=\n]\|$\)'
+let l:saved = [&g:undofile, &l:undofile]
+endif
+if exists('+undofile')
+set undofile
+set noundofile
+set invundofile
+set undofile!
+setlocal undofile
+setlocal noundofile
+setlocal invundofile
+setlocal undofile!
+setglobal undofile
+setglobal noundofile
+setglobal invundofile
+setglobal undofile!
+set udf
+set noudf
+set invudf
+set udf!
+setlocal udf
+setlocal noudf
+setlocal invudf
+setlocal udf!
+setglobal udf
+setglobal noudf
+setglobal invudf
+setglobal udf!
+set undofile&
+set udf&
+if exists('l:saved')
+let [&g:undofile, &l:undofile] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_undolevels()
+if exists('+undolevels') && execute('set!') =~# '\n..undolevels\([=\n]\|$\)'
+let l:saved = [&g:undolevels, &l:undolevels]
+endif
+if exists('+undolevels')
+set undolevels=-1
+set undolevels=0
+set undolevels=100
+setlocal undolevels=-1
+setlocal undolevels=0
+setlocal undolevels=100
+setglobal undolevels=-1
+setglobal undolevels=0
+setglobal undolevels=100
+setlocal undolevels=-123456
+call assert_equal(&g:undolevels, &undolevels)
+set ul=-1
+set ul=0
+set ul=100
+setlocal ul=-1
+setlocal ul=0
+setlocal ul=100
+setglobal ul=-1
+setglobal ul=0
+setglobal ul=100
+setlocal ul=-123456
+call assert_equal(&g:undolevels, &undolevels)
+silent! call assert_fails('set undolevels=')
+silent! call assert_fails('setlocal undolevels=')
+silent! call assert_fails('setglobal undolevels=')
+silent! call assert_fails('set ul=')
+silent! call assert_fails('setlocal ul=')
+silent! call assert_fails('setglobal ul=')
+set undolevels&
+set ul&
+if exists('l:saved')
+let [&g:undolevels, &l:undolevels] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_undomaxmem()
+if exists('+undomaxmem') && execute('set!') =~# '\n..undomaxmem\([=\n]\|$\)'
+let l:saved = [&g:undomaxmem, &l:undomaxmem]
+endif
+if exists('+undomaxmem')
+set undomaxmem=0
+set undomaxmem=1
+set undomaxmem=100
+set undomaxmem=99999
+setlocal undomaxmem=0
+setlocal undomaxmem=1
+setlocal undomaxmem=100
+setlocal undomaxmem=99999
+setglobal undomaxmem=0
+setglobal undomaxmem=1
+setglobal undomaxmem=100
+setglobal undomaxmem=99999
+set umm=0
+set umm=1
+set umm=100
+set umm=99999
+setlocal umm=0
+setlocal umm=1
+setlocal umm=100
+setlocal umm=99999
+setglobal umm=0
+setglobal umm=1
+setglobal umm=100
+setglobal umm=99999
+silent! call assert_fails('set undomaxmem=-1')
+silent! call assert_fails('setlocal undomaxmem=-1')
+silent! call assert_fails('setglobal undomaxmem=-1')
+silent! call assert_fails('set umm=-1')
+silent! call assert_fails('setlocal umm=-1')
+silent! call assert_fails('setglobal umm=-1')
+set undomaxmem&
+set umm&
+if exists('l:saved')
+let [&g:undomaxmem, &l:undomaxmem] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_undoreload()
+if exists('+undoreload') && execute('set!') =~# '\n..undoreload\([=\n]\|$\)'
+let l:saved = [&g:undoreload, &l:undoreload]
+endif
+if exists('+undoreload')
+set undoreload=-1
+set undoreload=0
+set undoreload=100
+setlocal undoreload=-1
+setlocal undoreload=0
+setlocal undoreload=100
+setglobal undoreload=-1
+setglobal undoreload=0
+setglobal undoreload=100
+set ur=-1
+set ur=0
+set ur=100
+setlocal ur=-1
+setlocal ur=0
+setlocal ur=100
+setglobal ur=-1
+setglobal ur=0
+setglobal ur=100
+silent! call assert_fails('set undoreload=')
+silent! call assert_fails('setlocal undoreload=')
+silent! call assert_fails('setglobal undoreload=')
+silent! call assert_fails('set ur=')
+silent! call assert_fails('setlocal ur=')
+silent! call assert_fails('setglobal ur=')
+set undoreload&
+set ur&
+if exists('l:saved')
+let [&g:undoreload, &l:undoreload] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_updatecount()
+if exists('+updatecount') && execute('set!') =~# '\n..updatecount\([=\n]\|$\)'
+let l:saved = [&g:updatecount, &l:updatecount]
+endif
+if exists('+updatecount')
+set updatecount=0
+set updatecount=1
+set updatecount=8
+set updatecount=9999
+setlocal updatecount=0
+setlocal updatecount=1
+setlocal updatecount=8
+setlocal updatecount=9999
+setglobal updatecount=0
+setglobal updatecount=1
+setglobal updatecount=8
+setglobal updatecount=9999
+set uc=0
+set uc=1
+set uc=8
+set uc=9999
+setlocal uc=0
+setlocal uc=1
+setlocal uc=8
+setlocal uc=9999
+setglobal uc=0
+setglobal uc=1
+setglobal uc=8
+setglobal uc=9999
+silent! call assert_fails('set updatecount=-1')
+silent! call assert_fails('setlocal updatecount=-1')
+silent! call assert_fails('setglobal updatecount=-1')
+silent! call assert_fails('set uc=-1')
+silent! call assert_fails('setlocal uc=-1')
+silent! call assert_fails('setglobal uc=-1')
+set updatecount&
+set uc&
+if exists('l:saved')
+let [&g:updatecount, &l:updatecount] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_updatetime()
+if exists('+updatetime') && execute('set!') =~# '\n..updatetime\([=\n]\|$\)'
+let l:saved = [&g:updatetime, &l:updatetime]
+endif
+if exists('+updatetime')
+set updatetime=0
+set updatetime=1
+set updatetime=8
+set updatetime=9999
+setlocal updatetime=0
+setlocal updatetime=1
+setlocal updatetime=8
+setlocal updatetime=9999
+setglobal updatetime=0
+setglobal updatetime=1
+setglobal updatetime=8
+setglobal updatetime=9999
+set ut=0
+set ut=1
+set ut=8
+set ut=9999
+setlocal ut=0
+setlocal ut=1
+setlocal ut=8
+setlocal ut=9999
+setglobal ut=0
+setglobal ut=1
+setglobal ut=8
+setglobal ut=9999
+silent! call assert_fails('set updatetime=-1')
+silent! call assert_fails('setlocal updatetime=-1')
+silent! call assert_fails('setglobal updatetime=-1')
+silent! call assert_fails('set ut=-1')
+silent! call assert_fails('setlocal ut=-1')
+silent! call assert_fails('setglobal ut=-1')
+set updatetime&
+set ut&
+if exists('l:saved')
+let [&g:updatetime, &l:updatetime] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_varsofttabstop()
+if exists('+varsofttabstop') && execute('set!') =~# '\n..varsofttabstop\([=\n]\|$\)'
+let l:saved = [&g:varsofttabstop, &l:varsofttabstop]
+endif
+if exists('+varsofttabstop')
+set varsofttabstop=8
+set varsofttabstop=4,8,16,32
+setlocal varsofttabstop=8
+setlocal varsofttabstop=4,8,16,32
+setglobal varsofttabstop=8
+setglobal varsofttabstop=4,8,16,32
+set vsts=8
+set vsts=4,8,16,32
+setlocal vsts=8
+setlocal vsts=4,8,16,32
+setglobal vsts=8
+setglobal vsts=4,8,16,32
+silent! call assert_fails('set varsofttabstop=xxx')
+silent! call assert_fails('set varsofttabstop=-1')
+silent! call assert_fails('set varsofttabstop=4,-1,20')
+silent! call assert_fails('set varsofttabstop=1,')
+silent! call assert_fails('setlocal varsofttabstop=xxx')
+silent! call assert_fails('setlocal varsofttabstop=-1')
+silent! call assert_fails('setlocal varsofttabstop=4,-1,20')
+silent! call assert_fails('setlocal varsofttabstop=1,')
+silent! call assert_fails('setglobal varsofttabstop=xxx')
+silent! call assert_fails('setglobal varsofttabstop=-1')
+silent! call assert_fails('setglobal varsofttabstop=4,-1,20')
+silent! call assert_fails('setglobal varsofttabstop=1,')
+silent! call assert_fails('set vsts=xxx')
+silent! call assert_fails('set vsts=-1')
+silent! call assert_fails('set vsts=4,-1,20')
+silent! call assert_fails('set vsts=1,')
+silent! call assert_fails('setlocal vsts=xxx')
+silent! call assert_fails('setlocal vsts=-1')
+silent! call assert_fails('setlocal vsts=4,-1,20')
+silent! call assert_fails('setlocal vsts=1,')
+silent! call assert_fails('setglobal vsts=xxx')
+silent! call assert_fails('setglobal vsts=-1')
+silent! call assert_fails('setglobal vsts=4,-1,20')
+silent! call assert_fails('setglobal vsts=1,')
+set varsofttabstop&
+set vsts&
+if exists('l:saved')
+let [&g:varsofttabstop, &l:varsofttabstop] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_vartabstop()
+if exists('+vartabstop') && execute('set!') =~# '\n..vartabstop\([=\n]\|$\)'
+let l:saved = [&g:vartabstop, &l:vartabstop]
+endif
+if exists('+vartabstop')
+set vartabstop=8
+set vartabstop=4,8,16,32
+setlocal vartabstop=8
+setlocal vartabstop=4,8,16,32
+setglobal vartabstop=8
+setglobal vartabstop=4,8,16,32
+set vts=8
+set vts=4,8,16,32
+setlocal vts=8
+setlocal vts=4,8,16,32
+setglobal vts=8
+setglobal vts=4,8,16,32
+silent! call assert_fails('set vartabstop=xxx')
+silent! call assert_fails('set vartabstop=-1')
+silent! call assert_fails('set vartabstop=4,-1,20')
+silent! call assert_fails('set vartabstop=1,')
+silent! call assert_fails('setlocal vartabstop=xxx')
+silent! call assert_fails('setlocal vartabstop=-1')
+silent! call assert_fails('setlocal vartabstop=4,-1,20')
+silent! call assert_fails('setlocal vartabstop=1,')
+silent! call assert_fails('setglobal vartabstop=xxx')
+silent! call assert_fails('setglobal vartabstop=-1')
+silent! call assert_fails('setglobal vartabstop=4,-1,20')
+silent! call assert_fails('setglobal vartabstop=1,')
+silent! call assert_fails('set vts=xxx')
+silent! call assert_fails('set vts=-1')
+silent! call assert_fails('set vts=4,-1,20')
+silent! call assert_fails('set vts=1,')
+silent! call assert_fails('setlocal vts=xxx')
+silent! call assert_fails('setlocal vts=-1')
+silent! call assert_fails('setlocal vts=4,-1,20')
+silent! call assert_fails('setlocal vts=1,')
+silent! call assert_fails('setglobal vts=xxx')
+silent! call assert_fails('setglobal vts=-1')
+silent! call assert_fails('setglobal vts=4,-1,20')
+silent! call assert_fails('setglobal vts=1,')
+set vartabstop&
+set vts&
+if exists('l:saved')
+let [&g:vartabstop, &l:vartabstop] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_verbose()
+if exists('+verbose') && execute('set!') =~# '\n..verbose\([=\n]\|$\)'
+let l:saved = [&g:verbose, &l:verbose]
+endif
+if exists('+verbose')
+set verbose=-1
+set verbose=0
+set verbose=1
+set verbose=8
+set verbose=9999
+setlocal verbose=-1
+setlocal verbose=0
+setlocal verbose=1
+setlocal verbose=8
+setlocal verbose=9999
+setglobal verbose=-1
+setglobal verbose=0
+setglobal verbose=1
+setglobal verbose=8
+setglobal verbose=9999
+set vbs=-1
+set vbs=0
+set vbs=1
+set vbs=8
+set vbs=9999
+setlocal vbs=-1
+setlocal vbs=0
+setlocal vbs=1
+setlocal vbs=8
+setlocal vbs=9999
+setglobal vbs=-1
+setglobal vbs=0
+setglobal vbs=1
+setglobal vbs=8
+setglobal vbs=9999
+silent! call assert_fails('set verbose=')
+silent! call assert_fails('setlocal verbose=')
+silent! call assert_fails('setglobal verbose=')
+silent! call assert_fails('set vbs=')
+silent! call assert_fails('setlocal vbs=')
+silent! call assert_fails('setglobal vbs=')
+set verbose&
+set vbs&
+if exists('l:saved')
+let [&g:verbose, &l:verbose] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_verbosefile()
+if exists('+verbosefile') && execute('set!') =~# '\n..verbosefile\([=\n]\|$\)'
+let l:saved = [&g:verbosefile, &l:verbosefile]
+endif
+if exists('+verbosefile')
+set verbosefile=
+set verbosefile=./Xfile
+setlocal verbosefile=
+setlocal verbosefile=./Xfile
+setglobal verbosefile=
+setglobal verbosefile=./Xfile
+set vfile=
+set vfile=./Xfile
+setlocal vfile=
+setlocal vfile=./Xfile
+setglobal vfile=
+setglobal vfile=./Xfile
+set verbosefile&
+set vfile&
+if exists('l:saved')
+let [&g:verbosefile, &l:verbosefile] = l:saved
+endif
+endif
+call delete("Xfile")
+endfunc
+func Test_opt_set_viewdir()
+if exists('+viewdir') && execute('set!') =~# '\n..viewdir\([=\n]\|$\)'
+let l:saved = [&g:viewdir, &l:viewdir]
+endif
+if exists('+viewdir')
+set viewdir=
+set viewdir=xxx
+setlocal viewdir=
+setlocal viewdir=xxx
+setglobal viewdir=
+setglobal viewdir=xxx
+set vdir=
+set vdir=xxx
+setlocal vdir=
+setlocal vdir=xxx
+setglobal vdir=
+setglobal vdir=xxx
+set viewdir&
+set vdir&
+if exists('l:saved')
+let [&g:viewdir, &l:viewdir] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_viewoptions()
+if exists('+viewoptions') && execute('set!') =~# '\n..viewoptions\([=\n]\|$\)'
+let l:saved = [&g:viewoptions, &l:viewoptions]
+endif
+if exists('+viewoptions')
+set viewoptions=
+set viewoptions=cursor
+set viewoptions=folds
+set viewoptions=options
+set viewoptions=localoptions
+set viewoptions=slash
+set viewoptions=unix
+set viewoptions=curdir
+set viewoptions=unix,slash
+setlocal viewoptions=
+setlocal viewoptions=cursor
+setlocal viewoptions=folds
+setlocal viewoptions=options
+setlocal viewoptions=localoptions
+setlocal viewoptions=slash
+setlocal viewoptions=unix
+setlocal viewoptions=curdir
+setlocal viewoptions=unix,slash
+setglobal viewoptions=
+setglobal viewoptions=cursor
+setglobal viewoptions=folds
+setglobal viewoptions=options
+setglobal viewoptions=localoptions
+setglobal viewoptions=slash
+setglobal viewoptions=unix
+setglobal viewoptions=curdir
+setglobal viewoptions=unix,slash
+set vop=
+set vop=cursor
+set vop=folds
+set vop=options
+set vop=localoptions
+set vop=slash
+set vop=unix
+set vop=curdir
+set vop=unix,slash
+setlocal vop=
+setlocal vop=cursor
+setlocal vop=folds
+setlocal vop=options
+setlocal vop=localoptions
+setlocal vop=slash
+setlocal vop=unix
+setlocal vop=curdir
+setlocal vop=unix,slash
+setglobal vop=
+setglobal vop=cursor
+setglobal vop=folds
+setglobal vop=options
+setglobal vop=localoptions
+setglobal vop=slash
+setglobal vop=unix
+setglobal vop=curdir
+setglobal vop=unix,slash
+silent! call assert_fails('set viewoptions=xxx')
+silent! call assert_fails('setlocal viewoptions=xxx')
+silent! call assert_fails('setglobal viewoptions=xxx')
+silent! call assert_fails('set vop=xxx')
+silent! call assert_fails('setlocal vop=xxx')
+silent! call assert_fails('setglobal vop=xxx')
+set viewoptions&
+set vop&
+if exists('l:saved')
+let [&g:viewoptions, &l:viewoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_viminfo()
+if exists('+viminfo') && execute('set!') =~# '\n..viminfo\([=\n]\|$\)'
+let l:saved = [&g:viminfo, &l:viminfo]
+endif
+if exists('+viminfo')
+set viminfo=
+set viminfo='50
+set viminfo="30
+set viminfo='100,<50,s10,h
+setlocal viminfo=
+setlocal viminfo='50
+setlocal viminfo="30
+setlocal viminfo='100,<50,s10,h
+setglobal viminfo=
+setglobal viminfo='50
+setglobal viminfo="30
+setglobal viminfo='100,<50,s10,h
+set vi=
+set vi='50
+set vi="30
+set vi='100,<50,s10,h
+setlocal vi=
+setlocal vi='50
+setlocal vi="30
+setlocal vi='100,<50,s10,h
+setglobal vi=
+setglobal vi='50
+setglobal vi="30
+setglobal vi='100,<50,s10,h
+silent! call assert_fails('set viminfo=xxx')
+silent! call assert_fails('set viminfo=h')
+silent! call assert_fails('setlocal viminfo=xxx')
+silent! call assert_fails('setlocal viminfo=h')
+silent! call assert_fails('setglobal viminfo=xxx')
+silent! call assert_fails('setglobal viminfo=h')
+silent! call assert_fails('set vi=xxx')
+silent! call assert_fails('set vi=h')
+silent! call assert_fails('setlocal vi=xxx')
+silent! call assert_fails('setlocal vi=h')
+silent! call assert_fails('setglobal vi=xxx')
+silent! call assert_fails('setglobal vi=h')
+set viminfo&
+set vi&
+if exists('l:saved')
+let [&g:viminfo, &l:viminfo] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_viminfofile()
+if exists('+viminfofile') && execute('set!') =~# '\n..viminfofile\([=\n]\|$\)'
+let l:saved = [&g:viminfofile, &l:viminfofile]
+endif
+if exists('+viminfofile')
+set viminfofile=
+set viminfofile=xxx
+setlocal viminfofile=
+setlocal viminfofile=xxx
+setglobal viminfofile=
+setglobal viminfofile=xxx
+set vif=
+set vif=xxx
+setlocal vif=
+setlocal vif=xxx
+setglobal vif=
+setglobal vif=xxx
+set viminfofile&
+set vif&
+if exists('l:saved')
+let [&g:viminfofile, &l:viminfofile] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_virtualedit()
+if exists('+virtualedit') && execute('set!') =~# '\n..virtualedit\([=\n]\|$\)'
+let l:saved = [&g:virtualedit, &l:virtualedit]
+endif
+if exists('+virtualedit')
+set virtualedit=
+set virtualedit=block
+set virtualedit=insert
+set virtualedit=all
+set virtualedit=onemore
+set virtualedit=none
+set virtualedit=NONE
+set virtualedit=all,block
+setlocal virtualedit=
+setlocal virtualedit=block
+setlocal virtualedit=insert
+setlocal virtualedit=all
+setlocal virtualedit=onemore
+setlocal virtualedit=none
+setlocal virtualedit=NONE
+setlocal virtualedit=all,block
+setglobal virtualedit=
+setglobal virtualedit=block
+setglobal virtualedit=insert
+setglobal virtualedit=all
+setglobal virtualedit=onemore
+setglobal virtualedit=none
+setglobal virtualedit=NONE
+setglobal virtualedit=all,block
+setlocal virtualedit=
+call assert_equal(&g:virtualedit, &virtualedit)
+set ve=
+set ve=block
+set ve=insert
+set ve=all
+set ve=onemore
+set ve=none
+set ve=NONE
+set ve=all,block
+setlocal ve=
+setlocal ve=block
+setlocal ve=insert
+setlocal ve=all
+setlocal ve=onemore
+setlocal ve=none
+setlocal ve=NONE
+setlocal ve=all,block
+setglobal ve=
+setglobal ve=block
+setglobal ve=insert
+setglobal ve=all
+setglobal ve=onemore
+setglobal ve=none
+setglobal ve=NONE
+setglobal ve=all,block
+setlocal ve=
+call assert_equal(&g:virtualedit, &virtualedit)
+silent! call assert_fails('set virtualedit=xxx')
+silent! call assert_fails('setlocal virtualedit=xxx')
+silent! call assert_fails('setglobal virtualedit=xxx')
+silent! call assert_fails('set ve=xxx')
+silent! call assert_fails('setlocal ve=xxx')
+silent! call assert_fails('setglobal ve=xxx')
+set virtualedit&
+set ve&
+if exists('l:saved')
+let [&g:virtualedit, &l:virtualedit] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_visualbell()
+if exists('+visualbell') && execute('set!') =~# '\n..visualbell\([=\n]\|$\)'
+let l:saved = [&g:visualbell, &l:visualbell]
+endif
+if exists('+visualbell')
+set visualbell
+set novisualbell
+set invvisualbell
+set visualbell!
+setlocal visualbell
+setlocal novisualbell
+setlocal invvisualbell
+setlocal visualbell!
+setglobal visualbell
+setglobal novisualbell
+setglobal invvisualbell
+setglobal visualbell!
+set vb
+set novb
+set invvb
+set vb!
+setlocal vb
+setlocal novb
+setlocal invvb
+setlocal vb!
+setglobal vb
+setglobal novb
+setglobal invvb
+setglobal vb!
+set visualbell&
+set vb&
+if exists('l:saved')
+let [&g:visualbell, &l:visualbell] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_w1200()
+if exists('+w1200') && execute('set!') =~# '\n..w1200\([=\n]\|$\)'
+let l:saved = [&g:w1200, &l:w1200]
+endif
+if exists('+w1200')
+set w1200=-1
+set w1200=0
+set w1200=100
+setlocal w1200=-1
+setlocal w1200=0
+setlocal w1200=100
+setglobal w1200=-1
+setglobal w1200=0
+setglobal w1200=100
+set w1200=-1
+set w1200=0
+set w1200=100
+setlocal w1200=-1
+setlocal w1200=0
+setlocal w1200=100
+setglobal w1200=-1
+setglobal w1200=0
+setglobal w1200=100
+silent! call assert_fails('set w1200=')
+silent! call assert_fails('setlocal w1200=')
+silent! call assert_fails('setglobal w1200=')
+silent! call assert_fails('set w1200=')
+silent! call assert_fails('setlocal w1200=')
+silent! call assert_fails('setglobal w1200=')
+set w1200&
+set w1200&
+if exists('l:saved')
+let [&g:w1200, &l:w1200] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_w300()
+if exists('+w300') && execute('set!') =~# '\n..w300\([=\n]\|$\)'
+let l:saved = [&g:w300, &l:w300]
+endif
+if exists('+w300')
+set w300=-1
+set w300=0
+set w300=100
+setlocal w300=-1
+setlocal w300=0
+setlocal w300=100
+setglobal w300=-1
+setglobal w300=0
+setglobal w300=100
+set w300=-1
+set w300=0
+set w300=100
+setlocal w300=-1
+setlocal w300=0
+setlocal w300=100
+setglobal w300=-1
+setglobal w300=0
+setglobal w300=100
+silent! call assert_fails('set w300=')
+silent! call assert_fails('setlocal w300=')
+silent! call assert_fails('setglobal w300=')
+silent! call assert_fails('set w300=')
+silent! call assert_fails('setlocal w300=')
+silent! call assert_fails('setglobal w300=')
+set w300&
+set w300&
+if exists('l:saved')
+let [&g:w300, &l:w300] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_w9600()
+if exists('+w9600') && execute('set!') =~# '\n..w9600\([=\n]\|$\)'
+let l:saved = [&g:w9600, &l:w9600]
+endif
+if exists('+w9600')
+set w9600=-1
+set w9600=0
+set w9600=100
+setlocal w9600=-1
+setlocal w9600=0
+setlocal w9600=100
+setglobal w9600=-1
+setglobal w9600=0
+setglobal w9600=100
+set w9600=-1
+set w9600=0
+set w9600=100
+setlocal w9600=-1
+setlocal w9600=0
+setlocal w9600=100
+setglobal w9600=-1
+setglobal w9600=0
+setglobal w9600=100
+silent! call assert_fails('set w9600=')
+silent! call assert_fails('setlocal w9600=')
+silent! call assert_fails('setglobal w9600=')
+silent! call assert_fails('set w9600=')
+silent! call assert_fails('setlocal w9600=')
+silent! call assert_fails('setglobal w9600=')
+set w9600&
+set w9600&
+if exists('l:saved')
+let [&g:w9600, &l:w9600] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_warn()
+if exists('+warn') && execute('set!') =~# '\n..warn\([=\n]\|$\)'
+let l:saved = [&g:warn, &l:warn]
+endif
+if exists('+warn')
+set warn
+set nowarn
+set invwarn
+set warn!
+setlocal warn
+setlocal nowarn
+setlocal invwarn
+setlocal warn!
+setglobal warn
+setglobal nowarn
+setglobal invwarn
+setglobal warn!
+set warn
+set nowarn
+set invwarn
+set warn!
+setlocal warn
+setlocal nowarn
+setlocal invwarn
+setlocal warn!
+setglobal warn
+setglobal nowarn
+setglobal invwarn
+setglobal warn!
+set warn&
+set warn&
+if exists('l:saved')
+let [&g:warn, &l:warn] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_weirdinvert()
+if exists('+weirdinvert') && execute('set!') =~# '\n..weirdinvert\([=\n]\|$\)'
+let l:saved = [&g:weirdinvert, &l:weirdinvert]
+endif
+if exists('+weirdinvert')
+set weirdinvert
+set noweirdinvert
+set invweirdinvert
+set weirdinvert!
+setlocal weirdinvert
+setlocal noweirdinvert
+setlocal invweirdinvert
+setlocal weirdinvert!
+setglobal weirdinvert
+setglobal noweirdinvert
+setglobal invweirdinvert
+setglobal weirdinvert!
+set wiv
+set nowiv
+set invwiv
+set wiv!
+setlocal wiv
+setlocal nowiv
+setlocal invwiv
+setlocal wiv!
+setglobal wiv
+setglobal nowiv
+setglobal invwiv
+setglobal wiv!
+set weirdinvert&
+set wiv&
+if exists('l:saved')
+let [&g:weirdinvert, &l:weirdinvert] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_whichwrap()
+if exists('+whichwrap') && execute('set!') =~# '\n..whichwrap\([=\n]\|$\)'
+let l:saved = [&g:whichwrap, &l:whichwrap]
+endif
+if exists('+whichwrap')
+set whichwrap=
+set whichwrap=b
+set whichwrap=s
+set whichwrap=h
+set whichwrap=l
+set whichwrap=<
+set whichwrap=>
+set whichwrap=~
+set whichwrap=[
+set whichwrap=]
+set whichwrap=b,s
+set whichwrap=bs
+setlocal whichwrap=
+setlocal whichwrap=b
+setlocal whichwrap=s
+setlocal whichwrap=h
+setlocal whichwrap=l
+setlocal whichwrap=<
+setlocal whichwrap=>
+setlocal whichwrap=~
+setlocal whichwrap=[
+setlocal whichwrap=]
+setlocal whichwrap=b,s
+setlocal whichwrap=bs
+setglobal whichwrap=
+setglobal whichwrap=b
+setglobal whichwrap=s
+setglobal whichwrap=h
+setglobal whichwrap=l
+setglobal whichwrap=<
+setglobal whichwrap=>
+setglobal whichwrap=~
+setglobal whichwrap=[
+setglobal whichwrap=]
+setglobal whichwrap=b,s
+setglobal whichwrap=bs
+set ww=
+set ww=b
+set ww=s
+set ww=h
+set ww=l
+set ww=<
+set ww=>
+set ww=~
+set ww=[
+set ww=]
+set ww=b,s
+set ww=bs
+setlocal ww=
+setlocal ww=b
+setlocal ww=s
+setlocal ww=h
+setlocal ww=l
+setlocal ww=<
+setlocal ww=>
+setlocal ww=~
+setlocal ww=[
+setlocal ww=]
+setlocal ww=b,s
+setlocal ww=bs
+setglobal ww=
+setglobal ww=b
+setglobal ww=s
+setglobal ww=h
+setglobal ww=l
+setglobal ww=<
+setglobal ww=>
+setglobal ww=~
+setglobal ww=[
+setglobal ww=]
+setglobal ww=b,s
+setglobal ww=bs
+silent! call assert_fails('set whichwrap=xxx')
+silent! call assert_fails('setlocal whichwrap=xxx')
+silent! call assert_fails('setglobal whichwrap=xxx')
+silent! call assert_fails('set ww=xxx')
+silent! call assert_fails('setlocal ww=xxx')
+silent! call assert_fails('setglobal ww=xxx')
+set whichwrap&
+set ww&
+if exists('l:saved')
+let [&g:whichwrap, &l:whichwrap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wildchar()
+if exists('+wildchar') && execute('set!') =~# '\n..wildchar\([=\n]\|$\)'
+let l:saved = [&g:wildchar, &l:wildchar]
+endif
+if exists('+wildchar')
+set wildchar=-1
+set wildchar=0
+set wildchar=100
+set wildchar=x
+set wildchar=^Y
+set wildchar=^@
+set wildchar=<Esc>
+set wildchar=<t_xx>
+set wildchar=<
+set wildchar=^
+setlocal wildchar=-1
+setlocal wildchar=0
+setlocal wildchar=100
+setlocal wildchar=x
+setlocal wildchar=^Y
+setlocal wildchar=^@
+setlocal wildchar=<Esc>
+setlocal wildchar=<t_xx>
+setlocal wildchar=<
+setlocal wildchar=^
+setglobal wildchar=-1
+setglobal wildchar=0
+setglobal wildchar=100
+setglobal wildchar=x
+setglobal wildchar=^Y
+setglobal wildchar=^@
+setglobal wildchar=<Esc>
+setglobal wildchar=<t_xx>
+setglobal wildchar=<
+setglobal wildchar=^
+set wc=-1
+set wc=0
+set wc=100
+set wc=x
+set wc=^Y
+set wc=^@
+set wc=<Esc>
+set wc=<t_xx>
+set wc=<
+set wc=^
+setlocal wc=-1
+setlocal wc=0
+setlocal wc=100
+setlocal wc=x
+setlocal wc=^Y
+setlocal wc=^@
+setlocal wc=<Esc>
+setlocal wc=<t_xx>
+setlocal wc=<
+setlocal wc=^
+setglobal wc=-1
+setglobal wc=0
+setglobal wc=100
+setglobal wc=x
+setglobal wc=^Y
+setglobal wc=^@
+setglobal wc=<Esc>
+setglobal wc=<t_xx>
+setglobal wc=<
+setglobal wc=^
+silent! call assert_fails('set wildchar=')
+silent! call assert_fails('set wildchar=xxx')
+silent! call assert_fails('set wildchar=<xxx>')
+silent! call assert_fails('set wildchar=<t_xxx>')
+silent! call assert_fails('set wildchar=<Esc')
+silent! call assert_fails('set wildchar=<t_xx')
+silent! call assert_fails('set wildchar=<C-C>')
+silent! call assert_fails('set wildchar=<NL>')
+silent! call assert_fails('set wildchar=<CR>')
+silent! call assert_fails('set wildchar=-16715')
+silent! call assert_fails('setlocal wildchar=')
+silent! call assert_fails('setlocal wildchar=xxx')
+silent! call assert_fails('setlocal wildchar=<xxx>')
+silent! call assert_fails('setlocal wildchar=<t_xxx>')
+silent! call assert_fails('setlocal wildchar=<Esc')
+silent! call assert_fails('setlocal wildchar=<t_xx')
+silent! call assert_fails('setlocal wildchar=<C-C>')
+silent! call assert_fails('setlocal wildchar=<NL>')
+silent! call assert_fails('setlocal wildchar=<CR>')
+silent! call assert_fails('setlocal wildchar=-16715')
+silent! call assert_fails('setglobal wildchar=')
+silent! call assert_fails('setglobal wildchar=xxx')
+silent! call assert_fails('setglobal wildchar=<xxx>')
+silent! call assert_fails('setglobal wildchar=<t_xxx>')
+silent! call assert_fails('setglobal wildchar=<Esc')
+silent! call assert_fails('setglobal wildchar=<t_xx')
+silent! call assert_fails('setglobal wildchar=<C-C>')
+silent! call assert_fails('setglobal wildchar=<NL>')
+silent! call assert_fails('setglobal wildchar=<CR>')
+silent! call assert_fails('setglobal wildchar=-16715')
+silent! call assert_fails('set wc=')
+silent! call assert_fails('set wc=xxx')
+silent! call assert_fails('set wc=<xxx>')
+silent! call assert_fails('set wc=<t_xxx>')
+silent! call assert_fails('set wc=<Esc')
+silent! call assert_fails('set wc=<t_xx')
+silent! call assert_fails('set wc=<C-C>')
+silent! call assert_fails('set wc=<NL>')
+silent! call assert_fails('set wc=<CR>')
+silent! call assert_fails('set wc=-16715')
+silent! call assert_fails('setlocal wc=')
+silent! call assert_fails('setlocal wc=xxx')
+silent! call assert_fails('setlocal wc=<xxx>')
+silent! call assert_fails('setlocal wc=<t_xxx>')
+silent! call assert_fails('setlocal wc=<Esc')
+silent! call assert_fails('setlocal wc=<t_xx')
+silent! call assert_fails('setlocal wc=<C-C>')
+silent! call assert_fails('setlocal wc=<NL>')
+silent! call assert_fails('setlocal wc=<CR>')
+silent! call assert_fails('setlocal wc=-16715')
+silent! call assert_fails('setglobal wc=')
+silent! call assert_fails('setglobal wc=xxx')
+silent! call assert_fails('setglobal wc=<xxx>')
+silent! call assert_fails('setglobal wc=<t_xxx>')
+silent! call assert_fails('setglobal wc=<Esc')
+silent! call assert_fails('setglobal wc=<t_xx')
+silent! call assert_fails('setglobal wc=<C-C>')
+silent! call assert_fails('setglobal wc=<NL>')
+silent! call assert_fails('setglobal wc=<CR>')
+silent! call assert_fails('setglobal wc=-16715')
+set wildchar&
+set wc&
+if exists('l:saved')
+let [&g:wildchar, &l:wildchar] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wildcharm()
+if exists('+wildcharm') && execute('set!') =~# '\n..wildcharm\([=\n]\|$\)'
+let l:saved = [&g:wildcharm, &l:wildcharm]
+endif
+if exists('+wildcharm')
+set wildcharm=-1
+set wildcharm=0
+set wildcharm=100
+set wildcharm=x
+set wildcharm=^Y
+set wildcharm=^@
+set wildcharm=<Esc>
+set wildcharm=<
+set wildcharm=^
+setlocal wildcharm=-1
+setlocal wildcharm=0
+setlocal wildcharm=100
+setlocal wildcharm=x
+setlocal wildcharm=^Y
+setlocal wildcharm=^@
+setlocal wildcharm=<Esc>
+setlocal wildcharm=<
+setlocal wildcharm=^
+setglobal wildcharm=-1
+setglobal wildcharm=0
+setglobal wildcharm=100
+setglobal wildcharm=x
+setglobal wildcharm=^Y
+setglobal wildcharm=^@
+setglobal wildcharm=<Esc>
+setglobal wildcharm=<
+setglobal wildcharm=^
+set wcm=-1
+set wcm=0
+set wcm=100
+set wcm=x
+set wcm=^Y
+set wcm=^@
+set wcm=<Esc>
+set wcm=<
+set wcm=^
+setlocal wcm=-1
+setlocal wcm=0
+setlocal wcm=100
+setlocal wcm=x
+setlocal wcm=^Y
+setlocal wcm=^@
+setlocal wcm=<Esc>
+setlocal wcm=<
+setlocal wcm=^
+setglobal wcm=-1
+setglobal wcm=0
+setglobal wcm=100
+setglobal wcm=x
+setglobal wcm=^Y
+setglobal wcm=^@
+setglobal wcm=<Esc>
+setglobal wcm=<
+setglobal wcm=^
+silent! call assert_fails('set wildcharm=')
+silent! call assert_fails('set wildcharm=xxx')
+silent! call assert_fails('set wildcharm=<xxx>')
+silent! call assert_fails('set wildcharm=<t_xxx>')
+silent! call assert_fails('set wildcharm=<Esc')
+silent! call assert_fails('set wildcharm=<t_xx')
+silent! call assert_fails('set wildcharm=<C-C>')
+silent! call assert_fails('set wildcharm=<NL>')
+silent! call assert_fails('set wildcharm=<CR>')
+silent! call assert_fails('set wildcharm=-16715')
+silent! call assert_fails('setlocal wildcharm=')
+silent! call assert_fails('setlocal wildcharm=xxx')
+silent! call assert_fails('setlocal wildcharm=<xxx>')
+silent! call assert_fails('setlocal wildcharm=<t_xxx>')
+silent! call assert_fails('setlocal wildcharm=<Esc')
+silent! call assert_fails('setlocal wildcharm=<t_xx')
+silent! call assert_fails('setlocal wildcharm=<C-C>')
+silent! call assert_fails('setlocal wildcharm=<NL>')
+silent! call assert_fails('setlocal wildcharm=<CR>')
+silent! call assert_fails('setlocal wildcharm=-16715')
+silent! call assert_fails('setglobal wildcharm=')
+silent! call assert_fails('setglobal wildcharm=xxx')
+silent! call assert_fails('setglobal wildcharm=<xxx>')
+silent! call assert_fails('setglobal wildcharm=<t_xxx>')
+silent! call assert_fails('setglobal wildcharm=<Esc')
+silent! call assert_fails('setglobal wildcharm=<t_xx')
+silent! call assert_fails('setglobal wildcharm=<C-C>')
+silent! call assert_fails('setglobal wildcharm=<NL>')
+silent! call assert_fails('setglobal wildcharm=<CR>')
+silent! call assert_fails('setglobal wildcharm=-16715')
+silent! call assert_fails('set wcm=')
+silent! call assert_fails('set wcm=xxx')
+silent! call assert_fails('set wcm=<xxx>')
+silent! call assert_fails('set wcm=<t_xxx>')
+silent! call assert_fails('set wcm=<Esc')
+silent! call assert_fails('set wcm=<t_xx')
+silent! call assert_fails('set wcm=<C-C>')
+silent! call assert_fails('set wcm=<NL>')
+silent! call assert_fails('set wcm=<CR>')
+silent! call assert_fails('set wcm=-16715')
+silent! call assert_fails('setlocal wcm=')
+silent! call assert_fails('setlocal wcm=xxx')
+silent! call assert_fails('setlocal wcm=<xxx>')
+silent! call assert_fails('setlocal wcm=<t_xxx>')
+silent! call assert_fails('setlocal wcm=<Esc')
+silent! call assert_fails('setlocal wcm=<t_xx')
+silent! call assert_fails('setlocal wcm=<C-C>')
+silent! call assert_fails('setlocal wcm=<NL>')
+silent! call assert_fails('setlocal wcm=<CR>')
+silent! call assert_fails('setlocal wcm=-16715')
+silent! call assert_fails('setglobal wcm=')
+silent! call assert_fails('setglobal wcm=xxx')
+silent! call assert_fails('setglobal wcm=<xxx>')
+silent! call assert_fails('setglobal wcm=<t_xxx>')
+silent! call assert_fails('setglobal wcm=<Esc')
+silent! call assert_fails('setglobal wcm=<t_xx')
+silent! call assert_fails('setglobal wcm=<C-C>')
+silent! call assert_fails('setglobal wcm=<NL>')
+silent! call assert_fails('setglobal wcm=<CR>')
+silent! call assert_fails('setglobal wcm=-16715')
+set wildcharm&
+set wcm&
+if exists('l:saved')
+let [&g:wildcharm, &l:wildcharm] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wildignore()
+if exists('+wildignore') && execute('set!') =~# '\n..wildignore\([=\n]\|$\)'
+let l:saved = [&g:wildignore, &l:wildignore]
+endif
+if exists('+wildignore')
+set wildignore=
+set wildignore=xxx
+setlocal wildignore=
+setlocal wildignore=xxx
+setglobal wildignore=
+setglobal wildignore=xxx
+set wig=
+set wig=xxx
+setlocal wig=
+setlocal wig=xxx
+setglobal wig=
+setglobal wig=xxx
+set wildignore&
+set wig&
+if exists('l:saved')
+let [&g:wildignore, &l:wildignore] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wildignorecase()
+if exists('+wildignorecase') && execute('set!') =~# '\n..wildignorecase\([=\n]\|$\)'
+let l:saved = [&g:wildignorecase, &l:wildignorecase]
+endif
+if exists('+wildignorecase')
+set wildignorecase
+set nowildignorecase
+set invwildignorecase
+set wildignorecase!
+setlocal wildignorecase
+setlocal nowildignorecase
+setlocal invwildignorecase
+setlocal wildignorecase!
+setglobal wildignorecase
+setglobal nowildignorecase
+setglobal invwildignorecase
+setglobal wildignorecase!
+set wic
+set nowic
+set invwic
+set wic!
+setlocal wic
+setlocal nowic
+setlocal invwic
+setlocal wic!
+setglobal wic
+setglobal nowic
+setglobal invwic
+setglobal wic!
+set wildignorecase&
+set wic&
+if exists('l:saved')
+let [&g:wildignorecase, &l:wildignorecase] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wildmenu()
+if exists('+wildmenu') && execute('set!') =~# '\n..wildmenu\([=\n]\|$\)'
+let l:saved = [&g:wildmenu, &l:wildmenu]
+endif
+if exists('+wildmenu')
+set wildmenu
+set nowildmenu
+set invwildmenu
+set wildmenu!
+setlocal wildmenu
+setlocal nowildmenu
+setlocal invwildmenu
+setlocal wildmenu!
+setglobal wildmenu
+setglobal nowildmenu
+setglobal invwildmenu
+setglobal wildmenu!
+set wmnu
+set nowmnu
+set invwmnu
+set wmnu!
+setlocal wmnu
+setlocal nowmnu
+setlocal invwmnu
+setlocal wmnu!
+setglobal wmnu
+setglobal nowmnu
+setglobal invwmnu
+setglobal wmnu!
+set wildmenu&
+set wmnu&
+if exists('l:saved')
+let [&g:wildmenu, &l:wildmenu] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wildmode()
+if exists('+wildmode') && execute('set!') =~# '\n..wildmode\([=\n]\|$\)'
+let l:saved = [&g:wildmode, &l:wildmode]
+endif
+if exists('+wildmode')
+set wildmode=
+set wildmode=full
+set wildmode=longest
+set wildmode=list
+set wildmode=lastused
+set wildmode=list:full
+set wildmode=noselect
+set wildmode=noselect,full
+set wildmode=noselect:lastused,full
+set wildmode=full,longest
+set wildmode=full,full,full,full
+setlocal wildmode=
+setlocal wildmode=full
+setlocal wildmode=longest
+setlocal wildmode=list
+setlocal wildmode=lastused
+setlocal wildmode=list:full
+setlocal wildmode=noselect
+setlocal wildmode=noselect,full
+setlocal wildmode=noselect:lastused,full
+setlocal wildmode=full,longest
+setlocal wildmode=full,full,full,full
+setglobal wildmode=
+setglobal wildmode=full
+setglobal wildmode=longest
+setglobal wildmode=list
+setglobal wildmode=lastused
+setglobal wildmode=list:full
+setglobal wildmode=noselect
+setglobal wildmode=noselect,full
+setglobal wildmode=noselect:lastused,full
+setglobal wildmode=full,longest
+setglobal wildmode=full,full,full,full
+set wim=
+set wim=full
+set wim=longest
+set wim=list
+set wim=lastused
+set wim=list:full
+set wim=noselect
+set wim=noselect,full
+set wim=noselect:lastused,full
+set wim=full,longest
+set wim=full,full,full,full
+setlocal wim=
+setlocal wim=full
+setlocal wim=longest
+setlocal wim=list
+setlocal wim=lastused
+setlocal wim=list:full
+setlocal wim=noselect
+setlocal wim=noselect,full
+setlocal wim=noselect:lastused,full
+setlocal wim=full,longest
+setlocal wim=full,full,full,full
+setglobal wim=
+setglobal wim=full
+setglobal wim=longest
+setglobal wim=list
+setglobal wim=lastused
+setglobal wim=list:full
+setglobal wim=noselect
+setglobal wim=noselect,full
+setglobal wim=noselect:lastused,full
+setglobal wim=full,longest
+setglobal wim=full,full,full,full
+silent! call assert_fails('set wildmode=xxx')
+silent! call assert_fails('set wildmode=a4')
+silent! call assert_fails('set wildmode=full,full,full,full,full')
+silent! call assert_fails('setlocal wildmode=xxx')
+silent! call assert_fails('setlocal wildmode=a4')
+silent! call assert_fails('setlocal wildmode=full,full,full,full,full')
+silent! call assert_fails('setglobal wildmode=xxx')
+silent! call assert_fails('setglobal wildmode=a4')
+silent! call assert_fails('setglobal wildmode=full,full,full,full,full')
+silent! call assert_fails('set wim=xxx')
+silent! call assert_fails('set wim=a4')
+silent! call assert_fails('set wim=full,full,full,full,full')
+silent! call assert_fails('setlocal wim=xxx')
+silent! call assert_fails('setlocal wim=a4')
+silent! call assert_fails('setlocal wim=full,full,full,full,full')
+silent! call assert_fails('setglobal wim=xxx')
+silent! call assert_fails('setglobal wim=a4')
+silent! call assert_fails('setglobal wim=full,full,full,full,full')
+set wildmode&
+set wim&
+if exists('l:saved')
+let [&g:wildmode, &l:wildmode] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wildoptions()
+if exists('+wildoptions') && execute('set!') =~# '\n..wildoptions\([=\n]\|$\)'
+let l:saved = [&g:wildoptions, &l:wildoptions]
+endif
+if exists('+wildoptions')
+set wildoptions=
+set wildoptions=tagfile
+set wildoptions=pum
+set wildoptions=fuzzy
+setlocal wildoptions=
+setlocal wildoptions=tagfile
+setlocal wildoptions=pum
+setlocal wildoptions=fuzzy
+setglobal wildoptions=
+setglobal wildoptions=tagfile
+setglobal wildoptions=pum
+setglobal wildoptions=fuzzy
+set wop=
+set wop=tagfile
+set wop=pum
+set wop=fuzzy
+setlocal wop=
+setlocal wop=tagfile
+setlocal wop=pum
+setlocal wop=fuzzy
+setglobal wop=
+setglobal wop=tagfile
+setglobal wop=pum
+setglobal wop=fuzzy
+silent! call assert_fails('set wildoptions=xxx')
+silent! call assert_fails('setlocal wildoptions=xxx')
+silent! call assert_fails('setglobal wildoptions=xxx')
+silent! call assert_fails('set wop=xxx')
+silent! call assert_fails('setlocal wop=xxx')
+silent! call assert_fails('setglobal wop=xxx')
+set wildoptions&
+set wop&
+if exists('l:saved')
+let [&g:wildoptions, &l:wildoptions] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winaltkeys()
+if exists('+winaltkeys') && execute('set!') =~# '\n..winaltkeys\([=\n]\|$\)'
+let l:saved = [&g:winaltkeys, &l:winaltkeys]
+endif
+if exists('+winaltkeys')
+set winaltkeys=no
+set winaltkeys=yes
+set winaltkeys=menu
+setlocal winaltkeys=no
+setlocal winaltkeys=yes
+setlocal winaltkeys=menu
+setglobal winaltkeys=no
+setglobal winaltkeys=yes
+setglobal winaltkeys=menu
+set wak=no
+set wak=yes
+set wak=menu
+setlocal wak=no
+setlocal wak=yes
+setlocal wak=menu
+setglobal wak=no
+setglobal wak=yes
+setglobal wak=menu
+silent! call assert_fails('set winaltkeys=')
+silent! call assert_fails('set winaltkeys=xxx')
+silent! call assert_fails('setlocal winaltkeys=')
+silent! call assert_fails('setlocal winaltkeys=xxx')
+silent! call assert_fails('setglobal winaltkeys=')
+silent! call assert_fails('setglobal winaltkeys=xxx')
+silent! call assert_fails('set wak=')
+silent! call assert_fails('set wak=xxx')
+silent! call assert_fails('setlocal wak=')
+silent! call assert_fails('setlocal wak=xxx')
+silent! call assert_fails('setglobal wak=')
+silent! call assert_fails('setglobal wak=xxx')
+set winaltkeys&
+set wak&
+if exists('l:saved')
+let [&g:winaltkeys, &l:winaltkeys] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wincolor()
+if exists('+wincolor') && execute('set!') =~# '\n..wincolor\([=\n]\|$\)'
+let l:saved = [&g:wincolor, &l:wincolor]
+endif
+if exists('+wincolor')
+set wincolor=
+set wincolor=xxx
+setlocal wincolor=
+setlocal wincolor=xxx
+setglobal wincolor=
+setglobal wincolor=xxx
+set wcr=
+set wcr=xxx
+setlocal wcr=
+setlocal wcr=xxx
+setglobal wcr=
+setglobal wcr=xxx
+set wincolor&
+set wcr&
+if exists('l:saved')
+let [&g:wincolor, &l:wincolor] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_window()
+if exists('+window') && execute('set!') =~# '\n..window\([=\n]\|$\)'
+let l:saved = [&g:window, &l:window]
+endif
+if exists('+window')
+set window=-1
+set window=0
+set window=100
+setlocal window=-1
+setlocal window=0
+setlocal window=100
+setglobal window=-1
+setglobal window=0
+setglobal window=100
+set wi=-1
+set wi=0
+set wi=100
+setlocal wi=-1
+setlocal wi=0
+setlocal wi=100
+setglobal wi=-1
+setglobal wi=0
+setglobal wi=100
+silent! call assert_fails('set window=')
+silent! call assert_fails('setlocal window=')
+silent! call assert_fails('setglobal window=')
+silent! call assert_fails('set wi=')
+silent! call assert_fails('setlocal wi=')
+silent! call assert_fails('setglobal wi=')
+set window&
+set wi&
+if exists('l:saved')
+let [&g:window, &l:window] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winfixbuf()
+if exists('+winfixbuf') && execute('set!') =~# '\n..winfixbuf\([=\n]\|$\)'
+let l:saved = [&g:winfixbuf, &l:winfixbuf]
+endif
+if exists('+winfixbuf')
+set winfixbuf
+set nowinfixbuf
+set invwinfixbuf
+set winfixbuf!
+setlocal winfixbuf
+setlocal nowinfixbuf
+setlocal invwinfixbuf
+setlocal winfixbuf!
+setglobal winfixbuf
+setglobal nowinfixbuf
+setglobal invwinfixbuf
+setglobal winfixbuf!
+set wfb
+set nowfb
+set invwfb
+set wfb!
+setlocal wfb
+setlocal nowfb
+setlocal invwfb
+setlocal wfb!
+setglobal wfb
+setglobal nowfb
+setglobal invwfb
+setglobal wfb!
+set winfixbuf&
+set wfb&
+if exists('l:saved')
+let [&g:winfixbuf, &l:winfixbuf] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winfixheight()
+if exists('+winfixheight') && execute('set!') =~# '\n..winfixheight\([=\n]\|$\)'
+let l:saved = [&g:winfixheight, &l:winfixheight]
+endif
+if exists('+winfixheight')
+set winfixheight
+set nowinfixheight
+set invwinfixheight
+set winfixheight!
+setlocal winfixheight
+setlocal nowinfixheight
+setlocal invwinfixheight
+setlocal winfixheight!
+setglobal winfixheight
+setglobal nowinfixheight
+setglobal invwinfixheight
+setglobal winfixheight!
+set wfh
+set nowfh
+set invwfh
+set wfh!
+setlocal wfh
+setlocal nowfh
+setlocal invwfh
+setlocal wfh!
+setglobal wfh
+setglobal nowfh
+setglobal invwfh
+setglobal wfh!
+set winfixheight&
+set wfh&
+if exists('l:saved')
+let [&g:winfixheight, &l:winfixheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winfixwidth()
+if exists('+winfixwidth') && execute('set!') =~# '\n..winfixwidth\([=\n]\|$\)'
+let l:saved = [&g:winfixwidth, &l:winfixwidth]
+endif
+if exists('+winfixwidth')
+set winfixwidth
+set nowinfixwidth
+set invwinfixwidth
+set winfixwidth!
+setlocal winfixwidth
+setlocal nowinfixwidth
+setlocal invwinfixwidth
+setlocal winfixwidth!
+setglobal winfixwidth
+setglobal nowinfixwidth
+setglobal invwinfixwidth
+setglobal winfixwidth!
+set wfw
+set nowfw
+set invwfw
+set wfw!
+setlocal wfw
+setlocal nowfw
+setlocal invwfw
+setlocal wfw!
+setglobal wfw
+setglobal nowfw
+setglobal invwfw
+setglobal wfw!
+set winfixwidth&
+set wfw&
+if exists('l:saved')
+let [&g:winfixwidth, &l:winfixwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winheight()
+if exists('+winheight') && execute('set!') =~# '\n..winheight\([=\n]\|$\)'
+let l:saved = [&g:winheight, &l:winheight]
+endif
+if exists('+winheight')
+set winheight=1
+set winheight=10
+set winheight=999
+setlocal winheight=1
+setlocal winheight=10
+setlocal winheight=999
+setglobal winheight=1
+setglobal winheight=10
+setglobal winheight=999
+set wh=1
+set wh=10
+set wh=999
+setlocal wh=1
+setlocal wh=10
+setlocal wh=999
+setglobal wh=1
+setglobal wh=10
+setglobal wh=999
+silent! call assert_fails('set winheight=-1')
+silent! call assert_fails('set winheight=0')
+silent! call assert_fails('setlocal winheight=-1')
+silent! call assert_fails('setlocal winheight=0')
+silent! call assert_fails('setglobal winheight=-1')
+silent! call assert_fails('setglobal winheight=0')
+silent! call assert_fails('set wh=-1')
+silent! call assert_fails('set wh=0')
+silent! call assert_fails('setlocal wh=-1')
+silent! call assert_fails('setlocal wh=0')
+silent! call assert_fails('setglobal wh=-1')
+silent! call assert_fails('setglobal wh=0')
+set winheight&
+set wh&
+if exists('l:saved')
+let [&g:winheight, &l:winheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winminheight()
+if exists('+winminheight') && execute('set!') =~# '\n..winminheight\([=\n]\|$\)'
+let l:saved = [&g:winminheight, &l:winminheight]
+endif
+if exists('+winminheight')
+set winminheight=0
+set winminheight=1
+setlocal winminheight=0
+setlocal winminheight=1
+setglobal winminheight=0
+setglobal winminheight=1
+set wmh=0
+set wmh=1
+setlocal wmh=0
+setlocal wmh=1
+setglobal wmh=0
+setglobal wmh=1
+silent! call assert_fails('set winminheight=-1')
+silent! call assert_fails('setlocal winminheight=-1')
+silent! call assert_fails('setglobal winminheight=-1')
+silent! call assert_fails('set wmh=-1')
+silent! call assert_fails('setlocal wmh=-1')
+silent! call assert_fails('setglobal wmh=-1')
+set winminheight&
+set wmh&
+if exists('l:saved')
+let [&g:winminheight, &l:winminheight] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winminwidth()
+if exists('+winminwidth') && execute('set!') =~# '\n..winminwidth\([=\n]\|$\)'
+let l:saved = [&g:winminwidth, &l:winminwidth]
+endif
+if exists('+winminwidth')
+set winminwidth=0
+set winminwidth=1
+set winminwidth=10
+setlocal winminwidth=0
+setlocal winminwidth=1
+setlocal winminwidth=10
+setglobal winminwidth=0
+setglobal winminwidth=1
+setglobal winminwidth=10
+set wmw=0
+set wmw=1
+set wmw=10
+setlocal wmw=0
+setlocal wmw=1
+setlocal wmw=10
+setglobal wmw=0
+setglobal wmw=1
+setglobal wmw=10
+silent! call assert_fails('set winminwidth=-1')
+silent! call assert_fails('setlocal winminwidth=-1')
+silent! call assert_fails('setglobal winminwidth=-1')
+silent! call assert_fails('set wmw=-1')
+silent! call assert_fails('setlocal wmw=-1')
+silent! call assert_fails('setglobal wmw=-1')
+set winminwidth&
+set wmw&
+if exists('l:saved')
+let [&g:winminwidth, &l:winminwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winptydll()
+if exists('+winptydll') && execute('set!') =~# '\n..winptydll\([=\n]\|$\)'
+let l:saved = [&g:winptydll, &l:winptydll]
+endif
+if exists('+winptydll')
+set winptydll=
+set winptydll=xxx
+setlocal winptydll=
+setlocal winptydll=xxx
+setglobal winptydll=
+setglobal winptydll=xxx
+set winptydll=
+set winptydll=xxx
+setlocal winptydll=
+setlocal winptydll=xxx
+setglobal winptydll=
+setglobal winptydll=xxx
+set winptydll&
+set winptydll&
+if exists('l:saved')
+let [&g:winptydll, &l:winptydll] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_winwidth()
+if exists('+winwidth') && execute('set!') =~# '\n..winwidth\([=\n]\|$\)'
+let l:saved = [&g:winwidth, &l:winwidth]
+endif
+if exists('+winwidth')
+set winwidth=1
+set winwidth=10
+set winwidth=999
+setlocal winwidth=1
+setlocal winwidth=10
+setlocal winwidth=999
+setglobal winwidth=1
+setglobal winwidth=10
+setglobal winwidth=999
+set wiw=1
+set wiw=10
+set wiw=999
+setlocal wiw=1
+setlocal wiw=10
+setlocal wiw=999
+setglobal wiw=1
+setglobal wiw=10
+setglobal wiw=999
+silent! call assert_fails('set winwidth=-1')
+silent! call assert_fails('set winwidth=0')
+silent! call assert_fails('setlocal winwidth=-1')
+silent! call assert_fails('setlocal winwidth=0')
+silent! call assert_fails('setglobal winwidth=-1')
+silent! call assert_fails('setglobal winwidth=0')
+silent! call assert_fails('set wiw=-1')
+silent! call assert_fails('set wiw=0')
+silent! call assert_fails('setlocal wiw=-1')
+silent! call assert_fails('setlocal wiw=0')
+silent! call assert_fails('setglobal wiw=-1')
+silent! call assert_fails('setglobal wiw=0')
+set winwidth&
+set wiw&
+if exists('l:saved')
+let [&g:winwidth, &l:winwidth] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wlseat()
+if exists('+wlseat') && execute('set!') =~# '\n..wlseat\([=\n]\|$\)'
+let l:saved = [&g:wlseat, &l:wlseat]
+endif
+if exists('+wlseat')
+set wlseat=
+set wlseat=xxx
+setlocal wlseat=
+setlocal wlseat=xxx
+setglobal wlseat=
+setglobal wlseat=xxx
+set wse=
+set wse=xxx
+setlocal wse=
+setlocal wse=xxx
+setglobal wse=
+setglobal wse=xxx
+set wlseat&
+set wse&
+if exists('l:saved')
+let [&g:wlseat, &l:wlseat] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wlsteal()
+if exists('+wlsteal') && execute('set!') =~# '\n..wlsteal\([=\n]\|$\)'
+let l:saved = [&g:wlsteal, &l:wlsteal]
+endif
+if exists('+wlsteal')
+set wlsteal
+set nowlsteal
+set invwlsteal
+set wlsteal!
+setlocal wlsteal
+setlocal nowlsteal
+setlocal invwlsteal
+setlocal wlsteal!
+setglobal wlsteal
+setglobal nowlsteal
+setglobal invwlsteal
+setglobal wlsteal!
+set wst
+set nowst
+set invwst
+set wst!
+setlocal wst
+setlocal nowst
+setlocal invwst
+setlocal wst!
+setglobal wst
+setglobal nowst
+setglobal invwst
+setglobal wst!
+set wlsteal&
+set wst&
+if exists('l:saved')
+let [&g:wlsteal, &l:wlsteal] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wltimeoutlen()
+if exists('+wltimeoutlen') && execute('set!') =~# '\n..wltimeoutlen\([=\n]\|$\)'
+let l:saved = [&g:wltimeoutlen, &l:wltimeoutlen]
+endif
+if exists('+wltimeoutlen')
+set wltimeoutlen=1
+set wltimeoutlen=10
+set wltimeoutlen=999
+setlocal wltimeoutlen=1
+setlocal wltimeoutlen=10
+setlocal wltimeoutlen=999
+setglobal wltimeoutlen=1
+setglobal wltimeoutlen=10
+setglobal wltimeoutlen=999
+set wtm=1
+set wtm=10
+set wtm=999
+setlocal wtm=1
+setlocal wtm=10
+setlocal wtm=999
+setglobal wtm=1
+setglobal wtm=10
+setglobal wtm=999
+silent! call assert_fails('set wltimeoutlen=-1')
+silent! call assert_fails('setlocal wltimeoutlen=-1')
+silent! call assert_fails('setglobal wltimeoutlen=-1')
+silent! call assert_fails('set wtm=-1')
+silent! call assert_fails('setlocal wtm=-1')
+silent! call assert_fails('setglobal wtm=-1')
+set wltimeoutlen&
+set wtm&
+if exists('l:saved')
+let [&g:wltimeoutlen, &l:wltimeoutlen] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wrap()
+if exists('+wrap') && execute('set!') =~# '\n..wrap\([=\n]\|$\)'
+let l:saved = [&g:wrap, &l:wrap]
+endif
+if exists('+wrap')
+set wrap
+set nowrap
+set invwrap
+set wrap!
+setlocal wrap
+setlocal nowrap
+setlocal invwrap
+setlocal wrap!
+setglobal wrap
+setglobal nowrap
+setglobal invwrap
+setglobal wrap!
+set wrap
+set nowrap
+set invwrap
+set wrap!
+setlocal wrap
+setlocal nowrap
+setlocal invwrap
+setlocal wrap!
+setglobal wrap
+setglobal nowrap
+setglobal invwrap
+setglobal wrap!
+set wrap&
+set wrap&
+if exists('l:saved')
+let [&g:wrap, &l:wrap] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wrapmargin()
+if exists('+wrapmargin') && execute('set!') =~# '\n..wrapmargin\([=\n]\|$\)'
+let l:saved = [&g:wrapmargin, &l:wrapmargin]
+endif
+if exists('+wrapmargin')
+set wrapmargin=-1
+set wrapmargin=0
+set wrapmargin=100
+setlocal wrapmargin=-1
+setlocal wrapmargin=0
+setlocal wrapmargin=100
+setglobal wrapmargin=-1
+setglobal wrapmargin=0
+setglobal wrapmargin=100
+set wm=-1
+set wm=0
+set wm=100
+setlocal wm=-1
+setlocal wm=0
+setlocal wm=100
+setglobal wm=-1
+setglobal wm=0
+setglobal wm=100
+silent! call assert_fails('set wrapmargin=')
+silent! call assert_fails('setlocal wrapmargin=')
+silent! call assert_fails('setglobal wrapmargin=')
+silent! call assert_fails('set wm=')
+silent! call assert_fails('setlocal wm=')
+silent! call assert_fails('setglobal wm=')
+set wrapmargin&
+set wm&
+if exists('l:saved')
+let [&g:wrapmargin, &l:wrapmargin] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_wrapscan()
+if exists('+wrapscan') && execute('set!') =~# '\n..wrapscan\([=\n]\|$\)'
+let l:saved = [&g:wrapscan, &l:wrapscan]
+endif
+if exists('+wrapscan')
+set wrapscan
+set nowrapscan
+set invwrapscan
+set wrapscan!
+setlocal wrapscan
+setlocal nowrapscan
+setlocal invwrapscan
+setlocal wrapscan!
+setglobal wrapscan
+setglobal nowrapscan
+setglobal invwrapscan
+setglobal wrapscan!
+set ws
+set nows
+set invws
+set ws!
+setlocal ws
+setlocal nows
+setlocal invws
+setlocal ws!
+setglobal ws
+setglobal nows
+setglobal invws
+setglobal ws!
+set wrapscan&
+set ws&
+if exists('l:saved')
+let [&g:wrapscan, &l:wrapscan] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_write()
+if exists('+write') && execute('set!') =~# '\n..write\([=\n]\|$\)'
+let l:saved = [&g:write, &l:write]
+endif
+if exists('+write')
+set write
+set nowrite
+set invwrite
+set write!
+setlocal write
+setlocal nowrite
+setlocal invwrite
+setlocal write!
+setglobal write
+setglobal nowrite
+setglobal invwrite
+setglobal write!
+set write
+set nowrite
+set invwrite
+set write!
+setlocal write
+setlocal nowrite
+setlocal invwrite
+setlocal write!
+setglobal write
+setglobal nowrite
+setglobal invwrite
+setglobal write!
+set write&
+set write&
+if exists('l:saved')
+let [&g:write, &l:write] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_writeany()
+if exists('+writeany') && execute('set!') =~# '\n..writeany\([=\n]\|$\)'
+let l:saved = [&g:writeany, &l:writeany]
+endif
+if exists('+writeany')
+set writeany
+set nowriteany
+set invwriteany
+set writeany!
+setlocal writeany
+setlocal nowriteany
+setlocal invwriteany
+setlocal writeany!
+setglobal writeany
+setglobal nowriteany
+setglobal invwriteany
+setglobal writeany!
+set wa
+set nowa
+set invwa
+set wa!
+setlocal wa
+setlocal nowa
+setlocal invwa
+setlocal wa!
+setglobal wa
+setglobal nowa
+setglobal invwa
+setglobal wa!
+set writeany&
+set wa&
+if exists('l:saved')
+let [&g:writeany, &l:writeany] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_writebackup()
+if exists('+writebackup') && execute('set!') =~# '\n..writebackup\([=\n]\|$\)'
+let l:saved = [&g:writebackup, &l:writebackup]
+endif
+if exists('+writebackup')
+set writebackup
+set nowritebackup
+set invwritebackup
+set writebackup!
+setlocal writebackup
+setlocal nowritebackup
+setlocal invwritebackup
+setlocal writebackup!
+setglobal writebackup
+setglobal nowritebackup
+setglobal invwritebackup
+setglobal writebackup!
+set wb
+set nowb
+set invwb
+set wb!
+setlocal wb
+setlocal nowb
+setlocal invwb
+setlocal wb!
+setglobal wb
+setglobal nowb
+setglobal invwb
+setglobal wb!
+set writebackup&
+set wb&
+if exists('l:saved')
+let [&g:writebackup, &l:writebackup] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_writedelay()
+if exists('+writedelay') && execute('set!') =~# '\n..writedelay\([=\n]\|$\)'
+let l:saved = [&g:writedelay, &l:writedelay]
+endif
+if exists('+writedelay')
+set writedelay=-1
+set writedelay=0
+set writedelay=100
+setlocal writedelay=-1
+setlocal writedelay=0
+setlocal writedelay=100
+setglobal writedelay=-1
+setglobal writedelay=0
+setglobal writedelay=100
+set wd=-1
+set wd=0
+set wd=100
+setlocal wd=-1
+setlocal wd=0
+setlocal wd=100
+setglobal wd=-1
+setglobal wd=0
+setglobal wd=100
+silent! call assert_fails('set writedelay=')
+silent! call assert_fails('setlocal writedelay=')
+silent! call assert_fails('setglobal writedelay=')
+silent! call assert_fails('set wd=')
+silent! call assert_fails('setlocal wd=')
+silent! call assert_fails('setglobal wd=')
+set writedelay&
+set wd&
+if exists('l:saved')
+let [&g:writedelay, &l:writedelay] = l:saved
+endif
+endif
+endfunc
+func Test_opt_set_xtermcodes()
+if exists('+xtermcodes') && execute('set!') =~# '\n..xtermcodes\([=\n]\|$\)'
+let l:saved = [&g:xtermcodes, &l:xtermcodes]
+endif
+if exists('+xtermcodes')
+set xtermcodes
+set noxtermcodes
+set invxtermcodes
+set xtermcodes!
+setlocal xtermcodes
+setlocal noxtermcodes
+setlocal invxtermcodes
+setlocal xtermcodes!
+setglobal xtermcodes
+setglobal noxtermcodes
+setglobal invxtermcodes
+setglobal xtermcodes!
+set xtermcodes
+set noxtermcodes
+set invxtermcodes
+set xtermcodes!
+setlocal xtermcodes
+setlocal noxtermcodes
+setlocal invxtermcodes
+setlocal xtermcodes!
+setglobal xtermcodes
+setglobal noxtermcodes
+setglobal invxtermcodes
+setglobal xtermcodes!
+set xtermcodes&
+set xtermcodes&
+if exists('l:saved')
+let [&g:xtermcodes, &l:xtermcodes] = l:saved
+endif
+endif
+endfunc
@@ -5501,4 +5501,61 @@ func Test_VimResized_and_window_width_not_equalized()
   call StopVimInTerminal(buf)
 endfunc
 
+" Simple patterns are matched without a regexp, check they match the same.
+func Test_autocmd_simple_patterns()
+  augroup testing
+    au!
+    au User * call add(g:matched, 'any')
+    au User **.c call add(g:matched, 'ext')
+    au User foo.c call add(g:matched, 'literal')
+    au User f?o.c call add(g:matched, 'regexp')
+    au User *.c* call add(g:matched, 'prefix')
+  augroup END
+
+  let save_fic = &fileignorecase
+  for [name, fic, expected] in [
+        \ ['foo.c', 0, ['any', 'ext', 'literal', 'regexp', 'prefix']],
+        \ ['Foo.C', 0, ['any']],
+        \ ['Foo.C', 1, ['any', 'ext', 'literal', 'regexp', 'prefix']],
+        \ ['xfoo.c', 0, ['any', 'ext', 'prefix']],
+        \ ['c', 0, ['any']],
+        \ ['.c', 0, ['any', 'ext', 'prefix']],
+        \ ['fo\u00f6.c', 1, ['any', 'ext', 'prefix']],
+        \ ['', 0, ['any']],
+        \ ]
+    let &fileignorecase = fic
+    let g:matched = []
+    exe 'doautocmd <nomodeline> User ' .. eval('"' .. name .. '"')
+    call assert_equal(expected, g:matched, name .. ' fic: ' .. fic)
+  endfor
+
+  let &fileignorecase = save_fic
+  unlet g:matched
+  call CleanUpTestAuGroup()
+endfunc
+
+func Test_autocmd_stats()
+  augroup testing
+    au!
+    au User Xmatch let g:user_count += 1
+  augroup END
+  let g:user_count = 0
+  let before = get(autocmd_stats(), 'User', #{count: 0, matched: 0})
+
+  doautocmd <nomodeline> User Xmatch
+  doautocmd <nomodeline> User Xnomatch
+  call assert_equal(1, g:user_count)
+
+  let stats = autocmd_stats().User
+  call assert_equal(['count', 'exectime', 'matched', 'matchtime'],
+        \ sort(keys(stats)))
+  call assert_equal(before.count + 2, stats.count)
+  call assert_equal(before.matched + 1, stats.matched)
+  call assert_equal(v:t_float, type(stats.matchtime))
+  call assert_equal(v:t_float, type(stats.exectime))
+
+  unlet g:user_count
+  call CleanUpTestAuGroup()
+endfunc
+
 " vim: shiftwidth=2 sts=2 expandtab
@@ -0,0 +1,38 @@
+" Test for benchmarking fuzzy matching while a pattern is typed
+
+CheckFeature reltime
+
+func s:Report(what, query, start)
+  let s = a:what .. ', query: ' .. a:query ..
+        \ ', time: ' .. reltimestr(reltime(a:start))
+  call writefile([s], 'benchmark.out', "a")
+endfunc
+
+" Match the list for every prefix of "query", as a fuzzy finder does for
+" each typed character.
+func s:Measure(list, query)
+  call writefile(['items: ' .. len(a:list)], 'benchmark.out', "a")
+  for i in range(1, len(a:query))
+    let q = a:query[: i - 1]
+    let start = reltime()
+    call matchfuzzy(a:list, q)
+    call s:Report('all', q, start)
+    let start = reltime()
+    call matchfuzzypos(a:list, q, #{best: 20})
+    call s:Report('best 20', q, start)
+  endfor
+endfunc
+
+func Test_Fuzzy_Benchmark()
+  let dirs = ['src', 'src/testdir', 'runtime/doc', 'runtime/syntax',
+        \ 'runtime/autoload/dist', 'src/libvterm/src', 'pixmaps', 'nsis/lang']
+  let words = ['buffer', 'window', 'option', 'filepath', 'findfile', 'search',
+        \ 'syntax', 'quickfix', 'channel', 'terminal', 'popup', 'undo']
+  let list = range(200000)->map({i, _ -> dirs[i % len(dirs)] .. '/'
+        \ .. words[i % len(words)] .. '_' .. words[(i / 7) % len(words)]
+        \ .. i .. '.vim'})
+  call s:Measure(list, 'srcfndfl12')
+  call s:Measure(list, 'rtdocxyz')
+endfunc
+
+" vim: shiftwidth=2 sts=2 expandtab
@@ -0,0 +1,61 @@
+" Test for benchmarking quickfix lists with many entries
+
+CheckFeature quickfix
+CheckFeature reltime
+
+func s:Report(what, count, start)
+  let s = a:what .. ', entries: ' .. a:count ..
+        \ ', time: ' .. reltimestr(reltime(a:start))
+  call writefile([s], 'benchmark.out', "a")
+endfunc
+
+func s:Measure(count)
+  call setqflist([], 'f')
+  let items = range(1, a:count)
+        \ ->map({_, v -> #{filename: 'Xbench' .. (v / 1000) .. '.c',
+        \                  lnum: v % 1000 + 1, text: 'error ' .. v}})
+
+  " Append the entries in chunks, like :caddexpr while a build is running.
+  let start = reltime()
+  call setqflist([], ' ', #{title: 'bench'})
+  for i in range(0, a:count - 1, 1000)
+    call setqflist([], 'a', #{items: items[i : i + 999]})
+  endfor
+  call s:Report('append', a:count, start)
+  call assert_equal(a:count, getqflist(#{size: 0}).size)
+
+  " Jump to entries far apart, without editing the file.
+  let start = reltime()
+  for i in range(1000)
+    call setqflist([], 'a', #{idx: (i * 7919) % a:count + 1})
+  endfor
+  call s:Report('set idx', a:count, start)
+
+  let start = reltime()
+  for i in range(1000)
+    call getqflist(#{idx: (i * 7919) % a:count + 1, items: 0})
+  endfor
+  call s:Report('get idx', a:count, start)
+
+  " Open the quickfix window, then jump around in it.
+  let start = reltime()
+  copen
+  redraw
+  call s:Report('open window', a:count, start)
+  let start = reltime()
+  for i in range(200)
+    call setqflist([], 'a', #{idx: (i * 7919) % a:count + 1})
+    redraw
+  endfor
+  call s:Report('update window', a:count, start)
+  cclose
+
+  call setqflist([], 'f')
+endfunc
+
+func Test_Quickfix_Benchmark()
+  call s:Measure(100000)
+  call s:Measure(1000000)
+endfunc
+
+" vim: shiftwidth=2 sts=2 expandtab
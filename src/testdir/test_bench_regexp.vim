@@ -3,7 +3,7 @@
 CheckFeature reltime
 
 func Measure(file, pattern, arg)
-  for re in range(3)
+  for re in range(4)
     let sstart = reltime()
     let before = ['set re=' .. re]
     let after = ['call search("' .. escape(a:pattern, '\\') .. '", "", "", 10000)']
@@ -20,4 +20,28 @@ func Test_Regex_Benchmark()
   call Measure('samples/re.freeze.txt', '\s\+\%#\@<!$', '+5')
 endfunc
 
+" Patterns with literal text that every match contains, on a file where no
+" line matches.
+func Test_Regex_Literal_Benchmark()
+  call writefile(repeat(['some text without TODO in it ...',
+        \ '  let foo_baz = bar(foo)'], 100000), 'Xliteral.txt', 'D')
+  call Measure('Xliteral.txt', 'TODO.*urgent', '+1')
+  call Measure('Xliteral.txt', '\<foo_bar\w*(', '+1')
+  call Measure('Xliteral.txt', '\w\+ = bar\.', '+1')
+endfunc
+
+" Syntax highlighting of a C file, from the start to the end.
+func Test_Regex_Syntax_Benchmark()
+  for re in range(4)
+    let sstart = reltime()
+    let before = ['set re=' .. re, 'syntax on']
+    let after = ['syntax sync fromstart', 'call synID(line("$"), 1, 1)']
+    let after += ['quit!']
+    call RunVim(before, after, '../regexp_nfa.c')
+    let s = 'syntax file: ../regexp_nfa.c, re: ' .. re ..
+          \ ', time: ' .. reltimestr(reltime(sstart))
+    call writefile([s], 'benchmark.out', "a")
+  endfor
+endfunc
+
 " vim: shiftwidth=2 sts=2 expandtab
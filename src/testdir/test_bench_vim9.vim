@@ -0,0 +1,56 @@
+" Test for benchmarking member access in compiled Vim9 functions
+
+CheckFeature reltime
+
+def Test_Vim9_Member_Benchmark()
+  var lines =<< trim END
+      vim9script
+      def Report(what: string, start: list<any>)
+        writefile([what .. ', time: ' .. reltimestr(reltime(start))],
+              'benchmark.out', 'a')
+      enddef
+
+      class Pos
+        var line: number
+        var col: number
+        var bufnr: number
+        def new(this.line, this.col, this.bufnr)
+        enddef
+      endclass
+
+      def DictLoop(recs: list<dict<any>>): number
+        var total = 0
+        for r in recs
+          total += r.id + r.line + r.col + r.start + r.end
+        endfor
+        return total
+      enddef
+
+      def AnyLoop(items: list<any>): number
+        var total = 0
+        for o in items
+          total += o.line + o.col + o.bufnr
+        endfor
+        return total
+      enddef
+
+      var dicts = range(1000)->mapnew((i, _) => ({id: i, line: i % 100,
+            col: i % 7, kind: 'k', name: 'n' .. i, start: 1, end: 3}))
+      var starttime = reltime()
+      for i in range(1000)
+        DictLoop(dicts)
+      endfor
+      Report('dict.key', starttime)
+
+      var objects: list<any> = range(1000)->mapnew((i, _) => Pos.new(i, 2, 3))
+      starttime = reltime()
+      for i in range(1000)
+        AnyLoop(objects)
+      endfor
+      Report('any.member', starttime)
+  END
+  writefile(lines, 'XbenchVim9', 'D')
+  source XbenchVim9
+enddef
+
+" vim: shiftwidth=2 sts=2 expandtab
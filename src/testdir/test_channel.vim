@@ -948,6 +948,46 @@ func Test_pipe_both_to_buffer()
   endtry
 endfunc
 
+func Test_pipe_to_quickfix()
+  CheckFeature quickfix
+  call setqflist([], 'f')
+  call setqflist([], ' ', {'title': 'pipe-qf'})
+  let qfid = getqflist({'id': 0}).id
+  let save_efm = &efm
+  set efm=%f:%l:%m
+  let job = job_start(s:python . " test_channel_pipe.py",
+	\ {'out_io': 'quickfix', 'out_qfid': qfid, 'err_io': 'out'})
+  call assert_equal("run", job_status(job))
+  let handle = job_getchannel(job)
+  call assert_equal('quickfix', ch_info(handle).out_io)
+  try
+    call ch_sendraw(handle, "echo Xqf1.c:10:first\n")
+    call WaitForAssert({-> assert_equal(1, getqflist({'id': qfid, 'size': 0}).size)})
+    call ch_sendraw(handle, "echoerr Xqf2.c:20:second\n")
+    call ch_sendraw(handle, "echo not an error\n")
+    call WaitForAssert({-> assert_equal(3, getqflist({'id': qfid, 'size': 0}).size)})
+    let l = getqflist({'id': qfid, 'items': 0}).items
+    call assert_equal('Xqf1.c', bufname(l[0].bufnr))
+    call assert_equal(10, l[0].lnum)
+    call assert_equal('first', l[0].text)
+    call assert_equal(1, l[0].valid)
+    call assert_equal('Xqf2.c', bufname(l[1].bufnr))
+    call assert_equal(20, l[1].lnum)
+    call assert_equal('second', l[1].text)
+    call assert_equal(0, l[2].valid)
+    call assert_equal('not an error', l[2].text)
+    call assert_equal('pipe-qf', getqflist({'id': qfid, 'title': 0}).title)
+    call ch_sendraw(handle, "quit\n")
+  finally
+    call job_stop(job)
+    let &efm = save_efm
+    call setqflist([], 'f')
+  endtry
+
+  call assert_fails("call job_start('echo', {'out_io': 'quickfix', 'out_qfid': 0})", 'E475:')
+  call assert_fails("call job_start('echo', {'in_io': 'quickfix'})", 'E475:')
+endfunc
+
 func Run_test_pipe_from_buffer(use_name)
   sp pipe-input
   call setline(1, ['echo one', 'echo two', 'echo three'])
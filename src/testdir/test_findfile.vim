@@ -834,5 +834,142 @@ func Test_findfunc_callback()
   %bw!
 endfunc
 
+" Searching uses the remembered directory contents, changes must be noticed.
+func Test_findfile_dir_changed()
+  let save_path = &path
+  call mkdir('Xffcache/a/b', 'pR')
+  call writefile([], 'Xffcache/a/b/one.txt')
+  set path=Xffcache/**
+
+  call assert_match('Xffcache/a/b/one.txt$', findfile('one.txt'))
+  call assert_equal('', findfile('two.txt'))
+
+  call writefile([], 'Xffcache/a/b/two.txt')
+  call assert_match('Xffcache/a/b/two.txt$', findfile('two.txt'))
+  call delete('Xffcache/a/b/one.txt')
+  call assert_equal('', findfile('one.txt'))
+
+  call mkdir('Xffcache/a/b/Xsub')
+  call assert_match('Xffcache/a/b/Xsub$', finddir('Xsub'))
+  call assert_equal('', findfile('Xsub'))
+  call delete('Xffcache/a/b/Xsub', 'd')
+  call writefile([], 'Xffcache/a/b/Xsub')
+  call assert_equal('', finddir('Xsub'))
+  call assert_match('Xffcache/a/b/Xsub$', findfile('Xsub'))
+
+  if has('unix')
+    " The target of a symlink appears and disappears, the directory with the
+    " symlink does not change.
+    call mkdir('Xfftarget', 'R')
+    silent !ln -s ../../../Xfftarget/Xlinkfile Xffcache/a/b/Xlinkfile
+    silent !ln -s ../../../Xfftarget/Xlinkdir Xffcache/a/b/Xlinkdir
+    " make the directory look old, so that its listing is not read again
+    silent !touch -d 2001-01-01 Xffcache/a/b
+    call assert_equal('', findfile('Xlinkfile'))
+    call assert_equal('', finddir('Xlinkdir'))
+    call writefile([], 'Xfftarget/Xlinkfile')
+    call mkdir('Xfftarget/Xlinkdir')
+    call assert_match('Xffcache/a/b/Xlinkfile$', findfile('Xlinkfile'))
+    call assert_match('Xffcache/a/b/Xlinkdir$', finddir('Xlinkdir'))
+    call delete('Xfftarget/Xlinkfile')
+    call delete('Xfftarget/Xlinkdir', 'd')
+    call assert_equal('', findfile('Xlinkfile'))
+    call assert_equal('', finddir('Xlinkdir'))
+  endif
+
+  let &path = save_path
+endfunc
+
+" Wait for a typed character, giving 'pathidletime' a chance to do its work.
+func s:WaitForChar()
+  call timer_start(100, {-> test_feedinput('x')})
+  while getcharstr() != 'x'
+  endwhile
+endfunc
+
+func Test_pathidletime()
+  CheckFeature timers
+
+  let save_path = &path
+  call mkdir('Xffidle/a/b/c', 'pR')
+  call mkdir('Xffidle/.hidden', 'p')
+  call writefile([], 'Xffidle/a/b/c/deep.txt')
+  call writefile([], 'Xffidle/.hidden/deep.txt')
+
+  " Without 'pathidletime' nothing is read.
+  set path=Xffidle/**2
+  let before = test_getvalue('dir_cache_count')
+  call s:WaitForChar()
+  call assert_equal(before, test_getvalue('dir_cache_count'))
+
+  " "Xffidle", "a" and "b" are read, "c" is too deep.
+  set pathidletime=10
+  call s:WaitForChar()
+  if has('unix')
+    call assert_equal(before + 3, test_getvalue('dir_cache_count'))
+  endif
+  call assert_equal('', findfile('deep.txt'))
+
+  set path=Xffidle/**
+  call s:WaitForChar()
+  if has('unix')
+    call assert_equal(before + 4, test_getvalue('dir_cache_count'))
+  endif
+  call assert_match('Xffidle/a/b/c/deep.txt$', findfile('deep.txt'))
+  call assert_equal(['Xffidle/a/b/c/deep.txt'],
+        \ findfile('deep.txt', '', -1)->map({_, v -> fnamemodify(v, ':.')}))
+
+  " A change after reading the directories is noticed.
+  call writefile([], 'Xffidle/a/b/new.txt')
+  call assert_match('Xffidle/a/b/new.txt$', findfile('new.txt'))
+  call delete('Xffidle/a/b/c/deep.txt')
+  call delete('Xffidle/.hidden/deep.txt')
+  call assert_equal('', findfile('deep.txt'))
+
+  set pathidletime&
+  let &path = save_path
+endfunc
+
+" A tree with more entries and directories than the cache may hold.  Each
+" search drops the listings that were used least recently and uses the other
+" ones again.
+func Test_findfile_dir_cache_full()
+  CheckUnix
+
+  let save_path = &path
+  " Work in a directory with few entries, the listing of the current
+  " directory is cached as well.
+  call mkdir('Xffcap', 'R')
+  cd Xffcap
+  for i in range(30)
+    call mkdir('big/d' .. i, 'p')
+    for name in ['f.txt', 'g.txt', 'h.txt', 'i.txt']
+      call writefile([], 'big/d' .. i .. '/' .. name)
+    endfor
+  endfor
+  " make the directories look old, so that their listings are not read again
+  silent !touch -d 2001-01-01 big big/d*
+  call test_override('dir_cache_max', 100)
+
+  set path=big/**
+  call assert_equal(30, findfile('f.txt', '', -1)->len())
+  call assert_equal(30, findfile('g.txt', '', -1)->len())
+  call assert_inrange(1, 100, test_getvalue('dir_cache_count'))
+
+  " Add a file without changing the time of the directories: it is only
+  " found in the directories that are not read from the cache.
+  for i in range(30)
+    call writefile([], 'big/d' .. i .. '/new.txt')
+  endfor
+  silent !touch -d 2001-01-01 big big/d*
+  call assert_inrange(1, 29, findfile('new.txt', '', -1)->len())
+  silent !touch big/d*
+  call assert_equal(30, findfile('new.txt', '', -1)->len())
+
+  call test_override('dir_cache_max', 0)
+  cd ..
+  let &path = save_path
+endfunc
+
 
 " vim: shiftwidth=2 sts=2 expandtab
@@ -3594,6 +3594,149 @@ func Test_garbagecollect_now_fails()
   let v:testing = 1
 endfunc
 
+func Test_garbagecollect_info()
+  let info = garbagecollect_info()
+  call assert_equal(['count', 'freed', 'last', 'max', 'skipped', 'total'],
+        \ sort(keys(info)))
+
+  " A List and Dict referring to each other can only be freed by garbage
+  " collection.
+  let l = [1]
+  let d = #{list: l}
+  call add(l, d)
+  unlet l d
+  call test_garbagecollect_now()
+
+  let new = garbagecollect_info()
+  call assert_true(new.count > info.count)
+  call assert_true(new.freed > info.freed)
+  call assert_equal(v:t_float, type(new.last))
+  call assert_true(new.max >= new.last)
+  call assert_true(new.total >= new.max)
+  call assert_true(new.total >= info.total)
+endfunc
+
+" Return the count, skipped and freed values echoed by GcInfo() in the
+" terminal, -1 values when they are not displayed.
+func s:GcInfoOnScreen(buf)
+  let m = matchlist(term_getline(a:buf, 6), '^gc: \(\d\+\) \(\d\+\) \(\d\+\)')
+  return empty(m) ? [-1, -1, -1] : m[1 : 3]->map('str2nr(v:val)')
+endfunc
+
+" The collection done after waiting 'updatetime' for a key is skipped when
+" nothing can have become garbage since the previous one.
+func Test_garbagecollect_idle_skipped()
+  CheckRunVimInTerminal
+
+  let lines =<< trim END
+    set updatetime=50
+    func GcInfo()
+      let info = garbagecollect_info()
+      echo printf('gc: %d %d %d', info.count, info.skipped, info.freed)
+    endfunc
+  END
+  call writefile(lines, 'XgcIdle', 'D')
+  let buf = RunVimInTerminal('-S XgcIdle', #{rows: 6})
+  let GetInfo = {-> s:GcInfoOnScreen(buf)}
+
+  call TermWait(buf, 200)
+  call term_sendkeys(buf, ":call GcInfo()\<CR>")
+  call WaitForAssert({-> assert_notequal(-1, GetInfo()[0])})
+  let [gc_count, skipped, freed] = GetInfo()
+
+  " Calling GcInfo() may leave garbage, collected once.  Waiting twice more
+  " without running any command skips the collection.
+  call TermWait(buf, 200)
+  call term_sendkeys(buf, "\<Esc>")
+  call TermWait(buf, 200)
+  call term_sendkeys(buf, "\<Esc>")
+  call TermWait(buf, 200)
+  call term_sendkeys(buf, ":call GcInfo()\<CR>")
+  call WaitForAssert({-> assert_true(GetInfo()[1] >= skipped + 2)})
+  call assert_equal(gc_count + 1, GetInfo()[0])
+  let [gc_count, skipped, freed] = GetInfo()
+
+  " A List referring to itself is collected when waiting.
+  call term_sendkeys(buf, ":let l = [] | call add(l, l) | unlet l\<CR>")
+  call TermWait(buf, 200)
+  call term_sendkeys(buf, ":call GcInfo()\<CR>")
+  call WaitForAssert({-> assert_true(GetInfo()[0] > gc_count)})
+  call assert_true(GetInfo()[2] > freed)
+
+  call StopVimInTerminal(buf)
+endfunc
+
+func Test_trace()
+  let lines =<< trim END
+    vim9script
+    def Inner(): number
+      return 1
+    enddef
+    def Outer(): number
+      return Inner() + 1
+    enddef
+    func Legacy()
+      return 2
+    endfunc
+    augroup XtraceGroup
+      au User XtraceEvent g:trace_result = Outer() + Legacy()
+    augroup END
+    doautocmd User XtraceEvent
+    augroup XtraceGroup
+      au!
+    augroup END
+  END
+  call writefile(lines, 'Xtrace.vim', 'D')
+
+  call assert_equal('', trace_stop())
+  call trace_start('Xtrace.json')
+  source Xtrace.vim
+  call assert_equal('Xtrace.json', trace_stop())
+  call assert_equal('', trace_stop())
+  call assert_equal(4, g:trace_result)
+
+  let events = readfile('Xtrace.json')->join("\n")->json_decode()
+  call assert_equal('M', events[0].ph)
+  let spans = events[1 :]
+  call assert_equal(len(spans) / 2, spans->copy()->filter('v:val.ph == "B"')->len())
+  call assert_equal(['source Xtrace.vim', 'autocmd User', 'function Outer',
+        \ 'function Inner', 'function Legacy'],
+        \ spans->copy()->filter('v:val.ph == "B"')
+        \ ->map({_, e -> e.cat .. ' '
+        \        .. substitute(fnamemodify(e.name, ':t'), '<SNR>\d\+_', '', '')}))
+  call assert_equal('XtraceEvent', spans[1].args.detail)
+  call assert_true(spans[-1].ts >= spans[0].ts)
+
+  " A span that is still busy is ended by trace_stop().
+  func s:TraceAndStop()
+    return trace_stop()
+  endfunc
+  call trace_start('Xtrace.json')
+  call assert_equal('Xtrace.json', s:TraceAndStop())
+  let events = readfile('Xtrace.json')->join("\n")->json_decode()
+  call assert_equal(['M', 'B', 'E'], events->map('v:val.ph'))
+
+  if has('timers')
+    let g:trace_fired = 0
+    func s:TraceTimer(id)
+      let g:trace_fired = 1
+    endfunc
+    call trace_start('Xtrace.json')
+    call timer_start(0, 's:TraceTimer')
+    call WaitForAssert({-> assert_equal(1, g:trace_fired)})
+    call trace_stop()
+    let events = readfile('Xtrace.json')->join("\n")->json_decode()
+    call filter(events, {_, e -> get(e, 'cat', '') == 'timer'})
+    call assert_equal(1, events->filter('v:val.name =~ "TraceTimer$"')->len())
+    unlet g:trace_fired
+  endif
+
+  call assert_fails("call trace_start('')", 'E1175:')
+  call delete('Xtrace.json')
+  unlet g:trace_result
+  delfunc s:TraceAndStop
+endfunc
+
 func Test_echoraw()
   CheckScreendump
 
@@ -105,6 +105,55 @@ func Test_ins_complete()
   call delete('Xcpldir', 'rf')
 endfunc
 
+" Test for completing words from other buffers, which uses an index of the
+" words in those buffers.
+func Test_ins_complete_other_buffer()
+  func s:Items()
+    let s:items = complete_info(['items']).items->map('v:val.word')
+    return ''
+  endfunc
+
+  set hidden complete=b
+  new Xother
+  call setline(1, ['foo fooBar a中b x', 'FOO foobar', 'zfoo food', 'fooBar'])
+  new
+  call feedkeys("Sfo\<C-N>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo', 'fooBar', 'foobar', 'food'], s:items)
+  call feedkeys("Sfo\<C-P>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo', 'foobar', 'food', 'fooBar'], s:items)
+  set ignorecase
+  call feedkeys("SfO\<C-N>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo', 'fooBar', 'FOO', 'foobar', 'food'], s:items)
+  set ignorecase&
+
+  " all words, the one after "a" is skipped
+  call feedkeys("S\<C-N>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo', 'fooBar', 'a', 'FOO', 'foobar', 'zfoo', 'food'],
+        \ s:items)
+  set cpo-=c
+  call feedkeys("S\<C-N>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo', 'fooBar', 'a', '中', 'FOO', 'foobar', 'zfoo',
+        \ 'food'], s:items)
+  set cpo&
+
+  " changing the other buffer or its 'iskeyword'
+  call setbufline('Xother', 2, 'football')
+  call feedkeys("Sfoo\<C-N>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo', 'fooBar', 'football', 'food'], s:items)
+  call setbufvar('Xother', '&iskeyword', '@,48-57,_,192-255,-')
+  call setbufline('Xother', 1, 'foo-bar')
+  call feedkeys("Sfoo\<C-N>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo', 'football', 'food', 'fooBar'], s:items)
+  setlocal iskeyword=@,48-57,_,192-255,-
+  call feedkeys("Sfoo\<C-N>\<C-R>=s:Items()\<CR>\<Esc>", 'tx')
+  call assert_equal(['foo-bar', 'football', 'food', 'fooBar'], s:items)
+
+  bwipe!
+  bwipe! Xother
+  set hidden& complete&
+  delfunc s:Items
+endfunc
+
 func Test_ins_complete_invalid_byte()
   if has('unix') && executable('base64')
     " this weird command was causing an illegal memory access
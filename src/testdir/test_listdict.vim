@@ -233,6 +233,47 @@ func Test_list_items()
   call assert_fails('call items(3)', 'E1225:')
 endfunc
 
+" Getting an item far away from the last used index in a long list uses an
+" array of item pointers, check it is correct after changing the list.
+func Test_list_index_long_list()
+  func s:CheckItems(l)
+    " get the items by index in an order that jumps around
+    let got = map(range(0, len(a:l) - 1, 97), 'a:l[(v:val * 7) % len(a:l)]')
+    " get the same items by going over the list
+    let items = []
+    for [idx, val] in items(a:l)
+      let items += [[idx, val]]
+    endfor
+    let expected = map(range(0, len(a:l) - 1, 97),
+          \ 'items[(v:val * 7) % len(a:l)][1]')
+    call assert_equal(expected, got)
+  endfunc
+
+  let l = range(5000)
+  call s:CheckItems(l)
+  call extend(l, range(5000, 5999))
+  call s:CheckItems(l)
+  call insert(l, 'x', 2500)
+  call s:CheckItems(l)
+  call insert(l, 'y')
+  call s:CheckItems(l)
+  call remove(l, 1000, 1100)
+  call s:CheckItems(l)
+  call reverse(l)
+  call s:CheckItems(l)
+  call sort(l, 'N')
+  call s:CheckItems(l)
+  let l = sort(l + l)->uniq()
+  call s:CheckItems(l)
+  call filter(l, 'v:key % 3')
+  call s:CheckItems(l)
+  call flatten(insert(l, range(300), 1234))
+  call s:CheckItems(l)
+  call assert_equal(l[-1], l[len(l) - 1])
+
+  delfunc s:CheckItems
+endfunc
+
 func Test_string_items()
   let r = []
   let s = 'ábツ'
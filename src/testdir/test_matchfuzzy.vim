@@ -289,6 +289,34 @@ func Test_matchfuzzy_limit()
   call assert_equal([{'id': 5, 'val': 'crayon'}], l->matchfuzzy('c', #{key: 'val', limit: 1}))
 endfunc
 
+func Test_matchfuzzy_best()
+  let x = ['abc', 'xaxbxc', 'ab', 'abcd', 'axbc', 'abc']
+  call assert_equal(['abc', 'abc', 'abcd', 'axbc', 'xaxbxc'], x->matchfuzzy('abc'))
+  call assert_equal(['abc', 'abc', 'abcd', 'axbc', 'xaxbxc'], x->matchfuzzy('abc', #{best: 0}))
+  call assert_equal(['abc'], x->matchfuzzy('abc', #{best: 1}))
+  call assert_equal(['abc', 'abc', 'abcd'], x->matchfuzzy('abc', #{best: 3}))
+  call assert_equal(['abc', 'abc', 'abcd', 'axbc', 'xaxbxc'], x->matchfuzzy('abc', #{best: 10}))
+  " "limit" is applied first
+  call assert_equal(['abc', 'abcd'], x->matchfuzzy('abc', #{limit: 4, best: 2}))
+  call assert_fails("call matchfuzzy(x, 'abc', #{best: '2'})", 'E475:')
+
+  let expected = x->matchfuzzypos('abc')
+  call assert_equal([expected[0][: 1], expected[1][: 1], expected[2][: 1]],
+        \ x->matchfuzzypos('abc', #{best: 2}))
+
+  " the best matches of a long list, with many equal scores
+  let l = range(1000)->map({i, _ -> repeat('x', i % 37) .. 'a' .. repeat('y', i % 11) .. 'b'})
+  let all = l->matchfuzzypos('ab')
+  for n in [1, 7, 100, 999, 1000, 2000]
+    call assert_equal([all[0][: n - 1], all[1][: n - 1], all[2][: n - 1]],
+          \ l->matchfuzzypos('ab', #{best: n}))
+  endfor
+
+  let d = [{'id': 5, 'val': 'crayon'}, {'id': 6, 'val': 'camera'}]
+  call assert_equal([{'id': 6, 'val': 'camera'}], d->matchfuzzy('cam', #{key: 'val', best: 1}))
+  call assert_equal([{'id': 6, 'val': 'camera'}], d->matchfuzzy('cam', #{text_cb: {v -> v.val}, best: 1}))
+endfunc
+
 " This was using uninitialized memory
 func Test_matchfuzzy_initialized()
   CheckRunVimInTerminal
@@ -771,7 +771,7 @@ endfunc
 func Test_set_option_errors()
   call assert_fails('set scroll=-1', 'E49:')
   call assert_fails('set backupcopy=', 'E474:')
-  call assert_fails('set regexpengine=3', 'E474:')
+  call assert_fails('set regexpengine=4', 'E474:')
   call assert_fails('set history=10001', 'E474:')
   call assert_fails('set numberwidth=21', 'E474:')
   call assert_fails('set colorcolumn=-a', 'E474:')
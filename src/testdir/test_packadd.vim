@@ -410,6 +410,63 @@ func Test_runtime()
   call assert_equal('runstartfoostartoptxxxopt', g:sequence)
 endfunc
 
+" Directory listings are cached, changes must still be noticed.
+func Test_runtime_dir_changed()
+  let rundir = &packpath . '/runtime/extra'
+  call mkdir(rundir, 'p')
+  exe 'set rtp=' . &packpath . '/runtime'
+  call writefile(['let g:sequence .= "one"'], rundir . '/one.vim')
+  call writefile(['let g:sequence .= "hidden"'], rundir . '/.hidden.vim')
+
+  let g:sequence = ''
+  runtime! extra/*.vim
+  call assert_equal('one', g:sequence)
+
+  " changes in the same second
+  call writefile(['let g:sequence .= "two"'], rundir . '/two.vim')
+  let g:sequence = ''
+  runtime! extra/*.vim
+  call assert_equal('onetwo', g:sequence)
+  call delete(rundir . '/one.vim')
+  let g:sequence = ''
+  runtime! extra/*.vim extra/one.vim
+  call assert_equal('two', g:sequence)
+  if has('unix')
+    " a symlink without a target
+    let target = &packpath . '/runtime/target.vim'
+    exe 'silent !ln -s ' .. target .. ' ' .. rundir .. '/link.vim'
+  endif
+
+  " changes after the listing was validated
+  sleep 1100m
+  let g:sequence = ''
+  runtime! extra/*.vim
+  call assert_equal('two', g:sequence)
+  if has('unix')
+    " the target of the symlink appears and disappears, the directory with
+    " the symlink does not change
+    call writefile(['let g:sequence .= "link"'], target)
+    let g:sequence = ''
+    runtime extra/link.vim
+    call assert_equal('link', g:sequence)
+    call delete(target)
+    let g:sequence = ''
+    runtime extra/link.vim
+    call assert_equal('', g:sequence)
+    call delete(rundir . '/link.vim')
+  endif
+  call mkdir(rundir . '/sub')
+  call writefile(['let g:sequence .= "three"'], rundir . '/sub/three.vim')
+  call writefile(['let g:sequence .= "one"'], rundir . '/one.vim')
+  let g:sequence = ''
+  runtime! extra/*.vim extra/*/three.vim
+  call assert_equal('onetwothree', g:sequence)
+
+  let g:sequence = ''
+  runtime! extra/.*.vim
+  call assert_equal('hidden', g:sequence)
+endfunc
+
 func Test_runtime_completion()
   let rundir = &packpath . '/runtime/Aextra'
   let startdir = &packpath . '/pack/mine/start/foo/Aextra'
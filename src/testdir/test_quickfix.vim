@@ -1710,6 +1710,37 @@ func Test_efm_end_lnum_col()
   let &efm = save_efm
 endfunc
 
+" Test for 'efm' entries starting with literal text, these are only tried on
+" lines starting with that text, ignoring case.
+func Test_efm_literal_prefix()
+  let save_efm = &efm
+
+  set efm=[E]\ %f:%l:%m,%-GLong\ ignored\ line\ prefix%.%#,warning:\ %f:%l:%m
+  let lines =<< trim END
+    [e] Xfile1:10:msg1
+    WARNING: Xfile1:20:msg2
+    long Ignored line prefix that is skipped
+    long ignored line
+    warn: Xfile1:30:msg3
+    Xfile1:40:msg4
+  END
+  cexpr lines
+  let l = getqflist()
+  call assert_equal(5, len(l))
+  call assert_equal([10, 1, 'msg1'], [l[0].lnum, l[0].valid, l[0].text])
+  call assert_equal([20, 1, 'msg2'], [l[1].lnum, l[1].valid, l[1].text])
+  call assert_equal([0, 'long ignored line'], [l[2].valid, l[2].text])
+  call assert_equal([0, 'warn: Xfile1:30:msg3'], [l[3].valid, l[3].text])
+  call assert_equal([0, 'Xfile1:40:msg4'], [l[4].valid, l[4].text])
+
+  " the literal text may be followed by a multi
+  set efm=ab%#c\ %f:%l:%m
+  cexpr ['ac Xfile1:10:msg1', 'abbbc Xfile1:20:msg2', 'b Xfile1:30:msg3']
+  call assert_equal([1, 1, 0], getqflist()->map({_, v -> v.valid}))
+
+  let &efm = save_efm
+endfunc
+
 func XquickfixChangedByAutocmd(cchar)
   call s:setup_commands(a:cchar)
   if a:cchar == 'c'
@@ -3311,6 +3342,82 @@ func Test_vimgrep_existing_swapfile()
   unlet g:ignoreSwapExists
 endfunc
 
+" Test that :vimgrep finds the same matches when reading the text of a file
+" directly as when loading it into a buffer.
+func Test_vimgrep_read_text()
+  call writefile(['one two', '', 'two three two', "nul\nbyte", 'end'],
+        \ 'Xvgtext1', 'D')
+  call writefile(['one', 'two'], 'Xvgtext2', 'bD')
+  call writefile(["dos\r", "two\r"], 'Xvgtext3', 'D')
+  call writefile([], 'Xvgtext4', 'D')
+  call writefile(['none'], 'Xvgtext5', 'D')
+
+  func s:VgMatches(pat)
+    exe 'vimgrep /' .. a:pat .. '/jg Xvgtext*'
+    return getqflist()->map({_, v -> [bufname(v.bufnr), v.lnum, v.end_lnum,
+          \ v.col, v.end_col, v.text]})
+  endfunc
+
+  let pats = ['two', 'o\+', '^$', '\<two\>', 'l\%x00b', 'e$', '\%>1ltwo',
+        \ '\%5ct', 'two\n', '\(t\)\@<=wo', '[[:keyword:]]\+e']
+  " The SwapExists autocommand of the test runner would cause loading the
+  " files into a buffer.
+  for pat in pats
+    set eventignore=SwapExists
+    let actual = s:VgMatches(pat)
+    set eventignore&
+    call assert_notequal([], actual, pat)
+    let g:vg_read = 0
+    augroup VgText
+      au BufReadPost Xvgtext* let g:vg_read += 1
+    augroup END
+    let expected = s:VgMatches(pat)
+    au! VgText
+    call assert_equal(5, g:vg_read, pat)
+    call assert_equal(expected, actual, pat)
+  endfor
+
+  %bwipe!
+  augroup! VgText
+  delfunc s:VgMatches
+  unlet g:vg_read
+endfunc
+
+" Test :vimgrep reading the text directly together with loading a file into a
+" buffer.
+func Test_vimgrep_read_text_and_load()
+  call writefile(['one two'], 'Xvgload1', 'D')
+  call writefile(["two\r"], 'Xvgload2', 'D')
+  call writefile(['two three'], 'Xvgload3.xvg', 'D')
+  " The SwapExists autocommand of the test runner would cause loading the
+  " files into a buffer.
+  set eventignore=SwapExists
+
+  " Only the buffer of the first match is kept loaded, when the text of the
+  " file with that match was read directly.
+  vimgrep /two/ Xvgload1 Xvgload2
+  call assert_equal(2, len(getqflist()))
+  call assert_equal('Xvgload1', bufname())
+  call assert_false(bufloaded('Xvgload2'))
+  %bwipe!
+
+  " Filetype detection defined by the user is done when loading the file.
+  filetype on
+  let g:vg_ftdetect = 0
+  augroup filetypedetect
+    au BufNewFile,BufRead *.xvg let g:vg_ftdetect += 1
+  augroup END
+  vimgrep /two/j Xvgload1 Xvgload3.xvg
+  call assert_equal(2, len(getqflist()))
+  call assert_equal(1, g:vg_ftdetect)
+
+  %bwipe!
+  au! filetypedetect BufNewFile,BufRead *.xvg
+  filetype off
+  set eventignore&
+  unlet g:vg_ftdetect
+endfunc
+
 func XfreeTests(cchar)
   call s:setup_commands(a:cchar)
 
@@ -4022,6 +4129,53 @@ func Test_qfjump()
   call Xqfjump_tests('l')
 endfunc
 
+" Test for finding an entry by its index in a list that was built by appending
+" entries several times and in a copied location list.
+func Xqfidx_tests(cchar)
+  call s:setup_commands(a:cchar)
+
+  call g:Xsetlist([], 'f')
+  for i in range(10)
+    call g:Xsetlist(range(1, 100)->map({_, v -> #{bufnr: bufnr(''),
+          \ lnum: i * 100 + v, text: 'item ' .. (i * 100 + v)}}), 'a')
+  endfor
+  call assert_equal(1000, g:Xgetlist(#{size: 0}).size)
+  for idx in [1, 2, 555, 999, 1000, 321]
+    call assert_equal('item ' .. idx, g:Xgetlist(#{idx: idx, items: 0}).items[0].text)
+    call g:Xsetlist([], 'a', #{idx: idx})
+    call assert_equal(idx, g:Xgetlist(#{idx: 0}).idx)
+  endfor
+  call g:Xsetlist([], 'a', #{idx: 2000})
+  call assert_equal(1000, g:Xgetlist(#{idx: 0}).idx)
+  Xfirst
+  call assert_equal(1, g:Xgetlist(#{idx: 0}).idx)
+  Xfirst 432
+  call assert_equal(432, g:Xgetlist(#{idx: 0}).idx)
+  call assert_equal(432, line('.'))
+  Xfirst 1234
+  call assert_equal(1000, g:Xgetlist(#{idx: 0}).idx)
+
+  if a:cchar == 'l'
+    " The copied location list can also be indexed.
+    new
+    call assert_equal(1000, g:Xgetlist(#{idx: 0}).idx)
+    Xfirst 77
+    call assert_equal(77, line('.'))
+    call assert_equal('item 600', g:Xgetlist(#{idx: 600, items: 0}).items[0].text)
+    close
+  endif
+
+  call g:Xsetlist([], 'f')
+endfunc
+
+func Test_qfidx()
+  new
+  call setline(1, range(1, 1000))
+  call Xqfidx_tests('c')
+  call Xqfidx_tests('l')
+  bwipe!
+endfunc
+
 " Tests for the getqflist() and getloclist() functions when the list is not
 " present or is empty
 func Xgetlist_empty_tests(cchar)
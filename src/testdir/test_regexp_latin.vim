@@ -125,7 +125,7 @@ endfunc
 
 func Test_out_of_memory()
   new
-  s/^/,n
+  s/^/,n;
   " This will be slow...
   call assert_fails('call search("\\v((n||<)+);")', 'E363:')
 endfunc
@@ -179,8 +179,8 @@ func Test_regexp_single_line_pat()
   " tl is a List of Lists with:
   "    regexp engines to test
   "       0 - test with 'regexpengine' values 0 and 1
-  "       1 - test with 'regexpengine' values 0 and 2
-  "       2 - test with 'regexpengine' values 0, 1 and 2
+  "       1 - test with 'regexpengine' values 0, 2 and 3
+  "       2 - test with 'regexpengine' values 0, 1, 2 and 3
   "    regexp pattern
   "    text to test the pattern on
   "    expected match (optional)
@@ -639,8 +639,8 @@ func Test_regexp_single_line_pat()
     let pat = t[1]
     let text = t[2]
     let matchidx = 3
-    for engine in [0, 1, 2]
-      if engine == 2 && re == 0 || engine == 1 && re == 1
+    for engine in [0, 1, 2, 3]
+      if engine >= 2 && re == 0 || engine == 1 && re == 1
         continue
       endif
       let &regexpengine = engine
@@ -695,8 +695,8 @@ func Test_regexp_multiline_pat()
   " tl is a List of Lists with:
   "    regexp engines to test
   "       0 - test with 'regexpengine' values 0 and 1
-  "       1 - test with 'regexpengine' values 0 and 2
-  "       2 - test with 'regexpengine' values 0, 1 and 2
+  "       1 - test with 'regexpengine' values 0, 2 and 3
+  "       2 - test with 'regexpengine' values 0, 1, 2 and 3
   "    regexp pattern
   "    List with text to test the pattern on
   "    List with the expected match
@@ -787,8 +787,8 @@ func Test_regexp_multiline_pat()
     let pat = t[1]
     let before = t[2]
     let after = t[3]
-    for engine in [0, 1, 2]
-      if engine == 2 && re == 0 || engine == 1 && re == 1
+    for engine in [0, 1, 2, 3]
+      if engine >= 2 && re == 0 || engine == 1 && re == 1
         continue
       endif
       let &regexpengine = engine
@@ -1172,4 +1172,43 @@ def Test_compare_column_matchstr()
 enddef
 
 
+" Compiled patterns are cached, check the cache is used and that the result
+" doesn't depend on what was cached before.
+func Test_regexp_cache()
+  let info = regexpcacheinfo()
+  call assert_equal(['count', 'hits', 'misses', 'size'], keys(info)->sort())
+  call assert_inrange(0, info.size, info.count)
+
+  let pat = 'x\d\+y' .. localtime()
+  call assert_equal('abc', substitute('abc', pat, '', ''))
+  let hits = regexpcacheinfo().hits
+  for i in range(10)
+    call assert_equal('--', substitute('-x12y' .. localtime() .. '-', pat, '', 'g'))
+  endfor
+  call assert_true(regexpcacheinfo().hits >= hits + 10)
+
+  " 'regexpengine' is used when compiling
+  let misses = regexpcacheinfo().misses
+  set re=1
+  call assert_equal('--', substitute('-x12y' .. localtime() .. '-', pat, '', 'g'))
+  set re=0
+  call assert_equal(misses + 1, regexpcacheinfo().misses)
+
+  " "~" is the previous substitute string
+  new
+  call setline(1, ['abc', 'xyz'])
+  s/b/y/
+  call assert_equal(2, search('x~', 'w'))
+  1s/y/z/
+  call assert_equal(0, search('x~', 'nw'))
+  call assert_equal(1, search('a~', 'w'))
+  bwipe!
+
+  for re in range(3)
+    exe 'set re=' .. re
+    call assert_equal(2, match('ab12', '\d\+'))
+  endfor
+  set re=0
+endfunc
+
 " vim: shiftwidth=2 sts=2 expandtab
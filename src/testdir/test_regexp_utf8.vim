@@ -290,8 +290,8 @@ func Test_multibyte_chars()
     let pat = t[1]
     let text = t[2]
     let matchidx = 3
-    for engine in [0, 1, 2]
-      if engine == 2 && re == 0 || engine == 1 && re == 1
+    for engine in [0, 1, 2, 3]
+      if engine >= 2 && re == 0 || engine == 1 && re == 1
         continue
       endif
       let &regexpengine = engine
@@ -617,4 +617,57 @@ func Test_search_multibyte_match_ascii()
   bw!
 endfunc
 
+" A line without the literal text that every match contains is skipped
+" before trying to match.  Check this doesn't skip lines that do match.
+func Test_match_required_literal()
+  new
+  call setline(1, ['foo_bar1 TODO later urgent', 'TODO: not now',
+        \ 'x ſTODO urgent', 'abcdef', 'xabcydef', 'AB日本語CD',
+        \ 'ab[c]de'])
+  for i in range(0, 3)
+    exe "set re=" .. i
+    call assert_equal(['foo_bar1'], matchbufline('%', '\<foo_bar\w*', 1, '$')
+          \ ->mapnew({_, v -> v.text}), 're=' .. &re)
+    call assert_equal([1, 3], matchbufline('%', 'TODO.*urgent', 1, '$')
+          \ ->mapnew({_, v -> v.lnum}), 're=' .. &re)
+    call assert_equal(['x ſTODO urgent'],
+          \ matchbufline('%', '\cX STODO.*URGENT', 3, 3)
+          \ ->mapnew({_, v -> v.text}), 're=' .. &re)
+    call assert_equal([4, 5], matchbufline('%', '\%(abc\|abcy\)def', 1, '$')
+          \ ->mapnew({_, v -> v.lnum}), 're=' .. &re)
+    call assert_equal([], matchbufline('%', 'bc\%(def\)\@=y', 1, '$'),
+          \ 're=' .. &re)
+    call assert_equal(['B日本語C'],
+          \ matchbufline('%', '\cb日本語c', 1, '$')
+          \ ->mapnew({_, v -> v.text}), 're=' .. &re)
+    call assert_equal([4, 7], matchbufline('%', 'ab[c]de\|ab\[c]de', 1, '$')
+          \ ->mapnew({_, v -> v.lnum}), 're=' .. &re)
+    call assert_equal(5, search('y\zsdef', 'w'), 're=' .. &re)
+  endfor
+  set re=0
+  bw!
+endfunc
+
+" The DFA engine must give the same result as the NFA engine.
+func Test_regexp_dfa_engine()
+  new
+  call setline(1, ['  let foo = bar(12);  ', 'x = y', "Abc\u00e9\u00c9",
+        \ "e\u0301x", repeat('ab', 1000) .. 'c', ''])
+  let pats = ['\w\+ = \w\+(\d\+)', '\s\+$', '^\s*let', '^$', 'bc\%u00e9',
+        \ '[[:upper:]]\l\+', '[^a-z ]\+', 'e\%(x\|y\)', '\%(ab\)\+c',
+        \ 'b\zsc\ze\%u00e9', '\<x', 'ab\%[cd]$']
+  for ic in [0, 1]
+    let &ignorecase = ic
+    for pat in pats
+      set re=2
+      let expected = matchbufline('%', pat, 1, '$')
+      set re=3
+      call assert_equal(expected, matchbufline('%', pat, 1, '$'),
+            \ 'ic=' .. ic .. ' pat=' .. pat)
+    endfor
+  endfor
+  set re=0 ignorecase&
+  bw!
+endfunc
+
 " vim: shiftwidth=2 sts=2 expandtab
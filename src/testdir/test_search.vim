@@ -1894,7 +1894,7 @@ func Test_invalid_regexp()
   call assert_fails("call search('\\%[]')", 'E70:')
   call assert_fails("call search('\\%9999999999999999999999999999v')", 'E951:')
   set regexpengine&
-  call assert_fails("call search('\\%#=3ab')", 'E864:')
+  call assert_fails("call search('\\%#=4ab')", 'E864:')
 endfunc
 
 " Test for searching a very complex pattern in a string. Should switch the
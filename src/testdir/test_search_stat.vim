@@ -255,6 +255,68 @@ func Test_search_stat()
   bwipe!
 endfunc
 
+" The matches are remembered and updated when lines change.  Adding "\%>0l"
+" makes the pattern depend on line numbers, then the count is computed from
+" scratch, which must give the same result.
+func Test_searchcount_after_changes()
+  new
+  call setline(1, repeat(['foo bar', 'xfoox', 'nothing', 'foofoo'], 50))
+  let pats = ['foo', '\<foo\>', 'o', '^', '$', 'x\|bar', 'o\nn', 'a*']
+  let positions = [[1, 1, 0], [2, 2, 0], [50, 3, 0], [150, 1, 0], [200, 9, 0]]
+  let changes = [
+	\ 'call setline(3, "foo foo")',
+	\ 'call append(10, ["foo", "bar foo"])',
+	\ '20,25d',
+	\ '30s/o/0/g',
+	\ '40,41m0',
+	\ '1,50s/^/o/',
+	\ 'call append(0, "first foo")',
+	\ '$d',
+	\ ]
+  for change in changes
+    exe change
+    for pat in pats
+      for pos in positions
+	for maxcount in [0, 3]
+	  call assert_equal(
+		\ searchcount(#{pattern: '\%(' .. pat .. '\)\%>0l', pos: pos, maxcount: maxcount}),
+		\ searchcount(#{pattern: pat, pos: pos, maxcount: maxcount}),
+		\ change .. ': ' .. pat .. ' at ' .. string(pos))
+	endfor
+      endfor
+    endfor
+  endfor
+  bwipe!
+endfunc
+
+" The remembered matches must not be used after an option that changes what
+" a character class matches was set.
+func Test_searchcount_after_option_changes()
+  new
+  call setline(1, repeat(["a-b c.d e:f\tx"], 5))
+  let save_isf = &isfname
+  let save_isi = &isident
+  let save_isp = &isprint
+  for [pat, opt, val1, val2] in [
+        \ ['\f\+', 'isfname', '@,-', '@'],
+        \ ['\F\+', 'isfname', '@', '@,.'],
+        \ ['\i\+', 'isident', '@', '@,:'],
+        \ ['\I\+', 'isident', '@,:', '@'],
+        \ ['\p\+', 'isprint', '@,161-255', '@,9,161-255'],
+        \ ['\P\+', 'isprint', '@,9,161-255', '@,161-255']]
+    exe 'let &' .. opt .. ' = val1'
+    let before = searchcount(#{pattern: pat, pos: [1, 1, 0]})
+    exe 'let &' .. opt .. ' = val2'
+    let expected = searchcount(#{pattern: '\%(' .. pat .. '\)\%>0l', pos: [1, 1, 0]})
+    call assert_notequal(before.total, expected.total, pat)
+    call assert_equal(expected, searchcount(#{pattern: pat, pos: [1, 1, 0]}), pat)
+  endfor
+  let &isfname = save_isf
+  let &isident = save_isi
+  let &isprint = save_isp
+  bwipe!
+endfunc
+
 func Test_searchcount_fails()
   call assert_fails('echo searchcount("boo!")', 'E1206:')
   call assert_fails('echo searchcount({"timeout" : []})', 'E745:')
@@ -718,6 +718,21 @@ func Test_startuptime()
   call delete('Xtestout')
 endfunc
 
+func Test_trace_startup()
+  let after = ['qall']
+  if RunVim([], after, '--trace Xtrace.json')
+    let events = readfile('Xtrace.json')->join("\n")->json_decode()
+    call assert_equal('M', events[0].ph)
+    " the script passed with -S is sourced
+    call assert_notequal([], events->copy()
+          \ ->filter({_, e -> e.ph == 'B' && e.cat == 'source'
+          \                   && e.name =~ 'Xafter.vim$'}))
+    call assert_equal(len(events) - 1, 2 * events
+          \ ->filter({_, e -> e.ph == 'B'})->len())
+  endif
+  call delete('Xtrace.json')
+endfunc
+
 func Test_log()
   CheckFeature channel
 
@@ -116,14 +116,14 @@ func Test_syntime()
   setfiletype cpp
   redraw
   let a = execute('syntime report')
-  call assert_match('^  TOTAL *COUNT *MATCH *SLOWEST *AVERAGE *NAME *PATTERN', a)
+  call assert_match('^  TOTAL *COUNT *MATCH *SKIPPED *SLOWEST *AVERAGE *NAME *PATTERN', a)
   call assert_match(' \d*\.\d* \+[^0]\d* .* cppRawString ', a)
   call assert_match(' \d*\.\d* \+[^0]\d* .* cppNumber ', a)
 
   syntime off
   syntime clear
   let a = execute('syntime report')
-  call assert_match('^  TOTAL *COUNT *MATCH *SLOWEST *AVERAGE *NAME *PATTERN', a)
+  call assert_match('^  TOTAL *COUNT *MATCH *SKIPPED *SLOWEST *AVERAGE *NAME *PATTERN', a)
   call assert_notmatch('.* cppRawString *', a)
   call assert_notmatch('.* cppNumber*', a)
   call assert_notmatch('[1-9]', a)
@@ -137,6 +137,32 @@ func Test_syntime()
   bd
 endfunc
 
+" Patterns are not tried on lines without a character a match can start with.
+func Test_syntime_skipped()
+  CheckFeature profile
+
+  new
+  call setline(1, ['one two', 'three "four"', 'five'])
+  syntax match testString /"[^"]*"/
+  syntax match testNumber /\<\d\+\>/
+  syntax match testEnd /e$/
+  syntime on
+  redraw!
+  let a = execute('syntime report')
+  " testString is only tried in line 2
+  call assert_match('\n *\d*\.\d* \+1 \+1 \+2 .* testString ', a)
+  " testNumber is never tried
+  call assert_match('\n *\d*\.\d* \+0 \+0 \+3 .* testNumber ', a)
+  " testEnd is tried in every line
+  call assert_match('\n *\d*\.\d* \+[1-9]\d* \+[1-9]\d* \+0 .* testEnd ', a)
+  call assert_equal('testString', synIDattr(synID(2, 8, 1), 'name'))
+  call assert_equal('testEnd', synIDattr(synID(3, 4, 1), 'name'))
+
+  syntime off
+  syntime clear
+  bwipe!
+endfunc
+
 func Test_syntime_completion()
   CheckFeature profile
 
@@ -988,5 +1014,55 @@ func Test_WinEnter_synstack_synID()
   bw!
 endfunc
 
+" Wait for a typed character, giving 'synidletime' a chance to do its work.
+func s:WaitForChar()
+  call timer_start(100, {-> test_feedinput('x')})
+  while getcharstr() != 'x'
+  endwhile
+endfunc
+
+func Test_syntax_idle()
+  CheckUnix
+  CheckFeature timers
+
+  let lines = ['{{'] + repeat(['text'], 2000)
+
+  " Without 'synidletime' syncing starts after the "{{".
+  new
+  call setline(1, lines)
+  syntax region Xregion start=/{{/ end=/}}/
+  syntax sync minlines=200
+  redraw
+  call s:WaitForChar()
+  call assert_equal(0, synID(1500, 1, 1))
+  bwipe!
+
+  " While waiting for a character the state is computed from the start,
+  " without the cursor going near line 1500.
+  set synidletime=20
+  new
+  call setline(1, lines)
+  syntax region Xregion start=/{{/ end=/}}/
+  syntax sync minlines=200
+  redraw
+  call s:WaitForChar()
+  call assert_equal(1, line('.'))
+  call assert_true(line('w$') < 1500)
+  call assert_equal('Xregion', synIDattr(synID(1500, 1, 1), 'name'))
+
+  " After a change it is computed again.
+  call setline(1, 'text')
+  redraw
+  call s:WaitForChar()
+  call assert_equal(0, synID(1500, 1, 1))
+  call setline(1, '{{')
+  redraw
+  call s:WaitForChar()
+  call assert_equal('Xregion', synIDattr(synID(1500, 1, 1), 'name'))
+
+  set synidletime&
+  bwipe!
+endfunc
+
 
 " vim: shiftwidth=2 sts=2 expandtab
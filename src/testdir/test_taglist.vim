@@ -261,6 +261,58 @@ func Test_format_error()
   set tags&
 endfunc
 
+" Test for a linear search in a tags file, which uses an index of the file.
+func Test_taglist_linear_search()
+  let lines = ["!_TAG_FILE_SORTED\t1\t//"]
+  for i in range(1000)
+    let lines += [printf("tag%04d\tXfoo\t%d", i, i + 1)]
+  endfor
+  call extend(lines, ["Tag0500\tXbar\t1", "TAG0500x\tXbar\t2",
+        \ "tag\u00c4\tXbar\t3", repeat('x', 600) .. "\tXbar\t4"], 501)
+  call writefile(lines, 'Xtags', 'D')
+  set tags=Xtags ignorecase
+
+  " matches with the same kind are found in the order of the file
+  call assert_equal(['tag0500', 'Tag0500', 'TAG0500x'],
+        \ taglist('tag0500')->map({_, v -> v.name}))
+  call assert_equal(['Tag0500', 'TAG0500x', 'tag0500'],
+        \ taglist('^TaG0500')->map({_, v -> v.name}))
+  call assert_equal(['tag0999'], taglist('^tag099[9]$')->map({_, v -> v.name}))
+  call assert_equal(["tag\u00c4"], taglist("^tag\u00e4")->map({_, v -> v.name}))
+  call assert_equal(1002, taglist('^tag0')->len())
+  call assert_equal(['4'], taglist('^xx')->map({_, v -> v.cmd}))
+  call assert_equal([], taglist('^nosuchtag'))
+
+  " the tags file is changed
+  let lines[1] = "Tag0000x\tXbar\t10"
+  call writefile(lines, 'Xtags')
+  call assert_equal(['10'], taglist('^tag0000')->map({_, v -> v.cmd}))
+  call writefile(lines[0 : 1] + lines[3 :], 'Xtags')
+  call assert_equal(['tag0002'], taglist('^tag0002')->map({_, v -> v.name}))
+
+  set tags& ignorecase&
+endfunc
+
+" Only the indexes of the tags files that were used last are kept.
+func Test_taglist_linear_search_many_files()
+  set ignorecase
+  for i in range(12)
+    call writefile(["!_TAG_FILE_SORTED\t1\t//", printf("tag%d\tXfoo\t%d", i, i)],
+          \ 'Xtags' .. i, 'D')
+    let &tags = 'Xtags' .. i
+    call assert_equal([printf('tag%d', i)],
+          \ taglist('^tag')->map({_, v -> v.name}))
+  endfor
+  call assert_equal(10, test_getvalue('tagindex_count'))
+
+  " an index that was dropped is made again
+  set tags=Xtags0
+  call assert_equal(['tag0'], taglist('^tag')->map({_, v -> v.name}))
+  call assert_equal(10, test_getvalue('tagindex_count'))
+
+  set tags& ignorecase&
+endfunc
+
 " Test for :tag command completion with 'wildoptions' set to 'tagfile'
 func Test_tag_complete_wildoptions()
   call writefile(["foo\ta.c\t10;\"\tf", "bar\tb.c\t20;\"\td"], 'Xtags', 'D')
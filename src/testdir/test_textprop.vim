@@ -316,6 +316,64 @@ func Test_prop_find_with_both_option_enabled()
   bwipe!
 endfunc
 
+" Test finding and removing text properties in a buffer where only some of
+" the lines have them, also after the lines were changed.
+func Test_prop_find_sparse()
+  new
+  call prop_type_add('sparse', {})
+  call setline(1, range(1, 3000))
+  " add the properties out of order
+  for lnum in [2500, 700, 1500, 10, 2999]
+    call prop_add(lnum, 1, #{type: 'sparse', id: lnum})
+  endfor
+
+  " look for them a few times, so that visited lines add up
+  for i in range(3)
+    call assert_equal(10, prop_find(#{type: 'sparse', lnum: 1}).lnum)
+    call assert_equal(700, prop_find(#{type: 'sparse', lnum: 11}).lnum)
+    call assert_equal(2999, prop_find(#{id: 2999, lnum: 1}).lnum)
+    call assert_equal(1500, prop_find(#{type: 'sparse', lnum: 2499}, 'b').lnum)
+    call assert_equal({}, prop_find(#{type: 'sparse', lnum: 9}, 'b'))
+    call assert_equal(5, prop_list(1, #{end_lnum: -1})->len())
+  endfor
+
+  " adding a property is found without inserting or deleting lines
+  call prop_add(1000, 2, #{type: 'sparse', id: 1000})
+  call assert_equal(1000, prop_find(#{type: 'sparse', lnum: 701}).lnum)
+  call assert_equal(1000, prop_find(#{type: 'sparse', lnum: 1499}, 'b').lnum)
+
+  " inserting and deleting lines moves the properties
+  call append(0, ['a', 'b'])
+  1000d
+  call assert_equal([12, 702, 1001, 1501, 2501, 3000],
+        \ prop_list(1, #{end_lnum: -1})->map({_, v -> v.lnum}))
+  for i in range(3)
+    call assert_equal(1501, prop_find(#{id: 1500, lnum: 1}).lnum)
+  endfor
+
+  " deleting a line with a property and undoing that brings it back
+  let &undolevels = &undolevels
+  1501d
+  call assert_equal(2500, prop_find(#{type: 'sparse', lnum: 1002}).lnum)
+  call assert_equal({}, prop_find(#{id: 1500, lnum: 1}))
+  undo
+  call assert_equal(1501, prop_find(#{type: 'sparse', lnum: 1002}).lnum)
+  call assert_equal(1501, prop_find(#{id: 1500, lnum: 1}).lnum)
+  call assert_equal(3000, prop_find(#{type: 'sparse', lnum: 3000}, 'b').lnum)
+
+  " a property on a new line is found
+  call append(5, 'new')
+  call prop_add(6, 1, #{type: 'sparse', id: 6})
+  call assert_equal(6, prop_find(#{type: 'sparse', lnum: 1}).lnum)
+
+  call assert_equal(7, prop_remove(#{type: 'sparse'}))
+  call assert_equal({}, prop_find(#{type: 'sparse', lnum: 1}))
+  call assert_equal([], prop_list(1, #{end_lnum: -1}))
+
+  bwipe!
+  call prop_type_delete('sparse')
+endfunc
+
 func Test_prop_add()
   new
   call AddPropTypes()
@@ -401,6 +459,60 @@ func Test_prop_add_list()
   bw!
 endfunc
 
+" Test for the prop_replace() function
+func Test_prop_replace_func()
+  new
+  call AddPropTypes()
+  call setline(1, ['one one one', 'two two two', 'six six six', 'ten ten ten'])
+  call prop_add(1, 5, #{type: 'two', length: 3})
+  call prop_add(2, 1, #{type: 'one', length: 3, id: 7})
+  call prop_add(3, 1, #{type: 'three', length: 3})
+  call prop_add(4, 0, #{type: 'one', text: 'virtual'})
+
+  call prop_replace(#{types: ['one', 'two'], id: 4}, 1, 2,
+        \ [[2, 9, 3, 1], [1, 9, 3, 0], [1, 1, 3, 1, 5], [1, 1, 0, 0]])
+  let line1 = prop_list(1)
+  call assert_equal([
+        \ #{id: 4, col: 1, type_bufnr: 0, end: 1, type: 'one', length: 0, start: 1},
+        \ #{id: 5, col: 1, type_bufnr: 0, end: 1, type: 'two', length: 3, start: 1},
+        \ #{id: 4, col: 9, type_bufnr: 0, end: 1, type: 'one', length: 3, start: 1}],
+        \ line1)
+  call assert_equal([#{id: 4, col: 9, type_bufnr: 0, end: 1, type: 'two',
+        \ length: 3, start: 1}], prop_list(2))
+  call assert_equal([#{id: 0, col: 1, type_bufnr: 0, end: 1, type: 'three',
+        \ length: 3, start: 1}], prop_list(3))
+  call assert_equal(1, prop_list(4)->len())
+
+  " the properties are in the same order as when using prop_add()
+  call prop_clear(1)
+  call prop_add(1, 9, #{type: 'one', length: 3, id: 4})
+  call prop_add(1, 1, #{type: 'two', length: 3, id: 5})
+  call prop_add(1, 1, #{type: 'one', length: 0, id: 4})
+  call assert_equal(line1, prop_list(1))
+
+  " virtual text is removed, properties of other types are kept
+  call prop_replace(#{types: ['one', 'two']}, 1, 4, [])
+  call assert_equal([], prop_list(1, #{types: ['one', 'two'], end_lnum: -1}))
+  call assert_equal(1, prop_list(1, #{end_lnum: -1})->len())
+
+  call assert_fails('call prop_replace(#{types: ["one"]}, 1, 5, [])', 'E16:')
+  call assert_fails('call prop_replace(#{types: ["one"]}, 2, 1, [])', 'E16:')
+  call assert_fails('call prop_replace(#{}, 1, 1, [])', 'E965:')
+  call assert_fails('call prop_replace(#{types: "one"}, 1, 1, [])', 'E714:')
+  call assert_fails('call prop_replace(#{types: [1]}, 1, 1, [])', 'E928:')
+  call assert_fails('call prop_replace(#{types: ["xxx"]}, 1, 1, [])', 'E971:')
+  call assert_fails('call prop_replace(#{types: ["one"]}, 1, 2, [[3, 1, 1, 0]])', 'E966:')
+  call assert_fails('call prop_replace(#{types: ["one"]}, 1, 2, [[1, 1, 1, 1]])', 'E474:')
+  call assert_fails('call prop_replace(#{types: ["one"]}, 1, 2, [[1, 1]])', 'E474:')
+  call assert_fails('call prop_replace(#{types: ["one"]}, 1, 2, [{}])', 'E714:')
+  call assert_fails('call prop_replace(#{types: ["one"]}, 1, 2, [[1, 30, 1, 0]])', 'E964:')
+  call assert_fails('call prop_replace(#{types: ["one"]}, 1, 2, {})', 'E1211:')
+  call assert_fails('call prop_replace(#{types: ["one"], bufnr: 9999}, 1, 1, [])', 'E158:')
+
+  call DeletePropTypes()
+  bw!
+endfunc
+
 func Test_prop_remove()
   new
   call AddPropTypes()
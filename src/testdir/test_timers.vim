@@ -539,5 +539,42 @@ func Test_timer_using_win_execute_undo_sync()
   au! InsertEnter
 endfunc
 
+" Timers fire in the order they are due, also when several are due at the
+" same time.
+func Test_timer_fire_in_due_order()
+  let g:fired = []
+  let g:delay_of = {}
+  let timers = {}
+  for delay in [90, 30, 150, 60, 120, 10, 180, 45]
+    let id = timer_start(delay, {t -> add(g:fired, g:delay_of[t])})
+    let g:delay_of[id] = delay
+    let timers[delay] = id
+  endfor
+  call timer_stop(timers[60])
+  call timer_pause(timers[150], 1)
+  call assert_equal([], timer_info(timers[60]))
+  call assert_equal(1, timer_info(timers[150])[0].paused)
+
+  call WaitForAssert({-> assert_equal([10, 30, 45, 90, 120, 180], g:fired)})
+  call timer_pause(timers[150], 0)
+  call WaitForAssert({-> assert_equal([10, 30, 45, 90, 120, 180, 150],
+        \ g:fired)})
+
+  " Timers that are due in the same pass are invoked in due order.  Wait
+  " without checking for timers, so that they are all due in the next pass.
+  let g:fired = []
+  let start = reltime()
+  for delay in [30, 10, 20]
+    let g:delay_of[timer_start(delay, {t -> add(g:fired, g:delay_of[t])})]
+          \ = delay
+  endfor
+  while reltimefloat(reltime(start)) < 0.05
+  endwhile
+  call assert_equal([], g:fired)
+  sleep 1m
+  call assert_equal([10, 20, 30], g:fired)
+  unlet g:fired g:delay_of
+endfunc
+
 
 " vim: shiftwidth=2 sts=2 expandtab
@@ -140,7 +140,7 @@ func Test_undotree_bufnr()
   " after creating a buffer nosuchbuf, undotree('nosuchbuf') should
   " not error out
   new nosuchbuf
-  let d = {'seq_last': 0, 'entries': [], 'time_cur': 0, 'save_last': 0, 'synced': 1, 'save_cur': 0, 'seq_cur': 0}
+  let d = {'seq_last': 0, 'entries': [], 'time_cur': 0, 'save_last': 0, 'synced': 1, 'save_cur': 0, 'seq_cur': 0, 'memory': 0}
   call assert_equal(d, undotree("nosuchbuf"))
   " clean up
   bw nosuchbuf
@@ -151,6 +151,59 @@ func Test_undotree_bufnr()
   bw!
 endfunc
 
+" Test for 'undomaxmem' and the "memory" item of undotree()
+func Test_undomaxmem()
+  new
+  call setline(1, repeat(['x'->repeat(100)], 1000))
+  set ul=100
+  let mem1 = undotree().memory
+  call assert_true(mem1 > 0)
+  for c in ['a', 'b', 'c', 'd']
+    exe '%s/x/' .. c .. '/'
+    set ul=100
+  endfor
+  let d = undotree()
+  call assert_equal(5, len(d.entries))
+  " each substitute saves all lines, more than 100 Kbyte
+  call assert_true(d.memory > mem1 + 4 * 100000)
+  let mem = d.memory
+
+  " after undoing the first change its block holds all the lines
+  undo 0
+  call assert_true(undotree().memory > mem)
+  undo 5
+  call assert_equal(mem, undotree().memory)
+
+  " old undo blocks are freed when making a change
+  set undomaxmem=250
+  call assert_equal(5, len(undotree().entries))
+  %s/x/e/
+  set ul=100
+  let d = undotree()
+  call assert_equal(2, len(d.entries))
+  call assert_equal([5, 6], d.entries->map({_, v -> v.seq}))
+  call assert_true(d.memory < mem)
+  call assert_equal('abcde' .. 'x'->repeat(95), getline(1))
+  undo
+  call assert_equal('abcd' .. 'x'->repeat(96), getline(1))
+  undo
+  call assert_equal('abc' .. 'x'->repeat(97), getline(1))
+  undo
+  call assert_equal('abc' .. 'x'->repeat(97), getline(1))
+  redo
+  redo
+  call assert_equal('abcde' .. 'x'->repeat(95), getline(1))
+
+  " without a change nothing is freed
+  set undomaxmem=1
+  call assert_equal(2, len(undotree().entries))
+  call assert_fails('set undomaxmem=-1', 'E487:')
+
+  set undomaxmem& ul&
+  bwipe!
+  call assert_equal(0, undotree().memory)
+endfunc
+
 func Test_global_local_undolevels()
   new one
   set undolevels=5
@@ -463,6 +516,41 @@ func Test_undofile_truncated()
   bwipe!
 endfunc
 
+" Check that an undo tree with many headers and branches is restored.
+func Test_undofile_branches()
+  new
+  set ul=1000
+  call setline(1, range(1, 100))
+  for i in range(1, 300)
+    if i % 10 == 0
+      " go back a few steps to start a new branch
+      undo 3
+      undo
+    endif
+    call setline(i % 100 + 1, 'change ' .. i)
+    set ul=1000
+  endfor
+  let tree = undotree()
+  let lines = getline(1, '$')
+  wundo! Xundofile
+  undo 100
+  let lines100 = getline(1, '$')
+  bwipe!
+
+  new
+  call setline(1, lines)
+  rundo Xundofile
+  call assert_equal(tree.entries, undotree().entries)
+  call assert_equal(tree.seq_cur, undotree().seq_cur)
+  call assert_equal(tree.seq_last, undotree().seq_last)
+  undo 100
+  call assert_equal(lines100, getline(1, '$'))
+
+  call delete('Xundofile')
+  set ul&
+  bwipe!
+endfunc
+
 func Test_rundo_errors()
   call assert_fails('rundo XfileDoesNotExist', 'E822:')
 
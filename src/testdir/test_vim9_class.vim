@@ -845,6 +845,46 @@ def Test_member_any_used_as_object()
   v9.CheckSourceFailure(lines, 'E1326: Variable "someval" not found in object "Inner"', 1)
 enddef
 
+" Reading a variable of an "any" object remembers the class and the index of
+" the variable, check that objects of other classes still work.
+def Test_member_any_class_changes()
+  var lines =<< trim END
+    vim9script
+
+    class A
+      var x: number = 1
+    endclass
+
+    class B
+      var y: string = 'y'
+      var x: number = 2
+    endclass
+
+    class C
+      var _x: number = 3
+    endclass
+
+    def GetX(o: any): number
+      return o.x
+    enddef
+
+    def GetProtectedX(o: any): number
+      return o._x
+    enddef
+
+    assert_equal([1, 2, 1, 2, 1],
+          \ [A.new(), B.new(), A.new(), B.new(), A.new()]->map((_, o) => GetX(o)))
+    assert_fails('GetProtectedX(C.new())', 'E1333: Cannot access protected variable "_x" in class "C"')
+    assert_fails('GetProtectedX(C.new())', 'E1333: Cannot access protected variable "_x" in class "C"')
+    assert_fails('GetX(C.new())', 'E1326: Variable "x" not found in object "C"')
+    assert_equal(2, GetX(B.new()))
+    assert_fails('GetX({y: 1})', 'E716: Key not present in Dictionary: "x"')
+    assert_equal(3, GetX({x: 3}))
+    assert_equal(1, GetX(A.new()))
+  END
+  v9.CheckSourceSuccess(lines)
+enddef
+
 " Nested assignment to a object variable which is of another class type
 def Test_assignment_nested_type()
   var lines =<< trim END
@@ -3286,6 +3286,41 @@ def Test_expr_member_vim9script()
   v9.CheckDefAndScriptSuccess(lines)
 enddef
 
+" Reading a dict item with "d.key" remembers where it was found, check that
+" a different dict or a changed dict still works.
+def Test_expr_member_changed_dict()
+  var lines =<< trim END
+      vim9script
+      def GetX(d: dict<any>): any
+        return d.x
+      enddef
+
+      var dicts = [{x: 1}, {a: 0, x: 2}, {x: 3, a: 0}, {b: 0, c: 0, x: 4}]
+      for i in range(50)
+        dicts->add({['k' .. i]: i, x: 5 + i})
+      endfor
+      for d in dicts + dicts
+        assert_equal(d['x'], GetX(d))
+      endfor
+
+      var d = {x: 1, y: 2}
+      assert_equal(1, GetX(d))
+      remove(d, 'x')
+      assert_fails('GetX(d)', 'E716: Key not present in Dictionary: "x"')
+      d.x = 7
+      assert_equal(7, GetX(d))
+      for i in range(100)
+        d['k' .. i] = i
+      endfor
+      assert_equal(7, GetX(d))
+      remove(d, 'x')
+      d.x = 8
+      assert_equal(8, GetX(d))
+      assert_fails('GetX({})', 'E716: Key not present in Dictionary: "x"')
+  END
+  v9.CheckScriptSuccess(lines)
+enddef
+
 def SetSomeVar()
   b:someVar = &fdm
 enddef
@@ -88,7 +88,8 @@ let test_values = {
       \ 'lines': [[2, 24, 1000], [-1, 0, 1]],
       \ 'linespace': [[-1, 0, 2, 4, 999], ['']],
       \ 'numberwidth': [[1, 4, 8, 10, 11, 20], [-1, 0, 21]],
-      \ 'regexpengine': [[0, 1, 2], [-1, 3, 999]],
+      \ 'pathidletime': [[0, 10, 100], [-1]],
+      \ 'regexpengine': [[0, 1, 2, 3], [-1, 4, 999]],
       \ 'report': [[0, 1, 2, 9999], [-1]],
       \ 'scroll': [[0, 1, 2, 15], [-1, 999]],
       \ 'scrolljump': [[-100, -1, 0, 1, 2, 15], [-101, 999]],
@@ -97,11 +98,13 @@ let test_values = {
       \ 'showtabpanel': [[0, 1, 2], []],
       \ 'sidescroll': [[0, 1, 8, 999], [-1]],
       \ 'sidescrolloff': [[0, 1, 8, 999], [-1]],
+      \ 'synidletime': [[0, 10, 100], [-1]],
       \ 'tabstop': [[1, 4, 8, 12, 9999], [-1, 0, 10000]],
       \ 'termwinscroll': [[1, 100, 99999], [-1, 0]],
       \ 'textwidth': [[0, 1, 8, 99], [-1]],
       \ 'timeoutlen': [[0, 8, 99999], [-1]],
       \ 'titlelen': [[0, 1, 8, 9999], [-1]],
+      \ 'undomaxmem': [[0, 1, 100, 99999], [-1]],
       \ 'updatecount': [[0, 1, 8, 9999], [-1]],
       \ 'updatetime': [[0, 1, 8, 9999], [-1]],
       \ 'verbose': [[-1, 0, 1, 8, 9999], ['']],
@@ -977,6 +977,10 @@ f_test_getvalue(typval_T *argvars, typval_T *rettv)
 
     if (STRCMP(name, (char_u *)"need_fileinfo") == 0)
 	rettv->vval.v_number = need_fileinfo;
+    else if (STRCMP(name, (char_u *)"dir_cache_count") == 0)
+	rettv->vval.v_number = dir_cache_count();
+    else if (STRCMP(name, (char_u *)"tagindex_count") == 0)
+	rettv->vval.v_number = tagindex_count();
     else
 	semsg(_(e_invalid_argument_str), name);
 }
@@ -1056,6 +1060,8 @@ f_test_override(typval_T *argvars, typval_T *rettv UNUSED)
 	override_autoload = val;
     else if (STRCMP(name, (char_u *)"defcompile") == 0)
 	override_defcompile = val;
+    else if (STRCMP(name, (char_u *)"dir_cache_max") == 0)
+	dir_cache_set_max(val);
     else if (STRCMP(name, (char_u *)"ALL") == 0)
     {
 	disable_char_avail_for_testing = FALSE;
@@ -1066,6 +1072,7 @@ f_test_override(typval_T *argvars, typval_T *rettv UNUSED)
 	ui_delay_for_testing = 0;
 	reset_term_props_on_termresponse = FALSE;
 	override_sysinfo_uptime = -1;
+	dir_cache_set_max(0);
 	// ml_get_alloc_lines is not reset by "ALL"
 	if (save_starting >= 0)
 	{
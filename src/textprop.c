@@ -322,6 +322,7 @@ prop_add_one(
 	buf->b_ml.ml_line_ptr = newtext;
 	buf->b_ml.ml_line_len += sizeof(textprop_T);
 	buf->b_ml.ml_flags |= ML_LINE_DIRTY;
+	prop_lines_add(buf, lnum);
     }
 
     changed_line_display_buf(buf);
@@ -668,6 +669,205 @@ get_text_props(buf_T *buf, linenr_T lnum, char_u **props, int will_change)
     return (int)(proplen / sizeof(textprop_T));
 }
 
+/*
+ * Function passed to qsort() for sorting line numbers.
+ */
+    static int
+prop_lines_compare(const void *s1, const void *s2)
+{
+    linenr_T	lnum1 = *(linenr_T *)s1;
+    linenr_T	lnum2 = *(linenr_T *)s2;
+
+    return lnum1 == lnum2 ? 0 : lnum1 > lnum2 ? 1 : -1;
+}
+
+/*
+ * Build the index of lines in "buf" that have text properties.
+ */
+    static void
+prop_lines_build(buf_T *buf)
+{
+    garray_T	*gap = &buf->b_prop_lines;
+    linenr_T	lnum;
+
+    ga_init2(gap, sizeof(linenr_T), 100);
+    for (lnum = 1; lnum <= buf->b_ml.ml_line_count; ++lnum)
+    {
+	size_t	textlen = ml_get_buf_len(buf, lnum) + 1;
+
+	if ((size_t)buf->b_ml.ml_line_len > textlen)
+	{
+	    if (ga_grow(gap, 1) == FAIL)
+	    {
+		ga_clear(gap);
+		return;
+	    }
+	    ((linenr_T *)gap->ga_data)[gap->ga_len++] = lnum;
+	}
+    }
+    buf->b_prop_lines_valid = TRUE;
+    buf->b_prop_lines_sorted = TRUE;
+    buf->b_prop_lines_moved = 0;
+}
+
+/*
+ * Drop the index of lines with text properties of "buf".
+ */
+    void
+prop_lines_invalidate(buf_T *buf)
+{
+    if (buf->b_prop_lines_valid)
+    {
+	ga_clear(&buf->b_prop_lines);
+	buf->b_prop_lines_valid = FALSE;
+    }
+    buf->b_prop_lines_steps = 0;
+}
+
+/*
+ * Adjust the index of lines with text properties of "buf" for the lines
+ * after "lnum" moving by "amount": 1 when a line was inserted below "lnum",
+ * -1 when line "lnum" was deleted.
+ */
+    static void
+prop_lines_move(buf_T *buf, linenr_T lnum, int amount)
+{
+    garray_T	*gap = &buf->b_prop_lines;
+    linenr_T	*lines = (linenr_T *)gap->ga_data;
+    int		i, j;
+
+    // Going over the entries is a lot cheaper than getting every line to
+    // build the index again, but with many changes it may add up.  Then drop
+    // the index, it is built again when needed.
+    buf->b_prop_lines_moved += gap->ga_len;
+    if (buf->b_prop_lines_moved > 10 * (long)buf->b_ml.ml_line_count)
+    {
+	prop_lines_invalidate(buf);
+	return;
+    }
+    for (i = 0, j = 0; i < gap->ga_len; ++i)
+    {
+	if (amount < 0 && lines[i] == lnum)
+	    continue;
+	lines[j++] = lines[i] > lnum ? lines[i] + amount : lines[i];
+    }
+    gap->ga_len = j;
+}
+
+/*
+ * Update the index of lines with text properties of "buf" for a line
+ * appended below line "lnum" with text "line", "len" bytes long including
+ * text properties.  Must be called when a line is inserted.
+ */
+    void
+prop_lines_append(buf_T *buf, linenr_T lnum, char_u *line, colnr_T len)
+{
+    if (!buf->b_prop_lines_valid)
+	return;
+    prop_lines_move(buf, lnum, 1);
+    if ((size_t)len > STRLEN(line) + 1)
+	prop_lines_add(buf, lnum + 1);
+}
+
+/*
+ * Update the index of lines with text properties of "buf" for line "lnum"
+ * being deleted.  Must be called when a line is deleted.
+ */
+    void
+prop_lines_delete(buf_T *buf, linenr_T lnum)
+{
+    if (buf->b_prop_lines_valid)
+	prop_lines_move(buf, lnum, -1);
+}
+
+/*
+ * Add line "lnum" to the index of lines with text properties of "buf".  Must
+ * be called when text properties are added to a line.
+ */
+    void
+prop_lines_add(buf_T *buf, linenr_T lnum)
+{
+    garray_T	*gap = &buf->b_prop_lines;
+
+    if (!buf->b_prop_lines_valid)
+	return;
+    if (gap->ga_len > 0)
+    {
+	linenr_T last = ((linenr_T *)gap->ga_data)[gap->ga_len - 1];
+
+	if (last == lnum)
+	    return;
+	// Sorting is done when the index is used.
+	if (last > lnum)
+	    buf->b_prop_lines_sorted = FALSE;
+    }
+    if (ga_grow(gap, 1) == FAIL)
+    {
+	prop_lines_invalidate(buf);
+	return;
+    }
+    ((linenr_T *)gap->ga_data)[gap->ga_len++] = lnum;
+}
+
+/*
+ * Return the line after "lnum" when "dir" is FORWARD, or before "lnum" when
+ * "dir" is BACKWARD, that may have text properties.  Returns zero when there
+ * is no such line.
+ * Without an index this is the next line.  The index is built once as many
+ * lines have been visited as the buffer has, thus it at most doubles the
+ * work.
+ */
+    static linenr_T
+prop_next_line(buf_T *buf, linenr_T lnum, int dir)
+{
+    garray_T	*gap = &buf->b_prop_lines;
+    linenr_T	*lines;
+    int		lo, hi;
+
+    if (!buf->b_prop_lines_valid
+		&& ++buf->b_prop_lines_steps > buf->b_ml.ml_line_count)
+	prop_lines_build(buf);
+    if (!buf->b_prop_lines_valid)
+    {
+	lnum += dir;
+	return lnum < 1 || lnum > buf->b_ml.ml_line_count ? 0 : lnum;
+    }
+
+    lines = (linenr_T *)gap->ga_data;
+    if (!buf->b_prop_lines_sorted)
+    {
+	int	i, j;
+
+	qsort((void *)lines, (size_t)gap->ga_len, sizeof(linenr_T),
+							  prop_lines_compare);
+	// remove duplicates
+	for (i = 1, j = 1; i < gap->ga_len; ++i)
+	    if (lines[i] != lines[j - 1])
+		lines[j++] = lines[i];
+	if (gap->ga_len > 0)
+	    gap->ga_len = j;
+	buf->b_prop_lines_sorted = TRUE;
+    }
+
+    // Find the first entry after "lnum".
+    lo = 0;
+    hi = gap->ga_len;
+    while (lo < hi)
+    {
+	int mid = lo + (hi - lo) / 2;
+
+	if (lines[mid] <= lnum)
+	    lo = mid + 1;
+	else
+	    hi = mid;
+    }
+    if (dir == FORWARD)
+	return lo < gap->ga_len ? lines[lo] : 0;
+    if (lo > 0 && lines[lo - 1] == lnum)
+	--lo;
+    return lo > 0 ? lines[lo - 1] : 0;
+}
+
 /*
  * Return the number of text properties with "above" or "below" alignment in
  * line "lnum".  A "right" aligned property also goes below after a "below" or
@@ -888,6 +1088,8 @@ set_text_props(linenr_T lnum, char_u *props, int len)
     curbuf->b_ml.ml_line_ptr = newtext;
     curbuf->b_ml.ml_line_len = textlen + len;
     curbuf->b_ml.ml_flags |= ML_LINE_DIRTY;
+    if (len > 0)
+	prop_lines_add(curbuf, lnum);
 }
 
 /*
@@ -911,6 +1113,7 @@ add_text_props(linenr_T lnum, textprop_T *text_props, int text_prop_count)
     curbuf->b_ml.ml_line_ptr = newtext;
     curbuf->b_ml.ml_line_len += proplen;
     curbuf->b_ml.ml_flags |= ML_LINE_DIRTY;
+    prop_lines_add(curbuf, lnum);
 }
 
 /*
@@ -1095,7 +1298,8 @@ f_prop_clear(typval_T *argvars, typval_T *rettv UNUSED)
 	return;
     }
 
-    for (lnum = start; lnum <= end; ++lnum)
+    for (lnum = start; lnum != 0 && lnum <= end;
+				      lnum = prop_next_line(buf, lnum, FORWARD))
     {
 	char_u *text;
 	size_t len;
@@ -1303,18 +1507,9 @@ f_prop_find(typval_T *argvars, typval_T *rettv)
 	    }
 	}
 
-	if (dir > 0)
-	{
-	    if (lnum >= buf->b_ml.ml_line_count)
-		break;
-	    lnum++;
-	}
-	else
-	{
-	    if (lnum <= 1)
-		break;
-	    lnum--;
-	}
+	lnum = prop_next_line(buf, lnum, dir);
+	if (lnum == 0)
+	    break;
     }
 }
 
@@ -1561,7 +1756,8 @@ f_prop_list(typval_T *argvars, typval_T *rettv)
 		|| end_lnum < 1 || end_lnum < start_lnum)
 	emsg(_(e_invalid_range));
     else
-	for (lnum = start_lnum; lnum <= end_lnum; lnum++)
+	for (lnum = start_lnum; lnum != 0 && lnum <= end_lnum;
+				      lnum = prop_next_line(buf, lnum, FORWARD))
 	    get_props_in_line(buf, lnum, prop_types, prop_types_len,
 		    prop_ids, prop_ids_len,
 		    rettv->vval.v_list, add_lnum);
@@ -1685,7 +1881,8 @@ f_prop_remove(typval_T *argvars, typval_T *rettv)
 
     if (end == 0)
 	end = buf->b_ml.ml_line_count;
-    for (lnum = start; lnum <= end; ++lnum)
+    for (lnum = start; lnum != 0 && lnum <= end;
+				      lnum = prop_next_line(buf, lnum, FORWARD))
     {
 	size_t len;
 
@@ -1796,6 +1993,317 @@ cleanup_prop_remove:
     vim_free(type_ids);
 }
 
+// A text property to be added by prop_replace().
+typedef struct {
+    linenr_T	pr_lnum;
+    colnr_T	pr_col;
+    long	pr_len;
+    int		pr_type;	// index in the list of types
+    int		pr_id;
+    int		pr_idx;		// index in the list of items
+} propreplace_T;
+
+/*
+ * Function passed to qsort() for sorting propreplace_T on the line number,
+ * keeping the order of the items within a line.
+ */
+    static int
+prop_replace_compare(const void *s1, const void *s2)
+{
+    propreplace_T *pr1 = (propreplace_T *)s1;
+    propreplace_T *pr2 = (propreplace_T *)s2;
+
+    if (pr1->pr_lnum != pr2->pr_lnum)
+	return pr1->pr_lnum > pr2->pr_lnum ? 1 : -1;
+    return pr1->pr_idx - pr2->pr_idx;
+}
+
+/*
+ * Replace the text properties with a type in "types[num_types]" in line
+ * "lnum" of "buf" with the "num_items" properties in "items".
+ * The line is rewritten once.  Sets "did_remove_text" when the text of a
+ * virtual text property was freed.
+ * Returns FAIL when a column is invalid or out of memory.
+ */
+    static int
+prop_replace_line(
+	buf_T		*buf,
+	linenr_T	lnum,
+	proptype_T	**types,
+	int		num_types,
+	propreplace_T	*items,
+	int		num_items,
+	int		*did_remove_text)
+{
+    char_u	*props = NULL;
+    int		proplen;
+    size_t	textlen;
+    char_u	*newtext;
+    char_u	*newprops;
+    int		count = 0;
+    textprop_T	prop;
+    int		i, j;
+
+    proplen = get_text_props(buf, lnum, &props, TRUE);
+    if (proplen == 0 && num_items == 0)
+	return OK;
+    textlen = buf->b_ml.ml_line_len - proplen * sizeof(textprop_T);
+    for (i = 0; i < num_items; ++i)
+	if (items[i].pr_col - 1 > (colnr_T)textlen)
+	{
+	    semsg(_(e_invalid_column_number_nr), (long)items[i].pr_col);
+	    return FAIL;
+	}
+
+    newtext = alloc(textlen + (proplen + num_items) * sizeof(textprop_T));
+    if (newtext == NULL)
+	return FAIL;
+    mch_memmove(newtext, buf->b_ml.ml_line_ptr, textlen);
+    newprops = newtext + textlen;
+
+    // Keep the properties of other types.
+    for (i = 0; i < proplen; ++i)
+    {
+	mch_memmove(&prop, props + i * sizeof(textprop_T), sizeof(textprop_T));
+	for (j = 0; j < num_types; ++j)
+	    if (prop.tp_type == types[j]->pt_id)
+		break;
+	if (j < num_types)
+	{
+	    if (prop.tp_id < 0)
+	    {
+		garray_T    *gap = &buf->b_textprop_text;
+		int	    ii = -prop.tp_id - 1;
+
+		// negative ID: property with text - free the text
+		if (ii < gap->ga_len)
+		{
+		    VIM_CLEAR(((char_u **)gap->ga_data)[ii]);
+		    *did_remove_text = TRUE;
+		}
+	    }
+	    continue;
+	}
+	mch_memmove(newprops + count * sizeof(textprop_T), &prop,
+							   sizeof(textprop_T));
+	++count;
+    }
+
+    // Insert the new properties where prop_add() would put them.
+    for (i = 0; i < num_items; ++i)
+    {
+	propreplace_T	*pr = &items[i];
+	proptype_T	*type = types[pr->pr_type];
+	textprop_T	tmp_prop;
+
+	for (j = 0; j < count; ++j)
+	{
+	    mch_memmove(&tmp_prop, newprops + j * sizeof(textprop_T),
+							   sizeof(textprop_T));
+	    if (((tmp_prop.tp_flags & TP_FLAG_ALIGN_ABOVE)
+					? 0 : tmp_prop.tp_col) >= pr->pr_col)
+		break;
+	}
+	if (j < count)
+	    mch_memmove(newprops + (j + 1) * sizeof(textprop_T),
+				       newprops + j * sizeof(textprop_T),
+				       (count - j) * sizeof(textprop_T));
+
+	CLEAR_FIELD(prop);
+	prop.tp_col = pr->pr_col;
+	prop.tp_len = pr->pr_len > (long)textlen ? (colnr_T)textlen
+							: (colnr_T)pr->pr_len;
+	prop.tp_id = pr->pr_id;
+	prop.tp_type = type->pt_id;
+	prop.tp_flags = (type->pt_flags & PT_FLAG_INS_START_INCL)
+						     ? TP_FLAG_START_INCL : 0;
+	mch_memmove(newprops + j * sizeof(textprop_T), &prop,
+							   sizeof(textprop_T));
+	++count;
+    }
+
+    if (buf->b_ml.ml_flags & (ML_LINE_DIRTY | ML_ALLOCATED))
+	vim_free(buf->b_ml.ml_line_ptr);
+    buf->b_ml.ml_line_ptr = newtext;
+    buf->b_ml.ml_line_len = (int)(textlen + count * sizeof(textprop_T));
+    buf->b_ml.ml_flags |= ML_LINE_DIRTY;
+    return OK;
+}
+
+/*
+ * prop_replace({props}, {lnum}, {lnum-end}, {items})
+ */
+    void
+f_prop_replace(typval_T *argvars, typval_T *rettv UNUSED)
+{
+    dict_T	*dict;
+    dictitem_T	*di;
+    buf_T	*buf = curbuf;
+    linenr_T	start;
+    linenr_T	end;
+    linenr_T	lnum;
+    proptype_T	**types = NULL;
+    int		num_types = 0;
+    propreplace_T *items = NULL;
+    int		num_items = 0;
+    int		id = 0;
+    listitem_T	*li;
+    int		i;
+    int		error = FALSE;
+    int		prev_did_emsg = did_emsg;
+    int		did_remove_text = FALSE;
+
+    if (in_vim9script()
+	    && (check_for_number_arg(argvars, 1) == FAIL
+		|| check_for_number_arg(argvars, 2) == FAIL))
+	return;
+
+    if (check_for_nonnull_dict_arg(argvars, 0) == FAIL
+	    || check_for_list_arg(argvars, 3) == FAIL)
+	return;
+    dict = argvars[0].vval.v_dict;
+
+    if (get_bufnr_from_arg(&argvars[0], &buf) == FAIL)
+	return;
+    if (buf->b_ml.ml_mfp == NULL)
+    {
+	emsg(_(e_cannot_add_text_property_to_unloaded_buffer));
+	return;
+    }
+
+    start = tv_get_number(&argvars[1]);
+    end = tv_get_number(&argvars[2]);
+    if (start < 1 || end < start || end > buf->b_ml.ml_line_count)
+    {
+	emsg(_(e_invalid_range));
+	return;
+    }
+
+    di = dict_find(dict, (char_u *)"types", -1);
+    if (di == NULL)
+    {
+	emsg(_(e_missing_property_type_name));
+	return;
+    }
+    if (di->di_tv.v_type != VAR_LIST)
+    {
+	emsg(_(e_list_required));
+	return;
+    }
+    if (list_len(di->di_tv.vval.v_list) > 0)
+    {
+	types = ALLOC_MULT(proptype_T *, list_len(di->di_tv.vval.v_list));
+	if (types == NULL)
+	    return;
+	FOR_ALL_LIST_ITEMS(di->di_tv.vval.v_list, li)
+	{
+	    if (li->li_tv.v_type != VAR_STRING)
+	    {
+		emsg(_(e_string_required));
+		goto theend;
+	    }
+	    types[num_types] = lookup_prop_type(li->li_tv.vval.v_string, buf);
+	    if (types[num_types] == NULL)
+		goto theend;
+	    ++num_types;
+	}
+    }
+
+    if (dict_has_key(dict, "id"))
+	id = dict_get_number(dict, "id");
+
+    if (argvars[3].vval.v_list != NULL && argvars[3].vval.v_list->lv_len > 0)
+    {
+	items = ALLOC_MULT(propreplace_T, argvars[3].vval.v_list->lv_len);
+	if (items == NULL)
+	    goto theend;
+	FOR_ALL_LIST_ITEMS(argvars[3].vval.v_list, li)
+	{
+	    propreplace_T   *pr = &items[num_items];
+	    list_T	    *l;
+
+	    if (li->li_tv.v_type != VAR_LIST || li->li_tv.vval.v_list == NULL)
+	    {
+		emsg(_(e_list_required));
+		goto theend;
+	    }
+	    l = li->li_tv.vval.v_list;
+	    pr->pr_lnum = list_find_nr(l, 0L, &error);
+	    if (!error)
+		pr->pr_col = list_find_nr(l, 1L, &error);
+	    if (!error)
+		pr->pr_len = list_find_nr(l, 2L, &error);
+	    if (!error)
+		pr->pr_type = list_find_nr(l, 3L, &error);
+	    pr->pr_id = id;
+	    if (!error && l->lv_len > 4)
+		pr->pr_id = list_find_nr(l, 4L, &error);
+	    if (error || pr->pr_col <= 0 || pr->pr_len < 0
+		    || pr->pr_type < 0 || pr->pr_type >= num_types)
+	    {
+		if (prev_did_emsg == did_emsg)
+		    emsg(_(e_invalid_argument));
+		goto theend;
+	    }
+	    if (pr->pr_lnum < start || pr->pr_lnum > end)
+	    {
+		semsg(_(e_invalid_line_number_nr), (long)pr->pr_lnum);
+		goto theend;
+	    }
+	    pr->pr_idx = num_items++;
+	}
+	qsort((void *)items, (size_t)num_items, sizeof(propreplace_T),
+							prop_replace_compare);
+    }
+
+    // This must be done _before_ we start adding properties because property
+    // changes trigger buffer (memline) reorganisation, which needs this flag
+    // to be correctly set.
+    buf->b_has_textprop = TRUE;  // this is never reset
+
+    // Go over the lines that have properties or items, each line is only
+    // changed once.
+    i = 0;
+    lnum = start;
+    while (lnum != 0 && lnum <= end)
+    {
+	linenr_T    next;
+	int	    n = 0;
+
+	while (i + n < num_items && items[i + n].pr_lnum == lnum)
+	    ++n;
+	if (prop_replace_line(buf, lnum, types, num_types, items + i, n,
+						      &did_remove_text) == FAIL)
+	    break;
+	i += n;
+
+	next = prop_next_line(buf, lnum, FORWARD);
+	if (i < num_items && (next == 0 || items[i].pr_lnum < next))
+	    next = items[i].pr_lnum;
+	lnum = next;
+    }
+    for (i = 0; i < num_items; ++i)
+	prop_lines_add(buf, items[i].pr_lnum);
+
+    changed_line_display_buf(buf);
+    changed_lines_buf(buf, start, end + 1, 0);
+    redraw_buf_later(buf, UPD_VALID);
+
+    if (did_remove_text)
+    {
+	garray_T    *gap = &buf->b_textprop_text;
+
+	// Reduce the growarray size for NULL pointers at the end.
+	while (gap->ga_len > 0
+			 && ((char_u **)gap->ga_data)[gap->ga_len - 1] == NULL)
+	    --gap->ga_len;
+    }
+
+theend:
+    vim_free(types);
+    vim_free(items);
+}
+
 /*
  * Common for f_prop_type_add() and f_prop_type_change().
  */
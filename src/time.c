@@ -397,6 +397,13 @@ f_strptime(typval_T *argvars, typval_T *rettv)
 static timer_T	*first_timer = NULL;
 static long	last_timer_id = 0;
 
+// Timers that are waiting to fire: not paused, firing or stopped.  Kept as a
+// binary heap with the timer that is due first at index zero.
+static garray_T	timer_heap = {0, 0, sizeof(timer_T *), 20, NULL};
+static int_u	timer_pass = 0;
+
+#define TIMER_HEAP(idx) (((timer_T **)timer_heap.ga_data)[idx])
+
 /*
  * Return time left, in "msec", until "due".  Negative if past "due".
  */
@@ -419,6 +426,102 @@ proftime_time_left(proftime_T *due, proftime_T *now)
 #  endif
 }
 
+/*
+ * Return TRUE when timer "a" is due before timer "b".
+ */
+    static int
+timer_due_before(timer_T *a, timer_T *b)
+{
+#  ifdef MSWIN
+    return a->tr_due.QuadPart < b->tr_due.QuadPart;
+#  else
+    return a->tr_due.tv_sec < b->tr_due.tv_sec
+	    || (a->tr_due.tv_sec == b->tr_due.tv_sec
+				     && a->tr_due.tv_fsec < b->tr_due.tv_fsec);
+#  endif
+}
+
+/*
+ * Put "timer" at index "idx" of the timer heap.
+ */
+    static void
+timer_heap_set(int idx, timer_T *timer)
+{
+    TIMER_HEAP(idx) = timer;
+    timer->tr_heap_idx = idx;
+}
+
+/*
+ * Move the timer at index "idx" of the timer heap up or down to where it
+ * belongs.
+ */
+    static void
+timer_heap_fix(int idx)
+{
+    timer_T	*timer = TIMER_HEAP(idx);
+    int		parent;
+    int		child;
+
+    while (idx > 0)
+    {
+	parent = (idx - 1) / 2;
+	if (!timer_due_before(timer, TIMER_HEAP(parent)))
+	    break;
+	timer_heap_set(idx, TIMER_HEAP(parent));
+	idx = parent;
+    }
+    for (;;)
+    {
+	child = idx * 2 + 1;
+	if (child >= timer_heap.ga_len)
+	    break;
+	if (child + 1 < timer_heap.ga_len
+		&& timer_due_before(TIMER_HEAP(child + 1), TIMER_HEAP(child)))
+	    ++child;
+	if (!timer_due_before(TIMER_HEAP(child), timer))
+	    break;
+	timer_heap_set(idx, TIMER_HEAP(child));
+	idx = child;
+    }
+    timer_heap_set(idx, timer);
+}
+
+/*
+ * Take "timer" out of the timer heap, if it is in it.
+ */
+    static void
+timer_heap_remove(timer_T *timer)
+{
+    int		idx = timer->tr_heap_idx;
+
+    if (idx < 0)
+	return;
+    timer->tr_heap_idx = -1;
+    if (--timer_heap.ga_len > idx)
+    {
+	timer_heap_set(idx, TIMER_HEAP(timer_heap.ga_len));
+	timer_heap_fix(idx);
+    }
+}
+
+/*
+ * Update the position of "timer" in the timer heap after its due time or
+ * state changed.  Only timers that are waiting to fire are in the heap.
+ */
+    static void
+timer_heap_update(timer_T *timer)
+{
+    if (timer->tr_id == -1 || timer->tr_firing || timer->tr_paused)
+	timer_heap_remove(timer);
+    else if (timer->tr_heap_idx >= 0)
+	timer_heap_fix(timer->tr_heap_idx);
+    else if (ga_grow(&timer_heap, 1) == OK)
+    {
+	timer_heap_set(timer_heap.ga_len++, timer);
+	timer_heap_fix(timer->tr_heap_idx);
+    }
+}
+
 /*
  * Insert a timer in the list of timers.
  */
@@ -427,6 +530,7 @@ insert_timer(timer_T *timer)
 {
     timer->tr_next = first_timer;
     timer->tr_prev = NULL;
+    timer->tr_heap_idx = -1;
     if (first_timer != NULL)
 	first_timer->tr_prev = timer;
     first_timer = timer;
@@ -439,6 +543,7 @@ insert_timer(timer_T *timer)
     static void
 remove_timer(timer_T *timer)
 {
+    timer_heap_remove(timer);
     if (timer->tr_prev == NULL)
 	first_timer = timer->tr_next;
     else
@@ -470,6 +575,7 @@ create_timer(long msec, int repeat)
 	// Overflow!  Might cause duplicates...
 	last_timer_id = 0;
     timer->tr_id = last_timer_id;
+    timer->tr_pass = timer_pass;
     insert_timer(timer);
     if (repeat != 0)
 	timer->tr_repeat = repeat - 1;
@@ -487,6 +593,7 @@ timer_start(timer_T *timer)
 {
     profile_setlimit(timer->tr_interval, &timer->tr_due);
     timer->tr_paused = FALSE;
+    timer_heap_update(timer);
 }
 
 /*
@@ -513,7 +620,20 @@ timer_callback(timer_T *timer)
     argv[1].v_type = VAR_UNKNOWN;
 
     rettv.v_type = VAR_UNKNOWN;
+#ifdef FEAT_EVAL
+    if (trace_fd != NULL)
+    {
+	callback_T *cb = &timer->tr_callback;
+
+	trace_begin("timer", cb->cb_partial != NULL
+			  ? partial_name(cb->cb_partial) : cb->cb_name, NULL);
+    }
+#endif
     call_callback(&timer->tr_callback, -1, &rettv, 1, argv);
+#ifdef FEAT_EVAL
+    if (trace_fd != NULL)
+	trace_end();
+#endif
     clear_tv(&rettv);
 
 #ifdef FEAT_EVAL
@@ -530,13 +650,13 @@ timer_callback(timer_T *timer)
 check_due_timer(void)
 {
     timer_T	*timer;
-    timer_T	*timer_next;
     long	this_due;
     long	next_due = -1;
     proftime_T	now;
     int		did_one = FALSE;
     int		need_update_screen = FALSE;
     long	current_id = last_timer_id;
+    int_u	pass = ++timer_pass;
 
     // Don't run any timers while exiting, dealing with an error or at the
     // debug prompt.
@@ -544,90 +664,90 @@ check_due_timer(void)
 	return next_due;
 
     profile_start(&now);
-    for (timer = first_timer; timer != NULL && !got_int; timer = timer_next)
+    // The timer heap only holds timers waiting to fire, the one at the top is
+    // due first.  A timer that was created or already fired in this pass is
+    // not invoked until the next pass.
+    while (timer_heap.ga_len > 0 && !got_int)
     {
-	timer_next = timer->tr_next;
-
-	if (timer->tr_id == -1 || timer->tr_firing || timer->tr_paused)
-	    continue;
+	timer = TIMER_HEAP(0);
 	this_due = proftime_time_left(&timer->tr_due, &now);
-	if (this_due <= 1)
+	if (this_due > 1 || timer->tr_pass == pass)
+	    break;
+	timer->tr_pass = pass;
+	timer_heap_remove(timer);
+
+	// Save and restore a lot of flags, because the timer fires while
+	// waiting for a character, which might be halfway a command.
+	int save_timer_busy = timer_busy;
+	int save_vgetc_busy = vgetc_busy;
+	int save_did_emsg = did_emsg;
+	int prev_uncaught_emsg = uncaught_emsg;
+	int save_called_emsg = called_emsg;
+	int save_must_redraw = must_redraw;
+	int save_ex_pressedreturn = get_pressedreturn();
+	int save_may_garbage_collect = may_garbage_collect;
+	vimvars_save_T	vvsave;
+	exception_state_T	estate;
+
+	exception_state_save(&estate);
+
+	// Create a scope for running the timer callback, ignoring most of
+	// the current scope, such as being inside a try/catch.
+	timer_busy = timer_busy > 0 || vgetc_busy > 0;
+	vgetc_busy = 0;
+	called_emsg = 0;
+	did_emsg = FALSE;
+	must_redraw = 0;
+	may_garbage_collect = FALSE;
+	exception_state_clear();
+	save_vimvars(&vvsave);
+
+	// Invoke the callback.
+	timer->tr_firing = TRUE;
+	timer_callback(timer);
+	timer->tr_firing = FALSE;
+
+	// Restore stuff.
+	did_one = TRUE;
+	timer_busy = save_timer_busy;
+	vgetc_busy = save_vgetc_busy;
+	if (uncaught_emsg > prev_uncaught_emsg)
+	    ++timer->tr_emsg_count;
+	did_emsg = save_did_emsg;
+	called_emsg = save_called_emsg;
+	exception_state_restore(&estate);
+	restore_vimvars(&vvsave);
+	if (must_redraw != 0)
+	    need_update_screen = TRUE;
+	must_redraw = must_redraw > save_must_redraw
+					  ? must_redraw : save_must_redraw;
+	set_pressedreturn(save_ex_pressedreturn);
+	may_garbage_collect = save_may_garbage_collect;
+
+	// Only fire the timer again if it repeats and stop_timer() wasn't
+	// called while inside the callback (tr_id == -1).
+	if (timer->tr_repeat != 0 && timer->tr_id != -1
+		&& timer->tr_emsg_count < 3)
 	{
-	    // Save and restore a lot of flags, because the timer fires while
-	    // waiting for a character, which might be halfway a command.
-	    int save_timer_busy = timer_busy;
-	    int save_vgetc_busy = vgetc_busy;
-	    int save_did_emsg = did_emsg;
-	    int prev_uncaught_emsg = uncaught_emsg;
-	    int save_called_emsg = called_emsg;
-	    int save_must_redraw = must_redraw;
-	    int save_ex_pressedreturn = get_pressedreturn();
-	    int save_may_garbage_collect = may_garbage_collect;
-	    vimvars_save_T	vvsave;
-	    exception_state_T	estate;
-
-	    exception_state_save(&estate);
-
-	    // Create a scope for running the timer callback, ignoring most of
-	    // the current scope, such as being inside a try/catch.
-	    timer_busy = timer_busy > 0 || vgetc_busy > 0;
-	    vgetc_busy = 0;
-	    called_emsg = 0;
-	    did_emsg = FALSE;
-	    must_redraw = 0;
-	    may_garbage_collect = FALSE;
-	    exception_state_clear();
-	    save_vimvars(&vvsave);
-
-	    // Invoke the callback.
-	    timer->tr_firing = TRUE;
-	    timer_callback(timer);
-	    timer->tr_firing = FALSE;
-
-	    // Restore stuff.
-	    timer_next = timer->tr_next;
-	    did_one = TRUE;
-	    timer_busy = save_timer_busy;
-	    vgetc_busy = save_vgetc_busy;
-	    if (uncaught_emsg > prev_uncaught_emsg)
-		++timer->tr_emsg_count;
-	    did_emsg = save_did_emsg;
-	    called_emsg = save_called_emsg;
-	    exception_state_restore(&estate);
-	    restore_vimvars(&vvsave);
-	    if (must_redraw != 0)
-		need_update_screen = TRUE;
-	    must_redraw = must_redraw > save_must_redraw
-					      ? must_redraw : save_must_redraw;
-	    set_pressedreturn(save_ex_pressedreturn);
-	    may_garbage_collect = save_may_garbage_collect;
-
-	    // Only fire the timer again if it repeats and stop_timer() wasn't
-	    // called while inside the callback (tr_id == -1).
-	    if (timer->tr_repeat != 0 && timer->tr_id != -1
-		    && timer->tr_emsg_count < 3)
-	    {
-		profile_setlimit(timer->tr_interval, &timer->tr_due);
-		this_due = proftime_time_left(&timer->tr_due, &now);
-		if (this_due < 1)
-		    this_due = 1;
-		if (timer->tr_repeat > 0)
-		    --timer->tr_repeat;
-	    }
-	    else
-	    {
-		this_due = -1;
-		if (timer->tr_keep)
-		    timer->tr_paused = TRUE;
-		else
-		{
-		    remove_timer(timer);
-		    free_timer(timer);
-		}
-	    }
+	    profile_setlimit(timer->tr_interval, &timer->tr_due);
+	    if (timer->tr_repeat > 0)
+		--timer->tr_repeat;
+	    timer_heap_update(timer);
 	}
-	if (this_due > 0 && (next_due == -1 || next_due > this_due))
-	    next_due = this_due;
+	else if (timer->tr_keep)
+	    timer->tr_paused = TRUE;
+	else
+	{
+	    remove_timer(timer);
+	    free_timer(timer);
+	}
+    }
+
+    if (timer_heap.ga_len > 0)
+    {
+	next_due = proftime_time_left(&TIMER_HEAP(0)->tr_due, &now);
+	if (next_due < 1)
+	    next_due = 1;
     }
 
     if (did_one)
@@ -809,6 +929,7 @@ timer_free_all(void)
 	remove_timer(timer);
 	free_timer(timer);
     }
+    ga_clear(&timer_heap);
 }
 # endif
 
@@ -859,7 +980,10 @@ f_timer_pause(typval_T *argvars, typval_T *rettv UNUSED)
 
     timer = find_timer((int)tv_get_number(&argvars[0]));
     if (timer != NULL)
+    {
 	timer->tr_paused = paused;
+	timer_heap_update(timer);
+    }
 }
 
 /*
@@ -21,7 +21,9 @@ static tuple_T		*first_tuple = NULL;	// list of all tuples
     static void
 tuple_init(tuple_T *tuple)
 {
-    // Prepend the tuple to the list of tuples for garbage collection.
+    // Prepend the tuple to the list of tuples for garbage collection.  Until
+    // it is referenced only garbage collection can free it.
+    may_have_garbage = TRUE;
     if (first_tuple != NULL)
 	first_tuple->tv_used_prev = tuple;
     tuple->tv_used_prev = NULL;
@@ -140,8 +142,12 @@ rettv_tuple_set_with_items(typval_T *rettv, int count)
     void
 tuple_unref(tuple_T *tuple)
 {
-    if (tuple != NULL && --tuple->tv_refcount <= 0)
+    if (tuple == NULL)
+	return;
+    if (--tuple->tv_refcount <= 0)
 	tuple_free(tuple);
+    else
+	may_have_garbage = TRUE;
 }
 
 /*
@@ -460,6 +460,64 @@ ui_wait_for_chars_or_timer(
 	}
 	if (due_time <= 0 || (wtime > 0 && due_time > remaining))
 	    due_time = remaining;
+# ifdef FEAT_SYN_HL
+	// Use the time until a character is typed to compute syntax state,
+	// checking for a character in between.
+	if ((due_time < 0 || due_time > 10L) && syntax_idle_pending())
+	{
+#  ifdef ELAPSED_FUNC
+	    elapsed_T	start_tv;
+#  endif
+
+	    if (wait_func(0L, interrupted, ignore_input))
+		return OK;
+	    if (interrupted != NULL && *interrupted)
+		return FAIL;
+#  ifdef ELAPSED_FUNC
+	    ELAPSED_INIT(start_tv);
+#  endif
+	    syntax_idle();
+	    if (wtime > 0)
+#  ifdef ELAPSED_FUNC
+		remaining -= ELAPSED_FUNC(start_tv);
+#  else
+		remaining -= p_sit;
+#  endif
+	    continue;
+	}
+# endif
+# ifdef ELAPSED_FUNC
+	// Also use it to update the matches for the search count.
+	if ((due_time < 0 || due_time > 10L) && search_index_pending())
+	{
+	    elapsed_T	start_tv;
+
+	    if (wait_func(0L, interrupted, ignore_input))
+		return OK;
+	    if (interrupted != NULL && *interrupted)
+		return FAIL;
+	    ELAPSED_INIT(start_tv);
+	    search_index_idle();
+	    if (wtime > 0)
+		remaining -= ELAPSED_FUNC(start_tv);
+	    continue;
+	}
+	// And to read the directories in 'path'.
+	if ((due_time < 0 || due_time > 10L) && findfile_idle_pending())
+	{
+	    elapsed_T	start_tv;
+
+	    if (wait_func(0L, interrupted, ignore_input))
+		return OK;
+	    if (interrupted != NULL && *interrupted)
+		return FAIL;
+	    ELAPSED_INIT(start_tv);
+	    findfile_idle();
+	    if (wtime > 0)
+		remaining -= ELAPSED_FUNC(start_tv);
+	    continue;
+	}
+# endif
 # if defined(FEAT_JOB_CHANNEL) || defined(FEAT_SOUND_CANBERRA) || defined(FEAT_SOUND_MACOSX)
 	if ((due_time < 0 || due_time > 10L) && (
 #  if defined(FEAT_JOB_CHANNEL)
@@ -81,8 +81,9 @@
 #define UH_MAGIC 0x18dade	// value for uh_magic when in use
 #define UE_MAGIC 0xabc123	// value for ue_magic when in use
 
-// Size of buffer used for encryption.
-#define CRYPT_BUF_SIZE 8192
+// Size of buffer used for reading and writing the undo file.  Must not be
+// changed, whole-file encryption works on blocks of this size.
+#define UNDO_BUF_SIZE 8192
 
 #include "vim.h"
 
@@ -93,10 +94,10 @@ typedef struct {
     FILE	*bi_fp;
 #ifdef FEAT_CRYPT
     cryptstate_T *bi_state;
-    char_u	*bi_buffer; // CRYPT_BUF_SIZE, NULL when not buffering
+#endif
+    char_u	*bi_buffer; // UNDO_BUF_SIZE, NULL when not buffering
     size_t	bi_used;    // bytes written to/read from bi_buffer
     size_t	bi_avail;   // bytes available in bi_buffer
-#endif
 } bufinfo_T;
 
 
@@ -110,10 +111,9 @@ static void u_freeheader(buf_T *buf, u_header_T *uhp, u_header_T **uhpp);
 static void u_freebranch(buf_T *buf, u_header_T *uhp, u_header_T **uhpp);
 static void u_freeentries(buf_T *buf, u_header_T *uhp, u_header_T **uhpp);
 static void u_freeentry(u_entry_T *, long);
+static long_u u_entry_mem(u_entry_T *uep);
 #ifdef FEAT_PERSISTENT_UNDO
-# ifdef FEAT_CRYPT
 static int undo_flush(bufinfo_T *bi);
-# endif
 static int undo_read(bufinfo_T *bi, char_u *buffer, size_t size);
 static int serialize_uep(bufinfo_T *bi, u_entry_T *uep);
 static u_entry_T *unserialize_uep(bufinfo_T *bi, int *error, char_u *file_name);
@@ -377,6 +377,30 @@ u_save_line(undoline_T *ul, linenr_T lnum)
     return ul->ul_line == NULL ? FAIL : OK;
 }
 
+/*
+ * Return the number of bytes used by undo entry "uep" and its lines.
+ */
+    static long_u
+u_entry_mem(u_entry_T *uep)
+{
+    long_u	mem = sizeof(u_entry_T) + uep->ue_size * sizeof(undoline_T);
+    long	i;
+
+    for (i = 0; i < uep->ue_size; ++i)
+	mem += uep->ue_array[i].ul_len;
+    return mem;
+}
+
+/*
+ * Return TRUE when the undo information of the current buffer uses more
+ * memory than 'undomaxmem'.
+ */
+    static int
+u_over_maxmem(void)
+{
+    return p_umm > 0 && curbuf->b_u_mem > (long_u)p_umm * 1024;
+}
+
 #ifdef FEAT_PROP_POPUP
 /*
  * return TRUE if line "lnum" has text property "flags".
@@ -530,9 +554,10 @@ u_savecommon(
 	}
 
 	/*
-	 * free headers to keep the size right
+	 * free headers to keep the size right, also when using too much
+	 * memory
 	 */
-	while (curbuf->b_u_numhead > get_undolevel()
+	while ((curbuf->b_u_numhead > get_undolevel() || u_over_maxmem())
 					       && curbuf->b_u_oldhead != NULL)
 	{
 	    u_header_T	    *uhfree = curbuf->b_u_oldhead;
@@ -607,6 +632,7 @@ u_savecommon(
 	if (curbuf->b_u_oldhead == NULL)
 	    curbuf->b_u_oldhead = uhp;
 	++curbuf->b_u_numhead;
+	curbuf->b_u_mem += sizeof(u_header_T);
     }
     else
     {
@@ -749,6 +775,7 @@ u_savecommon(
 	uep->ue_array = NULL;
     uep->ue_next = curbuf->b_u_newhead->uh_entry;
     curbuf->b_u_newhead->uh_entry = uep;
+    curbuf->b_u_mem += u_entry_mem(uep);
     curbuf->b_u_synced = FALSE;
     undo_undoes = FALSE;
 
@@ -925,20 +952,19 @@ u_free_uhp(u_header_T *uhp)
     static int
 undo_write(bufinfo_T *bi, char_u *ptr, size_t len)
 {
-#ifdef FEAT_CRYPT
     if (bi->bi_buffer != NULL)
     {
 	size_t	len_todo = len;
 	char_u  *p = ptr;
 
-	while (bi->bi_used + len_todo >= CRYPT_BUF_SIZE)
+	while (bi->bi_used + len_todo >= UNDO_BUF_SIZE)
 	{
-	    size_t	n = CRYPT_BUF_SIZE - bi->bi_used;
+	    size_t	n = UNDO_BUF_SIZE - bi->bi_used;
 
 	    mch_memmove(bi->bi_buffer + bi->bi_used, p, n);
 	    len_todo -= n;
 	    p += n;
-	    bi->bi_used = CRYPT_BUF_SIZE;
+	    bi->bi_used = UNDO_BUF_SIZE;
 	    if (undo_flush(bi) == FAIL)
 		return FAIL;
 	}
@@ -949,28 +975,33 @@ undo_write(bufinfo_T *bi, char_u *ptr, size_t len)
 	}
 	return OK;
     }
-#endif
     if (fwrite(ptr, len, (size_t)1, bi->bi_fp) != 1)
 	return FAIL;
     return OK;
 }
 
-#ifdef FEAT_CRYPT
+/*
+ * Write out the bytes in the buffer, encrypting them when needed.
+ * Returns OK or FAIL.
+ */
     static int
 undo_flush(bufinfo_T *bi)
 {
-    if (bi->bi_buffer != NULL && bi->bi_state != NULL && bi->bi_used > 0)
+    if (bi->bi_buffer != NULL && bi->bi_used > 0)
     {
-	// Last parameter is only used for sodium encryption and that
-	// explicitly disables encryption of undofiles.
-	crypt_encode_inplace(bi->bi_state, bi->bi_buffer, bi->bi_used, FALSE);
+#ifdef FEAT_CRYPT
+	if (bi->bi_state != NULL)
+	    // Last parameter is only used for sodium encryption and that
+	    // explicitly disables encryption of undofiles.
+	    crypt_encode_inplace(bi->bi_state, bi->bi_buffer, bi->bi_used,
+									FALSE);
+#endif
 	if (fwrite(bi->bi_buffer, bi->bi_used, (size_t)1, bi->bi_fp) != 1)
 	    return FAIL;
 	bi->bi_used = 0;
     }
     return OK;
 }
-#endif
 
 /*
  * Write "ptr[len]" and crypt the bytes when needed.
@@ -1037,7 +1068,6 @@ put_header_ptr(bufinfo_T *bi, u_header_T *uhp)
     static int
 undo_read_4c(bufinfo_T *bi)
 {
-#ifdef FEAT_CRYPT
     if (bi->bi_buffer != NULL)
     {
 	char_u  buf[4];
@@ -1047,14 +1077,12 @@ undo_read_4c(bufinfo_T *bi)
 	n = ((unsigned)buf[0] << 24) + (buf[1] << 16) + (buf[2] << 8) + buf[3];
 	return n;
     }
-#endif
     return get4c(bi->bi_fp);
 }
 
     static int
 undo_read_2c(bufinfo_T *bi)
 {
-#ifdef FEAT_CRYPT
     if (bi->bi_buffer != NULL)
     {
 	char_u  buf[2];
@@ -1064,14 +1092,12 @@ undo_read_2c(bufinfo_T *bi)
 	n = (buf[0] << 8) + buf[1];
 	return n;
     }
-#endif
     return get2c(bi->bi_fp);
 }
 
     static int
 undo_read_byte(bufinfo_T *bi)
 {
-#ifdef FEAT_CRYPT
     if (bi->bi_buffer != NULL)
     {
 	char_u  buf[1];
@@ -1079,14 +1105,12 @@ undo_read_byte(bufinfo_T *bi)
 	undo_read(bi, buf, (size_t)1);
 	return buf[0];
     }
-#endif
     return getc(bi->bi_fp);
 }
 
     static time_t
 undo_read_time(bufinfo_T *bi)
 {
-#ifdef FEAT_CRYPT
     if (bi->bi_buffer != NULL)
     {
 	char_u  buf[8];
@@ -1098,7 +1122,6 @@ undo_read_time(bufinfo_T *bi)
 	    n = (n << 8) + buf[i];
 	return n;
     }
-#endif
     return get8ctime(bi->bi_fp);
 }
 
@@ -1111,7 +1134,6 @@ undo_read(bufinfo_T *bi, char_u *buffer, size_t size)
 {
     int retval = OK;
 
-#ifdef FEAT_CRYPT
     if (bi->bi_buffer != NULL)
     {
 	int	size_todo = (int)size;
@@ -1123,7 +1145,7 @@ undo_read(bufinfo_T *bi, char_u *buffer, size_t size)
 
 	    if (bi->bi_used >= bi->bi_avail)
 	    {
-		n = fread(bi->bi_buffer, 1, (size_t)CRYPT_BUF_SIZE, bi->bi_fp);
+		n = fread(bi->bi_buffer, 1, (size_t)UNDO_BUF_SIZE, bi->bi_fp);
 		if (n == 0)
 		{
 		    retval = FAIL;
@@ -1131,7 +1153,11 @@ undo_read(bufinfo_T *bi, char_u *buffer, size_t size)
 		}
 		bi->bi_avail = n;
 		bi->bi_used = 0;
-		crypt_decode_inplace(bi->bi_state, bi->bi_buffer, bi->bi_avail, FALSE);
+#ifdef FEAT_CRYPT
+		if (bi->bi_state != NULL)
+		    crypt_decode_inplace(bi->bi_state, bi->bi_buffer,
+							 bi->bi_avail, FALSE);
+#endif
 	    }
 	    n = size_todo;
 	    if (n > bi->bi_avail - bi->bi_used)
@@ -1142,9 +1168,7 @@ undo_read(bufinfo_T *bi, char_u *buffer, size_t size)
 	    p += n;
 	}
     }
-    else
-#endif
-    if (fread(buffer, size, 1, bi->bi_fp) != 1)
+    else if (fread(buffer, size, 1, bi->bi_fp) != 1)
 	retval = FAIL;
 
     if (retval == FAIL)
@@ -1223,7 +1247,7 @@ serialize_header(bufinfo_T *bi, char_u *hash)
 
 	if (crypt_whole_undofile(crypt_get_method_nr(buf)))
 	{
-	    bi->bi_buffer = alloc(CRYPT_BUF_SIZE);
+	    bi->bi_buffer = alloc(UNDO_BUF_SIZE);
 	    if (bi->bi_buffer == NULL)
 	    {
 		crypt_free_state(bi->bi_state);
@@ -1235,8 +1259,15 @@ serialize_header(bufinfo_T *bi, char_u *hash)
     }
     else
 #endif
+    {
 	undo_write_bytes(bi, (long_u)UF_VERSION, 2);
 
+	// Collect the following bytes in a buffer, so that they are not
+	// written one number at a time.  Without memory go on unbuffered.
+	bi->bi_buffer = lalloc(UNDO_BUF_SIZE, FALSE);
+	bi->bi_used = 0;
+    }
+
 
     // Write a hash of the buffer text, so that we can verify it is still the
     // same when reading the buffer text.
@@ -1777,10 +1808,8 @@ u_write_undo(
     }
 #endif
 
-#ifdef FEAT_CRYPT
-    if (bi.bi_state != NULL && undo_flush(&bi) == FAIL)
+    if (undo_flush(&bi) == FAIL)
 	write_ok = FALSE;
-#endif
 
 #if defined(UNIX) && defined(HAVE_FSYNC)
     if (p_fs && fflush(fp) == 0 && vim_fsync(fd) != 0)
@@ -1814,12 +1843,49 @@ theend:
 #ifdef FEAT_CRYPT
     if (bi.bi_state != NULL)
 	crypt_free_state(bi.bi_state);
-    vim_free(bi.bi_buffer);
 #endif
+    vim_free(bi.bi_buffer);
     if (file_name != name)
 	vim_free(file_name);
 }
 
+/*
+ * Compare function for qsort(): sort undo headers on their sequence number.
+ */
+    static int
+uhp_compare(const void *s1, const void *s2)
+{
+    long seq1 = (*(u_header_T **)s1)->uh_seq;
+    long seq2 = (*(u_header_T **)s2)->uh_seq;
+
+    return seq1 == seq2 ? 0 : seq1 > seq2 ? 1 : -1;
+}
+
+/*
+ * Find the undo header with sequence number "seq" in "uhp_table[num_head]",
+ * which is sorted with uhp_compare().
+ * Returns the index in "uhp_table" or -1 when not found.
+ */
+    static int
+uhp_table_find(u_header_T **uhp_table, long num_head, long seq)
+{
+    long    lo = 0;
+    long    hi = num_head - 1;
+
+    while (lo <= hi)
+    {
+	long	mid = lo + (hi - lo) / 2;
+
+	if (uhp_table[mid]->uh_seq == seq)
+	    return (int)mid;
+	if (uhp_table[mid]->uh_seq < seq)
+	    lo = mid + 1;
+	else
+	    hi = mid - 1;
+    }
+    return -1;
+}
+
 /*
  * Load the undo tree from an undo file.
  * If "name" is not NULL use it as the undo file name.  This also means being
@@ -1841,7 +1907,7 @@ u_read_undo(char_u *name, char_u *hash, char_u *orig_name UNUSED)
     long	old_header_seq, new_header_seq, cur_header_seq;
     long	seq_last, seq_cur;
     long	last_save_nr = 0;
-    short	old_idx = -1, new_idx = -1, cur_idx = -1;
+    long	old_idx = -1, new_idx = -1, cur_idx = -1;
     long	num_read_uhps = 0;
     time_t	seq_time;
     int		i, j;
@@ -1936,7 +2002,7 @@ u_read_undo(char_u *name, char_u *hash, char_u *orig_name UNUSED)
 	}
 	if (crypt_whole_undofile(bi.bi_state->method_nr))
 	{
-	    bi.bi_buffer = alloc(CRYPT_BUF_SIZE);
+	    bi.bi_buffer = alloc(UNDO_BUF_SIZE);
 	    if (bi.bi_buffer == NULL)
 	    {
 		crypt_free_state(bi.bi_state);
@@ -1956,6 +2022,14 @@ u_read_undo(char_u *name, char_u *hash, char_u *orig_name UNUSED)
 	semsg(_(e_incompatible_undo_file_str), file_name);
 	goto error;
     }
+    else
+    {
+	// Read the rest of the file in blocks, reading it one number at a
+	// time is slow.  Without memory go on unbuffered.
+	bi.bi_buffer = lalloc(UNDO_BUF_SIZE, FALSE);
+	bi.bi_avail = 0;
+	bi.bi_used = 0;
+    }
 
     if (undo_read(&bi, read_hash, (size_t)UNDO_HASH_SIZE) == FAIL)
     {
@@ -2070,67 +2144,70 @@ u_read_undo(char_u *name, char_u *hash, char_u *orig_name UNUSED)
 # define SET_FLAG(j)
 #endif
 
-    // We have put all of the headers into a table. Now we iterate through the
-    // table and swizzle each sequence number we have stored in uh_*_seq into
-    // a pointer corresponding to the header with that sequence number.
+    // We have put all of the headers into a table.  Sort it on the sequence
+    // number, so that a header can be found with a binary search, then
+    // iterate through the table and swizzle each sequence number we have
+    // stored in uh_*_seq into a pointer corresponding to the header with that
+    // sequence number.
+    if (num_head > 1)
+	qsort((void *)uhp_table, (size_t)num_head, sizeof(u_header_T *),
+								uhp_compare);
+    for (i = 1; i < num_head; i++)
+	if (uhp_table[i - 1]->uh_seq == uhp_table[i]->uh_seq)
+	{
+	    corruption_error("duplicate uh_seq", file_name);
+	    goto error;
+	}
     for (i = 0; i < num_head; i++)
     {
 	uhp = uhp_table[i];
-	if (uhp == NULL)
-	    continue;
-	for (j = 0; j < num_head; j++)
-	    if (uhp_table[j] != NULL && i != j
-			      && uhp_table[i]->uh_seq == uhp_table[j]->uh_seq)
-	    {
-		corruption_error("duplicate uh_seq", file_name);
-		goto error;
-	    }
-	for (j = 0; j < num_head; j++)
-	    if (uhp_table[j] != NULL
-				  && uhp_table[j]->uh_seq == uhp->uh_next.seq)
-	    {
-		uhp->uh_next.ptr = uhp_table[j];
-		SET_FLAG(j);
-		break;
-	    }
-	for (j = 0; j < num_head; j++)
-	    if (uhp_table[j] != NULL
-				  && uhp_table[j]->uh_seq == uhp->uh_prev.seq)
-	    {
-		uhp->uh_prev.ptr = uhp_table[j];
-		SET_FLAG(j);
-		break;
-	    }
-	for (j = 0; j < num_head; j++)
-	    if (uhp_table[j] != NULL
-			      && uhp_table[j]->uh_seq == uhp->uh_alt_next.seq)
-	    {
-		uhp->uh_alt_next.ptr = uhp_table[j];
-		SET_FLAG(j);
-		break;
-	    }
-	for (j = 0; j < num_head; j++)
-	    if (uhp_table[j] != NULL
-			      && uhp_table[j]->uh_seq == uhp->uh_alt_prev.seq)
-	    {
-		uhp->uh_alt_prev.ptr = uhp_table[j];
-		SET_FLAG(j);
-		break;
-	    }
-	if (old_header_seq > 0 && old_idx < 0 && uhp->uh_seq == old_header_seq)
+	j = uhp_table_find(uhp_table, num_head, uhp->uh_next.seq);
+	if (j >= 0)
 	{
-	    old_idx = i;
-	    SET_FLAG(i);
+	    uhp->uh_next.ptr = uhp_table[j];
+	    SET_FLAG(j);
 	}
-	if (new_header_seq > 0 && new_idx < 0 && uhp->uh_seq == new_header_seq)
+	j = uhp_table_find(uhp_table, num_head, uhp->uh_prev.seq);
+	if (j >= 0)
 	{
-	    new_idx = i;
-	    SET_FLAG(i);
+	    uhp->uh_prev.ptr = uhp_table[j];
+	    SET_FLAG(j);
 	}
-	if (cur_header_seq > 0 && cur_idx < 0 && uhp->uh_seq == cur_header_seq)
+	j = uhp_table_find(uhp_table, num_head, uhp->uh_alt_next.seq);
+	if (j >= 0)
 	{
-	    cur_idx = i;
-	    SET_FLAG(i);
+	    uhp->uh_alt_next.ptr = uhp_table[j];
+	    SET_FLAG(j);
+	}
+	j = uhp_table_find(uhp_table, num_head, uhp->uh_alt_prev.seq);
+	if (j >= 0)
+	{
+	    uhp->uh_alt_prev.ptr = uhp_table[j];
+	    SET_FLAG(j);
+	}
+    }
+    if (old_header_seq > 0)
+    {
+	old_idx = uhp_table_find(uhp_table, num_head, old_header_seq);
+	if (old_idx >= 0)
+	{
+	    SET_FLAG(old_idx);
+	}
+    }
+    if (new_header_seq > 0)
+    {
+	new_idx = uhp_table_find(uhp_table, num_head, new_header_seq);
+	if (new_idx >= 0)
+	{
+	    SET_FLAG(new_idx);
+	}
+    }
+    if (cur_header_seq > 0)
+    {
+	cur_idx = uhp_table_find(uhp_table, num_head, cur_header_seq);
+	if (cur_idx >= 0)
+	{
+	    SET_FLAG(cur_idx);
 	}
     }
 
@@ -2149,6 +2226,17 @@ u_read_undo(char_u *name, char_u *hash, char_u *orig_name UNUSED)
     curbuf->b_u_time_cur = seq_time;
     curbuf->b_u_save_nr_last = last_save_nr;
     curbuf->b_u_save_nr_cur = last_save_nr;
+    curbuf->b_u_mem = 0;
+    for (i = 0; i < num_head; ++i)
+	if (uhp_table[i] != NULL)
+	{
+	    u_entry_T	*uep;
+
+	    curbuf->b_u_mem += sizeof(u_header_T);
+	    for (uep = uhp_table[i]->uh_entry; uep != NULL;
+							   uep = uep->ue_next)
+		curbuf->b_u_mem += u_entry_mem(uep);
+	}
 
     curbuf->b_u_synced = TRUE;
     vim_free(uhp_table);
@@ -2179,8 +2267,8 @@ theend:
 #ifdef FEAT_CRYPT
     if (bi.bi_state != NULL)
 	crypt_free_state(bi.bi_state);
-    vim_free(bi.bi_buffer);
 #endif
+    vim_free(bi.bi_buffer);
     if (fp != NULL)
 	fclose(fp);
     if (file_name != name)
@@ -2783,6 +2871,7 @@ u_undoredo(int undo)
 		while (uep != NULL)
 		{
 		    nuep = uep->ue_next;
+		    curbuf->b_u_mem -= u_entry_mem(uep);
 		    u_freeentry(uep, uep->ue_size);
 		    uep = nuep;
 		}
@@ -2810,6 +2899,7 @@ u_undoredo(int undo)
 	/*
 	 * Insert the lines in u_array between top and bot.
 	 */
+	curbuf->b_u_mem -= u_entry_mem(uep);
 	if (newsize)
 	{
 	    for (lnum = top, i = 0; i < newsize; ++i, ++lnum)
@@ -2863,6 +2953,7 @@ u_undoredo(int undo)
 	uep->ue_size = oldsize;
 	uep->ue_array = newarray;
 	uep->ue_bot = top + newsize + 1;
+	curbuf->b_u_mem += u_entry_mem(uep);
 
 	/*
 	 * insert this entry in front of the new entry list
@@ -3450,6 +3541,7 @@ u_freeentries(
     for (uep = uhp->uh_entry; uep != NULL; uep = nuep)
     {
 	nuep = uep->ue_next;
+	buf->b_u_mem -= u_entry_mem(uep);
 	u_freeentry(uep, uep->ue_size);
     }
 
@@ -3458,6 +3550,7 @@ u_freeentries(
 #endif
     vim_free((char_u *)uhp);
     --buf->b_u_numhead;
+    buf->b_u_mem -= sizeof(u_header_T);
 }
 
 /*
@@ -3484,6 +3577,7 @@ u_clearall(buf_T *buf)
     buf->b_u_newhead = buf->b_u_oldhead = buf->b_u_curhead = NULL;
     buf->b_u_synced = TRUE;
     buf->b_u_numhead = 0;
+    buf->b_u_mem = 0;
     buf->b_u_line_ptr.ul_line = NULL;
     buf->b_u_line_ptr.ul_len = 0;
     buf->b_u_line_ptr.ul_textlen = 0;
@@ -3766,6 +3860,7 @@ f_undotree(typval_T *argvars, typval_T *rettv)
     dict_add_number(dict, "seq_cur", buf->b_u_seq_cur);
     dict_add_number(dict, "time_cur", (long)buf->b_u_time_cur);
     dict_add_number(dict, "save_cur", buf->b_u_save_nr_cur);
+    dict_add_number(dict, "memory", (varnumber_T)buf->b_u_mem);
 
     list_T *list = list_alloc();
     if (list != NULL)
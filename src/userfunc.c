@@ -2595,6 +2595,7 @@ cleanup_function_call(funccall_T *fc)
 	// Link "fc" in the list for garbage collection later.
 	fc->fc_caller = previous_funccal;
 	previous_funccal = fc;
+	may_have_garbage = TRUE;
 
 	if (want_garbage_collect)
 	    // If garbage collector is ready, clear count.
@@ -2663,6 +2664,7 @@ funccal_unref(funccall_T *fc, ufunc_T *fp, int force)
 		return;
 	    }
 	}
+    may_have_garbage = TRUE;
     for (i = 0; i < fc->fc_ufuncs.ga_len; ++i)
 	if (((ufunc_T **)(fc->fc_ufuncs.ga_data))[i] == fp)
 	    ((ufunc_T **)(fc->fc_ufuncs.ga_data))[i] = NULL;
@@ -3029,11 +3031,15 @@ call_user_func(
 	if (do_profiling == PROF_YES)
 	    profile_may_start_func(&profile_info, fp, caller);
 #endif
+	if (trace_fd != NULL)
+	    trace_begin("function", printable_func_name(fp), NULL);
 	sticky_cmdmod_flags = 0;
 	if (call_def_function(fp, argcount, argvars, 0,
 		   funcexe->fe_partial, funcexe->fe_object, fc, rettv) == FAIL)
 	    retval = FCERR_FAILED;
 	funcdepth_decrement();
+	if (trace_fd != NULL)
+	    trace_end();
 #ifdef FEAT_PROFILE
 	if (do_profiling == PROF_YES && (fp->uf_profiling
 				  || (caller != NULL && caller->uf_profiling)))
@@ -3261,6 +3267,8 @@ call_user_func(
 	profile_may_start_func(&profile_info, fp,
 			fc->fc_caller == NULL ? NULL : fc->fc_caller->fc_func);
 #endif
+    if (trace_fd != NULL)
+	trace_begin("function", printable_func_name(fp), NULL);
 
     // "legacy" does not apply to commands in the function
     sticky_cmdmod_flags = 0;
@@ -3323,6 +3331,8 @@ call_user_func(
 	    profile_may_end_func(&profile_info, fp, caller);
     }
 #endif
+    if (trace_fd != NULL)
+	trace_end();
 
     // when being verbose, mention the return value
     if (p_verbose >= 12)
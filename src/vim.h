@@ -920,6 +920,7 @@ extern int (*dyn_libintl_wputenv)(const wchar_t *envstring);
 #define EW_EMPTYOK	0x8000	// no matches is not an error
 #define EW_NOTENV	0x10000	// do not expand environment variables
 #define EW_CDPATH	0x20000	// search in 'cdpath' too
+#define EW_CACHE	0x40000	// may use cached directory listings
 
 // Flags for find_file_*() functions.
 #define FINDFILE_FILE	0	// only files
@@ -191,7 +191,7 @@ typedef enum {
     ISN_BLOBAPPEND, // append to a blob, like add()
     ISN_GETITEM,    // push list item, isn_arg.number is the index
     ISN_MEMBER,	    // dict[member]
-    ISN_STRINGMEMBER, // dict.member using isn_arg.string
+    ISN_STRINGMEMBER, // dict.member using isn_arg.stringmember
     ISN_2BOOL,	    // falsy/truthy to bool, uses isn_arg.tobool
     ISN_COND2BOOL,  // convert value to bool
     ISN_2STRING,    // convert value to string at isn_arg.tostring on stack
@@ -380,6 +380,25 @@ typedef struct {
     scriptref_T	*scriptref;
 } script_T;
 
+// Inline cache for ISN_STRINGMEMBER: where the member was found the last
+// time.  Dicts created in the same way have their items at the same index in
+// the hashtab and objects of the same class have the member at the same
+// index, thus the next lookup can often skip the search.
+typedef struct {
+    hash_T	mc_hash;	// hash of the member name
+    long_u	mc_ht_mask;	// "ht_mask" of the dict hashtab, zero if not set
+    long_u	mc_ht_idx;	// index in "ht_array" of the dict hashtab
+    class_T	*mc_class;	// class of the object, NULL if not set; not a
+				// reference, only used to compare with
+    int		mc_obj_idx;	// index of the object variable in "mc_class"
+} membercache_T;
+
+// arguments to ISN_STRINGMEMBER
+typedef struct {
+    char_u	    *sm_name;	// member name
+    membercache_T   *sm_cache;	// inline cache, allocated
+} stringmember_T;
+
 // arguments to ISN_UNLET
 typedef struct {
     char_u	*ul_name;	// variable name with g:, w:, etc.
@@ -558,6 +577,7 @@ struct isn_S {
 	loadstore_T	    loadstore;
 	script_T	    script;
 	unlet_T		    unlet;
+	stringmember_T	    stringmember;
 	funcref_T	    funcref;
 	newfunc_T	    newfunc;
 	checklen_T	    checklen;
@@ -3720,6 +3720,7 @@ class_unref(class_T *cl)
 	return;
 
     --cl->class_refcount;
+    may_have_garbage = TRUE;
 
     if (cl->class_name == NULL)
 	return;
@@ -3843,8 +3844,12 @@ object_free(object_T *obj)
     void
 object_unref(object_T *obj)
 {
-    if (obj != NULL && --obj->obj_refcount <= 0)
+    if (obj == NULL)
+	return;
+    if (--obj->obj_refcount <= 0)
 	object_free(obj);
+    else
+	may_have_garbage = TRUE;
 }
 
 /*
@@ -732,6 +732,8 @@ call_dfunc(
     // Start execution at the first instruction.
     ectx->ec_iidx = 0;
 
+    if (trace_fd != NULL)
+	trace_begin("function", printable_func_name(ufunc), NULL);
     return OK;
 }
 
@@ -1250,6 +1252,9 @@ func_return(ectx_T *ectx)
     if (dfunc->df_defer_var_idx > 0)
 	invoke_defer_funcs(ectx);
 
+    if (trace_fd != NULL)
+	trace_end();
+
     // No check for uf_refcount being zero, cannot think of a way that would
     // happen.
     --dfunc->df_ufunc->uf_calls;
@@ -3229,6 +3234,33 @@ object_required_error(typval_T *tv)
     clear_type_list(&type_list);
 }
 
+/*
+ * Find the item "name" in dict "d" for ISN_STRINGMEMBER, using and updating
+ * the inline cache "mc".
+ * Returns NULL if not found.
+ */
+    static dictitem_T *
+dict_find_cached(dict_T *d, char_u *name, membercache_T *mc)
+{
+    hashtab_T	*ht = &d->dv_hashtab;
+    hashitem_T	*hi;
+
+    if (ht->ht_mask == mc->mc_ht_mask)
+    {
+	hi = &ht->ht_array[mc->mc_ht_idx];
+	if (!HASHITEM_EMPTY(hi) && hi->hi_hash == mc->mc_hash
+					     && STRCMP(hi->hi_key, name) == 0)
+	    return HI2DI(hi);
+    }
+
+    hi = hash_lookup(ht, name, mc->mc_hash);
+    if (HASHITEM_EMPTY(hi))
+	return NULL;
+    mc->mc_ht_mask = ht->ht_mask;
+    mc->mc_ht_idx = hi - ht->ht_array;
+    return HI2DI(hi);
+}
+
 /*
  * Accessing the variable or method of an object or a class stored in a
  * variable of type "any".
@@ -3242,6 +3274,8 @@ var_any_get_oc_member(class_T *current_class, isn_T *iptr, typval_T *tv)
     class_T	*tv_cl;
     object_T	*obj = NULL;
     typval_T	mtv;
+    char_u	*name = iptr->isn_arg.stringmember.sm_name;
+    membercache_T *mc = iptr->isn_arg.stringmember.sm_cache;
 
     if (is_object)
     {
@@ -3253,6 +3287,20 @@ var_any_get_oc_member(class_T *current_class, isn_T *iptr, typval_T *tv)
 	    return FAIL;
 	}
 	tv_cl = obj->obj_class;
+
+	// When the class is the same as the last time, use the object
+	// variable index found then.  The name is checked, the class may have
+	// been freed and another one allocated at the same address.
+	if (tv_cl == mc->mc_class
+		&& mc->mc_obj_idx < tv_cl->class_obj_member_count
+		&& STRCMP(tv_cl->class_obj_members[mc->mc_obj_idx].ocm_name,
+								  name) == 0)
+	{
+	    copy_tv((typval_T *)(obj + 1) + mc->mc_obj_idx, tv);
+	    set_tv_type(tv,
+		       tv_cl->class_obj_members[mc->mc_obj_idx].ocm_type);
+	    return OK;
+	}
     }
     else
     {
@@ -3270,15 +3318,28 @@ var_any_get_oc_member(class_T *current_class, isn_T *iptr, typval_T *tv)
     copy_tv(tv, &mtv);
 
     // 'name' can either be an instance or class variable or method
-    int		namelen = (int)STRLEN(iptr->isn_arg.string);
+    int		namelen = (int)STRLEN(name);
     int		save_did_emsg = did_emsg;
 
-    if (get_member_tv(tv_cl, is_object, iptr->isn_arg.string, namelen,
+    if (get_member_tv(tv_cl, is_object, name, namelen,
 						current_class, &mtv) == OK)
     {
 	// instance or class variable
 	copy_tv(&mtv, tv);
 	clear_tv(&mtv);
+
+	// Remember the index of a public object variable for next time.
+	if (is_object && *name != '_')
+	{
+	    int	    m_idx;
+
+	    if (member_lookup(tv_cl, VAR_OBJECT, name, namelen, &m_idx)
+								      != NULL)
+	    {
+		mc->mc_class = tv_cl;
+		mc->mc_obj_idx = m_idx;
+	    }
+	}
 	return OK;
     }
 
@@ -3289,8 +3350,8 @@ var_any_get_oc_member(class_T *current_class, isn_T *iptr, typval_T *tv)
     ufunc_T	*oc_method;
     int		oc_method_idx;
 
-    oc_method = method_lookup(tv_cl, tv->v_type, iptr->isn_arg.string,
-						namelen, &oc_method_idx);
+    oc_method = method_lookup(tv_cl, tv->v_type, name, namelen,
+							      &oc_method_idx);
     if (oc_method == NULL)
     {
 	char	*msg;
@@ -3300,7 +3361,7 @@ var_any_get_oc_member(class_T *current_class, isn_T *iptr, typval_T *tv)
 	    msg = e_variable_not_found_on_object_str_str;
 	else
 	    msg = e_class_variable_str_not_found_in_class_str;
-	semsg(_(msg), iptr->isn_arg.string, tv_cl->class_name);
+	semsg(_(msg), name, tv_cl->class_name);
 	return FAIL;
     }
 
@@ -6041,12 +6102,13 @@ exec_instructions(ectx_T *ectx)
 			}
 			dict = tv->vval.v_dict;
 
-			if ((di = dict_find(dict, iptr->isn_arg.string, -1))
-								   == NULL)
+			if ((di = dict_find_cached(dict,
+				    iptr->isn_arg.stringmember.sm_name,
+				    iptr->isn_arg.stringmember.sm_cache)) == NULL)
 			{
 			    SOURCING_LNUM = iptr->isn_lnum;
 			    semsg(_(e_key_not_present_in_dictionary_str),
-						     iptr->isn_arg.string);
+					   iptr->isn_arg.stringmember.sm_name);
 			    goto on_error;
 			}
 			// Put the dict used on the dict stack, it might be
@@ -7801,7 +7863,7 @@ list_instructions(char *pfx, isn_T *instr, int instr_count, ufunc_T *ufunc)
 						       " with op" : ""); break;
 	    case ISN_MEMBER: smsg("%s%4d MEMBER", pfx, current); break;
 	    case ISN_STRINGMEMBER: smsg("%s%4d MEMBER %s", pfx, current,
-						  iptr->isn_arg.string); break;
+				  iptr->isn_arg.stringmember.sm_name); break;
 	    case ISN_GET_OBJ_MEMBER: smsg("%s%4d OBJ_MEMBER %d", pfx, current,
 			     (int)iptr->isn_arg.classmember.cm_idx);
 				     break;
@@ -2209,7 +2209,13 @@ generate_STRINGMEMBER(cctx_T *cctx, char_u *name, size_t len)
     RETURN_OK_IF_SKIP(cctx);
     if ((isn = generate_instr(cctx, ISN_STRINGMEMBER)) == NULL)
 	return FAIL;
-    isn->isn_arg.string = vim_strnsave(name, len);
+    isn->isn_arg.stringmember.sm_name = vim_strnsave(name, len);
+    isn->isn_arg.stringmember.sm_cache = ALLOC_CLEAR_ONE(membercache_T);
+    if (isn->isn_arg.stringmember.sm_name == NULL
+			       || isn->isn_arg.stringmember.sm_cache == NULL)
+	return FAIL;
+    isn->isn_arg.stringmember.sm_cache->mc_hash =
+			       hash_hash(isn->isn_arg.stringmember.sm_name);
 
     // check for dict type
     type = get_type_on_stack(cctx, 0);
@@ -2677,10 +2683,14 @@ delete_instr(isn_T *isn)
 	case ISN_STOREG:
 	case ISN_STORET:
 	case ISN_STOREW:
-	case ISN_STRINGMEMBER:
 	    vim_free(isn->isn_arg.string);
 	    break;
 
+	case ISN_STRINGMEMBER:
+	    vim_free(isn->isn_arg.stringmember.sm_name);
+	    vim_free(isn->isn_arg.stringmember.sm_cache);
+	    break;
+
 	case ISN_LOCKUNLOCK:
 	    class_unref(isn->isn_arg.lockunlock.lu_cl_exec);
 	    vim_free(isn->isn_arg.lockunlock.lu_string);